@@ -47,11 +47,41 @@ class Settings(BaseSettings):
     hand_detection_confidence: float = 0.5
     hand_tracking_confidence: float = 0.5
     
+    # Hand Tracker Pool Settings
+    hand_tracker_pool_size: int = 4  # Static-mode trackers for one-shot images
+    hand_tracker_max_sessions: int = 32  # Video-mode trackers for streaming sessions
+    hand_tracker_session_ttl: float = 300.0  # Seconds before an idle session is dropped
+    hand_tracker_checkout_timeout: float = 5.0
+    
+    # Speech-to-Text Settings
+    stt_backend: str = "google"  # google, vosk (offline) or stub (offline, deterministic)
+    stt_timeout: float = 10.0  # Seconds per transcription
+    stt_max_concurrency: int = 4  # Concurrent transcriptions
+    stt_max_connections: int = 8  # Keep-alive HTTP connections (google)
+    stt_google_api_key: str = ""
+    stt_vosk_model_path: str = "models/vosk"
+    stt_stub_text: str = "hello world"
+    
+    # Sign Video Settings
+    sign_helpers_path: str = "../../.."  # Repository root holding the helper/ package
+    sign_landmark_store_path: str = "../../../landmark_store"  # Written by build_landmark_store.py
+    sign_landmark_stores: str = "general,railway,medical"  # Searched in this order
+    sign_video_dir: str = "uploads/videos"
+    sign_video_fps: float = 30.0
+    sign_video_size: int = 500
+    sign_video_ttl: float = 3600.0  # Seconds rendered sentence videos are kept
+    ffmpeg_path: str = "ffmpeg"
+    
     @property
     def allowed_origins_list(self) -> List[str]:
         """Convert comma-separated origins to list."""
         return [origin.strip() for origin in self.allowed_origins.split(",")]
     
+    @property
+    def sign_landmark_stores_list(self) -> List[str]:
+        """Convert comma-separated store names to list."""
+        return [name.strip() for name in self.sign_landmark_stores.split(",") if name.strip()]
+    
     @property
     def allowed_audio_formats_list(self) -> List[str]:
         """Convert comma-separated audio formats to list."""
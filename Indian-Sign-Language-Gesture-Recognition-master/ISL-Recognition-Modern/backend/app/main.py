@@ -8,7 +8,9 @@ from contextlib import asynccontextmanager
 
 from app.config import get_settings
 from app.database import init_db
-from app.routers import gesture, audio
+from app.routers import gesture, audio, sign_video
+from app.services.hand_tracker_pool import get_hand_tracker_pool
+from app.services.speech_to_text import close_speech_backend, get_speech_backend
 
 settings = get_settings()
 
@@ -21,9 +23,16 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     print("✅ Database initialized")
+    try:
+        get_speech_backend()
+    except (RuntimeError, ValueError) as e:
+        # Audio upload reports this per request; everything else still works
+        print(f"⚠️ Speech-to-text unavailable: {e}")
     yield
     # Shutdown
     print("👋 Shutting down...")
+    get_hand_tracker_pool().close()
+    await close_speech_backend()
 
 
 # Create FastAPI app
@@ -46,6 +55,7 @@ app.add_middleware(
 # Include routers
 app.include_router(gesture.router, prefix="/api/gesture", tags=["Gesture Recognition"])
 app.include_router(audio.router, prefix="/api/audio", tags=["Audio Processing"])
+app.include_router(sign_video.router, prefix="/api/sign-video", tags=["Sign Video"])
 
 # Mount static files
 import os
@@ -1,18 +1,25 @@
 """
 Audio processing router for speech-to-gesture conversion.
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 import aiofiles
+import logging
 import os
 from pathlib import Path
 import time
 import uuid
+from typing import Literal
 
-from app.schemas.schemas import AudioProcessRequest, AudioProcessResponse
+from app.schemas.schemas import (
+    AudioProcessRequest, AudioProcessResponse, GestureWordEvent, GestureStreamSummary
+)
 from app.services.audio_processor import get_audio_processor
 from app.services.image_generator import get_image_generator
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 router = APIRouter()
 
@@ -24,10 +31,54 @@ AUDIO_DIR.mkdir(exist_ok=True)
 IMAGE_DIR = UPLOAD_DIR / "images"
 IMAGE_DIR.mkdir(exist_ok=True)
 
+# File extension for each output format
+OUTPUT_EXTENSIONS = {"png": "png", "webp": "webp", "apng": "png"}
+
+
+def _render_gesture_output(text: str, unique_id: str, output_format: str) -> str:
+    """
+    Render text to a static grid or an animated image.
+    
+    Returns:
+        Filename of the generated image inside IMAGE_DIR
+    """
+    image_generator = get_image_generator()
+    image_filename = f"{unique_id}.{OUTPUT_EXTENSIONS[output_format]}"
+    image_path = IMAGE_DIR / image_filename
+    
+    if output_format == "png":
+        image_generator.generate_sentence_image(text, output_path=str(image_path))
+    else:
+        # Animated output has one frame per word and is never truncated
+        image_generator.generate_sentence_animation(
+            text,
+            output_path=str(image_path),
+            image_format=output_format
+        )
+    return image_filename
+
+
+def _store_word_tile(word: str) -> str:
+    """
+    Make sure a word's image exists on disk under its content address.
+    
+    Returns:
+        Filename of the word image inside IMAGE_DIR
+    """
+    digest, png = get_image_generator().get_word_png(word)
+    filename = f"word-{digest}.png"
+    path = IMAGE_DIR / filename
+    if not path.exists():
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_path.write_bytes(png)
+        os.replace(tmp_path, path)
+    return filename
+
 
 @router.post("/upload", response_model=AudioProcessResponse)
 async def upload_audio(
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    output_format: Literal["png", "webp", "apng"] = Form("png")
 ):
     """
     Upload audio file and convert to ISL gestures.
@@ -60,7 +111,7 @@ async def upload_audio(
     
     # Transcribe audio
     audio_processor = get_audio_processor()
-    success, transcribed_text, error = audio_processor.transcribe_audio(str(audio_path))
+    success, transcribed_text, error = await audio_processor.transcribe_audio_async(str(audio_path))
     
     if not success:
         # Clean up file
@@ -71,14 +122,9 @@ async def upload_audio(
         )
     
     # Generate ISL gesture image
-    image_generator = get_image_generator()
-    image_filename = f"{unique_id}.png"
-    image_path = IMAGE_DIR / image_filename
-    
     try:
-        gesture_image = image_generator.generate_sentence_image(
-            transcribed_text,
-            output_path=str(image_path)
+        image_filename = await run_in_threadpool(
+            _render_gesture_output, transcribed_text, unique_id, output_format
         )
     except Exception as e:
         # Clean up files
@@ -115,15 +161,11 @@ async def text_to_gesture(
         )
     
     # Generate ISL gesture image
-    image_generator = get_image_generator()
     unique_id = str(uuid.uuid4())
-    image_filename = f"{unique_id}.png"
-    image_path = IMAGE_DIR / image_filename
     
     try:
-        gesture_image = image_generator.generate_sentence_image(
-            request.text,
-            output_path=str(image_path)
+        image_filename = await run_in_threadpool(
+            _render_gesture_output, request.text, unique_id, request.output_format
         )
     except Exception as e:
         raise HTTPException(
@@ -142,6 +184,57 @@ async def text_to_gesture(
     )
 
 
+@router.post("/text-to-gesture/stream")
+async def text_to_gesture_stream(
+    request: AudioProcessRequest
+):
+    """
+    Stream ISL gesture images for text, one word at a time.
+    
+    The response is newline-delimited JSON: one GestureWordEvent per word,
+    in order, as soon as that word is rendered, followed by a
+    GestureStreamSummary. Word images are content-addressed, so repeated
+    words are rendered once and served from the same URL.
+    """
+    if not request.text or not request.text.split():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text is required"
+        )
+    
+    words = request.text.split()
+    start_time = time.perf_counter()
+    
+    async def event_stream():
+        time_to_first_word = None
+        for index, word in enumerate(words):
+            filename = await run_in_threadpool(_store_word_tile, word)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            if time_to_first_word is None:
+                time_to_first_word = elapsed_ms
+            event = GestureWordEvent(
+                index=index,
+                word=word,
+                image_url=f"/api/audio/images/{filename}",
+                elapsed_ms=elapsed_ms
+            )
+            yield event.model_dump_json() + "\n"
+        
+        processing_time = time.perf_counter() - start_time
+        logger.info(
+            f"Streamed {len(words)} words, first word after "
+            f"{time_to_first_word:.1f} ms, total {processing_time * 1000:.1f} ms"
+        )
+        summary = GestureStreamSummary(
+            word_count=len(words),
+            time_to_first_word_ms=time_to_first_word,
+            processing_time=processing_time
+        )
+        yield summary.model_dump_json() + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/images/{filename}")
 async def get_image(filename: str):
     """
@@ -157,4 +250,7 @@ async def get_image(filename: str):
             detail="Image not found"
         )
     
+    if filename.startswith("word-"):
+        # Content-addressed word images never change
+        return FileResponse(image_path, headers={"Cache-Control": "public, max-age=31536000, immutable"})
     return FileResponse(image_path)
@@ -1,51 +1,42 @@
 """
 Gesture recognition router for real-time hand gesture processing.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 import cv2
 import numpy as np
 import base64
-from io import BytesIO
-from PIL import Image
+import binascii
+from typing import Optional
 
 from app.schemas.schemas import GestureRecognitionRequest, GestureRecognitionResponse
-from app.services.hand_tracker import HandTracker
+from app.config import get_settings
+from app.services.hand_tracker_pool import get_hand_tracker_pool, PoolTimeoutError
 from app.services.gesture_classifier import GestureClassifier, SpellCorrector
 
+settings = get_settings()
 router = APIRouter()
 
 # Initialize services
-hand_tracker = HandTracker()
+hand_tracker_pool = get_hand_tracker_pool()
 gesture_classifier = GestureClassifier()
 spell_corrector = SpellCorrector()
 
 
-@router.post("/recognize", response_model=GestureRecognitionResponse)
-async def recognize_gesture(
-    request: GestureRecognitionRequest
-):
+def _detect_hand(frame: np.ndarray, session_id: Optional[str]):
     """
-    Recognize gesture from image data.
+    Run hand detection on a pooled tracker.
+    
+    Returns:
+        Tuple of (landmarks, hand_type, hand_region), or None if no hand was found
     """
-    try:
-        # Decode base64 image
-        image_data = base64.b64decode(request.image_data.split(',')[1] if ',' in request.image_data else request.image_data)
-        image = Image.open(BytesIO(image_data))
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        
-        # Process frame with hand tracker
-        print(f"Processing frame with shape: {frame.shape}")
+    with hand_tracker_pool.checkout(session_id) as hand_tracker:
         annotated_frame, hand_landmarks_list = hand_tracker.process_frame(frame)
         
         # Check if hand detection returned None or empty list
         if hand_landmarks_list is None or len(hand_landmarks_list) == 0:
-            print("No hands detected in the image")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No hand detected in image"
-            )
+            return None
         
         print(f"Detected {len(hand_landmarks_list)} hands")
         
@@ -61,15 +52,88 @@ async def recognize_gesture(
         # Extract hand region
         hand_region = hand_tracker.extract_hand_region(frame, landmarks)
         
+        return landmarks, hand_type, hand_region
+
+
+def decode_image_bytes(buffer) -> np.ndarray:
+    """
+    Decode an encoded JPEG/PNG buffer straight to a BGR frame.
+    
+    Args:
+        buffer: Encoded image bytes (bytes, bytearray or memoryview)
+        
+    Returns:
+        BGR image as uint8 array
+    """
+    if not buffer:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty image payload"
+        )
+    if len(buffer) > settings.max_upload_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image exceeds {settings.max_upload_size} bytes"
+        )
+    
+    # np.frombuffer wraps the request buffer without copying it
+    frame = cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not decode image"
+        )
+    return frame
+
+
+def decode_base64_image(image_data: str) -> np.ndarray:
+    """
+    Decode a base64 string (optionally a data URL) to a BGR frame.
+    """
+    _, _, payload = image_data.rpartition(',')
+    try:
+        buffer = base64.b64decode(payload)
+    except binascii.Error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid base64 image data"
+        )
+    return decode_image_bytes(buffer)
+
+
+async def _recognize_frame(
+    frame: np.ndarray,
+    session_id: Optional[str] = None
+) -> GestureRecognitionResponse:
+    """
+    Run hand detection and classification on a decoded BGR frame.
+    """
+    try:
+        # Process frame with a pooled hand tracker off the event loop
+        print(f"Processing frame with shape: {frame.shape}")
+        try:
+            detection = await run_in_threadpool(_detect_hand, frame, session_id)
+        except PoolTimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
+        
+        if detection is None:
+            print("No hands detected in the image")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No hand detected in image"
+            )
+        
+        landmarks, hand_type, hand_region = detection
+        
         if hand_region is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Could not extract hand region"
             )
         
-        # Preprocess for classification
-        preprocessed = hand_tracker.preprocess_for_classification(hand_region)
-        
         # Classify gesture
         # Use landmark-based classification with the new model
         print(f"Classifying gesture with {len(landmarks)} landmarks")
@@ -99,6 +163,72 @@ async def recognize_gesture(
         )
 
 
+@router.post(
+    "/recognize",
+    response_model=GestureRecognitionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": GestureRecognitionRequest.model_json_schema()
+                },
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "file": {"type": "string", "format": "binary"},
+                            "session_id": {"type": "string"}
+                        },
+                        "required": ["file"]
+                    }
+                },
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            }
+        }
+    }
+)
+async def recognize_gesture(request: Request):
+    """
+    Recognize gesture from image data.
+    
+    Accepts a JPEG/PNG as raw bytes (application/octet-stream or image/*),
+    as a multipart "file" field, or base64-encoded in JSON. Binary uploads
+    are decoded directly from the request buffer. Streaming clients pass
+    session_id as a form field, JSON field, query parameter or the
+    X-Session-Id header.
+    """
+    content_type = request.headers.get("content-type", "")
+    session_id = request.headers.get("x-session-id") or request.query_params.get("session_id")
+    
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Multipart upload must include a 'file' field"
+            )
+        frame = decode_image_bytes(await upload.read())
+        session_id = form.get("session_id") or session_id
+    elif content_type.startswith(("application/octet-stream", "image/")):
+        frame = decode_image_bytes(await request.body())
+    else:
+        try:
+            payload = GestureRecognitionRequest.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=e.errors(include_url=False)
+            )
+        frame = decode_base64_image(payload.image_data)
+        session_id = payload.session_id or session_id
+    
+    return await _recognize_frame(frame, session_id)
+
+
 @router.post("/recognize-batch")
 async def recognize_gesture_batch(
     images: list[GestureRecognitionRequest]
@@ -112,7 +242,8 @@ async def recognize_gesture_batch(
     for img_request in images:
         try:
             # Process each image
-            result = await recognize_gesture(img_request)
+            frame = decode_base64_image(img_request.image_data)
+            result = await _recognize_frame(frame, img_request.session_id)
             recognized_chars.append(result.recognized_character)
             total_confidence += result.confidence
         except:
@@ -138,3 +269,24 @@ async def recognize_gesture_batch(
         "confidence": avg_confidence,
         "character_count": len(recognized_chars)
     }
+
+
+@router.get("/pool-stats")
+async def get_pool_stats():
+    """
+    Get hand tracker pool occupancy and checkout wait times.
+    """
+    return hand_tracker_pool.get_stats()
+
+
+@router.delete("/sessions/{session_id}")
+async def end_session(session_id: str):
+    """
+    Release the hand tracker held by a streaming session.
+    """
+    if not hand_tracker_pool.end_session(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+    return {"session_id": session_id, "released": True}
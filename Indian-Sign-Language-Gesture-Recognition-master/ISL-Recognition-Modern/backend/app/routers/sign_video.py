@@ -0,0 +1,157 @@
+"""
+Sign video router: ISL sentences as MP4/WebM files or HLS streams.
+"""
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+import asyncio
+import logging
+import re
+import uuid
+
+from app.schemas.schemas import SignVideoRequest, SignVideoResponse
+from app.services.sign_video import SignVideoError, get_sign_video_encoder
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+SEGMENT_NAME = re.compile(r"^[0-9a-f]{20}\.ts$")
+VIDEO_NAME = re.compile(r"^[0-9a-f]{32}\.(mp4|webm)$")
+VIDEO_MEDIA_TYPES = {"mp4": "video/mp4", "webm": "video/webm"}
+
+# Keeps prefetch tasks referenced until they finish
+_prefetch_tasks = set()
+
+
+def _get_encoder():
+    """The encoder, or 503 when the helper/ package it draws with is not available."""
+    try:
+        return get_sign_video_encoder()
+    except SignVideoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+
+
+async def _prefetch_segments(encoder, words):
+    """Encode the remaining segments of a playlist in the background, in order."""
+    for word in words:
+        try:
+            await run_in_threadpool(encoder.ensure_segment, word, "ts")
+        except SignVideoError as e:
+            logger.warning(f"Prefetch failed: {e}")
+
+
+@router.post("/render", response_model=SignVideoResponse)
+async def render_sign_video(request: SignVideoRequest):
+    """
+    Render text to a single MP4 or WebM file.
+
+    Word segments are encoded once and cached; the sentence is joined from
+    them with stream copy, so only words never seen before are encoded.
+    """
+    if not request.text or not request.text.split():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text is required"
+        )
+
+    encoder = _get_encoder()
+    filename = f"{uuid.uuid4().hex}.{request.output_format}"
+    try:
+        result = await run_in_threadpool(
+            encoder.render_sentence, request.text, request.output_format, filename
+        )
+    except SignVideoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+    logger.info(
+        f"Rendered {result['duration_seconds']:.2f}s of sign video in {result['processing_time']:.2f}s "
+        f"({result['seconds_per_output_second']:.3f}s per output second, {result['encode_seconds']:.2f}s encoding)"
+    )
+    return SignVideoResponse(
+        video_url=f"/api/sign-video/videos/{filename}",
+        words=result["words"],
+        missing_words=result["missing_words"],
+        duration_seconds=result["duration_seconds"],
+        encode_seconds=result["encode_seconds"],
+        processing_time=result["processing_time"],
+        seconds_per_output_second=result["seconds_per_output_second"]
+    )
+
+
+@router.get("/playlist.m3u8")
+async def sign_video_playlist(text: str = Query(..., min_length=1)):
+    """
+    HLS playlist for text, returned before any segment is encoded.
+
+    The first segment is encoded when the player requests it; the rest are
+    encoded in the background meanwhile, so playback starts after one word
+    instead of the whole sentence.
+    """
+    encoder = _get_encoder()
+    segments, missing = encoder.plan(encoder.tokenize(text), "ts")
+    if not segments:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="None of the words have stored landmarks"
+        )
+
+    task = asyncio.create_task(_prefetch_segments(encoder, [segment["word"] for segment in segments[1:]]))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+    headers = {"X-Missing-Words": ",".join(missing)} if missing else None
+    return Response(
+        content=encoder.hls_playlist(segments, "/api/sign-video/segments"),
+        media_type="application/vnd.apple.mpegurl",
+        headers=headers
+    )
+
+
+@router.get("/segments/{name}")
+async def get_sign_segment(name: str, word: str = Query(...)):
+    """
+    One word segment (MPEG-TS), encoded on first request.
+    """
+    if not SEGMENT_NAME.match(name):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Segment not found")
+
+    encoder = _get_encoder()
+    try:
+        path, _ = await run_in_threadpool(encoder.ensure_segment, word, "ts")
+    except SignVideoError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if path.name != name:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Segment not found")
+
+    # Segment names are content addresses, so they never change
+    return FileResponse(path, media_type="video/mp2t",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+@router.get("/videos/{filename}")
+async def get_sign_video(filename: str):
+    """
+    Get a rendered sentence video.
+    """
+    match = VIDEO_NAME.match(filename)
+    path = _get_encoder().output_dir / filename
+    if not match or not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video not found"
+        )
+    return FileResponse(path, media_type=VIDEO_MEDIA_TYPES[match.group(1)])
+
+
+@router.get("/stats")
+async def sign_video_stats():
+    """
+    Segment cache and encode-time statistics.
+    """
+    return _get_encoder().get_stats()
@@ -2,7 +2,7 @@
 Pydantic schemas for request/response validation.
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
 
 
@@ -64,6 +64,7 @@ class EmergencyContactResponse(EmergencyContactBase):
 # Audio Processing Schemas
 class AudioProcessRequest(BaseModel):
     text: Optional[str] = None  # For text-to-gesture
+    output_format: Literal["png", "webp", "apng"] = "png"  # Static grid or animated, one frame per word
 
 
 class AudioProcessResponse(BaseModel):
@@ -73,9 +74,41 @@ class AudioProcessResponse(BaseModel):
     processing_time: float
 
 
+class GestureWordEvent(BaseModel):
+    """One line of the streamed text-to-gesture response."""
+    index: int
+    word: str
+    image_url: str
+    elapsed_ms: float  # Time since the request started
+
+
+class GestureStreamSummary(BaseModel):
+    """Final line of the streamed text-to-gesture response."""
+    done: bool = True
+    word_count: int
+    time_to_first_word_ms: Optional[float] = None
+    processing_time: float
+
+
+class SignVideoRequest(BaseModel):
+    text: str
+    output_format: Literal["mp4", "webm"] = "mp4"
+
+
+class SignVideoResponse(BaseModel):
+    video_url: str
+    words: List[str]  # Words rendered, in order
+    missing_words: List[str]  # Words without stored landmarks
+    duration_seconds: float
+    encode_seconds: float  # Time spent encoding segments that were not cached
+    processing_time: float
+    seconds_per_output_second: float
+
+
 # Gesture Recognition Schemas
 class GestureRecognitionRequest(BaseModel):
     image_data: str  # Base64 encoded image
+    session_id: Optional[str] = None  # Streaming clients reuse a tracker per session
 
 
 class GestureRecognitionResponse(BaseModel):
@@ -10,6 +10,8 @@ from typing import Optional, Tuple
 from pathlib import Path
 import threading
 
+from app.services.speech_to_text import get_speech_backend, load_audio_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,13 +63,9 @@ class AudioProcessor:
             Tuple of (success, transcribed_text, error_message)
         """
         try:
-            # Load audio file
-            with sr.AudioFile(audio_file_path) as source:
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
-                # Record audio
-                audio_data = self.recognizer.record(source)
+            # Load the whole file; ambient noise calibration only matters for
+            # microphone input and would drop the first half second here
+            audio_data = load_audio_file(audio_file_path)
             
             # Perform speech recognition
             try:
@@ -88,6 +86,32 @@ class AudioProcessor:
             logger.error(error_msg)
             return False, None, error_msg
     
+    async def transcribe_audio_async(
+        self,
+        audio_file_path: str,
+        language: str = "en-IN"
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Transcribe audio file to text with the configured speech-to-text backend.
+        Runs without blocking the event loop, with pooled connections,
+        a timeout and a concurrency limit.
+        
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (default: en-IN for Indian English)
+            
+        Returns:
+            Tuple of (success, transcribed_text, error_message); a backend that
+            cannot be created (e.g. google without STT_GOOGLE_API_KEY) is reported
+            as an error rather than raised
+        """
+        try:
+            backend = get_speech_backend()
+        except (RuntimeError, ValueError) as e:
+            logger.error(f"Speech-to-text backend unavailable: {e}")
+            return False, None, str(e)
+        return await backend.transcribe(audio_file_path, language)
+    
     def transcribe_microphone(
         self,
         duration: int = 5,
@@ -20,7 +20,8 @@ class HandTracker:
         self,
         min_detection_confidence: float = 0.5,
         min_tracking_confidence: float = 0.5,
-        max_num_hands: int = 2
+        max_num_hands: int = 2,
+        static_image_mode: bool = False
     ):
         """
         Initialize MediaPipe Hands.
@@ -29,13 +30,15 @@ class HandTracker:
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
             max_num_hands: Maximum number of hands to detect
+            static_image_mode: Treat every frame as an unrelated image (no tracking state)
         """
+        self.static_image_mode = static_image_mode
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
         self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             max_num_hands=max_num_hands,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
@@ -198,7 +201,9 @@ class HandTracker:
     
     def close(self):
         """Release resources."""
-        self.hands.close()
+        if getattr(self, 'hands', None) is not None:
+            self.hands.close()
+            self.hands = None
     
     def __del__(self):
         """Cleanup on deletion."""
@@ -0,0 +1,288 @@
+"""
+Thread-safe pool of HandTracker instances.
+
+One-shot images are served by a fixed set of static-mode trackers, while
+streaming clients that send a session id get their own video-mode tracker
+so MediaPipe's tracking state is never shared between users.
+"""
+import queue
+import threading
+import time
+import logging
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from app.config import get_settings
+from app.services.hand_tracker import HandTracker
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no tracker becomes available within the checkout timeout."""
+
+
+class _SessionTracker:
+    """Video-mode tracker bound to a single streaming session."""
+
+    def __init__(self, tracker: HandTracker):
+        self.tracker = tracker
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.pending = 0  # Checkouts in progress, guarded by the pool's sessions lock
+
+
+class HandTrackerPool:
+    """
+    Pool of MediaPipe hand trackers with per-session affinity.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        max_sessions: int = 32,
+        session_ttl: float = 300.0,
+        checkout_timeout: float = 5.0,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+        wait_samples: int = 1024
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Number of static-mode trackers for one-shot images
+            max_sessions: Maximum number of live video-mode session trackers
+            session_ttl: Seconds of inactivity after which a session tracker is dropped
+            checkout_timeout: Seconds to wait for a free tracker before giving up
+            min_detection_confidence: Minimum confidence for hand detection
+            min_tracking_confidence: Minimum confidence for hand tracking
+            wait_samples: Number of recent checkout wait times kept for statistics
+        """
+        self.pool_size = pool_size
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.checkout_timeout = checkout_timeout
+        self._tracker_kwargs = {
+            'min_detection_confidence': min_detection_confidence,
+            'min_tracking_confidence': min_tracking_confidence,
+        }
+
+        self._static: "queue.Queue[HandTracker]" = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._static.put(HandTracker(static_image_mode=True, **self._tracker_kwargs))
+
+        self._sessions: "OrderedDict[str, _SessionTracker]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._wait_times: Dict[str, deque] = {
+            'static': deque(maxlen=wait_samples),
+            'session': deque(maxlen=wait_samples),
+        }
+        self._checkouts = {'static': 0, 'session': 0}
+        self._timeouts = 0
+        self._evictions = 0
+
+    def _record_wait(self, kind: str, wait: float):
+        with self._stats_lock:
+            self._wait_times[kind].append(wait)
+            self._checkouts[kind] += 1
+
+    def _expire_sessions(self, now: float):
+        """Drop idle session trackers. Caller must hold the sessions lock."""
+        expired = [
+            sid for sid, entry in self._sessions.items()
+            if now - entry.last_used > self.session_ttl and entry.pending == 0
+        ]
+        for sid in expired:
+            self._sessions.pop(sid).tracker.close()
+            self._evictions += 1
+
+    def _reuse_session(self, session_id: str) -> Optional[_SessionTracker]:
+        """Check out an existing session tracker. Caller must hold the sessions lock."""
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            self._sessions.move_to_end(session_id)
+            entry.pending += 1
+        return entry
+
+    def _make_room(self) -> bool:
+        """Evict the least recently used idle session if full. Caller must hold the sessions lock."""
+        if len(self._sessions) < self.max_sessions:
+            return True
+        victim = next((sid for sid, e in self._sessions.items() if e.pending == 0), None)
+        if victim is None:
+            return False
+        self._sessions.pop(victim).tracker.close()
+        self._evictions += 1
+        return True
+
+    def _get_session(self, session_id: str) -> Optional[_SessionTracker]:
+        """Get or create the tracker for a session, evicting the least recently used if full."""
+        with self._sessions_lock:
+            self._expire_sessions(time.monotonic())
+            entry = self._reuse_session(session_id)
+            if entry is not None:
+                return entry
+            if not self._make_room():
+                return None
+
+        # Building MediaPipe graphs is slow, so other sessions are not blocked on it
+        tracker = HandTracker(static_image_mode=False, **self._tracker_kwargs)
+
+        with self._sessions_lock:
+            entry = self._reuse_session(session_id)
+            if entry is None and self._make_room():
+                entry = _SessionTracker(tracker)
+                entry.pending += 1
+                self._sessions[session_id] = entry
+                return entry
+
+        # Another request created this session first, or the slots filled up meanwhile
+        tracker.close()
+        return entry
+
+    @contextmanager
+    def checkout(self, session_id: Optional[str] = None) -> Iterator[HandTracker]:
+        """
+        Borrow a tracker for the duration of a with-block.
+
+        Args:
+            session_id: Streaming session id; None for a one-shot image
+
+        Yields:
+            HandTracker reserved for the caller
+
+        Raises:
+            PoolTimeoutError: If no tracker is free within checkout_timeout
+        """
+        start = time.perf_counter()
+        entry = self._get_session(session_id) if session_id else None
+
+        if entry is not None:
+            try:
+                if not entry.lock.acquire(timeout=self.checkout_timeout):
+                    with self._stats_lock:
+                        self._timeouts += 1
+                    raise PoolTimeoutError(f"Session {session_id} is busy")
+                self._record_wait('session', time.perf_counter() - start)
+                try:
+                    yield entry.tracker
+                finally:
+                    if entry.last_used != float('-inf'):
+                        entry.last_used = time.monotonic()
+                    entry.lock.release()
+            finally:
+                with self._sessions_lock:
+                    entry.pending -= 1
+            return
+
+        if session_id:
+            logger.warning("Session tracker limit reached, using a static tracker")
+
+        try:
+            tracker = self._static.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise PoolTimeoutError("No hand tracker available")
+        self._record_wait('static', time.perf_counter() - start)
+        try:
+            yield tracker
+        finally:
+            self._static.put(tracker)
+
+    def end_session(self, session_id: str) -> bool:
+        """
+        Release the tracker held by a streaming session.
+
+        Returns:
+            True if the session existed
+        """
+        with self._sessions_lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return False
+            if entry.pending:
+                # Still in use; let the idle expiry reclaim it once released
+                entry.last_used = float('-inf')
+                return True
+            del self._sessions[session_id]
+        entry.tracker.close()
+        return True
+
+    def get_stats(self) -> Dict:
+        """
+        Get pool occupancy and checkout wait time statistics.
+
+        Returns:
+            Dictionary of counters and wait time percentiles in milliseconds
+        """
+        def summarize(samples) -> Dict[str, float]:
+            if not samples:
+                return {'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+            ordered = sorted(samples)
+            pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+            return {
+                'mean_ms': sum(ordered) / len(ordered) * 1000,
+                'p50_ms': pick(0.50),
+                'p95_ms': pick(0.95),
+                'max_ms': ordered[-1] * 1000,
+            }
+
+        with self._sessions_lock:
+            active_sessions = len(self._sessions)
+        with self._stats_lock:
+            return {
+                'pool_size': self.pool_size,
+                'static_available': self._static.qsize(),
+                'active_sessions': active_sessions,
+                'max_sessions': self.max_sessions,
+                'checkouts': dict(self._checkouts),
+                'timeouts': self._timeouts,
+                'session_evictions': self._evictions,
+                'wait_times': {kind: summarize(list(samples)) for kind, samples in self._wait_times.items()},
+            }
+
+    def close(self):
+        """Release all trackers."""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for entry in sessions:
+            entry.tracker.close()
+        while True:
+            try:
+                self._static.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# Singleton instance
+_hand_tracker_pool = None
+_lock = threading.Lock()
+
+
+def get_hand_tracker_pool() -> HandTrackerPool:
+    """
+    Get singleton hand tracker pool instance.
+    Thread-safe initialization.
+    """
+    global _hand_tracker_pool
+
+    if _hand_tracker_pool is None:
+        with _lock:
+            if _hand_tracker_pool is None:
+                settings = get_settings()
+                _hand_tracker_pool = HandTrackerPool(
+                    pool_size=settings.hand_tracker_pool_size,
+                    max_sessions=settings.hand_tracker_max_sessions,
+                    session_ttl=settings.hand_tracker_session_ttl,
+                    checkout_timeout=settings.hand_tracker_checkout_timeout,
+                    min_detection_confidence=settings.hand_detection_confidence,
+                    min_tracking_confidence=settings.hand_tracking_confidence
+                )
+
+    return _hand_tracker_pool
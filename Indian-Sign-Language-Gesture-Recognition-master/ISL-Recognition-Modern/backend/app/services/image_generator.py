@@ -7,7 +7,11 @@ import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 from pathlib import Path
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from collections import OrderedDict
+from io import BytesIO
+import hashlib
+import threading
 import os
 
 logger = logging.getLogger(__name__)
@@ -19,12 +23,28 @@ class ISLImageGenerator:
     Creates visual representations of sign language alphabets.
     """
     
-    def __init__(self, alphabet_images_path: str = "data/alphabets"):
+    # Layout of a word block: a label strip above a grid of letter tiles
+    TILE_SIZE = (200, 200)
+    TILE_PADDING = 10
+    LABEL_HEIGHT = 50
+    MAX_COLUMNS = 4
+    WORD_SPACING = 20
+    
+    FONT_CANDIDATES = ("/System/Library/Fonts/Helvetica.ttc", "arial.ttf")
+    
+    # Output format name -> PIL format used for animated sentences
+    ANIMATION_FORMATS = {"webp": "WEBP", "apng": "PNG"}
+    
+    # Bump when the drawing code changes, so content-addressed word images are re-rendered
+    RENDER_VERSION = 1
+    
+    def __init__(self, alphabet_images_path: str = "data/alphabets", word_cache_size: int = 128):
         """
         Initialize image generator.
         
         Args:
             alphabet_images_path: Path to directory containing ISL alphabet images
+            word_cache_size: Number of rendered word images kept in memory
         """
         # Resolve path relative to backend root if needed
         base_path = Path(__file__).parent.parent.parent # backend/
@@ -35,7 +55,37 @@ class ISLImageGenerator:
              self.alphabet_path = Path(alphabet_images_path)
              
         self.alphabet_cache = {}
+        self._fonts = {}
+        self.word_cache_size = word_cache_size
+        self._word_cache = OrderedDict()  # digest -> (image, png bytes)
+        self._word_cache_lock = threading.Lock()
         self._load_alphabet_images()
+        
+        # Fonts and pre-resized tiles are built once and reused by every request
+        self.label_font = self._get_font(30)
+        self.tile_atlas = self._build_tile_atlas()
+        self.asset_digest = self._asset_digest()
+    
+    def _get_font(self, size: int):
+        """
+        Get a TrueType font of the given size, loading it at most once.
+        
+        Args:
+            size: Font size in points
+            
+        Returns:
+            PIL font, or the default bitmap font if no TrueType font is available
+        """
+        if size not in self._fonts:
+            font = None
+            for candidate in self.FONT_CANDIDATES:
+                try:
+                    font = ImageFont.truetype(candidate, size)
+                    break
+                except OSError:
+                    continue
+            self._fonts[size] = font if font is not None else ImageFont.load_default()
+        return self._fonts[size]
     
     def _load_alphabet_images(self):
         """Load ISL alphabet images into cache."""
@@ -55,6 +105,41 @@ class ISLImageGenerator:
                 except Exception as e:
                     logger.error(f"Error loading image for {letter}: {e}")
     
+    def _build_tile_atlas(self) -> dict:
+        """
+        Build RGB tiles of TILE_SIZE for every letter.
+        
+        Returns:
+            Dictionary mapping letter to its pre-resized tile
+        """
+        atlas = {}
+        for letter in 'abcdefghijklmnopqrstuvwxyz':
+            img = self.get_letter_image(letter)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            if img.size != self.TILE_SIZE:
+                img = img.resize(self.TILE_SIZE, Image.Resampling.LANCZOS)
+            atlas[letter] = img
+        return atlas
+    
+    def _asset_digest(self) -> str:
+        """
+        Hash the inputs of a rendered word besides its text: every letter tile
+        (as drawn, so placeholders are covered), the label font and RENDER_VERSION.
+        """
+        digest = hashlib.sha256(f"v{self.RENDER_VERSION}".encode("utf-8"))
+        for letter, tile in sorted(self.tile_atlas.items()):
+            digest.update(letter.encode("utf-8"))
+            digest.update(tile.tobytes())
+        
+        font_path = getattr(self.label_font, "path", None)
+        if font_path:
+            digest.update(Path(font_path).read_bytes())
+            digest.update(f"|{self.label_font.size}".encode("utf-8"))
+        else:
+            digest.update(b"default-font")
+        return digest.hexdigest()
+    
     def _create_placeholder_image(self, letter: str, size: tuple = (200, 200)) -> Image.Image:
         """
         Create a placeholder image for a letter.
@@ -68,15 +153,7 @@ class ISLImageGenerator:
         """
         img = Image.new('RGB', size, color=(240, 240, 240))
         draw = ImageDraw.Draw(img)
-        
-        # Try to use a nice font, fall back to default if not available
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 100)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", 100)
-            except:
-                font = ImageFont.load_default()
+        font = self._get_font(100)
         
         # Draw letter in center
         text = letter.upper()
@@ -114,6 +191,70 @@ class ISLImageGenerator:
             self.alphabet_cache[letter_lower] = placeholder
             return placeholder.copy()
     
+    def _get_tile(self, letter: str) -> Image.Image:
+        """Get the shared pre-resized tile for a letter (do not modify it)."""
+        tile = self.tile_atlas.get(letter)
+        if tile is None:
+            tile = self.get_letter_image(letter).convert('RGB').resize(self.TILE_SIZE, Image.Resampling.LANCZOS)
+            self.tile_atlas[letter] = tile
+        return tile
+    
+    def _word_block_size(self, num_letters: int) -> tuple:
+        """
+        Get the (width, height) of the block for a word with num_letters letters.
+        """
+        if num_letters == 0:
+            return (400, 200)
+        
+        img_width, img_height = self.TILE_SIZE
+        cols = min(self.MAX_COLUMNS, num_letters)
+        rows = (num_letters + cols - 1) // cols
+        
+        total_width = cols * (img_width + self.TILE_PADDING) + self.TILE_PADDING
+        total_height = rows * (img_height + self.TILE_PADDING) + self.TILE_PADDING + self.LABEL_HEIGHT
+        return total_width, total_height
+    
+    def _draw_word_block(
+        self,
+        canvas: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        word: str,
+        letters: List[str],
+        origin: tuple,
+        block_width: int
+    ):
+        """
+        Draw a word's label and letter tiles onto a canvas.
+        
+        Args:
+            canvas: Canvas to paste tiles into
+            draw: ImageDraw bound to the canvas
+            word: Word used for the label
+            letters: Alphabetic letters of the word
+            origin: (x, y) of the block's top-left corner on the canvas
+            block_width: Width of the block, used to center the label
+        """
+        origin_x, origin_y = origin
+        img_width, img_height = self.TILE_SIZE
+        cols = min(self.MAX_COLUMNS, len(letters))
+        
+        # Add word label at top
+        text = f"ISL: {word.upper()}"
+        bbox = draw.textbbox((0, 0), text, font=self.label_font)
+        text_width = bbox[2] - bbox[0]
+        x = (block_width - text_width) // 2
+        draw.text((origin_x + x, origin_y + 10), text, fill=(0, 0, 0), font=self.label_font)
+        
+        # Place letter tiles in grid
+        for idx, letter in enumerate(letters):
+            row = idx // cols
+            col = idx % cols
+            
+            x = col * (img_width + self.TILE_PADDING) + self.TILE_PADDING
+            y = row * (img_height + self.TILE_PADDING) + self.TILE_PADDING + self.LABEL_HEIGHT
+            
+            canvas.paste(self._get_tile(letter), (origin_x + x, origin_y + y))
+    
     def generate_word_image(
         self,
         word: str,
@@ -136,52 +277,9 @@ class ISLImageGenerator:
             # Return blank image if no valid letters
             return Image.new('RGB', (400, 200), color=(255, 255, 255))
         
-        # Get images for each letter
-        letter_images = [self.get_letter_image(letter) for letter in letters]
-        
-        # Calculate grid dimensions
-        num_letters = len(letters)
-        cols = min(4, num_letters)  # Max 4 columns
-        rows = (num_letters + cols - 1) // cols
-        
-        # Image dimensions
-        img_width = 200
-        img_height = 200
-        padding = 10
-        
-        # Create composite image
-        total_width = cols * (img_width + padding) + padding
-        total_height = rows * (img_height + padding) + padding + 50  # Extra for word label
-        
+        total_width, total_height = self._word_block_size(len(letters))
         composite = Image.new('RGB', (total_width, total_height), color=(255, 255, 255))
-        
-        # Add word label at top
-        draw = ImageDraw.Draw(composite)
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", 30)
-            except:
-                font = ImageFont.load_default()
-        
-        text = f"ISL: {word.upper()}"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        x = (total_width - text_width) // 2
-        draw.text((x, 10), text, fill=(0, 0, 0), font=font)
-        
-        # Place letter images in grid
-        for idx, (letter, img) in enumerate(zip(letters, letter_images)):
-            row = idx // cols
-            col = idx % cols
-            
-            x = col * (img_width + padding) + padding
-            y = row * (img_height + padding) + padding + 50
-            
-            # Resize image if needed
-            img_resized = img.resize((img_width, img_height), Image.Resampling.LANCZOS)
-            composite.paste(img_resized, (x, y))
+        self._draw_word_block(composite, ImageDraw.Draw(composite), word, letters, (0, 0), total_width)
         
         # Save if output path provided
         if output_path:
@@ -213,20 +311,23 @@ class ISLImageGenerator:
         if not words:
             return Image.new('RGB', (400, 200), color=(255, 255, 255))
         
-        # Generate image for each word
-        word_images = [self.generate_word_image(word) for word in words]
+        # Lay out every word block first so the sentence canvas is allocated once
+        word_letters = [[c for c in word.lower() if c.isalpha()] for word in words]
+        block_sizes = [self._word_block_size(len(letters)) for letters in word_letters]
         
-        # Stack images vertically
-        total_width = max(img.width for img in word_images)
-        total_height = sum(img.height for img in word_images) + 20 * len(word_images)
+        # Stack blocks vertically
+        total_width = max(width for width, _ in block_sizes)
+        total_height = sum(height for _, height in block_sizes) + self.WORD_SPACING * len(block_sizes)
         
         composite = Image.new('RGB', (total_width, total_height), color=(255, 255, 255))
+        draw = ImageDraw.Draw(composite)
         
-        y_offset = 10
-        for img in word_images:
-            x = (total_width - img.width) // 2
-            composite.paste(img, (x, y_offset))
-            y_offset += img.height + 20
+        y_offset = self.WORD_SPACING // 2
+        for word, letters, (width, height) in zip(words, word_letters, block_sizes):
+            if letters:
+                x = (total_width - width) // 2
+                self._draw_word_block(composite, draw, word, letters, (x, y_offset), width)
+            y_offset += height + self.WORD_SPACING
         
         # Save if output path provided
         if output_path:
@@ -235,6 +336,130 @@ class ISLImageGenerator:
         
         return composite
 
+    
+    def word_digest(self, word: str) -> str:
+        """
+        Get the content address of a word's rendered image.
+        
+        The digest covers everything that affects the pixels (label text, tile
+        layout, the tile images, the label font and RENDER_VERSION), so it is
+        safe to use as a cache key and file name.
+        """
+        key = (f"{word.upper()}|{self.TILE_SIZE}|{self.TILE_PADDING}|{self.LABEL_HEIGHT}|{self.MAX_COLUMNS}"
+               f"|{self.asset_digest}")
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    
+    def _get_cached_word(self, word: str) -> Tuple[str, Image.Image, bytes]:
+        """
+        Render a word once and keep its image and PNG encoding in an LRU cache.
+        
+        Returns:
+            Tuple of (digest, image, png_bytes)
+        """
+        digest = self.word_digest(word)
+        with self._word_cache_lock:
+            cached = self._word_cache.get(digest)
+            if cached is not None:
+                self._word_cache.move_to_end(digest)
+                return (digest,) + cached
+        
+        image = self.generate_word_image(word)
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        entry = (image, buffer.getvalue())
+        
+        with self._word_cache_lock:
+            self._word_cache[digest] = entry
+            self._word_cache.move_to_end(digest)
+            while len(self._word_cache) > self.word_cache_size:
+                self._word_cache.popitem(last=False)
+        return (digest,) + entry
+    
+    def get_word_png(self, word: str) -> Tuple[str, bytes]:
+        """
+        Get the PNG encoding of a word's gesture image.
+        
+        Args:
+            word: Word to render
+            
+        Returns:
+            Tuple of (digest, png_bytes)
+        """
+        digest, _, png = self._get_cached_word(word)
+        return digest, png
+    
+    def iter_word_pngs(self, sentence: str) -> Iterator[Tuple[int, str, str, bytes]]:
+        """
+        Render a sentence word by word, in order and without truncation.
+        
+        Args:
+            sentence: Sentence to render
+            
+        Yields:
+            Tuples of (index, word, digest, png_bytes)
+        """
+        for index, word in enumerate(sentence.split()):
+            digest, png = self.get_word_png(word)
+            yield index, word, digest, png
+    
+    def generate_sentence_animation(
+        self,
+        sentence: str,
+        output_path: Optional[str] = None,
+        image_format: str = "webp",
+        frame_duration: int = 1000
+    ) -> bytes:
+        """
+        Generate an animated image with one frame per word of a sentence.
+        
+        Args:
+            sentence: Sentence to generate the animation for
+            output_path: Optional path to save the animation
+            image_format: "webp" or "apng"
+            frame_duration: Display time of each word in milliseconds
+            
+        Returns:
+            Encoded animation bytes
+        """
+        if image_format not in self.ANIMATION_FORMATS:
+            raise ValueError(f"Unsupported animation format: {image_format}")
+        
+        words = sentence.split()
+        images = [self._get_cached_word(word)[1] for word in words]
+        if not images:
+            images = [Image.new('RGB', (400, 200), color=(255, 255, 255))]
+        
+        # Every frame shares the canvas size of the largest word
+        width = max(img.width for img in images)
+        height = max(img.height for img in images)
+        frames = []
+        for img in images:
+            if img.size == (width, height):
+                frames.append(img)
+                continue
+            frame = Image.new('RGB', (width, height), color=(255, 255, 255))
+            frame.paste(img, ((width - img.width) // 2, 0))
+            frames.append(frame)
+        
+        buffer = BytesIO()
+        frames[0].save(
+            buffer,
+            format=self.ANIMATION_FORMATS[image_format],
+            save_all=True,
+            append_images=frames[1:],
+            duration=frame_duration,
+            loop=0
+        )
+        data = buffer.getvalue()
+        
+        # Save if output path provided
+        if output_path:
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            logger.info(f"Saved sentence animation to {output_path}")
+        
+        return data
+
 
 # Singleton instance
 _image_generator = None
@@ -0,0 +1,462 @@
+"""
+Server-side ISL sentence video rendering.
+
+Sign animations are drawn from the precomputed landmark stores written by
+build_landmark_store.py (landmark_store/<dictionary>/ in the repository
+root), read and drawn with the repository's own helper/ modules (found
+through SIGN_HELPERS_PATH; without them the service is unavailable but the
+rest of the backend runs). Every
+word is encoded once into a cached video segment with fixed codec
+parameters, so a sentence is just its word segments joined by ffmpeg's
+concat demuxer with stream copy, or listed in an HLS playlist.
+"""
+import hashlib
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from helper.landmark_renderer import LandmarkRenderer
+    from helper.landmark_store import LandmarkClip, LandmarkStore
+
+logger = logging.getLogger(__name__)
+
+# Bump when drawing or codec settings change so cached segments are not reused
+RENDER_VERSION = 1
+
+# Codec settings per segment container. Every segment of a container uses the
+# same settings, which is what lets sentences be joined without re-encoding.
+SEGMENT_FORMATS = {
+    "ts": {
+        "extension": "ts",
+        "args": ["-c:v", "libx264", "-preset", "veryfast", "-tune", "animation",
+                 "-pix_fmt", "yuv420p", "-f", "mpegts"],
+    },
+    "webm": {
+        "extension": "webm",
+        "args": ["-c:v", "libvpx-vp9", "-deadline", "realtime", "-cpu-used", "8",
+                 "-b:v", "0", "-crf", "40", "-pix_fmt", "yuv420p", "-f", "webm"],
+    },
+}
+
+# Output container -> segment container
+OUTPUT_SEGMENTS = {"mp4": "ts", "webm": "webm"}
+
+# Seconds between sweeps for expired sentence videos
+CLEANUP_INTERVAL = 60.0
+
+
+class SignVideoError(Exception):
+    """Raised when a sentence video cannot be produced."""
+
+
+def import_helpers(helpers_path: Optional[str] = None):
+    """
+    Import the landmark helpers shared with the desktop players.
+
+    Args:
+        helpers_path: Directory containing the repository's helper/ package;
+            None if it is already importable
+
+    Returns:
+        The helper.landmark_store, helper.landmark_renderer, helper.connections
+        and helper.phrase_matcher modules
+
+    Raises:
+        SignVideoError: If helper/ cannot be imported
+    """
+    if helpers_path:
+        root = str(Path(helpers_path).resolve())
+        if root not in sys.path:
+            sys.path.append(root)
+    try:
+        from helper import connections, landmark_renderer, landmark_store, phrase_matcher
+    except ImportError as e:
+        raise SignVideoError(
+            f"Sign video rendering needs the repository's helper/ package "
+            f"(SIGN_HELPERS_PATH={helpers_path!r}): {e}"
+        )
+    return landmark_store, landmark_renderer, connections, phrase_matcher
+
+
+def make_renderer(store: "LandmarkStore") -> "LandmarkRenderer":
+    """Renderer for a store's layout, drawn like the desktop players."""
+    _, landmark_renderer, connections, _ = import_helpers()
+    return landmark_renderer.LandmarkRenderer(
+        store.layout,
+        pose_connections_to_skip=connections.CONNECTIONS_NOT_NEEDED,
+        pose_color=(0, 255, 0),
+        hand_color=(255, 0, 0),
+        face_color=(0, 0, 255),
+    )
+
+
+class SignVideoEncoder:
+    """
+    Encodes per-word sign segments and joins them into sentence videos.
+    """
+
+    def __init__(
+        self,
+        store_root: str,
+        store_names: List[str],
+        output_dir: str,
+        fps: float = 30.0,
+        size: int = 500,
+        ffmpeg_path: str = "ffmpeg",
+        video_ttl: float = 3600.0,
+        helpers_path: Optional[str] = None
+    ):
+        """
+        Args:
+            store_root: Directory holding one landmark store per dictionary
+            store_names: Dictionaries to search, in priority order
+            output_dir: Directory for cached segments and sentence videos
+            fps: Output frame rate; clips are resampled to it
+            size: Output width and height in pixels
+            ffmpeg_path: ffmpeg executable
+            video_ttl: Seconds a rendered sentence video is kept
+            helpers_path: Directory containing the repository's helper/ package
+
+        Raises:
+            SignVideoError: If helper/ cannot be imported
+        """
+        landmark_store, _, _, phrase_matcher = import_helpers(helpers_path)
+
+        self.fps = fps
+        self.size = size
+        self.ffmpeg_path = ffmpeg_path
+        self.video_ttl = video_ttl
+        self.output_dir = Path(output_dir)
+        self.segment_dir = self.output_dir / "segments"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+
+        # (name, store, renderer) in priority order
+        self.stores: List[Tuple[str, "LandmarkStore", "LandmarkRenderer"]] = []
+        for name in store_names:
+            path = Path(store_root) / name
+            if (path / "index.json").exists():
+                store = landmark_store.LandmarkStore(str(path))
+                self.stores.append((name, store, make_renderer(store)))
+            else:
+                logger.warning(f"Landmark store not found: {path}")
+
+        # Longest match first, so multi-word signs such as "guinea pig" stay one word
+        self.matcher = phrase_matcher.PhraseMatcher(word for _, store, _ in self.stores for word in store.words)
+
+        self._last_cleanup = 0.0
+        self._cleanup_lock = threading.Lock()
+
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+        # Encode statistics
+        self._stats_lock = threading.Lock()
+        self.segments_encoded = 0
+        self.segment_hits = 0
+        self.encode_seconds = 0.0
+        self.encoded_output_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Words and segments
+    # ------------------------------------------------------------------
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split text into stored signs, longest match first, and leftover words."""
+        words = re.findall(r"[a-z0-9']+", text.lower())
+        return [token for token, _ in self.matcher.segment(words)]
+
+    def find(self, word: str) -> Optional[Tuple[str, "LandmarkRenderer", "LandmarkClip"]]:
+        """Return (store name, renderer, clip) from the first store holding the word."""
+        for name, store, renderer in self.stores:
+            clip = store.get(word)
+            if clip is not None:
+                return name, renderer, clip
+        return None
+
+    def frame_count(self, source_frames: int, source_fps: float) -> int:
+        if not source_fps:
+            return source_frames
+        return max(1, round(source_frames * self.fps / source_fps))
+
+    def segment_name(self, store_name: str, clip: "LandmarkClip", segment_format: str) -> str:
+        """
+        Content address of a word's segment.
+
+        The key includes the clip's landmark data, not only its word, so a
+        rebuilt store (or a word re-aliased to another clip) gets new
+        segments instead of stale cached ones.
+        """
+        digest = hashlib.sha1(
+            f"{RENDER_VERSION}|{store_name}|{clip.word}|{clip.fps}|{self.size}|{self.fps}|{segment_format}".encode("utf-8")
+        )
+        digest.update(np.ascontiguousarray(clip.points).tobytes())
+        digest.update(np.ascontiguousarray(clip.mask).tobytes())
+        return f"{digest.hexdigest()[:20]}.{SEGMENT_FORMATS[segment_format]['extension']}"
+
+    def plan(self, words: List[str], segment_format: str) -> Tuple[List[dict], List[str]]:
+        """
+        Resolve words to segments without encoding anything.
+
+        Returns:
+            Tuple of (segments, missing_words); each segment has word, name and duration
+        """
+        segments, missing = [], []
+        for word in words:
+            found = self.find(word)
+            if found is not None:
+                signs = [(word, found)]
+            else:
+                # Fingerspell words without a sign, as the chatbot does
+                signs = [(letter, self.find(letter)) for letter in word.upper() if letter.isalnum()]
+                if not signs or any(letter_found is None for _, letter_found in signs):
+                    missing.append(word)
+                    continue
+
+            for sign, (store_name, _, clip) in signs:
+                segments.append({
+                    "word": sign,
+                    "name": self.segment_name(store_name, clip, segment_format),
+                    "duration": self.frame_count(len(clip), clip.fps) / self.fps,
+                })
+        return segments, missing
+
+    def _render_frames(self, renderer: "LandmarkRenderer", word: str, clip: "LandmarkClip"):
+        count = self.frame_count(len(clip), clip.fps)
+        # Nearest source frame for every output frame
+        indices = np.minimum((np.arange(count) * (clip.fps or self.fps) / self.fps).astype(np.intp), len(clip) - 1)
+        for index in indices:
+            canvas = np.full((self.size, self.size, 3), 255, dtype=np.uint8)
+            renderer.render_frame(canvas, clip.points[index], clip.mask[index])
+            cv2.putText(canvas, f"Word: {word}", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 1, cv2.LINE_AA)
+            yield canvas
+
+    def _segment_lock(self, name: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def ensure_segment(self, word: str, segment_format: str = "ts") -> Tuple[Path, float]:
+        """
+        Return the cached segment for a word, encoding it first if needed.
+
+        Returns:
+            Tuple of (segment path, seconds spent encoding; 0 when cached)
+
+        Raises:
+            SignVideoError: If the word is not in any store or encoding fails
+        """
+        found = self.find(word)
+        if found is None:
+            raise SignVideoError(f"No stored landmarks for word: {word}")
+        store_name, renderer, clip = found
+
+        path = self.segment_dir / self.segment_name(store_name, clip, segment_format)
+        with self._segment_lock(path.name):
+            if path.exists():
+                with self._stats_lock:
+                    self.segment_hits += 1
+                return path, 0.0
+
+            start = time.perf_counter()
+            tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+            command = [
+                self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y",
+                "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{self.size}x{self.size}",
+                "-r", str(self.fps), "-i", "pipe:0",
+                *SEGMENT_FORMATS[segment_format]["args"], str(tmp_path)
+            ]
+            try:
+                process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+            except OSError as e:
+                raise SignVideoError(f"Could not start ffmpeg ({self.ffmpeg_path}): {e}")
+            frames = 0
+            try:
+                for canvas in self._render_frames(renderer, word, clip):
+                    process.stdin.write(canvas.tobytes())
+                    frames += 1
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            stderr = process.stderr.read().decode(errors="replace")
+            if process.wait() != 0:
+                tmp_path.unlink(missing_ok=True)
+                raise SignVideoError(f"ffmpeg failed for {word}: {stderr.strip()}")
+            os.replace(tmp_path, path)
+
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.segments_encoded += 1
+                self.encode_seconds += elapsed
+                self.encoded_output_seconds += frames / self.fps
+            logger.info(f"Encoded segment for {word!r}: {frames / self.fps:.2f}s of video in {elapsed:.2f}s")
+            return path, elapsed
+
+    # ------------------------------------------------------------------
+    # Sentences
+    # ------------------------------------------------------------------
+
+    def render_sentence(self, text: str, output_format: str = "mp4", filename: Optional[str] = None) -> dict:
+        """
+        Render a sentence to a single video by joining word segments.
+
+        Returns:
+            Dictionary with the output path, words, missing words, duration and timings
+        """
+        self.remove_expired_videos()
+        segment_format = OUTPUT_SEGMENTS[output_format]
+        segments, missing = self.plan(self.tokenize(text), segment_format)
+        if not segments:
+            raise SignVideoError("None of the words have stored landmarks")
+
+        start = time.perf_counter()
+        paths, encode_seconds = [], 0.0
+        for segment in segments:
+            path, elapsed = self.ensure_segment(segment["word"], segment_format)
+            paths.append(path)
+            encode_seconds += elapsed
+
+        output_path = self.output_dir / (filename or f"{hashlib.sha1(text.encode('utf-8')).hexdigest()[:20]}.{output_format}")
+        self.concat(paths, output_path, output_format)
+
+        duration = sum(segment["duration"] for segment in segments)
+        processing_time = time.perf_counter() - start
+        return {
+            "path": output_path,
+            "words": [segment["word"] for segment in segments],
+            "missing_words": missing,
+            "duration_seconds": duration,
+            "encode_seconds": encode_seconds,
+            "processing_time": processing_time,
+            "seconds_per_output_second": processing_time / duration if duration else 0.0,
+        }
+
+    def remove_expired_videos(self, force: bool = False) -> int:
+        """
+        Delete sentence videos (and leftover temporary files) older than video_ttl.
+
+        Runs at most once per CLEANUP_INTERVAL unless forced; cached word
+        segments are kept.
+
+        Returns:
+            Number of files removed
+        """
+        now = time.time()
+        with self._cleanup_lock:
+            if not force and now - self._last_cleanup < CLEANUP_INTERVAL:
+                return 0
+            self._last_cleanup = now
+
+        removed = 0
+        for path in self.output_dir.iterdir():
+            try:
+                if path.is_file() and now - path.stat().st_mtime > self.video_ttl:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        if removed:
+            logger.info(f"Removed {removed} expired sign videos")
+        return removed
+
+    def concat(self, paths: List[Path], output_path: Path, output_format: str):
+        """Join segments with the concat demuxer; streams are copied, not re-encoded."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", dir=self.output_dir, delete=False) as f:
+            for path in paths:
+                f.write(f"file '{path.resolve()}'\n")
+            list_path = f.name
+
+        extra = ["-movflags", "+faststart"] if output_format == "mp4" else []
+        tmp_path = output_path.with_name(f"{output_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        command = [
+            self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "concat", "-safe", "0", "-i", list_path,
+            "-c", "copy", *extra, "-f", output_format, str(tmp_path)
+        ]
+        try:
+            try:
+                result = subprocess.run(command, capture_output=True)
+            except OSError as e:
+                raise SignVideoError(f"Could not start ffmpeg ({self.ffmpeg_path}): {e}")
+            if result.returncode != 0:
+                tmp_path.unlink(missing_ok=True)
+                raise SignVideoError(f"ffmpeg concat failed: {result.stderr.decode(errors='replace').strip()}")
+            os.replace(tmp_path, output_path)
+        finally:
+            os.remove(list_path)
+
+    def hls_playlist(self, segments: List[dict], segment_url: str) -> str:
+        """
+        Build an HLS playlist for planned MPEG-TS segments.
+
+        Each word segment starts its own timeline, so segments are separated
+        by EXT-X-DISCONTINUITY tags.
+        """
+        target = max(1, int(np.ceil(max(segment["duration"] for segment in segments))))
+        lines = ["#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{target}",
+                 "#EXT-X-MEDIA-SEQUENCE:0", "#EXT-X-PLAYLIST-TYPE:VOD"]
+        for index, segment in enumerate(segments):
+            if index:
+                lines.append("#EXT-X-DISCONTINUITY")
+            lines.append(f"#EXTINF:{segment['duration']:.3f},{segment['word']}")
+            lines.append(f"{segment_url}/{segment['name']}?word={quote(segment['word'])}")
+        lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    def get_stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "stores": [name for name, _, _ in self.stores],
+                "segments_encoded": self.segments_encoded,
+                "segment_hits": self.segment_hits,
+                "encode_seconds": self.encode_seconds,
+                "encoded_output_seconds": self.encoded_output_seconds,
+                "encode_seconds_per_output_second": (
+                    self.encode_seconds / self.encoded_output_seconds if self.encoded_output_seconds else 0.0
+                ),
+            }
+
+
+# Singleton instance
+_sign_video_encoder = None
+_lock = threading.Lock()
+
+
+def get_sign_video_encoder() -> SignVideoEncoder:
+    """
+    Get singleton sign video encoder instance.
+    Thread-safe initialization.
+
+    Raises:
+        SignVideoError: If the helper/ package is not available
+    """
+    global _sign_video_encoder
+
+    if _sign_video_encoder is None:
+        with _lock:
+            if _sign_video_encoder is None:
+                settings = get_settings()
+                _sign_video_encoder = SignVideoEncoder(
+                    store_root=settings.sign_landmark_store_path,
+                    store_names=settings.sign_landmark_stores_list,
+                    output_dir=settings.sign_video_dir,
+                    fps=settings.sign_video_fps,
+                    size=settings.sign_video_size,
+                    ffmpeg_path=settings.ffmpeg_path,
+                    video_ttl=settings.sign_video_ttl,
+                    helpers_path=settings.sign_helpers_path
+                )
+
+    return _sign_video_encoder
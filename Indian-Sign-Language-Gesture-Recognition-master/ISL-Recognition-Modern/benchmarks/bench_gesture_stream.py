@@ -0,0 +1,60 @@
+"""
+Benchmark time-to-first-word of streamed ISL output.
+
+Compares how long a client waits for something to show with the static
+composite PNG (the whole sentence rendered and encoded before anything
+is sent) against the per-word stream behind
+POST /api/audio/text-to-gesture/stream, with a cold and a warm word cache.
+
+Usage (from ISL-Recognition-Modern/):
+    python benchmarks/bench_gesture_stream.py
+"""
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, 'backend')
+
+from app.services.image_generator import ISLImageGenerator
+
+SENTENCE = (
+    "the train to mumbai will arrive on platform nine soon so please stand "
+    "behind the yellow line and wait here"
+)
+
+
+def static_composite(generator, sentence):
+    start = time.perf_counter()
+    image = generator.generate_sentence_image(sentence, max_words=len(sentence.split()))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, elapsed, len(buffer.getvalue())
+
+
+def streamed(generator, sentence):
+    start = time.perf_counter()
+    first = None
+    total_bytes = 0
+    for _, _, _, png in generator.iter_word_pngs(sentence):
+        if first is None:
+            first = (time.perf_counter() - start) * 1000
+        total_bytes += len(png)
+    return first, (time.perf_counter() - start) * 1000, total_bytes
+
+
+def main():
+    generator = ISLImageGenerator()
+    words = len(SENTENCE.split())
+    print(f"{words}-word sentence")
+
+    rows = [("static PNG", static_composite(generator, SENTENCE))]
+    rows.append(("stream (cold)", streamed(generator, SENTENCE)))
+    rows.append(("stream (warm)", streamed(generator, SENTENCE)))
+
+    for label, (first_ms, total_ms, size) in rows:
+        print(f"  {label:<14} first word {first_ms:8.2f} ms  complete {total_ms:8.2f} ms  {size / 1024:8.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark frame decoding for /api/gesture/recognize.
+
+Compares the old base64 + PIL path against decoding binary uploads with
+cv2.imdecode directly on the request buffer.
+
+Old path, per frame:
+    base64 text -> bytes (b64decode) -> PIL image -> RGB PIL image
+    -> np.array (RGB) -> cvtColor (BGR)
+New path, per frame:
+    request bytes -> np.frombuffer (no copy) -> cv2.imdecode (BGR)
+
+Base64 also inflates the upload by a third before any of this happens.
+
+Usage (from ISL-Recognition-Modern/):
+    python benchmarks/bench_image_decode.py [--width 640] [--height 480] [--iterations 200]
+"""
+import argparse
+import base64
+import statistics
+import time
+import tracemalloc
+from io import BytesIO
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+def make_payload(width, height, ext):
+    """Encode a synthetic webcam-like frame."""
+    rng = np.random.default_rng(0)
+    frame = cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (9, 9), 0)
+    ok, encoded = cv2.imencode(ext, frame)
+    assert ok
+    return encoded.tobytes()
+
+
+def decode_base64_pil(data_url):
+    image_data = base64.b64decode(data_url.split(',')[1] if ',' in data_url else data_url)
+    image = Image.open(BytesIO(image_data))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+
+
+def decode_binary(buffer):
+    return cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+
+def measure(fn, arg, iterations):
+    fn(arg)  # Warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'median_ms': statistics.median(timings) * 1000,
+        'p95_ms': timings[int(0.95 * (len(timings) - 1))] * 1000,
+        'peak_kib': peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=480)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    for ext, mime in (('.jpg', 'jpeg'), ('.png', 'png')):
+        raw = make_payload(args.width, args.height, ext)
+        data_url = f"data:image/{mime};base64," + base64.b64encode(raw).decode('ascii')
+
+        old = measure(decode_base64_pil, data_url, args.iterations)
+        new = measure(decode_binary, raw, args.iterations)
+
+        print(f"{mime.upper()} {args.width}x{args.height}: upload {len(data_url)} B base64 vs {len(raw)} B binary")
+        print(f"  base64+PIL  median {old['median_ms']:.2f} ms  p95 {old['p95_ms']:.2f} ms  peak {old['peak_kib']:.0f} KiB")
+        print(f"  imdecode    median {new['median_ms']:.2f} ms  p95 {new['p95_ms']:.2f} ms  peak {new['peak_kib']:.0f} KiB")
+        print(f"  speedup     {old['median_ms'] / new['median_ms']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
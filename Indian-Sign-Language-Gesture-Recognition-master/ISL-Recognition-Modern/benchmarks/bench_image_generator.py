@@ -0,0 +1,104 @@
+"""
+Benchmark ISLImageGenerator sentence composition.
+
+Compares the tile-atlas generator against the previous approach, which
+copied and LANCZOS-resized every letter image and reloaded the TrueType
+font on every request, then composed each word on its own canvas before
+pasting it into the sentence canvas.
+
+Usage (from ISL-Recognition-Modern/):
+    python benchmarks/bench_image_generator.py [--iterations 20]
+"""
+import argparse
+import statistics
+import sys
+import time
+
+sys.path.insert(0, 'backend')
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.services.image_generator import ISLImageGenerator
+
+SENTENCES = {
+    1: "hello",
+    4: "please help me now",
+    20: "the train to mumbai will arrive on platform nine soon so please stand behind the yellow line and wait here",
+}
+
+
+def _legacy_font(size):
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    except OSError:
+        try:
+            return ImageFont.truetype("arial.ttf", size)
+        except OSError:
+            return ImageFont.load_default()
+
+
+def legacy_word_image(generator, word):
+    letters = [c for c in word.lower() if c.isalpha()]
+    if not letters:
+        return Image.new('RGB', (400, 200), color=(255, 255, 255))
+    letter_images = [generator.get_letter_image(letter) for letter in letters]
+
+    cols = min(4, len(letters))
+    rows = (len(letters) + cols - 1) // cols
+    total_width = cols * 210 + 10
+    total_height = rows * 210 + 10 + 50
+    composite = Image.new('RGB', (total_width, total_height), color=(255, 255, 255))
+
+    draw = ImageDraw.Draw(composite)
+    font = _legacy_font(30)
+    text = f"ISL: {word.upper()}"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    draw.text(((total_width - (bbox[2] - bbox[0])) // 2, 10), text, fill=(0, 0, 0), font=font)
+
+    for idx, img in enumerate(letter_images):
+        x = (idx % cols) * 210 + 10
+        y = (idx // cols) * 210 + 60
+        composite.paste(img.resize((200, 200), Image.Resampling.LANCZOS), (x, y))
+    return composite
+
+
+def legacy_sentence_image(generator, words):
+    word_images = [legacy_word_image(generator, word) for word in words]
+    total_width = max(img.width for img in word_images)
+    total_height = sum(img.height for img in word_images) + 20 * len(word_images)
+    composite = Image.new('RGB', (total_width, total_height), color=(255, 255, 255))
+    y_offset = 10
+    for img in word_images:
+        composite.paste(img, ((total_width - img.width) // 2, y_offset))
+        y_offset += img.height + 20
+    return composite
+
+
+def median_ms(fn, iterations):
+    fn()  # Warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generator = ISLImageGenerator()
+    print(f"Generator startup (atlas + fonts): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for count, sentence in SENTENCES.items():
+        words = sentence.split()
+        old = median_ms(lambda: legacy_sentence_image(generator, words), args.iterations)
+        new = median_ms(lambda: generator.generate_sentence_image(sentence, max_words=len(words)), args.iterations)
+        print(f"{count:>2} word(s): legacy {old:8.2f} ms  atlas {new:8.2f} ms  speedup {old / new:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
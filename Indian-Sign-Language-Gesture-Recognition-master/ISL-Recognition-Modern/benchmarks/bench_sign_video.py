@@ -0,0 +1,61 @@
+"""
+Benchmark server-side sign video rendering.
+
+Renders a sentence from the landmark stores twice: cold (every word
+segment is drawn and encoded) and warm (segments come from the cache and
+are only joined with stream copy). Reports encode time per second of
+output video and time until the first HLS segment is ready.
+
+Needs ffmpeg and the stores from build_landmark_store.py.
+
+Usage (from ISL-Recognition-Modern/):
+    python benchmarks/bench_sign_video.py [--store-root ../../landmark_store] [--helpers-path ../..] [--format mp4]
+"""
+import argparse
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, 'backend')
+
+from app.services.sign_video import SignVideoEncoder
+
+SENTENCE = "good morning doctor i have fever and headache since two days please help"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--store-root', default='../../landmark_store')
+    parser.add_argument('--helpers-path', default='../..', help="Repository root holding helper/")
+    parser.add_argument('--stores', default='general,railway,medical')
+    parser.add_argument('--format', choices=['mp4', 'webm'], default='mp4')
+    parser.add_argument('--text', default=SENTENCE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        encoder = SignVideoEncoder(args.store_root, args.stores.split(','), output_dir,
+                                   helpers_path=args.helpers_path)
+        segments, missing = encoder.plan(encoder.tokenize(args.text), 'ts')
+        if missing:
+            print(f"Not in the stores (skipped): {' '.join(missing)}")
+        if not segments:
+            print("Nothing to render")
+            return
+
+        start = time.perf_counter()
+        encoder.ensure_segment(segments[0]['word'])
+        print(f"First HLS segment ready: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        for label in ('cold', 'warm'):
+            result = encoder.render_sentence(args.text, args.format, f"{label}.{args.format}")
+            print(f"{label}: {result['duration_seconds']:.2f}s of video in {result['processing_time']:.2f}s "
+                  f"({result['seconds_per_output_second']:.3f}s per output second, "
+                  f"{result['encode_seconds']:.2f}s encoding)")
+
+        stats = encoder.get_stats()
+        print(f"Segments encoded {stats['segments_encoded']}, cache hits {stats['segment_hits']}, "
+              f"{stats['encode_seconds_per_output_second']:.3f} encode s per output s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark the asynchronous speech-to-text backends.
+
+Runs a burst of concurrent transcriptions through a backend and reports
+throughput and latency percentiles. The stub backend needs no network and
+isolates the interface overhead (concurrency limit, timeout, file I/O);
+the vosk backend measures real offline recognition.
+
+Usage (from ISL-Recognition-Modern/):
+    python benchmarks/bench_speech_to_text.py AUDIO.wav [--backend stub|vosk|google]
+        [--requests 50] [--concurrency 4] [--stub-latency 0.2]
+        [--vosk-model backend/models/vosk] [--google-key KEY]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, 'backend')
+
+from app.services.speech_to_text import (
+    GoogleSpeechBackend, StubSpeechBackend, VoskSpeechBackend
+)
+
+
+async def run(backend, audio_path, requests):
+    async def one():
+        start = time.perf_counter()
+        success, _, _ = await backend.transcribe(audio_path)
+        return success, time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    wall = time.perf_counter() - start
+    await backend.close()
+
+    latencies = sorted(latency for _, latency in results)
+    failures = sum(1 for success, _ in results if not success)
+    print(f"{backend.name}: {requests} requests, concurrency {backend.max_concurrency}, {failures} failed")
+    print(f"  throughput {requests / wall:.1f} req/s")
+    print(f"  latency p50 {statistics.median(latencies) * 1000:.1f} ms  "
+          f"p99 {latencies[int(0.99 * (len(latencies) - 1))] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('audio')
+    parser.add_argument('--backend', choices=['stub', 'vosk', 'google'], default='stub')
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--stub-latency', type=float, default=0.2)
+    parser.add_argument('--vosk-model', default='backend/models/vosk')
+    parser.add_argument('--google-key', default=os.getenv('STT_GOOGLE_API_KEY', ''),
+                        help='API key of the google backend (default: STT_GOOGLE_API_KEY)')
+    args = parser.parse_args()
+
+    if args.backend == 'stub':
+        backend = StubSpeechBackend(latency=args.stub_latency, max_concurrency=args.concurrency)
+    elif args.backend == 'vosk':
+        backend = VoskSpeechBackend(args.vosk_model, max_concurrency=args.concurrency)
+    else:
+        backend = GoogleSpeechBackend(args.google_key, max_concurrency=args.concurrency)
+
+    asyncio.run(run(backend, args.audio, args.requests))
+
+
+if __name__ == '__main__':
+    main()
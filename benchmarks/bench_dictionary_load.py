@@ -0,0 +1,106 @@
+"""
+Benchmark sign dictionary loading: import time, memory and lookups.
+
+Compares the old form of a dictionary (a Python dict literal calling
+DRIVE_LINK_PLACEHOLDER.format for every entry, regenerated from the data
+file into a temporary module) with the CompactDictionary data file. Each
+variant runs in fresh interpreters; memory is what tracemalloc sees
+allocated once the dictionary is loaded, in a separate untimed run. The compact row includes its
+lazy load, forced by one lookup.
+
+Usage (from the repository root):
+    python benchmarks/bench_dictionary_load.py [--dictionary general|medical] [--lookups 100000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from helper.dictionaries import DICTIONARY_NAMES, load_dictionary
+
+PROBE = """
+import importlib, random, sys, time, tracemalloc
+# Modules CompactDictionary needs anyway, so they are not counted as dictionary memory
+import array, bisect, collections.abc, json, os, threading
+sys.path.insert(0, sys.argv[1])
+module_name, attribute = sys.argv[2], sys.argv[3]
+
+def load():
+    mapping = getattr(importlib.import_module(module_name), attribute)
+    mapping[next(iter(mapping))]
+    return mapping
+
+if sys.argv[5] == "memory":
+    tracemalloc.start()
+    load()
+    print(tracemalloc.get_traced_memory()[0])
+    sys.exit()
+
+start = time.perf_counter()
+mapping = load()
+elapsed = time.perf_counter() - start
+
+keys = list(mapping)
+rng = random.Random(0)
+probes = [rng.choice(keys) for _ in range(int(sys.argv[4]))]
+start = time.perf_counter()
+for key in probes:
+    mapping[key]
+print(elapsed, (time.perf_counter() - start) / len(probes))
+"""
+
+
+def write_literal_module(mapping, directory):
+    path = os.path.join(directory, "literal_dictionary.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('DRIVE_LINK_PLACEHOLDER = "https://drive.google.com/uc?export=download&id={}"\n\n')
+        f.write("VIDEO_ID = {\n")
+        for key in mapping:
+            f.write(f"    {json.dumps(key)}: DRIVE_LINK_PLACEHOLDER.format({json.dumps(mapping.video_id(key))}),\n")
+        f.write("}\n")
+
+
+def probe(path, module, attribute, lookups):
+    def run(mode):
+        return subprocess.run([sys.executable, "-c", PROBE, path, module, attribute, str(lookups), mode],
+                              cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+
+    # Timed without tracemalloc, which slows every allocation down
+    load, lookup = run("time")
+    memory, = run("memory")
+    return float(load), int(memory), float(lookup)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dictionary', choices=[name for name in DICTIONARY_NAMES if name != "railway"],
+                        default='general')
+    parser.add_argument('--lookups', type=int, default=100000)
+    args = parser.parse_args()
+
+    compact = load_dictionary(args.dictionary)
+    module_dir = os.path.join(ROOT, "med_chatbot") if args.dictionary == "medical" else ROOT
+    attribute = "MED_VIDEO_IDS" if args.dictionary == "medical" else "VIDEO_ID"
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_literal_module(compact, directory)
+        # Compile once so neither row pays for writing bytecode
+        subprocess.run([sys.executable, "-m", "compileall", "-q", directory], check=True)
+        rows = [
+            ("dict literal", probe(directory, "literal_dictionary", "VIDEO_ID", args.lookups)),
+            ("CompactDictionary", probe(module_dir, "helper.general_dictionary", attribute, args.lookups)),
+        ]
+
+    print(f"  {args.dictionary}: {len(compact)} words")
+    for label, (load, memory, lookup) in rows:
+        print(f"  {label:<18} load {load * 1000:7.2f} ms  memory {memory / 1024:8.1f} KiB  "
+              f"lookup {lookup * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark LandmarkDetector modes on a video.
+
+Runs the same frames through the serial Pose/Hands/FaceMesh path, the
+three graphs in parallel threads, and a single Holistic graph. Reports
+frames per second and p50/p95 per-frame latency of detect().
+
+Usage (from the repository root):
+    python benchmarks/bench_landmark_detector.py VIDEO [--frames 300] [--modes serial threads holistic]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from helper.landmark_detector import DETECTOR_MODES, LandmarkDetector
+
+
+def read_frames(video_path, limit):
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while len(frames) < limit:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.cvtColor(cv2.resize(frame, (500, 500)), cv2.COLOR_BGR2RGB))
+    cap.release()
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('video')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--modes', nargs='+', choices=DETECTOR_MODES, default=list(DETECTOR_MODES))
+    args = parser.parse_args()
+
+    frames = read_frames(args.video, args.frames)
+    if not frames:
+        sys.exit(f"No frames read from {args.video}")
+
+    for mode in args.modes:
+        detector = LandmarkDetector(mode=mode)
+        # Warm up the graphs before timing
+        detector.detect(frames[0])
+
+        timings = []
+        start = time.perf_counter()
+        for frame in frames:
+            t = time.perf_counter()
+            detector.detect(frame)
+            timings.append(time.perf_counter() - t)
+        total = time.perf_counter() - start
+        detector.close()
+
+        p50, p95 = np.percentile(timings, [50, 95]) * 1000
+        print(f"  {mode:<9} {len(frames) / total:7.1f} fps  p50 {p50:7.1f} ms  p95 {p95:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark loading railway landmarks.
+
+Compares the JSON-in-CSV path used by render_sentence (pandas read_csv,
+then ast.literal_eval on every pose/hands cell) against opening the binary
+landmark store and reading every word's frames.
+
+The store is created from the CSV with coordinate_extractor.convert_csv_to_store
+if it does not exist yet.
+
+Usage (from the repository root):
+    python benchmarks/bench_landmark_load.py coordinates.csv [--store DIR]
+"""
+import argparse
+import ast
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from coordinate_extractor import convert_csv_to_store
+from helper.landmark_store import DEFAULT_STORE_PATH, LandmarkStore
+
+
+def load_csv(csv_file):
+    df = pd.read_csv(csv_file)
+    frames = 0
+    for _, row in df.iterrows():
+        ast.literal_eval(row['pose'])
+        ast.literal_eval(row['hands'])
+        frames += 1
+    return frames
+
+
+def load_store(store_path):
+    store = LandmarkStore(store_path)
+    frames = 0
+    for word in store.words:
+        clip = store.get(word)
+        # Touch the data so the pages are actually read
+        np.asarray(clip.points).sum()
+        frames += len(clip)
+    return frames
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    frames = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return frames, elapsed * 1000, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('csv_file')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.store, 'index.json')):
+        start = time.perf_counter()
+        convert_csv_to_store(args.csv_file, args.store)
+        print(f"Conversion: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    csv_size = os.path.getsize(args.csv_file)
+    store_size = sum(os.path.getsize(os.path.join(args.store, name)) for name in os.listdir(args.store))
+    print(f"Size: CSV {csv_size / 1024 / 1024:.1f} MiB  store {store_size / 1024 / 1024:.1f} MiB")
+
+    for label, fn, path in (("CSV + literal_eval", load_csv, args.csv_file), ("landmark store", load_store, args.store)):
+        frames, ms, peak = measure(fn, path)
+        print(f"  {label:<18} {frames:7d} frames  {ms:9.1f} ms  peak {peak:7.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
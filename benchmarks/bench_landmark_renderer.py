@@ -0,0 +1,90 @@
+"""
+Benchmark landmark rendering throughput for a pose + two hands frame.
+
+Compares the previous LandmarkRenderer.render_landmarks, which built a
+Landmark class per point and drew every connection with its own cv2.line
+call, against the vectorized renderer drawing from (N, 3) arrays with
+batched cv2.polylines.
+
+Usage (from the repository root):
+    python benchmarks/bench_landmark_renderer.py [--frames 2000] [--size 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from helper.connections import POSE_CONNECTIONS, HAND_CONNECTIONS
+from railway_landmark_detector import LandmarkRenderer
+
+SKIP = LandmarkRenderer.CONNECTIONS_NOT_NEEDED
+
+
+def legacy_render(canvas, pose_landmarks, hand_landmarks):
+    class PoseLandmarkObject:
+        def __init__(self, landmarks):
+            self.landmark = [type('Landmark', (), {'x': lm['x'], 'y': lm['y'], 'z': lm.get('z', 0)}) for lm in landmarks]
+
+    pose = PoseLandmarkObject(pose_landmarks)
+    for start, end in POSE_CONNECTIONS:
+        if start in SKIP or end in SKIP:
+            continue
+        cv2.line(canvas,
+                 (int(pose.landmark[start].x * canvas.shape[1]), int(pose.landmark[start].y * canvas.shape[0])),
+                 (int(pose.landmark[end].x * canvas.shape[1]), int(pose.landmark[end].y * canvas.shape[0])),
+                 (255, 0, 0), 2)
+
+    h, w, _ = canvas.shape
+    for hand_landmark_dict in hand_landmarks:
+        hand = PoseLandmarkObject(hand_landmark_dict)
+        for lm in hand.landmark:
+            cv2.circle(canvas, (int(lm.x * w), int(lm.y * h)), 2, (0, 0, 255), cv2.FILLED)
+        for start, end in HAND_CONNECTIONS:
+            cv2.line(canvas,
+                     (int(hand.landmark[start].x * w), int(hand.landmark[start].y * h)),
+                     (int(hand.landmark[end].x * w), int(hand.landmark[end].y * h)),
+                     (0, 0, 255), 1)
+    return canvas
+
+
+def random_landmarks(rng, count):
+    return [{"x": float(x), "y": float(y), "z": 0.0} for x, y in rng.uniform(0.1, 0.9, size=(count, 2))]
+
+
+def fps(fn, frames, size):
+    start = time.perf_counter()
+    for frame in frames:
+        fn(255 * np.ones((size, size, 3), dtype=np.uint8), frame)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--size', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    dict_frames = [(random_landmarks(rng, 33), [random_landmarks(rng, 21), random_landmarks(rng, 21)])
+                   for _ in range(args.frames)]
+
+    renderer = LandmarkRenderer()
+    array_frames = [renderer.layout.pack_dicts(pose, hands) for pose, hands in dict_frames]
+
+    rows = [
+        ("legacy (dicts)", fps(lambda canvas, f: legacy_render(canvas, *f), dict_frames, args.size)),
+        ("vectorized (dicts)", fps(lambda canvas, f: renderer.render_landmarks(canvas, *f), dict_frames, args.size)),
+        ("vectorized (arrays)", fps(lambda canvas, f: renderer.render_frame(canvas, *f), array_frames, args.size)),
+    ]
+    print(f"{args.frames} frames, pose + 2 hands, {args.size}x{args.size} canvas")
+    for label, value in rows:
+        print(f"  {label:<20} {value:9.0f} fps")
+
+
+if __name__ == '__main__':
+    main()
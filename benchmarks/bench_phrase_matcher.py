@@ -0,0 +1,90 @@
+"""
+Benchmark multi-word phrase matching on long texts.
+
+Builds a synthetic text from dictionary keys (multi-word ones included)
+and filler words, then tokenizes it greedily longest-match first with a
+naive scan (every key compared at every position) and with PhraseMatcher.
+Both must produce the same tokens.
+
+Usage (from the repository root):
+    python benchmarks/bench_phrase_matcher.py [--dictionary medical] [--words 20000] [--naive-words 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helper.dictionaries import DICTIONARY_NAMES, load_dictionary
+from helper.phrase_matcher import PhraseMatcher
+
+FILLER = ["patient", "should", "visit", "doctor", "today", "after", "meal", "twice", "daily", "unknownword"]
+
+
+def make_text(keys, num_words, seed=0):
+    rng = random.Random(seed)
+    multi = [key for key in keys if " " in key]
+    words = []
+    while len(words) < num_words:
+        roll = rng.random()
+        if roll < 0.2 and multi:
+            words.extend(rng.choice(multi).split())
+        elif roll < 0.6:
+            words.extend(rng.choice(keys).split())
+        else:
+            words.append(rng.choice(FILLER))
+    return words[:num_words]
+
+
+def naive_segment(keys, words):
+    phrases = sorted((key.split() for key in keys), key=len, reverse=True)
+    tokens = []
+    i = 0
+    while i < len(words):
+        for phrase in phrases:
+            if words[i:i + len(phrase)] == phrase:
+                tokens.append((" ".join(phrase), True))
+                i += len(phrase)
+                break
+        else:
+            tokens.append((words[i], False))
+            i += 1
+    return tokens
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dictionary', choices=DICTIONARY_NAMES, default='medical')
+    parser.add_argument('--words', type=int, default=20000)
+    parser.add_argument('--naive-words', type=int, default=2000,
+                        help="the naive scan compares every key at every position, so it only runs on this prefix")
+    args = parser.parse_args()
+
+    keys = list(load_dictionary(args.dictionary).keys())
+    words = make_text(keys, args.words)
+
+    matcher, build = timed(PhraseMatcher, keys)
+    print(f"  {args.dictionary}: {len(keys)} keys, longest {matcher.max_words} words, trie built in {build * 1000:.1f} ms")
+
+    prefix = words[:args.naive_words]
+    expected, naive_time = timed(naive_segment, keys, prefix)
+    got, _ = timed(matcher.segment, prefix)
+    assert got == expected, "PhraseMatcher disagrees with the naive scan"
+
+    tokens, trie_time = timed(matcher.segment, words)
+    phrases = sum(1 for token, is_key in tokens if is_key and " " in token)
+    print(f"  naive scan    {len(prefix):8d} words  {naive_time * 1000:9.1f} ms  {len(prefix) / naive_time:12.0f} words/s")
+    print(f"  PhraseMatcher {len(words):8d} words  {trie_time * 1000:9.1f} ms  {len(words) / trie_time:12.0f} words/s"
+          f"  ({phrases} multi-word matches)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark sentence playback with simulated rendering.
+
+Compares the old player (each word opened, rendered and shown one after
+another, waitKey(1) between frames) with helper.playback.PlaybackEngine
+(upcoming words rendered on worker threads, frames presented by a
+PresentationScheduler at the source frame rate). Rendering is simulated with sleeps, so no video,
+cv2 or MediaPipe is needed.
+
+Reports the presented frame rate and the time each word took against the
+source, the longest pause at a word boundary, the p95 frame interval and
+the scheduler's dropped, repeated and unrendered frames, stalls and
+lateness percentiles. A --render-ms above 1000 / --fps simulates detection
+slower than real time. The offline row renders the same words unpaced, as
+for a VideoFileSink or MemorySink.
+
+Usage (from the repository root):
+    python benchmarks/bench_playback.py [--words 8] [--frames 50] [--fps 25]
+        [--render-ms 15] [--startup-ms 80] [--workers 2]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helper.playback import PlaybackEngine
+
+
+def simulated_render(word, render_s):
+    def render(index):
+        time.sleep(render_s)
+        return (word, index)
+    return render
+
+
+def run_serial(args):
+    shown = []
+    for w in range(args.words):
+        time.sleep(args.startup_ms / 1000)  # Opening the video
+        render = simulated_render(w, args.render_ms / 1000)
+        for i in range(args.frames):
+            shown.append((time.perf_counter(), render(i)))
+            time.sleep(0.001)  # waitKey(1)
+    return shown, None
+
+
+class TimestampSink:
+    """Records when each new frame is shown, like a FrameSink without a display."""
+
+    def __init__(self, realtime):
+        self.realtime = realtime
+        self.shown = []
+
+    def show(self, frame, word, hold, fps):
+        # Repeats of the previous frame are not new frames
+        if not self.shown or self.shown[-1][1] is not frame:
+            self.shown.append((time.perf_counter(), frame))
+        if self.realtime:
+            time.sleep(max(0.001, hold))
+        return True
+
+    def finish(self):
+        pass
+
+
+def run_engine(args, realtime=True):
+    def source(word):
+        time.sleep(args.startup_ms / 1000)
+        return range(args.frames), args.fps, simulated_render(word, args.render_ms / 1000)
+
+    engine = PlaybackEngine(workers=args.workers)
+    sink = TimestampSink(realtime)
+
+    async def play():
+        queue = asyncio.Queue(maxsize=args.lookahead)
+
+        async def buffer():
+            for w in range(args.words):
+                await queue.put(engine.submit(w, lambda w=w: source(w)))
+            await queue.put(None)
+
+        _, stats = await asyncio.gather(buffer(), engine.play(queue, sink))
+        return stats
+
+    start = time.perf_counter()
+    stats = asyncio.run(play())
+    elapsed = time.perf_counter() - start
+    engine.close()
+    return sink.shown, stats, elapsed
+
+
+def report(name, shown, args, stats):
+    times = [t for t, _ in shown]
+    intervals = [b - a for a, b in zip(times, times[1:])]
+    boundaries = [b - a for (a, fa), (b, fb) in zip(shown, shown[1:]) if fa[0] != fb[0]]
+    # Time each word actually took against its length at the source frame rate
+    durations = {}
+    for t, (word, _) in shown:
+        first, _ = durations.get(word, (t, t))
+        durations[word] = (first, t)
+    word_ms = statistics.mean(last - first for first, last in durations.values()) * 1000
+    rate = (len(times) - 1) / (times[-1] - times[0])
+    p95 = statistics.quantiles(intervals, n=20)[18] if len(intervals) > 1 else 0.0
+    line = (f"{name:7s} {rate:6.1f} fps presented (source {args.fps:g})  "
+            f"word {word_ms:6.0f} ms (source {(args.frames - 1) / args.fps * 1000:.0f})  "
+            f"max word gap {max(boundaries, default=0) * 1000:6.1f} ms  p95 interval {p95 * 1000:5.1f} ms")
+    print(line)
+    if stats is not None:
+        print(f"        dropped {stats['dropped']}  repeated {stats['duplicated']}  not rendered {stats['skipped']}  "
+              f"stalls {stats['stalls']}  lateness p50 {stats['lateness_p50_ms']:.1f} ms  "
+              f"p95 {stats['lateness_p95_ms']:.1f} ms  max {stats['lateness_max_ms']:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=8)
+    parser.add_argument('--frames', type=int, default=50)
+    parser.add_argument('--fps', type=float, default=25.0)
+    parser.add_argument('--render-ms', type=float, default=15.0, help='Simulated detection time per frame')
+    parser.add_argument('--startup-ms', type=float, default=80.0, help='Simulated time to open a video')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--lookahead', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.words} words x {args.frames} frames, {args.render_ms:g} ms render, {args.startup_ms:g} ms startup")
+    shown, stats = run_serial(args)
+    report("serial", shown, args, stats)
+    shown, stats, _ = run_engine(args)
+    report("engine", shown, args, stats)
+    shown, stats, elapsed = run_engine(args, realtime=False)
+    print(f"offline {len(shown)} frames rendered in {elapsed:.2f}s ({len(shown) / elapsed:.0f} fps, "
+          f"{args.words * (args.frames - 1) / args.fps / elapsed:.1f}x real time) for file or memory sinks")
+
+
+if __name__ == '__main__':
+    main()
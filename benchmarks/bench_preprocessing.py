@@ -0,0 +1,121 @@
+"""
+Benchmark announcement preprocessing: accuracy and latency.
+
+Runs the offline AnnouncementTokenizer behind
+RailwaysAnnouncementPreprocessor.preprocess over the fixture announcements
+(and the held-out set, which was not used to write the rules) and compares the output with the expected tokens. Reports exact-match
+accuracy, token accuracy (matching tokens over the longer of the two
+sequences) and per-sentence latency. --llm also runs the original two-call
+LLM pipeline (needs GROQ_API_KEY and network).
+
+It then replays --announcements variants of the fixtures with random train
+numbers, times and platforms, with and without the TemplateCache.
+
+Usage (from the repository root):
+    python benchmarks/bench_preprocessing.py [--fixtures benchmarks/fixtures/railway_announcements.jsonl]
+        [--held-out benchmarks/fixtures/railway_announcements_held_out.jsonl] [--repeat 100] [--announcements 10000] [--llm]
+"""
+import argparse
+import difflib
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helper.announcement_tokenizer import AnnouncementTokenizer
+from helper.preprocess_cache import TemplateCache
+from helper.railway_dictionary import RAILWAY_IDS
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "railway_announcements.jsonl")
+DEFAULT_HELD_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "railway_announcements_held_out.jsonl")
+
+
+def load_fixtures(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(label, preprocess, fixtures, repeat, show_errors):
+    exact, matched, total = 0, 0, 0
+    timings = []
+    for case in fixtures:
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                tokens = preprocess(case["sentence"])
+                timings.append(time.perf_counter() - start)
+        except Exception as e:
+            tokens = []
+            print(f"  {label}: failed on {case['sentence']!r}: {e}")
+
+        expected = case["tokens"]
+        blocks = difflib.SequenceMatcher(a=tokens, b=expected, autojunk=False).get_matching_blocks()
+        matched += sum(block.size for block in blocks)
+        total += max(len(tokens), len(expected))
+        if tokens == expected:
+            exact += 1
+        elif show_errors:
+            print(f"  {label} mismatch: {case['sentence']!r}\n    got      {tokens}\n    expected {expected}")
+
+    p50, p99 = percentiles(timings)
+    print(f"  {label:<8} exact {exact}/{len(fixtures)}  token accuracy {matched / max(total, 1):6.1%}  "
+          f"p50 {p50:9.3f} ms  p99 {p99:9.3f} ms")
+
+
+def percentiles(timings):
+    cuts = statistics.quantiles(timings, n=100) if len(timings) > 1 else [0.0] * 99
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+def variants(fixtures, count, seed=0):
+    rng = random.Random(seed)
+    digits = lambda match: "".join(rng.choice("0123456789") for _ in match.group())
+    return [re.sub(r"\d+", digits, rng.choice(fixtures)["sentence"]) for _ in range(count)]
+
+
+def bench_repeated(tokenizer, sentences):
+    cache = TemplateCache(max_entries=1024)
+    for label, tokenize in (("uncached", tokenizer.tokenize),
+                            ("cached", lambda sentence: tokenizer.tokenize(sentence, cache=cache))):
+        timings = []
+        for sentence in sentences:
+            start = time.perf_counter()
+            tokenize(sentence)
+            timings.append(time.perf_counter() - start)
+        p50, p99 = percentiles(timings)
+        print(f"  {label:<8} {len(sentences)} announcements  p50 {p50:9.3f} ms  p99 {p99:9.3f} ms")
+    print(f"  template cache hit rate {cache.stats()['hit_rate']:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    parser.add_argument('--held-out', default=DEFAULT_HELD_OUT)
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--llm', action='store_true')
+    parser.add_argument('--show-errors', action='store_true')
+    parser.add_argument('--announcements', type=int, default=10000)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    tokenizer = AnnouncementTokenizer(RAILWAY_IDS.keys())
+    evaluate("offline", tokenizer.tokenize, fixtures, args.repeat, args.show_errors)
+    held_out = load_fixtures(args.held_out)
+    evaluate("held-out", tokenizer.tokenize, held_out, args.repeat, args.show_errors)
+    bench_repeated(tokenizer, variants(fixtures, args.announcements))
+
+    if args.llm:
+        from dotenv import load_dotenv
+        from text_isl_preprocessing import RailwaysAnnouncementPreprocessor
+
+        load_dotenv()
+        evaluate("llm", RailwaysAnnouncementPreprocessor().preprocess_llm, fixtures, 1, args.show_errors)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark player startup: import time and peak RSS.
+
+Each target is imported in a fresh interpreter, so module caches do not
+carry over. "torch + mediapipe" is what every player paid before the
+detector stopped importing torch and loading mediapipe eagerly; the other
+rows are the current entry points. Targets whose imports fail (missing
+optional packages) are reported and skipped.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup.py [--repeat 3] [--detector]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = [
+    ("torch + mediapipe", "import torch, mediapipe"),
+    ("text_isl", "import text_isl"),
+    ("railway_landmark_detector", "import railway_landmark_detector"),
+    ("helper.landmark_detector", "import helper.landmark_detector"),
+]
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+# ru_maxrss is KiB on Linux, bytes on macOS
+scale = 1 if sys.platform == "darwin" else 1024
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale)
+"""
+
+
+def probe(code):
+    result = subprocess.run([sys.executable, "-c", PROBE, code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1] if result.stderr else "failed"
+    seconds, rss = result.stdout.split()
+    return (float(seconds), int(rss)), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--detector', action='store_true',
+                        help="also time constructing a LandmarkDetector (loads mediapipe graphs)")
+    args = parser.parse_args()
+
+    targets = list(TARGETS)
+    if args.detector:
+        targets.append(("LandmarkDetector()",
+                        "from helper.landmark_detector import LandmarkDetector; LandmarkDetector()"))
+
+    for label, code in targets:
+        runs = []
+        for _ in range(args.repeat):
+            measured, error = probe(code)
+            if error:
+                print(f"  {label:<27} skipped: {error}")
+                break
+            runs.append(measured)
+        if not runs:
+            continue
+        best = min(seconds for seconds, _ in runs)
+        peak = max(rss for _, rss in runs)
+        print(f"  {label:<27} import {best * 1000:8.1f} ms  peak RSS {peak / (1024 * 1024):7.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark the local vector store's search against brute force.
+
+Fills a med_chatbot VectorIndex with synthetic embeddings (a mixture of
+clustered unit vectors, like sentence embeddings of related chunks),
+builds its IVF index and queries it with perturbed copies of stored rows.
+For each size reports the build time, p50/p99 query latency of the exact
+(memory-mapped brute force) and IVF searches and the IVF recall@k against
+the exact results.
+
+Usage (from the repository root):
+    python benchmarks/bench_vector_store.py [--sizes 10000 100000 1000000] [--dim 384]
+        [--queries 200] [--k 4 10] [--nprobe 0] [--dir /tmp/bench_vectors]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "med_chatbot"))
+
+import numpy as np
+
+from vector_index import VectorIndex
+
+
+def fill(index, size, dim, clusters, rng, batch=100000):
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    for start in range(0, size, batch):
+        n = min(batch, size - start)
+        rows = centers[rng.integers(clusters, size=n)] + 0.6 * rng.standard_normal((n, dim)).astype(np.float32)
+        index.add(rows)
+
+
+def latency(search, queries):
+    times = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(search(query))
+        times.append(time.perf_counter() - start)
+    cuts = statistics.quantiles(times, n=100)
+    return results, cuts[49] * 1000, cuts[98] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, nargs='+', default=[4, 10])
+    parser.add_argument('--nprobe', type=int, default=0, help='IVF cells per query (0: a tenth of the cells)')
+    parser.add_argument('--dir', help='Where the indexes are written (a temporary directory by default)')
+    args = parser.parse_args()
+
+    root = args.dir or tempfile.mkdtemp(prefix="bench_vectors_")
+    rng = np.random.default_rng(0)
+    k_max = max(args.k)
+    try:
+        for size in args.sizes:
+            path = os.path.join(root, str(size))
+            shutil.rmtree(path, ignore_errors=True)
+            index = VectorIndex(path, args.dim, nprobe=args.nprobe or None)
+
+            start = time.perf_counter()
+            fill(index, size, args.dim, clusters=max(10, size // 1000), rng=rng)
+            fill_s = time.perf_counter() - start
+            start = time.perf_counter()
+            index.build_ivf()
+            build_s = time.perf_counter() - start
+
+            rows = rng.choice(size, args.queries, replace=False)
+            queries = np.asarray(index.vectors[np.sort(rows)])
+            queries = queries + 0.5 * rng.standard_normal(queries.shape).astype(np.float32) / np.sqrt(args.dim)
+
+            exact, exact_p50, exact_p99 = latency(lambda q: index.search(q, k_max, exact=True)[0], queries)
+            approx, ivf_p50, ivf_p99 = latency(lambda q: index.search(q, k_max)[0], queries)
+
+            print(f"{size:>8} chunks  write {fill_s:5.1f}s  IVF build {build_s:5.1f}s ({index.ivf['nlist']} cells, "
+                  f"nprobe {args.nprobe or max(1, index.ivf['nlist'] // 10)})")
+            print(f"          exact  p50 {exact_p50:7.2f} ms  p99 {exact_p99:7.2f} ms")
+            recalls = "  ".join(
+                f"recall@{k} {np.mean([len(set(a[:k]) & set(e[:k])) / k for a, e in zip(approx, exact)]):.3f}"
+                for k in args.k
+            )
+            print(f"          IVF    p50 {ivf_p50:7.2f} ms  p99 {ivf_p99:7.2f} ms  {recalls}")
+    finally:
+        if not args.dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
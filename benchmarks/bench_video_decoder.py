@@ -0,0 +1,71 @@
+"""
+Benchmark dictionary video decoding.
+
+Compares the old load_video_frames (every frame decoded and resized into a
+list before playback starts) with the streaming VideoStream decoder.
+Reports time to the first frame, total time and peak traced memory.
+
+Usage (from the repository root):
+    python benchmarks/bench_video_decoder.py VIDEO [--buffer-size 16]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+
+from helper.video_decoder import open_video_stream
+
+
+def load_all(video_path):
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, (500, 500)))
+    cap.release()
+    return frames
+
+
+def measure(consume):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first, count = consume(start)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first * 1000, total * 1000, count, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('video')
+    parser.add_argument('--buffer-size', type=int, default=16)
+    args = parser.parse_args()
+
+    def list_consume(start):
+        frames = load_all(args.video)
+        first = time.perf_counter() - start
+        return first, len(frames)
+
+    def stream_consume(start):
+        first, count = None, 0
+        for _ in open_video_stream(args.video, buffer_size=args.buffer_size):
+            if first is None:
+                first = time.perf_counter() - start
+            count += 1
+        return first or 0.0, count
+
+    for label, consume in (("load into list", list_consume), ("VideoStream", stream_consume)):
+        first_ms, total_ms, count, peak = measure(consume)
+        print(f"  {label:<15} {count:5d} frames  first {first_ms:8.1f} ms  total {total_ms:8.1f} ms  peak {peak:7.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Report how many dictionary words share a clip.
+
+For each dictionary: words, distinct clips (by Drive file id), the dedup
+ratio (words per clip) and the extractions, downloads and renders saved by
+treating synonyms as one video. --examples lists some synonym groups.
+
+Usage (from the repository root):
+    python benchmarks/bench_video_dedup.py [--examples 5]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helper.dictionaries import DICTIONARY_NAMES, dedup_stats, group_by_video, load_dictionary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--examples', type=int, default=0)
+    args = parser.parse_args()
+
+    for name in DICTIONARY_NAMES:
+        dictionary = load_dictionary(name)
+        stats = dedup_stats(dictionary)
+        saved = stats["words"] - stats["videos"]
+        print(f"  {name:<8} {stats['words']:5d} words  {stats['videos']:5d} clips  "
+              f"ratio {stats['dedup_ratio']:.3f}  {saved} extractions saved ({saved / stats['words']:.1%})")
+
+        shared = [words for words in group_by_video(dictionary).values() if len(words) > 1]
+        for words in shared[:args.examples]:
+            print(f"           {', '.join(words)}")
+
+
+if __name__ == '__main__':
+    main()
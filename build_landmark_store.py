@@ -0,0 +1,17 @@
+import argparse
+import os
+
+from coordinate_extractor import build_store
+from helper.dictionaries import DICTIONARY_NAMES
+from helper.landmark_store import STORE_ROOT
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute landmarks for the sign dictionaries.")
+    parser.add_argument("dictionaries", nargs="*", default=list(DICTIONARY_NAMES), choices=DICTIONARY_NAMES)
+    parser.add_argument("--output", default=STORE_ROOT, help="Directory holding one store per dictionary")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Extraction processes")
+    args = parser.parse_args()
+
+    for name in args.dictionaries:
+        build_store(name, os.path.join(args.output, name), args.workers)
@@ -1,110 +1,259 @@
-import mediapipe as mp
-import cv2
+import argparse
 import csv
+import hashlib
 import json
-from utils.railway_dictionary import RAILWAY_IDS
-
-class CoordinateExtractor:
-    def __init__(self):
-        self.mp_pose = mp.solutions.pose
-        self.mp_hands = mp.solutions.hands
-
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            smooth_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.3,
-        )
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.3,
-        )
-
-    def extract_coordinates(self, video_path):
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            print(f"Error: Cannot open video file {video_path}")
-            return []
-
-        frame_landmarks = []
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+import numpy as np
+
+from helper.dictionaries import DICTIONARY_NAMES, load_dictionary, video_key
+from helper.landmark_detector import LandmarkDetector, face_outline_connections
+from helper.landmark_store import DEFAULT_STORE_PATH, STORE_ROOT, LandmarkLayout, LandmarkStore, LandmarkStoreWriter
+
+DEFAULT_FPS = 30.0
+MANIFEST_NAME = "manifest.jsonl"
+
+def extract_video(video_path, size=(500, 500)):
+    """
+    Run landmark detection on every frame of a video, resized like playback does.
+
+    Each clip gets a fresh detector, so tracking state never carries over
+    from the previous word's clip.
+
+    :return: (points, mask, fps) arrays in the detector's layout
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise IOError(f"Cannot open video file {video_path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+    points, masks = [], []
+    with LandmarkDetector() as detector:
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
+            frame_points, frame_mask = detector.extract_landmarks(cv2.resize(frame, size))
+            points.append(frame_points)
+            masks.append(frame_mask)
+
+    cap.release()
+    if not points:
+        raise IOError(f"No frames decoded from {video_path}")
+    return np.stack(points), np.stack(masks), fps
+
 
-            # Convert to RGB for MediaPipe processing
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pose_results = self.pose.process(frame_rgb)
-            hands_results = self.hands.process(frame_rgb)
-
-            pose_landmarks = [
-                {
-                    "x": lm.x,
-                    "y": lm.y,
-                    "z": lm.z,
-                }
-                for lm in pose_results.pose_landmarks.landmark
-            ] if pose_results.pose_landmarks else []
-
-            hand_landmarks = [
-                [
-                    {"x": lm.x, "y": lm.y, "z": lm.z}
-                    for lm in hand_landmark.landmark
-                ]
-                for hand_landmark in hands_results.multi_hand_landmarks
-            ] if hands_results.multi_hand_landmarks else []
-
-            frame_landmarks.append({
-                "pose": pose_landmarks,
-                "hands": hand_landmarks,
-            })
-
-        cap.release()
-        return frame_landmarks
-
-
-def save_coordinates_to_csv(coordinate_data, output_file="coordinates.csv"):
+def convert_csv_to_store(csv_file="coordinates.csv", output_dir=DEFAULT_STORE_PATH, fps=DEFAULT_FPS):
     """
-    Save coordinate data to a CSV file with word information.
-    
-    :param coordinate_data: Dictionary containing landmarks for each word.
-    :param output_file: Path to the output CSV file.
+    Convert a coordinates.csv (word, frame, pose and hands JSON columns) into a landmark store.
+
+    The store gets the pose + hands layout of the CSV, without face points.
+    The CSV is streamed row by row, so only one word's frames are held in memory.
+
+    :param csv_file: Path to the existing CSV file.
+    :param output_dir: Store directory (created if missing).
+    :param fps: Frame rate recorded for every word (the CSV does not keep it).
     """
-    with open(output_file, "w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["word", "frame", "pose", "hands"]
-        )
-        writer.writeheader()
+    layout = LandmarkLayout.standard()
+    csv.field_size_limit(sys.maxsize)
 
-        for word, frames in coordinate_data.items():
-            for frame_idx, frame_data in enumerate(frames):
-                writer.writerow({
-                    "word": word,
-                    "frame": frame_idx,
-                    "pose": json.dumps(frame_data.get("pose", [])),  # Convert list to JSON string
-                    "hands": json.dumps(frame_data.get("hands", [])),  # Convert list to JSON string
-                })
+    def flush_word(writer, word, frames):
+        if word is not None and frames:
+            frames.sort(key=lambda frame: frame[0])
+            writer.add(word, [points for _, points, _ in frames], [mask for _, _, mask in frames], fps)
 
-    print(f"Coordinates saved to {output_file}")
+    words = 0
+    with open(csv_file, newline="") as f, LandmarkStoreWriter(output_dir, layout) as writer:
+        current_word, frames = None, []
+        for row in csv.DictReader(f):
+            if row["word"] != current_word:
+                flush_word(writer, current_word, frames)
+                words += current_word is not None
+                current_word, frames = row["word"], []
+            points, mask = layout.pack_dicts(json.loads(row["pose"]), json.loads(row["hands"]))
+            frames.append((int(row["frame"]), points, mask))
+        flush_word(writer, current_word, frames)
+        words += current_word is not None
 
+    print(f"Converted {words} words from {csv_file} to {output_dir}")
 
 
-if __name__ == "__main__":
-    word_to_video_map = RAILWAY_IDS # Mapping of words to video paths
+def shard_name(key):
+    return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".npz"
+
+
+def _extract_word(key, video_path, shard_dir):
+    """Worker task: extract one clip and write its shard. Returns (key, frames, fps, seconds)."""
+    start = time.time()
+    points, mask, fps = extract_video(video_path)
+
+    path = os.path.join(shard_dir, shard_name(key))
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, points=points, mask=mask, fps=np.float64(fps))
+    os.replace(tmp_path, path)
+    return key, len(points), fps, time.time() - start
+
+
+def read_manifest(shard_dir):
+    """Returns {word: entry} of the words whose shards were completed."""
+    done = {}
+    path = os.path.join(shard_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Torn last line from an interrupted run
+            if entry.get("status") == "ok" and os.path.exists(os.path.join(shard_dir, entry["shard"])):
+                done[entry["word"]] = entry
+            else:
+                done.pop(entry.get("word"), None)
+    return done
+
+
+def extract_to_shards(word_to_video_map, shard_dir, workers=None, skip=()):
+    """
+    Extract every word in parallel into per-clip shards, resuming where a previous run stopped.
+
+    Synonyms pointing at the same clip are extracted once and share a
+    shard. Each finished clip is appended to manifest.jsonl (one line per
+    word), so an interrupted or failed run loses at most the clips in
+    flight. Failed words are recorded and retried on the next run.
 
-    extractor = CoordinateExtractor()
-    all_coordinates = {}  # Initialize an empty dictionary
+    :param skip: Words not to extract, e.g. those already in the store
+    :return: Number of clips that failed
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    done = read_manifest(shard_dir)
+    groups = {}
+    for word in word_to_video_map:
+        if word not in done and word not in skip:
+            groups.setdefault(video_key(word_to_video_map, word), []).append(word)
+    pending = [(key, word_to_video_map[words[0]]) for key, words in groups.items()]
+    print(f"{len(done)} words already extracted, {len(pending)} clips to go "
+          f"for {sum(map(len, groups.values()))} words")
+    if not pending:
+        return 0
+
+    workers = workers or os.cpu_count()
+    failed = 0
+    frames_total = 0
+    start = time.time()
+
+    with open(os.path.join(shard_dir, MANIFEST_NAME), "a") as manifest, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_extract_word, key, path, shard_dir): key for key, path in pending}
+        for completed, future in enumerate(as_completed(futures), 1):
+            key = futures[future]
+            words = groups[key]
+            word = ", ".join(words)
+            try:
+                _, frames, fps, seconds = future.result()
+                entry = {"status": "ok", "shard": shard_name(key), "frames": frames, "fps": fps}
+                frames_total += frames
+                detail = f"{frames} frames in {seconds:.1f}s"
+            except Exception as e:
+                entry = {"status": "error", "error": str(e)}
+                failed += 1
+                detail = f"failed: {e}"
+
+            for synonym in words:
+                manifest.write(json.dumps({"word": synonym, **entry}) + "\n")
+            manifest.flush()
+            os.fsync(manifest.fileno())
+
+            elapsed = time.time() - start
+            rate = completed / elapsed
+            eta = (len(pending) - completed) / rate if rate else 0
+            print(f"[{completed}/{len(pending)}] {word}: {detail} | {rate:.2f} clips/s, "
+                  f"{frames_total / elapsed:.0f} frames/s, ETA {eta // 60:.0f}m{eta % 60:02.0f}s")
+
+    return failed
+
+
+def pack_shards(shard_dir, output_dir, layout, flush_every=50):
+    """
+    Append every extracted word that is not yet in the landmark store.
+
+    Words sharing a shard are written once; the others become aliases of it.
+
+    :param layout: LandmarkLayout the shards were extracted in
+    """
+    done = read_manifest(shard_dir)
+    with LandmarkStoreWriter(output_dir, layout) as writer:
+        # shard -> a word whose frames are already in the store
+        stored = {}
+        for word, entry in done.items():
+            if word in writer:
+                stored.setdefault(entry["shard"], word)
+
+        added = aliased = 0
+        for word, entry in done.items():
+            if word in writer:
+                continue
+            if entry["shard"] in stored:
+                writer.add_alias(word, stored[entry["shard"]])
+                aliased += 1
+                continue
+            with np.load(os.path.join(shard_dir, entry["shard"])) as shard:
+                if shard["points"].shape[1] != layout.num_points:
+                    raise ValueError(f"Shard of {word!r} in {shard_dir} has a different layout; "
+                                     f"delete the directory and extract again")
+                writer.add(word, shard["points"], shard["mask"], float(shard["fps"]))
+            stored[entry["shard"]] = word
+            added += 1
+            if added % flush_every == 0:
+                writer.flush()
 
-    # Extract coordinates for each word
-    for word, video_path in word_to_video_map.items():
-        print(f"Processing word: {word}")
-        coordinates = extractor.extract_coordinates(video_path)
-        all_coordinates[word] = coordinates  # Associate the word with its coordinates
+    print(f"Packed {added} new clips and {aliased} synonyms into {output_dir}")
 
-    # Save to CSV
-    save_coordinates_to_csv(all_coordinates, output_file="coordinates.csv")
 
+def build_store(name, output_dir=None, workers=None):
+    """
+    Extract a dictionary into the landmark store read by the players.
+
+    Clips are extracted in parallel into <store>.shards/ and packed into
+    the store with pose, hands and the face outline. Words already in the
+    store are skipped, so an interrupted build can be rerun.
+
+    :param name: Dictionary name
+    :param output_dir: Store directory (default landmark_store/<name>)
+    :return: Number of clips that failed
+    """
+    output_dir = output_dir or os.path.join(STORE_ROOT, name)
+    stored = ()
+    if os.path.exists(os.path.join(output_dir, "index.json")):
+        stored = LandmarkStore(output_dir).words
+
+    shard_dir = output_dir + ".shards"
+    failed = extract_to_shards(load_dictionary(name), shard_dir, workers, skip=stored)
+    pack_shards(shard_dir, output_dir, LandmarkLayout.standard(face_outline_connections()))
+    if failed:
+        print(f"{failed} clips failed; run again to retry them")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract sign landmarks for a dictionary.")
+    parser.add_argument("--dictionary", default="railway", choices=DICTIONARY_NAMES)
+    parser.add_argument("--output", help="Landmark store directory (default landmark_store/<dictionary>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Extraction processes")
+    parser.add_argument("--convert", metavar="CSV", help="Convert an existing coordinates.csv instead of extracting")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS, help="Frame rate stored with converted words")
+    args = parser.parse_args()
+
+    if args.convert:
+        convert_csv_to_store(args.convert, args.output or os.path.join(STORE_ROOT, args.dictionary), args.fps)
+        return
+
+    build_store(args.dictionary, args.output, args.workers)
+
+
+if __name__ == "__main__":
+    main()
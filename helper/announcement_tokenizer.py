@@ -0,0 +1,221 @@
+import re
+
+from helper.phrase_matcher import PhraseMatcher
+
+STOP_WORDS = frozenset([
+    "a", "an", "the", "by",
+    "is", "am", "are", "was", "were", "be", "been", "being",
+    "do", "does", "did", "has", "have", "had", "will", "shall",
+    "would", "should", "can", "could", "may", "might", "must",
+    "and", "or", "nor", "so", "for", "yet",
+    "oh", "uh", "um", "ah", "wow",
+])
+
+NUMBER_WORDS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
+    "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+    "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+    "eighteen": 18, "nineteen": 19,
+}
+# Combined with a following unit word, so "twenty one" is 21 rather than 2, 0, 1
+TENS_WORDS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+# Abbreviations expanded before tokenizing, applied in order
+ABBREVIATIONS = [
+    (re.compile(r"\btrain\s*\.?\s*no\b\.?"), "train number"),
+    (re.compile(r"\bnos?\b\.?(?=\s*\d)"), "number"),
+    (re.compile(r"\bp\s*/\s*f\b|\bpf\b|\bplat\b\.?"), "platform"),
+]
+
+# Codes such as "9b" or "12951a" (digits with one letter glued on), words, digit runs
+# and "&" (as in "jammu & kashmir"); everything else separates tokens, so "12:45"
+# becomes "12", "45" while "3am" stays "3", "am"
+TOKEN_PATTERN = re.compile(r"\d+[a-z](?![a-z])|[a-z]+|\d+|&")
+CODE_PATTERN = re.compile(r"(\d+)([a-z])")
+
+# Bump when the rules change so persisted template caches are not reused
+TOKENIZER_VERSION = 3
+
+# Template placeholders for the variable parts of an announcement; no dictionary key contains "\0"
+NUMBER_SLOT = "\0#"
+LETTER_SLOT = "\0@"
+
+# Forms the suffix rules cannot reach
+IRREGULAR_LEMMAS = {
+    "i": "me", "my": "me", "mine": "me", "myself": "me",
+    "left": "leave", "went": "go", "gone": "go", "stood": "stand",
+    "arrival": "arrive", "arrivals": "arrive", "departure": "depart", "departures": "depart",
+    "cancellation": "cancel", "boarded": "board", "informing": "inform",
+}
+
+# (suffix, replacement) pairs tried in order; a candidate is only used if it is in the vocabulary
+SUFFIX_RULES = [
+    ("ies", "y"), ("ied", "y"),
+    ("ing", ""), ("ing", "e"),
+    ("ed", ""), ("ed", "e"),
+    ("es", ""), ("s", ""),
+]
+
+
+class AnnouncementTokenizer:
+    def __init__(self, vocabulary, stop_words=STOP_WORDS, matcher=None):
+        """
+        Offline tokenizer that turns an announcement into sign dictionary keys.
+
+        Steps: expand abbreviations ("train no.", "P/F"), split into words and
+        digit runs, drop stop words, match multi-word phrases longest first,
+        lemmatize against the vocabulary and split numbers, times and
+        platform codes into single digit and letter tokens.
+
+        :param vocabulary: Iterable of dictionary keys (e.g. RAILWAY_IDS)
+        :param matcher: PhraseMatcher over the same keys, to share one (e.g. get_phrase_matcher("railway"))
+        """
+        self.vocabulary = frozenset(vocabulary)
+        self.stop_words = frozenset(stop_words)
+        self.matcher = matcher or PhraseMatcher(self.vocabulary)
+
+    def normalize(self, sentence):
+        """Lowercase, expand abbreviations and split into raw tokens."""
+        text = sentence.lower()
+        for pattern, replacement in ABBREVIATIONS:
+            text = pattern.sub(replacement, text)
+        return TOKEN_PATTERN.findall(text)
+
+    def lemmatize(self, word):
+        """Return the vocabulary entry for word, or None if it has none."""
+        if word in self.vocabulary:
+            return word
+        if word in IRREGULAR_LEMMAS:
+            lemma = IRREGULAR_LEMMAS[word]
+            return lemma if lemma in self.vocabulary else None
+
+        for suffix, replacement in SUFFIX_RULES:
+            if not word.endswith(suffix) or len(word) <= len(suffix) + 1:
+                continue
+            stem = word[:-len(suffix)]
+            for candidate in (stem + replacement, stem[:-1] if stem[-1:] == stem[-2:-1] else None):
+                if candidate and candidate in self.vocabulary:
+                    return candidate
+        return None
+
+    def _words(self, tokens):
+        """
+        Drop stop words, turn number words into digits and mark letters that belong to a code.
+
+        A tens word followed by a unit word ("twenty one") becomes one number.
+
+        A letter is part of a code when it was glued to the digits ("9B",
+        "12951A") or follows a platform number ("platform 4 B", "platform
+        number 4 B"). Any other
+        letter after a number is an ordinary word, so the "a" of "train
+        12951 a superfast express" is dropped as a stop word.
+        """
+        words = []
+        tens = None
+        for token in tokens:
+            code = CODE_PATTERN.fullmatch(token)
+            if code:
+                words.extend((code.group(1), code.group(2).upper()))
+            elif token in TENS_WORDS:
+                words.append(str(TENS_WORDS[token]))
+            elif token in NUMBER_WORDS:
+                if tens is not None and 1 <= NUMBER_WORDS[token] <= 9:
+                    words[-1] = str(tens + NUMBER_WORDS[token])
+                else:
+                    words.append(str(NUMBER_WORDS[token]))
+            elif len(token) == 1 and token.isalpha() and self._follows_platform_number(words):
+                words.append(token.upper())
+            elif token not in self.stop_words:
+                words.append(token)
+            tens = TENS_WORDS.get(token)
+        return words
+
+    @staticmethod
+    def _follows_platform_number(words):
+        """True if words end with "platform [number] <digits>"."""
+        if not words or not words[-1].isdigit():
+            return False
+        before = words[-3:-1] if len(words) >= 3 else words[:-1]
+        return before[-1:] == ["platform"] or before == ["platform", "number"]
+
+    def templatize(self, sentence):
+        """
+        Split an announcement into a template and the values of its slots.
+
+        Numbers (train numbers, times, platforms) become NUMBER_SLOT and the
+        letter of a platform code such as "9B" becomes LETTER_SLOT, so
+        announcements that differ only in those share one template.
+
+        :return: (template words as a tuple, slot values in order)
+        """
+        template, slots = [], []
+        for word in self._words(self.normalize(sentence)):
+            if word.isdigit():
+                template.append(NUMBER_SLOT)
+                slots.append(word)
+            elif len(word) == 1 and word.isupper():
+                template.append(LETTER_SLOT)
+                slots.append(word)
+            else:
+                template.append(word)
+        return tuple(template), slots
+
+    @staticmethod
+    def fill(keys, slots):
+        """Replace the slots in tokenized template keys with their values, one digit per number token."""
+        values = iter(slots)
+        filled = []
+        for key in keys:
+            if key == NUMBER_SLOT:
+                filled.extend(next(values))
+            elif key == LETTER_SLOT:
+                filled.append(next(values))
+            else:
+                filled.append(key)
+        return filled
+
+    def tokenize(self, sentence, fallback=None, cache=None):
+        """
+        Tokenize an announcement into dictionary keys.
+
+        Words that are neither in the vocabulary nor reachable by
+        lemmatization are passed to fallback (if given) as one list; it
+        returns {word: lemma} for the ones it could resolve. Anything still
+        unknown is fingerspelled as uppercase letters.
+
+        :param fallback: Optional callable(list of words) -> dict
+        :param cache: Optional TemplateCache; a hit only refills the slots
+        :return: List of dictionary keys
+        """
+        template, slots = self.templatize(sentence)
+        keys = cache.get(template) if cache is not None else None
+        if keys is None:
+            keys = self.tokenize_template(template, fallback)
+            if cache is not None:
+                cache.put(template, keys)
+        return self.fill(keys, slots)
+
+    def tokenize_template(self, template, fallback=None):
+        """Tokenize template words into dictionary keys, passing slots through unchanged."""
+        words = [token for token, _ in self.matcher.segment(list(template))]
+
+        slot = (NUMBER_SLOT, LETTER_SLOT)
+        lemmas = [word if word in slot or word in self.vocabulary else self.lemmatize(word) for word in words]
+        unknown = [word for word, lemma in zip(words, lemmas) if lemma is None]
+        resolved = fallback(sorted(set(unknown))) if fallback and unknown else {}
+
+        keys = []
+        for word, lemma in zip(words, lemmas):
+            if lemma is None:
+                lemma = resolved.get(word)
+                if lemma is not None and lemma not in self.vocabulary:
+                    lemma = self.lemmatize(lemma)
+            if lemma is not None:
+                keys.append(lemma)
+            else:
+                keys.extend(letter.upper() for letter in word if letter.isalpha())
+        return keys
@@ -0,0 +1,89 @@
+import bisect
+import json
+import os
+import threading
+from array import array
+from collections.abc import Mapping
+
+
+class CompactDictionary(Mapping):
+    def __init__(self, path, url_template):
+        """
+        Read-only word -> video URL mapping backed by a JSON data file.
+
+        The file holds the words sorted, the distinct video ids once each and,
+        per word, the index of its id, so synonyms sharing a clip share one
+        string. Nothing is read until the first lookup, and URLs are only
+        formatted when a value is asked for. Lookups bisect the sorted words.
+
+        :param path: Data file written by write_compact_dictionary
+        :param url_template: Format string with one {} for the video id (DRIVE_LINK_PLACEHOLDER)
+        """
+        self.path = path
+        self.url_template = url_template
+        self._keys = None
+        self._ids = None
+        self._refs = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._keys is None:
+            with self._lock:
+                if self._keys is None:
+                    with open(self.path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    self._ids = data["ids"]
+                    self._refs = array("I", data["refs"])
+                    self._keys = data["keys"]
+        return self._keys
+
+    def _find(self, key):
+        keys = self._load()
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return i
+        return -1
+
+    def video_id(self, key):
+        """The video id of a word, without formatting a URL."""
+        i = self._find(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        return self._ids[self._refs[i]]
+
+    def __getitem__(self, key):
+        return self.url_template.format(self.video_id(key))
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __repr__(self):
+        return f"CompactDictionary({self.path!r})"
+
+
+def write_compact_dictionary(path, video_ids):
+    """
+    Write a data file for CompactDictionary.
+
+    :param video_ids: Mapping of word -> video id (not URL)
+    """
+    keys = sorted(video_ids)
+    ids, refs, seen = [], [], {}
+    for key in keys:
+        video_id = video_ids[key]
+        if video_id not in seen:
+            seen[video_id] = len(ids)
+            ids.append(video_id)
+        refs.append(seen[video_id])
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"keys": keys, "ids": ids, "refs": refs}, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
@@ -0,0 +1,56 @@
+import os
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DICTIONARY_NAMES = ("general", "railway", "medical")
+
+MEDICAL_DATA_PATH = os.path.join(ROOT, "med_chatbot", "helper", "dictionary_data", "medical.json")
+
+
+def load_dictionary(name):
+    """Returns the word -> video URL mapping for a dictionary name."""
+    if name == "general":
+        from helper.general_dictionary import VIDEO_ID
+        return VIDEO_ID
+    if name == "railway":
+        from helper.railway_dictionary import RAILWAY_IDS
+        return RAILWAY_IDS
+    if name == "medical":
+        # med_chatbot keeps its own helper/ package, so open its data file directly
+        from helper.compact_dictionary import CompactDictionary
+        from helper.drive_link_placeholder import DRIVE_LINK_PLACEHOLDER
+        return CompactDictionary(MEDICAL_DATA_PATH, DRIVE_LINK_PLACEHOLDER)
+    raise ValueError(f"Unknown dictionary: {name}")
+
+
+def video_key(dictionary, word):
+    """
+    Canonical id of a word's clip: its Drive file id, or the URL when it has none.
+
+    Synonyms that point at the same clip ("ache" and "pain") get the same key,
+    so caches, landmark extraction and playback can treat them as one video.
+    """
+    video_id = getattr(dictionary, "video_id", None)
+    if video_id is not None:
+        return video_id(word)
+    url = dictionary[word]
+    return parse_qs(urlparse(url).query).get("id", [url])[0]
+
+
+def group_by_video(dictionary):
+    """Returns {video key: [words]} with the words of each clip in dictionary order."""
+    groups = {}
+    for word in dictionary:
+        groups.setdefault(video_key(dictionary, word), []).append(word)
+    return groups
+
+
+def dedup_stats(dictionary):
+    """Words, distinct clips and words per clip of a dictionary."""
+    videos = len(group_by_video(dictionary))
+    return {
+        "words": len(dictionary),
+        "videos": videos,
+        "dedup_ratio": len(dictionary) / videos if videos else 1.0,
+    }
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+# Rendered landmarks are mostly white canvas, which run-length PNG shrinks
+# about 80x (a 500x500 frame to ~9 KB) and decodes in a few milliseconds
+PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE]
+
+
+def encode_frame(frame):
+    ok, png = cv2.imencode(".png", frame, PNG_PARAMS)
+    if not ok:
+        raise ValueError("Could not encode frame as PNG")
+    return png.tobytes()
+
+
+def decode_frame(png):
+    return cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+
+class RenderedWord:
+    def __init__(self, word, frames, fps):
+        """
+        Rendered frames of one word, kept PNG-encoded.
+
+        Play it by decoding each frame, e.g. as the render step of a
+        PlaybackEngine source: (rendered.frames, rendered.fps, decode_frame).
+
+        :param frames: List of PNG-encoded frames (bytes)
+        :param fps: Playback frame rate
+        """
+        self.word = word
+        self.frames = frames
+        self.fps = fps
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def nbytes(self):
+        return sum(len(frame) for frame in self.frames)
+
+
+class FrameCache:
+    def __init__(self, memory_budget=512 * 1024 * 1024, spill_dir=None, disk_budget=2 * 1024 * 1024 * 1024):
+        """
+        LRU cache of rendered per-word frame sequences.
+
+        Entries are keyed by word, canvas size and render style, and frames
+        are stored PNG-encoded, so the budget holds thousands of words rather
+        than a few raw ones. When the in-memory entries exceed memory_budget,
+        the least recently used ones are written to spill_dir (if given)
+        instead of being dropped. Spilled entries survive restarts and are
+        reloaded into memory on their next hit.
+
+        :param memory_budget: Bytes of encoded frames kept in memory
+        :param spill_dir: Directory for evicted entries (None disables spilling)
+        :param disk_budget: Bytes of spilled entries kept on disk
+        """
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.disk_budget = disk_budget
+
+        self._memory = OrderedDict()  # key -> RenderedWord
+        self._disk = OrderedDict()  # key -> bytes on disk
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._load_spill_index()
+
+    @staticmethod
+    def make_key(word, size, style):
+        raw = json.dumps([word, list(size), style])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _spill_paths(self, key):
+        return os.path.join(self.spill_dir, f"{key}.frames"), os.path.join(self.spill_dir, f"{key}.json")
+
+    def _load_spill_index(self):
+        entries = []
+        for name in os.listdir(self.spill_dir):
+            if name.endswith(".npy"):
+                # Raw frames spilled by older versions
+                os.remove(os.path.join(self.spill_dir, name))
+                continue
+            if not name.endswith(".frames"):
+                continue
+            key = name[:-len(".frames")]
+            frames_path, meta_path = self._spill_paths(key)
+            if not os.path.exists(meta_path):
+                os.remove(frames_path)
+                continue
+            entries.append((os.path.getmtime(frames_path), key, os.path.getsize(frames_path)))
+
+        # Oldest first, so the OrderedDict keeps LRU order
+        for _, key, nbytes in sorted(entries):
+            self._disk[key] = nbytes
+            self.disk_bytes += nbytes
+
+    def contains(self, word, size, style):
+        """True if the word is cached in memory or on disk; does not count as a lookup."""
+        key = self.make_key(word, size, style)
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def get(self, word, size, style):
+        """Return the cached RenderedWord or None."""
+        key = self.make_key(word, size, style)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            if key not in self._disk:
+                self.misses += 1
+                return None
+
+            entry = self._read_spilled(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, entry)
+            return entry
+
+    def put(self, word, size, style, frames, fps):
+        """
+        Cache the rendered frames of a word; they are PNG-encoded on the calling thread.
+
+        :param frames: Sequence of equally sized uint8 canvases
+        """
+        if not len(frames):
+            return None
+        entry = RenderedWord(word, [encode_frame(frame) for frame in frames], fps)
+        key = self.make_key(word, size, style)
+        with self._lock:
+            self._insert(key, entry)
+        return entry
+
+    def put_encoded(self, word, size, style, frames, fps):
+        """
+        Cache frames that are already PNG-encoded, e.g. by a PlaybackEngine encode step.
+
+        :param frames: Sequence of encode_frame results
+        """
+        if not len(frames):
+            return None
+        entry = RenderedWord(word, list(frames), fps)
+        key = self.make_key(word, size, style)
+        with self._lock:
+            self._insert(key, entry)
+        return entry
+
+    def _insert(self, key, entry):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self.memory_bytes -= old.nbytes
+        self._memory[key] = entry
+        self.memory_bytes += entry.nbytes
+
+        # Always keep the newest entry, even if it is larger than the budget on its own
+        while self.memory_bytes > self.memory_budget and len(self._memory) > 1:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self.memory_bytes -= evicted.nbytes
+            self._spill(evicted_key, evicted)
+
+    def _spill(self, key, entry):
+        if not self.spill_dir:
+            return
+        if key in self._disk:
+            self._disk.move_to_end(key)
+            return
+
+        frames_path, meta_path = self._spill_paths(key)
+        tmp_path = frames_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for frame in entry.frames:
+                f.write(frame)
+        os.replace(tmp_path, frames_path)
+        with open(meta_path, "w") as f:
+            json.dump({"word": entry.word, "fps": entry.fps, "lengths": [len(frame) for frame in entry.frames]}, f)
+
+        nbytes = os.path.getsize(frames_path)
+        self._disk[key] = nbytes
+        self.disk_bytes += nbytes
+
+        while self.disk_bytes > self.disk_budget and len(self._disk) > 1:
+            old_key, old_bytes = self._disk.popitem(last=False)
+            self.disk_bytes -= old_bytes
+            for path in self._spill_paths(old_key):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _read_spilled(self, key):
+        frames_path, meta_path = self._spill_paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(frames_path, "rb") as f:
+                data = f.read()
+            ends = np.cumsum(meta["lengths"]).tolist()
+            if not ends or ends[-1] != len(data):
+                raise ValueError(f"Spilled frames of {key} are truncated")
+            frames = [data[start:end] for start, end in zip([0] + ends[:-1], ends)]
+        except (OSError, ValueError, KeyError):
+            self.disk_bytes -= self._disk.pop(key)
+            return None
+
+        self._disk.move_to_end(key)
+        os.utime(frames_path)
+        return RenderedWord(meta["word"], frames, meta["fps"])
+
+    def stats(self):
+        """Hit counts and sizes; hit_rate counts memory and disk hits."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self.memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self.disk_bytes,
+            }
@@ -0,0 +1,230 @@
+import http.server
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+# Ends a MemorySink's frames
+_END = object()
+
+
+class FrameSink:
+    # Whether frames are paced in real time by the PresentationScheduler; offline sinks
+    # get every frame as fast as it is rendered, with its duration as hold
+    realtime = True
+
+    def __init__(self, annotate=None):
+        """
+        Destination of presented frames: a window, a file, memory or an HTTP stream.
+
+        :param annotate: Optional callable(frame copy, word, fps) that draws labels and returns the frame
+        """
+        self.annotate = annotate
+        # Set when the viewer asked to stop (e.g. 'q' in a window)
+        self.stop_requested = False
+
+    def show(self, frame, word, hold, fps):
+        """Called by the PresentationScheduler for every frame; returns False to skip the rest of the word."""
+        if self.annotate is not None:
+            frame = self.annotate(frame.copy(), word, fps)
+        if self.write(frame, word, hold):
+            return True
+        self.stop_requested = True
+        return False
+
+    def write(self, frame, word, hold):
+        raise NotImplementedError
+
+    def finish(self):
+        """Called after every sentence."""
+
+    def close(self):
+        self.finish()
+
+
+class WindowSink(FrameSink):
+    def __init__(self, name="Landmark Canvas", annotate=None):
+        """Shows frames in a cv2 window; 'q' skips the rest of a word."""
+        super().__init__(annotate)
+        self.name = name
+
+    def write(self, frame, word, hold):
+        cv2.imshow(self.name, frame)
+        return cv2.waitKey(max(1, round(hold * 1000))) & 0xFF != ord("q")
+
+    def finish(self):
+        cv2.destroyAllWindows()
+
+
+class VideoFileSink(FrameSink):
+    realtime = False
+
+    def __init__(self, path, fps=30.0, fourcc="mp4v", annotate=None):
+        """
+        Writes frames into a video file at a fixed frame rate.
+
+        Words whose clips have another frame rate are resampled by
+        repeating or leaving out frames, so every word keeps its duration.
+        The file is closed by finish().
+
+        :param path: Output file; the container follows the extension (.mp4, .avi)
+        :param fps: Frame rate of the written video
+        :param fourcc: Four character codec code for cv2.VideoWriter
+        """
+        super().__init__(annotate)
+        self.path = path
+        self.fps = fps
+        self.fourcc = fourcc
+        self.frames_written = 0
+        self._writer = None
+        self._duration = 0.0
+
+    def write(self, frame, word, hold):
+        if self._writer is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            height, width = frame.shape[:2]
+            self._writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (width, height))
+            if not self._writer.isOpened():
+                raise IOError(f"Cannot open video writer for {self.path}")
+
+        self._duration += hold
+        while self.frames_written < round(self._duration * self.fps):
+            self._writer.write(frame)
+            self.frames_written += 1
+        return True
+
+    def finish(self):
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+
+class MemorySink(FrameSink):
+    realtime = False
+
+    def __init__(self, max_buffered=64, annotate=None):
+        """
+        Hands frames to a consumer iterating the sink, e.g. on another thread.
+
+        Iterating yields (frame, word, duration in seconds) until finish().
+        Rendering blocks once max_buffered frames are waiting, so a slow
+        consumer holds a bounded number of frames.
+        """
+        super().__init__(annotate)
+        self._queue = queue.Queue(maxsize=max_buffered)
+
+    def write(self, frame, word, hold):
+        self._queue.put((frame, word, hold))
+        return True
+
+    def finish(self):
+        self._queue.put(_END)
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            yield item
+
+
+def generate_frames(render, max_buffered=64, annotate=None):
+    """
+    Run render(sink) on a background thread and yield its frames as they are produced.
+
+    :param render: Callable taking a MemorySink, e.g. lambda sink: render_sentence(words, sink=sink)
+    :return: Generator of (frame, word, duration in seconds)
+    """
+    sink = MemorySink(max_buffered, annotate)
+    errors = []
+
+    def run():
+        try:
+            render(sink)
+        except Exception as e:
+            errors.append(e)
+            sink.finish()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    yield from sink
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+class HTTPStreamSink(FrameSink):
+    def __init__(self, host="0.0.0.0", port=8080, quality=80, annotate=None):
+        """
+        Serves frames as an MJPEG stream (multipart/x-mixed-replace) over HTTP.
+
+        Open http://host:port/ in a browser or any MJPEG client; every client
+        gets the newest frame, paced by the scheduler at the source rate. The
+        server runs on a background thread until close().
+
+        :param quality: JPEG quality (0-100)
+        """
+        super().__init__(annotate)
+        self.quality = quality
+        self._frame = None
+        self._sequence = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        sink = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+                self.end_headers()
+                sequence = 0
+                try:
+                    while True:
+                        jpeg, sequence = sink.next_jpeg(sequence)
+                        if jpeg is None:
+                            break
+                        self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n")
+                        self.wfile.write(f"Content-Length: {len(jpeg)}\r\n\r\n".encode("ascii"))
+                        self.wfile.write(jpeg)
+                        self.wfile.write(b"\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.address = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def next_jpeg(self, seen):
+        """Block until a frame newer than sequence number seen; returns (jpeg bytes, sequence) or (None, seen) once closed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or self._sequence > seen)
+            if self._closed:
+                return None, seen
+            return self._frame, self._sequence
+
+    def write(self, frame, word, hold):
+        ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+        if ok:
+            with self._condition:
+                self._frame = jpeg.tobytes()
+                self._sequence += 1
+                self._condition.notify_all()
+        if hold > 0:
+            time.sleep(hold)
+        return True
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
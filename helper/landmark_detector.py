@@ -0,0 +1,196 @@
+import concurrent.futures
+import os
+
+import cv2
+import numpy as np
+
+from helper.connections import CONNECTIONS_NOT_NEEDED, HAND_CONNECTIONS, POSE_CONNECTIONS
+from helper.landmark_store import LandmarkLayout
+
+# serial: Pose, Hands and FaceMesh one after another
+# threads: the same three graphs in parallel threads (MediaPipe releases the GIL)
+# holistic: a single Holistic graph
+DETECTOR_MODES = ("serial", "threads", "holistic")
+
+
+def face_outline_connections():
+    """FaceMesh connections drawn for the face: lips, eyes, face oval and nose."""
+    import mediapipe as mp
+
+    face_mesh = mp.solutions.face_mesh
+    return (
+        list(face_mesh.FACEMESH_LIPS) +  # Mouth outline
+        list(face_mesh.FACEMESH_LEFT_EYE) +  # Left eye outline
+        list(face_mesh.FACEMESH_RIGHT_EYE) +  # Right eye outline
+        list(face_mesh.FACEMESH_FACE_OVAL) +  # Face outline
+        list(face_mesh.FACEMESH_NOSE)  # Nose outline
+    )
+
+
+class LandmarkDetector:
+    def __init__(self, mode=None):
+        """
+        MediaPipe pose, hand and face detection on BGR frames.
+
+        mediapipe is imported here rather than at module level, so players
+        that only replay stored landmarks or cached renders never load it.
+
+        The graphs track landmarks from frame to frame, so a detector must
+        only see the frames of one clip: use a new one per clip and close it
+        (or use it as a context manager) afterwards.
+
+        :param mode: One of DETECTOR_MODES (defaults to LANDMARK_DETECTOR_MODE or "serial")
+        """
+        import mediapipe as mp
+
+        self.mp_pose = mp.solutions.pose
+        self.mp_hands = mp.solutions.hands
+        self.mp_face_mesh = mp.solutions.face_mesh
+
+        self.mode = mode or os.getenv("LANDMARK_DETECTOR_MODE", "serial")
+        if self.mode not in DETECTOR_MODES:
+            raise ValueError(f"Unknown detector mode {self.mode!r}, expected one of {DETECTOR_MODES}")
+        self._pool = None
+        # Reused RGB buffer, so converting a frame does not allocate
+        self._rgb = None
+
+        if self.mode == "holistic":
+            self.holistic = mp.solutions.holistic.Holistic(
+                static_image_mode=False,
+                model_complexity=1,
+                smooth_landmarks=True,
+                refine_face_landmarks=True,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.3
+            )
+        else:
+            self._create_graphs()
+            if self.mode == "threads":
+                self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=3, thread_name_prefix="mediapipe")
+
+        # Define a filtered list of connections for face outlines
+        self.FACEMESH_OUTLINE_CONNECTIONS = face_outline_connections()
+        self.layout = LandmarkLayout.standard(self.FACEMESH_OUTLINE_CONNECTIONS)
+
+    def _create_graphs(self):
+        self.pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=1,
+            smooth_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.3
+        )
+        self.hands = self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.3
+        )
+        self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.3
+        )
+
+    def to_rgb(self, image):
+        """
+        Convert a BGR frame into the detector's reusable RGB buffer.
+
+        The returned array is overwritten by the next call; MediaPipe copies
+        its input, so it only has to stay valid for one detect().
+        """
+        if self._rgb is None or self._rgb.shape != image.shape:
+            self._rgb = np.empty_like(image)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb)
+
+    def detect(self, image_rgb):
+        """
+        Runs the configured graphs on an RGB frame.
+
+        Returns (pose_landmarks, hand_landmarks, face_landmarks) in the shapes of
+        results.pose_landmarks, results.multi_hand_landmarks and results.multi_face_landmarks.
+        """
+        if self.mode == "holistic":
+            results = self.holistic.process(image_rgb)
+            hands = [hand for hand in (results.left_hand_landmarks, results.right_hand_landmarks) if hand]
+            faces = [results.face_landmarks] if results.face_landmarks else None
+            return results.pose_landmarks, hands or None, faces
+
+        if self.mode == "threads":
+            pose = self._pool.submit(self.pose.process, image_rgb)
+            hands = self._pool.submit(self.hands.process, image_rgb)
+            face = self._pool.submit(self.face_mesh.process, image_rgb)
+            pose_results, hands_results, face_mesh_results = pose.result(), hands.result(), face.result()
+        else:
+            pose_results = self.pose.process(image_rgb)
+            hands_results = self.hands.process(image_rgb)
+            face_mesh_results = self.face_mesh.process(image_rgb)
+
+        return (
+            pose_results.pose_landmarks,
+            hands_results.multi_hand_landmarks,
+            face_mesh_results.multi_face_landmarks,
+        )
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        for graph in ("holistic", "pose", "hands", "face_mesh"):
+            if hasattr(self, graph):
+                getattr(self, graph).close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def draw_landmarks(self, canvas, pose_landmarks, hand_landmarks, face_mesh_landmarks):
+        pose_color = (0, 255, 0)  # Green
+        hand_color = (255, 0, 0)  # Blue
+        face_color = (0, 0, 255)  # Red
+
+        if pose_landmarks:
+            for connection in POSE_CONNECTIONS:
+                if connection[0] in CONNECTIONS_NOT_NEEDED or connection[1] in CONNECTIONS_NOT_NEEDED:
+                    continue
+
+                start_x, start_y = int(pose_landmarks.landmark[connection[0]].x * canvas.shape[1]), int(pose_landmarks.landmark[connection[0]].y * canvas.shape[0])
+                end_x, end_y = int(pose_landmarks.landmark[connection[1]].x * canvas.shape[1]), int(pose_landmarks.landmark[connection[1]].y * canvas.shape[0])
+                cv2.line(canvas, (start_x, start_y), (end_x, end_y), pose_color, 2)
+
+        if hand_landmarks:
+            h, w = canvas.shape[:2]
+            for hand_landmark in hand_landmarks:
+                for lm in hand_landmark.landmark:
+                    cx, cy = int(lm.x * w), int(lm.y * h)
+                    cv2.circle(canvas, (cx, cy), 2, hand_color, cv2.FILLED)
+
+                for connection in HAND_CONNECTIONS:
+                    start_x, start_y = int(hand_landmark.landmark[connection[0]].x * w), int(hand_landmark.landmark[connection[0]].y * h)
+                    end_x, end_y = int(hand_landmark.landmark[connection[1]].x * w), int(hand_landmark.landmark[connection[1]].y * h)
+                    cv2.line(canvas, (start_x, start_y), (end_x, end_y), hand_color, 1)
+
+        if face_mesh_landmarks:
+            for face_landmarks in face_mesh_landmarks:
+                for connection in self.FACEMESH_OUTLINE_CONNECTIONS:
+                    start_x, start_y = int(face_landmarks.landmark[connection[0]].x * canvas.shape[1]), int(face_landmarks.landmark[connection[0]].y * canvas.shape[0])
+                    end_x, end_y = int(face_landmarks.landmark[connection[1]].x * canvas.shape[1]), int(face_landmarks.landmark[connection[1]].y * canvas.shape[0])
+                    cv2.line(canvas, (start_x, start_y), (end_x, end_y), face_color, 1)
+
+        return canvas
+
+    def extract_landmarks(self, image):
+        """Runs detection and returns (points, mask) arrays in self.layout."""
+        return self.layout.pack_results(*self.detect(self.to_rgb(image)))
+
+    def detect_landmarks(self, image):
+        pose_landmarks, hand_landmarks, face_mesh_landmarks = self.detect(self.to_rgb(image))
+
+        # White canvas
+        canvas = np.full((image.shape[0], image.shape[1], 3), 255, dtype=np.uint8)
+
+        return self.draw_landmarks(canvas, pose_landmarks, hand_landmarks, face_mesh_landmarks)
@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+
+from helper.landmark_store import LandmarkLayout, POSE, HAND_0, FACE, MAX_HANDS, HAND_POINTS
+
+
+class LandmarkRenderer:
+    def __init__(self, layout=None, pose_connections_to_skip=(), pose_color=(255, 0, 0), hand_color=(0, 0, 255),
+                 face_color=(0, 0, 255), pose_thickness=2, hand_thickness=1, point_radius=2):
+        """
+        Draws stored landmark frames with one vectorized scale and batched OpenCV calls.
+
+        :param layout: LandmarkLayout of the frames (defaults to pose + two hands)
+        :param pose_connections_to_skip: Pose landmark indices whose connections are not drawn
+        :param pose_color: Color for pose connections (BGR format)
+        :param hand_color: Color for hand landmarks and connections (BGR format)
+        :param face_color: Color for face connections (BGR format)
+        :param point_radius: Radius of hand landmark dots (0 disables them)
+        """
+        self.layout = layout or LandmarkLayout.standard()
+        self.pose_color = pose_color
+        self.hand_color = hand_color
+        self.face_color = face_color
+        self.pose_thickness = pose_thickness
+        self.hand_thickness = hand_thickness
+        # A zero-length polyline segment is drawn with round caps, i.e. a filled dot
+        self.point_thickness = 2 * point_radius + 1 if point_radius else 0
+
+        skip = set(pose_connections_to_skip)
+        self.pose_edges = self._edges([c for c in self.layout.pose_connections
+                                       if c[0] not in skip and c[1] not in skip])
+
+        # Connection index arrays into the stored frame, one per hand slot
+        hand_edges = self._edges(self.layout.hand_connections)
+        self.hand_edges = [hand_edges + offset for offset in self.layout.hand_offsets]
+        self.hand_points = [
+            np.repeat(np.arange(offset, offset + HAND_POINTS, dtype=np.intp)[:, None], 2, axis=1)
+            for offset in self.layout.hand_offsets
+        ]
+
+        face_offset, face_slot = self.layout.face_offset, self.layout.face_slot
+        self.face_edges = self._edges([(face_offset + face_slot[a], face_offset + face_slot[b])
+                                       for a, b in self.layout.face_connections])
+
+    @staticmethod
+    def _edges(connections):
+        return np.asarray(list(connections), dtype=np.intp).reshape(-1, 2)
+
+    def render_frame(self, canvas, points, mask):
+        """
+        Render one frame on the given canvas
+
+        :param canvas: OpenCV image to draw on
+        :param points: Array of shape (num_points, 3) with normalized coordinates
+        :param mask: Presence mask of the frame (POSE, HAND_0, HAND_1, FACE)
+        :return: Canvas with landmarks drawn
+        """
+        h, w = canvas.shape[:2]
+        pixels = (np.asarray(points)[:, :2] * (w, h)).astype(np.int32)
+
+        if mask[POSE] and len(self.pose_edges):
+            cv2.polylines(canvas, pixels[self.pose_edges], False, self.pose_color, self.pose_thickness)
+
+        for slot in range(MAX_HANDS):
+            if not mask[HAND_0 + slot]:
+                continue
+            if self.point_thickness:
+                cv2.polylines(canvas, pixels[self.hand_points[slot]], False, self.hand_color, self.point_thickness)
+            cv2.polylines(canvas, pixels[self.hand_edges[slot]], False, self.hand_color, self.hand_thickness)
+
+        if mask[FACE] and len(self.face_edges):
+            cv2.polylines(canvas, pixels[self.face_edges], False, self.face_color, 1)
+
+        return canvas
+
+    def render_clip(self, clip, size=(500, 500), background=255):
+        """Yield a freshly drawn canvas for every frame of a LandmarkClip."""
+        for points, mask in zip(clip.points, clip.mask):
+            canvas = np.full((size[1], size[0], 3), background, dtype=np.uint8)
+            yield self.render_frame(canvas, points, mask)
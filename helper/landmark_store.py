@@ -0,0 +1,322 @@
+import functools
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from helper.connections import POSE_CONNECTIONS, HAND_CONNECTIONS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STORE_ROOT = os.path.join(ROOT, "landmark_store")
+# Store replayed by railway_landmark_detector, written by build_landmark_store.py / coordinate_extractor.py
+DEFAULT_STORE_PATH = os.path.join(STORE_ROOT, "railway")
+
+# Fixed point layout of every stored frame:
+#   [0, 33)            pose
+#   [33, 54), [54, 75) up to two hands
+#   [75, 75 + F)       optional face outline points (F = len(face_indices))
+POSE_POINTS = 33
+HAND_POINTS = 21
+MAX_HANDS = 2
+
+# Presence mask columns
+POSE, HAND_0, HAND_1, FACE = range(4)
+MASK_GROUPS = 4
+
+
+class LandmarkLayout:
+    def __init__(self, pose_connections, hand_connections, face_indices=(), face_connections=()):
+        """
+        Describes how landmarks are laid out in a stored frame.
+
+        :param pose_connections: Pairs of pose landmark indices to draw
+        :param hand_connections: Pairs of hand landmark indices to draw
+        :param face_indices: FaceMesh landmark indices kept in the store (empty for no face)
+        :param face_connections: Pairs of FaceMesh indices to draw, each present in face_indices
+        """
+        self.pose_connections = [tuple(c) for c in pose_connections]
+        self.hand_connections = [tuple(c) for c in hand_connections]
+        self.face_indices = [int(i) for i in face_indices]
+        self.face_connections = [tuple(c) for c in face_connections]
+
+        self.hand_offsets = [POSE_POINTS + i * HAND_POINTS for i in range(MAX_HANDS)]
+        self.face_offset = POSE_POINTS + MAX_HANDS * HAND_POINTS
+        self.num_points = self.face_offset + len(self.face_indices)
+
+        # FaceMesh index -> position in the stored face block
+        self.face_slot = {index: slot for slot, index in enumerate(self.face_indices)}
+
+    @classmethod
+    def standard(cls, face_connections=()):
+        """
+        Pose + two hands, plus the FaceMesh points used by face_connections if given.
+
+        :param face_connections: FaceMesh connections to keep; empty stores no face
+        """
+        face_connections = list(face_connections)
+        face_indices = sorted({i for connection in face_connections for i in connection})
+        return cls(
+            pose_connections=POSE_CONNECTIONS,
+            hand_connections=HAND_CONNECTIONS,
+            face_indices=face_indices,
+            face_connections=face_connections,
+        )
+
+    def to_dict(self):
+        return {
+            "pose_connections": self.pose_connections,
+            "hand_connections": self.hand_connections,
+            "face_indices": self.face_indices,
+            "face_connections": self.face_connections,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def empty_frame(self):
+        """Return zeroed (points, mask) arrays for one frame."""
+        return (
+            np.zeros((self.num_points, 3), dtype=np.float32),
+            np.zeros(MASK_GROUPS, dtype=bool),
+        )
+
+    def pack_results(self, pose_landmarks=None, hand_landmarks=None, face_landmarks=None):
+        """
+        Convert MediaPipe results for one frame into (points, mask) arrays.
+
+        :param pose_landmarks: results.pose_landmarks (or None)
+        :param hand_landmarks: results.multi_hand_landmarks (or None)
+        :param face_landmarks: results.multi_face_landmarks (or None)
+        """
+        points, mask = self.empty_frame()
+
+        if pose_landmarks:
+            points[:POSE_POINTS] = [(lm.x, lm.y, lm.z) for lm in pose_landmarks.landmark]
+            mask[POSE] = True
+
+        if hand_landmarks:
+            for slot, hand in enumerate(hand_landmarks[:MAX_HANDS]):
+                start = self.hand_offsets[slot]
+                points[start:start + HAND_POINTS] = [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                mask[HAND_0 + slot] = True
+
+        if face_landmarks and self.face_indices:
+            landmarks = face_landmarks[0].landmark
+            points[self.face_offset:] = [(landmarks[i].x, landmarks[i].y, landmarks[i].z) for i in self.face_indices]
+            mask[FACE] = True
+
+        return points, mask
+
+    def pack_dicts(self, pose=None, hands=None):
+        """
+        Convert the {"x", "y", "z"} dictionaries used by coordinates.csv into (points, mask) arrays.
+        """
+        points, mask = self.empty_frame()
+
+        if pose:
+            points[:POSE_POINTS] = [(lm["x"], lm["y"], lm.get("z", 0)) for lm in pose]
+            mask[POSE] = True
+
+        for slot, hand in enumerate((hands or [])[:MAX_HANDS]):
+            start = self.hand_offsets[slot]
+            points[start:start + HAND_POINTS] = [(lm["x"], lm["y"], lm.get("z", 0)) for lm in hand]
+            mask[HAND_0 + slot] = True
+
+        return points, mask
+
+
+class LandmarkClip:
+    def __init__(self, word, points, mask, fps):
+        """
+        Landmarks of one dictionary video.
+
+        :param points: float32 array of shape (frames, num_points, 3)
+        :param mask: bool array of shape (frames, MASK_GROUPS)
+        :param fps: Frame rate of the source video
+        """
+        self.word = word
+        self.points = points
+        self.mask = mask
+        self.fps = fps
+
+    def __len__(self):
+        return len(self.points)
+
+
+class LandmarkStore:
+    """
+    Read-only, memory-mapped landmark store.
+
+    A store is a directory with:
+      index.json  layout, frame count and word -> (offset, length, fps); synonyms share an offset
+      points.bin  float32 (frames, num_points, 3)
+      mask.bin    bool    (frames, MASK_GROUPS)
+    """
+
+    def __init__(self, path, cache_size=0):
+        """
+        :param path: Store directory
+        :param cache_size: Number of recently used clips kept resident in memory (0 disables)
+        """
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        with open(os.path.join(path, "index.json")) as f:
+            index = json.load(f)
+
+        self.layout = LandmarkLayout.from_dict(index["layout"])
+        self.words = index["words"]
+        self.num_frames = index["frames"]
+
+        if self.num_frames:
+            self.points = np.memmap(os.path.join(path, "points.bin"), dtype=np.float32, mode="r",
+                                    shape=(self.num_frames, self.layout.num_points, 3))
+            self.mask = np.memmap(os.path.join(path, "mask.bin"), dtype=bool, mode="r",
+                                  shape=(self.num_frames, MASK_GROUPS))
+        else:
+            # np.memmap cannot map an empty file
+            self.points = np.zeros((0, self.layout.num_points, 3), dtype=np.float32)
+            self.mask = np.zeros((0, MASK_GROUPS), dtype=bool)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def get(self, word):
+        """
+        Return the LandmarkClip for a word, or None.
+
+        Uncached words are returned as views into the memory map. With a cache,
+        recently used clips are copied into memory once, so repeating them does
+        not read the files again. The cache is keyed by the frames, so synonyms
+        stored as aliases of one clip share a single copy.
+        """
+        entry = self.words.get(word)
+        if entry is None:
+            return None
+
+        start, length = entry["offset"], entry["length"]
+        with self._cache_lock:
+            cached = self._cache.get((start, length))
+            if cached is not None:
+                self._cache.move_to_end((start, length))
+                self.hits += 1
+                return LandmarkClip(word, cached[0], cached[1], entry["fps"])
+        self.misses += 1
+
+        points, mask = self.points[start:start + length], self.mask[start:start + length]
+        if not self.cache_size:
+            return LandmarkClip(word, points, mask, entry["fps"])
+
+        points, mask = np.array(points), np.array(mask)
+        with self._cache_lock:
+            self._cache[(start, length)] = (points, mask)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return LandmarkClip(word, points, mask, entry["fps"])
+
+
+@functools.lru_cache(maxsize=None)
+def _open_store(path, cache_size):
+    return LandmarkStore(path, cache_size)
+
+
+def open_store(path, cache_size=256):
+    """
+    Return the process-wide LandmarkStore for a directory.
+
+    The index is parsed and the files are mapped once per process; later
+    calls with the same path return the same store (and its word cache).
+    """
+    return _open_store(os.path.abspath(path), cache_size)
+
+
+class LandmarkStoreWriter:
+    def __init__(self, path, layout):
+        """
+        Append-only writer for a LandmarkStore.
+
+        Reopening an existing store keeps its words so an interrupted build can resume.
+
+        :param path: Store directory
+        :param layout: LandmarkLayout used for every frame
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        index_path = os.path.join(path, "index.json")
+
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+            if index["layout"] != json.loads(json.dumps(layout.to_dict())):
+                raise ValueError(f"Store at {path} was built with a different layout")
+            self.words = index["words"]
+            self.num_frames = index["frames"]
+        else:
+            self.words = {}
+            self.num_frames = 0
+
+        self.layout = layout
+        self._points = open(os.path.join(path, "points.bin"), "ab")
+        self._mask = open(os.path.join(path, "mask.bin"), "ab")
+
+        # Drop bytes written after the last saved index (interrupted run)
+        self._points.truncate(self.num_frames * layout.num_points * 3 * 4)
+        self._mask.truncate(self.num_frames * MASK_GROUPS)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def add(self, word, points, mask, fps):
+        """
+        Append the frames of one word.
+
+        :param points: Array-like of shape (frames, num_points, 3)
+        :param mask: Array-like of shape (frames, MASK_GROUPS)
+        """
+        points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, self.layout.num_points, 3)
+        mask = np.ascontiguousarray(mask, dtype=bool).reshape(-1, MASK_GROUPS)
+        if len(points) != len(mask):
+            raise ValueError("points and mask must have the same number of frames")
+
+        self._points.write(points.tobytes())
+        self._mask.write(mask.tobytes())
+        self.words[word] = {"offset": self.num_frames, "length": len(points), "fps": float(fps)}
+        self.num_frames += len(points)
+
+    def add_alias(self, word, target):
+        """Store word as a synonym of target: both index the same frames, nothing is written twice."""
+        self.words[word] = dict(self.words[target])
+
+    def flush(self):
+        """Write data and index to disk so the store is readable (and resumable) as it stands."""
+        self._points.flush()
+        self._mask.flush()
+        os.fsync(self._points.fileno())
+        os.fsync(self._mask.fileno())
+
+        index = {"layout": self.layout.to_dict(), "frames": self.num_frames, "words": self.words}
+        tmp_path = os.path.join(self.path, "index.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(self.path, "index.json"))
+
+    def close(self):
+        self.flush()
+        self._points.close()
+        self._mask.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,83 @@
+import functools
+
+from helper.dictionaries import load_dictionary
+
+# Marks the end of a key in the trie; None never collides with a word
+_END = None
+
+
+class PhraseMatcher:
+    def __init__(self, keys):
+        """
+        Word-level trie over dictionary keys for greedy longest-match tokenization.
+
+        Keys are split on whitespace, so "andhra pradesh" is matched as the
+        two words "andhra", "pradesh". At each position the trie is walked
+        as far as the text allows and the longest key ending on the way
+        wins, so a sentence is tokenized in one pass whose cost depends on
+        the number of words and the longest key, not on the dictionary size.
+
+        :param keys: Iterable of dictionary keys
+        """
+        self._root = {}
+        self.max_words = 0
+        self.size = 0
+        for key in keys:
+            words = key.split()
+            if not words:
+                continue
+            node = self._root
+            for word in words:
+                node = node.setdefault(word, {})
+            if _END not in node:
+                self.size += 1
+            node[_END] = key
+            self.max_words = max(self.max_words, len(words))
+
+    def match_at(self, words, start):
+        """Return (key, number of words) of the longest key starting at words[start], or (None, 0)."""
+        node = self._root
+        best, best_length = None, 0
+        for i in range(start, len(words)):
+            node = node.get(words[i])
+            if node is None:
+                break
+            if _END in node:
+                best, best_length = node[_END], i - start + 1
+        return best, best_length
+
+    def segment(self, words):
+        """
+        Split words into dictionary keys and leftover words, longest match first.
+
+        :return: List of (token, is_key); a multi-word key is one token
+        """
+        tokens = []
+        i = 0
+        while i < len(words):
+            key, length = self.match_at(words, i)
+            if key is None:
+                tokens.append((words[i], False))
+                i += 1
+            else:
+                tokens.append((key, True))
+                i += length
+        return tokens
+
+    def find(self, words, min_words=1):
+        """Keys of at least min_words words found in words by segment(), in order."""
+        return [token for token, is_key in self.segment(words) if is_key and len(token.split()) >= min_words]
+
+    def __contains__(self, key):
+        node = self._root
+        for word in key.split():
+            node = node.get(word)
+            if node is None:
+                return False
+        return _END in node
+
+
+@functools.lru_cache(maxsize=None)
+def get_phrase_matcher(name):
+    """Shared PhraseMatcher over a named dictionary ("general", "railway" or "medical")."""
+    return PhraseMatcher(load_dictionary(name).keys())
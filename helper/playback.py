@@ -0,0 +1,380 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Marks the end of a track's frames
+_END = object()
+
+
+class WordTrack:
+    def __init__(self, word, max_buffered=64):
+        """
+        Frames of one word, handed from a render worker to the presenter.
+
+        The worker pushes (source frame index, frame) pairs as they are
+        rendered and blocks once max_buffered frames are waiting, so a word
+        rendered far ahead of playback holds a bounded number of frames.
+
+        :param word: Word shown with the frames
+        :param max_buffered: Frames rendered ahead of presentation
+        """
+        self.word = word
+        self.fps = None
+        # Set by the scheduler when the first frame is shown in real time
+        self.start_time = None
+        # Frames the worker did not render because their slot had passed
+        self.skipped = 0
+        # Every frame encoded once the track finished, if it was submitted with an encode step;
+        # frames skipped to keep up are filled with a neighbouring frame, so indexes line up
+        self.frames = None
+        self.error = None
+        self.finished = threading.Event()
+        self._queue = queue.Queue(maxsize=max_buffered)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def slot(self):
+        """Index of the source frame due on screen now (0 before the track starts playing)."""
+        if self.start_time is None:
+            return 0
+        return int((time.monotonic() - self.start_time) * self.fps)
+
+    def push(self, index, frame):
+        """Hand a frame to the presenter; returns False once the track was cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put((index, frame), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def finish(self):
+        self.push(None, _END)
+        self.finished.set()
+
+    def next_frame(self, timeout=None):
+        """
+        Wait up to timeout seconds for the next (index, frame) pair.
+
+        :return: The pair, None if no frame was rendered in time, or _END after the last one
+        """
+        try:
+            index, frame = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return _END if frame is _END else (index, frame)
+
+    def ready(self):
+        """Whether a frame is waiting to be presented."""
+        return not self._queue.empty()
+
+    def cancel(self):
+        """Stop rendering and drop the frames not presented yet."""
+        self._cancelled.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+class PresentationScheduler:
+    def __init__(self, show, realtime=True):
+        """
+        Shows the frames of word tracks in real time at their source frame rate.
+
+        Frame i of a word is due at the word's start plus i / fps on the
+        monotonic clock, and a word starts when the previous one ends, so
+        playback speed does not depend on how fast frames are rendered.
+        When the frame due next is not rendered in time, the previous frame
+        stays on screen (a duplicate); when a frame's slot has passed and a
+        newer one is waiting, it is dropped. Only the start of a word waits
+        for its first frame, which is counted as a stall.
+
+        Lateness (shown time minus due time) is recorded for every frame.
+        Without realtime every frame is shown in order as soon as it is
+        rendered, with its duration as hold, for sinks writing files.
+
+        :param show: Callable(frame, word, hold, fps) that shows a frame and keeps it up for
+                     hold seconds, e.g. FrameSink.show; fps is the measured presentation rate.
+                     Returns False to skip the rest of the word
+        :param realtime: Pace frames on the clock (False for offline rendering)
+        """
+        self.show = show
+        self.realtime = realtime
+        self.reset()
+
+    def reset(self):
+        """Start a new clock and new statistics, e.g. for the next sentence."""
+        self._next_start = None
+        self._shown_at = deque()
+        self.words = 0
+        self.presented = 0
+        self.dropped = 0
+        self.duplicated = 0
+        self.skipped = 0
+        self.stalls = 0
+        self.stall_time = 0.0
+        self.lateness = []
+
+    def presentation_fps(self, now):
+        """New frames shown in the last second."""
+        while self._shown_at and now - self._shown_at[0] > 1.0:
+            self._shown_at.popleft()
+        return len(self._shown_at)
+
+    def _show(self, frame, word, hold):
+        return self.show(frame, word, hold, self.presentation_fps(time.monotonic()))
+
+    def present(self, track):
+        """Show every frame of a track; blocks until the track ends or is skipped."""
+        if not self.realtime:
+            self._present_all(track)
+            return
+
+        first = track.next_frame()
+        if first is _END:
+            self._report_error(track)
+            return
+
+        self.words += 1
+        interval = 1.0 / track.fps
+        now = time.monotonic()
+        if self._next_start is not None and now - self._next_start >= interval:
+            # The first frame missed its slot after the previous word ended
+            self.stalls += 1
+            self.stall_time += now - self._next_start
+        start = now if self._next_start is None else max(now, self._next_start)
+        track.start_time = start
+
+        pending, last, last_index = first, None, -1
+        while True:
+            now = time.monotonic()
+            if pending is None:
+                # Wait until the slot of the next frame (or the current one, if later) is over
+                slot_end = start + (max(last_index + 1, int((now - start) / interval)) + 1) * interval
+                pending = track.next_frame(timeout=max(0.0, slot_end - now))
+                if pending is _END:
+                    break
+                if pending is None:
+                    # Not rendered in time: keep the previous frame up for another slot
+                    if last is not None:
+                        self.duplicated += 1
+                        if not self._show(last, track.word, 0):
+                            track.cancel()
+                            break
+                    continue
+
+            index, frame = pending
+            pending = None
+            now = time.monotonic()
+            due = start + index * interval
+            if now - due >= interval and track.ready():
+                # Its slot has passed and a newer frame is waiting
+                self.dropped += 1
+                continue
+            if due > now:
+                # Ahead of the clock: hold the previous frame until this one is due
+                if last is not None and not self._show(last, track.word, due - now):
+                    track.cancel()
+                    break
+                if last is None:
+                    time.sleep(due - now)
+                now = time.monotonic()
+
+            self.lateness.append(max(0.0, now - due))
+            self._shown_at.append(now)
+            if not self._show(frame, track.word, due + interval - time.monotonic()):
+                track.cancel()
+                break
+            self.presented += 1
+            last, last_index = frame, index
+
+        self._next_start = max(time.monotonic(), start + (last_index + 1) * interval)
+        self.skipped += track.skipped
+        self._report_error(track)
+
+    def _present_all(self, track):
+        counted = False
+        while True:
+            pending = track.next_frame()
+            if pending is _END:
+                break
+            if not counted:
+                self.words += 1
+                counted = True
+            if not self.show(pending[1], track.word, 1.0 / track.fps, track.fps):
+                track.cancel()
+                break
+            self.presented += 1
+        self._report_error(track)
+
+    @staticmethod
+    def _report_error(track):
+        if track.error is not None:
+            print(f"Error rendering word {track.word}: {track.error}")
+
+    def stats(self):
+        """Counts of this run plus lateness percentiles in milliseconds."""
+        lateness = sorted(self.lateness)
+
+        def percentile(fraction):
+            return lateness[min(len(lateness) - 1, int(fraction * len(lateness)))] * 1000 if lateness else 0.0
+
+        return {
+            "words": self.words,
+            "presented": self.presented,
+            "dropped": self.dropped,
+            "duplicated": self.duplicated,
+            "skipped": self.skipped,
+            "stalls": self.stalls,
+            "stall_time": self.stall_time,
+            "lateness_p50_ms": percentile(0.50),
+            "lateness_p95_ms": percentile(0.95),
+            "lateness_max_ms": percentile(1.0),
+        }
+
+
+class PlaybackEngine:
+    def __init__(self, workers=None, max_buffered=64, default_fps=30.0):
+        """
+        Renders upcoming words in parallel and presents their frames on one clock.
+
+        Rendering (decoding, landmark detection, drawing) runs on a long-lived
+        pool of worker threads, so the next words are prepared while the
+        current one plays. A PresentationScheduler shows the frames at the
+        source frame rate and keeps its clock running across word
+        boundaries. When a word renders slower than real time, its worker
+        skips rendering the frames whose slot has already passed instead of
+        letting playback fall behind.
+
+        Frames go to the FrameSink given to play() or run(), so one engine
+        serves a window, files or a stream.
+
+        :param workers: Render threads (defaults to PLAYBACK_WORKERS or 2)
+        :param max_buffered: Frames a word may be rendered ahead of presentation
+        :param default_fps: Frame rate of sources that do not report one
+        """
+        self.max_buffered = max_buffered
+        self.default_fps = default_fps
+        workers = workers or int(os.getenv("PLAYBACK_WORKERS", "2"))
+        self._workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="playback-render")
+        # cv2 windows must be driven from one thread, so every sink is
+        self._presenter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playback-present")
+
+    def submit(self, word, source, on_complete=None, encode=None):
+        """
+        Start rendering a word on the worker pool.
+
+        :param source: Callable run on a worker that returns (items, fps, render). items is an
+                       iterable of source frames and render turns one into a frame to show; render
+                       None means the items are shown as they are
+        :param on_complete: Optional callable(frames, fps) run on the worker with the encoded frames
+                            once every frame was rendered (e.g. FrameCache.put_encoded); not called
+                            if the word was skipped or frames were left out to keep up
+        :param encode: Optional callable(frame) run on each frame as it is rendered (e.g.
+                       encode_frame); the encoded frames are kept on the track for on_complete and
+                       submit_repeat, so no raw frames are held once they were shown
+        :return: WordTrack to queue for play()
+        """
+        track = WordTrack(word, self.max_buffered)
+        self._workers.submit(self._render, track, source, on_complete, encode)
+        return track
+
+    def submit_repeat(self, word, track, decode):
+        """
+        Play the frames of an earlier track again, e.g. for a synonym sharing its clip.
+
+        :param track: Track submitted with an encode step
+        :param decode: Inverse of that encode step (e.g. decode_frame)
+        """
+        def source():
+            track.finished.wait()
+            return track.frames or [], track.fps, decode
+        return self.submit(word, source)
+
+    def _render(self, track, source, on_complete, encode):
+        encoded = [] if encode is not None else None
+        # Skipped frames before the first rendered one, filled in with it
+        missing = 0
+        complete = True
+        items = None
+        try:
+            items, fps, render = source()
+            track.fps = fps or self.default_fps
+            for index, item in enumerate(items):
+                if render is None:
+                    frame = item
+                elif index < track.slot():
+                    # Already late for this frame's slot: skip the costly part
+                    track.skipped += 1
+                    complete = False
+                    if encoded:
+                        # Repeats of the word show the previous frame in its place
+                        encoded.append(encoded[-1])
+                    elif encoded is not None:
+                        missing += 1
+                    continue
+                else:
+                    frame = render(item)
+                if not track.push(index, frame):
+                    break
+                if encoded is not None:
+                    encoded.extend([encode(frame)] * (missing + 1))
+                    missing = 0
+            if not track.cancelled:
+                track.frames = encoded
+                if on_complete is not None and encoded and complete:
+                    on_complete(encoded, track.fps)
+        except Exception as e:
+            track.error = e
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+            track.finish()
+
+    def run(self, tracks, sink):
+        """
+        Present an iterable of tracks in order on the calling thread.
+
+        :param sink: FrameSink receiving the frames; finished afterwards
+        :return: Scheduler stats of this run
+        """
+        scheduler = PresentationScheduler(sink.show, sink.realtime)
+        try:
+            for track in tracks:
+                scheduler.present(track)
+        finally:
+            sink.finish()
+        return scheduler.stats()
+
+    async def play(self, tracks, sink):
+        """
+        Present the tracks of an asyncio.Queue in order until a None item.
+
+        :param sink: FrameSink receiving the frames; finished afterwards
+        :return: Scheduler stats of this run
+        """
+        loop = asyncio.get_running_loop()
+        scheduler = PresentationScheduler(sink.show, sink.realtime)
+        try:
+            while True:
+                track = await tracks.get()
+                if track is None:
+                    break
+                await loop.run_in_executor(self._presenter, scheduler.present, track)
+        finally:
+            await loop.run_in_executor(self._presenter, sink.finish)
+        return scheduler.stats()
+
+    def close(self):
+        self._workers.shutdown(wait=True)
+        self._presenter.shutdown(wait=True)
@@ -0,0 +1,311 @@
+import asyncio
+import functools
+import os
+
+import cv2
+import numpy as np
+
+from helper.connections import CONNECTIONS_NOT_NEEDED
+from helper.dictionaries import video_key
+from helper.frame_cache import FrameCache, decode_frame, encode_frame
+from helper.frame_sinks import WindowSink
+from helper.landmark_detector import LandmarkDetector
+from helper.landmark_renderer import LandmarkRenderer
+from helper.landmark_store import LandmarkStore
+from helper.playback import PlaybackEngine
+from helper.video_decoder import open_video_stream
+from helper.video_fetcher import create_video_fetcher
+
+# Rendered words are cached across sentences; evicted words spill to disk
+FRAME_CACHE_MB = int(os.getenv("FRAME_CACHE_MB", "512"))
+FRAME_CACHE_DISK_MB = int(os.getenv("FRAME_CACHE_DISK_MB", "2048"))
+CANVAS_SIZE = (500, 500)
+# Bump when drawing changes so stale renders are not reused.
+# Renders are cached by clip without the word label, so synonyms share them.
+RENDER_STYLE = "landmarks-v2"
+DEFAULT_FPS = 30.0
+
+# Dictionary clips are downloaded once into a local cache; VIDEO_SOURCE_DIR serves them from disk instead
+VIDEO_CACHE_MB = int(os.getenv("VIDEO_CACHE_MB", "4096"))
+VIDEO_SOURCE_DIR = os.getenv("VIDEO_SOURCE_DIR")
+PREFETCH_WORDS = int(os.getenv("PREFETCH_WORDS", "3"))
+
+# Words queued for playback ahead of the one playing; their rendering runs on PLAYBACK_WORKERS threads
+PLAYBACK_LOOKAHEAD = int(os.getenv("PLAYBACK_LOOKAHEAD", "3"))
+
+_playback_engine = None
+
+
+def get_playback_engine():
+    global _playback_engine
+    if _playback_engine is None:
+        _playback_engine = PlaybackEngine(default_fps=DEFAULT_FPS)
+    return _playback_engine
+
+
+def make_stored_renderer(layout):
+    """Renderer that draws stored frames the same way LandmarkDetector.draw_landmarks does."""
+    return LandmarkRenderer(
+        layout,
+        pose_connections_to_skip=CONNECTIONS_NOT_NEEDED,
+        pose_color=(0, 255, 0),  # Green
+        hand_color=(255, 0, 0),  # Blue
+        face_color=(0, 0, 255),  # Red
+    )
+
+
+def draw_word_label(canvas, word):
+    cv2.putText(
+        canvas,
+        f"Word: {word}",
+        (10, 60),  # Position below the FPS
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1,
+        (255, 0, 0),  # Blue text
+        1,
+        cv2.LINE_AA,
+    )
+    return canvas
+
+
+def annotate_frame(canvas, word, fps):
+    """
+    Draws the word label and the FPS overlay on a frame about to be shown.
+
+    fps is the rate frames are actually presented at, not how fast they were rendered.
+    """
+    draw_word_label(canvas, word)
+    cv2.putText(
+        canvas,
+        f"FPS: {int(fps)}",
+        (10, 470),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1,
+        (0, 255, 0),
+        1,
+        cv2.LINE_AA,
+    )
+    return canvas
+
+
+class DetectedVideo:
+    def __init__(self, frames):
+        """
+        Decoded frames of one clip and the LandmarkDetector that renders them.
+
+        MediaPipe graphs track landmarks from frame to frame, so every clip
+        gets its own detector. The playback engine closes the items of a
+        word once it is rendered, which releases the decoder and the graphs.
+
+        :param frames: Started VideoStream of the clip
+        """
+        self.frames = frames
+        self.fps = frames.fps
+        try:
+            self.detector = LandmarkDetector()
+        except Exception:
+            frames.close()
+            raise
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def render(self, frame):
+        return self.detector.detect_landmarks(frame)
+
+    def close(self):
+        self.frames.close()
+        self.detector.close()
+
+
+def process_video(frames, word):
+    """
+    Renders a decoded video by performing landmark detection on each frame.
+
+    Runs on a playback worker and returns (frames, fps, render) for the
+    engine, which detects landmarks on the frames it needs to stay in time.
+    Graphs are only built once a word is missing from the store and the
+    frame cache.
+    """
+    if not frames.wait_started():
+        frames.close()
+        return [], None, None
+    print(f"Processing video for word: {word}")
+    video = DetectedVideo(frames)
+    return video, video.fps, video.render
+
+
+def process_landmarks(clip, layout, word, size=CANVAS_SIZE):
+    """Renders precomputed landmarks for a word; returns (frames, fps, render) like process_video."""
+    print(f"Streaming stored landmarks for word: {word}")
+    renderer = make_stored_renderer(layout)
+
+    def render(frame):
+        canvas = np.full((size[1], size[0], 3), 255, dtype=np.uint8)
+        return renderer.render_frame(canvas, *frame)
+
+    return zip(clip.points, clip.mask), clip.fps, render
+
+
+def play_rendered(rendered, word):
+    """Plays a cached RenderedWord: frames are only decoded, without any detection or landmark drawing."""
+    print(f"Playing cached render for word: {word}")
+    return rendered.frames, rendered.fps, decode_frame
+
+
+def print_playback_stats(stats):
+    print(f"Playback: {stats['presented']} frames presented, {stats['dropped']} dropped, "
+          f"{stats['duplicated']} repeated, {stats['skipped']} not rendered to keep up, "
+          f"{stats['stalls']} stalls ({stats['stall_time'] * 1000:.0f} ms); lateness p50 "
+          f"{stats['lateness_p50_ms']:.1f} ms, p95 {stats['lateness_p95_ms']:.1f} ms, max {stats['lateness_max_ms']:.1f} ms")
+
+
+def clip_key(word_to_video_map, word):
+    """Frame cache key of a word: its clip, so synonyms share one render."""
+    return video_key(word_to_video_map, word) if word in word_to_video_map else word
+
+
+async def buffer_videos(queue, engine, words, word_to_video_map, store=None, cache=None, fetcher=None):
+    """
+    Submits the words of a sentence to the playback engine and queues their tracks in order.
+
+    queue.put waits while the queue is full, so at most its size plus one
+    words are rendered ahead of the one playing. A word whose clip is
+    already being rendered for an earlier word of the sentence replays that
+    word's frames instead of being decoded again. Frames are PNG-encoded as
+    they are rendered, so a word holds no raw canvases once they were shown
+    and the frame cache stores the same encoded frames.
+    """
+    loop = asyncio.get_event_loop()
+    layout = store.layout if store is not None else None
+    rendering = {}  # Clip key -> track rendering it in this sentence
+
+    def needs_video(word):
+        if store is not None and word in store:
+            return False
+        key = clip_key(word_to_video_map, word)
+        if key in rendering:
+            return False
+        return cache is None or not cache.contains(key, CANVAS_SIZE, RENDER_STYLE)
+
+    def cache_put(key):
+        if cache is None:
+            return None
+        return functools.partial(cache.put_encoded, key, CANVAS_SIZE, RENDER_STYLE)
+
+    for index, word in enumerate(words):
+        # Download the clips of the next few words concurrently
+        if fetcher is not None:
+            upcoming = words[index:index + PREFETCH_WORDS]
+            fetcher.prefetch(word_to_video_map.get(word) for word in upcoming if needs_video(word))
+
+        key = clip_key(word_to_video_map, word)
+        video_path = word_to_video_map.get(word)
+        rendered = cache.get(key, CANVAS_SIZE, RENDER_STYLE) if cache is not None else None
+        if rendered is not None:
+            # Already rendered in an earlier sentence, or for a synonym
+            track = engine.submit(word, functools.partial(play_rendered, rendered, word))
+        elif key in rendering:
+            # Same clip as an earlier word of this sentence
+            track = engine.submit_repeat(word, rendering[key], decode_frame)
+        elif store is not None and word in store:
+            # Precomputed landmarks: no download or detection needed
+            clip = store.get(word)
+            track = engine.submit(word, functools.partial(process_landmarks, clip, layout, word),
+                                  cache_put(key), encode_frame)
+            rendering[key] = track
+        elif video_path:
+            print(f"Buffering video for: {word}")
+            if fetcher is not None:
+                try:
+                    video_path = await loop.run_in_executor(None, fetcher.get, video_path)
+                except Exception as e:
+                    print(f"Error fetching video for {word}: {e}")
+                    continue
+            # Frames are decoded and detected in the background while earlier words play
+            frames = open_video_stream(video_path, CANVAS_SIZE)
+            track = engine.submit(word, functools.partial(process_video, frames, word), cache_put(key),
+                                  encode_frame)
+            rendering[key] = track
+        else:
+            print(f"No video found for word: {word}")
+            continue
+
+        await queue.put(track)
+
+    # Signal that buffering is complete
+    await queue.put(None)
+
+
+class SignPlayer:
+    def __init__(self, store_path, frame_cache_dir, video_cache_dir, window_name="Landmark Canvas"):
+        """
+        Plays sentences of dictionary words as landmark animations.
+
+        Words come from the landmark store when they are in it, from the
+        frame cache when they were rendered before, and otherwise from the
+        dictionary clip with landmark detection while earlier words play.
+        The frame cache and video fetcher are created on first use.
+
+        :param store_path: Landmark store of the dictionary (used if it has been built)
+        :param frame_cache_dir: Spill directory of the frame cache
+        :param video_cache_dir: Download cache of the dictionary clips
+        :param window_name: Window of the default sink
+        """
+        self.store_path = store_path
+        self.frame_cache_dir = frame_cache_dir
+        self.video_cache_dir = video_cache_dir
+        self.window_name = window_name
+        self._frame_cache = None
+        self._video_fetcher = None
+
+    def get_frame_cache(self):
+        if self._frame_cache is None:
+            self._frame_cache = FrameCache(FRAME_CACHE_MB * 1024 * 1024, self.frame_cache_dir,
+                                           FRAME_CACHE_DISK_MB * 1024 * 1024)
+        return self._frame_cache
+
+    def get_video_fetcher(self):
+        if self._video_fetcher is None:
+            self._video_fetcher = create_video_fetcher(self.video_cache_dir, VIDEO_SOURCE_DIR, VIDEO_CACHE_MB,
+                                                       PREFETCH_WORDS)
+        return self._video_fetcher
+
+    async def process_sentence(self, words, word_to_video_map, store_path=None, cache=None, fetcher=None,
+                               sink=None):
+        """
+        Processes a sentence and handles buffering and streaming concurrently.
+
+        :param store_path: Landmark store to use instead of the player's
+        :param sink: FrameSink for the rendered frames (defaults to a window);
+                     a VideoFileSink or MemorySink renders without a display
+        :return: Playback stats of the sentence
+        """
+        if sink is None:
+            sink = WindowSink(self.window_name, annotate_frame)
+        store_path = store_path or self.store_path
+        store = LandmarkStore(store_path) if os.path.exists(os.path.join(store_path, "index.json")) else None
+        if cache is None:
+            cache = self.get_frame_cache()
+        if fetcher is None:
+            fetcher = self.get_video_fetcher()
+
+        engine = get_playback_engine()
+
+        # Words rendered ahead of the one playing
+        queue = asyncio.Queue(maxsize=PLAYBACK_LOOKAHEAD)
+
+        # Buffering and playback run concurrently
+        buffer_task = asyncio.create_task(buffer_videos(queue, engine, words, word_to_video_map, store, cache, fetcher))
+        play_task = asyncio.create_task(engine.play(queue, sink))
+        _, playback_stats = await asyncio.gather(buffer_task, play_task)
+
+        print_playback_stats(playback_stats)
+
+        stats = cache.stats()
+        print(f"Frame cache: {stats['hit_rate']:.0%} hit rate ({stats['hits']} memory, {stats['disk_hits']} disk, "
+              f"{stats['misses']} misses), {stats['memory_bytes'] / 1024 / 1024:.0f} MiB in memory")
+        stats = fetcher.stats()
+        print(f"Video cache: {stats['hits']} hits, {stats['misses']} fetched, {stats['revalidations']} revalidated, "
+              f"{stats['bytes'] / 1024 / 1024:.0f} MiB on disk")
+        return playback_stats
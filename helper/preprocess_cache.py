@@ -0,0 +1,104 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class TemplateCache:
+    def __init__(self, max_entries=1024, db_path=None, namespace=""):
+        """
+        LRU cache of tokenized announcement templates, optionally backed by SQLite.
+
+        Keys are the template word tuples from AnnouncementTokenizer.templatize,
+        so "train 12951 at platform 3" and "train 22691 at platform 7" share
+        one entry. Entries missing from memory are looked up in the database
+        (if given), which keeps them across restarts.
+
+        :param max_entries: Templates kept in memory
+        :param db_path: SQLite file for persistent entries (None keeps them in memory only)
+        :param namespace: Separates entries of different dictionaries or settings in one database
+        """
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS templates "
+                "(namespace TEXT, template TEXT, tokens TEXT, last_used REAL, PRIMARY KEY (namespace, template))"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _encode(template):
+        return json.dumps(list(template))
+
+    def get(self, template):
+        """Return the cached keys of a template or None."""
+        with self._lock:
+            keys = self._memory.get(template)
+            if keys is not None:
+                self._memory.move_to_end(template)
+                self.hits += 1
+                return keys
+
+            if self._db is not None:
+                encoded = self._encode(template)
+                row = self._db.execute(
+                    "SELECT tokens FROM templates WHERE namespace = ? AND template = ?",
+                    (self.namespace, encoded),
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE templates SET last_used = ? WHERE namespace = ? AND template = ?",
+                        (time.time(), self.namespace, encoded),
+                    )
+                    self._db.commit()
+                    keys = json.loads(row[0])
+                    self.db_hits += 1
+                    self._insert(template, keys)
+                    return keys
+
+            self.misses += 1
+            return None
+
+    def put(self, template, keys):
+        with self._lock:
+            self._insert(template, list(keys))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO templates VALUES (?, ?, ?, ?)",
+                    (self.namespace, self._encode(template), json.dumps(list(keys)), time.time()),
+                )
+                self._db.commit()
+
+    def _insert(self, template, keys):
+        self._memory[template] = keys
+        self._memory.move_to_end(template)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.db_hits + self.misses
+            return {
+                "hits": self.hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.db_hits) / lookups if lookups else 0.0,
+                "entries": len(self._memory),
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,100 @@
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+
+class VideoStream:
+    def __init__(self, video_path, size=(500, 500), buffer_size=16):
+        """
+        Decodes a video on a background thread into a fixed ring buffer of frames.
+
+        Iterating yields resized BGR frames as soon as they are decoded. A
+        yielded frame is a view into the ring buffer and stays valid until
+        the next frame is requested; copy it to keep it longer. Memory use is
+        bounded by buffer_size frames whatever the video length.
+
+        :param video_path: File path or URL accepted by cv2.VideoCapture
+        :param size: (width, height) every frame is resized to
+        :param buffer_size: Number of decoded frames held ahead of playback (at least 2)
+        """
+        self.video_path = video_path
+        self.size = size
+        self.buffer_size = max(2, buffer_size)
+        self.fps = None
+        self.opened = None
+        self.frames_decoded = 0
+
+        self._ring = np.empty((self.buffer_size, size[1], size[0], 3), dtype=np.uint8)
+        # Slots holding decoded frames, in order; None marks the end of the video
+        self._ready = queue.Queue(maxsize=self.buffer_size + 1)
+        # Slots the decoder may overwrite
+        self._free = threading.Semaphore(self.buffer_size)
+        self._started = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._decode, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _decode(self):
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            self.opened = cap.isOpened()
+            if not self.opened:
+                print(f"Error: Cannot open video file {self.video_path}")
+                return
+            self.fps = cap.get(cv2.CAP_PROP_FPS) or None
+            self._started.set()
+
+            slot = 0
+            while not self._stop.is_set():
+                if not self._free.acquire(timeout=0.1):
+                    continue
+                ret, frame = cap.read()
+                if not ret:
+                    self._free.release()
+                    break
+                cv2.resize(frame, self.size, dst=self._ring[slot])
+                self._ready.put(slot)
+                self.frames_decoded += 1
+                slot = (slot + 1) % self.buffer_size
+        finally:
+            cap.release()
+            self._started.set()
+            self._ready.put(None)
+
+    def wait_started(self, timeout=None):
+        """Block until the video is opened (or failed to open); returns self.opened."""
+        self._started.wait(timeout)
+        return self.opened
+
+    def __iter__(self):
+        held = None
+        while True:
+            slot = self._ready.get()
+            # The previous frame is no longer in use, so the decoder may reuse its slot
+            if held is not None:
+                self._free.release()
+            if slot is None:
+                return
+            held = slot
+            yield self._ring[slot]
+
+    def close(self):
+        """Stop decoding early and wait for the decoder thread to exit."""
+        self._stop.set()
+        # Unblock a decoder waiting to hand over a frame
+        while self._thread.is_alive():
+            try:
+                self._ready.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+
+def open_video_stream(video_path, size=(500, 500), buffer_size=16):
+    """Starts decoding a video in the background and returns the VideoStream."""
+    return VideoStream(video_path, size, buffer_size).start()
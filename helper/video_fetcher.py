@@ -0,0 +1,345 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Clips used (or downloaded) this recently are never evicted: another
+# process sharing the cache directory may be about to decode them
+IN_USE_GRACE = 300.0
+
+
+class HttpBackend:
+    def __init__(self, timeout=30):
+        """Downloads clips over HTTP(S) with conditional requests."""
+        self.timeout = timeout
+
+    def fetch(self, url, dest_path, validators):
+        """
+        Download url into dest_path unless the cached copy is still current.
+
+        :param validators: {"etag", "last_modified"} saved from the previous download
+        :return: None if not modified, otherwise the new validators
+        """
+        request = urllib.request.Request(url)
+        if validators.get("etag"):
+            request.add_header("If-None-Match", validators["etag"])
+        if validators.get("last_modified"):
+            request.add_header("If-Modified-Since", validators["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response, open(dest_path, "wb") as f:
+                shutil.copyfileobj(response, f, 1024 * 1024)
+                return {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+
+class LocalDirectoryBackend:
+    def __init__(self, root):
+        """
+        Serves clips from a local directory, for offline use and tests.
+
+        A URL is looked up by its Drive file id (the id= query parameter) or,
+        failing that, its file name, with or without a video extension.
+        """
+        self.root = root
+
+    def resolve(self, url):
+        parsed = urlparse(url)
+        names = parse_qs(parsed.query).get("id", []) + [os.path.basename(parsed.path)]
+        for name in filter(None, names):
+            for candidate in (name, f"{name}.mp4", f"{name}.webm", f"{name}.avi"):
+                path = os.path.join(self.root, candidate)
+                if os.path.isfile(path):
+                    return path
+        raise FileNotFoundError(f"No local clip for {url} in {self.root}")
+
+    def fetch(self, url, dest_path, validators):
+        source = self.resolve(url)
+        stat = os.stat(source)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        if validators.get("etag") == etag:
+            return None
+        shutil.copyfile(source, dest_path)
+        return {"etag": etag, "last_modified": None}
+
+
+class FileLock:
+    def __init__(self, path):
+        """Exclusive lock held across every process that opens the same lock file."""
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+def temp_path(path):
+    """Temporary name next to path that no other thread or process uses."""
+    return f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VideoFetcher:
+    def __init__(self, cache_dir, backend=None, max_bytes=4 * 1024 * 1024 * 1024, revalidate_after=24 * 3600,
+                 prefetch_workers=3):
+        """
+        Persistent local cache of dictionary clips with concurrent prefetching.
+
+        Clips are stored under their URL hash with the validators (ETag,
+        Last-Modified) and SHA-256 of the download. Entries older than
+        revalidate_after are revalidated with a conditional request; when the
+        source gives no validators, the clip is fetched again and only replaced
+        if its checksum changed. The least recently used clips are evicted once
+        the cache exceeds max_bytes.
+
+        Several processes can share one cache directory (e.g. render_signs.py
+        workers): downloads go through per-process temporary names, the
+        index is merged with the copy on disk under a file lock before it
+        is written, and clips used within IN_USE_GRACE seconds by any
+        process are not evicted.
+
+        :param cache_dir: Cache directory (created if missing)
+        :param backend: HttpBackend (default) or LocalDirectoryBackend
+        :param max_bytes: Size cap of the cached clips
+        :param revalidate_after: Seconds before a cached clip is checked again (None never)
+        :param prefetch_workers: Concurrent downloads
+        """
+        self.cache_dir = cache_dir
+        self.backend = backend or HttpBackend()
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._file_lock = FileLock(os.path.join(cache_dir, "index.lock"))
+        # Reentrant: a done-callback can run inside _submit while the lock is held
+        self._lock = threading.RLock()
+        self._inflight = {}  # key -> Future
+        self._executor = ThreadPoolExecutor(max_workers=prefetch_workers, thread_name_prefix="video-fetch")
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        with self._file_lock:
+            self._index = self._read_index()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _read_index(self):
+        """Index on disk, without entries whose file disappeared."""
+        try:
+            with open(self._index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        return {key: entry for key, entry in index.items()
+                if os.path.exists(os.path.join(self.cache_dir, entry["file"]))}
+
+    def _merge_index(self):
+        """
+        Merge the index with the one on disk; call with the file lock held.
+
+        Other processes may have added, refreshed or evicted clips since
+        this one last read it. For a clip both know, the newer download wins.
+        """
+        index = self._read_index()
+        for key, entry in self._index.items():
+            other = index.get(key)
+            if other is None:
+                if os.path.exists(os.path.join(self.cache_dir, entry["file"])):
+                    index[key] = entry
+            elif entry.get("fetched_at", 0) >= other.get("fetched_at", 0):
+                entry["last_used"] = max(entry.get("last_used", 0), other.get("last_used", 0))
+                index[key] = entry
+            else:
+                other["last_used"] = max(entry.get("last_used", 0), other.get("last_used", 0))
+        self._index = index
+
+    def _save_index(self):
+        """Merge the index with the one on disk and write it; call with the file lock held."""
+        self._merge_index()
+        tmp_path = temp_path(self._index_path)
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _last_used(self, entry):
+        # Hits in any process touch the file, so its mtime covers the other processes
+        try:
+            mtime = os.path.getmtime(os.path.join(self.cache_dir, entry["file"]))
+        except OSError:
+            mtime = 0
+        return max(entry.get("last_used", 0), mtime)
+
+    @property
+    def total_bytes(self):
+        return sum(entry["size"] for entry in self._index.values())
+
+    def _evict(self, keep):
+        """Remove least recently used clips until the cache fits; call with the file lock held."""
+        total = self.total_bytes
+        now = time.time()
+        last_used = {key: self._last_used(entry) for key, entry in self._index.items()}
+        for key in sorted(self._index, key=last_used.get):
+            if total <= self.max_bytes:
+                break
+            if key == keep or key in self._inflight or now - last_used[key] < IN_USE_GRACE:
+                continue
+            try:
+                os.remove(os.path.join(self.cache_dir, self._index[key]["file"]))
+            except FileNotFoundError:
+                pass
+            except PermissionError:
+                continue  # Open in another process (Windows)
+            total -= self._index[key]["size"]
+            del self._index[key]
+
+    def _download(self, url, key):
+        with self._lock:
+            entry = dict(self._index.get(key, {}))
+        path = os.path.join(self.cache_dir, f"{key}.video")
+        cached = bool(entry) and os.path.exists(path) and os.path.getsize(path) == entry.get("size")
+
+        if cached:
+            if self._is_fresh(entry):
+                return path
+            with self._lock:
+                self.revalidations += 1
+
+        tmp_path = temp_path(path)
+        try:
+            validators = self.backend.fetch(url, tmp_path, entry if cached else {})
+            if validators is None:
+                entry["fetched_at"] = time.time()
+            else:
+                checksum = file_sha256(tmp_path)
+                if cached and not validators.get("etag") and checksum == entry.get("sha256"):
+                    # No validators from the source, but the content is unchanged
+                    os.remove(tmp_path)
+                else:
+                    os.replace(tmp_path, path)
+                entry.update(validators)
+                entry.update(file=os.path.basename(path), size=os.path.getsize(path),
+                             sha256=checksum, fetched_at=time.time())
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with self._lock, self._file_lock:
+            entry["last_used"] = time.time()
+            self._index[key] = entry
+            self._merge_index()
+            self._evict(keep=key)
+            self._save_index()
+        return path
+
+    def _is_fresh(self, entry):
+        return self.revalidate_after is None or time.time() - entry["fetched_at"] < self.revalidate_after
+
+    def _submit(self, url):
+        key = self._key(url)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(self._download, url, key)
+                self._inflight[key] = future
+                future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def prefetch(self, urls):
+        """Start downloading clips in the background; already cached or running ones are skipped."""
+        for url in urls:
+            if url:
+                self._submit(url)
+
+    def get(self, url):
+        """Return the local path of a clip, downloading (or waiting for a prefetch) if needed."""
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if key not in self._inflight and entry is not None and self._is_fresh(entry):
+                path = os.path.join(self.cache_dir, entry["file"])
+                try:
+                    current = os.path.getsize(path) == entry["size"]
+                    if current:
+                        os.utime(path)
+                except OSError:
+                    current = False  # Evicted by another process
+                if current:
+                    self.hits += 1
+                    entry["last_used"] = time.time()
+                    return path
+            # Not ready yet: downloading, being prefetched or due for revalidation
+            self.misses += 1
+        return self._submit(url).result()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": len(self._index),
+                "bytes": self.total_bytes,
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock, self._file_lock:
+            self._save_index()
+
+
+def create_video_fetcher(cache_dir, source_dir=None, max_mb=4096, prefetch_workers=3):
+    """
+    Build a VideoFetcher; clips come from source_dir instead of the network when it is set.
+    """
+    backend = LocalDirectoryBackend(source_dir) if source_dir else HttpBackend()
+    return VideoFetcher(cache_dir, backend, max_bytes=max_mb * 1024 * 1024, prefetch_workers=prefetch_workers)
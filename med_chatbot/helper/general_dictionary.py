@@ -1,5389 +1,12 @@
+import os
+
+# CompactDictionary lives in the repository root's helper/, which chatbot.py puts on sys.path
+from helper.compact_dictionary import CompactDictionary
 from helper.drive_link_placeholder import DRIVE_LINK_PLACEHOLDER
 
-MED_VIDEO_IDS={"plaster": DRIVE_LINK_PLACEHOLDER.format("1XPexwSugldZccJVxzbIJ4U0w_oocWFWB"),
-"platelet": DRIVE_LINK_PLACEHOLDER.format("11yzdSc8i0aI8KVXM816BvQlPGIzKVoc1"),
-"guinea pig": DRIVE_LINK_PLACEHOLDER.format("18ggJCgc8OwK8mDQ9bGBBeajotxgJ2ghC"),
-"blood bank refrigerator": DRIVE_LINK_PLACEHOLDER.format("1T5b6VI0MKNLGjL-rKKq6JPcdgqhY-mT5"),
-"blood ransfusion": DRIVE_LINK_PLACEHOLDER.format("1K5Ty_k_inT86QXSHrbbE2Q8VxmoYxpO6"),
-"tongue depressors": DRIVE_LINK_PLACEHOLDER.format("1Njygn2USmsIPOQSLJvHAkfopD86qDZRx"),
-"rehabilitation": DRIVE_LINK_PLACEHOLDER.format("1AM25uy5TMTOjJKD-1j56W4wkBG7zzBrI"),
-"coronary artery bypass surgery": DRIVE_LINK_PLACEHOLDER.format("1tUNSg6oZtM6dcVFmW-dApMyOl8scTHJz"),
-"liver transplantation": DRIVE_LINK_PLACEHOLDER.format("1PAtjFCgHsfglIXhqXJDfLp6mfcpg8auG"),
-"telespectomy set": DRIVE_LINK_PLACEHOLDER.format("1s-KFN-7thOl-uTXmtBZf18x6DHcCoa4u"),
-"auscultation": DRIVE_LINK_PLACEHOLDER.format("1kctixuLHrR5gG_70UARwLRHByRg_rkM0"),
-"debridement": DRIVE_LINK_PLACEHOLDER.format("1nFK2IFfMccTIDIVIhyj40EZ8AFohTF_G"),
-"calorimeter": DRIVE_LINK_PLACEHOLDER.format("1zuu58yXr2jhSyMVj2e1Bi1us8jpHR6Fq"),
-"digestible": DRIVE_LINK_PLACEHOLDER.format("1M6maj5q9DWlq7j93KpRzhTE0yrqvEcjG"),
-"anaesthetists": DRIVE_LINK_PLACEHOLDER.format("1y18u0_4BmiLtvHcRiu5FMl4laaHhkRR5"),
-"bed cradle": DRIVE_LINK_PLACEHOLDER.format("1UHYIbIPFMofhASh3thr4kX2ySI99wOW-"),
-"atrial natriuretic peptide": DRIVE_LINK_PLACEHOLDER.format("1Tupj2yGbTmapj2zrAXeii8X3N06mJkP-"),
-"menopause": DRIVE_LINK_PLACEHOLDER.format("1XQzgA7DzAKd9dZqjrdDjs6J3M3qCSoWS"),
-"thermometer ear": DRIVE_LINK_PLACEHOLDER.format("1mllhhfKeWYfvb1z9xM5LOkxQlHZjH_xC"),
-"calipers": DRIVE_LINK_PLACEHOLDER.format("1IniOyjLSjs4FZB-dF5CHrj3utFQh66BV"),
-"brace": DRIVE_LINK_PLACEHOLDER.format("1JyzG_c0m_ViGlUNY5Gs8p-Y4xzdT-VMD"),
-"electroencephalography": DRIVE_LINK_PLACEHOLDER.format("1mPPjS_jt5lyUIdLxDWRRcv1L5ng6rLgN"),
-"abscess": DRIVE_LINK_PLACEHOLDER.format("1udLdQvVlcZll4Gk4vwsoUnFDHWxDNfHO"),
-"autopsy table": DRIVE_LINK_PLACEHOLDER.format("1kobKKkrlfuuUm5Q_Nu7XF5L_OhJN_oAU"),
-"hiv screening": DRIVE_LINK_PLACEHOLDER.format("1IIsivTQYmOj7BbaUi0BbU7oBFNAbfNke"),
-"handrab": DRIVE_LINK_PLACEHOLDER.format("1Uy1rXpiJHm1U331PAUBytKndXUeiZduT"),
-"antibody": DRIVE_LINK_PLACEHOLDER.format("1kM6_vikN0ykvCWigL-V-kbMLHeNGK5nG"),
-"infusion stand": DRIVE_LINK_PLACEHOLDER.format("1u2OEtHLJ8CKiuy3RIKCIId6K_gTEKMa_"),
-"bag mask device": DRIVE_LINK_PLACEHOLDER.format("1Cyb7EHf4ssTfpiwQ8coezQFX0FwlBYM2"),
-"centrifuge": DRIVE_LINK_PLACEHOLDER.format("1TQtRaW_Sj2UG9XkrzZY0fdxMr3Soiv7B"),
-"contraception": DRIVE_LINK_PLACEHOLDER.format("1qHthPRUDXN82RU-SmhjP2GYN-tlkauB7"),
-"dental compressor": DRIVE_LINK_PLACEHOLDER.format("1-zjFARkx5W0KTeEpL92hVl3nqtu4S_mR"),
-"dental x ray": DRIVE_LINK_PLACEHOLDER.format("1WZrZJeMCH-cUBXgofzX9NGOk2882dep6"),
-"cold room": DRIVE_LINK_PLACEHOLDER.format("12Qz3A3TwA8tUP5Nlo5utxtOIcYSUOrlD"),
-"myomectomy": DRIVE_LINK_PLACEHOLDER.format("1XZ6Dy9cPhGjiVq_WtM9J49hwl-_-n_RF"),
-"contact lens": DRIVE_LINK_PLACEHOLDER.format("1Vzemfz-6HRypkqM0hKc9Sco_bkKPJ0TZ"),
-"trolley": DRIVE_LINK_PLACEHOLDER.format("1n27PdTSU6a6_Xb5vKMXSv-hmVOxi54f2"),
-"linen": DRIVE_LINK_PLACEHOLDER.format("1n27PdTSU6a6_Xb5vKMXSv-hmVOxi54f2"),
-"acidity": DRIVE_LINK_PLACEHOLDER.format("1mF0aESQ2yIeRMM3RRcJoS_m8mFbLg3R8"),
-"elbow conformer": DRIVE_LINK_PLACEHOLDER.format("1-Wkz_991vviWIPSjMUjDkJoFcv_CuF-C"),
-"nebulization": DRIVE_LINK_PLACEHOLDER.format("1zOrZ2pzPUkiu4FHL_eT7TBkVsVPoaBKi"),
-"film hopper": DRIVE_LINK_PLACEHOLDER.format("1FqANpGcTUyYrniBnXqbEPDpYcfEVAOsj"),
-"biopsy": DRIVE_LINK_PLACEHOLDER.format("1erXEAZjle8GCnLO6SoVDvFuqMqfLjZMv"),
-"tonsillectomy": DRIVE_LINK_PLACEHOLDER.format("1I-Sa_t1BJhQsq0XMehtsbYprTtyoSGZA"),
-"bp machine": DRIVE_LINK_PLACEHOLDER.format("1fSOO5b8dELtPW5Jwcz2aidWIgbF74irX"),
-"fetoscope": DRIVE_LINK_PLACEHOLDER.format("1yccxcWvs0HkTLjqr28xFpDfOzz2AkFey"),
-"dental chair": DRIVE_LINK_PLACEHOLDER.format("1qtbCFV4dYndsxyS2ZtI23a9Tv023B1NC"),
-"donation": DRIVE_LINK_PLACEHOLDER.format("12BNxqBmIYYW2DgiUFCZxRo8ZePuS9c-z"),
-"anaesthetic machine": DRIVE_LINK_PLACEHOLDER.format("1bJ4i4gVbcu1d-bI91XIvRXOyMLuYRxQc"),
-"ecg monitor": DRIVE_LINK_PLACEHOLDER.format("1ANW8HK4S1Z5-Sna8MWcHwdaIfdaJgxRo"),
-"general x ray unit": DRIVE_LINK_PLACEHOLDER.format("1YdbTziCjCETGvzH6jyLWaRDgN6y7Lyb4"),
-"sneeze": DRIVE_LINK_PLACEHOLDER.format("1AXhivZ3ikNpQZi5JjguOthiI6q08WYqF"),
-"agnosia": DRIVE_LINK_PLACEHOLDER.format("1wUfIpV0GfIJ4zqMZyB9QeRerq4vUjdXw"),
-"amalgamator": DRIVE_LINK_PLACEHOLDER.format("1Wdy3pSZPXb09_kRKIHy5uKMrYuNYlA9w"),
-"triple marker test": DRIVE_LINK_PLACEHOLDER.format("1EuRtvdKLXkOH6EkFD_fqEkwJumghHB5Z"),
-"braille": DRIVE_LINK_PLACEHOLDER.format("19jT71JlfJgpxkNoKzL9dbEF4fdcNOXqm"),
-"androgen": DRIVE_LINK_PLACEHOLDER.format("19dWf91z77FXrqlgaedpYnNcUul_MDJhb"),
-"resuscitation": DRIVE_LINK_PLACEHOLDER.format("1kZi0jvWyiR5MavNPHnmFo5OUZfBX0R-D"),
-"lactation": DRIVE_LINK_PLACEHOLDER.format("1VUhDwOazerog5g9kpsO-AVSdn5ksW0La"),
-"adolescence": DRIVE_LINK_PLACEHOLDER.format("1h4LYdeWP3AZ7YPWkxR96f94R3NlZftWI"),
-"delivery bed": DRIVE_LINK_PLACEHOLDER.format("1zGFw6wWbBaO3sw7Zhjlm0fcVYIr6gJFU"),
-"pregnancy test": DRIVE_LINK_PLACEHOLDER.format("1aXyeRBOa-r6_YG-7HCX0uBsP-L64szhk"),
-"denture": DRIVE_LINK_PLACEHOLDER.format("15nvMfJNBP00Ljf45P6LjVQ8s1XLS2Yub"),
-"angioplasty": DRIVE_LINK_PLACEHOLDER.format("19KDekRyYTnqs7Y2Ku8w42GNVcfKe_ZCZ"),
-"hdu high dependency unit": DRIVE_LINK_PLACEHOLDER.format("1rViU_VFBKDe3rT7Lx7pkKlMNarOimFyk"),
-"abortion": DRIVE_LINK_PLACEHOLDER.format("184tKsYXBSkDuKb6N-8mUCt0r9g0Z3blF"),
-"adenoids": DRIVE_LINK_PLACEHOLDER.format("1CR5IOxmcR3QUUGNvfh1AFQWbF81CptUF"),
-"testosterone": DRIVE_LINK_PLACEHOLDER.format("1AYMySY3wziAxTywwPgRBI6a-aZW51xjd"),
-"carbohydrates": DRIVE_LINK_PLACEHOLDER.format("1u0SOeVyc4YuhFYr0ABGygR0t3Uk7rbjm"),
-"antidiuretic hormone": DRIVE_LINK_PLACEHOLDER.format("19KYEyTDy5qbj5K0D0rasoxIo8qbaHzno"),
-"acid reflex disorder": DRIVE_LINK_PLACEHOLDER.format("1f455Wbp4hpAwKeTQYYU0zCFx2bXiSio4"),
-"digestion": DRIVE_LINK_PLACEHOLDER.format("1Jl5hGSqy38C47TZ4C9tPR8p_u3lE5URW"),
-"icu intensive care unit": DRIVE_LINK_PLACEHOLDER.format("141XzJOE7BLSiSE0k6kAhU9-4WA9gWMt1"),
-"acidosis": DRIVE_LINK_PLACEHOLDER.format("1gAin86ze4msOsEy0hMixz0S66IErMq45"),
-"prostaglandins": DRIVE_LINK_PLACEHOLDER.format("1TVnZ0pT1BYbmh-C9T5x3DC024UGbkjWc"),
-"pregnancy": DRIVE_LINK_PLACEHOLDER.format("1L1MeVbQbzkh-kHPLIXBmLcAliKGZ7lIE"),
-"audiometer": DRIVE_LINK_PLACEHOLDER.format("1Et8cTEBhtjgfzlgNEJyM6V5WPbD4jhiw"),
-"bilirubin meter": DRIVE_LINK_PLACEHOLDER.format("123S83LbAaJsaKy315PBsEQVdFEBYs43N"),
-"puberty": DRIVE_LINK_PLACEHOLDER.format("12bdd-QZY0eCzwsxz1Rg1l9NZ2a8jckTv"),
-"doner": DRIVE_LINK_PLACEHOLDER.format("1-HjIKPRB9lbM6SxbZZViGjk37MHmuZNK"),
-"anti mullerian hormone": DRIVE_LINK_PLACEHOLDER.format("1_1KWn7FfPUHsKvY455eS_nv7PM87s5ei"),
-"blood bank": DRIVE_LINK_PLACEHOLDER.format("1w3ryhX1v7IiKf3pMm4pCPp9AoDoKF1AK"),
-"lumber traction": DRIVE_LINK_PLACEHOLDER.format("1P0Jv0a2iQLr8QHJdGw780t0fdo_cUamm"),
-"quickening": DRIVE_LINK_PLACEHOLDER.format("1O_tMwU0PVb3m6BAMML1uDUYuZiUK_N8Z"),
-"snore": DRIVE_LINK_PLACEHOLDER.format("1_EWgZTU9nHytA0MXc-j-gDv41nTLtVnB"),
-"hemodialysis": DRIVE_LINK_PLACEHOLDER.format("1l0Dg2tG1BpNZVgpa-FLQOo7P3Eftn9aB"),
-"acromegaly": DRIVE_LINK_PLACEHOLDER.format("16F5vwToOACF4qmHxUYQ0eExR2pkfimCp"),
-"thermometer": DRIVE_LINK_PLACEHOLDER.format("13E6FvcjuyRriNRErcGw4flzp52I7LRO0"),
-"glove": DRIVE_LINK_PLACEHOLDER.format("1P_k-mAfxxprCzh0WbpeliXFuxOgYKKff"),
-"detoxification": DRIVE_LINK_PLACEHOLDER.format("1UXh7KL_880lvfAnP-kOrqqYmsgmseXTb"),
-"film drier": DRIVE_LINK_PLACEHOLDER.format("1MVCWiptEiqUWlKoK8qs21DYWFNiH1l1H"),
-"blood pressure cuff": DRIVE_LINK_PLACEHOLDER.format("1dY1qUk2Mj0QUByMvB3ei5thbnzpDSqXd"),
-"tourniquet": DRIVE_LINK_PLACEHOLDER.format("1Y9pIEfWpzV6dK2yqVHWybbG4ljca_R9k"),
-"theatre": DRIVE_LINK_PLACEHOLDER.format("1Cj4EOpTV0-vlK5kjRcXdE4ihMk-MM4Dy"),
-"theatre": DRIVE_LINK_PLACEHOLDER.format("13-1itD2KJsDerAiscp4LkEzU8IoO7vSk"),
-"shortwave diathermy": DRIVE_LINK_PLACEHOLDER.format("1zX3eQBDpQA_HM_Mks7rgXo7ccEbCeM4_"),
-"eye bank": DRIVE_LINK_PLACEHOLDER.format("1rycyJvT4MfCMe2THt9QF-XpAkRvJR1ry"),
-"eye chart e type": DRIVE_LINK_PLACEHOLDER.format("14PR9ja2Qhg8MPJSv08f8GWccy260sLGJ"),
-"ear plug": DRIVE_LINK_PLACEHOLDER.format("1br8HhdUX7kVsJVjafvw3bMBRMDZdCwLP"),
-"cool box": DRIVE_LINK_PLACEHOLDER.format("1A7SMazTki9_Dq5XgtoQbtTTwybE6U6aJ"),
-"tripod": DRIVE_LINK_PLACEHOLDER.format("19TX57dh-HGipYRK_3FfMN0tZDk2CyO8q"),
-"troucher and canulla": DRIVE_LINK_PLACEHOLDER.format("19bFcCxdPEqsZgGbcox2GH7rCV7eJUC_n"),
-"oral rehydration therapy": DRIVE_LINK_PLACEHOLDER.format("1JlZkI5HGaTck2lBmvmMwjD8i1Xq59lLm"),
-"tuberculin skin test": DRIVE_LINK_PLACEHOLDER.format("1xv2ZhpxIbbG_41b6X_gfGnbcSqe58l31"),
-"autoclave": DRIVE_LINK_PLACEHOLDER.format("1BQsd7TPWKKmoE8YJ27IMSJrN1yl_Waqb"),
-"infant weighing scale": DRIVE_LINK_PLACEHOLDER.format("1CYqW_z0DFF7LKutZZI7BWUpyi3p5-sZF"),
-"electrode": DRIVE_LINK_PLACEHOLDER.format("19ulpxbAYLYtDejG27zu3qOLAXqXdpP3r"),
-"perspiration": DRIVE_LINK_PLACEHOLDER.format("1mAOJXE8opgmN-MSe-xS2Ebeb5jzQlUE0"),
-"nervous": DRIVE_LINK_PLACEHOLDER.format("1wAClfAmF_vyPkVVIrhpKB7QYxQdawFgv"),
-"aedes": DRIVE_LINK_PLACEHOLDER.format("1QSGaIyCM1LZbDRlz0KwFyKzXvp_Y8s6C"),
-"achalasia": DRIVE_LINK_PLACEHOLDER.format("1wYBn3xTd9S7GQAy70-P49swiexgoUUCr"),
-"centrifuge tube conical": DRIVE_LINK_PLACEHOLDER.format("1kclOKAsKzJNqbEcCfXNYUnFD8r3JU16l"),
-"euthanasia": DRIVE_LINK_PLACEHOLDER.format("18VbXNlciVmnvgvf2lCL8MJtucC0mStng"),
-"melatonin": DRIVE_LINK_PLACEHOLDER.format("1dq9r_MdkYqm3If0VqZjJ2pD-jpNVm37c"),
-"endoscope": DRIVE_LINK_PLACEHOLDER.format("1_lGmimD6AzgSVUBwbOthNx5LmUbQQckh"),
-"pulse": DRIVE_LINK_PLACEHOLDER.format("1y-gkGpf135mrQhYKes1QwKh9B9qwH0yx"),
-"tracheotomy": DRIVE_LINK_PLACEHOLDER.format("1gM-MKXMElzCxLzoTZlz1mtgIpsDo--x8"),
-"foley catheter": DRIVE_LINK_PLACEHOLDER.format("1LAG_lTrPfgvAeOX8IJco_ukn51NF64by"),
-"catheter": DRIVE_LINK_PLACEHOLDER.format("1LCx7_5-ZiCm2GuB73u42ZRTm3rQfjqhY"),
-"baby cot": DRIVE_LINK_PLACEHOLDER.format("11HdKKVPf7v73uO6XMV96xjQ2NMJbOBvy"),
-"disinfection": DRIVE_LINK_PLACEHOLDER.format("1FFclUFswhtAbVfnMG-2hSVi0Pa7moyp6"),
-"exercise mat": DRIVE_LINK_PLACEHOLDER.format("1Xu_uXImZdFCDmbOSZzdVP_YpYTC4Dy-4"),
-"blood group": DRIVE_LINK_PLACEHOLDER.format("1w1Fe4kOJ1ypmemJl2j8YCb94VtoW3_7b"),
-"chest expander": DRIVE_LINK_PLACEHOLDER.format("19pAfOmCQm7FVzx1lSHwH-NH4iBUdyxnK"),
-"sputum": DRIVE_LINK_PLACEHOLDER.format("1A79rQFsEvh74Z9KGVaP4FTEhzxplJz9Z"),
-"bariatrics": DRIVE_LINK_PLACEHOLDER.format("1GPG78VVLxzwWRZ4uAsW-vcPJqu8neKbj"),
-"hysterectomy": DRIVE_LINK_PLACEHOLDER.format("1ZwQ9tTO_PlM6V2M62ymvxADmJxKuzRBw"),
-"cholesteral": DRIVE_LINK_PLACEHOLDER.format("1Y8ERvqh0nXgWbGx65pZmq6WnSIMtWnLn"),
-"trolley": DRIVE_LINK_PLACEHOLDER.format("1XC6TCkHfIBTqkh7V8bNLGQjrt181wOJn"),
-"vitamin b7": DRIVE_LINK_PLACEHOLDER.format("18H-YiNQsjyqBTBUywUSkxLOIt4uL-n1D"),
-"dental examination mirror": DRIVE_LINK_PLACEHOLDER.format("110VCbXPVzLKMj1wazcJyRyPWbJ92ifjY"),
-"cry therapy": DRIVE_LINK_PLACEHOLDER.format("1PbWTBsnf7ybOZfrSp6AMFx6UrRaWg1Bq"),
-"grafting": DRIVE_LINK_PLACEHOLDER.format("1JNqVVQ8Mhl5moeXSWQGkWbfwShYWMfxM"),
-"anticoagulant": DRIVE_LINK_PLACEHOLDER.format("1Pnkr9tA6pUca7UfiPJmZAF3d9Lp6U_hc"),
-"beaker": DRIVE_LINK_PLACEHOLDER.format("1OpAoV0lcQqVjLhdSKmX9zlabMe4aqN0k"),
-"dental lab": DRIVE_LINK_PLACEHOLDER.format("16qmCWiP-_QOgcXr48os5xF69QJ0QoSBZ"),
-"casarean section": DRIVE_LINK_PLACEHOLDER.format("1ZwAUPNwSpwK7A97lvBe9k7ZYlDlMZxM7"),
-"acne": DRIVE_LINK_PLACEHOLDER.format("1k9tTsOXb0ZSsYBEUn8iK-Rieg3CFKxGr"),
-"prolactin": DRIVE_LINK_PLACEHOLDER.format("13s2TRs6bHmznEmz1EavKhZ0d0EuSmIKs"),
-"dengue": DRIVE_LINK_PLACEHOLDER.format("1mzUoZN5NwGqFZP9O9Qk5-1dH7f_uqJIi"),
-"maternity": DRIVE_LINK_PLACEHOLDER.format("1ee6RMM11Ik73IoGqChS-CQ_6oKbfY1rZ"),
-"transplantation": DRIVE_LINK_PLACEHOLDER.format("11dpSz2BkeIVAqbHLgWkZpq_bAaghXr7-"),
-"urine": DRIVE_LINK_PLACEHOLDER.format("1q5Ao0xrJCs5LnVqkkDiwrKPfjoQkuVpR"),
-"blood pressure": DRIVE_LINK_PLACEHOLDER.format("10hfiPu-8gZGnMwcNYjjLOd7L9ubghb4x"),
-"andropause": DRIVE_LINK_PLACEHOLDER.format("1QjoIYeVRWz5-r9kq5Ka4n27MzUtfjyDT"),
-"blood lancet disposable": DRIVE_LINK_PLACEHOLDER.format("1t4Us2plNLpbF0nYW5grgDl1eIWUkqXyG"),
-"epidemic": DRIVE_LINK_PLACEHOLDER.format("1tlNtfkXagTlDHqHIuToTlpD3bClK_HWf"),
-"autopsy instruments": DRIVE_LINK_PLACEHOLDER.format("1T7Jil7UgslI_QW7q6UEZT1GvsfO_wsnz"),
-"halitosis": DRIVE_LINK_PLACEHOLDER.format("1YIcKoXIr6hWwM-bAZmmBjyF_f3IkDDNM"),
-"trolley": DRIVE_LINK_PLACEHOLDER.format("1867vgkG29Q7CDIs7kHcgx8O6qYrwbruo"),
-"pox": DRIVE_LINK_PLACEHOLDER.format("1L9K-oN2OWgFO_hrnPbZBxpAsQZJeaWP3"),
-"acute": DRIVE_LINK_PLACEHOLDER.format("1xuK2GEm7JBcZNN4SnGAL7Z3Dt_hgjKzI"),
-"contamination": DRIVE_LINK_PLACEHOLDER.format("1DE0ZflwJ987vbzLrkSgHeMGwYNaKbzNG"),
-"commode chair": DRIVE_LINK_PLACEHOLDER.format("1neJgRp_94BwjcN2RuSau2nnVN96C61f6"),
-"disease": DRIVE_LINK_PLACEHOLDER.format("1Dprn6xztdS-AcTJ5pajYaVAcStkfUHEj"),
-"thymoma and thymic carcinoma": DRIVE_LINK_PLACEHOLDER.format("1J6bwXbuA4BhIxrTyFXNi5TBtMwGGsoFF"),
-"inflammatory bowel disease": DRIVE_LINK_PLACEHOLDER.format("11CEphlAwjlvVolcZ2f0gNSj13_YkPb76"),
-"somatostatin": DRIVE_LINK_PLACEHOLDER.format("1ldKWacVfqG87Ld2KLBhejQW5VTnPdGa1"),
-"scoliosis": DRIVE_LINK_PLACEHOLDER.format("1T3vbOjH7IBJYSYEBDSOlB5F6_fHjpYly"),
-"audiogram": DRIVE_LINK_PLACEHOLDER.format("1h2szfUk1EaKwHC5Z0rCsrEPP_HVEuLHc"),
-"graft": DRIVE_LINK_PLACEHOLDER.format("1iQWL3ifSqkIVgIbTQnZ3jfwuuuB76gZw"),
-"physical disability": DRIVE_LINK_PLACEHOLDER.format("1B3IdvHrXEQZrCEC7o6hugRfGCMA0A8WV"),
-"discharge summary": DRIVE_LINK_PLACEHOLDER.format("1wRfoMg3IITRxFnxbOUQFi1fELRvgL5Xx"),
-"urinary retention": DRIVE_LINK_PLACEHOLDER.format("1jlQD7qlVRkPelvOKGgKED_9ZYU73JygY"),
-"echocardiogram": DRIVE_LINK_PLACEHOLDER.format("1nnrxyi-aTFK9QpKO4ix5P5qn78_z5w6S"),
-"wound": DRIVE_LINK_PLACEHOLDER.format("1pmZ9W7bAbwQ8iQysNjFQ-Q_YyLf9tKyo"),
-"acupuncture": DRIVE_LINK_PLACEHOLDER.format("174bKZuUESElwkh6x07YjikJUieUINRXe"),
-"binocular microscope": DRIVE_LINK_PLACEHOLDER.format("1Fx9UWd1-rsTNTVWxFvKdGwE1p3aNK678"),
-"brain tumor inside": DRIVE_LINK_PLACEHOLDER.format("1FD73e4-Oyj8Y-HbIVDt7Wx1QRFC8pygl"),
-"dermatits": DRIVE_LINK_PLACEHOLDER.format("1Xbtv6LedXX45uOzeUkmztyPds1YdRd2m"),
-"chikungunya virus": DRIVE_LINK_PLACEHOLDER.format("1T8zwWTRdClM6Wg11sKzX7zZ1Y95TGZQy"),
-"acute coronary syndrome": DRIVE_LINK_PLACEHOLDER.format("1ijaUQUvz80xYqnDHhf4daKjBKzrKjL5n"),
-"luteinizing hormone": DRIVE_LINK_PLACEHOLDER.format("1T8HB3iXN-r_o157hYm84CTMh1BL92QfR"),
-"labour": DRIVE_LINK_PLACEHOLDER.format("1Mlvc-WhqmH2uqvkafO2pe1pBmgJy51xS"),
-"adipsia": DRIVE_LINK_PLACEHOLDER.format("1VVisFw07XvXy_xUXKT-PJDqPDY-qdzao"),
-"bowel rest": DRIVE_LINK_PLACEHOLDER.format("1KdCwbCBGBGJGepBwH5c_Dz0DO9OkgnpW"),
-"trolley": DRIVE_LINK_PLACEHOLDER.format("1_ZjIrZhc6dsp4zvEmVW32zHJQj4z4VlV"),
-"asystole": DRIVE_LINK_PLACEHOLDER.format("1WlDq20DUEgRjThPQMZBEbljHSgOFhmbV"),
-"congenital disease": DRIVE_LINK_PLACEHOLDER.format("1BpMr3tkEcGref_NuVHaryXpP6HtCBKnD"),
-"cannula": DRIVE_LINK_PLACEHOLDER.format("1S24Id2A7WYJ8HrUBlzM-uduefJHwaNqp"),
-"hernia": DRIVE_LINK_PLACEHOLDER.format("1uGL3KHY4hZmItPvdJazIiqAdTGD1oKGA"),
-"anorexia": DRIVE_LINK_PLACEHOLDER.format("1fqrhyeGgRiWHQsmtp7sxvSGrX6gJpsqq"),
-"elephantiasis": DRIVE_LINK_PLACEHOLDER.format("1KnS7AfsKozUkOLuztA3Qkp8TViUohQ8s"),
-"frostbite": DRIVE_LINK_PLACEHOLDER.format("1hz6EqI_1pQkLObvzX8Thq_Y6VGD8E9BI"),
-"blindness and low vision": DRIVE_LINK_PLACEHOLDER.format("14PDzvCuzAmC1BNn_TyyFrCnIEb8C1HGd"),
-"astigmatism": DRIVE_LINK_PLACEHOLDER.format("16eGC_qoe6O5Yjs-Iv19p_3vsQi48Fx7P"),
-"infra red radiation irr craddle": DRIVE_LINK_PLACEHOLDER.format("1fI8Bgt9716rtL6rFEKfCkNGbcwR1oyhh"),
-"swelling": DRIVE_LINK_PLACEHOLDER.format("16J2Is27o3lr6UNxMeQQkZG6nkaSyxRNQ"),
-"bile duct cancer": DRIVE_LINK_PLACEHOLDER.format("1kbtU-F4FtBRon9iz_XPUpOhkWfxPcHIH"),
-"bench press": DRIVE_LINK_PLACEHOLDER.format("1-OPXJni9PwTfBLuXfB5B0YhvatQwKBnn"),
-"bruise": DRIVE_LINK_PLACEHOLDER.format("1irQ4CRl7ttEw70lBqsejM-CGQoVreT7T"),
-"rabies": DRIVE_LINK_PLACEHOLDER.format("1LSudR46JbXGBNF2gAYy2aD9a8xJTtR24"),
-"eye chart": DRIVE_LINK_PLACEHOLDER.format("1YA2n83JJf-Pcg3bQ9y-_jU9zCbESZB-t"),
-"protein": DRIVE_LINK_PLACEHOLDER.format("1JmdpbjvX2EtslDmraguuX3THJI_PDg6U"),
-"abrasion": DRIVE_LINK_PLACEHOLDER.format("1N112Fi0bQiTRjWFz3KjCqvXNXbL-Dy-P"),
-"cautery machine": DRIVE_LINK_PLACEHOLDER.format("1S2z8dUqpefvsGsQAEBArSYnn_d4hms2N"),
-"common cold": DRIVE_LINK_PLACEHOLDER.format("1KBIoe95T8zPMWViUy1YdyYTyLLfqVJog"),
-"medicine": DRIVE_LINK_PLACEHOLDER.format("11Ve5ld7SzYuqWDD2uGlU5l5ec9qKmYUD"),
-"vitamin d": DRIVE_LINK_PLACEHOLDER.format("15ofzG_AKBSvLhMSeE-pxUJnASp0kkOab"),
-"meningitis": DRIVE_LINK_PLACEHOLDER.format("195KPX3Uw4Gy3Jlf9qlYFIscNAqnOx4wI"),
-"scabies": DRIVE_LINK_PLACEHOLDER.format("1I6rg9n3djmJLWzqVEbaJOKe9B3SGsaVl"),
-"cystitis": DRIVE_LINK_PLACEHOLDER.format("1D1TCf3gtTMotX7CBd1aDHQ4t-txC6idw"),
-"scar": DRIVE_LINK_PLACEHOLDER.format("1pYgoZNxyeZNRXi7Fa02_LuhhXl0b2u5l"),
-"brain injury": DRIVE_LINK_PLACEHOLDER.format("142kvBrrRWdxD2gJN4LIudzjAXUJILA-Y"),
-"syncope": DRIVE_LINK_PLACEHOLDER.format("1kswM9sQsZ6KKxDHSoNNAjRIgBOA1V-Ud"),
-"small cell lung cancer": DRIVE_LINK_PLACEHOLDER.format("1Abjzx6g5ySqHyxM83eCRvnrnnn4n3SmZ"),
-"convelsion": DRIVE_LINK_PLACEHOLDER.format("178kd9skNpIGctnrTIBiDSveo0JEEvsVX"),
-"vitamin b5": DRIVE_LINK_PLACEHOLDER.format("1sXg6NgC0JG4EUltBOB0OPvh28-zjW8iF"),
-"hemorrhoid piles": DRIVE_LINK_PLACEHOLDER.format("1__lqA2pkLljjrhHgX8DJVV9dXr49GubH"),
-"hepatitis": DRIVE_LINK_PLACEHOLDER.format("1CCNu5uVVmA6ykAUWwSsrfMLGJojuYFne"),
-"sexually transmitted disease": DRIVE_LINK_PLACEHOLDER.format("1kV5pUFGJcwo5jt2qesb4zt96noKc0_Oz"),
-"noncommunicable disease": DRIVE_LINK_PLACEHOLDER.format("1kEfNPI-DMCBHBvRTuVwFUGapIh_CKJ-b"),
-"cerebral palsy": DRIVE_LINK_PLACEHOLDER.format("1MOKdsVe5yYvHKbl6MnSrL-lv5Y-G-jOm"),
-"heatstroke": DRIVE_LINK_PLACEHOLDER.format("1FGZjwfqrYtEo5tuOwzQxAf1wX1-MCR5d"),
-"autism": DRIVE_LINK_PLACEHOLDER.format("1JP1QX-ryKhVg_3WZPmAzTpHCAKtKAoYT"),
-"pus": DRIVE_LINK_PLACEHOLDER.format("1WhOOHbtsCnPwzZCJ_bfUXYxWPk4zZglz"),
-"cataract": DRIVE_LINK_PLACEHOLDER.format("1ehEFBodrKUpLN2smPA6eVks6WWSIYegU"),
-"regurgitation": DRIVE_LINK_PLACEHOLDER.format("18W1A5SVj25RZvZcYlBTpYNkghln7Q-SG"),
-"vitamin_b9": DRIVE_LINK_PLACEHOLDER.format("1raojpmu_kjaEQKSlLLyWfmAxDhYHVM-v"),
-"syndrome": DRIVE_LINK_PLACEHOLDER.format("1r9TOIumxXMJnYg6WBwtA30WNpCBNXVAR"),
-"urinary incontinence": DRIVE_LINK_PLACEHOLDER.format("1unWjrFW3k4ng_OydXVH3Fk86lT4RL8ce"),
-"tonsillitis": DRIVE_LINK_PLACEHOLDER.format("1NJwEXJ-rLPw42iAY4eC4agmz4RMFGYHr"),
-"cervical cancer": DRIVE_LINK_PLACEHOLDER.format("1PwGTgpSzxX2I0B6bv2lTIrw63CnT7dSl"),
-"gynecomastia": DRIVE_LINK_PLACEHOLDER.format("17zSPeLF38fVRAK_e2PBssnkjNHd1GmZ-"),
-"caries": DRIVE_LINK_PLACEHOLDER.format("18o-5Y-uFimRYYLwA21GLaYBFnvA3r7ME"),
-"earache": DRIVE_LINK_PLACEHOLDER.format("1EOX687bjC-uQOJjQFn05AMm68fRjCd7D"),
-"sunburn": DRIVE_LINK_PLACEHOLDER.format("1y-m2crPviRedrt4n6wcv8GTvv_bMwzjf"),
-"yellow fever": DRIVE_LINK_PLACEHOLDER.format("1I8W8RP9X1d3spy4BcNFV0MBOioZw3m7L"),
-"speech and language disorders": DRIVE_LINK_PLACEHOLDER.format("1Ers3X0pSogqMo-vDk11zQyJuMqpR1S3M"),
-"thyroid cancer": DRIVE_LINK_PLACEHOLDER.format("1T6P-QwX7yqv8Rt2MYurbHLBE-qc6VLg7"),
-"oedema": DRIVE_LINK_PLACEHOLDER.format("1Gn4rLSRwBqdCTbN7blmW5A4n95Rn_CGD"),
-"edema": DRIVE_LINK_PLACEHOLDER.format("1Gn4rLSRwBqdCTbN7blmW5A4n95Rn_CGD"),
-"candidiasis": DRIVE_LINK_PLACEHOLDER.format("1UzN4LJPql0rTGpxpb9kfjaLoXnX9NLqi"),
-"memory loss": DRIVE_LINK_PLACEHOLDER.format("1L8M5LFIYVtuOgNnQtDLeoOqt2O8kOoto"),
-"boil": DRIVE_LINK_PLACEHOLDER.format("1Q2Cds0_gd53i4Zln0U9rK9MGVufuyRXp"),
-"anorehidism": DRIVE_LINK_PLACEHOLDER.format("1Dma9B9oVkD2rKm6LBVhAWIitEwUyVJ0_"),
-"urticaria": DRIVE_LINK_PLACEHOLDER.format("1l330nCkPZ13VMuTfj8KUx5-NH1WNhnCv"),
-"vitamin c": DRIVE_LINK_PLACEHOLDER.format("1Oq9AiWiKJ1S3TNTtjFIb58-UXtSIhfBh"),
-"drug overdose": DRIVE_LINK_PLACEHOLDER.format("15h2fSGFZZXEZmc_I8RFncFjRHFgxn9zd"),
-"laryngeal cancer": DRIVE_LINK_PLACEHOLDER.format("1vazePw63bHf-khJkt41auRWLjMApO-Wd"),
-"food adulterant": DRIVE_LINK_PLACEHOLDER.format("1vboIDmer8Ws5cEEP8uewqSDVN7u6JSbc"),
-"lymphoma": DRIVE_LINK_PLACEHOLDER.format("1lIRMmyBnEsMbLcjOduafqqJhka1RKgi2"),
-"asperger's disorder": DRIVE_LINK_PLACEHOLDER.format("1h-QDz8XfBVabzI3lQebGOmSsoXl8Zbj8"),
-"bacteria": DRIVE_LINK_PLACEHOLDER.format("1Nw6vNXDNO0qwUqshYnfeAdpzTFtcUPLf"),
-"fever": DRIVE_LINK_PLACEHOLDER.format("1bR8eGHzvZzhoAo4q_B6QOdlXjD5iIHBc"),
-"suicide": DRIVE_LINK_PLACEHOLDER.format("1-myV0rs4mO7mcdo5AGOU5Fiw2xyPDtrH"),
-"bone cancer osteosarcoma and malignant fibrous histiocytoma": DRIVE_LINK_PLACEHOLDER.format("1Wpv9gMWcnWe_ED8qfemIsgE1oW5WEBi2"),
-"skin cancer": DRIVE_LINK_PLACEHOLDER.format("1S0mCuHaI6_RySq-YdfVDxY9ZfYnrtL1A"),
-"learning disability": DRIVE_LINK_PLACEHOLDER.format("1FCQniC1QdC2hrvjT7qUL7igMbwv3QNMw"),
-"melanoma": DRIVE_LINK_PLACEHOLDER.format("1ZlOFF8LXQtUpQmEyLUhTCXrKksmpgjRh"),
-"dyspnea": DRIVE_LINK_PLACEHOLDER.format("1y9sF2fsx35sWwa3Dv8mA90j90uJbtip6"),
-"bowel incontinence": DRIVE_LINK_PLACEHOLDER.format("10vQSEaSQD0YslkUz9ZQcSKJiEVvgPhvK"),
-"diarrhea": DRIVE_LINK_PLACEHOLDER.format("1Ekz2ItaU0mPf2KqsBp0boPMwGUAfwsj0"),
-"kaposi sarcoma": DRIVE_LINK_PLACEHOLDER.format("1hCTIx9sWeYCSi_wrnS7lw2EDO5bGJ04i"),
-"testicular cancer": DRIVE_LINK_PLACEHOLDER.format("1N-9PlZwiczZ28sKxBOwQqOztwWEnW_e6"),
-"women's cancers": DRIVE_LINK_PLACEHOLDER.format("1CcEh1Ezmom-KdWAa0VjhPZRH1k2KbCx3"),
-"sciatica": DRIVE_LINK_PLACEHOLDER.format("1uzFGc0gmLexkrbb67qrOJVv1m8BHfvQk"),
-"ovarian cyst": DRIVE_LINK_PLACEHOLDER.format("18q1XRak-jcdMWYeY-leh5KP51oQewtjw"),
-"tremor": DRIVE_LINK_PLACEHOLDER.format("1Ew3PE4_UqrCD4F4637JSyLruqsAsUL_E"),
-"vitamin b2": DRIVE_LINK_PLACEHOLDER.format("1wDIGmh-j6WP_M0ITkM51SA52pSseX0ut"),
-"hemolysis": DRIVE_LINK_PLACEHOLDER.format("1JKFZVjGHvQFYPjCVEsR2TDmQp0m25zS2"),
-"benign": DRIVE_LINK_PLACEHOLDER.format("15kRxpgMDsaqJOgZEqIaMEbLOyCfN-N4o"),
-"heartburn": DRIVE_LINK_PLACEHOLDER.format("114GzFHmIFeeZ-7lPzT_gZvt4pQ-ffwwU"),
-"cirrhosis": DRIVE_LINK_PLACEHOLDER.format("1T2moSRnLV4CBW71ZC1jP31LL91Ln8wKG"),
-"athlete's foot": DRIVE_LINK_PLACEHOLDER.format("1Mm9stJjkdQXYOIaMDeexPkw6NwpI8C8p"),
-"osteoporosis": DRIVE_LINK_PLACEHOLDER.format("1QuUtIAkymHMZMHO2eSvKPWLbJ9vGjcuB"),
-"palliation": DRIVE_LINK_PLACEHOLDER.format("1uXgD9-xdi6ypGOpngaNrugrtCDqw9Azo"),
-"autoimmune disease": DRIVE_LINK_PLACEHOLDER.format("1NTNUCFRy84BhnbgrVvGy4oaiwJqcgF5Q"),
-"pancreatic cancer": DRIVE_LINK_PLACEHOLDER.format("1GYwrzAziLmZN00pZauRydXRNXJybGuLN"),
-"vitamin b3": DRIVE_LINK_PLACEHOLDER.format("1JXiWcV3qIWn1wOxmN5F5BtdO03AhSvOB"),
-"brain": DRIVE_LINK_PLACEHOLDER.format("1wGcZ2vb4wUYAj-Jmn9RSpP3sLHfJBI80"),
-"color blindness": DRIVE_LINK_PLACEHOLDER.format("1nre9EKxlE5DzQo2fBS9qScP_G4bKZoy1"),
-"brain tumor": DRIVE_LINK_PLACEHOLDER.format("1hEjxjk59bl8Sw7BaSPb5bF32BEv58vjJ"),
-"brain tumor outside": DRIVE_LINK_PLACEHOLDER.format("1hEjxjk59bl8Sw7BaSPb5bF32BEv58vjJ"),
-"crutches": DRIVE_LINK_PLACEHOLDER.format("1w_6Kk64scAV22Rm7oyDlaLzgL68Tk_qU"),
-"contagions disease": DRIVE_LINK_PLACEHOLDER.format("1JBStHctRz24tjLDHdDMpBjjLUOKGSV6q"),
-"food borne disease": DRIVE_LINK_PLACEHOLDER.format("1VPlVtBRF4csbOJduGVYv5wrfM9dI0tTa"),
-"drug abuse and addiction": DRIVE_LINK_PLACEHOLDER.format("13EjfR5ZGtl_Dxp6gUDfEElKrBt26gDmR"),
-"heart diseases": DRIVE_LINK_PLACEHOLDER.format("1aRb2aT7p98ePfItzxafKSaOxXlc7xoOQ"),
-"epistaxis": DRIVE_LINK_PLACEHOLDER.format("1AauB4NE0_2k6xqt4IOv4uDL9cLapeXU_"),
-"scrabble": DRIVE_LINK_PLACEHOLDER.format("17hCMwaQaZKYeBgI4jDoVRhG49sLRivrw"),
-"lip and oral cavity cancer": DRIVE_LINK_PLACEHOLDER.format("1DAPBNc4LxqJ2KlYJjAVlmTuRZandEF2H"),
-"carpal tunnel syndrome": DRIVE_LINK_PLACEHOLDER.format("1od1Nul5tMvt-lp-pCr9eHL7qbfgkCZgS"),
-"carcinoid tumor": DRIVE_LINK_PLACEHOLDER.format("1S0h9UuJ-QH9o5Dz1Mh8uyHPdxv6q8jly"),
-"sleepwalking": DRIVE_LINK_PLACEHOLDER.format("1k5LEhCAxIEC3UdksEKjtrYvedsON02Yo"),
-"hypothermia": DRIVE_LINK_PLACEHOLDER.format("1vrbIWm5R31GILzu8nEvVjgmHsEOtTNKa"),
-"dislocation": DRIVE_LINK_PLACEHOLDER.format("1UHBoomxJGJu2dYWKY9O1Dipl8Q49aX7Y"),
-"thyroid disease": DRIVE_LINK_PLACEHOLDER.format("1_AQrRPN5rN8RyhbhwSUXD4fRH0Xxi8EL"),
-"sprain": DRIVE_LINK_PLACEHOLDER.format("1ZrCWEXOCSrhBwgmXl8666YMtqy93QSff"),
-"cough": DRIVE_LINK_PLACEHOLDER.format("10o_OdCwDKCCeN3uatN9P4RNBh0xx-yde"),
-"preterm": DRIVE_LINK_PLACEHOLDER.format("1bsd3PJDs9AEMwyEh77CKRXHzsjHcAJzP"),
-"ribs": DRIVE_LINK_PLACEHOLDER.format("1oYTPdHwKz22BHZ5uMHARoAysXtn-V8hj"),
-"gallstone": DRIVE_LINK_PLACEHOLDER.format("1_aobIUCVU0buFCmUxI3U_lTPJV2O_L2K"),
-"vitamin b6": DRIVE_LINK_PLACEHOLDER.format("1J6KS-nc6NtiGqDoB0PIGyLpFubNtMpBU"),
-"vitamin k1": DRIVE_LINK_PLACEHOLDER.format("1hfUCZgQjRWz63rK0AVqqXl7VmjtInSAM"),
-"nostril": DRIVE_LINK_PLACEHOLDER.format("1KERHrY7R0TNwBj11ljPEq_3XVXkORUZi"),
-"farsightedness": DRIVE_LINK_PLACEHOLDER.format("1M_dH6HxDk_ZuK6Slx0uE0amx2QOwakWh"),
-"corn": DRIVE_LINK_PLACEHOLDER.format("1K7Vl2x0edil0CPsl8eGBNbuox71wFZ6c"),
-"phobia": DRIVE_LINK_PLACEHOLDER.format("1zgHqUu_clKR6BuynUDOIsy7d41MyJk4r"),
-"seizure": DRIVE_LINK_PLACEHOLDER.format("1WinM9lOgGuqdOeauwlz3fXx-11Nc5jkF"),
-"louse": DRIVE_LINK_PLACEHOLDER.format("1WgZsh6sa4_TbRJ6kzk03Uj2xXG0Ds-Bi"),
-"obesity": DRIVE_LINK_PLACEHOLDER.format("18DvaP93JOtl1-IqbKPx8KxfM61MMQQGZ"),
-"renal pelvis and ureter": DRIVE_LINK_PLACEHOLDER.format("1spK0WFP_5LuDqnRIfmKPpLAfZAppnvsp"),
-"osteoclast in bone": DRIVE_LINK_PLACEHOLDER.format("1_eIkyaCVpKWfOYAIyPgDQQ82bACIeNeX"),
-"choking": DRIVE_LINK_PLACEHOLDER.format("1mXJ0RMgrxptvFmZ6ARXEPtW_vMVIABmJ"),
-"syphilis": DRIVE_LINK_PLACEHOLDER.format("1EQwwnv3bmAvt5-CpMA-lh7zeyBMYlzgO"),
-"german measles rubella": DRIVE_LINK_PLACEHOLDER.format("14zW_1YCaiCIbSScclG7caC3iKCrYXGNr"),
-"relaxant": DRIVE_LINK_PLACEHOLDER.format("1Cu3Qzfxjbs1Z34ukZDYpEH1vkTkbScB0"),
-"cardiovascular medicine": DRIVE_LINK_PLACEHOLDER.format("1yQda0dhBKiRbxOY6DbUP5Fhe3f-La3-1"),
-"ureter": DRIVE_LINK_PLACEHOLDER.format("1HdQj9yi8-rxPEkQ-eWz9NNQYs7P64CYe"),
-"tumors": DRIVE_LINK_PLACEHOLDER.format("1PFw1OnViWU7AHCuMg7E4wBwBzo_SN7Vm"),
-"human nutrition": DRIVE_LINK_PLACEHOLDER.format("1KIElhFbUg9K-pWfZc3pquh8f-GVpDqMy"),
-"essential dietary minerals": DRIVE_LINK_PLACEHOLDER.format("12GQM87XpVxTk_hIx9mQwNzqSG3a4OO_G"),
-"heart attack": DRIVE_LINK_PLACEHOLDER.format("1AQ3YKeDXz2ZyltLa9dGyYDUJuHjXf23Y"),
-"embryo": DRIVE_LINK_PLACEHOLDER.format("1d0PPNpAEYe5r8hhaxi3AbaAaiXG2LYdV"),
-"chronic kidney": DRIVE_LINK_PLACEHOLDER.format("1WBCUlDjpOUivpAa4FTVw4nspX3st7DsI"),
-"bronchitis": DRIVE_LINK_PLACEHOLDER.format("1xaJj7L8oehOp3IABwjzo5BWwMtKAN0RF"),
-"toothache": DRIVE_LINK_PLACEHOLDER.format("1qu7PA0OTrTaqMk5p1LP_pbme4kJOr6eV"),
-"nasal cavity": DRIVE_LINK_PLACEHOLDER.format("1x3L2x0waVxK3jGqL3wITRxUhg_BSeYpi"),
-"vaccination": DRIVE_LINK_PLACEHOLDER.format("1QEv_ltmwowZ7LxJEULdp3DlyDnvrH4eI"),
-"squamous cell carcinoma": DRIVE_LINK_PLACEHOLDER.format("1f_4Z89Qj6ki9uKf634ngW2LYOfHoUkeY"),
-"skin cancer": DRIVE_LINK_PLACEHOLDER.format("1f_4Z89Qj6ki9uKf634ngW2LYOfHoUkeY"),
-"baldness": DRIVE_LINK_PLACEHOLDER.format("1kj-i5iG9d3Rhu06D0rdBY__0dRZHvMez"),
-"diabetic": DRIVE_LINK_PLACEHOLDER.format("1DZn4vi9jlgeAFSJJbyOk607b0PFXR7U9"),
-"prostate": DRIVE_LINK_PLACEHOLDER.format("168uRm4v_odM_4ddFfSGadytqy2r6cxyZ"),
-"antitussive": DRIVE_LINK_PLACEHOLDER.format("1LMyJuRiqkhuRq0RUlCVcY41OQ19YgDNr"),
-"caesaerian section set": DRIVE_LINK_PLACEHOLDER.format("1MA23t_6eYG7zDGVsCBlSZ90s68_XQizj"),
-"purulent": DRIVE_LINK_PLACEHOLDER.format("18b9sy93YjD9d5cofe4VJrc_gl40G406n"),
-"cancer": DRIVE_LINK_PLACEHOLDER.format("1JQql3vVm8RpJo4WMB4yP5dWs-8-GrSyV"),
-"tablet": DRIVE_LINK_PLACEHOLDER.format("1wqmlWCKkmpHa2JdYbrBMVOJNQKY9RCly"),
-"contraceptive": DRIVE_LINK_PLACEHOLDER.format("1ZkVnLbVvdfFNMnEBbizAyCAWhjmSHaIA"),
-"abstinence": DRIVE_LINK_PLACEHOLDER.format("1LrbQ3_n73RwLSdARB7GaRUmKYlA9nGNd"),
-"measles virus": DRIVE_LINK_PLACEHOLDER.format("1acmcHY5XH8ZdaLfnzRIotVkVZNTY6jFG"),
-"prickly heat": DRIVE_LINK_PLACEHOLDER.format("1z9oXjhrmmnI-WlKuzaqrOrWYGt1y02iS"),
-"achilles tendon": DRIVE_LINK_PLACEHOLDER.format("1VKTW2zIIwSIrYXLGT0I4rNg4SbGkiEvg"),
-"eyebrow": DRIVE_LINK_PLACEHOLDER.format("1EKmQ1XBNmmrhC7GnWUxDXXYODt4OIIyG"),
-"thyroid hormone": DRIVE_LINK_PLACEHOLDER.format("1tbxWkqmIyPTMvqRyGNTMsP62nMjpbPMT"),
-"breast cancer": DRIVE_LINK_PLACEHOLDER.format("1cd2mAeJEqMH-a0xzuCche_-qjzWkUQ-v"),
-"telespectomy set": DRIVE_LINK_PLACEHOLDER.format("1x_v5E4lzCpVes_dIgZXkuK8Llsjz5xG0"),
-"hyperthyroidism": DRIVE_LINK_PLACEHOLDER.format("1ZIW74eVaektw1X4ZqWvbh1sA4GA-JAFi"),
-"phlegm": DRIVE_LINK_PLACEHOLDER.format("1oK1cs1pEP058dQgN6ilztFzogAsrfL5r"),
-"forceps": DRIVE_LINK_PLACEHOLDER.format("1mygV9usCyx9I3nP1k6PM7kqThRQVSUUd"),
-"x ray safe light": DRIVE_LINK_PLACEHOLDER.format("1lZEzC1JUUDfG2uV2vEoTCX-nLzPY3uBs"),
-"maxilla": DRIVE_LINK_PLACEHOLDER.format("1wJK0iaHu6dhiGZdwalhzEznsjROO5XX-"),
-"calf": DRIVE_LINK_PLACEHOLDER.format("1eGyrpEa4gvWpv1lthM5b_Je6N93WiquB"),
-"fetus": DRIVE_LINK_PLACEHOLDER.format("1MfkX1XlDEjH17tr-0h2AjzItCroc4M9e"),
-"first aid": DRIVE_LINK_PLACEHOLDER.format("15eVKocsSxGb_6F3pnrIILz8OpjVjILsr"),
-"dysphagia": DRIVE_LINK_PLACEHOLDER.format("14bZekSBtuNa3VheR6r37G8eR5yyYBjny"),
-"herniated intervertebral": DRIVE_LINK_PLACEHOLDER.format("1Z3YmyK5k6EAcAbj9SlP70nwBEmUaM8Sa"),
-"hypoxia": DRIVE_LINK_PLACEHOLDER.format("18CAIONAL-XmHXkueYDqfvYk2_Ul9omJR"),
-"index finger": DRIVE_LINK_PLACEHOLDER.format("1fQUyNmB1MZMweCvGOZz99VAtJI8kaZz-"),
-"urologist": DRIVE_LINK_PLACEHOLDER.format("1NaYvPOXtn7kkI0faNgbEHyb654uEKxu7"),
-"dehydration": DRIVE_LINK_PLACEHOLDER.format("1xJ0ydvPAZSP0L9O00y7r4gj3v3yXmY-C"),
-"anitibiotic": DRIVE_LINK_PLACEHOLDER.format("1U8y9kzZRGbDg7gtfJi_hSoQjzhaPcYwX"),
-"x-ray": DRIVE_LINK_PLACEHOLDER.format("1ZQ3O59IJK9tDULTFSOczfSYzUnpP0nFc"),
-"hypotension": DRIVE_LINK_PLACEHOLDER.format("1mcxSTTrPopSklOYkAiT8O_8qvoevjXNV"),
-"bile": DRIVE_LINK_PLACEHOLDER.format("1KmRUlwp2bBv1b3WoYGtDFRt8xsutnm5B"),
-"implant": DRIVE_LINK_PLACEHOLDER.format("1AQ6JCco1_mhN96hLX1HTOrOSERbH-ZcG"),
-"gonorrhea": DRIVE_LINK_PLACEHOLDER.format("1r4nyUTLJCwGsgbgYuK_OpbOTTzMXMe0f"),
-"calamine": DRIVE_LINK_PLACEHOLDER.format("1UFI_JXFkUdCk2sCjHn6gutWJGaIXiiJB"),
-"buttocks backside": DRIVE_LINK_PLACEHOLDER.format("1t_Xib2wm2aqFk-sd_g02fafKFPucMvKI"),
-"deafness": DRIVE_LINK_PLACEHOLDER.format("18CPpK9ZDNyUKwqc1Gda8wZAz4QrOO8DH"),
-"hemoglobin": DRIVE_LINK_PLACEHOLDER.format("1J3J_-QoE863OwrhtZZ-iEP4XSYZ_U6-6"),
-"weighing scale": DRIVE_LINK_PLACEHOLDER.format("10bZfBWDPYkY7c-aOdaDDPpNCSM_Xq_8A"),
-"asphyxia": DRIVE_LINK_PLACEHOLDER.format("1uTrre4NepKcNtuyoU-DS8FgSQ9XKaoOz"),
-"cheek": DRIVE_LINK_PLACEHOLDER.format("1VjYnyBFNV_YZ2soqApQb9PBeDudXRb2s"),
-"trial lens": DRIVE_LINK_PLACEHOLDER.format("1blRmvWl5i5i1SrZ0VkhnhdZ83HKysNno"),
-"meibomian gland": DRIVE_LINK_PLACEHOLDER.format("1_w5Agw4GQZZRGj_s2eCe7I0x9FFo8Qt3"),
-"quarantine": DRIVE_LINK_PLACEHOLDER.format("1Np92VI7hp0YqUsBwYW9pVUM5ZltjEvZJ"),
-"antiperspirant": DRIVE_LINK_PLACEHOLDER.format("1f6Q63fmYXx-gxTFGt_gp6sV2qmbriph8"),
-"asthma": DRIVE_LINK_PLACEHOLDER.format("1dMCJ4A4fF-NUI18JfMFbPR5WzY-dNNIM"),
-"eyedrops": DRIVE_LINK_PLACEHOLDER.format("1jlDtjdqzKa3YgRZQe-BmkMlnL2vLsk-G"),
-"pimple": DRIVE_LINK_PLACEHOLDER.format("1iSY8PZMdPylwjKUZjiorAkodfhEwncI3"),
-"psoriasis": DRIVE_LINK_PLACEHOLDER.format("1PrwgAcwJsW1ZY4DQ8cuQQBRz5CbuzMiM"),
-"ward": DRIVE_LINK_PLACEHOLDER.format("150CWGcGp-MIR0pdz7UbDOv60kM8myoxJ"),
-"automatic film processor": DRIVE_LINK_PLACEHOLDER.format("18m5owvJIB2-xHWvoltd1lpe5s7P698qP"),
-"encephalitis": DRIVE_LINK_PLACEHOLDER.format("1HN_1kwaMrlRZSTrqfcrRmWreG2bOFMCS"),
-"blood cells": DRIVE_LINK_PLACEHOLDER.format("1FWJLm8B-uxvPIDRAcjLjBLet9OrdYJOy"),
-"birth contral pill": DRIVE_LINK_PLACEHOLDER.format("1RffLOuwYt1DT2yqDjAU2ZC2EL7ZD3Kbt"),
-"blood infusion set": DRIVE_LINK_PLACEHOLDER.format("1EvMTfvBC1-N7aNxbZviCdn8s0ca8XKW7"),
-"shoulder": DRIVE_LINK_PLACEHOLDER.format("1ZGvSK2GgwRXs8wHUKLryaWke4HsPHbhm"),
-"astrocytoma childhood cerebellar": DRIVE_LINK_PLACEHOLDER.format("1au2FpIbRvf7U1Y73x8yDkd-kEX-ZnWf1"),
-"urethra": DRIVE_LINK_PLACEHOLDER.format("1fHbQu_hp9SslewKpbM4SkHzvxwOQsBUH"),
-"adipose cells": DRIVE_LINK_PLACEHOLDER.format("1LsveBD0Ww_TmqPPQaAND0Fp7Z7ExyfAT"),
-"spasm": DRIVE_LINK_PLACEHOLDER.format("12_CLNQ_p6sdcQqo53Joz8HOIT0UoGev2"),
-"cervical traction": DRIVE_LINK_PLACEHOLDER.format("1Z5RuP86sjGCh-6gcnzt1VHL3VnFB2knK"),
-"trolley dressing": DRIVE_LINK_PLACEHOLDER.format("1gIb13JAt21ToI4Dxgl7ZaSRFhoQ-0ola"),
-"paranasal sinus and nasal cavity cancer": DRIVE_LINK_PLACEHOLDER.format("16fryRxK8FrjfSMcLv-CoTsU9_c84sf3H"),
-"coma": DRIVE_LINK_PLACEHOLDER.format("1Giq5neKnHj-XISrYO_CwGql4gozhUb1g"),
-"kidney": DRIVE_LINK_PLACEHOLDER.format("1GI-XUCAR-XTRfGoUmJzZCm-c3rcIlb38"),
-"headache": DRIVE_LINK_PLACEHOLDER.format("14xQO4IHmRakRECE7QrprKGDTSYd39WVq"),
-"amalgam": DRIVE_LINK_PLACEHOLDER.format("1rSJN1vGULdZF8cZ6PvX2fGwGk6v8Q4Qw"),
-"granulation": DRIVE_LINK_PLACEHOLDER.format("171LnG49paUNnulEDc1b78DYPLK_vKXxN"),
-"bifocal": DRIVE_LINK_PLACEHOLDER.format("1XMtVbkRfINnntOftYM1UBOzutNH1IrE3"),
-"kidney disease": DRIVE_LINK_PLACEHOLDER.format("1ADCT4NC1YyDP4nlI31kbsSsBK0Gl6AhX"),
-"crash cart": DRIVE_LINK_PLACEHOLDER.format("1Z1QhSmboElDIm6-LPHIKnbaR-p2veUsQ"),
-"hemophilia": DRIVE_LINK_PLACEHOLDER.format("1aJB-o37KzKqXHPSDwE0emN68K5rmg4dv"),
-"chickenpox": DRIVE_LINK_PLACEHOLDER.format("1pbWmJmsOMWptsTbc3j7Yr_7ZfV8tsLtB"),
-"addict": DRIVE_LINK_PLACEHOLDER.format("1lFHSODvVZWUOtux3EmptoqATBpNvWewz"),
-"steroid": DRIVE_LINK_PLACEHOLDER.format("1sBPUzwu-Aq0P_vpTO-4CEW7zvPfUniwa"),
-"proteinuria": DRIVE_LINK_PLACEHOLDER.format("1WU2XxZ8ASNRz3Dib6JSTkTOTvisXaxF7"),
-"pneumonia": DRIVE_LINK_PLACEHOLDER.format("11WA-ejPKX9MzWo3K8qgdoQZcEg5253KX"),
-"spine backbone": DRIVE_LINK_PLACEHOLDER.format("1M35hT0y0IYrWjBdJmVnTx6Nxj2uBwiJH"),
-"electrolysis": DRIVE_LINK_PLACEHOLDER.format("1Tb6pmoKQzyvPvDKlO6_xaCqeHnozwfUQ"),
-"adulteration": DRIVE_LINK_PLACEHOLDER.format("1Wng48rOLvJR-4GipiDd-a307VDMpmygI"),
-"nauseous": DRIVE_LINK_PLACEHOLDER.format("1empzZzl0EStviRsUn5bC3u1Rc39VxWqC"),
-"influenza flu": DRIVE_LINK_PLACEHOLDER.format("1LnXejY3B2Dc8zxkwGWkfbkzO6Ksi-0xo"),
-"dressing": DRIVE_LINK_PLACEHOLDER.format("1UOpL5ENkm7fU_Fsdq7d8ZjnDTixvR6-d"),
-"calcium": DRIVE_LINK_PLACEHOLDER.format("1urVKh5WXqOvdaSI2L0SRJqjNBM-sswAe"),
-"infection": DRIVE_LINK_PLACEHOLDER.format("19b25lKEwXTLqvwT0wWBeXkwUpZRXlQvG"),
-"nervous system": DRIVE_LINK_PLACEHOLDER.format("1jfm_UFK7ePOPY-jy9IpRiM-o5rqphodn"),
-"abdomen": DRIVE_LINK_PLACEHOLDER.format("1z1QxPuAep1-pSDcli0zUulE0AA2xcvkC"),
-"cornea": DRIVE_LINK_PLACEHOLDER.format("1vBzMxhWLsJ4nV5QNsKjqEiTI8QoCFfeS"),
-"aspiration": DRIVE_LINK_PLACEHOLDER.format("1Opo9dNemnzlfDHW_MNLL8g0A10wWkzy1"),
-"antidepressant": DRIVE_LINK_PLACEHOLDER.format("18Qw5Sql8KmgtgrGUqqZjqf3FWsNLCkvV"),
-"herpes": DRIVE_LINK_PLACEHOLDER.format("1JGrhG7Zo7I72KKofrPyDEXEy47vTbqkt"),
-"heartbeat": DRIVE_LINK_PLACEHOLDER.format("17evjoNSW8SG2I2THxazCivnS1IKK_Z62"),
-"bronchoscopy": DRIVE_LINK_PLACEHOLDER.format("1joXIjpag1QWpsE-hfKP9MVUD98dnuSMN"),
-"salivary gland": DRIVE_LINK_PLACEHOLDER.format("1j3zilnr0lXTT4GTGTi5N1WKOjQQBv9yF"),
-"exerciser mirror": DRIVE_LINK_PLACEHOLDER.format("1SBwgJ2twxkHeMhogq60y3heMEchwcaHb"),
-"mania": DRIVE_LINK_PLACEHOLDER.format("1g6BsIYWKvWfCiOEeq6weIkuy2cZf0ro7"),
-"pharyngitis": DRIVE_LINK_PLACEHOLDER.format("1yHEqu8fI2x6H-xgZTlIy9THS6LuYp5Cc"),
-"thyroxine": DRIVE_LINK_PLACEHOLDER.format("1RzPYjxjRQW2jsAWgWq11WzOwrGHeTWol"),
-"quadriplegia": DRIVE_LINK_PLACEHOLDER.format("1iHquyj2jiEWcSNRQKcMkL3UYzybgSQQ6"),
-"central nervous system": DRIVE_LINK_PLACEHOLDER.format("1MW1H9k9MjlmEQA4cHJn5Oraso_njUqKS"),
-"belly button": DRIVE_LINK_PLACEHOLDER.format("1vJ2BL4sVAzaZMCM3RihYLCXEQt3CAcTt"),
-"third finger": DRIVE_LINK_PLACEHOLDER.format("1LR-qp88fJY71rPbP6gbN8-4qLd3QCctm"),
-"petechiae": DRIVE_LINK_PLACEHOLDER.format("1FGxw_bh_412Bjs2shXsrBoz35IU8-61c"),
-"dementia": DRIVE_LINK_PLACEHOLDER.format("1GGkLzFzuBzjizJjjM_z_pNTYAnKZI5fY"),
-"ultrasonic scalar": DRIVE_LINK_PLACEHOLDER.format("15mJgO28OyoJH_t_4tD8ClBDfO4sO9pio"),
-"colic": DRIVE_LINK_PLACEHOLDER.format("18lILeH8QjpVZPT9S8zfkJWZTJf3MHsZ7"),
-"herps virus": DRIVE_LINK_PLACEHOLDER.format("12o_ujF7Wl0OANeclDjSqKoGSB6oGbup1"),
-"mammary gland": DRIVE_LINK_PLACEHOLDER.format("1GsKR1WTQp9EkrTV6WJfZz3ySJerRFN1K"),
-"hypothalamus": DRIVE_LINK_PLACEHOLDER.format("1uemYx6FNOqaPoLXG-kpptJW8GhJ1oJB9"),
-"aspirin": DRIVE_LINK_PLACEHOLDER.format("1kstitGdTPJshTA6PEJJLlJiI8dCyzhlc"),
-"laryngitis": DRIVE_LINK_PLACEHOLDER.format("1E0KfZ_lIlb5QrjXKyicnCJZ3qugCr16d"),
-"mumps": DRIVE_LINK_PLACEHOLDER.format("10hMLMkwLFL-6jXbN21po4UmhUkMxMTZM"),
-"symptom": DRIVE_LINK_PLACEHOLDER.format("1NWRPbaVE6oz0OWc7ufSVGGyIZcCClO28"),
-"vaccine transport box": DRIVE_LINK_PLACEHOLDER.format("1Qyz1xg1ClKgCGBvpCgQsbAMr6W1dP9pU"),
-"liver cancer": DRIVE_LINK_PLACEHOLDER.format("1yFoV8lLZhNKkuRXdQdG0WptEhvsXKDuQ"),
-"binge eating": DRIVE_LINK_PLACEHOLDER.format("1uqoszfgDuYXGn61Ej6fMufUyiZsJsuTl"),
-"x-ray viewer": DRIVE_LINK_PLACEHOLDER.format("1h_cCo5Lj7sknpwZcIjbRJqdsyrZNCxla"),
-"through": DRIVE_LINK_PLACEHOLDER.format("1iAxDloQpu5LNdAz9i3qgRYHmvjpARzzO"),
-"via": DRIVE_LINK_PLACEHOLDER.format("1iAxDloQpu5LNdAz9i3qgRYHmvjpARzzO"),
-"erythrocyte red blood cell": DRIVE_LINK_PLACEHOLDER.format("1AT7h5s4Td31BEwwKtkQwF6jq49g_5ZPr"),
-"sunscreen": DRIVE_LINK_PLACEHOLDER.format("1P9ieKJROSt0VsWGGhhheNUvtm9yMsQoV"),
-"aorta": DRIVE_LINK_PLACEHOLDER.format("1cfunKJpEsn0BpKExfRhAwoB4Vlg8W8fv"),
-"bleeding disorders": DRIVE_LINK_PLACEHOLDER.format("1OHRaeGlOUgxohyJu_0scQe-st36Ol_7C"),
-"urinary tract infection": DRIVE_LINK_PLACEHOLDER.format("1TxX6g0e0i51Xcn5aPWYR_juIEDjvzDLL"),
-"eardrops": DRIVE_LINK_PLACEHOLDER.format("1HKXEjNKHcogLVZ5UHBTuZZKYGTJXh_iI"),
-"anus": DRIVE_LINK_PLACEHOLDER.format("1bDxoP_3QVLE-P-Sva-Opgj3pE7SGDK55"),
-"tooth": DRIVE_LINK_PLACEHOLDER.format("1XLOuqBEoclVZqfz5kSZsa2o2wgczdc6Y"),
-"kidney cancer renal cell": DRIVE_LINK_PLACEHOLDER.format("1ziPFuvlxcUkZhtuGqrFZQbHfCfpdc4Aq"),
-"developmental delay": DRIVE_LINK_PLACEHOLDER.format("1EScaPvUGYex7Jwjbc7aiCSJYyrVlwNrO"),
-"eyelash": DRIVE_LINK_PLACEHOLDER.format("1pudu24SKw5Se487bxVYEe7jsjEaVq2aj"),
-"birth defect": DRIVE_LINK_PLACEHOLDER.format("1xUwVv6adtM01Ey7t4cuEa2aa9imSs1O2"),
-"scapula": DRIVE_LINK_PLACEHOLDER.format("1wUO77VRSFmpqdokOoVxumHmoRVSdVMI2"),
-"thyroid glands": DRIVE_LINK_PLACEHOLDER.format("1Yd2iuHUgYBtpeLn8sO-aebLKtfs-o1Nl"),
-"throat cancer": DRIVE_LINK_PLACEHOLDER.format("1g8KB4F9El4wkyEoYYMglhmouAapNk2TO"),
-"presbyopia": DRIVE_LINK_PLACEHOLDER.format("1-8lSWvdfgkzHEEWkzt94rJd_zMegm-Dl"),
-"anoxia": DRIVE_LINK_PLACEHOLDER.format("1EUVtyHSp7ND8FOMrJVLEPAV-MRsCXFpz"),
-"vitamin b12": DRIVE_LINK_PLACEHOLDER.format("1VmJ9GVnMTeReVjnV6kJ0ZndxuKikui_8"),
-"thumb": DRIVE_LINK_PLACEHOLDER.format("1rWJWOE9gxWE9pJvdYjO1ji9gAtGTgYRz"),
-"concussion": DRIVE_LINK_PLACEHOLDER.format("1lD_hnLANmuTDm3zx4-u1UyLA_BGWztu_"),
-"sinusitis": DRIVE_LINK_PLACEHOLDER.format("1HNAaPNfF5UNjL_XhTZdsyZHDq5v4eTb-"),
-"little toe": DRIVE_LINK_PLACEHOLDER.format("1IfrbDQ19KwRJUPxMdbIKbsJHFQtOiM2e"),
-"saliva": DRIVE_LINK_PLACEHOLDER.format("1BH6x6W6Rli5D_W8cgrkeEFD9gVkXIhyj"),
-"sepsis": DRIVE_LINK_PLACEHOLDER.format("18loLQmhO4TV3IuNe0Gyi3kUzDeVbae-L"),
-"cartilage cells chondrocytes": DRIVE_LINK_PLACEHOLDER.format("1WS3fpLFT9lu6HzeBXIsDH-oU6sNQdfJr"),
-"shigella dysenterie": DRIVE_LINK_PLACEHOLDER.format("1iR4VjLDa2r2aWsOnfuPDhvDcXOFilW--"),
-"penile cancer": DRIVE_LINK_PLACEHOLDER.format("15UaatQ_tk1mUVdRXF5Zk6FQe6-V9_a47"),
-"syringe": DRIVE_LINK_PLACEHOLDER.format("1Fe_bZH1kYRGq10KhgIKI3ZcURYbF2AC-"),
-"synovial fluid": DRIVE_LINK_PLACEHOLDER.format("1ZWQntW-A4FYDrCjEcjVC20ew1aFPDIk9"),
-"fibula": DRIVE_LINK_PLACEHOLDER.format("1kkDOyLW3XWY9grtjhDwg9gUwid23PjvX"),
-"chronic illness": DRIVE_LINK_PLACEHOLDER.format("10V1USJwUDC5vHsJfcYmYnrN4vBxAEqwY"),
-"anesthetic": DRIVE_LINK_PLACEHOLDER.format("1HhU-3eJg5IGdN-H8TOU8nAmX9yDtuVeN"),
-"endocrine system": DRIVE_LINK_PLACEHOLDER.format("1ocUmgphbbXA3ai2ehU623aDfBchQcJJe"),
-"pinna": DRIVE_LINK_PLACEHOLDER.format("12_mqZ9asJGKM6MaBbDjdoisxi6wT584R"),
-"backache": DRIVE_LINK_PLACEHOLDER.format("1YpN-CcpmiEQ1jS_qXDFPkSlzHFIIprCD"),
-"bronchial tumors": DRIVE_LINK_PLACEHOLDER.format("1xO1ija4pp8oIdCEwoL9UbxHmwRL81UNu"),
-"constipation": DRIVE_LINK_PLACEHOLDER.format("14QVOofxjhel13VbdUPapPtxM3TYGNeNf"),
-"tuberculosis": DRIVE_LINK_PLACEHOLDER.format("10AFkMcC4lmgrk-nj6mcPGhO0yA8o6hA5"),
-"vaginal cancer": DRIVE_LINK_PLACEHOLDER.format("1aC2py8agO4kA_ScYPdmubvBCuPPbAv9K"),
-"brain stem glioma": DRIVE_LINK_PLACEHOLDER.format("1qwe8UyuIQvFXwyUPxvaXASVhCsNtR4_E"),
-"muscular dystrophy": DRIVE_LINK_PLACEHOLDER.format("1hLcK7biiU-LOmSJbQHwHhf6nXsBjhFof"),
-"paranasal sinus": DRIVE_LINK_PLACEHOLDER.format("1my2VtH-9YVC7z-7NxyPXyJOGmQTTeIIW"),
-"infertility": DRIVE_LINK_PLACEHOLDER.format("1x4qpOYkHZd0_HrpajHnCLRngic2mhAos"),
-"liver": DRIVE_LINK_PLACEHOLDER.format("1ks5yTLU0qw2zKkaFWLixUWEAWzbdCwjl"),
-"dysuria": DRIVE_LINK_PLACEHOLDER.format("1JUqQBwMGfzsyvNTUBXaCFn6rn0_cP2qC"),
-"tachycardia": DRIVE_LINK_PLACEHOLDER.format("10ikaNlh5CFis6yzs4XLAygzpuxEzeOm2"),
-"vitamin": DRIVE_LINK_PLACEHOLDER.format("1-KB5hcQNoJuuzBvLe7RThkMgAYBGnXHW"),
-"joint": DRIVE_LINK_PLACEHOLDER.format("1X1PPB2u0WAV8q_seo9kXBzt2HaWZWgl7"),
-"conjunctiva": DRIVE_LINK_PLACEHOLDER.format("1_kYgKN8Ncf0iAbf7kFQijzr2DdDRAszj"),
-"tonsil": DRIVE_LINK_PLACEHOLDER.format("1-5J90UX6B9nawt8UTcQb2ek4sHAzBQ9J"),
-"eardrum": DRIVE_LINK_PLACEHOLDER.format("17Lo_0nzrXsoXlCZKLV3sookMjlmJAorY"),
-"vitamin b1": DRIVE_LINK_PLACEHOLDER.format("1Kt9G2_yxBTZlp1OlHA4z822XiCYzyDLb"),
-"cervix": DRIVE_LINK_PLACEHOLDER.format("1lALTK6fDHgRZLQGxS4eB3ioklV4j8F5C"),
-"spinal cord injury": DRIVE_LINK_PLACEHOLDER.format("1E5h4UALxAIEPspUewnybGjsUJnyMC9-O"),
-"vitamin c": DRIVE_LINK_PLACEHOLDER.format("13aNaVKpuHMedv157KE5z_4ZBSOCfH4AZ"),
-"small intestine cancer": DRIVE_LINK_PLACEHOLDER.format("1KVH7Yp_ytkHFbQtR7uVDGAe4eaOdJUB0"),
-"sleep apnea": DRIVE_LINK_PLACEHOLDER.format("1euLJ8cwKrKiLv8L-vRw_WJKJ9tR9xUVo"),
-"squint": DRIVE_LINK_PLACEHOLDER.format("1lJPqwXOjI_8sgjZZ8gjjXh6U-7dSRfLF"),
-"skeleton": DRIVE_LINK_PLACEHOLDER.format("1z50QRv1k8O0SEOK1XHTBxVZslQUkCNAf"),
-"dyselxia": DRIVE_LINK_PLACEHOLDER.format("13fYd1-t12kumcFQ4CDPtM9NwSPugQ_Bx"),
-"trachea": DRIVE_LINK_PLACEHOLDER.format("1GQ6IAfqTl_3gdmHLDqcCgzAaaifE6NZe"),
-"empyema": DRIVE_LINK_PLACEHOLDER.format("14suQkX7TL1RwLxGoDf0z1-4Prwq8Cwir"),
-"thymus gland": DRIVE_LINK_PLACEHOLDER.format("1uqqV0EVlq66or3LKB_IS2qBixrWEG9pf"),
-"earlobe": DRIVE_LINK_PLACEHOLDER.format("1Sl2JSZS0HsMB_qNmDiLn2RB65fZOjBfv"),
-"clavicle": DRIVE_LINK_PLACEHOLDER.format("18yn1j_vuuPLVH0Oowknd97FwIR5u4FRH"),
-"heart block": DRIVE_LINK_PLACEHOLDER.format("1C6mYCnUfIza7F7CY8dvcZI4KuUOuZDcC"),
-"stomach gastric cancer": DRIVE_LINK_PLACEHOLDER.format("1omX6dkpY_jkanCOg02nboVFGKdg3Wrrp"),
-"gout": DRIVE_LINK_PLACEHOLDER.format("1YE1FR_Z7gmUOKGjYcjJK9Oc2rHdj3AW_"),
-"stethoscope": DRIVE_LINK_PLACEHOLDER.format("1C2U8ovqhtgjnQsHgOp5hnQht6RuiNTZe"),
-"stimulator": DRIVE_LINK_PLACEHOLDER.format("1agP9FpN3xCMFvAafVu_Oa09VIbFgVQCi"),
-"callus": DRIVE_LINK_PLACEHOLDER.format("1_UG57NQdRwvJ6i7ApqI505K-aRUdxKES"),
-"vision loss and blindness": DRIVE_LINK_PLACEHOLDER.format("10EmC1uX6AVhWCxVGMYzmG7roft8catOO"),
-"stroke": DRIVE_LINK_PLACEHOLDER.format("1H0r1RnxDo0Gs-XUi772cFEqgeuURUMz7"),
-"paralysis": DRIVE_LINK_PLACEHOLDER.format("15aIWLX8d4iiX96Ob5VVGg2jwn3yqvtuB"),
-"spondylitis": DRIVE_LINK_PLACEHOLDER.format("1YnjRRO6EZubDSqbuztJTL1gXdqKdFZZc"),
-"sterilising drum": DRIVE_LINK_PLACEHOLDER.format("1ji0ISvZODrhIiIpukhPpoUFZcawf1QWA"),
-"vocal cord": DRIVE_LINK_PLACEHOLDER.format("1AsE3jWIluBkzz-_ngqyfWQtMq3U-TpSU"),
-"poliovirus vaccine inactivated": DRIVE_LINK_PLACEHOLDER.format("1yT8eN69KNLaQb0GCP-wzklwtSe_GwTDp"),
-"wax knife": DRIVE_LINK_PLACEHOLDER.format("1GlYMwwweOv3QEELlksHN39-3cx-3QepJ"),
-"hip bone": DRIVE_LINK_PLACEHOLDER.format("1B1uNVlP1zOKqW12VGgVTKimUMCPSa7dN"),
-"carciogen": DRIVE_LINK_PLACEHOLDER.format("1GQwaXauXdih9QC_ufC-oY1-0r3Yd-jxq"),
-"leprosy": DRIVE_LINK_PLACEHOLDER.format("10_bIuWe8bnaK1rQIX6lmrypSb62lLyN-"),
-"pneumatic ear speculum": DRIVE_LINK_PLACEHOLDER.format("1w7kzfpgmP43trCVR8GQBmw8mq21lWIai"),
-"flatfoot": DRIVE_LINK_PLACEHOLDER.format("1cctRWYaG3lp9DmQjepkwLLjACTb_-74F"),
-"tuning fork": DRIVE_LINK_PLACEHOLDER.format("1ZwAfK5yYjCuBElzYIsGKGROTyMx9uNAJ"),
-"breast": DRIVE_LINK_PLACEHOLDER.format("1ioVj-9ysHMOqcpN-wFAYltCNtZ8qN80K"),
-"flatulence": DRIVE_LINK_PLACEHOLDER.format("1Ez03i3InRfj4by1Ms5gw06wx7O36tGon"),
-"migraine": DRIVE_LINK_PLACEHOLDER.format("1pXicUF9JMGEcWR9uawvCK-zmfoIm_1zv"),
-"suntan": DRIVE_LINK_PLACEHOLDER.format("1emAYKUIK52fUwi8tuhWcwv9dl4E0QPV_"),
-"palpitation": DRIVE_LINK_PLACEHOLDER.format("1QTLGJofrh4P36vB46wX0sRA6fPo7scVZ"),
-"esophagus": DRIVE_LINK_PLACEHOLDER.format("1OOXdfJlCBueh64w7BCd5hg9mRpqcojPH"),
-"enamel": DRIVE_LINK_PLACEHOLDER.format("1BY6xK2JPtP4jo9gkckuo5VMk4F-It14-"),
-"lunula": DRIVE_LINK_PLACEHOLDER.format("1nMZJN0ekzdS79Kl6wVXLmQaT7epqKNMA"),
-"surform": DRIVE_LINK_PLACEHOLDER.format("1Y1-3mgEzSEcd4ydltQERzJjPHToUfgj2"),
-"tablet counter": DRIVE_LINK_PLACEHOLDER.format("1CG5lqJ0iaKkgYMQC-SzL13FNtSugcE30"),
-"tympanometer": DRIVE_LINK_PLACEHOLDER.format("1qDGPvPgu-MHT5I4rV2MUPLwQ8sRnlWxJ"),
-"ascariasis": DRIVE_LINK_PLACEHOLDER.format("1uyM_nEY_vE706DOMjvJzxd4SqnbUHuR-"),
-"vital signs monitor": DRIVE_LINK_PLACEHOLDER.format("1_LreQuIXeTJfRqjLnb3q_YkEwqMTlvLe"),
-"skin": DRIVE_LINK_PLACEHOLDER.format("1Cl8vW4L0j3UppyGvXPmaSzK1pAV6t-OP"),
-"thrombocytopenia": DRIVE_LINK_PLACEHOLDER.format("1mYEtkIOPjv7sgQ36wXGAYiKxSxM1PONY"),
-"parasite": DRIVE_LINK_PLACEHOLDER.format("1MbDjc6QAq-USMqG7_-ZVHw2l7049XojX"),
-"tinnitus": DRIVE_LINK_PLACEHOLDER.format("1cZ0AIsK9xVuOktJEDe7UOrqJJtNrmlYW"),
-"hook worm disease": DRIVE_LINK_PLACEHOLDER.format("1v2EAKqEy5e2VD8CE8tXbdfdyv38Zs3pq"),
-"bladder cancer": DRIVE_LINK_PLACEHOLDER.format("1kHpzMI-voPSEwvmM4fH4uECQyq6YZN1L"),
-"veterinary technologist": DRIVE_LINK_PLACEHOLDER.format("101OUrmfAPYsaDnD_1RrmAuLP6PTUcuU0"),
-"vertebra": DRIVE_LINK_PLACEHOLDER.format("1pyXj1cFd-XhpqGO2n1-s3QrGYzcUx5V2"),
-"hiv screening machine": DRIVE_LINK_PLACEHOLDER.format("1XdC2lL9VURlLvI-VeIloTt56uSRnBbcC"),
-"eczema": DRIVE_LINK_PLACEHOLDER.format("1FA0oeOr1OIBfMaojpLZsdFMm8XEj9Fju"),
-"cadaver": DRIVE_LINK_PLACEHOLDER.format("1-6wIv48XSeutR4xCoRAvuzHXC1P_3nk_"),
-"bone cells osteocytes": DRIVE_LINK_PLACEHOLDER.format("1ov2yfJHpNWhGwY3l23Q-k9evcwxmSh_U"),
-"attention deficit hyperactivity disorder": DRIVE_LINK_PLACEHOLDER.format("1h4KcFDZDDfYGeUVwOzBRXwqnOO04icgq"),
-"stretcher with iv pole": DRIVE_LINK_PLACEHOLDER.format("1tikGjsUN4VTbQmzbQmH71FWhz0C1xOS_"),
-"large intestine": DRIVE_LINK_PLACEHOLDER.format("1gnQxvViHu2ga24k7EK8DfMs9WqLFD3Pc"),
-"alimentary system": DRIVE_LINK_PLACEHOLDER.format("1V3_J3SzON-y6DALWltNm1wi3RC04y3Pf"),
-"sterilizer": DRIVE_LINK_PLACEHOLDER.format("1zjipojI-zlBtVqjFDadRJw5fD2zyqBS-"),
-"starvation diet example": DRIVE_LINK_PLACEHOLDER.format("1EYJxJApCEz4P6_MCyrDdUUrUNNHoOs07"),
-"bulimia": DRIVE_LINK_PLACEHOLDER.format("1QaxnNay-0_jdj_P7_S9Oy37MOBsQW_Pw"),
-"starvation": DRIVE_LINK_PLACEHOLDER.format("1S0y1mu__Hc_7dDfpBKn7-LdnEE7X_2dt"),
-"forehead": DRIVE_LINK_PLACEHOLDER.format("1W_o_nerVcqxkerumRt0QKbmtxiVSaRXd"),
-"tendon": DRIVE_LINK_PLACEHOLDER.format("14YPxtzy6L0jgjXc4r_q_AW2asoVJm0op"),
-"wartenberg wheel": DRIVE_LINK_PLACEHOLDER.format("1wFUJmv3kdzdIOcntQHdX6Ixgf8BI__9Q"),
-"diplopia": DRIVE_LINK_PLACEHOLDER.format("1jjt1R5v3_Jd7z9EsEI34uncVPgwSGrQU"),
-"ulcers": DRIVE_LINK_PLACEHOLDER.format("15X098FcyAlz7IHWUwl5cVfEXiWM0FI1Y"),
-"pancreas": DRIVE_LINK_PLACEHOLDER.format("1KtbyeHZq0bOWwc5jqkwl0F5lTgYy4jcO"),
-"lacrimal glands": DRIVE_LINK_PLACEHOLDER.format("1kG10W-T9NOTD6DXFzR8kz9dscxc_CBYU"),
-"cardioc arrest": DRIVE_LINK_PLACEHOLDER.format("1alp58g6sNv1a-8VW54ZOAn14Y_ayVIkc"),
-"patella": DRIVE_LINK_PLACEHOLDER.format("19hSmJLKFhN7HD-RLJoZi-7TGNPIyySDD"),
-"causing agent": DRIVE_LINK_PLACEHOLDER.format("1rcU1xWC7s_94APWHIkEHg4SP1AckCo2c"),
-"iris": DRIVE_LINK_PLACEHOLDER.format("1MxTQEwNAVoQN3lPrMwWgh8Ip5DextGhe"),
-"polyuria": DRIVE_LINK_PLACEHOLDER.format("1LA1oD3jmgPEz2OFKAV99SvyoK7RzBwOQ"),
-"big toe": DRIVE_LINK_PLACEHOLDER.format("1ROe1MwhWNV2NA2D-vuJILnMdyfeCLXGv"),
-"anabolic agent": DRIVE_LINK_PLACEHOLDER.format("16Qg1UYTRRUm0iUgdzHm7rN3tXswUXrEe"),
-"palm": DRIVE_LINK_PLACEHOLDER.format("1KGsjueWRQfWec8X3VgAJ1BwwCBMXKA_9"),
-"dwarf": DRIVE_LINK_PLACEHOLDER.format("1IfI2csij_z6xFLnAw1BRHK_c6KygK3wc"),
-"rhino virus": DRIVE_LINK_PLACEHOLDER.format("1B8Z0g-x_-jV7Lc-DhJbHArMGkm3jqC5d"),
-"swab": DRIVE_LINK_PLACEHOLDER.format("1ZtfYkjh7U8VQrUBAsqeBy5QYoclop44p"),
-"heart failure": DRIVE_LINK_PLACEHOLDER.format("1k3B7z993nn4cOKHZ4V5jn_T1F-x5ZZKP"),
-"skin disease lupus": DRIVE_LINK_PLACEHOLDER.format("1jn_vV6qi6SHp6W3-ivZ1NlSwT4VLDoQa"),
-"stethoscope": DRIVE_LINK_PLACEHOLDER.format("1f-DdaCkH9htEHG8UoZ5koG66GtGNtHFv"),
-"uterine sound": DRIVE_LINK_PLACEHOLDER.format("1R1QSYiT4d31mbgJZKrVnX6Tl-K7VG5Ay"),
-"stretcher": DRIVE_LINK_PLACEHOLDER.format("1ohwWAhE5ouxQ-h3EkkhL-6yT6phEaxuK"),
-"parotid gland": DRIVE_LINK_PLACEHOLDER.format("1P9DIiJlMy2CsGk-fc-8mKy2_weQxpGAo"),
-"toxicology": DRIVE_LINK_PLACEHOLDER.format("13JuNWxkC0BTyd7q6yrk_rN81mAuC3dzE"),
-"antimicrobial": DRIVE_LINK_PLACEHOLDER.format("1DJq2YR5Vsv0l5Ex5Y6BoSfhM9eAGjHzo"),
-"suction machine": DRIVE_LINK_PLACEHOLDER.format("1XRriJ4OeZfzyyyZeG03pIuKrF7PFF1t6"),
-"thigh": DRIVE_LINK_PLACEHOLDER.format("1KR6fmLFLjGaRTraPpOtL5MQEq1GHpQvb"),
-"syrup": DRIVE_LINK_PLACEHOLDER.format("1t_AZzKw7iezVa59VecTYOf4IuoERqWgV"),
-"syringe and needle": DRIVE_LINK_PLACEHOLDER.format("1olPwgpw728A9cmpRC3Odr3FrK6KT3XQc"),
-"veterinarian": DRIVE_LINK_PLACEHOLDER.format("13eL1LBmCDLCwL_GY1bPkM5AiXzZdmmPk"),
-"pediatric medicine": DRIVE_LINK_PLACEHOLDER.format("1wp2-MeqYmZ9TeLeTC5-KpBBOH9_cSROM"),
-"lung": DRIVE_LINK_PLACEHOLDER.format("1e8FaYPwEwM19gyHzx9oix0P4ZDD7az6Y"),
-"suture": DRIVE_LINK_PLACEHOLDER.format("1OWoi0uDbI92gIKgKaLOb7udyaZRq_iu3"),
-"antiemetic": DRIVE_LINK_PLACEHOLDER.format("1FLDVFx2toU1tPgrIDS8d8ecU-VQhpj-q"),
-"apocrine sweat glands": DRIVE_LINK_PLACEHOLDER.format("1rA7aN3tVRcgsAGihTg2YwHR1n9ZpMm2I"),
-"antacid": DRIVE_LINK_PLACEHOLDER.format("1R_dM1mJv96LZkHr_1OauPHbvcdRGiNXx"),
-"breastbone sternum": DRIVE_LINK_PLACEHOLDER.format("1rNKP2zXP9qNfc7xXD2YOM7NmD_TXD2D7"),
-"middle finger": DRIVE_LINK_PLACEHOLDER.format("1ALhSwFUE2f-587P7ekc5yp22oQiuJ9gB"),
-"amoxicillin": DRIVE_LINK_PLACEHOLDER.format("1wdVEE6armvS53fQih4Ace4dsdHa4GSDb"),
-"axilla": DRIVE_LINK_PLACEHOLDER.format("1xJnlAlKSQJzpQI9ZSVRXAlIms3YbfajG"),
-"ataxia": DRIVE_LINK_PLACEHOLDER.format("1PQPYsU1cVwVo9kdWguVIK3t5wynqLIQo"),
-"knee": DRIVE_LINK_PLACEHOLDER.format("1knV66Xdrwk4wxfyHxB993UTPdgTN82Wh"),
-"bowel": DRIVE_LINK_PLACEHOLDER.format("1Y00ZU6AqizFASLVzWMnSjwJnW-zVlvxi"),
-"ultrasound unit sonography": DRIVE_LINK_PLACEHOLDER.format("1TKn48v-HsDBX5OEXfVjLl8-0GukeG8Gw"),
-"artery": DRIVE_LINK_PLACEHOLDER.format("1jJrUC-dMOpxvHLB6ayw9kjWWwQOwwRsg"),
-"ovary": DRIVE_LINK_PLACEHOLDER.format("1qJnMykhXDXOz8f9iNaS7f9n1tFODy05B"),
-"vitamin a": DRIVE_LINK_PLACEHOLDER.format("1nBtlAIAtDD4m9Game0eF2jvgEdWhV0e2"),
-"uterus": DRIVE_LINK_PLACEHOLDER.format("1ZTlqHGL2wCSAsGiiT3UD6MChpohpqe7H"),
-"little finger": DRIVE_LINK_PLACEHOLDER.format("109YyqC_jr9xNJV4iSqsn1vH88Xfw-Zf8"),
-"bladder": DRIVE_LINK_PLACEHOLDER.format("1_lQjw2XAIBFRc2J6_FdQk9j__ioubor1"),
-"orbit": DRIVE_LINK_PLACEHOLDER.format("1uzZzlmHuOO7aahlg7z7kTxJe4hseN-vq"),
-"vaccine": DRIVE_LINK_PLACEHOLDER.format("1Iy5TdDw36ocmBqizA0bFu2A5pFUiPd6e"),
-"urology": DRIVE_LINK_PLACEHOLDER.format("14MdecglgeE1wXoQtnAsnVhpT38tRFyCr"),
-"adrenal": DRIVE_LINK_PLACEHOLDER.format("10rjNJaVkkSgInn0kaKaK1Tw2rUdPXxup"),
-"uterine glands": DRIVE_LINK_PLACEHOLDER.format("1rohbrGcnmPsea1zynD41JKgeMN_4EmHo"),
-"cell": DRIVE_LINK_PLACEHOLDER.format("1bmKUW9OwrFCHT89LYK9cPRQFX9JL1SNS"),
-"bandage": DRIVE_LINK_PLACEHOLDER.format("1fJrNz2VD-EqR4tHda3erOAxKbmEYUMlw"),
-"small intestine": DRIVE_LINK_PLACEHOLDER.format("1wagwiG1JdhcKXXHnuXdbEg-pwv8H3978"),
-"skull": DRIVE_LINK_PLACEHOLDER.format("1kNVxSdhNk6rs6492pPHKfp8bQRusUGJk"),
-"spleen": DRIVE_LINK_PLACEHOLDER.format("1eTokUyiY5obsDZeBCkq3VCrVh83EduOS"),
-"endotracheal tube": DRIVE_LINK_PLACEHOLDER.format("13b4KPgWyMA1TWr5OEuMt_z8bbY8EINVS"),
-"vein": DRIVE_LINK_PLACEHOLDER.format("1tYaixAEbAoZs0U6lTPOaUP5qLnMsIugb"),
-"weighing scaleelectronic": DRIVE_LINK_PLACEHOLDER.format("1kFt30ekTxZv7VrFASrGEAQbUhPlU3oS7"),
-"umbilical cord": DRIVE_LINK_PLACEHOLDER.format("1gsmc39WFaaL2t8efOuboiGiLVeusocar"),
-"vulvovaginal glands": DRIVE_LINK_PLACEHOLDER.format("1ZERP0Xa8tMmSZHQWTgYEdMD65u4p31RU"),
-"back": DRIVE_LINK_PLACEHOLDER.format("1_2m1oD3CU1lbXQKzHN5smVWsiP8hC_yc"),
-"wall bars": DRIVE_LINK_PLACEHOLDER.format("18oE6V97Xb2cs9GZKQJtCPPbT_V2Dilxb"),
-"amputee": DRIVE_LINK_PLACEHOLDER.format("16bwm-SgKrk9xYeRRrSMsHWyMSzzXNu8Q"),
-"sperm": DRIVE_LINK_PLACEHOLDER.format("11dfA8qs_jsTtZxqDs_iH01Z28YCjfRH-"),
-"chemotherapy": DRIVE_LINK_PLACEHOLDER.format("1ATJfXpCHqDKJ7GpV72oT_TfHVyE6TM3P"),
-"ultrasonic washer": DRIVE_LINK_PLACEHOLDER.format("1eVoCr9mik-LAebs_wB9b5lHFGercu_bz"),
-"x-ray cassettes": DRIVE_LINK_PLACEHOLDER.format("1sEG2y8tUSVUj6rOt3Og0MZZKGk67kCxB"),
-"antiseptic": DRIVE_LINK_PLACEHOLDER.format("1B6TtQDNDZIrsKXhohDDhogMmekSa4QTw"),
-"femur": DRIVE_LINK_PLACEHOLDER.format("1KRHr2gfFsJv0Kgo-9BHwuiwBvwKNXo_J"),
-"scalp": DRIVE_LINK_PLACEHOLDER.format("11Kx_tOpWSD_l7fbms90MKv8EMEtIjfjZ"),
-"antidote": DRIVE_LINK_PLACEHOLDER.format("1S0pl3QQWgoc_AuhWkXN_qj933MuYQYGn"),
-"stool frame": DRIVE_LINK_PLACEHOLDER.format("12eS74cb1MIft8vzIxPRFL6QUFuKXbw-x"),
-"stemgnosis set": DRIVE_LINK_PLACEHOLDER.format("1PdIBLC9o5Mek9GsGkQuDjOybPi1LIxyQ"),
-"therapist": DRIVE_LINK_PLACEHOLDER.format("1RoycwW863mHprnODVb0XDydQMAqxZJil"),
-"ankle": DRIVE_LINK_PLACEHOLDER.format("1dRvdNAHoUixlFk5B7lkXV9CIQ9mmKGbX"),
-"sedative": DRIVE_LINK_PLACEHOLDER.format("146zaPfq8bcBbU-QEqdVuvBYeKGB7HpIV"),
-"tibia": DRIVE_LINK_PLACEHOLDER.format("1IAaw3Bre5SqsA5foaoonfF_5VtwHjjWL"),
-"wax bath": DRIVE_LINK_PLACEHOLDER.format("1AHr06Hk6W1zlT0pZklmrcKKQbFtSutMJ"),
-"jaw": DRIVE_LINK_PLACEHOLDER.format("1fOjcRElyjNhtwS9BIX3ZooWKP8R2y5en"),
-"walking frame": DRIVE_LINK_PLACEHOLDER.format("1JlKluUkv03H8UtDEtlkHtNOG2TOfpfzE"),
-"adam's apple": DRIVE_LINK_PLACEHOLDER.format("1cFcd84-lPzvmhLC8fh6UhKXOcdXoaSS8"),
-"wheel chair": DRIVE_LINK_PLACEHOLDER.format("1a6l-JYj7oXjlpw5HZiF4j-7sD6kvqI8_"),
-"reproductive medicine": DRIVE_LINK_PLACEHOLDER.format("1s9y_g1DD5uDn4I5oQruu1vqdsio7epKs"),
-"anemometer": DRIVE_LINK_PLACEHOLDER.format("1U-R3V89qbKDIQL_2vjKxyoQQBqs9C6nF"),
-"anode": DRIVE_LINK_PLACEHOLDER.format("1ly-Jgn8pLB4JbjRAH7h8ULLnvB7n9inP"),
-"anion": DRIVE_LINK_PLACEHOLDER.format("1bFKKBJuf7rqTu4e5C9__-ev5UGozAp5G"),
-"anatomy": DRIVE_LINK_PLACEHOLDER.format("1fmscgAQNteMR9O-U3zSuQmLgVdt2Ib9r"),
-"algae": DRIVE_LINK_PLACEHOLDER.format("1RZAcsDA3ENdImqwx1rfu6O7VpQejYfGs"),
-"airbubble": DRIVE_LINK_PLACEHOLDER.format("193UgbwYBMGSWqfAokgIP3JltjXQkNPHu"),
-"artery": DRIVE_LINK_PLACEHOLDER.format("1I_EqcnzFURuXg-C9zNqH7KKfADm4nIi0"),
-"arc": DRIVE_LINK_PLACEHOLDER.format("1f8kFbI1NEYqSkms8_7dhuG01ga72hD6v"),
-"angel": DRIVE_LINK_PLACEHOLDER.format("19Q-YMoRF4NpTmNcohmUmyxhksBd91Kch"),
-"adult": DRIVE_LINK_PLACEHOLDER.format("1mDIXBL1X9DIi4wu6cxCD3kdJoiFFNoQ5"),
-"area": DRIVE_LINK_PLACEHOLDER.format("1EuR7El_dqa8p8O1ZsTK4GKGouaxoDtto"),
-"allegation": DRIVE_LINK_PLACEHOLDER.format("1IxXgWgOzeTw0hz_TDwkGjWnCwZoC_9_T"),
-"accusation": DRIVE_LINK_PLACEHOLDER.format("1IxXgWgOzeTw0hz_TDwkGjWnCwZoC_9_T"),
-"adamant": DRIVE_LINK_PLACEHOLDER.format("19Mers2_TGBnYXFrQT33kR7Kr0_nYOOgi"),
-"insistent": DRIVE_LINK_PLACEHOLDER.format("19Mers2_TGBnYXFrQT33kR7Kr0_nYOOgi"),
-"rigid": DRIVE_LINK_PLACEHOLDER.format("19Mers2_TGBnYXFrQT33kR7Kr0_nYOOgi"),
-"stubborn": DRIVE_LINK_PLACEHOLDER.format("19Mers2_TGBnYXFrQT33kR7Kr0_nYOOgi"),
-"assam": DRIVE_LINK_PLACEHOLDER.format("1NxOTVVSEJHCOBmGdwOe97DeQce9HBs23"),
-"approach": DRIVE_LINK_PLACEHOLDER.format("12gKbNY0PTP4XzNNSuOLfzHf4rPdu4N8n"),
-"ache": DRIVE_LINK_PLACEHOLDER.format("18lhm1GbHPCOiqjc3ugXUWLpbpdOLpehB"),
-"pain": DRIVE_LINK_PLACEHOLDER.format("18lhm1GbHPCOiqjc3ugXUWLpbpdOLpehB"),
-"accounts": DRIVE_LINK_PLACEHOLDER.format("18XbzteBpl-T27GWo-6tbPIe46Aa55PL4"),
-"arabia": DRIVE_LINK_PLACEHOLDER.format("1inLpVYgtAXCHpEN5S4XCWaFU_dy9az3r"),
-"agriculture": DRIVE_LINK_PLACEHOLDER.format("1W7_7vBkPaeO9vDpUfHwpLg9yJZMvnMZ4"),
-"atlas": DRIVE_LINK_PLACEHOLDER.format("1B3respdnP4wU6sOuMUzvrcvKIDYV1IGn"),
-"andhra pradesh":DRIVE_LINK_PLACEHOLDER.format("1Vpk4-E6eoJR2FQhJh7FLuz4XMVmGatpW"),
-"arunachal pradesh":DRIVE_LINK_PLACEHOLDER.format("1u8-vamsm4JtVtdqVeIjUfu6v4LC--5bv"),
-"acquit": DRIVE_LINK_PLACEHOLDER.format("14r6mG-MPw4NCtq061PKX1FsC-IEJYMrT"),
-"assimilation": DRIVE_LINK_PLACEHOLDER.format("1x859TPMCvuuduelLj3-p3of8v3WzyVr_"),
-"anus": DRIVE_LINK_PLACEHOLDER.format("1KjbFoAis53ktGhmZNxgsSN7_ORgoZjf6"),
-"amoeba": DRIVE_LINK_PLACEHOLDER.format("15Zyirs6hLHxxHkGLdThr6IjPC9J_PJSw"),
-"acid": DRIVE_LINK_PLACEHOLDER.format("1WUMnZ1waRtTvkJtD8z2ybZ6ebQuGYMd-"),
-"adaptation": DRIVE_LINK_PLACEHOLDER.format("1Oj1uA39pqoq55SNhFpWe_jjZF3heDFFL"),
-"algebra": DRIVE_LINK_PLACEHOLDER.format("1ehRdkZ2aO3HzormzeEfBW8T3s9nS7jIl"),
-"ashoka": DRIVE_LINK_PLACEHOLDER.format("1hJNg6aRTJXwOYRKVzoRghP4EYC8rNFQn"),
-"amphitheatre": DRIVE_LINK_PLACEHOLDER.format("15n2EOYtZ6djo9GxuwaYyZ1f0BQU7wTjZ"),
-"ashrama": DRIVE_LINK_PLACEHOLDER.format("1Gy6im--oIM-2h22HepUDjprPA8Xk4vT1"),
-"ahimsa": DRIVE_LINK_PLACEHOLDER.format("1tEWboQZ_eD3km1wp-v2BKGRErylAw1vZ"),
-"ashvamedha": DRIVE_LINK_PLACEHOLDER.format("1l1EVM8BQx118FfVrpaJYFJ1uGgIv0ovO"),
-"archeology": DRIVE_LINK_PLACEHOLDER.format("1etvDC9y0ZqC7KCuznpgTqOdLIZj0L4zz"),
-"amritsar": DRIVE_LINK_PLACEHOLDER.format("11IQDaupyPqPFDvf8hNkCu1GPGsjfPE_R"),
-"ahmedabad": DRIVE_LINK_PLACEHOLDER.format("1-EczkZLoqHgwSq2YGTMcOqz0fLDL3zhP"),
-"agra": DRIVE_LINK_PLACEHOLDER.format("18uQHNqZKgQamLOPvT4fRzLNI2NjXzs6y"),
-"attachments": DRIVE_LINK_PLACEHOLDER.format("1vg8Cq6iiAH1w6VskBAsrwiM-ukNDdIXB"),
-"approval": DRIVE_LINK_PLACEHOLDER.format("1NCuFo3z0xPL-1R4aUfYFiFgEDKkLizKK"),
-"acceptance": DRIVE_LINK_PLACEHOLDER.format("15D2CerYeTsWhD792NAI6N14GTSvpWjwX"),
-"authorisation": DRIVE_LINK_PLACEHOLDER.format("1gzrYuA34NLKYLEc-4U24n4nDZf8nsLe9"),
-"arbitrageur": DRIVE_LINK_PLACEHOLDER.format("1ojYAK86-yZ3dSt8VwS2P8ztjr9eHB1K3"),
-"auction": DRIVE_LINK_PLACEHOLDER.format("1p308jUWHJ_Kvvpcbs3AmtlcqrYWYhl-C"),
-"autotrophic": DRIVE_LINK_PLACEHOLDER.format("1vzpVJGtsKBnh1qqHa67EfvP-gsSSzwEe"),
-"aquaculture": DRIVE_LINK_PLACEHOLDER.format("1otYVMF0rWC3FFBrgmyNwLhIQKXmCENCr"),
-"apiculturist": DRIVE_LINK_PLACEHOLDER.format("12iF9aQNOg-LhsLXKyaTUexpPWBI9SyK0"),
-"albumin": DRIVE_LINK_PLACEHOLDER.format("1080jM1WvRYrnNS2tbxq2ENi20Ua-6pT8"),
-"atmosphere": DRIVE_LINK_PLACEHOLDER.format("1oEf7RSlG4uHzB66__6NREZUV3j1EsBDF"),
-"asterisk": DRIVE_LINK_PLACEHOLDER.format("1fveAUXeAciV9bs2c8v5U0ZnPSuLy2tbC"),
-"apostrophe": DRIVE_LINK_PLACEHOLDER.format("1r2dQ6agF_JiNDi97z0U4cBAvtemITHHf"),
-"atoms": DRIVE_LINK_PLACEHOLDER.format("1ZLQ7T7nfi9mwWuy3A5qdyWGTO8JI5y4P"),
-"ancestors": DRIVE_LINK_PLACEHOLDER.format("1QvTI-z8GfnrwvNO7cmWi2vAeUjeIWqVN"),
-"absorption": DRIVE_LINK_PLACEHOLDER.format("1hliyVDXnQmK8HblJf1KH440dUMzsURU2"),
-"autosum": DRIVE_LINK_PLACEHOLDER.format("1-IDOBYX7K6ekJcw2lyh7l5ttfCuLh2bL"),
-"accommodation": DRIVE_LINK_PLACEHOLDER.format("1RWqXSW2h5MUp6wHM3AXHbWQmpE0Q8hTL"),
-"analytics": DRIVE_LINK_PLACEHOLDER.format("19dMciOaLU1hi9JFaDok28QstAl0YMWz7"),
-"adsense": DRIVE_LINK_PLACEHOLDER.format("1YY0YHjicIqeUuPtqR0T3bxxD7chTW4pz"),
-"agnostic": DRIVE_LINK_PLACEHOLDER.format("1Yl64p3IweVkt1b_gpdeQSz2nSvaAzfR8"),
-"acumen": DRIVE_LINK_PLACEHOLDER.format("191ZUwp2wrUN5nS_0Pk3Ug_coc-1StALs"),
-"acuity": DRIVE_LINK_PLACEHOLDER.format("1qEjF4vR1MlidLQaTn1QMkXaidRsWFyF5"),
-"accumulate": DRIVE_LINK_PLACEHOLDER.format("1_ktL4CSB9s1I5BZj_u3lr2BcILVNdgJl"),
-"accurate": DRIVE_LINK_PLACEHOLDER.format("1Ts3mGF6a2FxMl3DgmQymyFevRwOSs299"),
-"abundant": DRIVE_LINK_PLACEHOLDER.format("1pAoSQ57gL75PcK883Y0BSX7TemOlRFwE"),
-"abolish": DRIVE_LINK_PLACEHOLDER.format("1fq6ffUwkp-Q2X5jDl7BXPopOfwpm-giX"),
-"axiom": DRIVE_LINK_PLACEHOLDER.format("1R3La-QzjkYM8k09gRvZzVkgaespUzvjc"),
-"assumption": DRIVE_LINK_PLACEHOLDER.format("1vZmqf9RMO8wSH1Spp_WBDKuEZC4owzEp"),
-"authority": DRIVE_LINK_PLACEHOLDER.format("1I_EXx9xH0tDPSBrx03R4ZVslgohMUZD2"),
-"article": DRIVE_LINK_PLACEHOLDER.format("1Wc6ptcPEuw5aVIzefCHUmtLA659ts2Ng"),
-"amoeba": DRIVE_LINK_PLACEHOLDER.format("1IAIRaAaY_DjFvUe3HsZCtWkmHYkUK1f4"),
-"ammonia": DRIVE_LINK_PLACEHOLDER.format("1kEALqNPE8QqGZx0D9BftiuOjuEvj9EW6"),
-"aluminium": DRIVE_LINK_PLACEHOLDER.format("1mOdsIHGJZvA9WBMLMavWgzqM6duuwqZQ"),
-"altitude": DRIVE_LINK_PLACEHOLDER.format("1g2F5G8g65YzrfUy-MVdl5Nut9k7U3k7P"),
-"alkalis": DRIVE_LINK_PLACEHOLDER.format("1J3Fh0bUN1ybGW9L_hX3a2m3nIZGsjMyb"),
-"adjectives": DRIVE_LINK_PLACEHOLDER.format("1NRQowPCeBGDQ2J3jhKvopQOC8xwHNkQM"),
-"assignment": DRIVE_LINK_PLACEHOLDER.format("19pH_Q6pKExugK6KcBqxcpwuTnryh1_V4"),
-"assessment": DRIVE_LINK_PLACEHOLDER.format("1OayONoVY7k4yfCa1wF5EafgIJ88_Ek3s"),
-"admixtures": DRIVE_LINK_PLACEHOLDER.format("1Qqx2PJ4BW-yyO3n5-ak44dZWI9xA22_d"),
-"accelerator": DRIVE_LINK_PLACEHOLDER.format("1iDPmaJ46HDeaU9bs41M5YPCEXm4nrJ7B"),
-"attraction": DRIVE_LINK_PLACEHOLDER.format("1sqNIXsnQ1Bt4eEn0BNw86_FZQC17xTiD"),
-"adventurers": DRIVE_LINK_PLACEHOLDER.format("1zKHD1ZShQa5WL2safTbSc4PSMsn_M6ky"),
-"amount": DRIVE_LINK_PLACEHOLDER.format("124e2GT5Ud7rstq7UVfJUgqlGv526BBG2"),
-"appreciation": DRIVE_LINK_PLACEHOLDER.format("1xnTlljbYhTNIWoLikafZgfjeBY6jvLi2"),
-"accessories": DRIVE_LINK_PLACEHOLDER.format("1AfAyQPUPZNxC2UeH_5ATVmmha5hkhXJu"),
-"avoidance": DRIVE_LINK_PLACEHOLDER.format("1Ie2Te2XZskfOntbS1ltaSrMdeXKtaBOL"),
-"aquifer": DRIVE_LINK_PLACEHOLDER.format("1PAlgPzeIUvhwmDSkgNRc8zfB49PZrJ6N"),
-"anthropogenic": DRIVE_LINK_PLACEHOLDER.format("1HErVWblKG2fwYu4l2QiELMJDrLtKyqtq"),
-"anaerobic": DRIVE_LINK_PLACEHOLDER.format("1EcsKZxQduL2s6gmoEQMXIkKMheLi1x-T"),
-"anoxic": DRIVE_LINK_PLACEHOLDER.format("1GddJqwuV4dJMJAO9sGUG4oGd9-TgJCnk"),
-"albedo": DRIVE_LINK_PLACEHOLDER.format("1AgA8uD9lVJHddGIsxwbNOJ7C-ymCcuhP"),
-"agroforestry": DRIVE_LINK_PLACEHOLDER.format("1sFR3ILCOi1XEmALnnwcOJDgshtF2qgZk"),
-"affluenza": DRIVE_LINK_PLACEHOLDER.format("1dy2jGc8vS-lDSBOWRTQT1ufXjAexRAwl"),
-"aerosols": DRIVE_LINK_PLACEHOLDER.format("1Dr4Yg1Qnb5FaX2FkKyEfgcw56tOi_wDv"),
-"acclimation": DRIVE_LINK_PLACEHOLDER.format("181QOq7rwmzByZXGeGfPZCZjBv4oEZmiI"),
-"automation": DRIVE_LINK_PLACEHOLDER.format("1Wig1tnD7kDP8Fw32qD84Dx8hvGOihgCH"),
-"austerity": DRIVE_LINK_PLACEHOLDER.format("1lPwcQzzUcAsfIM3PEZbsMEs8rHJQqfcG"),
-"approver.m4v": DRIVE_LINK_PLACEHOLDER.format("1xTEpsRjmlYgunvWRWdTyPjezT8mK3Qke"),
-"arrogate": DRIVE_LINK_PLACEHOLDER.format("1-BaN8zsEOtGLQ2JU37zAMtT7GTXcYpGL"),
-"abrogate": DRIVE_LINK_PLACEHOLDER.format("1PVaSzuY8nmrgkgLf0--rc34rOTiB0VHC"),
-"assyrians": DRIVE_LINK_PLACEHOLDER.format("1RH1hxDGP0BkDMKfAlAynnXAbIVF04cqD"),
-"archeology": DRIVE_LINK_PLACEHOLDER.format("1VBNFUHJOCyP2oCDBuIlcYcM440514Dvi"),
-"antonymy": DRIVE_LINK_PLACEHOLDER.format("1GRHncqAVHsvCENe6xnSaSxx7OLEKmnOS"),
-"addendum": DRIVE_LINK_PLACEHOLDER.format("1hpy7Vc7qlNzZdyhnYyJzl0EMzN1lD-4X"),
-"abrogation": DRIVE_LINK_PLACEHOLDER.format("1jI9NSWYwWSHVjXiDGBKgYAKsRDEOnkpf"),
-"attribute": DRIVE_LINK_PLACEHOLDER.format("1HJUfirGbAuaYCN-uKfKdGhBDR2snahid"),
-"alliance": DRIVE_LINK_PLACEHOLDER.format("1OHf310rl1bxyOSXdpQuG67BoUzfIZrWO"),
-"advance": DRIVE_LINK_PLACEHOLDER.format("1RVWrIe254Zv6FqO4EuAu1YJ7xHOS2pUB"),
-"auctioneer": DRIVE_LINK_PLACEHOLDER.format("1cIfPX7Pdj5COCy085kkK-R7fTAd5SQmS"),
-"assailant": DRIVE_LINK_PLACEHOLDER.format("1CnCo5qCqdmgt4-kTd5CT53nYT_-IlCKK"),
-"annexation": DRIVE_LINK_PLACEHOLDER.format("1IYVI_H2TNSHs77B0PXLlM8FqE4IHsZEe"),
-"agnate": DRIVE_LINK_PLACEHOLDER.format("1TmF-vHCmSe5ryDqCrov6RzxOl12fcaI6"),
-"agenda": DRIVE_LINK_PLACEHOLDER.format("1dwLJJYmexfuBIbXb0xhds2OtAQN5w2Vw"),
-"accentuating": DRIVE_LINK_PLACEHOLDER.format("1UgjHFxICaOk4RI5OPnTiQz_HHa1cdiJ3"),
-"abeyance": DRIVE_LINK_PLACEHOLDER.format("1dLx9rxban-f1QmJl15OnoiDWKOCjjzO-"),
-"ascii": DRIVE_LINK_PLACEHOLDER.format("1EehG_jT_fOSwtuukIaTc6-AfRVv9YTL1"),
-"ascender": DRIVE_LINK_PLACEHOLDER.format("1QvKkuNV9Sqawrs-0-Dpv5AgsDfiHUBQF"),
-"asset": DRIVE_LINK_PLACEHOLDER.format("16PpdyEIjXyPgo4B-tIOw2vT-YOQaXDNF"),
-"acronym": DRIVE_LINK_PLACEHOLDER.format("1TkIKHhkMUp6Irhak0XHaSSJ2GsWVR4RM"),
-"aborigine": DRIVE_LINK_PLACEHOLDER.format("1nDHo9Zm5dbrfe8PgsgCtz7pyz-KC8UwW"),
-"autograph": DRIVE_LINK_PLACEHOLDER.format("1JlhBzL9_qMhX7E3qcVeXDE8MVJUCAqZN"),
-"ambidextrous": DRIVE_LINK_PLACEHOLDER.format("1Kv-p0IuDWb0a-3pgkyJUCFtFDJ0z_i6M"),
-"assassination": DRIVE_LINK_PLACEHOLDER.format("1zZ96KN2gUNZjJxsN3mEliRihYgq_ep51"),
-"aid": DRIVE_LINK_PLACEHOLDER.format("1ZoNkVlJNfro9iBpS5GcZVw08xHT7YEAn"),
-"aftermath": DRIVE_LINK_PLACEHOLDER.format("1WMZm7JQazG-4_ZHuOFn9L4A0dfbT8i7f"),
-"afford": DRIVE_LINK_PLACEHOLDER.format("11MIzy9Ox5Y5Sdz1vrFXtJ6GIPghY5iSM"),
-"affiliate": DRIVE_LINK_PLACEHOLDER.format("1bb9yystLBXDEgmCGH7bRVGep5tiaHZDz"),
-"acquire": DRIVE_LINK_PLACEHOLDER.format("1ujrZ-2JOHBBxdIgioZdvHnCABJeIjTuX"),
-"acquaintance": DRIVE_LINK_PLACEHOLDER.format("14wL4X0qpNOsPmTu4ZOFbac_5Br00u3rX"),
-"accomplish": DRIVE_LINK_PLACEHOLDER.format("11Hp4CxXERcKRahQSloSR-vPQAhx4fSIs"),
-"arid": DRIVE_LINK_PLACEHOLDER.format("1jQZIeQVt-NrBtuloE_PN2-6yXVGvgdBW"),
-"atheist": DRIVE_LINK_PLACEHOLDER.format("1cQJTFEFhW1BRDo9V-T9vlRc5UqXr2_rs"),
-"ash": DRIVE_LINK_PLACEHOLDER.format("1Or3OnypiBz4pYBi2MeHg5Cho_QwSBcJq"),
-"arrow": DRIVE_LINK_PLACEHOLDER.format("1vkXZgr9WCtzzWTMOR8mQ5Se2CEvczdgx"),
-"arrive": DRIVE_LINK_PLACEHOLDER.format("17eS4mTHh7L9Zdpm1VauTp9AF1_SFKexY"),
-"armour": DRIVE_LINK_PLACEHOLDER.format("1P1C4Unhz8q34wR-43J6Ap79ui1vwA9JP"),
-"archaic": DRIVE_LINK_PLACEHOLDER.format("1lkvatJ1DQHBpdgI3OlnC_uApnvSGv9MX"),
-"arch": DRIVE_LINK_PLACEHOLDER.format("1WyQPb2qOqRgv4MWSHYSlY8Qer9uxGd09"),
-"appraise": DRIVE_LINK_PLACEHOLDER.format("1MmJ7WxBk8m_RONevbs4_d6lQK0y1fYsF"),
-"apex": DRIVE_LINK_PLACEHOLDER.format("1GBOkTytPZHHk4CB75WuxeN1oaU4Z8J75"),
-"adjacent": DRIVE_LINK_PLACEHOLDER.format("1apI4fOxdpUTmuDF2OY2eXxw35wqKY22Y"),
-"apostasy": DRIVE_LINK_PLACEHOLDER.format("1ZpLFtqFOPXccgo0efa8agfnmy58DBP4g"),
-"absolve": DRIVE_LINK_PLACEHOLDER.format("1TfgNUJy4fBJx4MX9Ru_Dm2piiBs9SX4o"),
-"abdicate": DRIVE_LINK_PLACEHOLDER.format("17xGK8tkuZSBe2mNQEdIwTr1ByI9kl-E0"),
-"abode": DRIVE_LINK_PLACEHOLDER.format("1yAn8iQXZFGAOOlm5Sj_tIELIBM2iIkfO"),
-"audiologist": DRIVE_LINK_PLACEHOLDER.format("1684o07u9hja34PHFAQR3pS7IWOsC9oF0"),
-"autonomy": DRIVE_LINK_PLACEHOLDER.format("1l4ni1mPknMgQiZ02GHxnNxAz5FnJ4eI4"),
-"acid": DRIVE_LINK_PLACEHOLDER.format("1N6fZLd7sDe5LC_sXdSUFAtMXAOXlEOLH"),
-"area": DRIVE_LINK_PLACEHOLDER.format("1EpQudhTAh2GD_0QDwlzVCgAyLEP_6hB9"),
-"angle": DRIVE_LINK_PLACEHOLDER.format("1OmCe_RtiqLrc6z5-5YFJ6E2yUn_Sl7gc"),
-"angry":DRIVE_LINK_PLACEHOLDER.format("13PjYoXwslfutZQ9mxpBw24ziletT1PaW"),
-"atlas": DRIVE_LINK_PLACEHOLDER.format("1sOnrkrY6E5VxfYQCx2LVSTZZ1tmHvuH7"),
-"assault": DRIVE_LINK_PLACEHOLDER.format("1yqCjJA1Uo0Osu1LGMHhVgmUnQSEV9mS6"),
-"arson": DRIVE_LINK_PLACEHOLDER.format("1TxBncg7-bx56eBKktASztKcfGi62ZfK2"),
-"arrears": DRIVE_LINK_PLACEHOLDER.format("1V6uC6xwrenYovKssylgXoTztUgOG57Vb"),
-"argument": DRIVE_LINK_PLACEHOLDER.format("1w4xQQ5C1FOgF5x6Ya870iPQQcJKNxHwf"),
-"appearance": DRIVE_LINK_PLACEHOLDER.format("1H0i_T1GfHCzSHrrf5vxxtCC26EeckxP6"),
-"antedate": DRIVE_LINK_PLACEHOLDER.format("1rOm2RQcKtTB1xvYrZyd59-bl63ZcBGhj"),
-"amnesty": DRIVE_LINK_PLACEHOLDER.format("1sSHOalKGksb3t1vTgJgFecCGxrjIQYxi"),
-"alimony": DRIVE_LINK_PLACEHOLDER.format("1rdvkv2Fa42HykgsRHXnB5X9FuMYoBYfW"),
-"alien": DRIVE_LINK_PLACEHOLDER.format("1oMrpO8PNj7CQ_o-P3itVpuOyLFhpHCWa"),
-"alibi": DRIVE_LINK_PLACEHOLDER.format("1pmHaitSu59quGCo22Hw0zVdua-hLBg54"),
-"airspace": DRIVE_LINK_PLACEHOLDER.format("13x47lKPz7nd8j2ZAnnjFsEQdvuNHQ3TW"),
-"agent": DRIVE_LINK_PLACEHOLDER.format("1VeVjlZNvW3vZUxVYG1Bwx8K_ysr3kA-D"),
-"affray": DRIVE_LINK_PLACEHOLDER.format("1Ux6JsBCvviBDxhFP8cmoWcbI8clwRPgS"),
-"affidavit": DRIVE_LINK_PLACEHOLDER.format("1vn8Ff-rie2A6xtyNkNGCu_35CEVPEYnY"),
-"adultery": DRIVE_LINK_PLACEHOLDER.format("15wPCHKSxp6Z6BarbZH8LZik_0R0C-Tc9"),
-"adpotion": DRIVE_LINK_PLACEHOLDER.format("1SjhMGPWcoQlWwMBlaterAHz54vDAAir2"),
-"admonish": DRIVE_LINK_PLACEHOLDER.format("1YgG1llhrpYT_iinSGn7BdxKqjKOByadt"),
-"administrator": DRIVE_LINK_PLACEHOLDER.format("1e3fPfoc1QPdefLkO0vkb6IhTd4KD2gUv"),
-"ademption": DRIVE_LINK_PLACEHOLDER.format("1AC_xZQnqKoWzW8HjxyHMAF1Yd89XY_cZ"),
-"actuary": DRIVE_LINK_PLACEHOLDER.format("1KNBYS2dMWmLPS4A-A4Am-4Z73iJXRv9y"),
-"acquittal": DRIVE_LINK_PLACEHOLDER.format("1c-NhWxFtVpUJjtDNbHSSZtLm_wc7JzOG"),
-"account": DRIVE_LINK_PLACEHOLDER.format("1fcP6oJaj3myYGrOYj2Jah2hSPsw1QLw1"),
-"abuttal": DRIVE_LINK_PLACEHOLDER.format("1zk-wOVR67pVKL7UTXWIrhXvJpnSmI2ZI"),
-"achieve": DRIVE_LINK_PLACEHOLDER.format("1w31oluFGQ1PTZRjqSU5Q-NXknIVg31TB"),
-"accept": DRIVE_LINK_PLACEHOLDER.format("1iFWVC1XWHfot1jJ_X9xk-UYiMzEL5ODa"),
-"abstract": DRIVE_LINK_PLACEHOLDER.format("1Q8SQn0m8-UhfyX_12AZXD06yK9qi8fL2"),
-"absent": DRIVE_LINK_PLACEHOLDER.format("1Ow9fwPNBB9GC76o6Qq38C7Qax61h9nj0"),
-"away": DRIVE_LINK_PLACEHOLDER.format("1zI-zP7q0jA7AEHHdAvkUbRcedH52wjJh"),
-"arm": DRIVE_LINK_PLACEHOLDER.format("1WbdTKHb9Idn1BEt6bEbUHpbWvlGJi1vw"),
-"acknowledgement": DRIVE_LINK_PLACEHOLDER.format("1nTncl2691IOLY8dCR6YDqI3pDuB7XwxH"),
-"abandonment": DRIVE_LINK_PLACEHOLDER.format("1RUeLpkQuJ873nLxl9s99s2ynFfOCAF7d"),
-"alloy": DRIVE_LINK_PLACEHOLDER.format("1goQPy6dUx-UZieXnqqjCfFsfxAJfcrd1"),
-"art": DRIVE_LINK_PLACEHOLDER.format("16zlbNTcXHescPEPxRKoK-XLS6J-xekh_"),
-"ankle": DRIVE_LINK_PLACEHOLDER.format("1Q64bJNqPtsd7eYfZmh7HE7RomgbNOXuF"),
-"airport": DRIVE_LINK_PLACEHOLDER.format("1RccQQh7q4OMnD9cmuNS8JXJALAHww34g"),
-"atm": DRIVE_LINK_PLACEHOLDER.format("1gE5IL4aQRPFG7hYm9A5V8PCPzAKtMZwN"),
-"approve": DRIVE_LINK_PLACEHOLDER.format("1FGL6V2X1Gw-TwvIGO7YQSNho9DiyRiFY"),
-"anonymous": DRIVE_LINK_PLACEHOLDER.format("1B9k6KeQFTto0eg0lLkCSH6CSrVk5OgEI"),
-"advocate": DRIVE_LINK_PLACEHOLDER.format("1NNWBOta7jlUqGeS__rJ7RfbhI1DIoWHQ"),
-"action": DRIVE_LINK_PLACEHOLDER.format("171I271hzzkHBo9GAOIw2bqsuF55wR4tL"),
-"aunt": DRIVE_LINK_PLACEHOLDER.format("1fL01G3K6C8BBNehFqfI0SG682W7tgzJb"),
-"alphabet": DRIVE_LINK_PLACEHOLDER.format("1puYbpkj6YfHXOzpRZh1rTP-9SVE785Aj"),
-"axes": DRIVE_LINK_PLACEHOLDER.format("1pjyiWY_iq6W6B4eQIcTSzZG8OxVFgblj"),
-"amplifier": DRIVE_LINK_PLACEHOLDER.format("1sZ5_OL3mzCWi7LsoWGg3Qax-I3zNkUiC"),
-"adverb": DRIVE_LINK_PLACEHOLDER.format("1ziFkIZa4bULhEFeJYVclv9vu7EMHgbiK"),
-"adjective": DRIVE_LINK_PLACEHOLDER.format("11zbiUMywkPi_zSBNgGCLwezppGjVVncw"),
-"applique": DRIVE_LINK_PLACEHOLDER.format("1YsAFS8EdOm0hxMFr40vHdq2b3s-91DTT"),
-"accent": DRIVE_LINK_PLACEHOLDER.format("1liGr6MGUtZO-BGx-Pno80MplgO2I-kei"),
-"amass": DRIVE_LINK_PLACEHOLDER.format("1BEdtwYtQdvip7S4RWxhrHk8XD8AobHEF"),
-"asteroids": DRIVE_LINK_PLACEHOLDER.format("1iiTSz73HOGZytxyyNx-9-nD-EIqtGGaJ"),
-"aftershocks": DRIVE_LINK_PLACEHOLDER.format("1bccRws-0wienIEBfeGzYqr3fE5vd-ppM"),
-"acute": DRIVE_LINK_PLACEHOLDER.format("1R_PfQZQ4I1l6jAugyeNq628FvsMZbt__"),
-"autospy": DRIVE_LINK_PLACEHOLDER.format("1e0ZXoQHqNMXbZlNXr3OqCf33QBVoVh5Z"),
-"audiometer": DRIVE_LINK_PLACEHOLDER.format("1hiCrnbTlmYoZCd4cfHTG1UtR3yu3_1zT"),
-"audiologists": DRIVE_LINK_PLACEHOLDER.format("1SjGNtRKnyMIK48Qq4kEgGFrOGgR7M5RK"),
-"audiogram": DRIVE_LINK_PLACEHOLDER.format("1sOMIFnJLwiic_UN4f3jkd3JTSumaeJwN"),
-"appendieitis": DRIVE_LINK_PLACEHOLDER.format("1T4htx6I03nZa7ku7JDId3e95LKzGTYs6"),
-"anus": DRIVE_LINK_PLACEHOLDER.format("1LURxhVbZ8fQYbowaJ41i8T43u3VvJSkU"),
-"abolition": DRIVE_LINK_PLACEHOLDER.format("1xwqU3BOi4HSK-F5JGkd9sC4-Q8TkpWfq"),
-"antimicrobial": DRIVE_LINK_PLACEHOLDER.format("1_NB2k-lREQqjtwU3NRGdbZ7GgCZFii4x"),
-"anesthesiologist": DRIVE_LINK_PLACEHOLDER.format("1ExQGhnppArjZccSAhM617bjP8aMElUhl"),
-"anemic": DRIVE_LINK_PLACEHOLDER.format("1Pb-KzeYMqGatBEWCjWCOrEzJn1xAR0DD"),
-"amalgamator": DRIVE_LINK_PLACEHOLDER.format("1m5MOJPwb5yL6-Qz-HK0wBfBiqoyG1WCJ"),
-"amalgam": DRIVE_LINK_PLACEHOLDER.format("1KZmsNJBdOt8BBnWH7S3R-mSfV1I35U8W"),
-"adipsia": DRIVE_LINK_PLACEHOLDER.format("1o5xzhIZYE621HH0jrIBJzcCe3zDp_BKN"),
-"acidosis": DRIVE_LINK_PLACEHOLDER.format("1LMuoWUsFKyemZcrHKaVIBnd2_UiZxgH6"),
-"artist": DRIVE_LINK_PLACEHOLDER.format("18L6J0dDhOWwatbT5jCnQhJcr9JqYDuCm"),
-"archaeologist": DRIVE_LINK_PLACEHOLDER.format("1yVtk-54goHkMaE9nhjd7zvBFxSTJT2CF"),
-"actress": DRIVE_LINK_PLACEHOLDER.format("1260SW6Q1znWOS44tFB7QLk_-Aa6zcpa4"),
-"actor": DRIVE_LINK_PLACEHOLDER.format("1A_XF1f2NoMQtgRcawaEmS9odWIUfgnjM"),
-"acceleration": DRIVE_LINK_PLACEHOLDER.format("1uWpmfVBGTZih38daYWz4GKxUmxwP6vJO"),
-"aristocracy": DRIVE_LINK_PLACEHOLDER.format("1ujgckQtCt12Go1QSdX4jl41YK3y09-Yu"),
-"alike": DRIVE_LINK_PLACEHOLDER.format("1x7e46TIu1avAaHJXKtD3zDz2RuoEaL0L"),
-"adopt": DRIVE_LINK_PLACEHOLDER.format("1N63XX8D3N1O-pl6yS4w_OM_hio0UhZGK"),
-"architect": DRIVE_LINK_PLACEHOLDER.format("1gkF8GYYrSknIqVi1WNf561l8EFY-6sox"),
-"audi": DRIVE_LINK_PLACEHOLDER.format("1qh-l49sebsB2JlBX75TQDdYOtyssrTTP"),
-"airtel": DRIVE_LINK_PLACEHOLDER.format("1dz9xtp7qRrkgqcdWdf5sxLTCmNaF3Oi9"),
-"airjet": DRIVE_LINK_PLACEHOLDER.format("1U1nR0-_gBnqXCM2SCsDSlQt3AIb32ZGc"),
-"aircel": DRIVE_LINK_PLACEHOLDER.format("1BJqvWY5caNI8F5Z4gZw9_UDIH7ROwAf0"),
-"ascariasis": DRIVE_LINK_PLACEHOLDER.format("1OZYTu74drAUujPuOvM9VYItfKhUXDCcO"),
-"aphasia": DRIVE_LINK_PLACEHOLDER.format("1c-3hdZh5K9VrmxnFZkVhguwaGGN_Yos-"),
-"anorehidism": DRIVE_LINK_PLACEHOLDER.format("16VsOHyQjQZqBt3DVUUewaaZqofzOq19G"),
-"androgen": DRIVE_LINK_PLACEHOLDER.format("1ExU3e_Rsvojel5n-JPGDVOvkTV59kcQW"),
-"amazon": DRIVE_LINK_PLACEHOLDER.format("1cxQC5CIO_Iy4BYc83mVM1n38npSWBY2f"),
-"alcohol": DRIVE_LINK_PLACEHOLDER.format("1LV0dmDyZVsURXKN7u5NWnZ3iVwOJkdIU"),
-"age": DRIVE_LINK_PLACEHOLDER.format("1MDuR5O6I3dPjf_nPo0dLW8NtBkKqDbKG"),
-"advantage": DRIVE_LINK_PLACEHOLDER.format("1Iqs6qWAw4hi4UmMxQ-TCZUXVOAywxIjr"),
-"anitibiotic": DRIVE_LINK_PLACEHOLDER.format("15o3V0TnQ9t2tyw-WLxR07zd2_4m0kWKJ"),
-"atom": DRIVE_LINK_PLACEHOLDER.format("1_Gf5CtX5MTa8gf3WbKAkY_jLyk730VHu"),
-"archipelago": DRIVE_LINK_PLACEHOLDER.format("1q6OIODShXvjbyjH2eNq5OczL7Z5HKVyF"),
-"animation": DRIVE_LINK_PLACEHOLDER.format("1j53klnM4E7OkOT_w6kURn2ofMfbYq_sI"),
-"amplitude": DRIVE_LINK_PLACEHOLDER.format("1Ie03jotlYPQmMWpnPs5MUPdrD6V1jlza"),
-"agriculture": DRIVE_LINK_PLACEHOLDER.format("1woIjGdpx4dRN8x31LAn0oJL4PuYMPA5h"),
-"afforestation": DRIVE_LINK_PLACEHOLDER.format("1Ue_wVGzR69vHh8E-XewxcQx61tnDbxaN"),
-"axilla": DRIVE_LINK_PLACEHOLDER.format("1r3bH5G3OkScyLkewKAW0TpgBZmmGHt9p"),
-"autism": DRIVE_LINK_PLACEHOLDER.format("1y82rDwQe2_K-PYPmdsFEMI6gWfVJ0AqY"),
-"auscultation": DRIVE_LINK_PLACEHOLDER.format("1I3xT9QbcBQXitVrKyvb82RlIhOLe1WZb"),
-"asystole": DRIVE_LINK_PLACEHOLDER.format("1QEqlEGBjAPn-KHln4hKLQ4orJPN-OguW"),
-"aspiration": DRIVE_LINK_PLACEHOLDER.format("1Zyf99yRJVncuVg0ps67cv5UBExhbaWxQ"),
-"asphyxia": DRIVE_LINK_PLACEHOLDER.format("1EqWL7V8IZawAfQrUxYahJV3bCE0djNMH"),
-"anxiety": DRIVE_LINK_PLACEHOLDER.format("1kmRsCI_KISCqdmJo-E_BXJt55MsycoUw"),
-"antiseptic": DRIVE_LINK_PLACEHOLDER.format("1YK4Om68Ee-SVu0jr3xJrhqCfGsyYA9tP"),
-"antiperspirant": DRIVE_LINK_PLACEHOLDER.format("1V-qorzpxmvebwDp7z5oHRZVIkNTli8bq"),
-"antibody": DRIVE_LINK_PLACEHOLDER.format("1wwUnS9kJntqGs_xiRcXYAogp3mZQ11xf"),
-"anthrax": DRIVE_LINK_PLACEHOLDER.format("1TuslxFnXS1BCFhFwuRkPnjgNwlELpiY2"),
-"anorexia": DRIVE_LINK_PLACEHOLDER.format("1ysH1ffGbPq-hq2LRIqWj4V_8MyQUmUzY"),
-"anesthetic": DRIVE_LINK_PLACEHOLDER.format("1Z03x5KnArQvHICZZUpVSPwM-F4p2-uGb"),
-"anesthesia": DRIVE_LINK_PLACEHOLDER.format("1h_bY5wMvzPYQgoSOCu4UYbcjp09vorej"),
-"andropause": DRIVE_LINK_PLACEHOLDER.format("12FujkWNSEXjNZ5yrNprmvglNrqjUJ-Ez"),
-"amputee": DRIVE_LINK_PLACEHOLDER.format("1jYWWpZ5qX25cEApOoIbo4ySM-DuQXsXr"),
-"amputation": DRIVE_LINK_PLACEHOLDER.format("1WWFYOUdaiRBAuvOIxdgzCSgiGNB3eixb"),
-"amnesia": DRIVE_LINK_PLACEHOLDER.format("1HawS8p5HE5Mm2vNygrppDv2OYEsVW5BB"),
-"amenorrhea": DRIVE_LINK_PLACEHOLDER.format("1uWr4iJ0rBjGhYAXkgbNCgcyrU1VrOVGZ"),
-"alopecia": DRIVE_LINK_PLACEHOLDER.format("1OffBcHDgLJsRPnvIAyzXlSnUflCAPaPC"),
-"allopathy": DRIVE_LINK_PLACEHOLDER.format("18hkhA-Z90oynYrVLbfhpPPCOpSrL-dZk"),
-"allergist": DRIVE_LINK_PLACEHOLDER.format("1liHyF64lEEkmfYeQGc55OZW__X9Vafnk"),
-"allergen": DRIVE_LINK_PLACEHOLDER.format("1E_dkm_cdqn8BRPb7qS8cnnxEbABcsmiP"),
-"alcoholism": DRIVE_LINK_PLACEHOLDER.format("1pe_WVvLcV9pbEJGQ5ZBEVS4IV5MHdek4"),
-"agoraphobia": DRIVE_LINK_PLACEHOLDER.format("16pNyMKUNcavsrFrLFciRPDeOs4hvHuJZ"),
-"aedes": DRIVE_LINK_PLACEHOLDER.format("1AXDTIt96B7Rt-NoWVDAQ_5LksVMrUAGq"),
-"adulteration": DRIVE_LINK_PLACEHOLDER.format("1XJsKoqcO847QNVqJB-BhM-4JWvLdfqCJ"),
-"acupuncture": DRIVE_LINK_PLACEHOLDER.format("13P9nnWzmwAI_t9FOmRCD9TstxdqS4E1Z"),
-"acupressure": DRIVE_LINK_PLACEHOLDER.format("1kwWiHX1B-hgmmakg2IPN9ZedxOnhCLQ_"),
-"acidity": DRIVE_LINK_PLACEHOLDER.format("16WOMTq5aKPE0ciAQ0mURbc6477aaDya5"),
-"achalasia": DRIVE_LINK_PLACEHOLDER.format("1qtceONoE5-LYWu5woAIv-btwEbj4QKSw"),
-"abstinence": DRIVE_LINK_PLACEHOLDER.format("1X9IcjltUeNTfIWB4OO33CmJY4Qp1Se5R"),
-"abscess": DRIVE_LINK_PLACEHOLDER.format("1UFe6CWWVPFnavfM5wFLFVed3mby0twKs"),
-"abrasion": DRIVE_LINK_PLACEHOLDER.format("1GWZxQD-6ceBd1AtHlpeI9cEzQZdApPjr"),
-"abortion": DRIVE_LINK_PLACEHOLDER.format("1nIXeomLtAocWimCTGpXtk7QJzWtsXEPF"),
-"address": DRIVE_LINK_PLACEHOLDER.format("1ftpXqJO53LeVCmBouFw9Ql4H5RTw02ml"),
-"asbestos": DRIVE_LINK_PLACEHOLDER.format("1jLn5YM0-DOA_Nyg-GV25bldsEJD-Ionz"),
-"austria": DRIVE_LINK_PLACEHOLDER.format("109vCwar_exv0hp0p3gtzX2x7H9lymKgM"),
-"australia": DRIVE_LINK_PLACEHOLDER.format("1xRBFry3eUo4ustCuqZwZCSivWWZK_rCQ"),
-"armenia": DRIVE_LINK_PLACEHOLDER.format("16ZaEdZcIFv5w792PyJdM6bmic6y2aINb"),
-"argentina": DRIVE_LINK_PLACEHOLDER.format("18QEnLD3jbmPd1pQ5TN8ePe9fYuGmQdLK"),
-"algeria": DRIVE_LINK_PLACEHOLDER.format("1fZk1qTGW2ALYvNnLY8jUGhuw3FwcZSqw"),
-"albania": DRIVE_LINK_PLACEHOLDER.format("1z1JsWGF7y2eN22HvVrTDNKi89mnQAkU7"),
-"afghanistan": DRIVE_LINK_PLACEHOLDER.format("1ZTUUvwmj8vGP-eiF_iqhNwcRmP00jhn7"),
-"alarm": DRIVE_LINK_PLACEHOLDER.format("1OenZVMDA59IavVg6T5_LSc4tvqy-bcgS"),
-"abacus": DRIVE_LINK_PLACEHOLDER.format("1bmsQjVwZqWTMZ7hquyXppuvW13Teim6k"),
-"archive": DRIVE_LINK_PLACEHOLDER.format("1J1wpBMHDrFexNK5ty096fxEVZcnaZH6s"),
-"android": DRIVE_LINK_PLACEHOLDER.format("199BW9skbxRMJjmK6dw9NKHQlE8s7-syl"),
-"august": DRIVE_LINK_PLACEHOLDER.format("1TOqscNJxh8GqKferg9EAe1a5Zcyvdc2I"),
-"april": DRIVE_LINK_PLACEHOLDER.format("1f3Roj7SsTgYbQLM55RhQrQWisStsdDdd"),
-"auger": DRIVE_LINK_PLACEHOLDER.format("1esCK-bOPG6quj1h9lBtVKqKibKYccW4t"),
-"abrasive": DRIVE_LINK_PLACEHOLDER.format("13muA5bO5793kk7wIzURfd0t5p7S4olgv"),
-"ancestral": DRIVE_LINK_PLACEHOLDER.format("142K08qgRvtumOiq1AFsfLIL8jnHMAvlH"),
-"assembly": DRIVE_LINK_PLACEHOLDER.format("1GerMKDIUySHG3ViLp6wbMQwsQV3ShnBO"),
-"agnosia": DRIVE_LINK_PLACEHOLDER.format("1wJmAdXuyoE7lXJqJeWmjSLkoU1_S_XgU"),
-"adolescence": DRIVE_LINK_PLACEHOLDER.format("1WRHtjgiOCWIRkGKt5oeiJOes2mvELeIk"),
-"adenoids": DRIVE_LINK_PLACEHOLDER.format("1k71uvlKrGYAC3xc1fHjwxUxCsAg-ZqMh"),
-"addict": DRIVE_LINK_PLACEHOLDER.format("1yzSLHL-3GeHHAygfdE20IV1CeR688GN3"),
-"acromegaly": DRIVE_LINK_PLACEHOLDER.format("1xCOykmnFVQGAsn2KHvhDfFun2tfMyMxt"),
-"acne": DRIVE_LINK_PLACEHOLDER.format("1rv75q6zx3t-a07bWidX3yiRWp54G7Y19"),
-"appurtenances": DRIVE_LINK_PLACEHOLDER.format("1E-JLko2pC8zmluB0gWa4e3L3t-q0Dg1j"),
-"abdomen": DRIVE_LINK_PLACEHOLDER.format("1boXbrSgB5LzJAer_lCmLaLHJeZCPzOPX"),
-"anorak": DRIVE_LINK_PLACEHOLDER.format("1ymXD7-Xhan_hqMEGKtpSTodjMiwt5r94"),
-"armature": DRIVE_LINK_PLACEHOLDER.format("17fB25wUOzP9YdoeEwBBePlgmvhkkpmPu"),
-"ampacity": DRIVE_LINK_PLACEHOLDER.format("1HxUXiGQ120irzE79H-VdcCjCuBEM6xLG"),
-"alternator": DRIVE_LINK_PLACEHOLDER.format("1o6yjmnjxqE0KIw0a7JDAImF9VBx_nhsb"),
-"apartheid": DRIVE_LINK_PLACEHOLDER.format("1V0lXSRmx829JHnZfN-tmvWMSS4p5V_ZQ"),
-"autobiography": DRIVE_LINK_PLACEHOLDER.format("1bitQ8a0LkP4AuV7_XTzMfDPzTOKmyqy1"),
-"artifact": DRIVE_LINK_PLACEHOLDER.format("1zyk78IU16Jt-u9b497sjr-5bSTPRx2-g"),
-"ambassador": DRIVE_LINK_PLACEHOLDER.format("1yJtIYUalgxbcQ33hcfBVLkypq5aEZZb7"),
-"ahimsa": DRIVE_LINK_PLACEHOLDER.format("1JdYuLuine-jxbbE1bFDPRt1lPXc88GrD"),
-"adaptation": DRIVE_LINK_PLACEHOLDER.format("1B0l02AvGiI4DlyBXznfcB8AWQTqDFtcw"),
-"accession": DRIVE_LINK_PLACEHOLDER.format("1CJsy1yV8aGhkV0ftRA2Yt48H7msWepzR"),
-"accessibility": DRIVE_LINK_PLACEHOLDER.format("1iyzzxihIqfS27CIeWw0loSyWLU6y_FRF"),
-"ataxia": DRIVE_LINK_PLACEHOLDER.format("1O_NvNAfEUzEOYyTmuP1brLIxqACxfcF8"),
-"astigmatism": DRIVE_LINK_PLACEHOLDER.format("13j4rj0Exw9mUXqkjMb04KYlmByrk0L2c"),
-"aspirin": DRIVE_LINK_PLACEHOLDER.format("1eM-NkYQL77Azir1zYLahYb4CHFzGmABW"),
-"arthralgia": DRIVE_LINK_PLACEHOLDER.format("1dYwpCUOL-738pMFncNIhavdqyGFrRdxg"),
-"arrhythmia": DRIVE_LINK_PLACEHOLDER.format("1wKvQNk8aSmeGt11Tqk-rUptueIy4p78Y"),
-"aromatherapy": DRIVE_LINK_PLACEHOLDER.format("188uIAuIJKO0FjaEQcLwGscF4WnA7mg9C"),
-"apnea": DRIVE_LINK_PLACEHOLDER.format("1LDimiRHKGy6K_Kj69OZ7CTTsb0s4JaqL"),
-"aorta": DRIVE_LINK_PLACEHOLDER.format("12ZtTMWHKiA3x2-PWSwDcTzQmHri32-kn"),
-"antitussive": DRIVE_LINK_PLACEHOLDER.format("1bjyH5sf7VqEXmGQc2iw7a_y_oY3OTXXl"),
-"antiemetic": DRIVE_LINK_PLACEHOLDER.format("1Ch5NZ_pP9Niebzfbg4_Si79sNxC_ibZt"),
-"antidote": DRIVE_LINK_PLACEHOLDER.format("19NcTpvUhNg5Mxzh6JrHCyVS_fwYjPP0N"),
-"antidepressant": DRIVE_LINK_PLACEHOLDER.format("1LJkxtLvj1u9bAP5qwgv9aTEKVP5JlFg3"),
-"anticoagulant": DRIVE_LINK_PLACEHOLDER.format("1c18YE8daMvuJ_yoJcywM4LFhKldWgGO4"),
-"antacid": DRIVE_LINK_PLACEHOLDER.format("1pAW3V38dITUNhAYRGaIvfgpDT4349Huy"),
-"anoxia": DRIVE_LINK_PLACEHOLDER.format("1HBMbSOudPske7F85RjlVgeEujDzlqSub"),
-"angioplasty": DRIVE_LINK_PLACEHOLDER.format("1_QWdNOJPegU9F5mIqgYPJV-G0dc2hKOp"),
-"angioedema": DRIVE_LINK_PLACEHOLDER.format("1rspUnoc2gOFaIYGu8J8iadIg2mkvAVxT"),
-"anesthetist": DRIVE_LINK_PLACEHOLDER.format("1wG-TTPAb_0fC3JqNSQ_niWzV9k1scZFo"),
-"anesthesiology": DRIVE_LINK_PLACEHOLDER.format("17uKol0yk71w3saA464GuHKyzBF78MQiN"),
-"anemia": DRIVE_LINK_PLACEHOLDER.format("1LIJDR9iW1eDvd4E8VZekoOY1mxfTCPu8"),
-"amoxicillin": DRIVE_LINK_PLACEHOLDER.format("19ls3ErPZgeCSVh77Yflsv76xyYYnV89L"),
-"ancestor": DRIVE_LINK_PLACEHOLDER.format("1n-aEbWqdw1ZhRpe-1tZzQno2lbAEXuXJ"),
-"app": DRIVE_LINK_PLACEHOLDER.format("11NKSp1taJ3EJmY_pykXfSrQh0a7MVVWW"),
-"axe": DRIVE_LINK_PLACEHOLDER.format("1ifJ5z42GtEsFSRlb08O_GvOP35rhP2kh"),
-"asia": DRIVE_LINK_PLACEHOLDER.format("1QwWAsAjXNu_r684B4um-OFOqS9OepDYE"),
-"antarctica": DRIVE_LINK_PLACEHOLDER.format("1v4lw5QoXTNkh5MSV65g-CXE6Z-hup9mH"),
-"africa": DRIVE_LINK_PLACEHOLDER.format("1TP7jizucoMM0uUwsh_ZuFYkMPexeB3A0"),
-"animals": DRIVE_LINK_PLACEHOLDER.format("1dbcO76jjI1Q7hWtHtTbwe7boYmznK1NO"),
-"apple": DRIVE_LINK_PLACEHOLDER.format("17kTTMK5vkL1avoCssvTHsDxvkQov6zv_"),
-"astronaut": DRIVE_LINK_PLACEHOLDER.format("1RwlwRARybnJHSR1feb0ncHN4UsSya-pO"),
-"anniversary": DRIVE_LINK_PLACEHOLDER.format("1kIGFIH48EyR4Wu2q0_AyrvaJHyzD6GL_"),
-"autoclave": DRIVE_LINK_PLACEHOLDER.format("1cOrvfZTPp47fvq4R9FLE2M_Dclr-yPNt"),
-"avalanche": DRIVE_LINK_PLACEHOLDER.format("1thBUhjo-OKxTvks_OksgiX2jTUpShNAp"),
-"autumn": DRIVE_LINK_PLACEHOLDER.format("1et15J3e7ubS4vE4HDDFXeWm2H0G-2SYV"),
-"archery": DRIVE_LINK_PLACEHOLDER.format("1keNISzltFFYA7WNxqdphblSmI8-x8jb8"),
-"ant": DRIVE_LINK_PLACEHOLDER.format("1iUaM6LMH8ueomKKFuEPT-KZZ-7xcIvRD"),
-"accordion": DRIVE_LINK_PLACEHOLDER.format("1HqrirWP1wEmhSrPMMoaCdoGyF7nvHxRp"),
-"automatic": DRIVE_LINK_PLACEHOLDER.format("1F-2YFgHuCfaVfckbeq_WBVR2pHpp7Xl4"),
-"ashamed": DRIVE_LINK_PLACEHOLDER.format("1HDVzm7qGYYJNs-N50HnkE3RHZ9gEw1MS"),
-"apply": DRIVE_LINK_PLACEHOLDER.format("18d_H0_ALOErxR21I3Gc_tqhUfZOMJbJZ"),
-"application": DRIVE_LINK_PLACEHOLDER.format("1Wqh0sJ7x9mwRl6fD8fs_xpHpAb0Vs2t5"),
-"applicant": DRIVE_LINK_PLACEHOLDER.format("1_CrKKENeKQyW8gS1rARI7VE7z3o69kJ9"),
-"allow": DRIVE_LINK_PLACEHOLDER.format("1BxW2aeQgX4l30RjGPp3idD2bSf5TWfGv"),
-"all": DRIVE_LINK_PLACEHOLDER.format("1rTDEWVWZEIoqRv_TY2AD_r5bILBShIZq"),
-"alive": DRIVE_LINK_PLACEHOLDER.format("1IR9iefJw8X3MGXywuoDX1qQwE_0om1hW"),
-"afternoon": DRIVE_LINK_PLACEHOLDER.format("1KRXCHtxEzcw1jU0ALfm84iFDzjTVZPck"),
-"add": DRIVE_LINK_PLACEHOLDER.format("1S3TlhxAe7H3IPH7_wEJVZ8jPzggph7Hk"),
-"accompany": DRIVE_LINK_PLACEHOLDER.format("1wjr6TFK-6jvgtNKfTG2usSi2-G9XdKIk"),
-"accident": DRIVE_LINK_PLACEHOLDER.format("10AXisyIhDcvXcNLLLRYn2JCrFnYQZDTh"),
-"available": DRIVE_LINK_PLACEHOLDER.format("1_43N0gYHORA9zRscjap4TS702HXe9MQ9"),
-"autorickshaw": DRIVE_LINK_PLACEHOLDER.format("1RLKgrGuM-XPNQ2v3v6pYikCtESUJp7oN"),
-"aeroplane": DRIVE_LINK_PLACEHOLDER.format("1d6Mi6AZPaz7IzLX7Z99a9pzt0tFperXW"),
-"any": DRIVE_LINK_PLACEHOLDER.format("1uj-thj7rDw8tGbudXlZ43_0sZ8_wde9B"),
-"after": DRIVE_LINK_PLACEHOLDER.format("1FBfOFXFqlTjAFtVemlzp6iMQUKUyl16O"),
-"audiology": DRIVE_LINK_PLACEHOLDER.format("1eMYU_asxwn23VP-ttj8IAlfHffWghOBe"),
-"audience": DRIVE_LINK_PLACEHOLDER.format("1zLWE1Bx9uCKY4aVf2THACjLbZgQHdK4_"),
-"attitude": DRIVE_LINK_PLACEHOLDER.format("1FJCvdt0agw1ZSZmExTy3N9sLfLynNAZU"),
-"assume": DRIVE_LINK_PLACEHOLDER.format("1TSJq2q5jXEtFxDs6pBt06cwV6UZE9pJ_"),
-"association": DRIVE_LINK_PLACEHOLDER.format("1-qOnFOhvvd-wlinLtbpttFh_nh7ntJPb"),
-"assistant": DRIVE_LINK_PLACEHOLDER.format("1bPjb6_qQ7tmjsPEFv7UOuCYfob4Z0tC-"),
-"approximate": DRIVE_LINK_PLACEHOLDER.format("1wyR_0-ngrTuRVdCcGO9twbgcOd9fcMMM"),
-"arrogant": DRIVE_LINK_PLACEHOLDER.format("10_diYZP27DZM6z-7deoK6pw5XJG8-IPj"),
-"arrest": DRIVE_LINK_PLACEHOLDER.format("1zmcAbPivm1vJzMyOnIiE5KH6_J30ChfE"),
-"around": DRIVE_LINK_PLACEHOLDER.format("1GEgCsfF4hujWPeDdCKLzubE9qVJ7LqFO"),
-"army": DRIVE_LINK_PLACEHOLDER.format("1D6LSGA1fu5EMYS-xidv8fnrk2KjTbg-r"),
-"answer": DRIVE_LINK_PLACEHOLDER.format("1J1qaClGbHNSEzaHI0MSxUML0XGIs1luK"),
-"appointment": DRIVE_LINK_PLACEHOLDER.format("1JLPjeLxWHoeaV_U0okqPVJydodrbTc4U"),
-"apartment": DRIVE_LINK_PLACEHOLDER.format("1vZWxGteY-ZnllyDuLlnflw0lgr2DKjrm"),
-"anxious": DRIVE_LINK_PLACEHOLDER.format("1ILdx5OKDp9axlqKf6xOdEPr-vd4fciZU"),
-"analysis": DRIVE_LINK_PLACEHOLDER.format("1wyKKVQe1pwssY47Lo_dGi1WYdqJ5R7Vs"),
-"among": DRIVE_LINK_PLACEHOLDER.format("1fQzaf9ynRBAG4U5P7URMOULzVfMA7xT3"),
-"ambitious": DRIVE_LINK_PLACEHOLDER.format("1WbRTkSVB6w97DrhTwYTcKLqFwBPtV_T8"),
-"already": DRIVE_LINK_PLACEHOLDER.format("1Q0j6xAJA-lcPKaw7dWM5ljybaDcgaYXi"),
-"alone_solo": DRIVE_LINK_PLACEHOLDER.format("1Af-_K9E1LKCer8qeRkkZxy76OdiMcb_T"),
-"across": DRIVE_LINK_PLACEHOLDER.format("1TFEqKrqcvHdNTOafzfeCtN2nUZiUu-T2"),
-"air": DRIVE_LINK_PLACEHOLDER.format("1WwB5fcruvvjNdWx7yS6D0SfvBi6sgGUj"),
-"andrology": DRIVE_LINK_PLACEHOLDER.format("14aqLoIA3v845DzflihbqcbhWDcAQxeJB"),
-"arraignment": DRIVE_LINK_PLACEHOLDER.format("170yYQUdPnveaps9vqMI6k2e2JLPVoasI"),
-"annuity": DRIVE_LINK_PLACEHOLDER.format("1s1PD_mqz66W7UAfeMSMMWePXOY1002h4"),
-"affiant": DRIVE_LINK_PLACEHOLDER.format("192U3NF9IM_ggGsnEEeSX6VrtsrY-djCz"),
-"arthritis": DRIVE_LINK_PLACEHOLDER.format("1ksrt8W51UbNPBl1my6IUaTk-HNtvMEmo"),
-"affirm": DRIVE_LINK_PLACEHOLDER.format("1riKrAaSZGnNvdvbwk1RrieRiyXIcrFHl"),
-"applause": DRIVE_LINK_PLACEHOLDER.format("1_3VGzWTNqXuyFOsZv7v7tAHdSlKDAT-D"),
-"amazed": DRIVE_LINK_PLACEHOLDER.format("1YKCzjGIIyJmzbqC3G6Vg93eDc0YoKv1j"),
-"advertisement": DRIVE_LINK_PLACEHOLDER.format("1AZKA_mSdWu-AxAWB560volELrHY67m2w"),
-"apron": DRIVE_LINK_PLACEHOLDER.format("1RYXIQxVR2kYotR4bw7Z2h3kBj-6M8t9K"),
-"algebra": DRIVE_LINK_PLACEHOLDER.format("1F65vSXUlKMc6UrHxtetlvUxambBOedkS"),
-"ammeter": DRIVE_LINK_PLACEHOLDER.format("1lNpwFCHhlIeqHvkYrcaNyVc7AXcGVTmi"),
-"addition": DRIVE_LINK_PLACEHOLDER.format("15ra1jhgKNNxUnnUkPPq3pi2xakFGamDM"),
-"asthma": DRIVE_LINK_PLACEHOLDER.format("1K1QAJhjESJLd-D7K9zCLBmVF5g3kMVAN"),
-"anaesthetists": DRIVE_LINK_PLACEHOLDER.format("127nukAv5W9iYh1mmGYPCHa3GfVcJ7w77"),
-"allergies": DRIVE_LINK_PLACEHOLDER.format("1VWK7QNduGldU2eLLXViiZxnySatK19f9"),
-"aids": DRIVE_LINK_PLACEHOLDER.format("1hWL9_3EO_1KFoXP5KQx9bGPKXzjUAX-F"),
-"adrenal": DRIVE_LINK_PLACEHOLDER.format("157ZxnE-k6AB_hChaGD7n4PvEXWkmXbqf"),
-"ambulance": DRIVE_LINK_PLACEHOLDER.format("1o8ATOBt88zl09rACY-LrBrLiGa-A601g"),
-"almond": DRIVE_LINK_PLACEHOLDER.format("1gxxOfJEHEd8rWqz9v2og1pIZzvnTRYLL"),
-"alert": DRIVE_LINK_PLACEHOLDER.format("17VAIOkQ1kOklz1-fySDbU4aKmIgbRZq9"),
-"at":DRIVE_LINK_PLACEHOLDER.format("1zC0AejJLxh4eWDm8cepouzsQk7pAMp92"),
-"attention": DRIVE_LINK_PLACEHOLDER.format("11k4j5POyRGkZ4RfNucB3wK_p5zZY7RWo"),
-"above": DRIVE_LINK_PLACEHOLDER.format("1V9MD3wwA7by74CQ-g4Zh6h5BOHbd_jiK"),
-"abscond": DRIVE_LINK_PLACEHOLDER.format("1MCKTmGVAJn_y3pc6PN0j9vJ6uHZIwNm6"),
-"burette": DRIVE_LINK_PLACEHOLDER.format("1PDf3c-Vzm3JnC9jA1qoUK1sD0g9hUKH0"),
-"biomedical": DRIVE_LINK_PLACEHOLDER.format("1XPKMV-ESEh6gqrh2Z2tz_Vf_ep8n7Nbb"),
-"bioinformatics": DRIVE_LINK_PLACEHOLDER.format("1yqEW2gB6R_d8Cm-9YHYlzUvm_DslY8xc"),
-"biochemistry": DRIVE_LINK_PLACEHOLDER.format("1wVo1iGWSBDKylUrukdf8ADH57ChyEUZu"),
-"bedrock": DRIVE_LINK_PLACEHOLDER.format("1ZHqnbhbbENihTvWSn8nwpRkFZeyUqqch"),
-"battery": DRIVE_LINK_PLACEHOLDER.format("1zmcdOlDzUEINWebnsOmNxFw4igXkoEGi"),
-"base": DRIVE_LINK_PLACEHOLDER.format("1Ib9u8_9aqFwrg__zJIh9gCIvsWj_ifo6"),
-"bet": DRIVE_LINK_PLACEHOLDER.format("1DbVwj1icfZMmkXQxCEbzRTLdUxPhXFuJ"),
-"bharat": DRIVE_LINK_PLACEHOLDER.format("15r6kcLp0Vt16qiP1oarLoPaAIAruyhWB"),
-"breeding": DRIVE_LINK_PLACEHOLDER.format("1k0u74i0OOvGpayfJGImU7gxoZn_-VEeU"),
-"bail": DRIVE_LINK_PLACEHOLDER.format("1D76_YppT0AIYzbiY-bizhMVNCz2jEmou"),
-"biology": DRIVE_LINK_PLACEHOLDER.format("1N5nCsUckJ529X6BGFJmwvwgo3zxCoZrT"),
-"bacteria": DRIVE_LINK_PLACEHOLDER.format("1oHKe_ISNXzun6_Q3_FTsMv72Ul0lmES3"),
-"beaker": DRIVE_LINK_PLACEHOLDER.format("1TaUfic0xX4tH-qK0Vvb1uVcoGltC1nUI"),
-"base": DRIVE_LINK_PLACEHOLDER.format("1_ed4xBFZZNp5LLM9K-AsiLpbZZPbZwma"),
-"battle": DRIVE_LINK_PLACEHOLDER.format("1m07pSD_a83Rjyb1xauFSMSxDG6PvPzeT"),
-"burial": DRIVE_LINK_PLACEHOLDER.format("1tJMMiUx3GqnTwjfqyVpzSlWVQMCgAyQP"),
-"bihar": DRIVE_LINK_PLACEHOLDER.format("13aX2fJJFBQaMlPK-dA45L0Z0wVzUvn1l"),
-"bhubaneswar": DRIVE_LINK_PLACEHOLDER.format("1oUuU-DoO1TuBNOetmWXDHhvNvLPGY63h"),
-"blotter": DRIVE_LINK_PLACEHOLDER.format("1nTzQPL3eVMmcd3KSQDlDP_2i37hzVkM5"),
-"brokers": DRIVE_LINK_PLACEHOLDER.format("1dStGkOiaI5ZaikUS1PxdwGKxx1cJMREL"),
-"benefeciary": DRIVE_LINK_PLACEHOLDER.format("19Kg10OBYyYrvnPkijjA4ZPdxufWnVw03"),
-"bank": DRIVE_LINK_PLACEHOLDER.format("1kOz55lu31LBkzEfA48ZrTxZcErizEFAg"),
-"budget": DRIVE_LINK_PLACEHOLDER.format("1MAhwpCm1Zx2KxYvwSHVQaZFVMIofh2R6"),
-"business": DRIVE_LINK_PLACEHOLDER.format("18hP-kkEePs0X9x_Gq2PR8EEPwtEOemci"),
-"brokerage": DRIVE_LINK_PLACEHOLDER.format("1pcNAzmYNdUt2cb4odN4jwfkKw3tekpQR"),
-"borrower": DRIVE_LINK_PLACEHOLDER.format("1dd_rEItmt91JDWI56iPrPZ0K-H1diXxw"),
-"bankruptcy": DRIVE_LINK_PLACEHOLDER.format("1TagoC0VClPkr4CP_KgAY4CNsdOyubMyk"),
-"bonds": DRIVE_LINK_PLACEHOLDER.format("1Jlp12dG7lwnC_Cxm-2YgP2McHT5O4R_f"),
-"blight": DRIVE_LINK_PLACEHOLDER.format("1B1zZZr5lAVoCthJ5203INiWCjcIXcASA"),
-"bambusa": DRIVE_LINK_PLACEHOLDER.format("1Sa2xXAIndxcUokKneMIE9253FUeUYYCS"),
-"bund": DRIVE_LINK_PLACEHOLDER.format("1YihKMSFonT9EFJljB-JSgDpP3hxvE5TW"),
-"broiler": DRIVE_LINK_PLACEHOLDER.format("1E5bJJLbiPFEg6HjbD1KdcaAJR-IyAqPZ"),
-"breeds": DRIVE_LINK_PLACEHOLDER.format("1GGp0b1Rv9nc8tfOxSwXjz4OrPQHdF7nS"),
-"brackets": DRIVE_LINK_PLACEHOLDER.format("1xMIXf_zCak9izCobaT9ustIRi_YDrsmQ"),
-"bombarded": DRIVE_LINK_PLACEHOLDER.format("1TwmxPPbgm9LLL6htxEeKP6cjR4o77aQt"),
-"border": DRIVE_LINK_PLACEHOLDER.format("1nuu9mdzvwsPndfxJ8PuSiYoA8fXrCfwM"),
-"block": DRIVE_LINK_PLACEHOLDER.format("1ZUvJ5R66Py4IHmjI63imob2_mEpXmlLO"),
-"bottom": DRIVE_LINK_PLACEHOLDER.format("1uliJGAJAq9F4dKhegV1_FI3d1d4CTesu"),
-"beat": DRIVE_LINK_PLACEHOLDER.format("1_fkVaeIBZmj92NYayxRtTratbYuY5ZNu"),
-"blow": DRIVE_LINK_PLACEHOLDER.format("18nPxP-mIFPJftaeKP4djJPzSh2sYulz4"),
-"become": DRIVE_LINK_PLACEHOLDER.format("1rhfuWkUV6VorcNXjQNKImYrKf5aOTqcd"),
-"bullet": DRIVE_LINK_PLACEHOLDER.format("1x0SFQaDNoPzvXgKGjjo9FzUkT0079be2"),
-"baseline": DRIVE_LINK_PLACEHOLDER.format("1HubSLUQD4AxgBpJmErtUThBYdhhC7JZv"),
-"blurring": DRIVE_LINK_PLACEHOLDER.format("1VpqKnLeTgBLlcX29MOQxgY8PrsFKbFzz"),
-"balloons": DRIVE_LINK_PLACEHOLDER.format("1gPaumhNyvq9w5xcwYfvI6SKctc2NDLeK"),
-"backup": DRIVE_LINK_PLACEHOLDER.format("1V1fEiFLk_XNwczoEF0_bQC4UvWdJo4Oq"),
-"blogger": DRIVE_LINK_PLACEHOLDER.format("1mVQAVIg2CiPk-iM8XdKJpH3skbLFcfP3"),
-"burner": DRIVE_LINK_PLACEHOLDER.format("1d2hp_Lc8nAXYfv3OU1f5-gx1IPyS8gkt"),
-"bisector": DRIVE_LINK_PLACEHOLDER.format("1QXnry1fG1zkvmCPJzVKyG-kVR-TTCVj1"),
-"breastfeed": DRIVE_LINK_PLACEHOLDER.format("1A8__Jn7a4MXsuXk2ruoyCc1EbpKbTy4r"),
-"birthmark": DRIVE_LINK_PLACEHOLDER.format("1P-LvO44Zi6L6d_Ry8vEjqG3sQiprjgEp"),
-"bouquet": DRIVE_LINK_PLACEHOLDER.format("1BJt0wFOf-9Dbu8uJLwLL9KX2dMwmp7QB"),
-"blanket": DRIVE_LINK_PLACEHOLDER.format("1oGp8ClbNGmDnpoEVB0tCVIhGb4ul0Ms2"),
-"badge": DRIVE_LINK_PLACEHOLDER.format("1CjKEglXbajxcWVekEuHeDRny3Em35sH1"),
-"bails": DRIVE_LINK_PLACEHOLDER.format("1NJewFyeiVUFFmEZh1s6wgw2La3qTCaSv"),
-"behead": DRIVE_LINK_PLACEHOLDER.format("1Wut3EKm11qvM94DwaI9Jz4poEdn0rDTf"),
-"blend": DRIVE_LINK_PLACEHOLDER.format("1huhZJxsCUlj9MfnSb75mnqJCcUcAkSHZ"),
-"beaker": DRIVE_LINK_PLACEHOLDER.format("1buhXAersnlqleLsFwap-RuHdi-6HZmD3"),
-"bookmark": DRIVE_LINK_PLACEHOLDER.format("19peojXYSQvDgbSfXxVyxOw7FGQSClArq"),
-"blink": DRIVE_LINK_PLACEHOLDER.format("1DZ_Q-U137ae7KUeTPHLQlegZfmHvh2Wp"),
-"bedwetting": DRIVE_LINK_PLACEHOLDER.format("11KPEQW7U22u3zX0jr0wMuYsQ8OEETjtl"),
-"bandit": DRIVE_LINK_PLACEHOLDER.format("1h0kGYlYyHXO1ih0_6_PW9K_WICntQOvd"),
-"blank": DRIVE_LINK_PLACEHOLDER.format("1EzcACmqPs2gDKMG1l8fkVU4VTcimPLXI"),
-"brownfield": DRIVE_LINK_PLACEHOLDER.format("1yugK7fASaCBYFr8Wn7UVNAcy_STRPtU7"),
-"borrow": DRIVE_LINK_PLACEHOLDER.format("1ZQP7SmKL6BIrbiQAefY2NCwhAlroe-EZ"),
-"boreal": DRIVE_LINK_PLACEHOLDER.format("1eQDKjO1fBj_-sddabadXVhbnt47R4vZp"),
-"bluewater": DRIVE_LINK_PLACEHOLDER.format("1xSX9wU2GyXG1b9KpjyrQi7Xh7KKH4tiW"),
-"blackwater": DRIVE_LINK_PLACEHOLDER.format("1CRyZXcnnKIOl2nfUka6OqCYRM6OEnvfK"),
-"bioremediation": DRIVE_LINK_PLACEHOLDER.format("1Uaqw-9CMLgcV-raCic3Mu0x3RoVsS64-"),
-"bioregion": DRIVE_LINK_PLACEHOLDER.format("1vwSnQKbVVdskNpBF1oM-xxzXBBAF_VeN"),
-"biophysical": DRIVE_LINK_PLACEHOLDER.format("1K-gH4HcN8CZVlbG9cMKaxdSnlq7vYwfj"),
-"biome": DRIVE_LINK_PLACEHOLDER.format("1gBBPlmfODylEQMqzNibkFZlweAvIPwz7"),
-"biofuel": DRIVE_LINK_PLACEHOLDER.format("1SzQhhwH1lziBd0xeoWJ38Ze7yCV1G9GL"),
-"bioenergy": DRIVE_LINK_PLACEHOLDER.format("146PmIv6_aSra43JdKLBBLRQcjjYOlvDC"),
-"bioelement": DRIVE_LINK_PLACEHOLDER.format("1KO0damQ9D3liMwx8WR7DKT99NwgMsiTp"),
-"biodegradable": DRIVE_LINK_PLACEHOLDER.format("1F1FhQ3_TS_O0BLjvsQna5gM6Cpy_Wgm_"),
-"biocapacity": DRIVE_LINK_PLACEHOLDER.format("19LjO-Eq2i9KqGkDTH6KaaI73YY1aYBzP"),
-"bioaccumulation": DRIVE_LINK_PLACEHOLDER.format("17F_r8msNiketxrr0egCAePjK-d2cxc7-"),
-"bimodal": DRIVE_LINK_PLACEHOLDER.format("12vllL_XICerJ9Plj1vB457KToQTmdve2"),
-"baseload": DRIVE_LINK_PLACEHOLDER.format("1V7GPMjsszn8q-mwLTuuzxr8AqvCfIiY4"),
-"baffle": DRIVE_LINK_PLACEHOLDER.format("1Ox1VHf4fZX20Eeak3RsiOn_sZLLlVHqR"),
-"backflow": DRIVE_LINK_PLACEHOLDER.format("1CivHklzI6eIBBbcBUyrVkEF2O-5drEF8"),
-"bagasse": DRIVE_LINK_PLACEHOLDER.format("1pMYPlTDmL_yi7k_FqWP4GyNjJzsAZsHw"),
-"berth": DRIVE_LINK_PLACEHOLDER.format("1JXyLedHt_0keHmW5-IWD1JbMUl16c-yE"),
-"bakery": DRIVE_LINK_PLACEHOLDER.format("1OQzE9CSOIacmlwx6k-bjfCGYShsy7W7k"),
-"ballet": DRIVE_LINK_PLACEHOLDER.format("1rqHvPucVYWbJZqErhHR_O0T_AbnFaa3P"),
-"broker": DRIVE_LINK_PLACEHOLDER.format("1bdy2hsj43s63ZaQjBaB9AYKO1EAnbwld"),
-"bailout": DRIVE_LINK_PLACEHOLDER.format("1c0dgbJdkKZh6VJJYgvBQyloVhc6YVRBj"),
-"budget": DRIVE_LINK_PLACEHOLDER.format("1Gt4aheyzbQKPwd1O09Bqerfh0bOkRFwM"),
-"branch": DRIVE_LINK_PLACEHOLDER.format("17k8VEekP55otZ5eAqiaTeLPYKR9UQq_N"),
-"backdate": DRIVE_LINK_PLACEHOLDER.format("1ylMtf3vBEuwQr8O98mMgNUw7_xFUqi7m"),
-"babylonians": DRIVE_LINK_PLACEHOLDER.format("1w5k6M14e8qWFThAu9kk4jPrscDhvp83F"),
-"burqa": DRIVE_LINK_PLACEHOLDER.format("1bNdLFN4e0OiFpKk4BxSFpN33-qj1t2ZW"),
-"branding": DRIVE_LINK_PLACEHOLDER.format("1lTMIPAyVGpqPvB0ilPXW8z9A1V6LNTpO"),
-"boom": DRIVE_LINK_PLACEHOLDER.format("1vVt_rcMHvxdIev461hd_4WXVhZSa5uYq"),
-"billboard": DRIVE_LINK_PLACEHOLDER.format("1ansrGhd_64HYYqHijLlZ2nsxUuAP75Vx"),
-"benchmark": DRIVE_LINK_PLACEHOLDER.format("1iGmzR3J1C1fyJKKv2eOLymWnS3M2F4JW"),
-"bidder": DRIVE_LINK_PLACEHOLDER.format("1jcxH7D5ATMhRqEx9hBUE0jhntcSM6cr4"),
-"beard": DRIVE_LINK_PLACEHOLDER.format("1LriPsuerjOSeg1JZF3tqZSH8d88M2qeq"),
-"blacklist": DRIVE_LINK_PLACEHOLDER.format("1jVcfObx91OOl4i8LJvTk2v8wq7kma0bT"),
-"bleed": DRIVE_LINK_PLACEHOLDER.format("1kncS4a51kej4cdfZ8IXKoNOGtDuC1Rpj"),
-"beehive": DRIVE_LINK_PLACEHOLDER.format("14Jr_g5nZbv2jlynrG9SbPVc-FjL6J3Rc"),
-"blindfold": DRIVE_LINK_PLACEHOLDER.format("1CNWdjfiMjbsvZSPWSWHbF-yL3D8O6WZl"),
-"bulletproof": DRIVE_LINK_PLACEHOLDER.format("1BVa_wEvsmQW39G775Y0byB3ztG71h18p"),
-"bottlefeed": DRIVE_LINK_PLACEHOLDER.format("1xrRazgRtufpJ1JSVVvWc9I5BbMTZz_Ty"),
-"beware": DRIVE_LINK_PLACEHOLDER.format("123sSD5g79gtbLvaJSfRp0mOfFl2ArGE8"),
-"bedridden": DRIVE_LINK_PLACEHOLDER.format("1tbBv823XS_6gMiKzfKSFXGXYWPMhu3Pm"),
-"banquet": DRIVE_LINK_PLACEHOLDER.format("1Q6RwmUF0n7N0Yb0GoI-da65MLMJ7nMv3"),
-"banner": DRIVE_LINK_PLACEHOLDER.format("1ceELWC9s5qMMFKUvSjDPieMzt7MUndkM"),
-"bald": DRIVE_LINK_PLACEHOLDER.format("1MSGdHogbJ7i6m7SRanzU8z26vhZTFpi2"),
-"balm": DRIVE_LINK_PLACEHOLDER.format("1vUcY9O8HiJKrFYWXyQ3qi1a3Bf4_NS2p"),
-"bte": DRIVE_LINK_PLACEHOLDER.format("13hIKc8PeRG0J9zVYDbe-0Z6zo9j3PHI3"),
-"bureaucracy": DRIVE_LINK_PLACEHOLDER.format("1l6y5dvnlSQQg-Mf0SgBMpLWU8VAjogAa"),
-"bigamy": DRIVE_LINK_PLACEHOLDER.format("1uUx56JrRg2gjvRvSNvSR6kJNak5fADH0"),
-"bench": DRIVE_LINK_PLACEHOLDER.format("1iCovu2VDin8juE8vYUNE0KHlUQ7BpBxV"),
-"barter": DRIVE_LINK_PLACEHOLDER.format("1ZuZb916iNb1XXMqYbwVcfDcrLTRJpmIb"),
-"bar": DRIVE_LINK_PLACEHOLDER.format("1BanvkyFSAlqosnKI1HfIZZL8JGFwQVfc"),
-"bankrupt": DRIVE_LINK_PLACEHOLDER.format("1cRPiedkPJ-ZStKqpbQfT5V5XZoP6R8xk"),
-"bailiff": DRIVE_LINK_PLACEHOLDER.format("1HzUYalMsRE6zn4TQr1X5YEvp06k-qKRW"),
-"bail": DRIVE_LINK_PLACEHOLDER.format("18dESaHu2whRXEWlqEyVTGJUggqLvn59Q"),
-"backlog": DRIVE_LINK_PLACEHOLDER.format("1wGw5E2-IhNa0WkgkZ6Pa6EAtwa0BKHnd"),
-"byelaws": DRIVE_LINK_PLACEHOLDER.format("1Dzuqom61cjfsVK4XCfVFqv5ytB3ZNUA6"),
-"buffet": DRIVE_LINK_PLACEHOLDER.format("1Df-QmWIFjFl9KOMKNayBkWA0Gagv07fQ"),
-"bone": DRIVE_LINK_PLACEHOLDER.format("1XPbiHjg2XZEL2eRdhGF8dII1TEurqMTE"),
-"blocks": DRIVE_LINK_PLACEHOLDER.format("1GFimFfOQXG6HxvWPHEe3v1w7LyCHmjgF"),
-"bindi": DRIVE_LINK_PLACEHOLDER.format("1yuHlqavBP1R8QMp8fjQq7De-sgUsn476"),
-"bat": DRIVE_LINK_PLACEHOLDER.format("1KrcxRsdO9lRqsPwC8iyXYJTSTOnZnZqL"),
-"ball": DRIVE_LINK_PLACEHOLDER.format("1JDVg6NEeaSebcotDNx6IoZIeocHsWRkC"),
-"basketball": DRIVE_LINK_PLACEHOLDER.format("1t7o8CVwMUKfnORygrbcxw17hZxZkhYHg"),
-"booking": DRIVE_LINK_PLACEHOLDER.format("1SdlEmG8Iuo95nNxBImZy3ot0HacdmQrr"),
-"biodiversity": DRIVE_LINK_PLACEHOLDER.format("1dLxJV2ojNnq11qiUQdAlQlVoowwArREO"),
-"bilingualism": DRIVE_LINK_PLACEHOLDER.format("1J1euypd3op4PmxlKhAVs6Hlppw7ZiyJt"),
-"burden": DRIVE_LINK_PLACEHOLDER.format("1zfvw8NoStlQUENUfbQ7CZJMCq-E61HRr"),
-"but":DRIVE_LINK_PLACEHOLDER.format("1PYvffEAY7bEMr7t-MGc_yNQLw8l_gAfs"),
-"bribe": DRIVE_LINK_PLACEHOLDER.format("1yvfZr1cML7WKvgXbuiArBxb9Xm-omRuL"),
-"builder": DRIVE_LINK_PLACEHOLDER.format("1sAlqL5jtiEZ1wKjD95csq55ekopjPuW9"),
-"banker": DRIVE_LINK_PLACEHOLDER.format("1rrEIVykT6LubL584euWEC50_StOaWfvx"),
-"brahma": DRIVE_LINK_PLACEHOLDER.format("1N6-u2fuY0Y_30iNVJWolLEMw5CC7qjnX"),
-"brown": DRIVE_LINK_PLACEHOLDER.format("1Wl4AGKs48lL0EzMso-P5mTMFyZMwkjJt"),
-"blue": DRIVE_LINK_PLACEHOLDER.format("1dY4fH00H3iLMlVjmjxYV5O60FCtyVIsh"),
-"black": DRIVE_LINK_PLACEHOLDER.format("17Ea9lNO54_RE1Jiuq6xXcYKgiFseRNVP"),
-"bsnl": DRIVE_LINK_PLACEHOLDER.format("15bLZfs3LhOIoBNd3plOFH0ahpBn_-pRb"),
-"blackberry": DRIVE_LINK_PLACEHOLDER.format("1nWUSTuAxbAVbU5AerCNQAUtrsjxmTpao"),
-"bengali": DRIVE_LINK_PLACEHOLDER.format("11Fv5mahBbLKWmvwgc7Gi5z5ybRiPkCjk"),
-"batching": DRIVE_LINK_PLACEHOLDER.format("1j7aVs1xchSA-QhbbnGy-10pf7WoXcjcc"),
-"bmw": DRIVE_LINK_PLACEHOLDER.format("1TJrz137cEoky05l2j94Jn_AwsoPyK4-f"),
-"bowel": DRIVE_LINK_PLACEHOLDER.format("1AAQWt40oqoeA6p3974bCqmJcgV8h8YT1"),
-"boil": DRIVE_LINK_PLACEHOLDER.format("1T_bq-15aPdSiTLAVWoO_0c_a3ekUeswW"),
-"bladder": DRIVE_LINK_PLACEHOLDER.format("1oCZ4O-_VUCLRq5ebm8tHM7iz3N7003OT"),
-"biopsy": DRIVE_LINK_PLACEHOLDER.format("1AU70Jf0zMdTGfheQU-emYFz3nHWuxZ2E"),
-"batman": DRIVE_LINK_PLACEHOLDER.format("1bd0yxAogLysBmWH_ecxCWdrQueMncf3t"),
-"bowler": DRIVE_LINK_PLACEHOLDER.format("1Da9-OTURkeAHmQwqGokqbx3IKQqCDyOX"),
-"bat": DRIVE_LINK_PLACEHOLDER.format("1rEDBURBLxdMbxifBiLozHzdvjqZbVnN6"),
-"banyan": DRIVE_LINK_PLACEHOLDER.format("1JvX2_TSxlkASm9M7x9AlB0IVEbfSQQ4e"),
-"boolean": DRIVE_LINK_PLACEHOLDER.format("1WgglkqBuxN5mOY7H4NRGhBbWpAIHoV-_"),
-"bromeliads": DRIVE_LINK_PLACEHOLDER.format("1g4MmCYNPG0dUhWu7v_QcKVM4AHdkauF_"),
-"broadcast": DRIVE_LINK_PLACEHOLDER.format("1G114j2QPSShfn1n8HjrCTaSR4Mb9TvbG"),
-"boiled": DRIVE_LINK_PLACEHOLDER.format("1c6GejNRBjGNiHUNxW7eBuNvgaphkXfaB"),
-"biogas": DRIVE_LINK_PLACEHOLDER.format("1xNfFpPRpibdVkvuNLyA2OFtENgt58SzN"),
-"bedouins": DRIVE_LINK_PLACEHOLDER.format("1YSpw846IuNoSdwwjOjNJU-_z7LYr8EMt"),
-"bride": DRIVE_LINK_PLACEHOLDER.format("1hiKFh67sZeq1kVqgiglvPOGxvpA4Wbi_"),
-"beam": DRIVE_LINK_PLACEHOLDER.format("17SAY4t_ZCwyck7piP7tHWbC7Sn0-JXYp"),
-"brothel": DRIVE_LINK_PLACEHOLDER.format("1wVg-LzkAcffC0sP9R2pE6wgh-xHEhgGG"),
-"baluster": DRIVE_LINK_PLACEHOLDER.format("1e_vb0TKzsVFJP3vJPlZwF15SdUHGZ8W2"),
-"burundi": DRIVE_LINK_PLACEHOLDER.format("1GVFNfty6VOoMj8M1V2psFI36RfS9NuEF"),
-"brazil": DRIVE_LINK_PLACEHOLDER.format("1AhgmxVCT9pZw4BzPGDiT1GsnS7ecPocf"),
-"belgium": DRIVE_LINK_PLACEHOLDER.format("1tOY0VAenl0gG2v8vgeksVR2SIJ1uvaI4"),
-"blouse": DRIVE_LINK_PLACEHOLDER.format("1I1OZbhQ-HiqrDWUnt8fEfScu9JTqrUg_"),
-"beautiful": DRIVE_LINK_PLACEHOLDER.format("1n4d78NhkBEU3l3gkYYkeeFcHx7nj2me6"),
-"beer": DRIVE_LINK_PLACEHOLDER.format("1eO_1_5aO2ookIaZy8xeSW9JLnR931uVw"),
-"bread": DRIVE_LINK_PLACEHOLDER.format("1_pdGVDIAoSCvfLcUH9KdmDgitB0bDBy_"),
-"bib": DRIVE_LINK_PLACEHOLDER.format("1PUkfB1ANdV0cjqASY325WDpB8KcNbHxp"),
-"bell": DRIVE_LINK_PLACEHOLDER.format("14v8MvUgyi_6iW6dTL-QI-AwWXofqm5L5"),
-"baseball": DRIVE_LINK_PLACEHOLDER.format("1QziFILaoPlbt9-afQRX1dHi_fckkIjJB"),
-"binary": DRIVE_LINK_PLACEHOLDER.format("1AKeOsmOPkOjtC3aImjb8vvDnM4W5y8e-"),
-"bcc": DRIVE_LINK_PLACEHOLDER.format("1jX0mjDwr8mdfMT7c_g9Hk9vX1Bfr8Gqo"),
-"behind": DRIVE_LINK_PLACEHOLDER.format("1cgDAAMWo-XhJzsOW6xvvkxcjB1xtStye"),
-"basil": DRIVE_LINK_PLACEHOLDER.format("1yqKFMzuTBjPLLFWnTACCwmGUa7Y-xqsB"),
-"bright": DRIVE_LINK_PLACEHOLDER.format("1wtT030Va5QGdhHzxrfFI1uoLS1a2t6_s"),
-"bag": DRIVE_LINK_PLACEHOLDER.format("1KyUy2XrhUHZgR6KfbjLnru9f-9vKBDx7"),
-"button": DRIVE_LINK_PLACEHOLDER.format("1VtyrdCoWY_pCCZkSZVuHJxp6rNjoe0Rm"),
-"belt": DRIVE_LINK_PLACEHOLDER.format("1caSZJq3kbSs5TtcAI_sakPOXe3YJG95q"),
-"bangle": DRIVE_LINK_PLACEHOLDER.format("1QanmtbvaeLgEYAu2I-hF7zroFUzVYqs5"),
-"bangalore": DRIVE_LINK_PLACEHOLDER.format("1R1SJx0hOx4FQGLuAtJI6lK7BXvXjJ_HK"),
-"bushes": DRIVE_LINK_PLACEHOLDER.format("1WJxy__ruia-eaFlTpu1cnwMKjvWGHiMf"),
-"bearing": DRIVE_LINK_PLACEHOLDER.format("1ZI-GFvy6bxVde2qEEjdZuE-EWEQ_ghZH"),
-"betray": DRIVE_LINK_PLACEHOLDER.format("1xcK-nRUTHOTGanuN4_e5qFbUVXPYI8ak"),
-"boring": DRIVE_LINK_PLACEHOLDER.format("1lKTeOlkIdHFgk7l3DHL7haO2MkrP6O1K"),
-"brand": DRIVE_LINK_PLACEHOLDER.format("16c4iyIhWYW7rBKq-iUvxuR3I_eWu6Rnd"),
-"breathalyzer": DRIVE_LINK_PLACEHOLDER.format("166jvs6YCYfUeO2CEZyQdYmPCHraKatzS"),
-"buckle": DRIVE_LINK_PLACEHOLDER.format("1lmsui6iAOmlSXnGUs5zalCLGaFeP8mmi"),
-"bodice": DRIVE_LINK_PLACEHOLDER.format("1CHIPZ1dIIbQwnWqRo_K3NaHs0JoEyvdC"),
-"bobbinet": DRIVE_LINK_PLACEHOLDER.format("18LPJHVPN8nnycctkNQ7O4DNIK-WDxFgD"),
-"blouse": DRIVE_LINK_PLACEHOLDER.format("1LZhQ59BmmC7TP3dLp1r6iSKGkVJv6TCJ"),
-"bleeding": DRIVE_LINK_PLACEHOLDER.format("17wBfE-WhW9za0zCdBxIKelXs5_nvK6Ug"),
-"bertha": DRIVE_LINK_PLACEHOLDER.format("14NHgqyOWQiA4swVtbMKVh6_vkmpOJtmu"),
-"basting": DRIVE_LINK_PLACEHOLDER.format("1bO8iKIWxwZ5pbhFM5v8GHRvJcFUygcgc"),
-"balmacaan": DRIVE_LINK_PLACEHOLDER.format("1yjf5BEXWJHSCa_nz2hJqJzr7JKxMG2tN"),
-"batter": DRIVE_LINK_PLACEHOLDER.format("1iRgToVeBp5y7fLn_eoN3AQ9tEVrRebI4"),
-"bulimia": DRIVE_LINK_PLACEHOLDER.format("1XAuixWLx56c2wLrl27V3VA3ZeMG2lOt0"),
-"bruise": DRIVE_LINK_PLACEHOLDER.format("1zU4MqSTOYf__GZkXWHJj1mNM1D3-91h2"),
-"bronchoscopy": DRIVE_LINK_PLACEHOLDER.format("1Jva-PnYw3WGNxh8_zUcI9Ia_SAUJwxlt"),
-"bronchitis": DRIVE_LINK_PLACEHOLDER.format("1yx6sliTu_TKCYwsr7nBDGsg6B-mTZWy8"),
-"brain": DRIVE_LINK_PLACEHOLDER.format("1oVV2juJb9M_EICBgEOqloe9FdokjTqxr"),
-"braille": DRIVE_LINK_PLACEHOLDER.format("1eOjiCuEq7L0Zh0lhaQP3GFBwIRLCt17C"),
-"boycott": DRIVE_LINK_PLACEHOLDER.format("1f3ei2ybnh4mDFxMe3CWMbGasHPuyjK-P"),
-"blackhole": DRIVE_LINK_PLACEHOLDER.format("1vAnM7ZyYmrhJTZvuXWeHCHI_IKlSti1a"),
-"biography": DRIVE_LINK_PLACEHOLDER.format("1-WXgSj9uF51xLysmUZ45v_51pDt0FVZq"),
-"behaviourism": DRIVE_LINK_PLACEHOLDER.format("1aY7RW768NgzcROlMeE_NxQuwezw0WFYy"),
-"behaviour": DRIVE_LINK_PLACEHOLDER.format("1xmhWKhBLjEmGaFMkLYYZZfYjyQ1Crpk4"),
-"ballot": DRIVE_LINK_PLACEHOLDER.format("1v3OVxUO1TC3Q1PjY_-FEy9zRUXTSGUIt"),
-"bile": DRIVE_LINK_PLACEHOLDER.format("1E6zt0OMm7oZuHim82qljQ84fxSQ9-MKp"),
-"bifocal": DRIVE_LINK_PLACEHOLDER.format("1c-jwl76zGxjj3SWktSCinO4NdtqAUTEh"),
-"benign": DRIVE_LINK_PLACEHOLDER.format("1PuuLfPmHqVF1WPkx9Kip2FOGFfrwTxNG"),
-"bariatrics": DRIVE_LINK_PLACEHOLDER.format("1DXZdTwFEJJwq8DC-VodVO1VfPVtV-R6f"),
-"baldness": DRIVE_LINK_PLACEHOLDER.format("1zxjs3arSV0m7pDQp0BfiztKgYphRSdc_"),
-"bhopal": DRIVE_LINK_PLACEHOLDER.format("184vIUc9ufI3geoleCYGLtQx2KsO0pio6"),
-"backache": DRIVE_LINK_PLACEHOLDER.format("1B2gzGWwuGDe_s_F5IIuElqeB9WE4NDiw"),
-"bulk": DRIVE_LINK_PLACEHOLDER.format("1_zXzjiuQYaPfa0n2IN9RVmP_YcexMOD3"),
-"bonus": DRIVE_LINK_PLACEHOLDER.format("1XNjvu67Y-FlDBV3KEx7STXl6CTvC7iG2"),
-"biometric": DRIVE_LINK_PLACEHOLDER.format("1EBYPsZ-PQD4L0ku5db0GHlZv96NVg4T8"),
-"biased": DRIVE_LINK_PLACEHOLDER.format("1okfXR0rv2xSlrWdUsRvXIuCf8E-FQDN6"),
-"bestow": DRIVE_LINK_PLACEHOLDER.format("1r00KyDh2Eu-BjYJgwTFrpIzorAt-pYeA"),
-"belief": DRIVE_LINK_PLACEHOLDER.format("1R1Jje8h-sfiVU-t5d1ar5vXO71Saehct"),
-"bigotry": DRIVE_LINK_PLACEHOLDER.format("1Ip0Jj8R1yzPu_gyWRAwna9u8JB74tIKU"),
-"bamboo": DRIVE_LINK_PLACEHOLDER.format("1CDTcXK2ida-Qbbr8_rSJyQqHDxLHcH4A"),
-"brace": DRIVE_LINK_PLACEHOLDER.format("1rgKXTnqH6crT-BtBk7Gs2Kylrww4dcnO"),
-"bulb": DRIVE_LINK_PLACEHOLDER.format("1EYhQdeTuX_1XxcvICoI5QQKx20v972-G"),
-"brochure": DRIVE_LINK_PLACEHOLDER.format("1yUK2CtTHVMbybf0VNf9mxwmuHxsiBLbw"),
-"briefcase": DRIVE_LINK_PLACEHOLDER.format("1B5VAc-1lgqpWfR84yHQcuPf1nGW7dWzd"),
-"brick": DRIVE_LINK_PLACEHOLDER.format("1kuJ2LddPm5Yh5UVzvWPCItxu8cr7r2Pi"),
-"box": DRIVE_LINK_PLACEHOLDER.format("1zvjoHovpcplbh6zHzVdgRA3v-PmLWckw"),
-"bowl": DRIVE_LINK_PLACEHOLDER.format("1CG5KIGZ1txVLb0HB8-kugtINs7CBq_0Q"),
-"bottle": DRIVE_LINK_PLACEHOLDER.format("1rNTefV0wTZqRw2EfjM3Mjba21u8Gbqbe"),
-"book": DRIVE_LINK_PLACEHOLDER.format("1G2I_aeRDKpkr-SDM3AzR5-LbJs5DixGM"),
-"basket": DRIVE_LINK_PLACEHOLDER.format("1Gtqs4_-fIFUzvJ_eshjNPkxCOXaWLMPg"),
-"bandage": DRIVE_LINK_PLACEHOLDER.format("15zP4zSKpn8EP6LEr8FDO80V-G-t8tM8a"),
-"balloon": DRIVE_LINK_PLACEHOLDER.format("1R4LqkBe3evOb1TeYmUtsRWMS0062p1Yn"),
-"ball": DRIVE_LINK_PLACEHOLDER.format("1rZ1lbjruwPCgNMNYN1lxG23tOU5DSbZ4"),
-"bangladesh": DRIVE_LINK_PLACEHOLDER.format("1lkhleF1BhuKNx8BkW7b9tIW0G3hWgV0H"),
-"birds": DRIVE_LINK_PLACEHOLDER.format("1wnai_jaejbjOlYoCeN97HOZpf0ZOZ_9E"),
-"beetroot": DRIVE_LINK_PLACEHOLDER.format("1qMaoRHbE-gvlh7ihZeLbd49oL9EtXv7J"),
-"banana": DRIVE_LINK_PLACEHOLDER.format("1tyAKJJJUMCaZxO5jflFUZW1silvNqyzu"),
-"blower": DRIVE_LINK_PLACEHOLDER.format("1ltbtIMrkQAPrQlriHhfZWZzELpHM2Oqk"),
-"beach": DRIVE_LINK_PLACEHOLDER.format("1OaFIvW5VzVOf1cABdpLbkgHejr8qG5T3"),
-"boxing": DRIVE_LINK_PLACEHOLDER.format("1w4GSPnhNUrusK4IeufO3UaRLRXDPmpSJ"),
-"butterfly": DRIVE_LINK_PLACEHOLDER.format("1hYeESYVdtvguzjQJpSc64I7fsfLrSogn"),
-"bull": DRIVE_LINK_PLACEHOLDER.format("1ezHTjoPgNsYKrpB3uzMeJAKq8b1V3Wqe"),
-"buffalo": DRIVE_LINK_PLACEHOLDER.format("10tUs2vgoak_nhnyPOs3nBup8Gla4UBzN"),
-"bear": DRIVE_LINK_PLACEHOLDER.format("1FLoYWw-qG9P5g3IC2zDQaLpR5kp_5s8w"),
-"bugle": DRIVE_LINK_PLACEHOLDER.format("1jm9n7XFJBbxXk0g5j06qJZPom-dYTTJm"),
-"born": DRIVE_LINK_PLACEHOLDER.format("1Gs5SwLKyd26F3ypCXpSybKK9dSGVt6_o"),
-"bus": DRIVE_LINK_PLACEHOLDER.format("1p2NIj_kPNcDH2h7BOHBilPng37nssWrB"),
-"boat": DRIVE_LINK_PLACEHOLDER.format("1gBOYoCIRwpcBFh8_zZO7wxycPmqWX-jf"),
-"bucket": DRIVE_LINK_PLACEHOLDER.format("1fSEBna79qI14VOvEh-fHZkDRDj27b6um"),
-"broom": DRIVE_LINK_PLACEHOLDER.format("1pXQWuQXYl4KgfXMfzCdYSa06owQfkCtX"),
-"bonafide": DRIVE_LINK_PLACEHOLDER.format("1bwpbNh0fa6zkXp5GtKpMYyheSrgYyrLz"),
-"before": DRIVE_LINK_PLACEHOLDER.format("1dALzSYWdgnyFfo0DVc-KFp5o5MVEJme6"),
-"basics": DRIVE_LINK_PLACEHOLDER.format("1UkiemVyxXVws4URACpvnH1i7BSmkmZzM"),
-"basic": DRIVE_LINK_PLACEHOLDER.format("1DdCyxlkgftn5r9sS-De7hsZAiHfptWue"),
-"barrier": DRIVE_LINK_PLACEHOLDER.format("1K4otaAoLZw7HBG2YaXhDTvJd7RsHFoRW"),
-"barber": DRIVE_LINK_PLACEHOLDER.format("106MgypuGz5IgQBHnBJFFFLXHBn9evaVH"),
-"ban": DRIVE_LINK_PLACEHOLDER.format("1J4S8_sNp9qPWPsm7uLDEUxtRG0m8cYSR"),
-"bake": DRIVE_LINK_PLACEHOLDER.format("1tAot3IJVcu-TGvfrQZ1p1xJ8ZpzWIfoK"),
-"bad": DRIVE_LINK_PLACEHOLDER.format("1vHlcQ7zUTOKBicONJYbC994wpI4JVQaf"),
-"background": DRIVE_LINK_PLACEHOLDER.format("164VZNyZBqyAZZVwEt6ob4vZvavjbpEUe"),
-"back": DRIVE_LINK_PLACEHOLDER.format("1EN061DNnwFHePNjIbjF90HQBdRVDcZ9K"),
-"baby": DRIVE_LINK_PLACEHOLDER.format("10YH73KZyI5jScWLnIsBLmWchAsMqxfae"),
-"badminton": DRIVE_LINK_PLACEHOLDER.format("17lLRHnDVYA5CIQH1ChecpJo6WkbAJ7wZ"),
-"blackmail": DRIVE_LINK_PLACEHOLDER.format("12Xh1ip3yKv_DY8J2hc42Rp46IGz7HMGi"),
-"browse": DRIVE_LINK_PLACEHOLDER.format("1sqPybjuqW5kSfrqHu1legqzu3EdSEa2m"),
-"broadband": DRIVE_LINK_PLACEHOLDER.format("1Gu-4W73VFd8Ao2Fu3sD-mMZl5EYOFRpt"),
-"boot": DRIVE_LINK_PLACEHOLDER.format("1P5-CvLzpbQDWNBILwJBVLIJkQM_OQLvW"),
-"boyfriend": DRIVE_LINK_PLACEHOLDER.format("15OhjRdkJwSJOCr0l9F85qD8mG3G0Jul2"),
-"bold": DRIVE_LINK_PLACEHOLDER.format("1JRbK8uKAefmAtvhvT2EpdpL8vhi26ORB"),
-"burn": DRIVE_LINK_PLACEHOLDER.format("18fxbDr1Q-FT8WChmyjr2__LLYbhtyNUB"),
-"brief": DRIVE_LINK_PLACEHOLDER.format("1zAqIIuYl-ZrDEuUmCyRa3tuR5bR1GsFH"),
-"breathe": DRIVE_LINK_PLACEHOLDER.format("1HAulfh7bgM2hhflNJ3KvpzVj7CVP0Vy7"),
-"breakfast": DRIVE_LINK_PLACEHOLDER.format("1KsR1XRde6SNuWt6edCKQaLRcEscgOLsM"),
-"borrow": DRIVE_LINK_PLACEHOLDER.format("1b5ktxj7kcxdmcE1fcbav6Nhn1791jzMe"),
-"body": DRIVE_LINK_PLACEHOLDER.format("1Gp1vX7dQR3n66NT4RTINVIsdD6YG3PtK"),
-"bluetooth": DRIVE_LINK_PLACEHOLDER.format("1E82O_ZdxW9HkkEEjXidszXh8FyfbEJBa"),
-"biscuit": DRIVE_LINK_PLACEHOLDER.format("1O8NE3mA7FIY-oO9abTZwnq_oVx6VE7aa"),
-"big": DRIVE_LINK_PLACEHOLDER.format("1TiGTjSmXOf2Xu3Z4mPlmLDph6wEWI6xH"),
-"best": DRIVE_LINK_PLACEHOLDER.format("1BcdSpB3scVnC-Mm9riVY-gRix88YAdRq"),
-"believe": DRIVE_LINK_PLACEHOLDER.format("1yXJ3EUog27RRH2XqHl7pV_wgocX2NbaI"),
-"bedroom": DRIVE_LINK_PLACEHOLDER.format("1XdjZ7ZVlsr0_IBCJ8TzWproAXB4dDraS"),
-"bathroom": DRIVE_LINK_PLACEHOLDER.format("1OxmZKYsMe1YUE87HooNl9g9UtvXyAC6R"),
-"bath": DRIVE_LINK_PLACEHOLDER.format("1kwoKaDvOPnEz_oI55maQFGSU79-zsm7a"),
-"bedpan": DRIVE_LINK_PLACEHOLDER.format("1vap-XAuNSGrKeI6oAaClHKQ4x2l2zcge"),
-"beaker": DRIVE_LINK_PLACEHOLDER.format("1UIojpLXTqxjcdFUy8xzgtBlsE7i6y80j"),
-"biology": DRIVE_LINK_PLACEHOLDER.format("1AEIPTvhkmWVWL7C68FMkR2kQaIQsu1fK"),
-"byte": DRIVE_LINK_PLACEHOLDER.format("1A9oOtPbRrPzeXhcW9KkJ-XuvZ45Gx0u3"),
-"bolt": DRIVE_LINK_PLACEHOLDER.format("10ZINrtwo7NJCPB7pLLSVfRFOttHQG6Ya"),
-"breast": DRIVE_LINK_PLACEHOLDER.format("1B6vBH4kYRcAAvTPMZnabbbQ-wzxnBIje"),
-"bacteria": DRIVE_LINK_PLACEHOLDER.format("1n77RVcbdEV9ywZhiMaGx6MxtgFnglOms"),
-"butter": DRIVE_LINK_PLACEHOLDER.format("1QKhcilr92vYKbchcCA3HrRhGcXa8bdVH"),
-"busy": DRIVE_LINK_PLACEHOLDER.format("1V45XQgyLDdHEnGH2FKwOHRwJn-oUmpRE"),
-"bury": DRIVE_LINK_PLACEHOLDER.format("1kjHrkfzAxB8S_yzo53rVBzrQXNRNuQla"),
-"burger": DRIVE_LINK_PLACEHOLDER.format("1z_R9HOBMpJ1ciWCAu0hjDF9dwOjMmffx"),
-"boy": DRIVE_LINK_PLACEHOLDER.format("10vhTMH_VFUKZ5Pqs9LKoBs0VPEgGRPSJ"),
-"boss": DRIVE_LINK_PLACEHOLDER.format("1WTKEx8dYlqPMgkouifoLNnWv_fhvI5qm"),
-"blood": DRIVE_LINK_PLACEHOLDER.format("1I6nZn3R4BJieourYs3jRatjvzlXbR351"),
-"bless": DRIVE_LINK_PLACEHOLDER.format("14fHn1SCeMszpNZP-zTGii6TT-aQ4gqXo"),
-"bite": DRIVE_LINK_PLACEHOLDER.format("1xUkljhUZUc_jHlJuLIWsTufD8r7AfnyX"),
-"birthday": DRIVE_LINK_PLACEHOLDER.format("1Aa7yNub0VCvqey1D_Pu4tS1ip9Gi1pHu"),
-"bill": DRIVE_LINK_PLACEHOLDER.format("1Vnz3dsLdVlGPimt3nzAFj8CbBQGTNG3X"),
-"bilingual": DRIVE_LINK_PLACEHOLDER.format("144l2aNTvcgahJqRWmrtM2VYO76LSHXfO"),
-"better": DRIVE_LINK_PLACEHOLDER.format("1hU7DGaGDHAuoTvbHL7ySVzmEvAbJrUK1"),
-"below": DRIVE_LINK_PLACEHOLDER.format("1G1Sd50zK0f0k9F9kEAoLtBUNz0zgL9CM"),
-"balcony": DRIVE_LINK_PLACEHOLDER.format("1M4HHz0xp5ETNUz4fwxrRTI4YDRdBgPuI"),
-"balance": DRIVE_LINK_PLACEHOLDER.format("1QN5GCFPlPLslM0ArEtS9YLPIeCRU1ExS"),
-"blackboard": DRIVE_LINK_PLACEHOLDER.format("1s4d2Q5W6AHD-Pl2QeIp8lpYDZN0yV8cG"),
-"board": DRIVE_LINK_PLACEHOLDER.format("1rXUj5YtpygbSAIFh6CNDpr14Ugluo7yD"),
-"cadon": DRIVE_LINK_PLACEHOLDER.format("1yCXxQ6y9kpN0VrzwHXpB829lLo_zX9Ta"),
-"cation": DRIVE_LINK_PLACEHOLDER.format("1U_26iTFb_YmvBg6HrrZ4qtUdG6U9w7LA"),
-"cathode": DRIVE_LINK_PLACEHOLDER.format("1QyoNTernqG2VqEM5hNEy4T8gBkEkiSO7"),
-"cambium": DRIVE_LINK_PLACEHOLDER.format("1S8CyA5Fc3NbkKxTn589hV-qIu4vxx0k-"),
-"capillary": DRIVE_LINK_PLACEHOLDER.format("1T9CqmNYR8WK1Xd0TJhApdnbmbjthgYYC"),
-"compass": DRIVE_LINK_PLACEHOLDER.format("1qjg3VEhgqHnnqNQDJOtC0qScdaj9InjH"),
-"chord": DRIVE_LINK_PLACEHOLDER.format("19iP0fxq_tC9tkXNqswLn6NSPqHZcOKJd"),
-"current": DRIVE_LINK_PLACEHOLDER.format("1CFvpoUYrDcdednhjuFJfbSR9lOw510AM"),
-"curious": DRIVE_LINK_PLACEHOLDER.format("1HWd7UKXVIRxZTphJpGxbIEVQrsrtdXxW"),
-"cure": DRIVE_LINK_PLACEHOLDER.format("1NENk6xP3fr6h-aQBtWEeK3dK9AxNgnCF"),
-"curd": DRIVE_LINK_PLACEHOLDER.format("1fx_ALUINs1VkiRaF-qVRZaayV0I5zJRK"),
-"correct": DRIVE_LINK_PLACEHOLDER.format("1sTwWONB-mZr8Qqgjv1htO7o3CoPKMWpW"),
-"colour": DRIVE_LINK_PLACEHOLDER.format("1RRkPZroLsjSkGXtUd2rl1TNo3m4CmNy3"),
-"collect": DRIVE_LINK_PLACEHOLDER.format("1nJ1h1dKZdZwpjnAQIxcWAsBv8NWaRueZ"),
-"cholera": DRIVE_LINK_PLACEHOLDER.format("1TANg-1zB9wLVj_6S8KUduMUCZMbMrm5d"),
-"charity": DRIVE_LINK_PLACEHOLDER.format("1bdfoVTaSHLCPiAw7atxhZThXHxha7VAP"),
-"chlorophyll": DRIVE_LINK_PLACEHOLDER.format("14Cz8nMj9dsQ_vg982TMuthBjM7cnOTiw"),
-"convict": DRIVE_LINK_PLACEHOLDER.format("10zG5wZx2M4G033m4nOo94gCc1lDw9z6Z"),
-"compensation": DRIVE_LINK_PLACEHOLDER.format("1ynIGwYVlvVAoiL2y2qxfVg3you-1sy1L"),
-"cognizable": DRIVE_LINK_PLACEHOLDER.format("1VcbSMXtlxBJa7EReUKTLgjuXLr2cnurU"),
-"chargesheet": DRIVE_LINK_PLACEHOLDER.format("1Berj0m9MMPP1HTg-h3H8ETiLNfRtxgJD"),
-"creche": DRIVE_LINK_PLACEHOLDER.format("1Qu5FamY5oI_Gt0qAlqTzT6cbjUWjJbEj"),
-"cencorship": DRIVE_LINK_PLACEHOLDER.format("1LGF4Dda6SIQna7yYcDMr8gjBfDYjSyjA"),
-"candidate": DRIVE_LINK_PLACEHOLDER.format("1n0pWw-rYPnnB6lvZ43oUa2xk861U14Li"),
-"constitution": DRIVE_LINK_PLACEHOLDER.format("1yLN_fM9d1CYYDIyBCy3Sy-T8oDn0cvCo"),
-"citizen": DRIVE_LINK_PLACEHOLDER.format("1JJStPWkL1fT_hFCHPg3VdkBQZuGgj9te"),
-"chemistry": DRIVE_LINK_PLACEHOLDER.format("1YuObaAQ9X4AeHu7DVqlnjEeds2pF3aMt"),
-"cud": DRIVE_LINK_PLACEHOLDER.format("12uzlN3pmglU7QJ4qpeyqg53aCqeLsRTY"),
-"conductor": DRIVE_LINK_PLACEHOLDER.format("1OA2JgRsuHlNkaR8IqNDS-v7HHCfjImFP"),
-"climate": DRIVE_LINK_PLACEHOLDER.format("1uSxFbEOIRkJtb9QBMX1vqbSxYZnb7C2s"),
-"cell": DRIVE_LINK_PLACEHOLDER.format("19yfuyE07kAg9WxOGuEberDKoA2rIqmyp"),
-"contraction": DRIVE_LINK_PLACEHOLDER.format("1o2463VaLX6UBkNXpp5aeOQPOMGnTlCPf"),
-"conduction": DRIVE_LINK_PLACEHOLDER.format("1FGh9Sz0947e_oMac_HSctMnRSPoPSWUw"),
-"condensation": DRIVE_LINK_PLACEHOLDER.format("1Onz5p4a71cgKEmtvema4eVAmkPD4L0xz"),
-"carbon": DRIVE_LINK_PLACEHOLDER.format("12q29M8JjVpQuFMpAmLS6TmrJWjHzoKWg"),
-"cube": DRIVE_LINK_PLACEHOLDER.format("1W8HRwCpPdxz-pYaCtOmZvl_1O43nhziq"),
-"cuboid": DRIVE_LINK_PLACEHOLDER.format("1GiAY-LGOMXsVtCvk9Jbgyw-koLe2D7Lx"),
-"cylinder": DRIVE_LINK_PLACEHOLDER.format("1husczsvDnXFxfdyQRS5VbSM7ow1TfEak"),
-"cone": DRIVE_LINK_PLACEHOLDER.format("1mDe75-C3g2uxQPliAx1dIQ5PrEm5I7a2"),
-"circumference": DRIVE_LINK_PLACEHOLDER.format("1elLVXLON6Pyx1EAChYLx_quoNPFW65E4"),
-"centre": DRIVE_LINK_PLACEHOLDER.format("1x2HK3ePcfgr38L3Sq6U-SGyziImnTcyn"),
-"circle": DRIVE_LINK_PLACEHOLDER.format("1OVmwxeTb2HgvupPYU0cjpS_HJUchgXJ8"),
-"curve": DRIVE_LINK_PLACEHOLDER.format("1H77N51vEffdt24wlaCn4NUau7_ConMer"),
-"carving": DRIVE_LINK_PLACEHOLDER.format("1Ch9UCidDteH5vzX0oYpVnTpMTeo-mT_z"),
-"cholas": DRIVE_LINK_PLACEHOLDER.format("1Iot2WS4Zi-Vg_SVI3gWG4ZoZvyDiPxEQ"),
-"cheras": DRIVE_LINK_PLACEHOLDER.format("1YgqVicCxNrKvON6Uvr2T-gzoah1TrSEQ"),
-"chandragupta maurya": DRIVE_LINK_PLACEHOLDER.format("1R3A8MLXQBrvn8QyE21y5n9n1vA3lucK-"),
-"caste": DRIVE_LINK_PLACEHOLDER.format("15VCbW-5SkjeZu23va3B02RTX-Plzib65"),
-"chandragupta": DRIVE_LINK_PLACEHOLDER.format("1aiMTL-GdT5_kaZxRtj1UAiwNsCp-3HFZ"),
-"chariot": DRIVE_LINK_PLACEHOLDER.format("1wIPh5Gadi9T23fFeqlYUnSLPBUnlRoNg"),
-"citadel": DRIVE_LINK_PLACEHOLDER.format("1z2LyyvBQm0jnoXQCysx1YWVrqEHX55d2"),
-"chhattisgarh": DRIVE_LINK_PLACEHOLDER.format("134kkpZDtYlAdV3H1kqvUYZsZAmHo9gJ9"),
-"chennai": DRIVE_LINK_PLACEHOLDER.format("1QqdAs3y-E2Ec0djA2H9lRHMcUeT7mpJB"),
-"chandigarh": DRIVE_LINK_PLACEHOLDER.format("1Ne8lEa-QtvF9xWXQ316-lzBRnYlT0fEX"),
-"coimbatore": DRIVE_LINK_PLACEHOLDER.format("1BHpIOfia0gKBaphiGP97hxJNLqRNe0r0"),
-"contracts": DRIVE_LINK_PLACEHOLDER.format("1ApsV6XoeuGjl95rNU77vlJEPAVaiYo1M"),
-"custodian": DRIVE_LINK_PLACEHOLDER.format("1qkCD7K12-Hd_gx-fihKemRB6nuLPvmGw"),
-"corpus": DRIVE_LINK_PLACEHOLDER.format("1yQA_eTztOH9P3rwzAFWjxpW9Pf80RiFw"),
-"cordial": DRIVE_LINK_PLACEHOLDER.format("12p9-SoLxGQc7qGJNOd6ISWeKCHN1ft9S"),
-"climbers": DRIVE_LINK_PLACEHOLDER.format("1-VevOPPlE6sL7ls40YGo09SOhzwH3rbP"),
-"cultivators": DRIVE_LINK_PLACEHOLDER.format("1_ESnGB8CPOzhuvVT9VGGHyNfjvkmiRgY"),
-"condensation": DRIVE_LINK_PLACEHOLDER.format("169OScN-Wq9u_hrdg48Ak0s0iWrbRfp8o"),
-"combine": DRIVE_LINK_PLACEHOLDER.format("1AOar6QEuh12t1bn2saIKpvKXORnz7Lcs"),
-"chatani": DRIVE_LINK_PLACEHOLDER.format("10-vKUoZffF4bMOqAKbQu-Jguw0lCTBoM"),
-"cultivation": DRIVE_LINK_PLACEHOLDER.format("1gHxQYrcRK9FyH6uRFmmwuV8Qm5WME0ZU"),
-"consolidation": DRIVE_LINK_PLACEHOLDER.format("1cNmbv3SyLiDDqnTQgG1OEhXi7PgYjYJG"),
-"chicks": DRIVE_LINK_PLACEHOLDER.format("17oEshsGWW3J7Kgmh6GIoWbD4Z9XytplA"),
-"chana": DRIVE_LINK_PLACEHOLDER.format("1vMv40cn2Hu3UVS34tM4k_PO2kO6fhdHF"),
-"castration": DRIVE_LINK_PLACEHOLDER.format("18npEZoHBefI1q83oR8QZWWMG419DLNFq"),
-"cream": DRIVE_LINK_PLACEHOLDER.format("1973LNpynymkp3BIn4LqxLaeswhACAV39"),
-"colostrum": DRIVE_LINK_PLACEHOLDER.format("1pYryi5J5F5mW-LWbgMpYe-tntxkqV2sJ"),
-"cock": DRIVE_LINK_PLACEHOLDER.format("1Q_Ce2qhsW-VlDWTI_zqmRg8NWEu-vsL6"),
-"coccidiosis": DRIVE_LINK_PLACEHOLDER.format("1YJUN34Sk9dVaNBiRrq_OVR2FX-8KWGV-"),
-"caponisation": DRIVE_LINK_PLACEHOLDER.format("1pXwEbgBNiNgjy4aw6XZ1tiyMSMzDnhQo"),
-"capon": DRIVE_LINK_PLACEHOLDER.format("1YrWSQevG97ATj-_Dthv97w-X33SIINZi"),
-"cutting": DRIVE_LINK_PLACEHOLDER.format("1ZUrSw6Qt5s0EkzBf-lUfZPlY8cI2Ez7U"),
-"crops": DRIVE_LINK_PLACEHOLDER.format("11fbHB_bpCMWpKSsVrKqKnoTRkVvOkv46"),
-"candy": DRIVE_LINK_PLACEHOLDER.format("1r-0VZc0xRRZniGLUOsqg8BWV_isnNdmi"),
-"commas": DRIVE_LINK_PLACEHOLDER.format("1Cql-zBfh874TTXwO43kPDseFFC-yF93y"),
-"colon": DRIVE_LINK_PLACEHOLDER.format("1cpncyyF8-6Nq6UOGw7RoCRRvG4rbmhAT"),
-"cyclone": DRIVE_LINK_PLACEHOLDER.format("1quHPXwAHJ0gDztMQ-Sm2wuT2Hc7P7Jmn"),
-"coupled": DRIVE_LINK_PLACEHOLDER.format("1zFS2WH-7iyBpvyR19jd1GOa9eiP6pqG-"),
-"commercial": DRIVE_LINK_PLACEHOLDER.format("113ZVwQtgMWyb5RC9nljpODJawpROooxz"),
-"cloudiness": DRIVE_LINK_PLACEHOLDER.format("1HGQVNnT4Y2Rjf1zB-U8SpNX-g0beD5SJ"),
-"crawl": DRIVE_LINK_PLACEHOLDER.format("1ooZeffRovN0LKY4w-EdsmdJClsugtAF4"),
-"consensus": DRIVE_LINK_PLACEHOLDER.format("1bgOuIxrl8lMb_Q2BllMPMeN2GurrwhAh"),
-"customer": DRIVE_LINK_PLACEHOLDER.format("1hBgFJs59GOjMbrvOUE_837LM6CSoVSk1"),
-"competence": DRIVE_LINK_PLACEHOLDER.format("1youqJNG7l4hkWaApWeLUbXY5Lu0rsRpx"),
-"conclusions": DRIVE_LINK_PLACEHOLDER.format("1pPDK4K71Wnc7XqqDTGHYJlsWLl8XM-xw"),
-"comment": DRIVE_LINK_PLACEHOLDER.format("1bSm_8nu72S4RnHt6_Lyxj7_qoh2lI4BP"),
-"compositing": DRIVE_LINK_PLACEHOLDER.format("119c0m-LHjlnUQTWjhH7AW-TIL_Tp9i2Y"),
-"cookies": DRIVE_LINK_PLACEHOLDER.format("1BjkH2pq_CzSASbkqj3CrYGRPNiDw5c2R"),
-"castrate": DRIVE_LINK_PLACEHOLDER.format("1_J894tgVYrDTxLzibPcBU2SLhO16S4Ge"),
-"cocoon": DRIVE_LINK_PLACEHOLDER.format("1E21FS8s6dYc8Sn_afcyEca_nmkOJhxmP"),
-"cells": DRIVE_LINK_PLACEHOLDER.format("1H6IGOXOdTuH53-56X2EwEtyL8BwENj2j"),
-"contract": DRIVE_LINK_PLACEHOLDER.format("1D0ncGOtUgFzYEt0o7ChbE3qKEPsx3cpW"),
-"circus": DRIVE_LINK_PLACEHOLDER.format("1eyCRy49nC9q_1KlE30Icud0WPPdSPdGa"),
-"charger": DRIVE_LINK_PLACEHOLDER.format("15o7NMdJH4RF7YTREM8PGij3knxndYDzY"),
-"cargo": DRIVE_LINK_PLACEHOLDER.format("1oTFC1m9t3R4yP7EUUxrCoGciO154H6Ei"),
-"cubicle": DRIVE_LINK_PLACEHOLDER.format("1MpfskVzCJ4LQOxMnspRhfdRdvi7Q6N_V"),
-"coverage": DRIVE_LINK_PLACEHOLDER.format("1XcN8Q3pOgTNLJ_cgr-bNo1-ElVzGpqWP"),
-"correlation": DRIVE_LINK_PLACEHOLDER.format("1hee9p648YzWxQC2akSXL51KDTOWL3Q-m"),
-"confidentiality": DRIVE_LINK_PLACEHOLDER.format("1N_g-QAjPBWubBBS9qDXOSNCF2YTxTBrJ"),
-"collaboration": DRIVE_LINK_PLACEHOLDER.format("1DQq7rQYyXi9UeehtP9Bag21-yXcv2PWo"),
-"cohort": DRIVE_LINK_PLACEHOLDER.format("1o4y02AmDcd5JQtvUE2QA4yW9-zyrlqO7"),
-"codes": DRIVE_LINK_PLACEHOLDER.format("155rn3BfEgNg8Ip77uJM2lwVkCKXkrrt6"),
-"codebook": DRIVE_LINK_PLACEHOLDER.format("1cpD2J5okNBarv0kWKH9MOmjFmaMolLCT"),
-"classification": DRIVE_LINK_PLACEHOLDER.format("185VYJHl33RBj9-L6jsaPzRJG2EXs30qE"),
-"chips": DRIVE_LINK_PLACEHOLDER.format("1Eln2nd-V5QHNX2vUXkPbQZy5nPlB0r1G"),
-"casserole": DRIVE_LINK_PLACEHOLDER.format("1S4tMvYeCJsNKi6j2S-YviWiU5KySpY1T"),
-"century": DRIVE_LINK_PLACEHOLDER.format("1EeYjCvx9FMN2xFzJaONrUc_7arB2FTpA"),
-"catch": DRIVE_LINK_PLACEHOLDER.format("1OvKACmaoGUQ1RrTi8VX-l9T8YSab6eJa"),
-"crown": DRIVE_LINK_PLACEHOLDER.format("1Rg8i2Qerm9oNORiTbP8a1yasuN7f41iH"),
-"cross": DRIVE_LINK_PLACEHOLDER.format("12LmrNMWUGqQ4dficXSwsbzebazTa-6RL"),
-"chain": DRIVE_LINK_PLACEHOLDER.format("1kGhXriUZj5122s0XoK-cMA7I8tN1J0Tw"),
-"casino": DRIVE_LINK_PLACEHOLDER.format("1-MUzblLTBpFbQF4AC7QvqCQrTpwbbXrt"),
-"computing": DRIVE_LINK_PLACEHOLDER.format("1W3_rRVxiHd14WFQcV_Kvm1U92RVcUXdQ"),
-"ceremony": DRIVE_LINK_PLACEHOLDER.format("1jtdEp3hox2N7NaSo1QJycpaHhEEtCLqN"),
-"conductor": DRIVE_LINK_PLACEHOLDER.format("1E_Yg_FHFb_1eCVffAPkfLowlWsSenU6m"),
-"comprehension": DRIVE_LINK_PLACEHOLDER.format("1HPyPn8d3CUuVXrnf98r7LioWK16fPBcT"),
-"cathode": DRIVE_LINK_PLACEHOLDER.format("1a4dT3DhIgvxDU1x2uHnMOxvx1T2MCdlE"),
-"cartridges": DRIVE_LINK_PLACEHOLDER.format("1JzhBVon3B8nTbzh_haLkkkBPetiUeuwP"),
-"carbon": DRIVE_LINK_PLACEHOLDER.format("1mMks-zbsCY2zDBAo3leEq8lfHqx7FKLx"),
-"canopy": DRIVE_LINK_PLACEHOLDER.format("18rzFjrZ97QoqGUrgP6uBH0tRDqjIJuP5"),
-"criteria": DRIVE_LINK_PLACEHOLDER.format("1kqPRfrU_wzBEa4uMvccyPA9eBz_zxTlj"),
-"cantilaver": DRIVE_LINK_PLACEHOLDER.format("16h63-uFobljsR5cByb5JPwuetn5jLgK6"),
-"crossword": DRIVE_LINK_PLACEHOLDER.format("1ujvk5FWPFWHZWJ1zPrfuS7h6K89ObLUr"),
-"challenge": DRIVE_LINK_PLACEHOLDER.format("1U60xqxYQaO101jfzwfQSv03O6OPJghp9"),
-"cryptosporidium": DRIVE_LINK_PLACEHOLDER.format("1Sm6LuaYcOeXcH8Yg7aEJoIX6un9-3vS8"),
-"cyanobacteria": DRIVE_LINK_PLACEHOLDER.format("1vkB2dQ4H3RD5qcRHsXS8LM61VoHGQ7Gt"),
-"covenants": DRIVE_LINK_PLACEHOLDER.format("1D7-0DbODZrFGfadWHojlM5eDwYjT76Ma"),
-"cultural_tourism": DRIVE_LINK_PLACEHOLDER.format("1lRww_pkcA4y2Tvm0HSu6G9gAs3plQFUY"),
-"cultural_heritage": DRIVE_LINK_PLACEHOLDER.format("18l4PEZokyuWSMBkoKjma9-J9va5g-C_X"),
-"conservation": DRIVE_LINK_PLACEHOLDER.format("1yi_zTEqaMuuxFirTHwDWx1aQ2b6R8lb3"),
-"chemistry": DRIVE_LINK_PLACEHOLDER.format("1bhT316Y-7hAwrcH-BvJkvIqn5jpARncI"),
-"chance": DRIVE_LINK_PLACEHOLDER.format("1RqIevMA2hmRmP9KJbVG4TpNDbD17ee2i"),
-"cacophony": DRIVE_LINK_PLACEHOLDER.format("1DpPeLpH2ug2Og9nAyodizxfWeL7Ve90m"),
-"cost": DRIVE_LINK_PLACEHOLDER.format("1H4ol2jDJ_-EXnC6mXDYTKk2FmmZX-sv3"),
-"charge": DRIVE_LINK_PLACEHOLDER.format("1AhXRlcwO0qjvSgFcVVr2pTGQ0XuP4lks"),
-"celibate": DRIVE_LINK_PLACEHOLDER.format("136kYXRf6Vr_KPu71nq5dZi5nbOG38vmE"),
-"caution": DRIVE_LINK_PLACEHOLDER.format("1oUMg_OqeDIGIY1Wb-hgyTwxCwcDBywGC"),
-"castigate": DRIVE_LINK_PLACEHOLDER.format("1i97ufnfYGlOtHiA3PoirnuNwvb6FzVtA"),
-"culvert": DRIVE_LINK_PLACEHOLDER.format("1DscnnDsdRG4t6OhBFNBMpBOphxoRwzQo"),
-"cullet": DRIVE_LINK_PLACEHOLDER.format("1igl5cotWd2Xn4QgZmtm3KeXc1CmMnSis"),
-"compost": DRIVE_LINK_PLACEHOLDER.format("1ZneLmK2I6EIfCONKDt_IdKMI3DJcRszZ"),
-"coir": DRIVE_LINK_PLACEHOLDER.format("1itjXil7xwl5lpdJMVso9Um68nFsz8f4U"),
-"calorie": DRIVE_LINK_PLACEHOLDER.format("1a2-SkrgDOUjHsKSTy3l8IN-P5Eh-He7z"),
-"chirp": DRIVE_LINK_PLACEHOLDER.format("1z6RCPQyF4Nipa14CvIrl9AXqbnIW2Cyc"),
-"caw": DRIVE_LINK_PLACEHOLDER.format("1onqcC9KgKHA5fYMpm-mgCz9ob012Vsm3"),
-"clarify": DRIVE_LINK_PLACEHOLDER.format("1iPJm5zUqBme0_AtqccvzqFiWfR9_jokj"),
-"cannibal": DRIVE_LINK_PLACEHOLDER.format("1Dndmj_W4ULYntMar1rg8RBxPQYuya_y4"),
-"cogeneration": DRIVE_LINK_PLACEHOLDER.format("1f1G0yVfEkrN5StNBdCGGeDSCyUxUkIpC"),
-"commemoration": DRIVE_LINK_PLACEHOLDER.format("1Pdkyz1s_couqnggOXt1WRQ9kHZZIaJIW"),
-"contractor": DRIVE_LINK_PLACEHOLDER.format("1ihR19SEKAL69u-kjB41XZGyuSMzqY0Jb"),
-"commission": DRIVE_LINK_PLACEHOLDER.format("1dqjSyq88nnWFb8ppkvR4Q7fPYBlgOsut"),
-"comets": DRIVE_LINK_PLACEHOLDER.format("1q1WGTXFnwZYWF4EEtzvxloHZIBXSPg_R"),
-"crisis": DRIVE_LINK_PLACEHOLDER.format("1qX_O1X_MUfgi5RXvR-lZCJ7vjceinibg"),
-"collabrate": DRIVE_LINK_PLACEHOLDER.format("1toYGoEnycqSEH_jiRfuj8KTrXccLHUkk"),
-"cub": DRIVE_LINK_PLACEHOLDER.format("1fHEmVz2BXvbiLGU9nB-yNeqZpr86UlQN"),
-"cobweb": DRIVE_LINK_PLACEHOLDER.format("1YzQqKbFezNU3pJSz0f_cf1ZaEZUEO9z0"),
-"corrigendum": DRIVE_LINK_PLACEHOLDER.format("1wAqQgrMDavS8VrxHRQo5phv424e7Za6p"),
-"collapse": DRIVE_LINK_PLACEHOLDER.format("1yHm1Zp4SFUeNov5Ad2eLTa6LnDMBHnkx"),
-"circular": DRIVE_LINK_PLACEHOLDER.format("1cwJszRYXeemxsAUFfSdeN2wRAqPOb-bN"),
-"case": DRIVE_LINK_PLACEHOLDER.format("1R8ug9hckq0RgpNfNxULXzwdc1mdoPKTH"),
-"crumb": DRIVE_LINK_PLACEHOLDER.format("1_ymJ1A2QBQUK0WeSKsuATDDpxMxGfGJa"),
-"chauffeur": DRIVE_LINK_PLACEHOLDER.format("1gsRQBUSI-lAj6es9MF_aT3FdPQ328Zi9"),
-"cuisine": DRIVE_LINK_PLACEHOLDER.format("1f29fqHurdrR8OCve2JHt-exFhf2ig4qs"),
-"chop": DRIVE_LINK_PLACEHOLDER.format("1mXXCPpvXtAay78CB40Soo-lkT3cfbYav"),
-"cabin": DRIVE_LINK_PLACEHOLDER.format("1r_oHkOKwENFK_sPCHVf5aSRkCYRlnmKW"),
-"cop": DRIVE_LINK_PLACEHOLDER.format("1fzpJaP7VstwSemzqo3wXDVT3kOJklrBj"),
-"contusion": DRIVE_LINK_PLACEHOLDER.format("1OLexfJftUgM1zw8Zg1cFp5Es6nFnKTBY"),
-"cardinal": DRIVE_LINK_PLACEHOLDER.format("1rmr5qktdWHKFnrvl6IhIWtgRDCHGzgXV"),
-"caricature": DRIVE_LINK_PLACEHOLDER.format("1QTaeFUqUeukm-VNHBPEdSwSsDellN4ih"),
-"campus": DRIVE_LINK_PLACEHOLDER.format("1SHiRhOiQKbehDM0rHQCqhAGoQpDTKmJx"),
-"conclusion": DRIVE_LINK_PLACEHOLDER.format("16tCXLF9s0XU4-4HxkTeejI-bz20X9E4d"),
-"class": DRIVE_LINK_PLACEHOLDER.format("1cKibuVOWho0DB4TFIsALbWICGD00at6r"),
-"coda": DRIVE_LINK_PLACEHOLDER.format("1tBnZyqX6WQ1RCnQEVXoMA3H-4jpXGBcr"),
-"civics": DRIVE_LINK_PLACEHOLDER.format("1T5ETvq2zs8pJ69Xd7xBKXf-IxNAEP01O"),
-"congruent": DRIVE_LINK_PLACEHOLDER.format("1YIN8nElkU03CJ_BkSfaHgSFlNxBc4FWY"),
-"circumference": DRIVE_LINK_PLACEHOLDER.format("1Zdf4Wv_47apUH-mypY8BOcDL8rYpOM23"),
-"continents": DRIVE_LINK_PLACEHOLDER.format("1cExj2dlqZAvKUCvw0-RM1ZLvjnhSpJeg"),
-"criminal": DRIVE_LINK_PLACEHOLDER.format("1CO3NzX8Rk04O8FGJfZGi5bRtVQ0WrUaC"),
-"convict": DRIVE_LINK_PLACEHOLDER.format("1PvPAY-r0Ia0nS7aKJc8V-4fofaxOLnaD"),
-"convict": DRIVE_LINK_PLACEHOLDER.format("1PvPAY-r0Ia0nS7aKJc8V-4fofaxOLnaD"),
-"confession": DRIVE_LINK_PLACEHOLDER.format("12KLv-GklW6lXaQHrfGsV-laxrg0_TnEG"),
-"condone": DRIVE_LINK_PLACEHOLDER.format("1Sa_NRqU_9QcIzIWNHm4OUl1eno4hpBqk"),
-"codicil": DRIVE_LINK_PLACEHOLDER.format("1MusGGySkHClmqUoHiGlQaJ58HRbwBLaC"),
-"chamber": DRIVE_LINK_PLACEHOLDER.format("1ahext8aqb6_ascMA-VYGdGBapV5zt8CG"),
-"cricket": DRIVE_LINK_PLACEHOLDER.format("1rbcn89jT_yYcC_z2Ee_GbjMp9Pe5V1En"),
-"cylinder": DRIVE_LINK_PLACEHOLDER.format("1WZMFBdXErBlRQaWa4boC5LKtSv8se6Y4"),
-"clock": DRIVE_LINK_PLACEHOLDER.format("1NRIEuACxG5ZpTT7McP44kHjoRaOljQ0Y"),
-"curfew": DRIVE_LINK_PLACEHOLDER.format("1IhF-UsL9_b3yHYNuYZLwo0glOCbYkW2p"),
-"capitalism": DRIVE_LINK_PLACEHOLDER.format("1pvHCINTnCtQSUFcSQFDcs_F9SdwPOiv0"),
-"cartoon": DRIVE_LINK_PLACEHOLDER.format("1j0FGANU9SNgCuOjpNWYMIWZn4Rrxwite"),
-"coconut": DRIVE_LINK_PLACEHOLDER.format("1FfeNOqFWnoypIFJhonW4EcXYUisFPfu7"),
-"cloud": DRIVE_LINK_PLACEHOLDER.format("1YGQx_5G0knee2YgtF7eMeQ1wenAbNX2U"),
-"cold": DRIVE_LINK_PLACEHOLDER.format("1y7M0BacwUmMGPT27MQYroMvPCqQIm9yd"),
-"cycle": DRIVE_LINK_PLACEHOLDER.format("1RygsiVu3hKredS6kykCGcKxPqSU1HczR"),
-"constitute": DRIVE_LINK_PLACEHOLDER.format("1LIWty5jO7OBLH_GmkeddkQ1gy0OjsMWK"),
-"crime": DRIVE_LINK_PLACEHOLDER.format("1OrnTfgapgu3oLK5tx-vAbO76htzgJmDY"),
-"construction": DRIVE_LINK_PLACEHOLDER.format("1m0_7jRZN_jBTh2naY2B89YhJ1M_cN3KV"),
-"confess": DRIVE_LINK_PLACEHOLDER.format("1LRIPpL7CHVpjxSdnI_v7ZzEDSqn7hlQ8"),
-"cystitis": DRIVE_LINK_PLACEHOLDER.format("1N0Aq1HPUGy43TTR64NyRF2fVSGaHTgWA"),
-"cornea": DRIVE_LINK_PLACEHOLDER.format("1lwBlE9MYLCUThDMrs6q40a_Yq7uiiz6Z"),
-"cannula": DRIVE_LINK_PLACEHOLDER.format("1WkSKrceaJQq-bJ6pjRuTF4W-ZSv7bdaz"),
-"coolie": DRIVE_LINK_PLACEHOLDER.format("1tkxBr04QpB2WV9pELi2NLavbAzxiF4zF"),
-"cobbler": DRIVE_LINK_PLACEHOLDER.format("1L0HJbBQtCYMCNS515ov058RTWGsAuizq"),
-"coach": DRIVE_LINK_PLACEHOLDER.format("1O4SmTSgIAyXc0GBxCSz1FcMJ4GIel-9X"),
-"chef": DRIVE_LINK_PLACEHOLDER.format("1eR71rnSYbQd1hClhUOeK0aoefB_lxBmF"),
-"carpenter": DRIVE_LINK_PLACEHOLDER.format("1kk5ttwDJ4OTfuci0wl8Fuq42wj97kvxz"),
-"christmas": DRIVE_LINK_PLACEHOLDER.format("1TN47g3Qm0R7KljAbZu30gaTfgl23-duA"),
-"cycling": DRIVE_LINK_PLACEHOLDER.format("1QOfHjdks9J1tvTM5SvI7wDwB436cq3QQ"),
-"cytoplasm": DRIVE_LINK_PLACEHOLDER.format("1KU06uHbXrxjsKe9mOpNsVlGCvjvCFuxT"),
-"cuneiform": DRIVE_LINK_PLACEHOLDER.format("1HPLdsUNtUGwJub0Ne9p1ssPjTu855ScD"),
-"creepers": DRIVE_LINK_PLACEHOLDER.format("1z8OjZlWlBlWwhPFJuvGlHYzg2_xw6XPv"),
-"cowboy": DRIVE_LINK_PLACEHOLDER.format("181N-EmUO5uvCsJ3EO-zuAdBcT5fw1eFZ"),
-"convection": DRIVE_LINK_PLACEHOLDER.format("1jFOcaOwabnZaCngOS90MRT4T3mmj0vyG"),
-"contraceptives": DRIVE_LINK_PLACEHOLDER.format("1jy91nTSO8XUxDqm1ntYX3qhmw8vOk-90"),
-"confluence": DRIVE_LINK_PLACEHOLDER.format("1nRH1WC7B1hby400x8dy78sK09a10wyWx"),
-"compound": DRIVE_LINK_PLACEHOLDER.format("1US8op0XsDcyBTSacvi9SLqMDkmJPvad6"),
-"combustible": DRIVE_LINK_PLACEHOLDER.format("1ujiFPKN3otTQ3wPDLmDp16lhEE8gtKYE"),
-"climbers": DRIVE_LINK_PLACEHOLDER.format("1yvHc3Sq8zCURLo4mrqM6PsJR3LFhgkhc"),
-"churning": DRIVE_LINK_PLACEHOLDER.format("1fEsKcS6bC42oCewYxV9i3YZsYduyID5h"),
-"chlorophyll": DRIVE_LINK_PLACEHOLDER.format("1U9qWStYzQwUioO4jG1ZA-romfQF4ulJx"),
-"cowl": DRIVE_LINK_PLACEHOLDER.format("1QWNUnIVuDK1J6c8Vb7fICNLdXBSucL81"),
-"chipping": DRIVE_LINK_PLACEHOLDER.format("1KX9sWXGfrylIZes4_ZKCOkuJsfN0-xTb"),
-"captive": DRIVE_LINK_PLACEHOLDER.format("1V8zHHXf6tCOHcBiKdTlOixZOlFvUb7PK"),
-"cradle": DRIVE_LINK_PLACEHOLDER.format("1uaMGNpgaCYs6QYztn7-cTNyGPS1YV4uz"),
-"condom": DRIVE_LINK_PLACEHOLDER.format("1T5MLYYffhKjqf4xwAAP5lhCjuNi1D_W6"),
-"chilli": DRIVE_LINK_PLACEHOLDER.format("1Ceoa3MipHbtBlAauQInybzhP9sl69EVt"),
-"chapati": DRIVE_LINK_PLACEHOLDER.format("1f66Fc3Sm6u8b09PUYPBY1ROC6vlXY3NS"),
-"cat": DRIVE_LINK_PLACEHOLDER.format("1XBvXKWycCt-6eBADKEzUP8Jc0HtvIEe-"),
-"curing": DRIVE_LINK_PLACEHOLDER.format("18b_em_hRTwYbs60O_X4fOMgiaVxM74JN"),
-"concrete": DRIVE_LINK_PLACEHOLDER.format("1ZFju6UnmUHXElcfS40iJ3QVY4c3XCCY5"),
-"compaction": DRIVE_LINK_PLACEHOLDER.format("135-PZOWoL-9jOTEJRSP3OKsHBjSyFPZz"),
-"chimney": DRIVE_LINK_PLACEHOLDER.format("1A8l8IVVwJuZujfvQJupo1w90cDkiLiQE"),
-"centering": DRIVE_LINK_PLACEHOLDER.format("1KU6y9OydBN3PgYchosyqaLbMv6ZL_NPT"),
-"ceiling": DRIVE_LINK_PLACEHOLDER.format("1L8DfWcxYWALg3e5oLqkkyb7vyYAXf3Nd"),
-"cyprus": DRIVE_LINK_PLACEHOLDER.format("1GjSHrTyJMLP3UdVU2nE6sub8B7aiPxTk"),
-"cuba": DRIVE_LINK_PLACEHOLDER.format("1V9_zl0NmCqdRAk4Ee4bN1ssSfc8rkjWx"),
-"croatia": DRIVE_LINK_PLACEHOLDER.format("1BE0-ua_1QjpQSJhFdjX4rhI9wSyvX413"),
-"colombia": DRIVE_LINK_PLACEHOLDER.format("1ZuqujTb2O4Bg-4TTSvYpXszRyDViOoy0"),
-"chile": DRIVE_LINK_PLACEHOLDER.format("1MeTqOl_PcvEsRIRsfZ6r_6oIa3AXmnOo"),
-"canada": DRIVE_LINK_PLACEHOLDER.format("1l1F9TWCXLe9BFGnCpcds5furSfN8Mv7h"),
-"cambodia": DRIVE_LINK_PLACEHOLDER.format("1ipRgsgEgFSnr3mUE5cRSrVKRi5ZwQJuR"),
-"coat": DRIVE_LINK_PLACEHOLDER.format("1-ncrwPM32T6jYWNXCnMo63-kS57RE2Dt"),
-"cube": DRIVE_LINK_PLACEHOLDER.format("1JbswHh3-Zf2ZxoVd4yBEK6hOrfDjY2pZ"),
-"cage": DRIVE_LINK_PLACEHOLDER.format("1DdRpcOOWzMMR42xq1EwEwcQvrsBNtsva"),
-"constant": DRIVE_LINK_PLACEHOLDER.format("1w2c67k4wcU6xFvQJqiY4tvsqUmcZ49F6"),
-"compress": DRIVE_LINK_PLACEHOLDER.format("1elG3Gdyw4rDW92kjj9e2Iwoj3610r4ew"),
-"chip": DRIVE_LINK_PLACEHOLDER.format("1KK_JPfdnj1JDtyUbcoVoUs6IdkdL15r_"),
-"chrome": DRIVE_LINK_PLACEHOLDER.format("1gk0JLtUn9OiN6D3MVruOC45C32rcLVMh"),
-"cell": DRIVE_LINK_PLACEHOLDER.format("1SjGWg8VhI4SUvWSXktLrLIu9jvglB8bP"),
-"chocolate": DRIVE_LINK_PLACEHOLDER.format("1wWsT71q354Lt1MSrpbQGq6bhl6xLbW1z"),
-"culture": DRIVE_LINK_PLACEHOLDER.format("1N8tr4zP8780eIzqUJS9rOhzYtL5TfqZK"),
-"corner": DRIVE_LINK_PLACEHOLDER.format("1iDckmbmj5PC_7F5EenI2VcazWGkQzuWm"),
-"concept": DRIVE_LINK_PLACEHOLDER.format("1HktmVToaM3ElO9jEy0fQfs7hogdtFKNp"),
-"communicate": DRIVE_LINK_PLACEHOLDER.format("1cWIidnQVP9tBPSp1Yf9YDUmvXpXFdvdA"),
-"change": DRIVE_LINK_PLACEHOLDER.format("16qpiPp9V0ohzMOQd49TQ0ThVFerv_nKG"),
-"certificate": DRIVE_LINK_PLACEHOLDER.format("1mAVs9L4B2QDDYQoqB52T39ZrYQJc5Ebd"),
-"cosmetics": DRIVE_LINK_PLACEHOLDER.format("1tD7WS-UeZcdE6AiZt60pVIKUZlIPP4Qn"),
-"comb": DRIVE_LINK_PLACEHOLDER.format("1yGIzMQfXEvjrlGuW4eLNrnc1PgleeL9Z"),
-"cap": DRIVE_LINK_PLACEHOLDER.format("1OVRbGxOq3E9DnHb3zEA69UiWLLMjO-yf"),
-"counsel": DRIVE_LINK_PLACEHOLDER.format("1we3takvO8P1dLHbkNgoxf9pQNLEqy1d-"),
-"conversion": DRIVE_LINK_PLACEHOLDER.format("1zONHfyEje3vNCfT7KPY-YQ67Anmum7RP"),
-"constitution": DRIVE_LINK_PLACEHOLDER.format("1qvU8BDIrcdo2slfutz87yMp_iqJaJk1E"),
-"concealment": DRIVE_LINK_PLACEHOLDER.format("1YbBLvgdWhqH68w1w0IdVXC-avD1sHJyK"),
-"compensation": DRIVE_LINK_PLACEHOLDER.format("1LW2IhBWNvip2_2920oYkXtKjAVLXHUR3"),
-"cohabit": DRIVE_LINK_PLACEHOLDER.format("1HjAQGUgK8VI9CQowDcwzA9eiC6j1R9-y"),
-"coercion": DRIVE_LINK_PLACEHOLDER.format("1039S5sVCzW6ak2NLXP4P9MkZ_uioxU9r"),
-"crane": DRIVE_LINK_PLACEHOLDER.format("1bS2_qXy95XkQy_VuGAaK7QKN0myVjvm6"),
-"coupling": DRIVE_LINK_PLACEHOLDER.format("1XmXJdy7_irMFxiWj0MIQA5-PNHf1OU0f"),
-"chisel": DRIVE_LINK_PLACEHOLDER.format("1QGUJ9x0qoOfM1sSMIwl9P5dzO72-n7tj"),
-"cam": DRIVE_LINK_PLACEHOLDER.format("1tHIsAOoY4h1COECU-Tc_XmQ1erpmAv1w"),
-"crorepati": DRIVE_LINK_PLACEHOLDER.format("1KA6CEWJI9f1avD9nFStS6iMSF8kofqU3"),
-"constituency": DRIVE_LINK_PLACEHOLDER.format("1V9ubnheAoxS0D_e8BK7aFJTJY9NiH0lO"),
-"censorship": DRIVE_LINK_PLACEHOLDER.format("1DWv0XmfRUd-s1Up_rGVOsKoHy--1p2K7"),
-"campaigning": DRIVE_LINK_PLACEHOLDER.format("1ZxfaJQfwrtbdd6hZ5sAcN3jLmuCQ2JaN"),
-"caste": DRIVE_LINK_PLACEHOLDER.format("1yOeoAC3s7q8b3hcWBQfFHsDrE_Vhx9V9"),
-"coroner": DRIVE_LINK_PLACEHOLDER.format("121Rk0EEQGkExzOm3EYevgVFd8Ijs5TiC"),
-"criminology": DRIVE_LINK_PLACEHOLDER.format("1UP4PsSSKyM50r2apzZvTtEdKX_iVob_P"),
-"cough": DRIVE_LINK_PLACEHOLDER.format("1io-XqBuXfLEgTC18qvIZBEj9VlfCRacA"),
-"convelsion": DRIVE_LINK_PLACEHOLDER.format("1KDPsWfsgYQ1vj8m1h2k8KxAwAyPEw8Zc"),
-"contraceptive": DRIVE_LINK_PLACEHOLDER.format("1ZtFtFSBHdHUMlRq1U5d8iK3WmlRsXWab"),
-"contraception": DRIVE_LINK_PLACEHOLDER.format("1GBbcG7Nfx3J-ygg_3L8uYU3FEgr2y2YL"),
-"contamination": DRIVE_LINK_PLACEHOLDER.format("1tJBTARk9u1HID0QyNvpfQeOCimPYLssm"),
-"constipation": DRIVE_LINK_PLACEHOLDER.format("1yPXKE6S1bPKy0jFWa4z9-kJCLMRU9w-u"),
-"conjunctiva": DRIVE_LINK_PLACEHOLDER.format("1lw-tRf7UnyUER52XtD4ziDC3wRNzisyB"),
-"concussion": DRIVE_LINK_PLACEHOLDER.format("1G8uOzZzI8qDxmeV8HY3jnxNzrz8eINp1"),
-"coma": DRIVE_LINK_PLACEHOLDER.format("1OU3D9wiVsaz_7YYt6wPl5-hlauBDpYO6"),
-"colic": DRIVE_LINK_PLACEHOLDER.format("1rFHdW2oNJNyKuQG-MCbxJJQQ9vDeHRRg"),
-"clavicle": DRIVE_LINK_PLACEHOLDER.format("1rMJDVXbLT7pebJq0w1zLA8SrSFJGCQRM"),
-"cirrhosis": DRIVE_LINK_PLACEHOLDER.format("1YokrXc8yqtqfSVK6NFNQO-sLjqSLdy69"),
-"constructivism": DRIVE_LINK_PLACEHOLDER.format("1pWvQHaGwiaC2NgxM9xZQp5bDl1RG0WU_"),
-"cholesteral": DRIVE_LINK_PLACEHOLDER.format("1b_7aIJ7IVeYZ314p1xP0YuuoVb3FCon6"),
-"choking": DRIVE_LINK_PLACEHOLDER.format("1QwWaJE31wMisouA3QEYUO2OrR42EbBrr"),
-"communism": DRIVE_LINK_PLACEHOLDER.format("1zUm5pbgcYSj4_f7rRcbzPyiES6Akd4jv"),
-"colonialism": DRIVE_LINK_PLACEHOLDER.format("1_OJVk14QIWSocoFLSDZkU74mpklo4Z4l"),
-"cognition": DRIVE_LINK_PLACEHOLDER.format("1QqV4HH2dFwk7-XsfR8wzYr0nw-uKsBQJ"),
-"chemotherapy": DRIVE_LINK_PLACEHOLDER.format("1p988zg6fv5JREPMn-r7vQGdBK2Jwcyii"),
-"cervix": DRIVE_LINK_PLACEHOLDER.format("1puztVTT0rw-t-s3klqsTxuYQeMLzhjbv"),
-"caries": DRIVE_LINK_PLACEHOLDER.format("1lwSoZDRmbYJ1IAnheh5iXQf9IGB2pQU6"),
-"carciogen": DRIVE_LINK_PLACEHOLDER.format("1Pxlv39m94ZQPIDdAUxa2C7-5k5yCYRuV"),
-"candidiasis": DRIVE_LINK_PLACEHOLDER.format("1zUiKF02fwz5nUtp4dcVQP1Z405PuEh5W"),
-"callus": DRIVE_LINK_PLACEHOLDER.format("1vh4_i5qj4INb4fpxStJPb2sJeGlseqJO"),
-"calcium": DRIVE_LINK_PLACEHOLDER.format("19fyRnie8t5vMf483wnpvwCWOlo5iNm_9"),
-"calamine": DRIVE_LINK_PLACEHOLDER.format("1GGuz83pXl9CHkr9jHzjD8iFJtmmQlZz7"),
-"cadaver": DRIVE_LINK_PLACEHOLDER.format("1mrNrv46E0wUHfgWNnI9xzx9AiVxHDgf9"),
-"citizenship": DRIVE_LINK_PLACEHOLDER.format("1-AUtqDyJB4k0cUO1PvLB7nhrVp8QH9zi"),
-"contempt": DRIVE_LINK_PLACEHOLDER.format("11529GeBg8P_9wzkhMlLyNNIcYWxxSlW8"),
-"clauses": DRIVE_LINK_PLACEHOLDER.format("15dZbC6F5LNA6vyg_Hm56HxmQCXRdcEl3"),
-"certiorari": DRIVE_LINK_PLACEHOLDER.format("1bnMTV_U0SciiuHKu2ohRk7HKBAT_Vq2u"),
-"census": DRIVE_LINK_PLACEHOLDER.format("1tX_snfXvNE62KAtCoHGLn8HYLI2VJxs6"),
-"case": DRIVE_LINK_PLACEHOLDER.format("1SIIBJjw7-CwYqmaJGSjvl-3ziYeNv5id"),
-"capitalization": DRIVE_LINK_PLACEHOLDER.format("1nMKt8aBZcwiXs-DApGGApgCYBqNPfZ7B"),
-"consumer": DRIVE_LINK_PLACEHOLDER.format("1tfW86TYwKGfubcxZ0TXXVZSoFvmhNvDK"),
-"collegium": DRIVE_LINK_PLACEHOLDER.format("1YU45LdShMR0mUZ2rx2fS5iSaNRpSbr-M"),
-"computer": DRIVE_LINK_PLACEHOLDER.format("1NPysJ-VcrCYkF3u68ETwCaNklyUwKA9N"),
-"cd": DRIVE_LINK_PLACEHOLDER.format("1OPmmIc5aEBvQZXOWlSymcqdL0-1oCtZK"),
-"cutlery": DRIVE_LINK_PLACEHOLDER.format("1-Qk3vFrgRsbYkj_y57FBpx3YoAC41tjk"),
-"cupboard": DRIVE_LINK_PLACEHOLDER.format("19ccUAxey7Mf-WKKKFYWC2K_gFwKNtmUv"),
-"cup": DRIVE_LINK_PLACEHOLDER.format("14G6CwDUhl_IjMB5l89k6I7J2btFkM-uL"),
-"cooker": DRIVE_LINK_PLACEHOLDER.format("15GU-jYpwNaMhWxFxqMuYjNkrHAhiYb5s"),
-"chalk": DRIVE_LINK_PLACEHOLDER.format("13Y7mBt9SGtgCAddG_eEwATgiQOx4ONXM"),
-"chair": DRIVE_LINK_PLACEHOLDER.format("129yzpBJ5YrFz-vJu_SSlYx1xzxDqowlr"),
-"catalogue": DRIVE_LINK_PLACEHOLDER.format("1Da_cb2oeRYvMr5bGfTLK36--4gPSvNE9"),
-"carpet": DRIVE_LINK_PLACEHOLDER.format("1R6BCHIqT3OiFRpvzvAZK48OpbL3gWa0l"),
-"candle": DRIVE_LINK_PLACEHOLDER.format("10rUSYGYw0mWIeVIEEoCzwcrcQkbxk74z"),
-"can": DRIVE_LINK_PLACEHOLDER.format("1Bjqu6LvaBWKJoV71EjRY6_v4Lydo8xhO"),
-"camera": DRIVE_LINK_PLACEHOLDER.format("1blgTWgbKr0fc9elpSMSDPygSo8fu_RPo"),
-"calendar": DRIVE_LINK_PLACEHOLDER.format("1o4XsdlY31NQhqPZln-GyyZ86OzaPq4er"),
-"calculator": DRIVE_LINK_PLACEHOLDER.format("1wzXl7f5g0DP81brYamnM_suuw9KkX7mj"),
-"cummerband": DRIVE_LINK_PLACEHOLDER.format("161go7rp6zrAr3D5T4NzS8XBf325bj9CK"),
-"culottes": DRIVE_LINK_PLACEHOLDER.format("1ogURvOiwaP7FDk_YvHGHeCzNkxivXDTt"),
-"cuffs": DRIVE_LINK_PLACEHOLDER.format("1LGxDCKdZW22gCDmAW9Y53qkwoK1eRcUq"),
-"cropped": DRIVE_LINK_PLACEHOLDER.format("1cUEyN0IDHZhl3ZCn-sYPjY_v0w5V6o5j"),
-"crease": DRIVE_LINK_PLACEHOLDER.format("1Cqq0vEdfzJtd5qKhKvVJXRJ8C7whnNcr"),
-"china": DRIVE_LINK_PLACEHOLDER.format("1dMN6e0pPQpo_6NP103cbXZExxxu3lrhs"),
-"couturiere": DRIVE_LINK_PLACEHOLDER.format("1oD2FEtVb_T69QAEGbRzruPBe23ZB0vCL"),
-"couturier": DRIVE_LINK_PLACEHOLDER.format("10DTTuQCMuefi-k-R-1jn-i90e0EfspXV"),
-"couching": DRIVE_LINK_PLACEHOLDER.format("1k7omQmQLw1BYL9b5wT3b1AQImDLyDzyo"),
-"chiaroscuro": DRIVE_LINK_PLACEHOLDER.format("1pTJ1GogcUmtU0G8x2-1aE037qNTguhuh"),
-"capri": DRIVE_LINK_PLACEHOLDER.format("1xUBMYIlmMgLCSbo1_hJRD8MI9EEcXqp3"),
-"camouflage": DRIVE_LINK_PLACEHOLDER.format("18pEEO7VS_o9nc4pbV0sZwZA3els0IAwH"),
-"caftan": DRIVE_LINK_PLACEHOLDER.format("13rnbzHDARbxHYSEUBSq1Bn740l3jH5BO"),
-"cancel": DRIVE_LINK_PLACEHOLDER.format("1mimvDt8IFpd_8-rzTgomJqF4efHbUIal"),
-"cucumber": DRIVE_LINK_PLACEHOLDER.format("1QCxoHAokN49ZCAZ0RTmHjg6EaM8uNaFk"),
-"corn": DRIVE_LINK_PLACEHOLDER.format("1aHeHBS3BnpWN-RFxntyKNbvPsYIzyGWO"),
-"chikoo": DRIVE_LINK_PLACEHOLDER.format("1TBAvJWvLFz-6bzM9LpF9I5Alri5jX7gR"),
-"chickpea": DRIVE_LINK_PLACEHOLDER.format("1V7Y6aM5_ZlFzIb7YeOfiNRqyw9bPnBbk"),
-"cherry": DRIVE_LINK_PLACEHOLDER.format("1aDD3QNLayQjsXbX3aOiXowZUpo6wOzEA"),
-"carrot": DRIVE_LINK_PLACEHOLDER.format("1kujirvMFZxaiY66OxxjRxUBITiSyu4Us"),
-"capsicum": DRIVE_LINK_PLACEHOLDER.format("1CkrjYtkyrrjCjol-ox9M8MB1xQVfD5e6"),
-"cabbage": DRIVE_LINK_PLACEHOLDER.format("165JBPlDcL4CltrrpNeVgiEwnAQZ_IT43"),
-"clown": DRIVE_LINK_PLACEHOLDER.format("1NMGXhW_48GvbLNzti9IHx1ny-MsM_k3J"),
-"chamfering": DRIVE_LINK_PLACEHOLDER.format("12gBS-XyLp9f8exH34ZoJgUSirQfzdqzE"),
-"circlip": DRIVE_LINK_PLACEHOLDER.format("11wCQKdgNWgYusp5RORkhkBypRSK3sSny"),
-"chiropodists": DRIVE_LINK_PLACEHOLDER.format("1l-kQX1POVUT_HVpdfZyMVw-6xYda-qfE"),
-"centrifuge": DRIVE_LINK_PLACEHOLDER.format("1Vd92ewBdWw9fB73x3aNt4boA9BbdeBuV"),
-"cardiographers": DRIVE_LINK_PLACEHOLDER.format("1bWnJhC974EklKUAIABUHVesxXXP1RQTj"),
-"carbohydrates": DRIVE_LINK_PLACEHOLDER.format("1YxTgHSEJYLkyrpCmiO4BTQf50gvOARdB"),
-"copyright": DRIVE_LINK_PLACEHOLDER.format("15IRU3SREEO0crX9OM2gMFPCkrfNjvgci"),
-"cave": DRIVE_LINK_PLACEHOLDER.format("1a9y9sWIIIC-l_jqm6SWYjfxMwVKTEbSk"),
-"carrom": DRIVE_LINK_PLACEHOLDER.format("1qaOQLwshL4M4eOnntdFFP4wwEDFueWVx"),
-"crocodile": DRIVE_LINK_PLACEHOLDER.format("19LNy6j51JTOfwdWNyD12VpvX93OZZmkh"),
-"cow": DRIVE_LINK_PLACEHOLDER.format("1ee9wZAhHNnva6wPU3aLzv6e9tuMas7n2"),
-"cockroach": DRIVE_LINK_PLACEHOLDER.format("1lWxCbKYUI3uHCUxuZVz9Eyfor1sdHwis"),
-"camel": DRIVE_LINK_PLACEHOLDER.format("1dJcbPZQXQkYTN2xCUgIEFffumauXDV6e"),
-"congratulations": DRIVE_LINK_PLACEHOLDER.format("1FnPTPe9MQV3a5TMnJq7QJu6wtS_70fR8"),
-"cool": DRIVE_LINK_PLACEHOLDER.format("1zSYaKBn9VKZNEGsQt2ZMQqxUfx26NvLv"),
-"clear": DRIVE_LINK_PLACEHOLDER.format("1_sIYPNM7bkz6JKm1ASdpX8qytRH8DHty"),
-"call": DRIVE_LINK_PLACEHOLDER.format("1jpLhZ2C-ymXv0SnTpwopsVUVeMc44D_d"),
-"casio": DRIVE_LINK_PLACEHOLDER.format("1CVR7gC8w7sv104QYGmJo3GRaYmUs79ad"),
-"car": DRIVE_LINK_PLACEHOLDER.format("1CWSYkYXn0L8Y4xM_qygzNhp8wIeyvZF9"),
-"conveyor": DRIVE_LINK_PLACEHOLDER.format("14fqTyhnmk5Y03GHDOyxe0DwsV5mhZvwB"),
-"compiler": DRIVE_LINK_PLACEHOLDER.format("13NV-CPwwT7TPzUYoNZ64ximAqSibGpkN"),
-"clipboard": DRIVE_LINK_PLACEHOLDER.format("10L9CQNAzMvptvFw3gHXfyij6BTT62W9S"),
-"cabinet": DRIVE_LINK_PLACEHOLDER.format("1C5xKhEgfpLsxpbuYIo4p35O6TI3FtzNp"),
-"curve": DRIVE_LINK_PLACEHOLDER.format("1xDGlfq6SpT2qp7zmFPbBnuReXPzhvbz_"),
-"crayon": DRIVE_LINK_PLACEHOLDER.format("1kwncwhZhFthQjl-eKxQQu--y1NWsdNYj"),
-"country": DRIVE_LINK_PLACEHOLDER.format("1lsKBcHpmENUyNOFlPEUH6c6tlnk3jLn2"),
-"college": DRIVE_LINK_PLACEHOLDER.format("1haFdFvjiXnKk8fzOifbK6__lHiaoiCo7"),
-"clumsy": DRIVE_LINK_PLACEHOLDER.format("1wDZqFw0bX2_MbYORa29PNwi3h8Y4MuzL"),
-"corpse": DRIVE_LINK_PLACEHOLDER.format("1FguOGjdIPE6MpuwWIFfIRFAv_wj4_eg9"),
-"cook": DRIVE_LINK_PLACEHOLDER.format("15sG23xMOQkskbJ2pSHKBgkeAU15NJslX"),
-"construct": DRIVE_LINK_PLACEHOLDER.format("1AI8n31BsXKySepOgTMLj39nWo79pmSHg"),
-"confused": DRIVE_LINK_PLACEHOLDER.format("1DKQs0eGHnB2rEASEeWDBcdjfbfRNDo9J"),
-"confirm": DRIVE_LINK_PLACEHOLDER.format("144qWtb8nMVdkGOp0-wR4VpQTSL39aPCQ"),
-"confidence": DRIVE_LINK_PLACEHOLDER.format("1KbI0vnpq1bqzomleyu-eL06oTUuaCVQv"),
-"cone": DRIVE_LINK_PLACEHOLDER.format("1EbHV83qDmIEnrxLpKK96HJI5Mmh05oPw"),
-"community": DRIVE_LINK_PLACEHOLDER.format("1LeMGzS7BppPaKWlQVC7YOVpslQ6UdZtc"),
-"common": DRIVE_LINK_PLACEHOLDER.format("1zU-Dm1o_eCdvko3DBmvTQD6HzV6vPLAM"),
-"commerce": DRIVE_LINK_PLACEHOLDER.format("1csf95OqF2APXr544LwzBe2AbkjPqJpIV"),
-"come": DRIVE_LINK_PLACEHOLDER.format("1gSukR7AOS5nPjFeMNwEfqwKFX6bNUyXf"),
-"capable": DRIVE_LINK_PLACEHOLDER.format("1StU9bBB5nBzMO7573L1YVSRv7_TTdRSG"),
-"cashew": DRIVE_LINK_PLACEHOLDER.format("1YMEcutrgar9Odyx1wHbx12E_F4Q_IksK"),
-"centimetre": DRIVE_LINK_PLACEHOLDER.format("1sYo4pDIsHFN5Ag5TF_5Whw-I22YuS0Rc"),
-"cement": DRIVE_LINK_PLACEHOLDER.format("1CtdNSY94HlwBZf5vgsnIDxlw6RuuxSSp"),
-"child": DRIVE_LINK_PLACEHOLDER.format("11add8DwvJDlR0EPRoBke9kM8uIyEvNrt"),
-"cashier": DRIVE_LINK_PLACEHOLDER.format("1uoDIhxFgp8jXdYst7d8HzNgjtXHFOk-A"),
-"chew": DRIVE_LINK_PLACEHOLDER.format("1IUpdrWVicT4DY8538wN2HsQEoGWJ6sHi"),
-"cheerful": DRIVE_LINK_PLACEHOLDER.format("1gb0nQxJxYU_3GsP5DOXNySKaJGmN2ssD"),
-"chart": DRIVE_LINK_PLACEHOLDER.format("1ZwznN6Jla28sdKvX70ii4e9qZAZlSVbY"),
-"chapter": DRIVE_LINK_PLACEHOLDER.format("1tvKWlWIvg_YHglGF4rPF8G-jrpmEBiGY"),
-"clerk": DRIVE_LINK_PLACEHOLDER.format("1Db_AjdG1wdthbBZta39fPbXisJVwAdak"),
-"circle": DRIVE_LINK_PLACEHOLDER.format("1L_kkKt2bkM_KZA1grNYbUCU7uHgOci-V"),
-"custody": DRIVE_LINK_PLACEHOLDER.format("1Lqmt8NmR_nF7padi3zTQ9lRg6Q4-N0Bj"),
-"counterfeit": DRIVE_LINK_PLACEHOLDER.format("153xZ7VvNP4PzUURSVn9T1YSmGqFlc8bY"),
-"conspiracy": DRIVE_LINK_PLACEHOLDER.format("1iHsGfRYCw8dgCA7o3jqFxQXS8UHiM6_t"),
-"capias": DRIVE_LINK_PLACEHOLDER.format("1FHzKAAiuFhgZzvoCZ2kUoK0LtoYerSw5"),
-"column": DRIVE_LINK_PLACEHOLDER.format("1GgBtqZ1cErsFVzHAXPw4NTxzzqPBMvNP"),
-"calm": DRIVE_LINK_PLACEHOLDER.format("1KYri17xsxBOzmRz7ooIotWaupEa_cdH8"),
-"court": DRIVE_LINK_PLACEHOLDER.format("1I4PQt_IG4Y6S16iF1W9hNPi4NC9lnBeY"),
-"carnivores": DRIVE_LINK_PLACEHOLDER.format("1gt2R_TgDcs63XMiMhOtu9_C_8jHoOmRD"),
-"capital": DRIVE_LINK_PLACEHOLDER.format("17Uw_YUdY3Yty54PshFzrq_HJ3Lwn5WdX"),
-"cursor": DRIVE_LINK_PLACEHOLDER.format("1UBTMpM3gWVObTd_aujCEUU-QGyy3ZQ38"),
-"copy": DRIVE_LINK_PLACEHOLDER.format("1YPfCFVUasoJm_oxH8iScfEyOvlcwdbpc"),
-"cartidge": DRIVE_LINK_PLACEHOLDER.format("1Ad76drsj4iNffLxEjktzi5VZDM46j_Xl"),
-"caliper": DRIVE_LINK_PLACEHOLDER.format("17LiLm5PACCgRUJ_GKwoRqeFMvk6p7Ylu"),
-"c++": DRIVE_LINK_PLACEHOLDER.format("1Z4FfdK6YBE02evfs_DKmYDNzmNWrg9zw"),
-"curriculum": DRIVE_LINK_PLACEHOLDER.format("1CpAW3ggGjuKaeF9-xGVgRcKX_lQ7Ybxn"),
-"cytology": DRIVE_LINK_PLACEHOLDER.format("12bbeo50ISiubd6AM5Cp9d0ldQzwxPA4T"),
-"crutches": DRIVE_LINK_PLACEHOLDER.format("1WQTJ6weuHm5bQZvTenKp4yreZF8ioIFn"),
-"chiropractor": DRIVE_LINK_PLACEHOLDER.format("1ZcQCcsHsVWWqomi8RC0XNtcIgJ489iUw"),
-"chin": DRIVE_LINK_PLACEHOLDER.format("10WSrw9Vnfxdj_Ulydf2wl6A47-2f6Zg9"),
-"chickenpox": DRIVE_LINK_PLACEHOLDER.format("1c9zYW0BhrXmHv1hJTD7Umu3eTl8flVc9"),
-"cheek": DRIVE_LINK_PLACEHOLDER.format("1KeAddxotDQMPIBFPjqt0VSxDpzRoI5j1"),
-"cataract": DRIVE_LINK_PLACEHOLDER.format("1JEPqcwW5JqXLVQQgs5DZEKNS7yvJMEmJ"),
-"cardiology": DRIVE_LINK_PLACEHOLDER.format("1bJzcz0gLktgk9ZU87aza2kGkPNItfk7s"),
-"cardiologists": DRIVE_LINK_PLACEHOLDER.format("1FW2p7N772ShrXOo1CMO_l67lKxrIs7NA"),
-"cancer": DRIVE_LINK_PLACEHOLDER.format("1487-9GM4VdQokDZhQWfZiOilFBuaQ10Y"),
-"calorimeter": DRIVE_LINK_PLACEHOLDER.format("1yOr7hkBbrGQBQ8tSlfrNHr1lgdspxQ30"),
-"calipers": DRIVE_LINK_PLACEHOLDER.format("1UYUPtzglmc8YqNS23YDJhB6kPmiQr2fZ"),
-"calf": DRIVE_LINK_PLACEHOLDER.format("1DWQwkj9FQ6h7S3O-CaFvinry2W6fYYEK"),
-"cute": DRIVE_LINK_PLACEHOLDER.format("1SZZHEvjzCNmFhDs5wlwoW97PqCY-L5ud"),
-"cut": DRIVE_LINK_PLACEHOLDER.format("1ZrQ8ZAEsnPh19H8Qr8Fcdwj62sW7zcZl"),
-"curtain": DRIVE_LINK_PLACEHOLDER.format("1-PMeNC7WS2W_v8h3SsY_kh0SvDJTPpN0"),
-"cremate": DRIVE_LINK_PLACEHOLDER.format("1KyIUETBfVobikSlyiPM8K3WE89gmckv0"),
-"cousins": DRIVE_LINK_PLACEHOLDER.format("1DlL_-_dHJcb5edTb84Ay2xFMZ9H_ZWVI"),
-"copper": DRIVE_LINK_PLACEHOLDER.format("1kuIVO_Ku8nxk3QW0-6H10dtt5RhWnW1u"),
-"consultant": DRIVE_LINK_PLACEHOLDER.format("1cOsWpcfWSPaRDcjLNz3hyNcFr3OI3elS"),
-"conference": DRIVE_LINK_PLACEHOLDER.format("1RWc6mxYT7eGqt1iTR_u-VChoFn3DTqPD"),
-"conclude": DRIVE_LINK_PLACEHOLDER.format("1xzkIs3LITakyDDkZw7NjOSCzYrRv0djW"),
-"complain": DRIVE_LINK_PLACEHOLDER.format("1cV02JEKj6EwHJERcyfJFqFmqDmyy0V6U"),
-"competition": DRIVE_LINK_PLACEHOLDER.format("1nJJ_XrnU1nUpLvaCACB_9ii7QjqzGmfU"),
-"compare": DRIVE_LINK_PLACEHOLDER.format("1fuF3BD0BNqRAuH_b92Pm93sCnoO8hXQK"),
-"company": DRIVE_LINK_PLACEHOLDER.format("1W_iLBRuX7VN4ecrgKUN73XlswW4nnZv5"),
-"committee": DRIVE_LINK_PLACEHOLDER.format("1-zsz46wj0PLktcfuwa7ZTsA5U82ZzE-x"),
-"comfortable": DRIVE_LINK_PLACEHOLDER.format("16W7DdFPfzWPFaVRRVwC3dRWgsUuXAvKS"),
-"coin": DRIVE_LINK_PLACEHOLDER.format("1f5YLxZv9MSCBt_78xWR-mGpoWZUlSDwd"),
-"coffee": DRIVE_LINK_PLACEHOLDER.format("14p2KVzzNrnCLlvwHOPu4HAnNPwaEGPGO"),
-"coal": DRIVE_LINK_PLACEHOLDER.format("1LyuDui7kgHFK7kpq8cfiJmXktc9KBORt"),
-"club": DRIVE_LINK_PLACEHOLDER.format("1JBzW9CPHZbZncnw3eUgZs9YJkng_VooT"),
-"cloudy": DRIVE_LINK_PLACEHOLDER.format("11qBKymRkTDAGh5dTh7w-88BjwlPNlUiP"),
-"cloth": DRIVE_LINK_PLACEHOLDER.format("1zJwOTYaVGqJWob5paJSc4go4RUljG27D"),
-"close": DRIVE_LINK_PLACEHOLDER.format("1VLYkeEsgzkIssl_iR9S4B6tvI3S1nJFm"),
-"climb": DRIVE_LINK_PLACEHOLDER.format("1XNkilJEt51QNNGK4V-t7lOXdymQKkQ_6"),
-"clever": DRIVE_LINK_PLACEHOLDER.format("1yt2CcCrvzZ4wN-blTULTLUNkjLg2xOs0"),
-"city": DRIVE_LINK_PLACEHOLDER.format("1Km6GZbE8HuxJ18BUbRlDbbi75e_C5Lwn"),
-"cheque": DRIVE_LINK_PLACEHOLDER.format("1Slo2_K-UIFtY2tsK6yqdkSvOg0GiHHzP"),
-"cheat": DRIVE_LINK_PLACEHOLDER.format("1_sCeJcK0GM6V16jydE55ZWtyY-XIJMFa"),
-"center": DRIVE_LINK_PLACEHOLDER.format("1SPChIt2B2EWUI8SR3vNYDcmKptCwCY7f"),
-"careful": DRIVE_LINK_PLACEHOLDER.format("1Zkcg1MojEvaLUuLhf4aidkGg59rGcD6l"),
-"canteen": DRIVE_LINK_PLACEHOLDER.format("1xzHO2dl9eY1oMkDO6emibQaufDRg_SGG"),
-"civilization": DRIVE_LINK_PLACEHOLDER.format("1AzxG4Vg33lGW8e2ZktWCqN-SGNYjLbSu"),
-"division": DRIVE_LINK_PLACEHOLDER.format("1Q-VCVLBZGbgk-G0xJqGqDnulPcYOffLt"),
-"distinguish": DRIVE_LINK_PLACEHOLDER.format("1Q6CksdhhbvlUYTbg9GdeAM02kIIXbCZM"),
-"diagonal": DRIVE_LINK_PLACEHOLDER.format("1sAhnhnaH-1Adm7W3kkR6QJ-cUy1CIYlE"),
-"deforestation": DRIVE_LINK_PLACEHOLDER.format("1hvyFG2-ENya3w2VMv-Z2KyYLElb2f0G-"),
-"decompose": DRIVE_LINK_PLACEHOLDER.format("1yk00zeQtnAaxuoqfdUybKxUTq4uA1yLU"),
-"diameter": DRIVE_LINK_PLACEHOLDER.format("1m7WFZdveP_tKxFQFKDZjOHRZmr4iSck-"),
-"dvd": DRIVE_LINK_PLACEHOLDER.format("1DLv6LlClMBeVrv9e_8YBv8c5_XCNLaYc"),
-"draw": DRIVE_LINK_PLACEHOLDER.format("11jgxqI3zQYH5Sl4ZJazoNUSX4OJ-aCk_"),
-"draft": DRIVE_LINK_PLACEHOLDER.format("1XicT8X-AK02iBLy3qkwwyP3ciopAqI8P"),
-"doner": DRIVE_LINK_PLACEHOLDER.format("1bJKSUA4xw6Sr2dRiUNnUUaomejKYDtaO"),
-"divide": DRIVE_LINK_PLACEHOLDER.format("1C9zIZwwylDOnVvbMeulIFnSXEndhFOOs"),
-"die": DRIVE_LINK_PLACEHOLDER.format("19OEey_41b_5TcgP5CnhPSE7LaIvjzxYh"),
-"decide": DRIVE_LINK_PLACEHOLDER.format("1-M1cPq_P60Xv7vQmQ0-6Gp60Eo__wMn6"),
-"deceive": DRIVE_LINK_PLACEHOLDER.format("1IXpuGAEhBVpOd1a2s6ZvdguY0isE85nt"),
-"dark": DRIVE_LINK_PLACEHOLDER.format("17kq67DYMuw4gOJ-3Wx9-eeIayhmSjLto"),
-"displaced": DRIVE_LINK_PLACEHOLDER.format("1Rv__EW1JEA_eK73lwH1IW7XPUwRAMafq"),
-"discrimination": DRIVE_LINK_PLACEHOLDER.format("1I_2zZ8qt_Do0gIvfYjKvlk-H8Y6-ZEg7"),
-"democracy": DRIVE_LINK_PLACEHOLDER.format("1ygZr-j6qTNsM2Gtji_qtj7DssIrPrZgd"),
-"dalit": DRIVE_LINK_PLACEHOLDER.format("1idVasWB9k4wAuoCsH2MDT1honkG1Lit0"),
-"dry": DRIVE_LINK_PLACEHOLDER.format("1nZanDF3uSFXM1MnR6zxtj0uyVVMHdd0U"),
-"digestion": DRIVE_LINK_PLACEHOLDER.format("1Q28f0sNfh3SBTE94CbQ61NKxL-QpxK47"),
-"dialysis": DRIVE_LINK_PLACEHOLDER.format("1SNF2tQb6CaxtJSI5qIr9B-ft4zF_YXut"),
-"divisible": DRIVE_LINK_PLACEHOLDER.format("1xDJOKofxYUbOTyNjkddVyettp6TQrY8m"),
-"divisor": DRIVE_LINK_PLACEHOLDER.format("1CqktCxRuSEyfcTBTso7IhQms5unEHRzc"),
-"dividend": DRIVE_LINK_PLACEHOLDER.format("1rU6LRSTThC-EJVC70Uk9HTnMpNlGIfoT"),
-"decimal": DRIVE_LINK_PLACEHOLDER.format("1h8o6vNvUdTZQ4xgD8khTYATfaYrxh36z"),
-"digit": DRIVE_LINK_PLACEHOLDER.format("1HznS_s5svS0lZDslaNm9olLL0OZJfA1R"),
-"denominator": DRIVE_LINK_PLACEHOLDER.format("1Zy_4BeIk3O2s_7xIKn-hQda8i1bvV3fu"),
-"data": DRIVE_LINK_PLACEHOLDER.format("17EWG_-s4FrwsyaJuTy4StT7QjnbBW4c4"),
-"divider": DRIVE_LINK_PLACEHOLDER.format("1Nryw5sRcZkyKQ5leScww_VJBG7oCl20-"),
-"degree": DRIVE_LINK_PLACEHOLDER.format("1z8I6hoxBVzlpkrLiB6jqesw_LOPGJcEB"),
-"dynasty": DRIVE_LINK_PLACEHOLDER.format("1RM47rdjtghVWlwz_8PWoN6jNvp-hL8Y1"),
-"deity": DRIVE_LINK_PLACEHOLDER.format("1IX15erqU5mNn4lZ9rWjrSJh6Htf1eBIj"),
-"deccan": DRIVE_LINK_PLACEHOLDER.format("1UDColgGnyT9UWxVJB8XxqhRZwK2cY_M5"),
-"domestication": DRIVE_LINK_PLACEHOLDER.format("1iFc26t0tViBNbVuNpUkAw2qsuocMLGQf"),
-"domesticate": DRIVE_LINK_PLACEHOLDER.format("1iFc26t0tViBNbVuNpUkAw2qsuocMLGQf"),
-"delhi": DRIVE_LINK_PLACEHOLDER.format("1ggK_1AOwV3bNuq0O9UL696lCDmeBhNhx"),
-"dehradun": DRIVE_LINK_PLACEHOLDER.format("1XQTU2KYaHQ5uKXRxQ4Q90tTJxbo9SCgB"),
-"dvp": DRIVE_LINK_PLACEHOLDER.format("13Oio-0TUBNV_eKgEZnH0JcPs0vd9uDPW"),
-"deposories": DRIVE_LINK_PLACEHOLDER.format("1KxGBX0jl_jGFGFwC6wiNhip2TDXrPVxj"),
-"depart": DRIVE_LINK_PLACEHOLDER.format("1eRx7Hf5U8ZnSZSSWGTdrYsRXvtdNSJfY"),
-"dealers": DRIVE_LINK_PLACEHOLDER.format("1m4v22Y2f-8ReftabckhZMWxIe_hAJVLi"),
-"derivatives": DRIVE_LINK_PLACEHOLDER.format("1MkCMnCR3Wk2oNaafIfhf_yq8j4iipgDA"),
-"decline": DRIVE_LINK_PLACEHOLDER.format("1XiMX0xr5LNyT0ff2GiwwemapEk4RkW0w"),
-"despatch": DRIVE_LINK_PLACEHOLDER.format("1bX5Cbsv7oWeD-9ktrHFh-vFOA3-96t7X"),
-"directors": DRIVE_LINK_PLACEHOLDER.format("1iqG1ecn_3rMqrtGSALg4uSbKb_qj9TGK"),
-"datum": DRIVE_LINK_PLACEHOLDER.format("1uSDHgucRwpPMqLjFdi6VYVd3mXuxmOCV"),
-"ditylenchus": DRIVE_LINK_PLACEHOLDER.format("19SOODxtZVnox1FzbyHbTf0z59PBmd1lY"),
-"dormancy": DRIVE_LINK_PLACEHOLDER.format("1MlgeUobLsM5w_R6exg8DCUt1Pd_wmYj-"),
-"doe": DRIVE_LINK_PLACEHOLDER.format("1voBXDhpn6WikQBjo2TAZX0CBHawBu8EN"),
-"dispersion": DRIVE_LINK_PLACEHOLDER.format("134ClQ5un_MkOcU7JsD9WnwGEgYjTe1SQ"),
-"diffusion": DRIVE_LINK_PLACEHOLDER.format("1RJ9Amvn-Ns3j0fjlFtl-aHMloozkOck7"),
-"devernilization": DRIVE_LINK_PLACEHOLDER.format("12Vz97169PYh_qxjLS3bcvm2xmyntjPRU"),
-"denitrification": DRIVE_LINK_PLACEHOLDER.format("1HiRNo3g6jI9xBah0FpDvfcFOw06Wwirh"),
-"debeaking": DRIVE_LINK_PLACEHOLDER.format("1Nl4_O1zguoZ5wWTo0ZHJK6B7lFzzLv7V"),
-"drainge": DRIVE_LINK_PLACEHOLDER.format("11P4QhEIwUWeS8hxyL6HHjZOoiAAKcNCU"),
-"designation": DRIVE_LINK_PLACEHOLDER.format("1UD7cXbLAsDqzKljcrgbElzX48W7resDv"),
-"deal": DRIVE_LINK_PLACEHOLDER.format("1g2tP9MYp7ingJz8cMZ2zMaC7Ug5SDRAh"),
-"dinkus": DRIVE_LINK_PLACEHOLDER.format("1Pa0yAK0ywCzt18TihpOyUKvPIUiWfbee"),
-"disaster": DRIVE_LINK_PLACEHOLDER.format("1tqp8z8Jfm1HN_nRbpwxeiwBTf2mpwpJq"),
-"distracted": DRIVE_LINK_PLACEHOLDER.format("1XOgcO7xtv3Db4r0aLL-rAdIwZfXIb63m"),
-"devaluation": DRIVE_LINK_PLACEHOLDER.format("1nz7dveMlFC37uWgqVw10Z53P1D0iFaNP"),
-"deregulation": DRIVE_LINK_PLACEHOLDER.format("1RI8a-fbhzJvnDr-uS4a-8O7KqdO-q3bZ"),
-"deafhood": DRIVE_LINK_PLACEHOLDER.format("1Z-mNVFQX4rsVkkfn3obZSvHfWX22zXl2"),
-"dolly": DRIVE_LINK_PLACEHOLDER.format("1Fphj6XGbNmK6WXZMuki1obvyYqpvUu_u"),
-"doodle": DRIVE_LINK_PLACEHOLDER.format("1JeCUokk7duqAoK9xN7S0UbDzhLoLyxNu"),
-"decimal": DRIVE_LINK_PLACEHOLDER.format("1UB1OdB2Sqw4iqlEc-I6CrKijk6H_XIpf"),
-"drown": DRIVE_LINK_PLACEHOLDER.format("1AKyJIFuGtICawg3mLlnilpyPljzplvJN"),
-"deaflympics": DRIVE_LINK_PLACEHOLDER.format("1YulhpcyhFBTZJiE3hpIC23ZDNLZlEgWs"),
-"dumbell": DRIVE_LINK_PLACEHOLDER.format("1huMW27Dft9Br1_gO26g742vSMYwf7Y0I"),
-"dawn": DRIVE_LINK_PLACEHOLDER.format("11EhlhN51H9uIW9RHybZIaf9SRsAiGZUb"),
-"dithering": DRIVE_LINK_PLACEHOLDER.format("1dByL-wy6J5YSUm3fCgueMFea_SGjfMOY"),
-"delay": DRIVE_LINK_PLACEHOLDER.format("10OPvdJk_YXvJ6lxSCRF4EYGOJPggukIn"),
-"decapitate": DRIVE_LINK_PLACEHOLDER.format("1mt8jw9xLeQta8Qu9mrBLMCoaDIwfcoG1"),
-"dilution": DRIVE_LINK_PLACEHOLDER.format("1F5JVelvqd0-rHr77L266AEqe-z2C1Oos"),
-"dictionary": DRIVE_LINK_PLACEHOLDER.format("1eUFXn5CmVT5ITYRMOVDTGLB8phFk35yV"),
-"deposit": DRIVE_LINK_PLACEHOLDER.format("1xfQSTiWFZQcTPBdKnTJqjTwcQt4yeP5h"),
-"density": DRIVE_LINK_PLACEHOLDER.format("1Ql723-TnINVA2hy1ChGjaH5YUlxgPk5l"),
-"disorder": DRIVE_LINK_PLACEHOLDER.format("1taEIaSsbbyS3zDIRkmuqL2h55Se7q5R_"),
-"damp": DRIVE_LINK_PLACEHOLDER.format("12LSKb6FEZY5P077Ugg9su8t0TSwhGTqY"),
-"dumping": DRIVE_LINK_PLACEHOLDER.format("1vp8NHaadvaA7V-wbg_A6LmnuwuR-d03d"),
-"daydream": DRIVE_LINK_PLACEHOLDER.format("1LWyb6guFVIpeceNJIgQMQ6TBylmbakYX"),
-"dandruff": DRIVE_LINK_PLACEHOLDER.format("1yTg0YB7LOC_B8w0K_LWjHlnHL_vJIG6P"),
-"desalination": DRIVE_LINK_PLACEHOLDER.format("1beB1tKqR-e3-QXco8QH5rbdaWRTatAMb"),
-"destination": DRIVE_LINK_PLACEHOLDER.format("1pFhDl-hSTkGROT5snTDZX_SpLvpEo1Oz"),
-"devil": DRIVE_LINK_PLACEHOLDER.format("1TTTsrq7phaFDHbH7nF_igT-ojK5hpFhd"),
-"die": DRIVE_LINK_PLACEHOLDER.format("11ZLpBbuNxIn1RYv1Sqkn1Vo_IcEkusbl"),
-"downstream": DRIVE_LINK_PLACEHOLDER.format("1ptHcjm2IAAVjwb-5F9rrJygp3eVteAZI"),
-"dieback": DRIVE_LINK_PLACEHOLDER.format("1ezrvNX9fIXYnZ3eFMVSm7blpohnWI6qU"),
-"dartboard": DRIVE_LINK_PLACEHOLDER.format("1u1ht7OhcQnCoYozFAry3uLow-sSN41WB"),
-"defalcation": DRIVE_LINK_PLACEHOLDER.format("1P_WmmqiQwpxKMJSrY_JODr8YLD2Iaxot"),
-"detective": DRIVE_LINK_PLACEHOLDER.format("1k07HeBiGi9y4mWaCF-5jCyZnEPFJ-xM3"),
-"deploy": DRIVE_LINK_PLACEHOLDER.format("1lESGnJiI3f_goczwgVQG3yVEsbiYq0su"),
-"delegation": DRIVE_LINK_PLACEHOLDER.format("1Rq4TUhU-T6YRzoOmc_WL9i3i3pbNvPR7"),
-"delegate": DRIVE_LINK_PLACEHOLDER.format("1uab8CIOoorXR3XOep5g5_9rtszAXhH6N"),
-"decriminalize": DRIVE_LINK_PLACEHOLDER.format("1mpR57sFPDKMyhCHks-5SmbHK4p6mg7tu"),
-"durable": DRIVE_LINK_PLACEHOLDER.format("1R20J3loMC3hAt16KQBns7Y32PqaaO4am"),
-"defect": DRIVE_LINK_PLACEHOLDER.format("1DupOkkp-gLvFZq56Gg_B7t9PFiB8c3Ru"),
-"duckling": DRIVE_LINK_PLACEHOLDER.format("14dPFjy4S2dljx-VO-aw_8bLJmIGsR7Zc"),
-"donkey": DRIVE_LINK_PLACEHOLDER.format("1F47dwx-y6eZYgL86Q8pXzxS8FuhveYq2"),
-"drafting": DRIVE_LINK_PLACEHOLDER.format("1fbocVrMsMJinHk64KOxY1gbl5vb3kn43"),
-"divorcee": DRIVE_LINK_PLACEHOLDER.format("1rqrYiICJsYFMHP89cRmOgDIxn7PPOw9J"),
-"deadline": DRIVE_LINK_PLACEHOLDER.format("13ubqH1A78FiDTuKs4Yorw5oNi12VDj0v"),
-"demobilisation": DRIVE_LINK_PLACEHOLDER.format("1BSoJfk8od6ZSRTn8Od0BPyoZZAo7BJp0"),
-"demarcation": DRIVE_LINK_PLACEHOLDER.format("14npYDqqWAMbHH5uTz5SosmYGMMHeocFk"),
-"defraud": DRIVE_LINK_PLACEHOLDER.format("1yU4gDbEsxxDaZzxf5Y6oTa65WWmIZXVs"),
-"decommission": DRIVE_LINK_PLACEHOLDER.format("1NpllZL-O440p-IWe-1Cp3MGVJpjzd6Gm"),
-"dak": DRIVE_LINK_PLACEHOLDER.format("1w09WKkchr3OqWRV6b7t2qBz7pdSQp6oZ"),
-"division": DRIVE_LINK_PLACEHOLDER.format("1PhtrzyhkAC8-hxGYCd8J3_8M6PG-Liba"),
-"disparity": DRIVE_LINK_PLACEHOLDER.format("1j87ypb0urtESvwaEft4b1HmrE-zpCcFI"),
-"descender": DRIVE_LINK_PLACEHOLDER.format("1zMFOKrj1Lrjs7LP4AXcBUEHhq1FvOOXy"),
-"dash": DRIVE_LINK_PLACEHOLDER.format("1hhXSLAgrWFlHnSF-2NNO7eCpRJmGSf21"),
-"downmarket": DRIVE_LINK_PLACEHOLDER.format("16xdum-mhfIZahuBYitKi6shLVyiJtnJY"),
-"drum": DRIVE_LINK_PLACEHOLDER.format("130hDmBY3Vlr0XMgkJ9XNUmvha4SqqMgT"),
-"dna": DRIVE_LINK_PLACEHOLDER.format("1eVXVN-JUVJ57ofc5oMwibT18D4vXPko4"),
-"ductility": DRIVE_LINK_PLACEHOLDER.format("18GSfWy2t2DNSshUYB9JeM3lW_5NVgVzA"),
-"dissolve": DRIVE_LINK_PLACEHOLDER.format("1nlCQ4OckKsZ9axlURX31uFwkOe76rKUj"),
-"decibel": DRIVE_LINK_PLACEHOLDER.format("1aA430GnVXcyx6-ixmZRuOvuTVxgFuTRR"),
-"dissent": DRIVE_LINK_PLACEHOLDER.format("120xEeJbipHu931htrbRbj4Ezhhln9V8K"),
-"date": DRIVE_LINK_PLACEHOLDER.format("1M7qQiSXfT7YKotweqxiig2oUjePDCA2i"),
-"dustbin": DRIVE_LINK_PLACEHOLDER.format("1cfHeMTmpBT11SoV7cNmeRc63k0kyfYlA"),
-"daughter": DRIVE_LINK_PLACEHOLDER.format("1RbbFulbMirTAh18C0y9Ev-ao_rhcW0vV"),
-"dysphagia": DRIVE_LINK_PLACEHOLDER.format("1jU3RqXnw146TfLaZ_D-J7yIzatw5Qp-j"),
-"dictatorship": DRIVE_LINK_PLACEHOLDER.format("120Nqf_vhWG7-kF3oYPbV6pmlaTH9AisZ"),
-"dressing": DRIVE_LINK_PLACEHOLDER.format("1xQI3_xXgj68QQURiRYvBh-cLcKSItmrS"),
-"dietician": DRIVE_LINK_PLACEHOLDER.format("1SEEMERF7PfkPzqNnPSq7f-Xd3t8MCuyG"),
-"driver": DRIVE_LINK_PLACEHOLDER.format("1Z6JC5aDYPyy-SwlLpetWnu150ippYKLf"),
-"draughtsman": DRIVE_LINK_PLACEHOLDER.format("1oPswCMtNcG25b3TaAkcDnBLKdpUhyeie"),
-"doctor": DRIVE_LINK_PLACEHOLDER.format("1vv8ufp1Egd_YymtXKaRsJp8lV_31K6c1"),
-"director": DRIVE_LINK_PLACEHOLDER.format("1GTOP6W0dwaD3rgvN2y-VmCMCc1pBbuzy"),
-"dream": DRIVE_LINK_PLACEHOLDER.format("1sXlo75pRosyCwcUl_JMx_lbQVHUWsCP7"),
-"don't": DRIVE_LINK_PLACEHOLDER.format("1bxZb4alAz5-bLXMUcro9JEdZVijIUG34"),
-"different": DRIVE_LINK_PLACEHOLDER.format("1izlAbmHnyOVF4hxaJWvfyKr1-GNAxc_F"),
-"devdasi": DRIVE_LINK_PLACEHOLDER.format("1GbetIWUOD9erTzyR1D6dWVGGeNznTT4j"),
-"dysuria": DRIVE_LINK_PLACEHOLDER.format("1k3_tPSe4944i4fmzUmHOovW8QOls0I-4"),
-"dyspnea": DRIVE_LINK_PLACEHOLDER.format("1pyBJNFPcH6d5dVmiE942-55_Cec1A9bW"),
-"dhoti": DRIVE_LINK_PLACEHOLDER.format("1vltkN4OVBb9h3epKOAsQfS5dlOZ4xpZU"),
-"deer": DRIVE_LINK_PLACEHOLDER.format("1h7i2GsIqKGGEs0BevRpmnuEyzS1NVKXs"),
-"database": DRIVE_LINK_PLACEHOLDER.format("1H4b2AM6JNumzad3B6lqZXCwra6ve6rkt"),
-"dust": DRIVE_LINK_PLACEHOLDER.format("1nfHKNxJN_NOzsUNKMzpHjeyKN9IXeUPG"),
-"double": DRIVE_LINK_PLACEHOLDER.format("1VMQnZEvQ5Ur6IhTJ-eIr7HJbg1rijSCi"),
-"document": DRIVE_LINK_PLACEHOLDER.format("1Pqm2Fb93TzfdBrmsUmDIKybJOyaI5vmQ"),
-"district": DRIVE_LINK_PLACEHOLDER.format("190jm3gl84zOpcwaOaUjLVA5jkDYWMGfl"),
-"disease": DRIVE_LINK_PLACEHOLDER.format("1ws5xmrQVXOxtSOJ2KFDDtUpz0jdRFSnl"),
-"discount": DRIVE_LINK_PLACEHOLDER.format("1fT-RWGIZWoS8vbSnjwSKyTXEccPendBR"),
-"discipline": DRIVE_LINK_PLACEHOLDER.format("1kytKB2EeOkPyWVS46X9V8zb4hm5bsITO"),
-"drought": DRIVE_LINK_PLACEHOLDER.format("1US8_rJFAUyy1c4VdLvRAO7VgNYvLTDjR"),
-"drainage": DRIVE_LINK_PLACEHOLDER.format("1vCuvymu97ab0iD_7R0gDcmVCK7cy6ehf"),
-"depression": DRIVE_LINK_PLACEHOLDER.format("1yHjrCqQEVePGHW3Hxo2AmGA7chuIlppp"),
-"dyselxia": DRIVE_LINK_PLACEHOLDER.format("1t6iO2vKrVGK-Nz11Lq7XSbkWYMdsnBXa"),
-"dwarf": DRIVE_LINK_PLACEHOLDER.format("1czHxgOxAmFGozF8V8MUK9agoWFx4G0dT"),
-"dislocation": DRIVE_LINK_PLACEHOLDER.format("1ewbXJ_2uu_WLGZpnb-ny9_fTl9lX0zGs"),
-"disinfection": DRIVE_LINK_PLACEHOLDER.format("11aQ3PVRmbyjrgmFhmyDeGhFeNw__4n88"),
-"diplopia": DRIVE_LINK_PLACEHOLDER.format("1C_jlQuy0GBdTHsUMW58DA7oco6sOpsr-"),
-"digestion": DRIVE_LINK_PLACEHOLDER.format("1fIXX351h_giMkh47oCmWwITAh4IXGpms"),
-"digestible": DRIVE_LINK_PLACEHOLDER.format("1YyHCZF7X_4xq0x7j6WmjCx7hydXFCqLE"),
-"diabetic": DRIVE_LINK_PLACEHOLDER.format("1O9O8LRiZwetsWzl0COnpuKlENavgxdkM"),
-"detoxification": DRIVE_LINK_PLACEHOLDER.format("1Cxknrv1Tqaos88uuTcP399qbOddMJcSJ"),
-"dermatologist": DRIVE_LINK_PLACEHOLDER.format("1wT5tia6heP6HRO1r2A_31TEAb1NmwN9G"),
-"dermatits": DRIVE_LINK_PLACEHOLDER.format("14AMlPtr-jZ_Nw-ccO6LRn1qGFNtKSyXI"),
-"denture": DRIVE_LINK_PLACEHOLDER.format("14vvPPObfNe4IzRPvE-j3lagsfQ3HUOJO"),
-"dementia": DRIVE_LINK_PLACEHOLDER.format("12XUiXMA9yY5Ez7dY03pX_syU0BvSTWlC"),
-"dehydration": DRIVE_LINK_PLACEHOLDER.format("16-PlVPpfWfW78dNblIePqD3U2PcmgPPm"),
-"debridement": DRIVE_LINK_PLACEHOLDER.format("1axTzlQQKfN_5J6Kc72e7f-wIjVcFD2_l"),
-"duck": DRIVE_LINK_PLACEHOLDER.format("1Bx_z03t8rKkaXt-Qv61RQYfBYAcJQi-h"),
-"demolishing": DRIVE_LINK_PLACEHOLDER.format("1DtZesJwbeVEdeBG9zTdvLJMSd_tmY7SX"),
-"denmark": DRIVE_LINK_PLACEHOLDER.format("14h9f5RWELlTvT0Tivliz0XAN0Wda9xqR"),
-"drug": DRIVE_LINK_PLACEHOLDER.format("1LnUK2CQl9Ih-7wUuka0mrh-GYPHCjxGI"),
-"drugs": DRIVE_LINK_PLACEHOLDER.format("1LnUK2CQl9Ih-7wUuka0mrh-GYPHCjxGI"),
-"diving": DRIVE_LINK_PLACEHOLDER.format("1331Jbc4DwqVbjqX8ohcjspfWxNlKX-tD"),
-"dial": DRIVE_LINK_PLACEHOLDER.format("1Gk3rz2YN7PE1hM3JPpywSftDeYE4On_h"),
-"demand": DRIVE_LINK_PLACEHOLDER.format("1Wgucqlsge_la9p6EHs4WK6K-6jMFWUq1"),
-"dtp": DRIVE_LINK_PLACEHOLDER.format("19zWxnNqTL2nG4PrSRPOwJBhxJPKwwINg"),
-"delete": DRIVE_LINK_PLACEHOLDER.format("1xcF972RSqHjMLcR2Fryeqd3SYgd9Q-1H"),
-"decryption": DRIVE_LINK_PLACEHOLDER.format("1dzR3E5nVIdTrU4o7JSrQvFITLQt7_nbe"),
-"drive": DRIVE_LINK_PLACEHOLDER.format("1EP-6oFMyBUrb7zOV4u4iAOjGAD8h5u1e"),
-"doubt": DRIVE_LINK_PLACEHOLDER.format("16qhcTuSOi_68cGO7kyTYzjS6lYE2nUOz"),
-"disability": DRIVE_LINK_PLACEHOLDER.format("1ihbRDiry-CrxvFTZssI_akthQHNYSvFo"),
-"diabetes": DRIVE_LINK_PLACEHOLDER.format("1ELJruy8s6hnqbP0w0fCVIs_oyiOycOf9"),
-"december": DRIVE_LINK_PLACEHOLDER.format("1NaJ_K1EgBHnN0Qtr75L6i1eVsceeEBfP"),
-"divorce": DRIVE_LINK_PLACEHOLDER.format("13i09jURTtCxF6NZit-J4gzTIk61ahGOv"),
-"disclosure": DRIVE_LINK_PLACEHOLDER.format("14vV9RKD3vnOCIMSOv4OVidX7wYJ0gw7A"),
-"disclaim": DRIVE_LINK_PLACEHOLDER.format("18HrWhcfmoopANeaWVpT2pCRajisWNuZe"),
-"decree": DRIVE_LINK_PLACEHOLDER.format("1RIiK3lsdM3HpD95Ywqyk2oxre6uQdL1q"),
-"dockyard": DRIVE_LINK_PLACEHOLDER.format("1wN8gSeTLM0D2CrGSRQ11L0qJWad3NPM2"),
-"discrimination": DRIVE_LINK_PLACEHOLDER.format("1V0jOvt3DO5hpFMFDDwn9kwuHvWwy-60F"),
-"defence": DRIVE_LINK_PLACEHOLDER.format("1RSr1hENzkRzLEBhM5ovy5J7IsNxRnQiP"),
-"data": DRIVE_LINK_PLACEHOLDER.format("1g5AQ1rHT_XxkIMMLUyHndHEVhN5uyhgb"),
-"dissipation": DRIVE_LINK_PLACEHOLDER.format("1MnNNM0WEp7jyaYUA4NbX9HpWXWPoACpO"),
-"dimmer": DRIVE_LINK_PLACEHOLDER.format("1PObX3nOa0lZJAXb90Rgg0uDoo46JTsZj"),
-"dead": DRIVE_LINK_PLACEHOLDER.format("1nUVxkxNjsYb8lMs4sO7VuFZYPm0g7UTn"),
-"daisychaining": DRIVE_LINK_PLACEHOLDER.format("1ylv_wL4o-oExucoGtemtAMTc-_tilBZl"),
-"diode": DRIVE_LINK_PLACEHOLDER.format("1jHuzgxfXSfZAu02GVuAnDOvbbBe40u7b"),
-"drama": DRIVE_LINK_PLACEHOLDER.format("1mvUXLqh97c3gAobMiVw0NnFB4xFOtIUw"),
-"democracy": DRIVE_LINK_PLACEHOLDER.format("1GhidXu7tJ9VrZ_XlU5n_zvjBNGdRw2jd"),
-"descendant": DRIVE_LINK_PLACEHOLDER.format("1fQGEEMwN9RL9stRU6rq9iC3dp6kQMt8c"),
-"demurrer": DRIVE_LINK_PLACEHOLDER.format("1EtdJ9DuvqdhvK4Xh_qh9vOLFxPkYIUJi"),
-"dropbox": DRIVE_LINK_PLACEHOLDER.format("1CzjxO7Vs4CXtgFpm2BK4V6Jx_ynnoptP"),
-"drawer": DRIVE_LINK_PLACEHOLDER.format("1wYejusUmhiuZ7omsjxwtHcl8kauz7xmt"),
-"door": DRIVE_LINK_PLACEHOLDER.format("1MysP1yLn4yAdTd3FXFZAhbJalqA2mxq2"),
-"duffle": DRIVE_LINK_PLACEHOLDER.format("1FP6c8tK5uwl7MoP_ZJkujJ_Utjw_1Sx5"),
-"dubai": DRIVE_LINK_PLACEHOLDER.format("1udzOwgYKYE_WJikn0_K53KlWyicrsuR4"),
-"debug": DRIVE_LINK_PLACEHOLDER.format("1dw7_6TzVfvKGGlqF7S0AuSMRRuskWFfl"),
-"do": DRIVE_LINK_PLACEHOLDER.format("1fXhqA4ZAlCwlQXNOJNozOVdyLImJG9IV"),
-"drizzle": DRIVE_LINK_PLACEHOLDER.format("1dcOha9GOGTcukxS5gGA77VDQC9fSzwP1"),
-"desert": DRIVE_LINK_PLACEHOLDER.format("1DgfqdEQswEdostqUOtgm7sjzYhONAVaB"),
-"dice": DRIVE_LINK_PLACEHOLDER.format("1s7tW2NzksBWw0HYxBCmTCPNQo1LQ9HSO"),
-"dart": DRIVE_LINK_PLACEHOLDER.format("1uQRyQ9pAV0c03ydZEQ-yxz3YaZcUlKL6"),
-"dog": DRIVE_LINK_PLACEHOLDER.format("1nVKEMoNqYzt4hJL2VGopthCNMzV2wpJH"),
-"dholak": DRIVE_LINK_PLACEHOLDER.format("1i_aK7cWk8ZLSoQeZxodet-UJUbidsy4r"),
-"deputy_director": DRIVE_LINK_PLACEHOLDER.format("1t-1NZf9zaZUnrxlnMuEB1pQe4O3UpI_m"),
-"day": DRIVE_LINK_PLACEHOLDER.format("1qKqHF0EM-TwfhoHbU0gBkHWV_GLEoL80"),
-"dussehra": DRIVE_LINK_PLACEHOLDER.format("1g1FwoyPta8_zpzlbWHA79zhUPCuXUqwJ"),
-"dhobi": DRIVE_LINK_PLACEHOLDER.format("1MAWK6UkBt611hQGa2VpXtYd4j-BB3ogo"),
-"disobey": DRIVE_LINK_PLACEHOLDER.format("1pypgmVtLpKKMF2QI5nluuKG5L3H7dVC2"),
-"directory": DRIVE_LINK_PLACEHOLDER.format("1hr4EV1w7w3ikFYzN2rSJ4mhCFUTCPfrk"),
-"diesel": DRIVE_LINK_PLACEHOLDER.format("1d3GHFde8uirHSY2ojxaHFNR_dkTX9YE3"),
-"during": DRIVE_LINK_PLACEHOLDER.format("1BeYaMcmhfqhYs1bd64uK5GasLydAbC_a"),
-"dot": DRIVE_LINK_PLACEHOLDER.format("1Et1C4UyIwygAT9x0uXra7ZDuuM8lDivC"),
-"dizzy": DRIVE_LINK_PLACEHOLDER.format("11edcZuWX0VJf_ZthwC4K7zUREK5Vkb_m"),
-"disrespect": DRIVE_LINK_PLACEHOLDER.format("1jev5sIii1n2BwwqM53I5qqItlv2IJ2CL"),
-"flowchart": DRIVE_LINK_PLACEHOLDER.format("1DLqlNd7F59YETJN2Noo-Fu8P3o6TMXaa"),
-"depth": DRIVE_LINK_PLACEHOLDER.format("1gvJYo5shUjSDGbxrUU4HWlw9IfGx4AC7"),
-"debate": DRIVE_LINK_PLACEHOLDER.format("1Xd_M9WyUOD1tbTms5f9n1vLRMWA_Xt-X"),
-"date": DRIVE_LINK_PLACEHOLDER.format("1tE_EWJyvSwkS-EOplUmMpBQyuHE3flmH"),
-"direction": DRIVE_LINK_PLACEHOLDER.format("1WtJS9oaw0GDUTz7pSaJdd0WstMH4XnA-"),
-"diet": DRIVE_LINK_PLACEHOLDER.format("1yZH100xwhLQ9_DDYIpeNSz54ml8QP2J8"),
-"determined": DRIVE_LINK_PLACEHOLDER.format("196Zd5o_KGrFWY3PeDqW5OqO6u7O66TK0"),
-"deny": DRIVE_LINK_PLACEHOLDER.format("12W0e38gh_C6FoH_Y4AGAwid0I73VqUMI"),
-"refuse": DRIVE_LINK_PLACEHOLDER.format("12W0e38gh_C6FoH_Y4AGAwid0I73VqUMI"),
-"delicious": DRIVE_LINK_PLACEHOLDER.format("1auRK5VKUumCJuGDpxJALxsyulZMqemGd"),
-"dry": DRIVE_LINK_PLACEHOLDER.format("1QfUpiV-BnY8BaEp3t-0dtazuolfHHBSj"),
-"drink": DRIVE_LINK_PLACEHOLDER.format("1TA2j2hSCBw_A7Vv3o-zeanVJ4nWgKzQb"),
-"dress": DRIVE_LINK_PLACEHOLDER.format("1jXYV-jeBnq--95OeWgMsVIydJNWrK0Y0"),
-"dosa": DRIVE_LINK_PLACEHOLDER.format("1upluSuO1qfKF0ckpDV_-bJlBV0pZS78M"),
-"drag": DRIVE_LINK_PLACEHOLDER.format("1QPiCyKhE2T65ZSolFk4PPb6TM9ad4UC3"),
-"download": DRIVE_LINK_PLACEHOLDER.format("1P6nI1n-c1DMaHCc_TAQj-vEKnNQ9D4bv"),
-"dos": DRIVE_LINK_PLACEHOLDER.format("1GyH4rPOPEiZHkGv2T9XWxrT4lR9TU-Mw"),
-"divider": DRIVE_LINK_PLACEHOLDER.format("1IPMUtH9p1MNO8U71X7b-xGwUwxy3MV0U"),
-"disconnect": DRIVE_LINK_PLACEHOLDER.format("1LOFtwAL58z984u1fOE_-85gh6h5gchG9"),
-"desktop": DRIVE_LINK_PLACEHOLDER.format("1-NKdW22EHu_r1DAQpl2qsIhhUp4X7kcY"),
-"dinner": DRIVE_LINK_PLACEHOLDER.format("1DqBpKsI79rignlK0zffMhCDwST3yoqz3"),
-"delta": DRIVE_LINK_PLACEHOLDER.format("1BOIp4zyyPi6ah1Qb1y9xpBAyqAEO8rG_"),
-"diarrhea": DRIVE_LINK_PLACEHOLDER.format("1po_J91PazTiKkl4szbFQUQ8r8YLORK3V"),
-"dermatology": DRIVE_LINK_PLACEHOLDER.format("1E0D6VRT1JB3ZjwesxdtpioafCUy71Xlq"),
-"dengue": DRIVE_LINK_PLACEHOLDER.format("1q9aQcTaX4tqnk4x-tjTzkRLCI3f3NGs4"),
-"deafness": DRIVE_LINK_PLACEHOLDER.format("1Al4HVpMgQGj6pGLoVNhrVSrOQwlaYFlB"),
-"diwali": DRIVE_LINK_PLACEHOLDER.format("11yMBSGh2BhFCqqJCdbV_VrDGfuryu_7c"),
-"distance": DRIVE_LINK_PLACEHOLDER.format("1SQgYsYt4VSTYypc4F2DsZ6RHEgzB5qcU"),
-"designer": DRIVE_LINK_PLACEHOLDER.format("1itThFBmSyCddoFlUnA0N2uc2YiEZYBia"),
-"dentist": DRIVE_LINK_PLACEHOLDER.format("1k0FM5ttrssZLmc45gXk-JQt_tcefIquV"),
-"decade": DRIVE_LINK_PLACEHOLDER.format("1qQaeZy_rijGIsqD-G8KxU4-OwWM-4vls"),
-"deaf": DRIVE_LINK_PLACEHOLDER.format("18QPPKKkorzRQYJCDSUNyj9TVH0CbNLKG"),
-"dance": DRIVE_LINK_PLACEHOLDER.format("1NaLHb6JKL-Ay9m_Rmt-hwx8HoE9HZH9C"),
-"evaporation": DRIVE_LINK_PLACEHOLDER.format("1iYXe_1RnG_HPwOnjM90z2qTg_cOGFx4x"),
-"evaporate": DRIVE_LINK_PLACEHOLDER.format("189_Cgu3aInaWiH1o8g-KfFOxeXQoiAoK"),
-"enzyme": DRIVE_LINK_PLACEHOLDER.format("1hplRrQ5Ub1NQuHR1VhhpebbhWgO7F2P8"),
-"electron": DRIVE_LINK_PLACEHOLDER.format("1uANw-8ZJ5OniafN6np03PTtVPLbpFkjL"),
-"ecologist": DRIVE_LINK_PLACEHOLDER.format("1IYq1mWlARjiBii6Mezzj8vygDQjJqBgs"),
-"ecology": DRIVE_LINK_PLACEHOLDER.format("1zvWbptP8Pefq35S7wdgakRfyWxZBZZPJ"),
-"electromagnet": DRIVE_LINK_PLACEHOLDER.format("1LZVMusQw2KM2kQSPExdhF40PYrZrtoks"),
-"excretion": DRIVE_LINK_PLACEHOLDER.format("1C3QOjlnXCPlHZmB7u_2glrnq4XoqVj3I"),
-"edge": DRIVE_LINK_PLACEHOLDER.format("1gS2L0Z2T8IS9t71-0v-Ut8WOWY3DtD6p"),
-"express": DRIVE_LINK_PLACEHOLDER.format("1MO0pR33UwxbaDYuLQu6sUBpl7uRPhvgd"),
-"education": DRIVE_LINK_PLACEHOLDER.format("1XA4oN5WgEpdphp7cgimFc5xodXZikkAU"),
-"egg": DRIVE_LINK_PLACEHOLDER.format("1ThnqwKK-Sz1dZhndJ6uGBb3hyYb168Nc"),
-"excretion": DRIVE_LINK_PLACEHOLDER.format("1xrqvekkBwGtcrAEU9gTbRmZN3iNldB1g"),
-"egestion": DRIVE_LINK_PLACEHOLDER.format("1M-tbfTsKQz8AmR_HPHcVLpAjNYxbe4Hp"),
-"expansion": DRIVE_LINK_PLACEHOLDER.format("18OH6hmthEjglTGH9SgseXTX4mkGaPshR"),
-"exhalation": DRIVE_LINK_PLACEHOLDER.format("1W00749S6FmU8C9e1x7GPOuxZndTf8aY0"),
-"energy": DRIVE_LINK_PLACEHOLDER.format("1ilGAsQuv6cnvxyATs4t1BAhWOaah1HPB"),
-"expression": DRIVE_LINK_PLACEHOLDER.format("14a6JypqP4irXQ4ERH4_VYhoWN0d8q_CJ"),
-"emperor": DRIVE_LINK_PLACEHOLDER.format("1eKMIVZOj9AC-3OS3aoLnVGJfpo120xs3"),
-"epic": DRIVE_LINK_PLACEHOLDER.format("1rHrgzsivH75NK5BhaymbOd2rbQadbGhq"),
-"empire": DRIVE_LINK_PLACEHOLDER.format("1q1wSfABmKRjTk1TU8IWouX1MDhz4OYov"),
-"embargoes": DRIVE_LINK_PLACEHOLDER.format("1FuU5ndVNwbzWLdBb3XhDUiewTTYUPNG8"),
-"european_option": DRIVE_LINK_PLACEHOLDER.format("1NLCAJ66ujCHpq-1HPIjZD3c7Mfa9O"),
-"equities": DRIVE_LINK_PLACEHOLDER.format("1HmoAWl94tG702zRtYWWBkz42nT_IAa8E"),
-"edging": DRIVE_LINK_PLACEHOLDER.format("1PeaO5v2elfFwK2W8A5iwLO6l7KHn1SzH"),
-"ewe": DRIVE_LINK_PLACEHOLDER.format("1kZU8fiuRLFHkosOPDGHMaJY5nriu9L-X"),
-"exploitation": DRIVE_LINK_PLACEHOLDER.format("1G6wSPIFqnG9vaU9WfDoxyFmo6DKzWJ2d"),
-"efficiency": DRIVE_LINK_PLACEHOLDER.format("1SuQXi8T0Wy28wo0IQjCEIOrxCOnsoQIJ"),
-"effort": DRIVE_LINK_PLACEHOLDER.format("1onI_JFUoSsX4scBepO8NchMjwfHzbPlG"),
-"enter": DRIVE_LINK_PLACEHOLDER.format("1UhwJvesnya7_OmbofobbpRsGyc4V_Eg5"),
-"entertainment": DRIVE_LINK_PLACEHOLDER.format("1R7X2UeFtvNBsOMrtgM4kWpCKW5sDjuDn"),
-"exit": DRIVE_LINK_PLACEHOLDER.format("1I4X35VRl1TXjL_npP_5_YEYn95oRcPtY"),
-"extension": DRIVE_LINK_PLACEHOLDER.format("1QCOYsrlMvwWnP-iAJHlyp4kc6GQE-zqZ"),
-"evaluation": DRIVE_LINK_PLACEHOLDER.format("1a-G9bbEAUPInktZiXHEiln3bzSSOA7SZ"),
-"enrolment": DRIVE_LINK_PLACEHOLDER.format("1zsSocMk-f9QpBmU26MRxS65KB5gg3wgc"),
-"exhausted": DRIVE_LINK_PLACEHOLDER.format("1lcUrP4_So0EltnmU_UMSiRlI3uzbJ-HF"),
-"econnect": DRIVE_LINK_PLACEHOLDER.format("1wbUq02_fzrvjptSKuHvXaHZ5oGnZl4Vg"),
-"expense": DRIVE_LINK_PLACEHOLDER.format("17vau7_6e2iqWUlt3Ae1LQ_Axc5GOvP8V"),
-"exploit": DRIVE_LINK_PLACEHOLDER.format("1xUPa7BFz4YtZo5ow8VzreOu1HpVDPVf4"),
-"employ": DRIVE_LINK_PLACEHOLDER.format("1SIQQOHT3g6_1Nq0cXDGRBGOLL_hr-SHD"),
-"escalator": DRIVE_LINK_PLACEHOLDER.format("1mDpgiXAtoKjxkWPAEuqLUtVssaPKN8io"),
-"externality": DRIVE_LINK_PLACEHOLDER.format("17a8ucrEQ_zwgDaU8eOV8EXqHfc5jVbNX"),
-"effluent": DRIVE_LINK_PLACEHOLDER.format("1nKkDlQadiWGydbfsAIal5W4wsGiGs_nQ"),
-"excursioinist": DRIVE_LINK_PLACEHOLDER.format("1DW3Zkj5BDum3Wv3NWKyj3ysQEU31Frat"),
-"ecotoursim": DRIVE_LINK_PLACEHOLDER.format("1ueWyhhhHJHiPaZLcSwuiwTx0kT1xAn7S"),
-"extinction": DRIVE_LINK_PLACEHOLDER.format("1FW0NPJhlP-eoWml8UlM5nxxHXSuvkYYh"),
-"evapotranspiration": DRIVE_LINK_PLACEHOLDER.format("10_hq9nLdZvM4FNO320hphah6z4nMTJpf"),
-"estuary": DRIVE_LINK_PLACEHOLDER.format("1FqSotCNnnwafries1w7kb3fqUaLGjNeO"),
-"ecolabel": DRIVE_LINK_PLACEHOLDER.format("1aoF9BhqXJnYGGyRVgEdS0yqj0tOQQ-TH"),
-"ecohouse": DRIVE_LINK_PLACEHOLDER.format("1KzAy61gAQm7vH15Nxu2B_bAh83hnJGh0"),
-"erosion": DRIVE_LINK_PLACEHOLDER.format("1l-RNPg5faleR5sO-6PPBpLbW5kVJrO7q"),
-"eco": DRIVE_LINK_PLACEHOLDER.format("1NB0bK_u1MLDIx5Y9sSrhCTDa-hZgQRx2"),
-"exploration": DRIVE_LINK_PLACEHOLDER.format("14TCL0Y0NhKLz2ygLiF9TpIBAKU-thLfU"),
-"expand": DRIVE_LINK_PLACEHOLDER.format("1diloZ54c39fpX3EW4_YRmxTZjJURn-5d"),
-"encounter": DRIVE_LINK_PLACEHOLDER.format("1TCF718SPjF_8-QznaT0yVjXbyC8fmFnB"),
-"earrings": DRIVE_LINK_PLACEHOLDER.format("1PCADMDbKsgV_fd44YwkcDOtnsutq3e4b"),
-"e-office": DRIVE_LINK_PLACEHOLDER.format("1NO46HV_JwVh1i5Tjl6QvvzTa0zqJx1r3"),
-"entry": DRIVE_LINK_PLACEHOLDER.format("1BBFYIrNIoBQofSKHUJlXHdRoyBOgI3PM"),
-"e-prisons": DRIVE_LINK_PLACEHOLDER.format("1dfA3AMg-GOO1Sm2X9F2NuKa2dN84oQo3"),
-"elasticity": DRIVE_LINK_PLACEHOLDER.format("1H8vgYF-oIdpY_KVPvwAQjE9o994FGP-P"),
-"equinox": DRIVE_LINK_PLACEHOLDER.format("13qWQ75UBjXcphSFHpdrVYz_9U7FgW6CP"),
-"equator": DRIVE_LINK_PLACEHOLDER.format("19aUbQBsa6my28JAc1w0ndWs1y4lMQx8G"),
-"electroscope": DRIVE_LINK_PLACEHOLDER.format("1hwcZ20dyA4LXa9847JwbmJsPM5gpAc-U"),
-"electroplating": DRIVE_LINK_PLACEHOLDER.format("1xixsBNiL-FJkqZGsgnz6GHX_LxUO6nHL"),
-"enzymes": DRIVE_LINK_PLACEHOLDER.format("1qkPgat0cBO3N2skthR3DvjIQX6Qylp3f"),
-"ecosystem": DRIVE_LINK_PLACEHOLDER.format("13b-tGHAD8J88I_1fFgkxCrMDaJQ3Ja4c"),
-"embezzlement": DRIVE_LINK_PLACEHOLDER.format("1Xx_4vfQrX5Zd9MTqBRxlWbHae5agFDHK"),
-"eardrum": DRIVE_LINK_PLACEHOLDER.format("13Wun2_jMSnsi3FScYy8GX9OjzO8X5sXV"),
-"extradition": DRIVE_LINK_PLACEHOLDER.format("1T6A6bh36ElRBuRWEL8WIVb8XREd6dZjv"),
-"entitlement": DRIVE_LINK_PLACEHOLDER.format("1xANbYrPRXIOc3qgbsu7_D1ZgAenOsgxT"),
-"editor": DRIVE_LINK_PLACEHOLDER.format("11cY29JMlHUfXdDjRVRQ1OofY6f5UKwGF"),
-"embarrass": DRIVE_LINK_PLACEHOLDER.format("1o9s7OL2DTiEBh_pZeDI2CaqIswjsRval"),
-"endocrinology": DRIVE_LINK_PLACEHOLDER.format("102OcqNULeiqYaJmAVbfxUgFE0ilS4miu"),
-"epileptology": DRIVE_LINK_PLACEHOLDER.format("1trOkOVMQeNB0CG4u3SEZDLO7c_MP_dnc"),
-"epidemic": DRIVE_LINK_PLACEHOLDER.format("1sVJK39noKZt3ZmsBp5eJbEtOepwzcCxR"),
-"endocrinologist": DRIVE_LINK_PLACEHOLDER.format("1ErGNPUeT2IJsd4V2fGxYeozPWm-cYmYG"),
-"encephalitis": DRIVE_LINK_PLACEHOLDER.format("1_YzLbuhjax7cHGB8AlKxdXJy4lSufJEX"),
-"enamel": DRIVE_LINK_PLACEHOLDER.format("1RR9WdjNALph275RnGEhxOApPoMfyozcf"),
-"empyema": DRIVE_LINK_PLACEHOLDER.format("1xSA7-H6UTm2PZTTlgeNrWkKLv4gsJocY"),
-"embryo": DRIVE_LINK_PLACEHOLDER.format("1-BWj274RkOBni2nYyu_EQGRIpxmJI3mi"),
-"elephantiasis": DRIVE_LINK_PLACEHOLDER.format("1hX9UgsdHFSQ1BJt2X8fVPyom3j1ZRHI_"),
-"electrolysis": DRIVE_LINK_PLACEHOLDER.format("1eSUeQfZedzTpwCdasbEHh1oKLzBP0h62"),
-"electroencephalography": DRIVE_LINK_PLACEHOLDER.format("1_ES8vkXUdjgOxSEBI4utxf8sPeg366rz"),
-"echocardiogram": DRIVE_LINK_PLACEHOLDER.format("1PvMb5gEhqtkSiWqTLb6eBtuG0WL5mzbb"),
-"earlobe": DRIVE_LINK_PLACEHOLDER.format("1wHd_AxKW8LCkZZ2L2M3yEzyO3BU5FwFA"),
-"eardrops": DRIVE_LINK_PLACEHOLDER.format("117sQiMjz-bBH3tSE4Rjdex_no-bM0kKv"),
-"earache": DRIVE_LINK_PLACEHOLDER.format("1iZvZBrKC6H76m51wJAOFOlnqwdMxKO9A"),
-"english": DRIVE_LINK_PLACEHOLDER.format("1rNffsxgKCkB5MDSrCNz-3Tr9y67DmfTh"),
-"enemy": DRIVE_LINK_PLACEHOLDER.format("1KFREyOm9YJX-7pEZeVO5wM-Laflrbj6x"),
-"evolution": DRIVE_LINK_PLACEHOLDER.format("1WvXqdOW_B16xyfcNUB_iq74nVKSGOHbL"),
-"extinct": DRIVE_LINK_PLACEHOLDER.format("1IN2P3fOkURW2i2LRICb2m_i9fmBjhc3O"),
-"escape": DRIVE_LINK_PLACEHOLDER.format("1VOeKIAuXXdn0QLIf1N20afW749LoK8gE"),
-"excavation": DRIVE_LINK_PLACEHOLDER.format("1FZmdr0tLUk6hLe0OlYq-PkeGJ1PZulKI"),
-"elevation": DRIVE_LINK_PLACEHOLDER.format("15cCymlAl_-wyNLDQ5YDyvttAQ1rLcBYT"),
-"england": DRIVE_LINK_PLACEHOLDER.format("1k-UsI7QZIk5ci0SNGQ-WKh1k6x_4jUhL"),
-"egypt": DRIVE_LINK_PLACEHOLDER.format("1PEosThyKoR8vDs0Ln1gcx3QCbBRn73P6"),
-"evening": DRIVE_LINK_PLACEHOLDER.format("18DQsYARzYa2i6-HaT1zgv0tX2oVBxb9S"),
-"ethics": DRIVE_LINK_PLACEHOLDER.format("1Q0lyx8Z6Rh6GCs1IDWfb2O7CwqBW_6AG"),
-"establish": DRIVE_LINK_PLACEHOLDER.format("1Bj0f3_lim69QgqOyfjzxiYARB7XROKPo"),
-"equal": DRIVE_LINK_PLACEHOLDER.format("1av1qAheiZqUWTxpuxIJtoICRNNm_g8Es"),
-"enough": DRIVE_LINK_PLACEHOLDER.format("1T_84lQe-YLrbAu_LOEUqMEvRmsSOLU72"),
-"enjoy": DRIVE_LINK_PLACEHOLDER.format("13rfras2W-vQAE76-ZAB5qKo_0T8tF7dB"),
-"engagement": DRIVE_LINK_PLACEHOLDER.format("1LPY2_85fb8i8bjvYVlDahW1aeED6978e"),
-"encourage": DRIVE_LINK_PLACEHOLDER.format("1Xp9K81glEYAhcUiZCRngwu3jyR2pOkVP"),
-"empowerment": DRIVE_LINK_PLACEHOLDER.format("1ipV1MU60FkmhgnkmKckRCpWIekANAz4A"),
-"edit": DRIVE_LINK_PLACEHOLDER.format("1U7WVxqvq09IyY3gao3kUI9OXLmS78qNj"),
-"equality": DRIVE_LINK_PLACEHOLDER.format("1fyHHG7HbC-Hf74gxmvoLJeQgEpIbUsjO"),
-"endowment": DRIVE_LINK_PLACEHOLDER.format("1ihtKHqFXR6wl03kmWeZgMVyJk-4EYXBo"),
-"eyedrops": DRIVE_LINK_PLACEHOLDER.format("1WIzFhrDi16HvtNXC-mhuCsH3084uSq-r"),
-"euthanasia": DRIVE_LINK_PLACEHOLDER.format("1QbqVHN3TFh5MwSe3ntQLML6xIeINcvMf"),
-"esophagus": DRIVE_LINK_PLACEHOLDER.format("1ML8Nsd06NiUQ45glGts2FwGJnddkL9Dh"),
-"epistaxis": DRIVE_LINK_PLACEHOLDER.format("1A-Pl0eb7cit4pveTy-JFBFGZaV3UoBrl"),
-"entrapment": DRIVE_LINK_PLACEHOLDER.format("1hYDUAV_SmxMmNVGtttVJJhC5lfm5aTtj"),
-"e-courts": DRIVE_LINK_PLACEHOLDER.format("1y1h8aFtuafueIlKw5ZdZej8SmFq_QDgn"),
-"eviction": DRIVE_LINK_PLACEHOLDER.format("1MRgZ5RncgD2u9sxI3le7-i8RjJss0fSQ"),
-"evacuee": DRIVE_LINK_PLACEHOLDER.format("1rJIsPxtC_ADm56AiRTKH0ryhQCa6T-iG"),
-"estoppel": DRIVE_LINK_PLACEHOLDER.format("1tzXcyjqE1Q3wND4gGXUu2hCl7-RJu-l3"),
-"eligible": DRIVE_LINK_PLACEHOLDER.format("1ULQMGL1xdtwN_XXAYgOt6ExirO2ioJT8"),
-"electrocution": DRIVE_LINK_PLACEHOLDER.format("1SiyNHstR-9c_NNaISVQhFxHspHKNESZU"),
-"electrolyte": DRIVE_LINK_PLACEHOLDER.format("1zqSn67UoFnmugO8IJ17Pgaekh5VIpdgP"),
-"expedition": DRIVE_LINK_PLACEHOLDER.format("1gSnGYBOL-MHxGAoCwSorxrbaH5MHKXae"),
-"essay": DRIVE_LINK_PLACEHOLDER.format("137xkSqvApdJvO3LkS00Be6g8hPBhuyAv"),
-"exhibit": DRIVE_LINK_PLACEHOLDER.format("17hmhTjqcSKka6BvZKq6imwjlU3WB8a0G"),
-"encryption": DRIVE_LINK_PLACEHOLDER.format("1l7Fsg4Bc_JRUYOG2vDB8FYkVPVBOL2V4"),
-"envelope": DRIVE_LINK_PLACEHOLDER.format("1dejODYd_SvroT28OPKgYhubQ2DrV439a"),
-"epaulet": DRIVE_LINK_PLACEHOLDER.format("1Pd-FGbWBQTuI6y2ECIYNiuMZZPZtitWF"),
-"elastic": DRIVE_LINK_PLACEHOLDER.format("1OXlOWgx1SdEf5zFFHrdXoXA1224FCNsQ"),
-"europe": DRIVE_LINK_PLACEHOLDER.format("1f_xOz9BoEmFrh7BqemmYyqCQaO23t-8w"),
-"expiry": DRIVE_LINK_PLACEHOLDER.format("1b2YOcoEC2j-M_bzUzFDZV0TbEHssmqqx"),
-"email": DRIVE_LINK_PLACEHOLDER.format("1z_05ku7mb___en8TqKgruScckyF7kln6"),
-"electrode": DRIVE_LINK_PLACEHOLDER.format("1dObFPa3sAT2xO2C1SMtuKIt0okWsbHml"),
-"extortion": DRIVE_LINK_PLACEHOLDER.format("1sJKzl36mJG8Q5mXCfs7Gw6QvmJW9ZXBW"),
-"eclipse": DRIVE_LINK_PLACEHOLDER.format("1bE89j5E5Z5vXh0CqL4FM3ibbJ8-HG23R"),
-"earthquake": DRIVE_LINK_PLACEHOLDER.format("1LPXrzpCt_5w_bxhmSUYTgj3dotbMaYvH"),
-"earth": DRIVE_LINK_PLACEHOLDER.format("1FmwWZtekBmNk1GGbqsfXnYxreKfuzEmz"),
-"elephant": DRIVE_LINK_PLACEHOLDER.format("1JsNc1rdPJsVg4BPB_SdDiJsVbhYfj6CG"),
-"eagle": DRIVE_LINK_PLACEHOLDER.format("1WzQRzm1ULSd0l1CRovu7pZT5kcNbm43-"),
-"experience": DRIVE_LINK_PLACEHOLDER.format("1w1Nqq1azd2W3ZLzxX31u8FBoieoc7D1f"),
-"expensive": DRIVE_LINK_PLACEHOLDER.format("1Tahx7Z3P78TiaN0_9dtaV6nZ1rahBUnH"),
-"exercise": DRIVE_LINK_PLACEHOLDER.format("1z50l7lSy9LGI50WqUesAAFTfZaHNxUiq"),
-"example": DRIVE_LINK_PLACEHOLDER.format("1lmFGQmLvm1NqCAzfQ3GSGeBVZPMqc-ud"),
-"exam": DRIVE_LINK_PLACEHOLDER.format("18H0S2vYaVAj0f7EX8dW7GnCLDoFNYrqF"),
-"everything": DRIVE_LINK_PLACEHOLDER.format("1hV28b1kbfReC6WMNshcbjLZe3IrBwmOK"),
-"ejectment": DRIVE_LINK_PLACEHOLDER.format("1biD1DGafsWU8m3aky3ITiEVx3_hI-JSi"),
-"engine": DRIVE_LINK_PLACEHOLDER.format("1bZ1-0XX5FZCRZrub9OOEsfYpxMUdG2p2"),
-"extra": DRIVE_LINK_PLACEHOLDER.format("1OPQjEjGeFJhY4Di-bGLUBsMI3zLWXORu"),
-"environment": DRIVE_LINK_PLACEHOLDER.format("1v4jqrslNkiAiZyAIAJTTxSw9d8rl5C3g"),
-"electricity": DRIVE_LINK_PLACEHOLDER.format("18-j1X3AOn_gPqVJa43-SslmHQmuyTqwK"),
-"emotion": DRIVE_LINK_PLACEHOLDER.format("1o4U1VFi4raIFLgnq7rO01pd7LGo1Olws"),
-"elevator": DRIVE_LINK_PLACEHOLDER.format("1aJi4dDAHpK1K3HauZsWeCzcZAw4oJZsy"),
-"election": DRIVE_LINK_PLACEHOLDER.format("1XuKBlQQ3wk3zzOFWSuypg0vrvZmDAw-r"),
-"each": DRIVE_LINK_PLACEHOLDER.format("1EhNR9F44UWHJ2DUP6aQuVLlQpmCe-JPB"),
-"explain": DRIVE_LINK_PLACEHOLDER.format("1N8krZIRMKxcOk1vOfg-kwq57AZh6vRPh"),
-"ear": DRIVE_LINK_PLACEHOLDER.format("1mCLA7EdkroC7kvunmPeO4Z3jZh7r1gWP"),
-"eye": DRIVE_LINK_PLACEHOLDER.format("1idukK5D7FkBQmX-h5z73tkY3XJ1zjudc"),
-"extend": DRIVE_LINK_PLACEHOLDER.format("1tfhdWpFDI96il49aBA9n2taEBtj2EWRC"),
-"experiment": DRIVE_LINK_PLACEHOLDER.format("1SiO2nmndKx8gqfYjOKl4QMe3-71KxJ_D"),
-"excuse": DRIVE_LINK_PLACEHOLDER.format("191Lz3M-tn32SG9-w1QPiLQHsS_EpmA0W"),
-"exclude": DRIVE_LINK_PLACEHOLDER.format("1vCU7NkKT8h7eMw9SXt-7VTsravpL41p_"),
-"excited": DRIVE_LINK_PLACEHOLDER.format("1vVhcXkebwCHVIRCcW0lxKx-hx5cbZHwZ"),
-"evil": DRIVE_LINK_PLACEHOLDER.format("1ZpBY2gLjb9jkhMNVWN0Re0_nIxfwvF0M"),
-"event": DRIVE_LINK_PLACEHOLDER.format("1S-iGqSxiSwGinr7K4kGfmXuxy_c5lNK1"),
-"euro": DRIVE_LINK_PLACEHOLDER.format("1Z4Z9GJ6df99OUToijav8Rq0CgLsWXq0J"),
-"equipment": DRIVE_LINK_PLACEHOLDER.format("1n2w3nStXMaQ--BkITWq4Mtp4JcGicuAg"),
-"engineer": DRIVE_LINK_PLACEHOLDER.format("1WeFS35sBQM3sw0uWBn88ekqVSm458ugi"),
-"emphasize": DRIVE_LINK_PLACEHOLDER.format("1IFFQA7Dcy2FdDwIBXjtT-9rC-7p786Mf"),
-"emergency": DRIVE_LINK_PLACEHOLDER.format("1WCVnil0MP5LTs1JdVRuVLqfdWfZkHyAs"),
-"electrician": DRIVE_LINK_PLACEHOLDER.format("1maPzUmZuYowP1JWkTtKATeohPuAt6g0n"),
-"eyebrow": DRIVE_LINK_PLACEHOLDER.format("15QLCN3t0qUFaNbAu6nYxBie8gTeiJp54"),
-"economics": DRIVE_LINK_PLACEHOLDER.format("18Fl4L5_uFDODCT739Dv9SrC3AOM8mzT8"),
-"eat": DRIVE_LINK_PLACEHOLDER.format("1iE4Q_7T0JpaU1gSUke4emOa__TNuyjKn"),
-"easy": DRIVE_LINK_PLACEHOLDER.format("1jLWsCSEorRSX7e7370dnDQjKucIau7C3"),
-"east": DRIVE_LINK_PLACEHOLDER.format("1NHQf4-JRaSA_9hSl5BvhGJ16sy9unrSc"),
-"early": DRIVE_LINK_PLACEHOLDER.format("1-km4kyDiF-5pic4UZ3Iz6MxvZ33Zlvsd"),
-"eyelash": DRIVE_LINK_PLACEHOLDER.format("1DRtgWd6wsAykAyjBRk8xGroXE466i_ph"),
-"endoscope": DRIVE_LINK_PLACEHOLDER.format("1_3e6kdwAMOIIe-EK4CqEwrPhGkerONaO"),
-"economy": DRIVE_LINK_PLACEHOLDER.format("1YGeb0k2SzfosoDEDQNMPi0t1Isy81Kv0"),
-"eczema": DRIVE_LINK_PLACEHOLDER.format("1Q8fXvZv-AdjfDftOo_eL74M-2wvS4nb0"),
-"energy": DRIVE_LINK_PLACEHOLDER.format("1FaNa_mn-RaH2ioyqBoUJPtRBUqBhjBZb"),
-"fuse": DRIVE_LINK_PLACEHOLDER.format("1lTCntysF-wQxxK3kKfoFw2k3t7XESBU1"),
-"freshwater": DRIVE_LINK_PLACEHOLDER.format("1XpiSGMo1OQsB0lXm9KpWpSBGQJ72t7gR"),
-"face": DRIVE_LINK_PLACEHOLDER.format("1LdU85mbnXjFb8f93UdT3avPbvCiT4GOl"),
-"fit": DRIVE_LINK_PLACEHOLDER.format("1-1R2FEwzr4Bby1HAidjAo_TmL0u-3RA1"),
-"forget": DRIVE_LINK_PLACEHOLDER.format("1cFvGJhBa8jJkadRnBbphhgAYoBjcbT_4"),
-"fashion": DRIVE_LINK_PLACEHOLDER.format("1Ho1fvyHmW5W6WH4To_NdrGe5N5MVur6g"),
-"fungicide": DRIVE_LINK_PLACEHOLDER.format("11_VQqSwnZYfQ1w_UzpChu_UBSLFZrveq"),
-"foodpipe": DRIVE_LINK_PLACEHOLDER.format("1vdQG_XVpMOyc4x9FXRKbMYjWfuQrGmzq"),
-"fertilizer": DRIVE_LINK_PLACEHOLDER.format("1OZZHjFrV8qEO-3m5X8zcfUfh8WP4n-FS"),
-"flask": DRIVE_LINK_PLACEHOLDER.format("1s7_iuEx0m0_VMiF8obJhuDiBc9lCIArH"),
-"fraction": DRIVE_LINK_PLACEHOLDER.format("1SooOSuVFfAtrhIQBWr0lgFBl1qhVcqyt"),
-"formula": DRIVE_LINK_PLACEHOLDER.format("1BIJkiqiCKFCRm23ku6fwHhrFqhvMnXlp"),
-"figure": DRIVE_LINK_PLACEHOLDER.format("1lU4EGGd1hWfVsjSlivL-z_ED8ZejvCNk"),
-"fortify": DRIVE_LINK_PLACEHOLDER.format("1ku-JFmjjB_oaFoMOzsZMdlx0et9D7PZI"),
-"fortification": DRIVE_LINK_PLACEHOLDER.format("1ku-JFmjjB_oaFoMOzsZMdlx0et9D7PZI"),
-"fort": DRIVE_LINK_PLACEHOLDER.format("1fzjiInVLpfqLgq22XowURxoumTjZHDRv"),
-"fop": DRIVE_LINK_PLACEHOLDER.format("1y4o9s-wNzTErYKr3uahj5I-WkrwvZ1zx"),
-"funding": DRIVE_LINK_PLACEHOLDER.format("1XOOzpif5_B5Jzqt5WCOz7mT0gigHntZE"),
-"futures": DRIVE_LINK_PLACEHOLDER.format("1nc3ymHgME82yQWUgeiMqbctV7F_bg_ql"),
-"floriculture": DRIVE_LINK_PLACEHOLDER.format("12gEl9tPyTjGsayDyASJVdSVfE7UN-511"),
-"frog": DRIVE_LINK_PLACEHOLDER.format("1jHn2mWOqIJ9D-_NPOsHELLzf3CwxNwx9"),
-"fumigation": DRIVE_LINK_PLACEHOLDER.format("1ZUmf6Nu--FutcJ4MphMhqwUGi6He4BtJ"),
-"fryers": DRIVE_LINK_PLACEHOLDER.format("1XRCpbZtEJFEi_OYQjF7REsiwLODX0eYw"),
-"firm": DRIVE_LINK_PLACEHOLDER.format("1a5spAY9z6CCKkkkpk479HjZ2gEFVCadC"),
-"frost": DRIVE_LINK_PLACEHOLDER.format("1JCJlhJAPnpLsCQGJzZ8X4LPPun1uph4v"),
-"fertilization": DRIVE_LINK_PLACEHOLDER.format("1EXIIAN_A4PIJfaGl3Pec4q0aGAUxpnvt"),
-"fusion": DRIVE_LINK_PLACEHOLDER.format("1VJuueb-Ha1Ghix9uqoWx1zI39ta7nYVy"),
-"friction": DRIVE_LINK_PLACEHOLDER.format("1rgnceqfQylAE9bPXoaGp6xjYaS1h72_1"),
-"flask": DRIVE_LINK_PLACEHOLDER.format("1Ul-8jncArNDsl66rEjBazw0qY1dieaAx"),
-"fission": DRIVE_LINK_PLACEHOLDER.format("1GCC2Yx9cqCokWqJYIqtGSDqw69MQTGTP"),
-"factors": DRIVE_LINK_PLACEHOLDER.format("15Vd-bD1eJ_ZyrhvL_cro5kCdZ-8_WZC8"),
-"fangs": DRIVE_LINK_PLACEHOLDER.format("1wFCD3DTw-nWV0uAk6W-vQv3v3Rd22Qnp"),
-"feed": DRIVE_LINK_PLACEHOLDER.format("1f9HImC3Ayi8FVK_DnkJdkT8k5n8S-jD6"),
-"feel": DRIVE_LINK_PLACEHOLDER.format("1WWuO-iHNPs5U41W5Mwk0zvk3rmAchaLQ"),
-"fight": DRIVE_LINK_PLACEHOLDER.format("1T-7TJ3Id6JqiIeF-rVVwUj5tEJGrzEYn"),
-"forums": DRIVE_LINK_PLACEHOLDER.format("1VmJ7h6R5x-_DemucxoUqY4gr0dFP9FXi"),
-"flag": DRIVE_LINK_PLACEHOLDER.format("1UyIIWm0tAgQtIOfMUiTc8ng26buWYleQ"),
-"filter": DRIVE_LINK_PLACEHOLDER.format("1Gvtl4mWPSQbJbaCnJgCPYqoO-QQ6ceUo"),
-"footage": DRIVE_LINK_PLACEHOLDER.format("1ADwKJVvDf9P7DspmnClbX3NjL0sHfPbg"),
-"fortnight": DRIVE_LINK_PLACEHOLDER.format("1bb_NhW81gHobUC2Jj_6w0AJhJUv8NRud"),
-"freezing": DRIVE_LINK_PLACEHOLDER.format("13bjK2M9CWGDrZnpW-UNKX9RG_OY7U33b"),
-"forage": DRIVE_LINK_PLACEHOLDER.format("1l8FQD3n9wNWY9SYfuW598UAdts5y9bfu"),
-"flyway": DRIVE_LINK_PLACEHOLDER.format("1aieexgRYKXU_Efu-D0j2k5gWPTIjrx27"),
-"foley": DRIVE_LINK_PLACEHOLDER.format("1vb-5e4Rc5vxMZXD2KnWhLN8JBLpB17sL"),
-"fishing": DRIVE_LINK_PLACEHOLDER.format("16CtEX8Xhmx-G0OTTlXSHChhRcO1TvRE7"),
-"fielder": DRIVE_LINK_PLACEHOLDER.format("10Mhn6-tOu1-cwCi4kZtALwQdd9cCbR63"),
-"fleece": DRIVE_LINK_PLACEHOLDER.format("1fyXLSIeUniwfPgfe3zlZ65PlPjcdX25j"),
-"figure": DRIVE_LINK_PLACEHOLDER.format("10aXdbBRber3Ef7-0eupvqAohlJvQXG9R"),
-"fink": DRIVE_LINK_PLACEHOLDER.format("1oN93sJkDdQvicesSgQW-d7njmiu_oKbC"),
-"fungus": DRIVE_LINK_PLACEHOLDER.format("10krhRvGZRKGR8NJMNsUovMMAiex-0uzw"),
-"free": DRIVE_LINK_PLACEHOLDER.format("1l2Sc9TNoaBrvAn5nXpu_KF7-88NM16-y"),
-"form": DRIVE_LINK_PLACEHOLDER.format("1GwCdWXoY8fU3VDT7xk75ytFmEitWPwUG"),
-"feasibility": DRIVE_LINK_PLACEHOLDER.format("1kDa3lq1-yiWExiE3kMF09GUuzxzQrZ_X"),
-"freeport": DRIVE_LINK_PLACEHOLDER.format("1RSCOw1i0Yf_xBnQ7biHe6Oq4-mHR0A98"),
-"fawn": DRIVE_LINK_PLACEHOLDER.format("1dlux_jsNS0azO-9_lVmm-rjIadPmadOu"),
-"foment": DRIVE_LINK_PLACEHOLDER.format("12deZ4sZcZrn7IbDbqaXQJBP0LJ7PNxeX"),
-"firing": DRIVE_LINK_PLACEHOLDER.format("15cS1G1KB4Hy8beELDk7EEpzNBXS_RGF_"),
-"filling": DRIVE_LINK_PLACEHOLDER.format("1URHOzHqbQrJPT47eX2aDEDuvnXsc1zN7"),
-"fluctuate": DRIVE_LINK_PLACEHOLDER.format("1qvOcA9x3_lJREq6U9QyT9bxi12WtAFTW"),
-"facewash": DRIVE_LINK_PLACEHOLDER.format("1iAgrQYO_fNkubZ8bknunv0SNDNetZoXq"),
-"fool": DRIVE_LINK_PLACEHOLDER.format("1DiVyl7LzaxbDQiqOUWccM7mq_2SLwT_W"),
-"farmer": DRIVE_LINK_PLACEHOLDER.format("1h6OqTmr216KNvMNQtwTGlaTv39aOn1TL"),
-"fluid": DRIVE_LINK_PLACEHOLDER.format("1XhtQaK38klZNwKVPYImcYYHPhNAQwXGd"),
-"fraction": DRIVE_LINK_PLACEHOLDER.format("1Uqoomw3c8JsygQgQEuuygA8R4z6JEvIC"),
-"forecast": DRIVE_LINK_PLACEHOLDER.format("1FUHRHYGIUE1CiMojLsgT6y6wEUyiMKPn"),
-"flora": DRIVE_LINK_PLACEHOLDER.format("104bNd715twMy27QzpjISpr2-InVOrPca"),
-"fauna": DRIVE_LINK_PLACEHOLDER.format("11-nVJdGifYHx1IMsDq7q3wYm3dQKLxbx"),
-"format": DRIVE_LINK_PLACEHOLDER.format("1LFPBRH88P0nqzebqRPEKAu1pNPTDpiBj"),
-"festival": DRIVE_LINK_PLACEHOLDER.format("1BGRmR0Nou_mfTbx1pmWC-_GbQ9_0hDwY"),
-"father": DRIVE_LINK_PLACEHOLDER.format("16BdBNUWAIF9tV2Nq_RNEOPn4599sZt60"),
-"family": DRIVE_LINK_PLACEHOLDER.format("1g8AOAyKV2Khw49DjEoqi7ianHHcSci2E"),
-"font": DRIVE_LINK_PLACEHOLDER.format("1BB7H6IHUorZokMwQZMDYqBndowpzpz25"),
-"folder": DRIVE_LINK_PLACEHOLDER.format("1yCONy5VQv7Fyhb6CWnXfwj2sNwXdM7gl"),
-"feticide": DRIVE_LINK_PLACEHOLDER.format("1spvSuKdNnu-9N70lNmLs59hCeu20O9_2"),
-"fisherman": DRIVE_LINK_PLACEHOLDER.format("161U8ncI-By6zwpHMWMGRcnPaygjiznXI"),
-"flash": DRIVE_LINK_PLACEHOLDER.format("1RB-X1xM67bu4AnQ0Wy1-45UIsdBqltC6"),
-"funeral": DRIVE_LINK_PLACEHOLDER.format("1aoL5byuLjPf27kjgzp0HQmZ1A1TZnsgS"),
-"ferrari": DRIVE_LINK_PLACEHOLDER.format("1kUJ59-RS7bHvNvKVloFqTTR7HRGzqJM0"),
-"frisbee": DRIVE_LINK_PLACEHOLDER.format("13cleI40kmPpHcdcjY8UTpl-McTzLTfmM"),
-"fish": DRIVE_LINK_PLACEHOLDER.format("1evv5SiNkaoG6tGQy3r4cT8cmkjsY9glU"),
-"funny": DRIVE_LINK_PLACEHOLDER.format("1E-7Qa7qouC5r9oaWV16tSENcxy_60Biv"),
-"fingerspell": DRIVE_LINK_PLACEHOLDER.format("1QpWGxHR4d4WIBF96pVDLizKY3rsNK058"),
-"female": DRIVE_LINK_PLACEHOLDER.format("1lbvQS7bQy9ZnPqsRU7J9xtxm3uoSpzFL"),
-"fast": DRIVE_LINK_PLACEHOLDER.format("1rRT2erMe6BfWdFLH44mUBO6yidzHkj5Y"),
-"farm": DRIVE_LINK_PLACEHOLDER.format("1SLTLZt53YFG43yA5-IRtgdMerpHq68z3"),
-"false": DRIVE_LINK_PLACEHOLDER.format("12gn4MfRTlutCdvcdRLcrkbgEMfwCRyV0"),
-"fall": DRIVE_LINK_PLACEHOLDER.format("1uPFuc6ly7PJGj0nQqqrJyO0vIhcTP_sy"),
-"fake": DRIVE_LINK_PLACEHOLDER.format("167i0QE7mUVFaKPvlhJ3ZJpynAcADk0EM"),
-"fail": DRIVE_LINK_PLACEHOLDER.format("114hH0lJhCPLFCN3WPLyn79SgE-sV5QWz"),
-"unsuccessful": DRIVE_LINK_PLACEHOLDER.format("114hH0lJhCPLFCN3WPLyn79SgE-sV5QWz"),
-"factory": DRIVE_LINK_PLACEHOLDER.format("112dga6rLAhHF6xpms8j--Jh5Tkhxr352"),
-"football": DRIVE_LINK_PLACEHOLDER.format("1EDrWL0eJ_lD5j8KYiZNWGCs1phAtIpn8"),
-"fungi": DRIVE_LINK_PLACEHOLDER.format("1Sym7kvkJExmsBYk-N6EG1e1u6l-kJ6O2"),
-"fossil": DRIVE_LINK_PLACEHOLDER.format("1s6qKlDnsOfCByS42qF-EHMErL9_4msL8"),
-"filtration": DRIVE_LINK_PLACEHOLDER.format("1BOW-5jwIcv8JVsJoY_SKPZVOmOk-OI-V"),
-"filament": DRIVE_LINK_PLACEHOLDER.format("1NhtQEXn26eklbMQppoJwU50ly1u1XKn5"),
-"fiction": DRIVE_LINK_PLACEHOLDER.format("1z0cxQ-yd5krfgXuiVBkLYQs54V8wn6Cn"),
-"fibre": DRIVE_LINK_PLACEHOLDER.format("1-kFMHOPBQ1_pupt2xlL6nVa93GdaJX7e"),
-"fats": DRIVE_LINK_PLACEHOLDER.format("1BV7ynJUVL76N5A4XmLu8sP3-2AI600Xp"),
-"famine": DRIVE_LINK_PLACEHOLDER.format("1fpN_Z5aZIFGbk4E-IdULkeCKMy0Wsekn"),
-"fibula": DRIVE_LINK_PLACEHOLDER.format("1r4b0_0MAjHRyXy4RVxoo3lIlyq8CFwOi"),
-"femur": DRIVE_LINK_PLACEHOLDER.format("10SHTJDrtV9DGpImsLBGfFLjcJ12MA5YL"),
-"fornication": DRIVE_LINK_PLACEHOLDER.format("1QWctIbIVnN1MOV_hl7R5gU_pmIXhVu4z"),
-"flange": DRIVE_LINK_PLACEHOLDER.format("1FqCoGlSIe0fQEJmEzDloVaQW7xNmXWpa"),
-"feeder": DRIVE_LINK_PLACEHOLDER.format("1Nh7MiLsovrnwMKoANcomEHPMtmvQHKPY"),
-"forever": DRIVE_LINK_PLACEHOLDER.format("198hPRWOGDMphcJNyxNJM04_ca6y_kizZ"),
-"flour": DRIVE_LINK_PLACEHOLDER.format("1WPd_WP21Ik35Pjj_htZjO-GB9495LYcc"),
-"fiancee": DRIVE_LINK_PLACEHOLDER.format("14Yc-P06avios3Yz_fYV4rYiSuu_-AJUW"),
-"fiance": DRIVE_LINK_PLACEHOLDER.format("1Yom4WewibI4EuJ83R-ah0scl6paSZG-6"),
-"foundation": DRIVE_LINK_PLACEHOLDER.format("1ujeTiD3diqvRyxQZQfB_kPfTRHg7UEAq"),
-"flooring": DRIVE_LINK_PLACEHOLDER.format("1Vulp5f71QQvGHN1WdFqclQNxAjX38jT0"),
-"float": DRIVE_LINK_PLACEHOLDER.format("1hQuGZCuMzUsJqHdu75O10bK-cfIh_D82"),
-"finland": DRIVE_LINK_PLACEHOLDER.format("1Ffv87Nheq2N-vIE6Hoaf2cSSMcU12ZGz"),
-"fiji": DRIVE_LINK_PLACEHOLDER.format("1ILRTUw9b_1HR0gwfs7looZmGeIoGp3BP"),
-"flipkart": DRIVE_LINK_PLACEHOLDER.format("1V3XBHfPfWK2gdmbnD_Fk6Z0Ra_rW3OFk"),
-"firbox": DRIVE_LINK_PLACEHOLDER.format("1xvYcQh8Lc7LLMYxqMyjbycvnsogdDyx6"),
-"future": DRIVE_LINK_PLACEHOLDER.format("1bQ2ouHbvhk0rK8GeOIG4qIxmBNBH28aF"),
-"february": DRIVE_LINK_PLACEHOLDER.format("1aQtV6UUNS8GDQVQfCoNih488JK2rPceB"),
-"freedom": DRIVE_LINK_PLACEHOLDER.format("1DyjHXUdlHK7RK3c6qzX0vH0zFtGoHRNj"),
-"fermentation": DRIVE_LINK_PLACEHOLDER.format("1tSGx6VyEAl2JC1B3MBYAGYRsVn-3aYI_"),
-"federalism": DRIVE_LINK_PLACEHOLDER.format("1xT6Uyc9Nrlfs7YZ7IPrK5e4IhPOA7nzR"),
-"farman": DRIVE_LINK_PLACEHOLDER.format("18lUKat_2gjAUyYTGmJMJXrbtKzKrj_3D"),
-"flaying": DRIVE_LINK_PLACEHOLDER.format("1YsoAX7g8G9nrZGz9nx3FeGR_2wOTT4a_"),
-"flatulence": DRIVE_LINK_PLACEHOLDER.format("1dagcI3MmLxogD22IsZU16nLGBF_8Wf2x"),
-"flatfoot": DRIVE_LINK_PLACEHOLDER.format("1Oh1ALTX0QU6glOPkb-c2QZ3FhvrP10vv"),
-"fetus": DRIVE_LINK_PLACEHOLDER.format("1V-ts38dOTCHuo2b-q1Dr8o9Fhe-NB6TL"),
-"farsightedness": DRIVE_LINK_PLACEHOLDER.format("1duGh3nW7ylrnpT4vtzyHshDe6ZbdG-M7"),
-"frostbite": DRIVE_LINK_PLACEHOLDER.format("1_qNyJzWHc_kQmk0pas1Pj1dt98I18weS"),
-"forceps": DRIVE_LINK_PLACEHOLDER.format("185N74PJNDQvxjsPhrv8MRG4ddvLVY0vJ"),
-"fingerprints": DRIVE_LINK_PLACEHOLDER.format("10QD8yntD9r2eWF5xTBEUoKxTOtl8OyL_"),
-"furtherance": DRIVE_LINK_PLACEHOLDER.format("1SO_icy3uR-ppA4mi7Ma-5ZJz3cPcRmLT"),
-"freight": DRIVE_LINK_PLACEHOLDER.format("1TwDbumiQQ3B3vk5v-5r2W9JqiFtKy-nX"),
-"fatal": DRIVE_LINK_PLACEHOLDER.format("12jVRnrs9lGgcqpDi3SXObI3-uq0yy-bW"),
-"facsimile": DRIVE_LINK_PLACEHOLDER.format("1Ujy8RtbPdukm8zIuK3hPH1edKLTLZol_"),
-"fabricate": DRIVE_LINK_PLACEHOLDER.format("1YJrnliNlTiopI59S4PQeoml2RtLjvTYj"),
-"farads": DRIVE_LINK_PLACEHOLDER.format("1jY_dSR8iMyAeTdiTYZBW7JLimj3JsYmx"),
-"functionalism": DRIVE_LINK_PLACEHOLDER.format("1YuSNIIUp1hAYnU2whzWMbSPak4UOGcsM"),
-"fascism": DRIVE_LINK_PLACEHOLDER.format("1K5D0uHsU1K7YWCefkLP2cppD58uvPjyA"),
-"fables": DRIVE_LINK_PLACEHOLDER.format("1N3uvi9MhNoXc8jSgxm3SFA2VgY3oI7wH"),
-"facebook": DRIVE_LINK_PLACEHOLDER.format("1cj568GZ5B7fHTT-JU1BUMbK4iYZMH8uc"),
-"fan": DRIVE_LINK_PLACEHOLDER.format("1WpVSVXCtyBBEwezrvAZCagPQ15c91QUC"),
-"fitted": DRIVE_LINK_PLACEHOLDER.format("1wKsmDmw0C_VuODOSCVIN-i5iXoW-UVvv"),
-"faggoting": DRIVE_LINK_PLACEHOLDER.format("1C-QukNnM2plWsua3c5_RcyPprkwitvrf"),
-"fabric": DRIVE_LINK_PLACEHOLDER.format("14HavamUHLqcYwT4WAblTglaAaJfCJtgQ"),
-"france": DRIVE_LINK_PLACEHOLDER.format("1rQrXCnI38IFxnKzTNHRza4kJKriyQuv5"),
-"fruits": DRIVE_LINK_PLACEHOLDER.format("1TAdQt3FczlAqn012ot8HXZalezVr_D1X"),
-"function": DRIVE_LINK_PLACEHOLDER.format("1U_kPDjfyvHmTF-KOSUKwypTuV2irFU8w"),
-"factorisation": DRIVE_LINK_PLACEHOLDER.format("1mpx_6EdhNi45I309te9MLSVFOba9jVKX"),
-"furnace": DRIVE_LINK_PLACEHOLDER.format("1rWwUmESMTjuk9F24zBQSytsG1dvU_Uf8"),
-"forest": DRIVE_LINK_PLACEHOLDER.format("15x3IoeXyt2xzlNWyqyvL4U_7g3ADgPjG"),
-"friday": DRIVE_LINK_PLACEHOLDER.format("1Mznw8UynmwtAq1U5EtHfSLPJcQb7NIEI"),
-"fog": DRIVE_LINK_PLACEHOLDER.format("1Dq_vKQCjzkRfNX_f2pUZ8_O2Xe2ArsRr"),
-"flood": DRIVE_LINK_PLACEHOLDER.format("1mwg3rvgz6v_azc28cm_EQHb3lwSbH-HX"),
-"fox": DRIVE_LINK_PLACEHOLDER.format("1X2IuTzsFajGw0o4obyaX8CHrWSxJUffm"),
-"fork": DRIVE_LINK_PLACEHOLDER.format("11KEK1_okK-JSwrm2Umd7n4CdIrjZJ-pZ"),
-"flute": DRIVE_LINK_PLACEHOLDER.format("106InqaVrUO1GoTp0idDg_Z8NVaBlLEuj"),
-"fine": DRIVE_LINK_PLACEHOLDER.format("1AS0jlHwNV0XuXrHSip3Le1UDjAHL05jC"),
-"find": DRIVE_LINK_PLACEHOLDER.format("1MTC4i9wXsTDExuwpogtls6VB6isiNKxc"),
-"final": DRIVE_LINK_PLACEHOLDER.format("15oQoQ6nAklPUX3DcqRRJip8MjV8VP36W"),
-"few": DRIVE_LINK_PLACEHOLDER.format("1wmtRNJ3elh42MZb8DHAeeJBYXT4aXQ62"),
-"fever": DRIVE_LINK_PLACEHOLDER.format("13c5UevvOdQ0dQIFOynuHCOt_0mOLyLn_"),
-"fire": DRIVE_LINK_PLACEHOLDER.format("1Se5XGrsW20mT5q-EwBdSJrHeQfN5PBxH"),
-"frisking": DRIVE_LINK_PLACEHOLDER.format("1LZyxKPYP6vNwzTlCKpJc3zs_kgEdmZVP"),
-"fifth": DRIVE_LINK_PLACEHOLDER.format("1PNVqeseNhRaBvQGyglM9grTQ5IwRdRj4"),
-"fly": DRIVE_LINK_PLACEHOLDER.format("1DdeUQ74tfajekkHubHZZPocai6y_1pgb"),
-"flower": DRIVE_LINK_PLACEHOLDER.format("1daY2_FaGJ2xY5wqm2f1wBSKD43_qA_-1"),
-"flexible": DRIVE_LINK_PLACEHOLDER.format("1jNdI6pN1fMkrOSSCb7ziA5LOfHl_Gzrh"),
-"feeling": DRIVE_LINK_PLACEHOLDER.format("1efwKUve8qVfQ61lVMMvW_rq9KUKupGQ3"),
-"fat": DRIVE_LINK_PLACEHOLDER.format("1WFtBdhbmjO7SW1uvDgCFa2e6D_M0Vk4G"),
-"far": DRIVE_LINK_PLACEHOLDER.format("1XyGK0UDiD1mzGq77F7_YO9OSndAnyvPQ"),
-"foundation": DRIVE_LINK_PLACEHOLDER.format("1LRSFQ3FRY9lmSeinY8Y11DTTFkw3vZr1"),
-"form": DRIVE_LINK_PLACEHOLDER.format("11JBNOOqld5hJOaHg8acuBW6CpCOr6_aa"),
-"forgive": DRIVE_LINK_PLACEHOLDER.format("1rXXD5YaxEmn_9te8NfHwtwHJXiVkdQOZ"),
-"faith": DRIVE_LINK_PLACEHOLDER.format("1zknS2Z-3DuLV-YmKsigrbWvvondxd0ZW"),
-"fact": DRIVE_LINK_PLACEHOLDER.format("1fsoyHa-EpvP5XUdCi-zMCOswl3L6upME"),
-"file": DRIVE_LINK_PLACEHOLDER.format("1nFIFFht5xSTHG1IJkP_ueWDLVHdBlH4z"),
-"full": DRIVE_LINK_PLACEHOLDER.format("1LfZo92_mUaFlCBzqkYKQ90jJFjkGj-3N"),
-"foot": DRIVE_LINK_PLACEHOLDER.format("10rUgzfxLTdla_0KiijMc15wFA6KySLso"),
-"forehead": DRIVE_LINK_PLACEHOLDER.format("1iOZnSl7kTF-F-xXRTQulDbDJBUu0FGrD"),
-"force": DRIVE_LINK_PLACEHOLDER.format("1mHkOWxetD5PegpQgynJtqDdstb-9TBq2"),
-"food": DRIVE_LINK_PLACEHOLDER.format("1w9fTPt3KklYVD9U0Xjk1yJ5-zPxB-w4j"),
-"follow": DRIVE_LINK_PLACEHOLDER.format("1rkzcS8aH902aitaLjU7-xGQyXuO_WAKP"),
-"fresh": DRIVE_LINK_PLACEHOLDER.format("1X2F-htNufXlE3PEGinO3H_8vCwilMBxe"),
-"freeze": DRIVE_LINK_PLACEHOLDER.format("1wQ9AwQyowCi8Y0Off4dd_TbSrJASFzeA"),
-"fraud": DRIVE_LINK_PLACEHOLDER.format("1k5MIAikcm7FrMIuPlWxNOOfdD3lkskyh"),
-"frustrate": DRIVE_LINK_PLACEHOLDER.format("1f-oTekSvnqa9MlPZLDRvwDPFYWgUYgOo"),
-"from": DRIVE_LINK_PLACEHOLDER.format("1f4xGi2KfMe-iZqRfTYehLWmliRUEXBny"),
-"friend": DRIVE_LINK_PLACEHOLDER.format("1ml7lthsJX7nIioROPcMtMQ1VUwnyyl_E"),
-"former": DRIVE_LINK_PLACEHOLDER.format("16Pe66S5u34GC8HsARXx1jsZSmJ5y7HZJ"),
-"footpath": DRIVE_LINK_PLACEHOLDER.format("1ClqaWM-d1nnGXjFq2AMjljI25uPrQNSZ"),
-"focus": DRIVE_LINK_PLACEHOLDER.format("116vBUz2WiEW9M3xPk52VkXYertvlIFqL"),
-"floor": DRIVE_LINK_PLACEHOLDER.format("1l1lfB3U0GWhkVDUv-uMmPgh7Xvxhr8UO"),
-"first": DRIVE_LINK_PLACEHOLDER.format("1XdX3Gslk5cKluqFRSZ8t8e4kOa2zfmeL"),
-"famous": DRIVE_LINK_PLACEHOLDER.format("1UYMr1hSQ-ztim9nyzK5f56QR77eg9Q9T"),
-"finish": DRIVE_LINK_PLACEHOLDER.format("1QH9bDUrLVKep800k488tFNetuur1bVZs"),
-"finance": DRIVE_LINK_PLACEHOLDER.format("12qTvE2918W1Lnr_3lBn4ojorTOH32EDR"),
-"fennel": DRIVE_LINK_PLACEHOLDER.format("1_5nNYHU73b1V2my5TKdnwuJymR1EUCQd"),
-"fence": DRIVE_LINK_PLACEHOLDER.format("1qUHUX63da3fcEXIGXsmFIByMLevAMAf5"),
-"fear": DRIVE_LINK_PLACEHOLDER.format("1CPFKH7E6gvn9FGJvuzk2S3WwoSkZu7Hy"),
-"fax": DRIVE_LINK_PLACEHOLDER.format("19-PwcAyT9QRulQYAPjyoXEDR5VX2eAod"),
-"favourite": DRIVE_LINK_PLACEHOLDER.format("1TtTUn89WLGNlbfRup68f5ZY6BPFTxaPK"),
-"fair": DRIVE_LINK_PLACEHOLDER.format("1Qa33Sqwfpdgt9lOEC3B2h0htTQwLDT1L"),
-"formula": DRIVE_LINK_PLACEHOLDER.format("1wAKf0fS3d6zpn0iZlqNDtkzJU8fQHXgX"),
-"forklift": DRIVE_LINK_PLACEHOLDER.format("1nZjUEaC9tdkI2-lTgtwEG0t3p6iokFI_"),
-"firewall": DRIVE_LINK_PLACEHOLDER.format("1LlipwqxJT19BS039k-ZNb5bhx-YKgiVp"),
-"fetoscope": DRIVE_LINK_PLACEHOLDER.format("1f1jelSAsqCoaDl-wMXSjI-ByKmuZqgS6"),
-"frequency": DRIVE_LINK_PLACEHOLDER.format("1fPq7av-us_84YGvc81fMOQEPUgvhKkrQ"),
-"firefighter": DRIVE_LINK_PLACEHOLDER.format("1iorJftYCkUTvVuqBTgwoYHX2nWoUM-ve"),
-"germs": DRIVE_LINK_PLACEHOLDER.format("1FJnVB0pyIngg7JZHwmn48e5UrBuxmhqp"),
-"geology": DRIVE_LINK_PLACEHOLDER.format("1lK19XFYzc_ennqcr6y1GhtZnxjNmx-wo"),
-"goosebumps": DRIVE_LINK_PLACEHOLDER.format("1rkAcwNOBRFbcG2hkJCU3Kw4BHnklCwBW"),
-"guilty": DRIVE_LINK_PLACEHOLDER.format("1BEXjhV6H1SOsSOugGAvAVv1p_pkFkdpN"),
-"gills": DRIVE_LINK_PLACEHOLDER.format("154igCNR0XAh0KGdwgZKey9sxW-QA-L7R"),
-"gas": DRIVE_LINK_PLACEHOLDER.format("14sKRb2tDay4t411G3_gK_joH02wI3L4x"),
-"greatest": DRIVE_LINK_PLACEHOLDER.format("1xMUwKKb90KQej1MMNdhFWQSo5K637oz_"),
-"geomrtry": DRIVE_LINK_PLACEHOLDER.format("1s-vcusi4SRiEobFL6LJZx8mVMpRcKed3"),
-"genealogy": DRIVE_LINK_PLACEHOLDER.format("1nmaTZEI8tSBaZ-waTDZM5md3ky50kY9a"),
-"gana": DRIVE_LINK_PLACEHOLDER.format("1lzXLVdm8jE87arh8BjH76EoMZqdtGpT2"),
-"gujarat": DRIVE_LINK_PLACEHOLDER.format("1PY3bRbwr4AbF5fbw0AL1WlK8vOw3YEc3"),
-"goa": DRIVE_LINK_PLACEHOLDER.format("1ZDyjAUJmnw3pn4bUnIC81HlzMOtne7yz"),
-"gangtok": DRIVE_LINK_PLACEHOLDER.format("1zunoACmeOE865DJqvNvRBbnf7oY6DOpm"),
-"gandhinagar": DRIVE_LINK_PLACEHOLDER.format("1Hy9eDtH5nBGFDZWHzv_z_e6fqk6OzwIh"),
-"guttation": DRIVE_LINK_PLACEHOLDER.format("1XGazEFevIzgH9phc5cZzJaCYIh80DXA6"),
-"gravity": DRIVE_LINK_PLACEHOLDER.format("13N0P4qZuqoJU9_S_bwHqqBkZZ9OIibpJ"),
-"gravitational": DRIVE_LINK_PLACEHOLDER.format("19Hgj66lJBDqxnJnxzLznpSANR2n6qFIO"),
-"geometreical": DRIVE_LINK_PLACEHOLDER.format("1Ji5LF-mEy-9GM74Qrd9OWtEXFxkz7-Ly"),
-"grading": DRIVE_LINK_PLACEHOLDER.format("1cBsYxCy5dsN9CqOHdAlricEGZXXOo81x"),
-"genome": DRIVE_LINK_PLACEHOLDER.format("1buT-Pw4s1EkThn4whmbbQmWRPEz_z3UT"),
-"giant": DRIVE_LINK_PLACEHOLDER.format("1yxGKA8T5CHvgNSiaxXv8Y_d9lnCwH1tV"),
-"glare": DRIVE_LINK_PLACEHOLDER.format("1UUDXce0Ai54vUPQTz8UE4dU6qk40Rio-"),
-"gutter": DRIVE_LINK_PLACEHOLDER.format("1frrCbEXJDKpIyteXTejkpteUMM87BCa7"),
-"grid": DRIVE_LINK_PLACEHOLDER.format("1neCTOxMJOWWa_eV42DYhemA5zEfC4Pr2"),
-"gargle": DRIVE_LINK_PLACEHOLDER.format("1cVYntZH-hbu8VWokg-juDeISiNILEjk3"),
-"gangster": DRIVE_LINK_PLACEHOLDER.format("1Ziik3du39J_z4_BIF3nIZi6AuVIzoIaz"),
-"gnp": DRIVE_LINK_PLACEHOLDER.format("1sRbGgTFDoYeYz4XpGZ0V0K8hj6rlT6wR"),
-"goals": DRIVE_LINK_PLACEHOLDER.format("18Qye9vfLjLrjhj9Wqj1C-uyqKpOgS0Br"),
-"gatecrash": DRIVE_LINK_PLACEHOLDER.format("1Y03Wc0QHUcC3Z3wIZJhtZWRgkyChDKNb"),
-"growl": DRIVE_LINK_PLACEHOLDER.format("1BSnKTMZpGRSfSscdoafr3W3f-P0jNJbM"),
-"grind": DRIVE_LINK_PLACEHOLDER.format("1xvd6PYd9E6Av9Tzz6Zi5FT69rMdUgJxs"),
-"garnish": DRIVE_LINK_PLACEHOLDER.format("1IQY_tpvVUXqZCvakjvNzo2WiL5evC8G_"),
-"ghat": DRIVE_LINK_PLACEHOLDER.format("16_9LhBJ6LyYhYen9EX-OsQVliY_ac8gl"),
-"glow": DRIVE_LINK_PLACEHOLDER.format("1WTRkzEfiI4H2Gsn4gqBziaNBbJfj2iA-"),
-"greywater": DRIVE_LINK_PLACEHOLDER.format("1UgbmPPE76WiK3MnSowx50ew725RH2EEz"),
-"groundwater": DRIVE_LINK_PLACEHOLDER.format("1_r_4KYlLyTJcfoNEH_wv_OY6uoAzMcXg"),
-"genre": DRIVE_LINK_PLACEHOLDER.format("1ovUShxxOFhqXtHiJ23K7iou5I3VnWuZp"),
-"glutton": DRIVE_LINK_PLACEHOLDER.format("1sTDxJ6wacRGKvheTeKp38Df5WdIxLzvs"),
-"glad": DRIVE_LINK_PLACEHOLDER.format("1EmjJ4xDxnN3BfBGDnQ_lRM2qhygMFFIO"),
-"glint": DRIVE_LINK_PLACEHOLDER.format("1kmO1lzbWq90MORE8uX7i0SDMSgQGVfbZ"),
-"gather": DRIVE_LINK_PLACEHOLDER.format("1yOP9JGZ_hVYxiogfzkjWPPBiZ3kNkt_u"),
-"glimmer": DRIVE_LINK_PLACEHOLDER.format("1grpoDAmd3NG3QTBd97q6cs-BUohGKlgk"),
-"gradual": DRIVE_LINK_PLACEHOLDER.format("1-BuW3zi-vCM34hwJmYN7t683wrsbcZGF"),
-"gaffe": DRIVE_LINK_PLACEHOLDER.format("1COlOAWBd_P7QjOYEZeVWJ81UCkYmmyw7"),
-"genealogy": DRIVE_LINK_PLACEHOLDER.format("12-HWeeBOCZ7-Al05_qreSNJ7aZDQrDqj"),
-"gloom": DRIVE_LINK_PLACEHOLDER.format("1NLfO_dayGHY_ZOUo-quYknbcZUA0oXxF"),
-"greylist": DRIVE_LINK_PLACEHOLDER.format("1p1LDifyoQbOpuxIMQQPR3ZO3pQRogSxK"),
-"gramophone": DRIVE_LINK_PLACEHOLDER.format("1phKlN2N-3SicMb0Lj-XpzCvhN_61T80C"),
-"giftwrap": DRIVE_LINK_PLACEHOLDER.format("1eUUaVJg2fSkFthmywrM0TbrqG998NwdD"),
-"garland": DRIVE_LINK_PLACEHOLDER.format("19OjDR0m2Kpg0dgFnpj4BUlSg8g9orBFJ"),
-"gallows": DRIVE_LINK_PLACEHOLDER.format("1hF4oqOrg5p1xqyu2SrqlpC6jCqpmzAmi"),
-"grenade": DRIVE_LINK_PLACEHOLDER.format("1ymfcOT5DCPNnDErrwCt4F_RBibnSRK1z"),
-"grief": DRIVE_LINK_PLACEHOLDER.format("1sJknuCT3Za1z8UQrSWeuNWrnDPkxpcbk"),
-"sorrow": DRIVE_LINK_PLACEHOLDER.format("1sJknuCT3Za1z8UQrSWeuNWrnDPkxpcbk"),
-"sadness": DRIVE_LINK_PLACEHOLDER.format("1sJknuCT3Za1z8UQrSWeuNWrnDPkxpcbk"),
-"grease": DRIVE_LINK_PLACEHOLDER.format("1FFmx3CPnzonwdlXUEPnl4Iq0MyY7QhPy"),
-"grate": DRIVE_LINK_PLACEHOLDER.format("1kmrLqYW1djPLch_jTiJfARgZ4BvU03W9"),
-"god": DRIVE_LINK_PLACEHOLDER.format("1VIGJxBEq_rOtBpd8eppaMTgcYDMzX9fl"),
-"gem": DRIVE_LINK_PLACEHOLDER.format("1AFpFpmJ2iarld9-9rkPKTUj-WlUSqS-Y"),
-"guest": DRIVE_LINK_PLACEHOLDER.format("18-RiF64MQKt18m3ACDQ6LpxnhFQCf5KB"),
-"gossip": DRIVE_LINK_PLACEHOLDER.format("1kQhxZYNLnln7Qz2hlSU0qiCnnnFq_Z7u"),
-"glacier": DRIVE_LINK_PLACEHOLDER.format("1bpjRzrLBDt7VVO0t3AeWgTw6FObut6xh"),
-"globe": DRIVE_LINK_PLACEHOLDER.format("13gaYfR0xK8PBbPnblshiTkeQSZjKgKtF"),
-"grandmother": DRIVE_LINK_PLACEHOLDER.format("1MDX2GuxWBiE1_VFX_KQuLgm-kRaXbefZ"),
-"grandfather": DRIVE_LINK_PLACEHOLDER.format("1uxQw4Vl10cy2CrxkaQyLwYML7mIRRre2"),
-"gst": DRIVE_LINK_PLACEHOLDER.format("1IqsGnr62pKHfB54yELSsj3tuejLUQrof"),
-"globalisation": DRIVE_LINK_PLACEHOLDER.format("1nWd4Lp2Zco3oOigjLHQy4EWt_HpnFM5K"),
-"gazette": DRIVE_LINK_PLACEHOLDER.format("1kgYfdYsuQFJxYcg67az7P2JJFDQUGTW5"),
-"gardener": DRIVE_LINK_PLACEHOLDER.format("11vlXoLWC6_HBizySOs6eJWN0cGHrfVXp"),
-"ganapati": DRIVE_LINK_PLACEHOLDER.format("1IwOwtTF9M6DFY0SXxXLRyl9w06NFcTfe"),
-"grey": DRIVE_LINK_PLACEHOLDER.format("14jbreCOQLCZjfJOr4-uiBcoVN3eyZPMK"),
-"green": DRIVE_LINK_PLACEHOLDER.format("1iBnYWivuvuKl5HyXPVgV0oxkd9y1GPhQ"),
-"gold": DRIVE_LINK_PLACEHOLDER.format("1pT_juIjaqxGd25CTv-xAHGag6FfcSsbk"),
-"grudge": DRIVE_LINK_PLACEHOLDER.format("1a0fsViLVGSr1NmAR_ibSzmTuKW1-Pufl"),
-"gotras": DRIVE_LINK_PLACEHOLDER.format("1j8XLdx6Y-BJiXlbTlmeKqcsofV4O51sZ"),
-"gionee": DRIVE_LINK_PLACEHOLDER.format("1YPkhcW3FcHBNUpPRKiPHpU01xQWC24DD"),
-"golf": DRIVE_LINK_PLACEHOLDER.format("1Jmv9_6a8v46IkArbrVjQUuTG_77ITw4M"),
-"genie": DRIVE_LINK_PLACEHOLDER.format("1EDer0apG46IXfL2ci1fMhvAS5JT1tMIY"),
-"gas_stove": DRIVE_LINK_PLACEHOLDER.format("1vZI5QTMZNqXxkf6c21WYkPsTeFpX791Z"),
-"gujarati": DRIVE_LINK_PLACEHOLDER.format("1wytY3CQJrkZ27l3T9bFUn1hZkgrX9IvD"),
-"good": DRIVE_LINK_PLACEHOLDER.format("1nW4kqwmmMYGJWvNavb5Ko6C1VROMzf6R"),
-"grasslands": DRIVE_LINK_PLACEHOLDER.format("1bJP5LyZ66ZTNzCkeXz3-hORoj6OzfMrw"),
-"granary": DRIVE_LINK_PLACEHOLDER.format("1tpNK8jSoXG3Tm0cFKyHYTFEHH_SDwMlA"),
-"germination": DRIVE_LINK_PLACEHOLDER.format("1Vo2GXtT8EmiPXpHtVVCeMvq7iiW92Zw9"),
-"geosyncline": DRIVE_LINK_PLACEHOLDER.format("1XB1E-pM16h2Qa_cGhnZROgbfIN3BBTFq"),
-"galvanization": DRIVE_LINK_PLACEHOLDER.format("1hZtO7GMEtTRWNx1uJyivgwKhN4e6LOPk"),
-"grill": DRIVE_LINK_PLACEHOLDER.format("1J7dSXf_K5LL6G8HjhfdKKKp6_O5gVia-"),
-"graders": DRIVE_LINK_PLACEHOLDER.format("1G_3pXIFryYKmNjNJRWZixOev_BmHvznJ"),
-"guinea": DRIVE_LINK_PLACEHOLDER.format("1ccKAmGb84X31koUcW9px7ZENRcp7k8Dz"),
-"guwahati": DRIVE_LINK_PLACEHOLDER.format("1CSFl3e2PcNTTN_sA16Z31B_HYBgAb1JI"),
-"greece": DRIVE_LINK_PLACEHOLDER.format("1qbh3LFPL0gv64XLcyrU3MPxFncpnLDFj"),
-"ghana": DRIVE_LINK_PLACEHOLDER.format("11uOagV5V7XtfZcxrrjfg4k9jQSfmL8NG"),
-"georgia": DRIVE_LINK_PLACEHOLDER.format("1RTpTQ9qwGU-2cdf5m9d-nLJBFUDufeOE"),
-"google": DRIVE_LINK_PLACEHOLDER.format("1R-5QM_pUliJTH4iiN7KtNjPvJ3bsLx2P"),
-"gmail": DRIVE_LINK_PLACEHOLDER.format("127t4QN0Lti_u5JjqH8vi4sCCX_KfZ5MP"),
-"gutka": DRIVE_LINK_PLACEHOLDER.format("1zqnu9TruG5R913GNAYkWjFOSAc0n9lD9"),
-"girl": DRIVE_LINK_PLACEHOLDER.format("1M8D-36hrLcMb-OVTR4_d9NQBRXi747e4"),
-"ghettoisation": DRIVE_LINK_PLACEHOLDER.format("1VNys5YjprPT7KLdLuXSQIdRwCxBmDBNV"),
-"gynecomastia": DRIVE_LINK_PLACEHOLDER.format("19AfTMYrtxcjvUC_30Lx1RwFdMwAUQFFf"),
-"granulation": DRIVE_LINK_PLACEHOLDER.format("1MVHXYoruC-QcNgGsE_viKkFWcgrn5lhX"),
-"grafting": DRIVE_LINK_PLACEHOLDER.format("1UzA_TULl6u8o3yehTatOLEsWShi2_If5"),
-"graft": DRIVE_LINK_PLACEHOLDER.format("1gVaNxoUJhiuRPLZS-VMNuK9i2Lcm9lWg"),
-"gout": DRIVE_LINK_PLACEHOLDER.format("1y3pQitIu78zEfFbsJpIECDxZxLhIoQIt"),
-"gonorrhea": DRIVE_LINK_PLACEHOLDER.format("1MngHi6UrZYl_NB7PPEdx1lC3Yj7p1AEX"),
-"glove": DRIVE_LINK_PLACEHOLDER.format("16BKulCTF0kLGxwj9-RnXWz3S8hXGutqm"),
-"gallstone": DRIVE_LINK_PLACEHOLDER.format("1aIX49vuXQeq1Q1rGeEGVNatjW3med4LT"),
-"guarantor": DRIVE_LINK_PLACEHOLDER.format("16DZfEVkvm4TTad_XlQgeEt3p-MoQILgx"),
-"gratuity": DRIVE_LINK_PLACEHOLDER.format("1i39HUWh2qNL--nUxYWv0sMoDQj6MUspC"),
-"gesture": DRIVE_LINK_PLACEHOLDER.format("1BQPW8CAm5qEiXPDz8e8usxK9jmtQQtID"),
-"gang": DRIVE_LINK_PLACEHOLDER.format("19gyfJKXy6T41mganKwAQSIuMsyf1WFEO"),
-"gain": DRIVE_LINK_PLACEHOLDER.format("1qmj73CXmn-ZQ8gHCXXrQ_OcjCQO9VBog"),
-"generator": DRIVE_LINK_PLACEHOLDER.format("11gSE-Vx0PaaBZ_Nb6-xzCfIDy_1qxC62"),
-"goldfish": DRIVE_LINK_PLACEHOLDER.format("1HDaNf6QuJVZ42Z4TRWgGF3_Onc-fhPLr"),
-"gun": DRIVE_LINK_PLACEHOLDER.format("1EWcqxBYz2NZ2LOda30jRyhmg8PSgNtLz"),
-"glass": DRIVE_LINK_PLACEHOLDER.format("1OxLn6ihfyvBrb_n27FD_I9HMTbWaS2KQ"),
-"grommets": DRIVE_LINK_PLACEHOLDER.format("1VmeK877U9wr8Wsmd8rGe1gTO9cyCpeWP"),
-"godet": DRIVE_LINK_PLACEHOLDER.format("1ixdp-IOrNlawZYWQKF-HlLTiQA7OK-sS"),
-"germany": DRIVE_LINK_PLACEHOLDER.format("1uvZ64FzA3bO2kCU_e2WRfAoLk7jDmDPX"),
-"guava": DRIVE_LINK_PLACEHOLDER.format("1km0QJXQ8XrkRL0qS6h4FhOXaJzuJSVJC"),
-"grapes": DRIVE_LINK_PLACEHOLDER.format("1NiKtmCFcstmMvG9NLZnfIPLVPNAYRmpG"),
-"ginger": DRIVE_LINK_PLACEHOLDER.format("1ib63_9N67cUHzQ-XPrKUc5gqu4AdXc20"),
-"gprs": DRIVE_LINK_PLACEHOLDER.format("1KvPD5Jqcarv-Nq8yNlGGjvT7GEQ-z5KZ"),
-"garlic": DRIVE_LINK_PLACEHOLDER.format("1Pqo4dq0tAl1boZE4Ginpr_5svHprTUkv"),
-"guide": DRIVE_LINK_PLACEHOLDER.format("1Ds0o5aP2g4FiqrfakAsczE-2yu_bw4AR"),
-"government": DRIVE_LINK_PLACEHOLDER.format("1806JtEW_vgyJvNBx4TORkTuMBxFoEzDq"),
-"grass": DRIVE_LINK_PLACEHOLDER.format("1_hne5tz5v29dJspQ_5L989TSrXWDEjcX"),
-"goat": DRIVE_LINK_PLACEHOLDER.format("1C0Sqp1SCo2gFN8hl46X_xrxgk31499iH"),
-"giraffe": DRIVE_LINK_PLACEHOLDER.format("1WSmBaHg63mRidICLxeC7T97a46SPx9o9"),
-"guitar": DRIVE_LINK_PLACEHOLDER.format("1qmWitjBWkEZAvOtAJWEPCQxX8EfXlqQs"),
-"grandson": DRIVE_LINK_PLACEHOLDER.format("1BHsXDMAe3MIHvpgdHAFDnUqX74P_Dibn"),
-"granddaughter": DRIVE_LINK_PLACEHOLDER.format("1GcZxLy7rK6i_pPjbMn5H2DrjFf7BPRbx"),
-"game": DRIVE_LINK_PLACEHOLDER.format("17w615Xk1g_TnTQt8RC4M8FB1eeyNWn98"),
-"gynaecology": DRIVE_LINK_PLACEHOLDER.format("1stKpxunLPDLb0cgplYd8dNmacKG2PcHG"),
-"gynaecologists": DRIVE_LINK_PLACEHOLDER.format("1sya-me5EEDdW4ocXUBwH-kz9HdiaZMAR"),
-"gif": DRIVE_LINK_PLACEHOLDER.format("152j1_2jxeogOyej6_KiouPZOgeJMGf6R"),
-"gurudwara": DRIVE_LINK_PLACEHOLDER.format("1gggLJ2pSKHAy_Qiymu9kEfeHw94fvSje"),
-"guess": DRIVE_LINK_PLACEHOLDER.format("1AfC8sATba-WxXt5BpKTvdpjXK4odFEs4"),
-"gram": DRIVE_LINK_PLACEHOLDER.format("1mzffM6_1APrmUgBb5GJY5MD0VRXb0BIo"),
-"genuine": DRIVE_LINK_PLACEHOLDER.format("1i5DqgmBdR7k4Pqhh2pPx4zMhb_LfUy7u"),
-"general": DRIVE_LINK_PLACEHOLDER.format("1pa1n9xS1ZIGIm8r1FjMWR71KzqzQiDkY"),
-"greedy": DRIVE_LINK_PLACEHOLDER.format("1d4PB2f18c95fLz8YDIJWqdLW_UlrKl7L"),
-"gloves": DRIVE_LINK_PLACEHOLDER.format("1GOuRUzhrR3vDv8x0zC_EMGRCKeyiPRWe"),
-"gender": DRIVE_LINK_PLACEHOLDER.format("18847M232BwOoj0DPCuoG0AUMKYF4gEzU"),
-"guilt": DRIVE_LINK_PLACEHOLDER.format("1WDYs15XzwfwQQdT-KwJ_j-hv6gk8loom"),
-"grammar": DRIVE_LINK_PLACEHOLDER.format("1AsS0q0nTjDkBg5qLrFmx4A8x4NCXWDtm"),
-"grain": DRIVE_LINK_PLACEHOLDER.format("13c_sEtZ3nFTEltIkJKTXGokHQyVqHAAj"),
-"gift": DRIVE_LINK_PLACEHOLDER.format("1Hl9BZe5U9N27IQcLINrkmnicvy-dYBtz"),
-"get": DRIVE_LINK_PLACEHOLDER.format("1syvydvKqdEEOdVGdwh47PvD_SaT6pNyx"),
-"garage": DRIVE_LINK_PLACEHOLDER.format("1oofPPrz6gS1LA4h4VdDCkHswCdc7_nxe"),
-"gastroenterology": DRIVE_LINK_PLACEHOLDER.format("1NFb-8UCSmLj2JewAilFKjyl6UC_6U0g-"),
-"girlfriend": DRIVE_LINK_PLACEHOLDER.format("1_o4MgoDa6IpxwFjNHMBTPoZdbmeOREBu"),
-"graphics": DRIVE_LINK_PLACEHOLDER.format("14fSSs_5RxgTy5OZvX1o2SFXLoXzoZySA"),
-"gears": DRIVE_LINK_PLACEHOLDER.format("13WnXobLsqk8VpVy20oGlVMTzoa-muJ-V"),
-"gauges": DRIVE_LINK_PLACEHOLDER.format("1MNdN1WlFlQNcmyFbtytQQY6o7UvCUeri"),
-"gases": DRIVE_LINK_PLACEHOLDER.format("1NHEk0jr2ec3lLpRNqJ1axQWsL7OjUedI"),
-"gerontology": DRIVE_LINK_PLACEHOLDER.format("1Pl3xHNbF0dBCZ7KJrNoN6hR27eZwys3K"),
-"greenhouse": DRIVE_LINK_PLACEHOLDER.format("1UrX9YB6-mqLP4XVXOxoIOVZK3DM_9SIm"),
-"genius": DRIVE_LINK_PLACEHOLDER.format("1UD8EOtCk6Gqw3nlhI57p26LIuV2aDxQU"),
-"gate": DRIVE_LINK_PLACEHOLDER.format("154t0M4C9c3qRsTadV2WelYq0pCkugWxk"),
-"gas": DRIVE_LINK_PLACEHOLDER.format("1MGKUI-85lrh6ng9u4qvYlBfIIKeV4rVM"),
-"group": DRIVE_LINK_PLACEHOLDER.format("1-MB4jCGtPJxy8uoRrLCO383Vy_NP4Tcj"),
-"go": DRIVE_LINK_PLACEHOLDER.format("1JXqAJAu1c2q0u5pxeGkf0CBSvC4lvYkt"),
-"glue": DRIVE_LINK_PLACEHOLDER.format("11m5fSnVwaNNY5y13OsMcYQybEKdbppJY"),
-"give": DRIVE_LINK_PLACEHOLDER.format("1H6CumVB-BXNoLZOjR8ndQungNwoFGOQA"),
-"gentle": DRIVE_LINK_PLACEHOLDER.format("1Wt28ki95eBqWVt7_WpRUt2oCD-OZ6XV5"),
-"geography": DRIVE_LINK_PLACEHOLDER.format("1tfSvM2LuZ2wSyOgvlzRaj3FChvu-OVrO"),
-"garden": DRIVE_LINK_PLACEHOLDER.format("1ky5Z0z6gP0Llkm-m2OiSHD4pAE7_oP23"),
-"garbage": DRIVE_LINK_PLACEHOLDER.format("1_DU7SiBFPbqAh_cc-bWCj25PmoGOO7l6"),
-"helminths": DRIVE_LINK_PLACEHOLDER.format("1OnzHWaE72MX4fqJG0RO2i9wZX0TdE3FE"),
-"habitat": DRIVE_LINK_PLACEHOLDER.format("1OKmdhxTkFVkwfpbY3dOsWNsaLR5h2MwZ"),
-"historian": DRIVE_LINK_PLACEHOLDER.format("1teyBj_0ymj3ANCjD_GHd93vu21SUQd_M"),
-"hard": DRIVE_LINK_PLACEHOLDER.format("147dG8vx0pQl3RQOSjqjGc-92RgZ9Dp1u"),
-"diffcult": DRIVE_LINK_PLACEHOLDER.format("147dG8vx0pQl3RQOSjqjGc-92RgZ9Dp1u"),
-"hard": DRIVE_LINK_PLACEHOLDER.format("19JLB8ELDahzSXD8thMHOMqpdPSBRrtWY"),
-"herder": DRIVE_LINK_PLACEHOLDER.format("1pSad05Giti1Ekn7kX6pb4UsvmXhU9sQa"),
-"herd": DRIVE_LINK_PLACEHOLDER.format("1y7mYNZbeBmJfBF5W8CyJrp2VM6VEMKIH"),
-"healthcare": DRIVE_LINK_PLACEHOLDER.format("1hDvUnQ5DcCKDG318gK0n1ISQ8vmMaIVu"),
-"herbicide": DRIVE_LINK_PLACEHOLDER.format("1oeC-u-gH--Hh2yGTCihCwxTDEMb3GwoX"),
-"hydrogen": DRIVE_LINK_PLACEHOLDER.format("10oibEXhpOcXgOsJaJ-xeFriAGMbWoPf7"),
-"host": DRIVE_LINK_PLACEHOLDER.format("1uKJojtcxUWhfahNxxOYkGWaa4Bhb7kog"),
-"heat": DRIVE_LINK_PLACEHOLDER.format("11Rl1kYhWZc0qfiCq0iQPNqf8b5KXWbZO"),
-"heartbeat": DRIVE_LINK_PLACEHOLDER.format("1vUtVKFGCe_Nd2BkMiY3EZ51PLX3TkE8c"),
-"haemoblobin": DRIVE_LINK_PLACEHOLDER.format("1gBaoew_clrCsBLnZ9yyy_lyNHyN9oSDv"),
-"herb": DRIVE_LINK_PLACEHOLDER.format("10tjErsuZj8THwOU1LBmcv5DyxOO8uhyi"),
-"hundredths": DRIVE_LINK_PLACEHOLDER.format("1D3RLckLaPEgR07ptbX7x-SSrj-bXaAKg"),
-"half": DRIVE_LINK_PLACEHOLDER.format("18ICouPofKQDrImYtnIMcwZmLbe8cGxIM"),
-"heptagon": DRIVE_LINK_PLACEHOLDER.format("18qDBFditHRrnCl0HFc8o1hZapGa0m8QF"),
-"hexagon": DRIVE_LINK_PLACEHOLDER.format("1dyROLAVj_kUpoOLaHuca2SXgPPKmo8Nh"),
-"hundreds": DRIVE_LINK_PLACEHOLDER.format("17nqA7aXrZVJBc5kualGLPG19csXpti6X"),
-"hastinapura": DRIVE_LINK_PLACEHOLDER.format("1BfxfFjA2PwdjyUPHPXw4DlzLPc0ljQIX"),
-"hymn": DRIVE_LINK_PLACEHOLDER.format("1IPHve9R-Ssy0F88_8c6T65PTFaxlzyxY"),
-"hyderabad": DRIVE_LINK_PLACEHOLDER.format("1URE86xGzy_qEnfkUEyJDKVVmWeVpky_a"),
-"haryana": DRIVE_LINK_PLACEHOLDER.format("1jF_4zR9Cn1TQg-DQatv7jiEhU8433Twc"),
-"hedges": DRIVE_LINK_PLACEHOLDER.format("1XsFuLRNBIB_3_8-81SkasyC5Yl55lW0X"),
-"honey": DRIVE_LINK_PLACEHOLDER.format("1FNWx5I8_sUJb4AZm9YpziKLpdx9XERV-"),
-"herbaceous": DRIVE_LINK_PLACEHOLDER.format("1IFlMLAEjfrOK-50ONZRNEsBAHcz0eJvI"),
-"hydathodes": DRIVE_LINK_PLACEHOLDER.format("1pVlXXxOHlog27wdFHkRbKm5-dCcGA-Ro"),
-"hypogeal": DRIVE_LINK_PLACEHOLDER.format("1LDqEplQWwwRtupynOQ7vRNRkQcYO45ZV"),
-"humped": DRIVE_LINK_PLACEHOLDER.format("1RbHqQTehkQHOqf_VJhIimpI4LWKugUfc"),
-"heterotrophic": DRIVE_LINK_PLACEHOLDER.format("1cZFV7vk3HuasnXUeUDsoLM9zz6MK53O8"),
-"hydration": DRIVE_LINK_PLACEHOLDER.format("10eyEWS5Z2zWCsgZknWTMGX6egw2tETDl"),
-"hybridization": DRIVE_LINK_PLACEHOLDER.format("1g-aSaKWIHx6IIw99KtVVNzmiiz7QQoS7"),
-"hybrid": DRIVE_LINK_PLACEHOLDER.format("1_LSnVaZuuAtX5re8zVd_IYuf5uBbHyLN"),
-"hyphen": DRIVE_LINK_PLACEHOLDER.format("1Lho8GdxfxD0xG9MHevgXtlKsn1yIHN3e"),
-"heater": DRIVE_LINK_PLACEHOLDER.format("1jo_jJBTITQw4wGqOekFSI-o_tvx1S5nj"),
-"hang": DRIVE_LINK_PLACEHOLDER.format("1SxLQET3Y821JabhE9eUqChjrnvXlbKbi"),
-"hide": DRIVE_LINK_PLACEHOLDER.format("1nOjYYdftq9_57cRXC0ol2Fh4uIem84N9"),
-"conceal": DRIVE_LINK_PLACEHOLDER.format("1nOjYYdftq9_57cRXC0ol2Fh4uIem84N9"),
-"hold": DRIVE_LINK_PLACEHOLDER.format("1LdRZlTvfyg6rAgadDsex6wOAKw6DeSl4"),
-"hurt": DRIVE_LINK_PLACEHOLDER.format("1yOEQyIiFQ0DoKTt1GGhqlSVcrwKnzpmt"),
-"halftone": DRIVE_LINK_PLACEHOLDER.format("1LuJim6HnuaTiBk3sTdHevNX0mzdjQxlf"),
-"host": DRIVE_LINK_PLACEHOLDER.format("1v41ATDWzrO9H6CiSyOqVA4ikF27iqwrQ"),
-"hangouts": DRIVE_LINK_PLACEHOLDER.format("1UPt3KPhBiTyq-37m0vxG_4Dv90Y8JyR8"),
-"hypotenuse": DRIVE_LINK_PLACEHOLDER.format("18PS4DhwZGeJFVY8AfG2H0aZXuQG2j0Rq"),
-"highlight": DRIVE_LINK_PLACEHOLDER.format("14FMvFdFpvKjKOoGXQxJEV-l-mGXLpHUS"),
-"helmet": DRIVE_LINK_PLACEHOLDER.format("1GOJ0tUuA1cPfBj-tP7tyWabWIo3XiBUw"),
-"hyphenation": DRIVE_LINK_PLACEHOLDER.format("1kDU3EKVmMNHSitsr4hRbiSdvhWgQ2DOw"),
-"hairdresser": DRIVE_LINK_PLACEHOLDER.format("1xrJ1Ayqr_novjaYpcpiP9Z1YLaneDii4"),
-"hypermetropia": DRIVE_LINK_PLACEHOLDER.format("1TApCdhrbZ2nS7qgWOM7jLujvsyU45m87"),
-"heterotroph": DRIVE_LINK_PLACEHOLDER.format("1Cbb9HnIqEIlquv1yPx7M0fy2-39Ootze"),
-"helium": DRIVE_LINK_PLACEHOLDER.format("1WL4FNJEDDbYIPnee_GqZvYJklPse5ja5"),
-"hawker": DRIVE_LINK_PLACEHOLDER.format("14cbFEUIpdAeNFv2LPPjLx09FacWWhceU"),
-"housing": DRIVE_LINK_PLACEHOLDER.format("1nl5gVRTCkoJOa61QGEg57lUpUixXAAcx"),
-"highway": DRIVE_LINK_PLACEHOLDER.format("10DCHOz7lo4dTRTZATkexlgaobGMldjqM"),
-"handrail": DRIVE_LINK_PLACEHOLDER.format("1LjpZLo5nR5eZ7g79jzrlRxxi0bMgKPlq"),
-"handwriting": DRIVE_LINK_PLACEHOLDER.format("1dhFBzer3r8tu-6uFGyMXiC8to7jwNTUg"),
-"hoarding": DRIVE_LINK_PLACEHOLDER.format("1zWjgm3punz75CS3SAQdPVDFICy-witiT"),
-"homebodies": DRIVE_LINK_PLACEHOLDER.format("15SdQSBqR2fkIukrgXQyCq8mQmqPbV7DB"),
-"hinge": DRIVE_LINK_PLACEHOLDER.format("1AKc98dJwgwg6kECB9UDXy8y8ZtmfEgR2"),
-"handle": DRIVE_LINK_PLACEHOLDER.format("1RvXO4qXkTdxOvI9qt4zv8b8JsGk1RHJI"),
-"homophone": DRIVE_LINK_PLACEHOLDER.format("1ICh5-SPXg0L0tx4N5Zp-nElyE9ACOtoS"),
-"homonomy": DRIVE_LINK_PLACEHOLDER.format("1HIB30uMQ7PtCcV12gb1Z9h8pjdM0PLxp"),
-"headlights": DRIVE_LINK_PLACEHOLDER.format("1qyzxsB0HGLn14-j-fH2a5STcrwpqsj10"),
-"hijab": DRIVE_LINK_PLACEHOLDER.format("1VuwICVBve4sUmlDKQd4wNeUdx4_TttIH"),
-"headphones": DRIVE_LINK_PLACEHOLDER.format("1cDMf-bRTUmMCveczQP5tzfJ1JywBdrN0"),
-"hashtag": DRIVE_LINK_PLACEHOLDER.format("1JVPyoCNbpWSQwgh_jxIe7xVNUFFYVAk1"),
-"hoops": DRIVE_LINK_PLACEHOLDER.format("1mnzYdARDfrtkv28kyFsAyYgWnSeCyvV7"),
-"haircut": DRIVE_LINK_PLACEHOLDER.format("18vGD9Aq4IuHHfJnYiMs5oCF5KZ8EAsk6"),
-"hra": DRIVE_LINK_PLACEHOLDER.format("1P7xbkxYRSLm8BS35ElDVJBWnX7CCfVnq"),
-"holster": DRIVE_LINK_PLACEHOLDER.format("1a_N_42RGaQpYYuDGse9xQiSt2aFdhjIB"),
-"handcuffs": DRIVE_LINK_PLACEHOLDER.format("1hh75rjR9_iipRXTmKZEx4-CGPn2ZLgr1"),
-"handwash": DRIVE_LINK_PLACEHOLDER.format("1QqaH3jFI8DTLxiQ0Kg02440HWgetLtDn"),
-"how many":DRIVE_LINK_PLACEHOLDER.format("1CTCPbDrFtWK7IFM18-B8Csn96bt0NaLV"),
-"homework": DRIVE_LINK_PLACEHOLDER.format("1WTEHqc_asFbw1XXsh2XNRBxWGXfw4r0Z"),
-"hell": DRIVE_LINK_PLACEHOLDER.format("1y4SRHoVGdwIzcRPTvGSmrVFghe3eaiHQ"),
-"height": DRIVE_LINK_PLACEHOLDER.format("1Orq_y7ATgxfMuHpIbEdbHK_jxY21dJI2"),
-"heaven": DRIVE_LINK_PLACEHOLDER.format("1Vh8jKZ0BBH-Sk-Q9FATKW1TnhHrl6sXg"),
-"handsome": DRIVE_LINK_PLACEHOLDER.format("1GiYGOc3N_UC-e8GovzPp8uzUtBIlR_pv"),
-"hemisphere": DRIVE_LINK_PLACEHOLDER.format("10JdcOvspMAPqXX3DplgN7SqacEyUniyO"),
-"heatstroke": DRIVE_LINK_PLACEHOLDER.format("1B9FLh1Ksf2QhCpZQno4X2_ZcYZrQkYe0"),
-"homeopathy": DRIVE_LINK_PLACEHOLDER.format("1TIFMwUTmabfdCh-LZWCoj9erOoDuLqV8"),
-"helipads": DRIVE_LINK_PLACEHOLDER.format("1X5E_0b7DOm-lRQPu3FEg8S7umqOsr4d3"),
-"hypoxia": DRIVE_LINK_PLACEHOLDER.format("1gyKfQMu3ooF8TfZDoqHBeZC_He-CZpIA"),
-"halitosis": DRIVE_LINK_PLACEHOLDER.format("1cRG1Iw0G862s6JuEHJnkxXyf9WFYSwDo"),
-"hanuman": DRIVE_LINK_PLACEHOLDER.format("1AK-bBHGbWa03X_JZqbV6hSy5LMj8Xi3r"),
-"himself": DRIVE_LINK_PLACEHOLDER.format("13PEv_yqP-B9u_P_JJCBhFB92Ymr7rAzD"),
-"himachal pradesh": DRIVE_LINK_PLACEHOLDER.format("1rdLKRhQ4F0llT3Pw6-rn0MnFDLTcMQHK"),
-"herself": DRIVE_LINK_PLACEHOLDER.format("1qWwP6baCQb3E9N80oZxmesRivjCDhl-K"),
-"her": DRIVE_LINK_PLACEHOLDER.format("14e6Hsp8PA1f8gTGUCQfkgFjBKCnVXWuA"),
-"he": DRIVE_LINK_PLACEHOLDER.format("1KtBgcJX4eR2cvnMRk0qBq2KqRfFG367h"),
-"honda": DRIVE_LINK_PLACEHOLDER.format("1-S33VGoRNoSddB6eFbZDK2Xn-_fiC6Kd"),
-"hippopotamus": DRIVE_LINK_PLACEHOLDER.format("1Loof9BU_BQCbODqEDBrYINth7Kd4NPsy"),
-"hat": DRIVE_LINK_PLACEHOLDER.format("1xeecwtnEzTBKLJxsWjIRYog72K8LLdua"),
-"hardware": DRIVE_LINK_PLACEHOLDER.format("1nZqYuUyxeB1G0dTQKNZNiGefE-8y9vi5"),
-"hysterectomy": DRIVE_LINK_PLACEHOLDER.format("1RrB5Mi9FwuF3OJuefaW_NSTQtbrLCaRk"),
-"hypothermia": DRIVE_LINK_PLACEHOLDER.format("1v88JFKnvJbdMY2B0vWUMNM5LW0Frvmie"),
-"hypothalamus": DRIVE_LINK_PLACEHOLDER.format("1fPlYdkthIReNgm9LGQd3ZRDW7gzXs7Yn"),
-"hypotension": DRIVE_LINK_PLACEHOLDER.format("1BpZaNn2F7LtKrUDJhgVC45xp_fPokc6f"),
-"histology": DRIVE_LINK_PLACEHOLDER.format("1m1swBbZGDkTQhvsS6ZPDy70dG2vDxh-X"),
-"hepatology": DRIVE_LINK_PLACEHOLDER.format("1Lbd5yTL5Wui3DTlFip8e00LRl52mpIOv"),
-"hepatitis": DRIVE_LINK_PLACEHOLDER.format("1GeHPBS3tb9-Ras53mr5z0sBe3qRvTDVn"),
-"hemophilia": DRIVE_LINK_PLACEHOLDER.format("1lAK4OeaQGxmMqIFfMImOYpfGAqhcDxgR"),
-"humid": DRIVE_LINK_PLACEHOLDER.format("1NlyQLquuS9FAnydvwcz53ziWquapFQiY"),
-"hour": DRIVE_LINK_PLACEHOLDER.format("1YRB_C47pVePDBWhmNkUI40-jPIfat-zo"),
-"hours": DRIVE_LINK_PLACEHOLDER.format("1YRB_C47pVePDBWhmNkUI40-jPIfat-zo"),
-"history": DRIVE_LINK_PLACEHOLDER.format("1ev7PuGUM6IkxkGCeQWSE_OpPaJoqRkhC"),
-"hindi": DRIVE_LINK_PLACEHOLDER.format("16ylzj6YiHnusMoPw0--y0RGDPcKzF_Ks"),
-"hate": DRIVE_LINK_PLACEHOLDER.format("1t1Zkx9WBKRgNml9cMChx_o9K_LhQ_7Tq"),
-"hospital": DRIVE_LINK_PLACEHOLDER.format("1Iy7tWVlC3U3yDsIufzKHlH62g1oNuxcS"),
-"huskies": DRIVE_LINK_PLACEHOLDER.format("1L1EBMpFdJpedZ0A58iDcil_YQEBxFv_X"),
-"humus": DRIVE_LINK_PLACEHOLDER.format("1iHSoXh33Q9-0QxIaehP4xJQqNy-tOXFY"),
-"horticulture": DRIVE_LINK_PLACEHOLDER.format("17N1Cj6tbZH6zxUhVd9LCvhTsjcL7VU1_"),
-"homestead": DRIVE_LINK_PLACEHOLDER.format("1nzorcTDyOsVAPtT22yjpck26qZoPY5y5"),
-"herbs": DRIVE_LINK_PLACEHOLDER.format("1fLaSILbdTIgaA6GyPdLIQ6sXgZX5bqrR"),
-"heiroglyphs": DRIVE_LINK_PLACEHOLDER.format("1XVtHxx46JWubyaU58gjsmbqd0i3cptXM"),
-"hemolysis": DRIVE_LINK_PLACEHOLDER.format("1OFkBMKEcNe9Le-MnqmepT-cp1RVPUXUj"),
-"hemoglobin": DRIVE_LINK_PLACEHOLDER.format("12TkE_m5oJkuLILwU8-faZNnLE2jjhMFK"),
-"hemodialysis": DRIVE_LINK_PLACEHOLDER.format("1zzmefF1W5OUaiQ9-rAGNfGa3Lu88pimU"),
-"hematologist": DRIVE_LINK_PLACEHOLDER.format("16FKKt94ObTwcdk2bFcD8X-SG2OPjah2x"),
-"heartburn": DRIVE_LINK_PLACEHOLDER.format("14rNx7_igHA_CMcacxLkHdcp-1devvd2-"),
-"heartbeat": DRIVE_LINK_PLACEHOLDER.format("1Ot_U4C19lryChWkwEIzVFEEgWEVqHpn-"),
-"hinduism": DRIVE_LINK_PLACEHOLDER.format("1-1CvAVRWch3p55t8gmDQLBiGlgAVTTso"),
-"have": DRIVE_LINK_PLACEHOLDER.format("1A7MDyrStLe29ovxtdTP8KcSacgWtrORZ"),
-"hoe": DRIVE_LINK_PLACEHOLDER.format("14KwzetsFL_ypPjRwnfalNQHWNPzJQrzL"),
-"hungary": DRIVE_LINK_PLACEHOLDER.format("1Z7coNDHTAN5sEnrqOf-ESgxfzdYu4rd6"),
-"handkerchief": DRIVE_LINK_PLACEHOLDER.format("1rqjUMWl7QYq4w2x0zzk6QE9h_u44EoHM"),
-"hosticide": DRIVE_LINK_PLACEHOLDER.format("1_zP-rOcoUbIREw-wZYdtju6r_rELC8_v"),
-"honorarium": DRIVE_LINK_PLACEHOLDER.format("1J_O0HYZVN6WSWJWA2-DxrWfhiJTD5uGB"),
-"homologne": DRIVE_LINK_PLACEHOLDER.format("1LJ3eqPvMZNadhfmSo8bXXJVjniIcWUBy"),
-"hierarchy": DRIVE_LINK_PLACEHOLDER.format("1bzwSOT97f7vsyDtQq6CRwfcxtlbH-m0p"),
-"heir": DRIVE_LINK_PLACEHOLDER.format("1kSmYEPUDqqiaKBwqO62Xi_i8DGiE_PRo"),
-"hearsay": DRIVE_LINK_PLACEHOLDER.format("1Kc4sCGmF5FFhcDhmg2NlgYGEXwjLTQBJ"),
-"harassment": DRIVE_LINK_PLACEHOLDER.format("17H2bnSMssLNkQtakYx1rK8bUWTA06j6W"),
-"hangman": DRIVE_LINK_PLACEHOLDER.format("1q1hT5SFOj6yGTGgKURr37aXl9tq4Oy8N"),
-"hyperthyroidism": DRIVE_LINK_PLACEHOLDER.format("1eNdCmMqOhiBRB-iscgBWLN0BZKzFvRlj"),
-"hypertension": DRIVE_LINK_PLACEHOLDER.format("169WTjcdXaeYsU1L-DskoJVTJtt4Db4p9"),
-"hyperglycemia": DRIVE_LINK_PLACEHOLDER.format("1V9jbkWus9rpCyQSLoPGiXI1S47CiEDP5"),
-"hydrocele": DRIVE_LINK_PLACEHOLDER.format("1wJVbJlMNXOP9i4rDKTKh4pwU2e3iiLdr"),
-"hospice": DRIVE_LINK_PLACEHOLDER.format("1aFZjon3gTghC2C6echK9fGD53B67yKd7"),
-"hernia": DRIVE_LINK_PLACEHOLDER.format("1UHHHcjHlCQYculxdTveFG11rnoXS8j7F"),
-"hepatologist": DRIVE_LINK_PLACEHOLDER.format("1a3JxQ1Mol4jf6hGYrk5x-B1gBktnPDjI"),
-"handrab": DRIVE_LINK_PLACEHOLDER.format("1ocSVr0B5bWSlfjETEW_BM1oxOmJpDo-l"),
-"hypothesis": DRIVE_LINK_PLACEHOLDER.format("1JzQBnUvPVu1HtbGJ7YSblFjsTM5NtVbC"),
-"hygiene": DRIVE_LINK_PLACEHOLDER.format("1VcDb-S1hdQinmkW2zIFVV-P-jfb3etbw"),
-"hibernation": DRIVE_LINK_PLACEHOLDER.format("1tdptxNUCkNfbCJMOokdrLboH2HPM9FJl"),
-"handicrafts": DRIVE_LINK_PLACEHOLDER.format("1n1vIqMtbtFZrl05RDKNG84j2szN4K_Zp"),
-"homicide": DRIVE_LINK_PLACEHOLDER.format("1VVcPM30Cj0qu52lBZw8ACP1z8GtG-e3F"),
-"hook": DRIVE_LINK_PLACEHOLDER.format("1U1CivestRX_JcHWvIiKJOD3oCUvWjhZZ"),
-"how":DRIVE_LINK_PLACEHOLDER.format("13uAHpHKMeUuLonLPSxpI9Ep6JW5gzcUP"),
-"hatchet": DRIVE_LINK_PLACEHOLDER.format("1RJk2vJcMlq48S1EWBBLjnVDOUiW22ypq"),
-"hemline": DRIVE_LINK_PLACEHOLDER.format("1irdKubjLqv7UbRrbh6_UAkvxFF4rFy4X"),
-"hanger": DRIVE_LINK_PLACEHOLDER.format("1S-7dIR_6PhYvE5x2QEmVkWjp0ECQB5m1"),
-"hot": DRIVE_LINK_PLACEHOLDER.format("1Cdzb9zc5Rcyl61tGwSdENzkzzgvF27Eh"),
-"hill": DRIVE_LINK_PLACEHOLDER.format("1zYiTZIz6tGx09Q0_sk1nbDhVllDpuWXV"),
-"hail": DRIVE_LINK_PLACEHOLDER.format("1cRm2gilaz1bsgKDAkAp-EcLQCxu_l5SZ"),
-"hockey": DRIVE_LINK_PLACEHOLDER.format("1gY1OLL5egyV79xaUGdE2rhtcixJNUlH6"),
-"housefly": DRIVE_LINK_PLACEHOLDER.format("1TSm2fzFLCsTre7i4rUgfb9Sy6KC3gMIB"),
-"horse": DRIVE_LINK_PLACEHOLDER.format("1Q1Gcn9GZVzpJD-CcMuuu5J9voJcq4b0a"),
-"honeybee": DRIVE_LINK_PLACEHOLDER.format("1uB4q1JIvH-bbp51_0okIbMNA4bDJJVtK"),
-"hen": DRIVE_LINK_PLACEHOLDER.format("1239WP83MoUCERrkDo8Mp6iY2vZddKZil"),
-"helicopter": DRIVE_LINK_PLACEHOLDER.format("1e-SWSl_jESSUIlBUUW9OLN4uqPCiGfI4"),
-"harmonium": DRIVE_LINK_PLACEHOLDER.format("1nGowlyTV_2CbzaMmIEP6WQrA71-n9gFt"),
-"heater": DRIVE_LINK_PLACEHOLDER.format("1ZGgjfluc-GV-3nZJzc0kxlHLMwqTxffQ"),
-"handpump": DRIVE_LINK_PLACEHOLDER.format("18DNclW6O9ToWgyj44kPfNSxS5k8r3tBH"),
-"head": DRIVE_LINK_PLACEHOLDER.format("1jLtN0q6snIYWC6ALSIagh5hb4BbImQa5"),
-"huge": DRIVE_LINK_PLACEHOLDER.format("1vySeX5FHq7_Ado11pAqr-VAh-hJsgM9U"),
-"hit": DRIVE_LINK_PLACEHOLDER.format("1AqyK_Ug3SOh44C-uux9SJ1nc2v7o5WHe"),
-"health": DRIVE_LINK_PLACEHOLDER.format("1uweVEUqA-5GbRt0KAk08A0Kybfu5EWAL"),
-"hello": DRIVE_LINK_PLACEHOLDER.format("1q25_z8OFiFiWlSAKuESn4mw9Cytpxmr3"),
-"happen": DRIVE_LINK_PLACEHOLDER.format("1qFeCFqyKHylHuaU--xEAhcaykIPiQUxB"),
-"hammer": DRIVE_LINK_PLACEHOLDER.format("1bQaBvcCK9ng2bYUYuB_6f9PLHYRCKs2o"),
-"hands": DRIVE_LINK_PLACEHOLDER.format("17IPS4muce-juIC1KwqC_svPo2T67BBy4"),
-"hot": DRIVE_LINK_PLACEHOLDER.format("1lVbeRXRvHXThLByHdu0Qs2eUW0-fYzhg"),
-"honest": DRIVE_LINK_PLACEHOLDER.format("1oRY-Ml4m7djLu0Kgx0lB-rtgKxfMZUy0"),
-"here": DRIVE_LINK_PLACEHOLDER.format("1Yj8ehLM7Pnjx3sxFpcQnhvDk8TWFntoY"),
-"half": DRIVE_LINK_PLACEHOLDER.format("12LGTBbxG1wzhPXhRGit8wgSxCe10n04R"),
-"hypocrite": DRIVE_LINK_PLACEHOLDER.format("1rzENqEnmkXiWlDgXBEwd1DsRoAr2k6VN"),
-"hungry": DRIVE_LINK_PLACEHOLDER.format("1veI_D4KOG6J5qbt0uLMOEFLp6Aa7ho2A"),
-"hug": DRIVE_LINK_PLACEHOLDER.format("1SpwvaYERnTBvYdapeggCV2cWAg2uu9hh"),
-"hotel": DRIVE_LINK_PLACEHOLDER.format("1HfU2uGWDRniftoyAxzrTztVOJYGzOwD8"),
-"horror": DRIVE_LINK_PLACEHOLDER.format("1B1SW9qVQdBuA6lMnSl8YFzbMm4GHPD_A"),
-"hope": DRIVE_LINK_PLACEHOLDER.format("1q6hz2saG7gcdJ5JKpdBRCkTwDQSYee3G"),
-"holy": DRIVE_LINK_PLACEHOLDER.format("1ikVcvYNCahGeTM_MV0nV4JoxaEjTOruu"),
-"holiday": DRIVE_LINK_PLACEHOLDER.format("16GpGBQgKu7SLNsvt6yh8fOuNVSrlVV9X"),
-"hobby": DRIVE_LINK_PLACEHOLDER.format("1l8hYWVhAtlXWA6lVG84d2XZiGhHDuMC6"),
-"hip": DRIVE_LINK_PLACEHOLDER.format("1LUraLmahP9PwnUKADcqwuIeKtYmKHtoH"),
-"highlighter": DRIVE_LINK_PLACEHOLDER.format("1Qi5rQ6VYfVDCw2MnzyhvWs15CmuEST-j"),
-"hero": DRIVE_LINK_PLACEHOLDER.format("1cgPMPIWIrBb-ED9mr_s5Tu_7QJovLNtM"),
-"heel": DRIVE_LINK_PLACEHOLDER.format("1NykTa1YpLhuaVPN5xOl6XLkH4TgwGd8r"),
-"heavy": DRIVE_LINK_PLACEHOLDER.format("18J-maQRuJqfBiBLZB2SV3PvURkfeWitA"),
-"heart": DRIVE_LINK_PLACEHOLDER.format("1z8tnWXOfP0u7hvLqLU_hCeVgYXO7FUqr"),
-"hear": DRIVE_LINK_PLACEHOLDER.format("1kwdGa-m-1VIqocNNkBEDzpq6BEBJ0vsL"),
-"headache": DRIVE_LINK_PLACEHOLDER.format("1NZWs11LSYVHXuNpKpnrvugW9R22oHOis"),
-"haze": DRIVE_LINK_PLACEHOLDER.format("1mtmwbCOvghzYGekUiomjfvdO-yXcDqhK"),
-"hair": DRIVE_LINK_PLACEHOLDER.format("11TPsJSmnrTdwnBDAYPn7CKm1NWk6XOKZ"),
-"habit": DRIVE_LINK_PLACEHOLDER.format("1oCENTOj5-gH1f1nJBapXKap9eGnwR1Pr"),
-"html": DRIVE_LINK_PLACEHOLDER.format("1USD03mIWCkuiDjcV56c3Iu75f9ZNgH0h"),
-"hacksaw": DRIVE_LINK_PLACEHOLDER.format("1E6kdgNJcorCxDavRY3u5VMq4o3C-abp8"),
-"herbivores": DRIVE_LINK_PLACEHOLDER.format("1tlIqevNX5z2WE8fCnW9I_uxgKR4g9lIk"),
-"herpes": DRIVE_LINK_PLACEHOLDER.format("1FuY70DSCthZtXzy-Kil-vTqomoMq75Xt"),
-"hydrogen": DRIVE_LINK_PLACEHOLDER.format("15pAeMN_qhoHZ-56_kI_MoZ86ckjkpcsO"),
-"humidity": DRIVE_LINK_PLACEHOLDER.format("19t-3m_ABnaZ_GWZokgSkhgW43Ckq-NuR"),
-"hurricane": DRIVE_LINK_PLACEHOLDER.format("1MuFw8UfX69_YsHYWcNvp8Nv6cvaXBH8o"),
-"hertz": DRIVE_LINK_PLACEHOLDER.format("1uMjeWeLZgTlevauK9-UcTAiwsS9q5D7g"),
-"husband": DRIVE_LINK_PLACEHOLDER.format("1U15NsjPxPCUILVUzTIs8Fy6BTvx9BIOd"),
-"hostel": DRIVE_LINK_PLACEHOLDER.format("1HFwL_hstYD-wCDfJ-TEBXeTQLDKCn2oj"),
-"humble": DRIVE_LINK_PLACEHOLDER.format("1QojImAQ-ay-8Gj8hMHcyMRMZ7E0C2ryn"),
-"holi": DRIVE_LINK_PLACEHOLDER.format("1vqPWVN_8SCc0GFzSaw-J0XHWztHZdLU2"),
-"his": DRIVE_LINK_PLACEHOLDER.format("156C3tY-XynXaMJTTnmIACm2Lh6iWdqlH"),
-"hire": DRIVE_LINK_PLACEHOLDER.format("1PJflXfSNrNs0vGqdcWjEak6UoSpcbWHd"),
-"her": DRIVE_LINK_PLACEHOLDER.format("1pJZCAAyytcexV5Uiftv7NfK_TjJXHcJY"),
-"help": DRIVE_LINK_PLACEHOLDER.format("1gOcGWvH7K9KADpVCQL27auAbzFl3OrG8"),
-"hearing": DRIVE_LINK_PLACEHOLDER.format("1yp0PkkGPzyieq8yybw77GhmosylWUIlj"),
-"happy": DRIVE_LINK_PLACEHOLDER.format("1HUjFYbNx4TsGhwupRh6dZbS5ov8Urtte"),
-"indicator": DRIVE_LINK_PLACEHOLDER.format("1Jgd3BFMThEFoxUqXUu84kK5PsjTmkIBK"),
-"interest": DRIVE_LINK_PLACEHOLDER.format("1qluTooTZUAsvwxJuP9YRhEbOLDaaB9qz"),
-"ipad": DRIVE_LINK_PLACEHOLDER.format("1GHVx3Q7mob_PqtJSa60B8Z37pIBFN5F-"),
-"insecticide": DRIVE_LINK_PLACEHOLDER.format("1HPAfCgzMKPCma-qh6LKvuGduLg-ycC9s"),
-"insulator": DRIVE_LINK_PLACEHOLDER.format("1p8CQ_n7aLXCOOLHi6y85ZUebqvLZ5tzl"),
-"insectivorous": DRIVE_LINK_PLACEHOLDER.format("1ELfoIjuSfJC23kGPPGMb0ZApa3JdG9dv"),
-"inhalation": DRIVE_LINK_PLACEHOLDER.format("1jBPFYCzwXW5WxVXy5mGbhVFVaWd4WNfy"),
-"integer": DRIVE_LINK_PLACEHOLDER.format("1-wiA1vQ1qV835DqoTjtaHQAkyUlu88KJ"),
-"india": DRIVE_LINK_PLACEHOLDER.format("1a206B4LhcHYK5ankAMvk5cLbtv99tHLh"),
-"investor": DRIVE_LINK_PLACEHOLDER.format("1OYoxeI3inea66CGnSdIn7x4auwBfPci4"),
-"index": DRIVE_LINK_PLACEHOLDER.format("10RQG5vyKEzEPXfgpTS8CMlCc98_0howz"),
-"investor": DRIVE_LINK_PLACEHOLDER.format("1yg79myz_dic6NKl_62ydGsA91Fa3bCDW"),
-"interbank": DRIVE_LINK_PLACEHOLDER.format("1_z9TLv3LJzY-I2lxxSsJ2YJYUIeuFjTN"),
-"ingadulicis": DRIVE_LINK_PLACEHOLDER.format("1j9SP4fM_5JVCjkrl9qqFDc8qDtu9Ox-P"),
-"inbreeding": DRIVE_LINK_PLACEHOLDER.format("1TfHjFEEeA_t2HqE2X1TJ1HYIkAABYvnR"),
-"inarching": DRIVE_LINK_PLACEHOLDER.format("1MajrOY6gkoWDiYjYyYt2mxYdvZ00gXuy"),
-"interconnection": DRIVE_LINK_PLACEHOLDER.format("1h_LMm4Z50gRlrzeqCe5-M8l_vvgXRtJF"),
-"inclination": DRIVE_LINK_PLACEHOLDER.format("1QdL7HG-Vi8o6bdtXEWstSPrhAEAQjwdw"),
-"issue": DRIVE_LINK_PLACEHOLDER.format("1yGw7ZydGQBa4Ophug3b_5yJXkE_ooByI"),
-"interstate": DRIVE_LINK_PLACEHOLDER.format("10RV_Lcfo-EakqUnB_6qa94-2xYJe-jID"),
-"intrastate": DRIVE_LINK_PLACEHOLDER.format("1-JHz9DSk97IqHMIZNdWrXPavjtzVkYTr"),
-"intelligence": DRIVE_LINK_PLACEHOLDER.format("1bo8TTHmGMauG3h-Tp_LjDCIXJ80TPBHL"),
-"ifsc": DRIVE_LINK_PLACEHOLDER.format("1SDkZR7j_HffeAGrs5GF-ynX-l0w8TSnP"),
-"innings": DRIVE_LINK_PLACEHOLDER.format("1uCqlL1O8ssjAc9ATz1DqXGp5w1cy6IgU"),
-"indent": DRIVE_LINK_PLACEHOLDER.format("1pY7Ep0NKRkpbIgy1K_p6fBKFOylJvyLy"),
-"implementation": DRIVE_LINK_PLACEHOLDER.format("1MVxp2DScLn44FTFEmWCTTPvo_BJP8KBr"),
-"indigestion": DRIVE_LINK_PLACEHOLDER.format("1P_xukkHC_JJsgN_dnjONdfvWZtgySriS"),
-"itinerary": DRIVE_LINK_PLACEHOLDER.format("1ycxyaeF_Nku-2lX0AePREhrdBD9X7i3Z"),
-"infiltration": DRIVE_LINK_PLACEHOLDER.format("1SjRTejO5IoOca7rPvSiv6XPp-SpQ7uSK"),
-"invertebrates": DRIVE_LINK_PLACEHOLDER.format("1D5MkUYdm_qqMk6xPtI7l6SF4CoNSh4Tw"),
-"iconicity": DRIVE_LINK_PLACEHOLDER.format("1N7iyfsIsLpGtsgTbnncajhGnbNjW8nun"),
-"idiolect": DRIVE_LINK_PLACEHOLDER.format("1nJmkHmupJGyn5BzlXSc-UZqgNaFSlhka"),
-"incentive": DRIVE_LINK_PLACEHOLDER.format("16xtqi9VcySwUBLrKXQ-s7vtyb4L9M3-7"),
-"implement": DRIVE_LINK_PLACEHOLDER.format("1M7JTjDQ0Q9yX-JcU3X6ffgEPzIEc__Y_"),
-"internship": DRIVE_LINK_PLACEHOLDER.format("1NLPvCcacqL073DX_nQDnVBDBEaku-qL-"),
-"innate": DRIVE_LINK_PLACEHOLDER.format("1n_bByoo6q8OqtXvvlY47og6HzB3UyZRv"),
-"indexing": DRIVE_LINK_PLACEHOLDER.format("1bCVdJbXAyR6l2GoRD5mxFBGwaYu8U2Fd"),
-"interceptor": DRIVE_LINK_PLACEHOLDER.format("15SUPY0ffXsKuw9yU-Yd-5ggvWhJKHFC1"),
-"ingredients": DRIVE_LINK_PLACEHOLDER.format("1YB7m9rpUaY7a0ofgHEKaJHIMdTYgWm0y"),
-"injection": DRIVE_LINK_PLACEHOLDER.format("1H7dmA2A3IK9a5w6v92plAYnWOBFV0wcV"),
-"impossible": DRIVE_LINK_PLACEHOLDER.format("1okMCbaQZXsu4KlCVv_uUV_mfq8laPVdc"),
-"ignore": DRIVE_LINK_PLACEHOLDER.format("1jT3s25BC0GQUurtUxTSB98CSo5Ognz3a"),
-"inclusion": DRIVE_LINK_PLACEHOLDER.format("1LfJZYY81peQuZLPMxn8nkwUYyAeKycIq"),
-"intestate": DRIVE_LINK_PLACEHOLDER.format("1aTejTXJDDk74Ix5bGPOmhneugju4l73y"),
-"iron": DRIVE_LINK_PLACEHOLDER.format("1ZZQpsZmhutO35ggp3Hmau5JJdcC7chdU"),
-"infection": DRIVE_LINK_PLACEHOLDER.format("1xJEQkF-0a1vOoecedvGS0JN0m5ELosFn"),
-"inventory": DRIVE_LINK_PLACEHOLDER.format("1QiJpOX56Es3h3ic1bL5vvNep4iyrwlN2"),
-"interpretation": DRIVE_LINK_PLACEHOLDER.format("1y6aUqi-6ua7RmG9zoNuKlaBRP4hHyZPY"),
-"irrigation": DRIVE_LINK_PLACEHOLDER.format("1I3NJ_90JonHWxsfBeiuD7s2AbrGeVcac"),
-"investment": DRIVE_LINK_PLACEHOLDER.format("1Ck5UaoN7NrH_5xNqyx6syQasvhRRuJcZ"),
-"inhaler": DRIVE_LINK_PLACEHOLDER.format("1_ikSUwKmIijlfQUIWNxyzAFgk-t6e61L"),
-"infertility": DRIVE_LINK_PLACEHOLDER.format("1UDLNHmzXtKObzRFGYu8cQrhpV5BIxk2B"),
-"itself": DRIVE_LINK_PLACEHOLDER.format("1A9IEtbJk0ymOREfCjOrcuRGuIaA_CBnS"),
-"it": DRIVE_LINK_PLACEHOLDER.format("1D92Gla1a2-rC-ZI_86NvHGSoOqeMZeMc"),
-"intelligent": DRIVE_LINK_PLACEHOLDER.format("1FlqxN0bsnCqshaesUJmCHvhH57T7VIXT"),
-"knowledgable": DRIVE_LINK_PLACEHOLDER.format("1FlqxN0bsnCqshaesUJmCHvhH57T7VIXT"),
-"intelligence": DRIVE_LINK_PLACEHOLDER.format("1WBpXZyF5DdwEDEi3UQFp5_nn16GAJc6V"),
-"knowledge": DRIVE_LINK_PLACEHOLDER.format("1WBpXZyF5DdwEDEi3UQFp5_nn16GAJc6V"),
-"indigo": DRIVE_LINK_PLACEHOLDER.format("1QR96gQyhOV1A59SS2MVEZLFGWBivXUoJ"),
-"iphone": DRIVE_LINK_PLACEHOLDER.format("1HeZT9meqjeKKVl3l-mfPh_5JRf2raCip"),
-"idea": DRIVE_LINK_PLACEHOLDER.format("1IjbmbvbOv5of1BjUrxtwCBpNphhXh-Yu"),
-"influenza": DRIVE_LINK_PLACEHOLDER.format("1obyLlsaoUni6t9LzHvuT20krZDyXis9m"),
-"implant": DRIVE_LINK_PLACEHOLDER.format("1wdFpy_gun0u2D83toxAfb4CS4d-Ldg30"),
-"immunology": DRIVE_LINK_PLACEHOLDER.format("1obXfa34x5YaEnAz6NBRrvpjIQS9Ljurv"),
-"interview": DRIVE_LINK_PLACEHOLDER.format("1vqsNeKr-TSk4mdoNFOcZei3f4mKbYZaC"),
-"internet": DRIVE_LINK_PLACEHOLDER.format("1XVVCdPBB1T82EgsvaUQ2du1fN0Cijmx3"),
-"independent": DRIVE_LINK_PLACEHOLDER.format("16Ko05_NObV7F9ooO6hgsboxEWy55HbqA"),
-"improve": DRIVE_LINK_PLACEHOLDER.format("1CFglFUW1F_TFlYXe1eh33pIC46eHhSWy"),
-"introduce": DRIVE_LINK_PLACEHOLDER.format("1zm4iXUYvGt3_K3Vd8Hi1pB_4maO_Kuk1"),
-"interpret": DRIVE_LINK_PLACEHOLDER.format("14jPCfzRhA09fNmhOlUvNwyEbnVUmPQd7"),
-"identity": DRIVE_LINK_PLACEHOLDER.format("14sKvlidgjUfbLNE8WU7e8y1awsO22bUa"),
-"introspection": DRIVE_LINK_PLACEHOLDER.format("1nKn5StOrQ7PJE3FVV_7TEoetof5qeDqQ"),
-"infant": DRIVE_LINK_PLACEHOLDER.format("16DsQuZfHlPgNb6dPWAzJAxjkXKden0b0"),
-"islam": DRIVE_LINK_PLACEHOLDER.format("1XTOrHGaFnY1DmET3SliQFQJ0bzVSUDeT"),
-"muslim": DRIVE_LINK_PLACEHOLDER.format("1XTOrHGaFnY1DmET3SliQFQJ0bzVSUDeT"),
-"italy": DRIVE_LINK_PLACEHOLDER.format("1PAJkvXBrFV-bQy9m_Q_-8seQJWUhut9x"),
-"ireland": DRIVE_LINK_PLACEHOLDER.format("1pPyP6VvpfKut62I6ojwd1L-JDMeXXp3E"),
-"iraq": DRIVE_LINK_PLACEHOLDER.format("1BheC4C0uNneUpXGiwuevwAhg_YlWhdLd"),
-"iran": DRIVE_LINK_PLACEHOLDER.format("1I89t91XJgGKnKQifiQqmat-jfko3jx-n"),
-"indonesia": DRIVE_LINK_PLACEHOLDER.format("1_0tmOt5gVw4q57DZOFSjE-Bx_Y63LdqD"),
-"iceland": DRIVE_LINK_PLACEHOLDER.format("1KCoEOE-yT_xkKuQbMfhleqz5nEIt1jgq"),
-"integer": DRIVE_LINK_PLACEHOLDER.format("1xJAUQKBHuvExuJPUlgJGoxN2WJbxU9Fu"),
-"instagram": DRIVE_LINK_PLACEHOLDER.format("1pj5O1TVCxCP3a22IjAzJ13i95_mon9mJ"),
-"ideal": DRIVE_LINK_PLACEHOLDER.format("1gnyOA45vP_HpB8xP1XPKTs0RkRctqjO5"),
-"infanticide": DRIVE_LINK_PLACEHOLDER.format("1TdE9ir84mhcxKwt8LO8asq07wjVd5mHq"),
-"impeachment": DRIVE_LINK_PLACEHOLDER.format("1y0ERBvdwWXG8c1R3lrXG5I3fc7jU0tQ4"),
-"impact": DRIVE_LINK_PLACEHOLDER.format("1ySJLXN9lPQ-kbKs3Yrx6eXjXdBF_3QRi"),
-"immaterial": DRIVE_LINK_PLACEHOLDER.format("1dyR5G_6wA-xqmf_ihJJSGQCRoYQW1FCf"),
-"imitation": DRIVE_LINK_PLACEHOLDER.format("179D2doFQtvGNhN4rdrn51geXL3nwMTDl"),
-"identification": DRIVE_LINK_PLACEHOLDER.format("1z_cnyQSzPQhUCbj4I4D8h18x4egOgaCf"),
-"iddat": DRIVE_LINK_PLACEHOLDER.format("1lpIFtK-4vMqp490n9YvlyuMhBOgoqSjc"),
-"incumbrance": DRIVE_LINK_PLACEHOLDER.format("1u9xGsHgwmr_ei-4WPnSVr1sNtRKNieef"),
-"inverter": DRIVE_LINK_PLACEHOLDER.format("1x_4t2xA5fALxqTYSf843iHyNAvaSO97O"),
-"inductor": DRIVE_LINK_PLACEHOLDER.format("1lJS7Dt1NG9dtRIjOpC2PMW19H-7wyrgb"),
-"insulator": DRIVE_LINK_PLACEHOLDER.format("1wfACafYuZAsY54E4AoSuaPefF6orStDV"),
-"inertia": DRIVE_LINK_PLACEHOLDER.format("1iP51EqNxhg8qqOnpZCyJnJ_21GnP3Uxd"),
-"idioms": DRIVE_LINK_PLACEHOLDER.format("1HvA1o8Icp6AmwZbddTX0yF1Jec58_yL2"),
-"inmate": DRIVE_LINK_PLACEHOLDER.format("1YKJQohjueLLK5cK1oTNJ5dLRmlGjnFn2"),
-"interlining": DRIVE_LINK_PLACEHOLDER.format("1TIB-VcBC2NcbK54y5j195ZFxz82B01W9"),
-"israel": DRIVE_LINK_PLACEHOLDER.format("1F6HuS_aessWnAQcZySfyoKHR8hp9A-Rp"),
-"italics": DRIVE_LINK_PLACEHOLDER.format("1uIW0mh63XcVRhPfszM5MK2eGU34wbSrd"),
-"inheritance": DRIVE_LINK_PLACEHOLDER.format("15IL6qb0qDz4lUEKDJcMQ29HLAyJCFSYC"),
-"invite": DRIVE_LINK_PLACEHOLDER.format("18ig9icTQ2IWDMUN5Gd9AMeqTG-vMg9im"),
-"island": DRIVE_LINK_PLACEHOLDER.format("1WINmD5HVg_TC-KaXZP31lHefjLFr3H4P"),
-"insect": DRIVE_LINK_PLACEHOLDER.format("1Cu-4NJYnlu5TleSqP1-zW32_Az90MiVG"),
-"institution": DRIVE_LINK_PLACEHOLDER.format("1kE_tYNTcMKW-WBZklsxxX3hDJykbvOCe"),
-"install": DRIVE_LINK_PLACEHOLDER.format("1P-buHRYXxMXucwDsZTeBoptcVOs3s5r9"),
-"individual": DRIVE_LINK_PLACEHOLDER.format("1gTitKx9Wflkrgjemwi9dD1JVPX1UmdLH"),
-"in": DRIVE_LINK_PLACEHOLDER.format("1P_HsWRJkg3HoK6477gSLrUjUlYgX2Po2"),
-"i am":DRIVE_LINK_PLACEHOLDER.format("1ZzZJUrKHlpi686-lrFBY-huiDfpFPkRr"),
-"inauguration": DRIVE_LINK_PLACEHOLDER.format("1s3MmofyEPbvpC-PvpDQQxZZf7NGLIz2E"),
-"its": DRIVE_LINK_PLACEHOLDER.format("1yQKVyhl5S_aZe3iAGX6ODpyYAx3jzrMM"),
-"international": DRIVE_LINK_PLACEHOLDER.format("11YJMlX1fR9qRjzO0Aikfp8xmUJXdk07z"),
-"insurance": DRIVE_LINK_PLACEHOLDER.format("1-a4N0Kca2VgGFUlLaEBc2kbeEj8E-M26"),
-"ink": DRIVE_LINK_PLACEHOLDER.format("1DDhDk7kwUm36sXNFr4lGkHpKBUvL8evp"),
-"increase": DRIVE_LINK_PLACEHOLDER.format("1xQn72jp4dglhH360zp09HMt4bfN6qcwV"),
-"income": DRIVE_LINK_PLACEHOLDER.format("1TZZXiNZ2C0bxcLWNQoyueVk4vSUkbq8_"),
-"include": DRIVE_LINK_PLACEHOLDER.format("1InKPoTsOl3lEsbwdyNjj-WIuQmf37MSK"),
-"inch": DRIVE_LINK_PLACEHOLDER.format("1dJuCD25v3qRPZxGxzo37MAcm8bLXtOj9"),
-"impure": DRIVE_LINK_PLACEHOLDER.format("1h6hrk6QPbhxJH8sGRsPlKvWXhxOxDev_"),
-"important": DRIVE_LINK_PLACEHOLDER.format("1y8S03Bc2TWREQKYL4vt5E2zLPshqcNi9"),
-"significant": DRIVE_LINK_PLACEHOLDER.format("1y8S03Bc2TWREQKYL4vt5E2zLPshqcNi9"),
-"idle": DRIVE_LINK_PLACEHOLDER.format("1Jnl9ocpeoyxR3DVWkt-U6BkjR5hgrSfi"),
-"inspire": DRIVE_LINK_PLACEHOLDER.format("1SlbJ7RJ2xljkI97hAiqiurbW-EwV2pQc"),
-"innovate": DRIVE_LINK_PLACEHOLDER.format("19l1ZRI-n9SYRPCOn6b9C-rvn0tJ6qT-5"),
-"initiative": DRIVE_LINK_PLACEHOLDER.format("1VWFKSZALe3knCzigOJOQn50o4pfWv6qh"),
-"influence": DRIVE_LINK_PLACEHOLDER.format("1y8YHbFo5SpVnyGhZUv6tvZ73BJ8sLAHI"),
-"affect": DRIVE_LINK_PLACEHOLDER.format("1y8YHbFo5SpVnyGhZUv6tvZ73BJ8sLAHI"),
-"icon": DRIVE_LINK_PLACEHOLDER.format("1l1vK_j6uwx-iVZ_nI1T-7JhIwBDUGUxg"),
-"iris": DRIVE_LINK_PLACEHOLDER.format("1DboFBvbenuJRv1ii_BCwbCi_kZkXv48L"),
-"icu": DRIVE_LINK_PLACEHOLDER.format("1Ug7x3xkEyB4wqf8MiKEUu6P_wHHcOZVz"),
-"integers": DRIVE_LINK_PLACEHOLDER.format("1JpiK236Lvcy0l2fs2QoQ_LTEQK6fmpEv"),
-"inflammable": DRIVE_LINK_PLACEHOLDER.format("1ocZeNNVWEBxNWtEXKaplTQJuN4oKBGZO"),
-"imperialism": DRIVE_LINK_PLACEHOLDER.format("19hjpbsXLA9GSRnYSbtUYyYoP4nq2c2pw"),
-"involve": DRIVE_LINK_PLACEHOLDER.format("1__b0BhHoR-8qwxesD0LdEL9lkfTpDOkV"),
-"interpret": DRIVE_LINK_PLACEHOLDER.format("1nGemN2mOUgkUsWNor95x99A3CKDjxnbB"),
-"interpreter": DRIVE_LINK_PLACEHOLDER.format("1nGemN2mOUgkUsWNor95x99A3CKDjxnbB"),
-"insult": DRIVE_LINK_PLACEHOLDER.format("1rsDp6zQU4gfiL-WeoTwaWQb3umbqCrWz"),
-"instruct": DRIVE_LINK_PLACEHOLDER.format("1Qbcx-61Bx7ixdW_pfTk0vrSL1j90h2IK"),
-"teach": DRIVE_LINK_PLACEHOLDER.format("1Qbcx-61Bx7ixdW_pfTk0vrSL1j90h2IK"),
-"injury": DRIVE_LINK_PLACEHOLDER.format("15mOa0hpLxTPq3KTlG2VlC_6amTDmhZv9"),
-"justice": DRIVE_LINK_PLACEHOLDER.format("1kpbQvwF8wxNspmXOl3PzBxfdL-UizH6g"),
-"judiciary": DRIVE_LINK_PLACEHOLDER.format("18EMNvZzrOjLDvy5_p1Bs2pHc4k_EY1To"),
-"jana": DRIVE_LINK_PLACEHOLDER.format("1Jok5aS3bP9_htpCbF3bfSUbC_QGyoyVn"),
-"jharkhand": DRIVE_LINK_PLACEHOLDER.format("1Hh4Nw9DlWc1JOzoToi-Kr1IGBG0B3DKW"),
-"jaipur": DRIVE_LINK_PLACEHOLDER.format("1c-ggEYHiz_DcG5_tRTwSykr1RrfltIxr"),
-"journey": DRIVE_LINK_PLACEHOLDER.format("1eZKGB6vMEg88tnU-xzqZV9CQQXP8lSVU"),
-"julienne": DRIVE_LINK_PLACEHOLDER.format("1qRbsPeY8Qa_mtgPazaowS_A6n93LZSWg"),
-"jockey": DRIVE_LINK_PLACEHOLDER.format("1Fn5fTklVrD9oHBdHAdkBCoTPdn99KiLk"),
-"jammed": DRIVE_LINK_PLACEHOLDER.format("1yrURdJiQCldB49f8z88-t72z0wL1Abmg"),
-"jammu kashmir": DRIVE_LINK_PLACEHOLDER.format("12o8cfxWDODcjzxuxs75NHyTPjwACf2tU"),
-"jackpot": DRIVE_LINK_PLACEHOLDER.format("1YiDmtHm1KQU_h_Wd1ilBhmeusGiRfSJf"),
-"jupiter": DRIVE_LINK_PLACEHOLDER.format("1nDRZBFFP-CnqEUOsi_JpL0r8SAN2PMPv"),
-"joey": DRIVE_LINK_PLACEHOLDER.format("1fkwvo9noR0IYO1ETE0aak9KcLyaCTo-U"),
-"judge": DRIVE_LINK_PLACEHOLDER.format("1DooJdQjJ1gmtFJ5QJKZypLAFg6vu0yVn"),
-"july": DRIVE_LINK_PLACEHOLDER.format("1OpNdAPEFIkUjkcBpP6k6kibx0m0Fiar_"),
-"january": DRIVE_LINK_PLACEHOLDER.format("1usvz9atmfssHbNWDpaZLeYtZIXw_EPBl"),
-"jpeg": DRIVE_LINK_PLACEHOLDER.format("1_UJX2dnzJeFwurhJkkzgv27m-kDJJTl4"),
-"joint": DRIVE_LINK_PLACEHOLDER.format("1rFkvdDVHzgPq_DCJYuHQRwGfNV2SxL_g"),
-"jizya": DRIVE_LINK_PLACEHOLDER.format("1O8xs-DYGtSGTIakYGgM8PJgCDJvnf9uT"),
-"jeweller": DRIVE_LINK_PLACEHOLDER.format("1NsD9NwXcZ1jVuIHoPPAJnmODP4847j4F"),
-"janitor": DRIVE_LINK_PLACEHOLDER.format("1omCs5sAU6wDSNaXowI3SmM_WWmd48HbM"),
-"jet": DRIVE_LINK_PLACEHOLDER.format("1gXhDNa4unKv6hLADeJuVeBqekoTbcwYe"),
-"jio": DRIVE_LINK_PLACEHOLDER.format("1IcQwoXxt0enYOEMnn_QC7fkfV_lFugnS"),
-"jellyfish": DRIVE_LINK_PLACEHOLDER.format("1d14aZBxHyTSj3nEc7ksFgp8ZiHboP8cI"),
-"jump": DRIVE_LINK_PLACEHOLDER.format("1Gsv4E6sfpX7PspzsT6aW278nxZZAdfON"),
-"jew": DRIVE_LINK_PLACEHOLDER.format("18ebp8k8BewncncMT1MMuPEPEiXe2Fk9M"),
-"joints": DRIVE_LINK_PLACEHOLDER.format("1wA9FeY3sJs4ax4zqEcE1VSGv5gvVJa6n"),
-"jabot": DRIVE_LINK_PLACEHOLDER.format("1o31CooVzMLEtwSpsG7w6HGj8_scaQLHk"),
-"jainism": DRIVE_LINK_PLACEHOLDER.format("1RRU7MUKfxTBGNR8jW5M6IjwueQ-_e3s9"),
-"jain": DRIVE_LINK_PLACEHOLDER.format("1RRU7MUKfxTBGNR8jW5M6IjwueQ-_e3s9"),
-"jobless": DRIVE_LINK_PLACEHOLDER.format("1nl0TGeQdrjZDZVo4rVnCf_gjmuv0JKaf"),
-"unemployed": DRIVE_LINK_PLACEHOLDER.format("1nl0TGeQdrjZDZVo4rVnCf_gjmuv0JKaf"),
-"janmashtami": DRIVE_LINK_PLACEHOLDER.format("1nX0HiwRb4I1SMegOAK5ohuICVO6bnisC"),
-"jointing": DRIVE_LINK_PLACEHOLDER.format("1ex6Url5-8lsxcxEWiuTB9kE6171VFjKY"),
-"jordan": DRIVE_LINK_PLACEHOLDER.format("13tH3yfFPAisI-ZP-AC3VmfbN17kuqy5O"),
-"japan": DRIVE_LINK_PLACEHOLDER.format("1XWj9fWhHKqITk4ERDKamI8DwUUEPbXfW"),
-"jamaica": DRIVE_LINK_PLACEHOLDER.format("1TKW1Xk7r321MHdQ83be3NxwKCx2RaXPI"),
-"justify": DRIVE_LINK_PLACEHOLDER.format("1Lw-OzTanncS9kBI2hiKBoo8ZVwuVrNRM"),
-"jam": DRIVE_LINK_PLACEHOLDER.format("117wIN669Ba6BuA96rkfchlxVjEHI3sof"),
-"jacket": DRIVE_LINK_PLACEHOLDER.format("1misY__UrFBBXjwBJ0FlCdr1nOZ0kAkon"),
-"juice": DRIVE_LINK_PLACEHOLDER.format("1ECwiHhePSkb6qEfgsk_jZs3Jh5WETMNF"),
-"jalebi": DRIVE_LINK_PLACEHOLDER.format("1UFepefafhazZKapDs5zGaw_TTG-9h-8C"),
-"judgement": DRIVE_LINK_PLACEHOLDER.format("16x0fMGp1JiIVKs8FjmAAHfnsKT_cDvqP"),
-"jack": DRIVE_LINK_PLACEHOLDER.format("1FrriInWdELHHS1aMOGm26PFNIa600Idq"),
-"june": DRIVE_LINK_PLACEHOLDER.format("1mHU9ewMs8N8qjcEyC4qM50PR33KJ0Itl"),
-"juvenile": DRIVE_LINK_PLACEHOLDER.format("1Ffq7Xdty44IyUsfgwKPxx7neK1tTXCCC"),
-"jams": DRIVE_LINK_PLACEHOLDER.format("184ov2_R038iMz1kT-h6Pd8XEqluS5sD-"),
-"jamun": DRIVE_LINK_PLACEHOLDER.format("1IXKOl-6DwBQV4ry800pbY9hOC4PzvWsw"),
-"jackfruit": DRIVE_LINK_PLACEHOLDER.format("1l3-1bpmSfKepIpcY1QnAGGzRQOq3VXPa"),
-"jewelery": DRIVE_LINK_PLACEHOLDER.format("1Wt--VdeQbhc57LJwwzmIp0IVxYSWMs5D"),
-"jasmine": DRIVE_LINK_PLACEHOLDER.format("11HDXrpEH749-jhqKcrZ50BpUPvBM6jtt"),
-"joke": DRIVE_LINK_PLACEHOLDER.format("1l9kyScmH835LZFfS0eVGeXA267q34g41"),
-"funny": DRIVE_LINK_PLACEHOLDER.format("1l9kyScmH835LZFfS0eVGeXA267q34g41"),
-"tease": DRIVE_LINK_PLACEHOLDER.format("1l9kyScmH835LZFfS0eVGeXA267q34g41"),
-"judaism": DRIVE_LINK_PLACEHOLDER.format("1JW_5Ujm2zFeJWiYjpUq_cQ2FjriR__VX"),
-"job": DRIVE_LINK_PLACEHOLDER.format("1xH76QuYhwPrARgeQbrQWSmMhx-P5dHY1"),
-"jaundice": DRIVE_LINK_PLACEHOLDER.format("1ujqqxc0uKLE_l2OEbZ0aor8gjL0z4p-x"),
-"jealous": DRIVE_LINK_PLACEHOLDER.format("1V8rT0f9hFl_EiB-z2zgCmCwtLkfiYO5a"),
-"joystick": DRIVE_LINK_PLACEHOLDER.format("1llKMOVzNs9K55qrOs8DZfqCwlVn_8z1O"),
-"jaw": DRIVE_LINK_PLACEHOLDER.format("1K-Wm553NC0icRujv5t_ifXngsTeIqVTI"),
-"journalist": DRIVE_LINK_PLACEHOLDER.format("1UhCyUn3Q2nzctOOfxjdOKJ3ZrAO064Jh"),
-"reporter": DRIVE_LINK_PLACEHOLDER.format("1UhCyUn3Q2nzctOOfxjdOKJ3ZrAO064Jh"),
-"join": DRIVE_LINK_PLACEHOLDER.format("1SG7fmEd8aUBUm1zE_nxKvSZ_ZEsxbQoL"),
-"jail": DRIVE_LINK_PLACEHOLDER.format("1-bcg41zg1Jq6iWbN_Y3e69FcYPI7VyT-"),
-"kochi": DRIVE_LINK_PLACEHOLDER.format("1r_cyJm2MJ4gM6zSJ-mHMfc5na49V9dFh"),
-"cochin": DRIVE_LINK_PLACEHOLDER.format("1r_cyJm2MJ4gM6zSJ-mHMfc5na49V9dFh"),
-"kingdom": DRIVE_LINK_PLACEHOLDER.format("1q9Le1V1INikjQATTZ_cH3GxPkqpnaVc-"),
-"karma": DRIVE_LINK_PLACEHOLDER.format("1T3i3C-0Xj-RRO5VTvdrB1AyGR7lESAPM"),
-"kalidasa": DRIVE_LINK_PLACEHOLDER.format("1WSCzX1Zs5GtN8GQ9D58k5t0GJ8NDhrYJ"),
-"kanishka": DRIVE_LINK_PLACEHOLDER.format("1UtPVDHTQcJaHX_y9kWy7jQSADRX5nlfl"),
-"kshatriya": DRIVE_LINK_PLACEHOLDER.format("1vuGN1mZJFoWCm42vYZAVrTOTWeWcMgNJ"),
-"kolkata": DRIVE_LINK_PLACEHOLDER.format("1nE2_s1MyYcQKk5D7gh6Dgk1OSHLuTSE8"),
-"calcutta": DRIVE_LINK_PLACEHOLDER.format("1nE2_s1MyYcQKk5D7gh6Dgk1OSHLuTSE8"),
-"kohima": DRIVE_LINK_PLACEHOLDER.format("1S2bo1HfE-D8g1__HXc6_Fk48DwRNaf8B"),
-"kerala": DRIVE_LINK_PLACEHOLDER.format("10ytgBq3Yk14iOInZL6tQz05wsv5xRZj6"),
-"karnataka": DRIVE_LINK_PLACEHOLDER.format("1U_wQPpxHpiXs6659W2n2TBI-0H2LtaEx"),
-"kyc": DRIVE_LINK_PLACEHOLDER.format("19cht2TLqaDmmIE_Ukut64lvvBqLBet5T"),
-"kitosis": DRIVE_LINK_PLACEHOLDER.format("1IS9U93WBqgFZAbR4mPI7pHeos-J17q6R"),
-"knit": DRIVE_LINK_PLACEHOLDER.format("1hBlbujWKHMwCnrhZP4wccY8L-860Vuc3"),
-"kneel": DRIVE_LINK_PLACEHOLDER.format("1efxYKl-bqo0NuvBvWfLz_5KeCZVATyCd"),
-"keying": DRIVE_LINK_PLACEHOLDER.format("1IMhS9sOuCFk_xu5KWn0-D1pqQzjKktjb"),
-"keep": DRIVE_LINK_PLACEHOLDER.format("1hszUT2Ztavxg0QQ3lo8a3j0v8_BtVCdp"),
-"knead": DRIVE_LINK_PLACEHOLDER.format("1QS_8OiWBDk2eTILygTClYcoG8Nmdt5st"),
-"kerning": DRIVE_LINK_PLACEHOLDER.format("1ZUnyZtoDSAlwvfF-YmMr3dFdgoI2Utbl"),
-"kitten": DRIVE_LINK_PLACEHOLDER.format("1yuWVtbcvzhofjL9Q6w24gRimT8Q4CwjB"),
-"kid": DRIVE_LINK_PLACEHOLDER.format("1MK2734f0o3iS30uPs-nbEW_MmjVUfWxT"),
-"kennel": DRIVE_LINK_PLACEHOLDER.format("1KJDRjegisWhYgEBcxUS8KSQlKQthpCSR"),
-"karnal": DRIVE_LINK_PLACEHOLDER.format("1w_CnhM7JLsc4oaT7KrRR3RMnUKiNDXM5"),
-"kin": DRIVE_LINK_PLACEHOLDER.format("1npec6MbwuFPUCjwA1JBxkNFrQ_dcDOjD"),
-"kite": DRIVE_LINK_PLACEHOLDER.format("1YeB_cNFJqQsO_CakukaihPfs1lRgT61F"),
-"kilobyte": DRIVE_LINK_PLACEHOLDER.format("1k6QW4er_SQO9hpADKjxKzz-S2WBU27S-"),
-"kaleidoscope": DRIVE_LINK_PLACEHOLDER.format("1kKu8_v4bB4L9I_CmjGD6ZY0eDOeD3Wod"),
-"krishna": DRIVE_LINK_PLACEHOLDER.format("1PEOq-wmQ0o8NWVb_fC9xVY3D1Wa9PzMd"),
-"kathakali": DRIVE_LINK_PLACEHOLDER.format("1oeBWmV40F-E-4QMP3YCzHDAW-FVGOvMY"),
-"kitchen": DRIVE_LINK_PLACEHOLDER.format("1B3lZKEizSBYmFTsAhekPAy1VD6E4vC7z"),
-"kidnap": DRIVE_LINK_PLACEHOLDER.format("1ThEZnmuUHNcw96pGuy83K91AFIKYi-za"),
-"kayak": DRIVE_LINK_PLACEHOLDER.format("1vxmcqd-oPqsn2HAwT5RAXKqNcLqyUjHl"),
-"kuwait": DRIVE_LINK_PLACEHOLDER.format("1cz2Je3y5K0de55qn5Tir6Kph-bH9CUxh"),
-"korea": DRIVE_LINK_PLACEHOLDER.format("17nDvjjIsLmlsebsttzyS_L0kE2lo31NN"),
-"kenya": DRIVE_LINK_PLACEHOLDER.format("1H3APuSTUCqCLgw6UyPFWc5IoPmetUZLW"),
-"kazakhstan": DRIVE_LINK_PLACEHOLDER.format("1rUdP8RLeSBnXwTLNKB7-QHgCY_n_k_2i"),
-"kajal": DRIVE_LINK_PLACEHOLDER.format("1P7eT3AoLTxJEUtOmxnHJOjkr6Tbw5mxR"),
-"keyhole": DRIVE_LINK_PLACEHOLDER.format("1HcviFULUI9mv_qjZL7hxlLas4SDiZ8TZ"),
-"knife": DRIVE_LINK_PLACEHOLDER.format("1UZqE5RL16giJE0j6GwwF3KIjWvg0-zap"),
-"key": DRIVE_LINK_PLACEHOLDER.format("1r-NhNuXpsuNkpc5LfuPj9qD0OM-jlQsz"),
-"knurling": DRIVE_LINK_PLACEHOLDER.format("1H6eARsGh_cz7yFf9NSPzu4vWAa_cW3qq"),
-"karate": DRIVE_LINK_PLACEHOLDER.format("1GxAWEup_Bp4O7KzliLyiydmBsYvIZpex"),
-"knee": DRIVE_LINK_PLACEHOLDER.format("1EtM-f9Y6jb4d8GLcW403XFCDvY4BXpkC"),
-"kiss": DRIVE_LINK_PLACEHOLDER.format("1_NF1YYKMzhtvKDxeLSTxbB8ecqIo9Bnv"),
-"kilometre": DRIVE_LINK_PLACEHOLDER.format("1t1d7ealwpEAIMGiLNqoFRmXB3mH7UWXX"),
-"kilogram": DRIVE_LINK_PLACEHOLDER.format("1PbNMDHFrFnF1IFfPeirjUe9qw9qyW2ea"),
-"kannada": DRIVE_LINK_PLACEHOLDER.format("1Ju_I0wn1ealnDy30I8mwrl1rtAnCnR-z"),
-"kabaddi": DRIVE_LINK_PLACEHOLDER.format("1Vu4xncg11tcln1GieFL-ThOwfB-9sUIe"),
-"keyboard": DRIVE_LINK_PLACEHOLDER.format("1k8ZazC3jo6PMPg2oeTEdzglj3S3-0stw"),
-"expertise": DRIVE_LINK_PLACEHOLDER.format("1KDx8kZhKLMvLIu6BzztXzDMuYInjN6IL"),
-"know": DRIVE_LINK_PLACEHOLDER.format("1rvT9TtQeTJYijnFcDCmOK4dSYdcByY9I"),
-"knock": DRIVE_LINK_PLACEHOLDER.format("1U7DuuGfUh7mEypMckdaWutuz-ELtJcac"),
-"kidney": DRIVE_LINK_PLACEHOLDER.format("1gZoI6Z1Oe8C0jOcgrmqhY2bf4bhLPk3n"),
-"kurta": DRIVE_LINK_PLACEHOLDER.format("1FWi-6zT0s3uNjmpXfyKezmMqNLnkY4IJ"),
-"king": DRIVE_LINK_PLACEHOLDER.format("1UnfkEfJHTrV8BA5zt3Md9UOdl4ZsK-xp"),
-"kangaroo": DRIVE_LINK_PLACEHOLDER.format("18eQK_dQjfT5PLip_KoxaKVUHo6K7VjtF"),
-"thermometer": DRIVE_LINK_PLACEHOLDER.format("1JuhzE09OCnY1pSb5zcXiyg9cIwgnCmH5"),
-"lungs": DRIVE_LINK_PLACEHOLDER.format("1hyHDZqr3RZmRcaHTlLBpnzhS7CdDBhX8"),
-"lens": DRIVE_LINK_PLACEHOLDER.format("1SdqJU2JnZpiqenO7NaDRMhsRQAd30Fy1"),
-"logo": DRIVE_LINK_PLACEHOLDER.format("1Peq3Mo2ZXoCju6Yb9RsHNcLkJfNuZJpp"),
-"line": DRIVE_LINK_PLACEHOLDER.format("1Qa-YD4G-TVHeSP33UzA16zqO9jjApNF2"),
-"legislature": DRIVE_LINK_PLACEHOLDER.format("1V5dr1RzxfI4kteN1cNVtz3Fd4O2NBbu3"),
-"liver": DRIVE_LINK_PLACEHOLDER.format("1JgBhyMZxXPB6gD0-1Qq5DqJdumIKXsqc"),
-"lightning": DRIVE_LINK_PLACEHOLDER.format("1hO_YjWv4z9BrytkglqgtQWhSvkMUl3WN"),
-"liquid": DRIVE_LINK_PLACEHOLDER.format("1SSirYxrTtEQsa5zJeWVn6cgY15SsBP-S"),
-"laboratory": DRIVE_LINK_PLACEHOLDER.format("1TWR6EVGz_hEXYGKbMVp6fFToTH8ezLKp"),
-"landowner": DRIVE_LINK_PLACEHOLDER.format("1UfFyikLqnnkX-xqKa0nOzLjhLeC7LBBG"),
-"lucknow": DRIVE_LINK_PLACEHOLDER.format("1cQA830P5LrJl2SHZlf0C8fMvWffjdBNK"),
-"liquidity": DRIVE_LINK_PLACEHOLDER.format("1pZTmwq8zOOFkpS95y5wMHqg_OziaC78n"),
-"ladakh": DRIVE_LINK_PLACEHOLDER.format("1mhCUu_BEHcjvO9dKyNKS6AYrPTK29oc-"),
-"loan": DRIVE_LINK_PLACEHOLDER.format("1ko7SbDsiyzoDmqsOyGevCVNzi-IOUW0h"),
-"legal": DRIVE_LINK_PLACEHOLDER.format("1y8WBw60INdPdeoGSipmtuXKnL48lbHMV"),
-"liquidation": DRIVE_LINK_PLACEHOLDER.format("11ZgZ3uE4YvUFE1XmaAUGFhtpuBAsIn2V"),
-"listing": DRIVE_LINK_PLACEHOLDER.format("1yFny5JT7k5zmpBFtEoSAMUXF_UHSaMzf"),
-"libor": DRIVE_LINK_PLACEHOLDER.format("11T0vJYnzyvygblBDZC4_YtDnI7kx3WII"),
-"lawn": DRIVE_LINK_PLACEHOLDER.format("124vUIzvG8GmjdBM-k8jMnuoj3zoE6xmw"),
-"limnology": DRIVE_LINK_PLACEHOLDER.format("1cxhUBXAvJutpGqj5S8ibePxskSPBJiG4"),
-"landmass": DRIVE_LINK_PLACEHOLDER.format("11LN9cpKSg3Uy_XsocqlYrVRKwFMFXRoT"),
-"location": DRIVE_LINK_PLACEHOLDER.format("11HOeKrNiduMLPXH8WcN41J0DplyyQWml"),
-"limitation": DRIVE_LINK_PLACEHOLDER.format("1axV2vEYmlDqUFGUd70GWrnnkHZqtc6yA"),
-"lead": DRIVE_LINK_PLACEHOLDER.format("1w_2E-1HyNTb4UFIfSkACKjeVVvZrBx6b"),
-"land": DRIVE_LINK_PLACEHOLDER.format("1cGGKLXmk2vHls7MrSTIf5mql1iJoKUAD"),
-"leaders": DRIVE_LINK_PLACEHOLDER.format("1h4g4bu4tVF1FMCoTqT_r7Z0mckgH6IYL"),
-"lgbt": DRIVE_LINK_PLACEHOLDER.format("1Lvdl4fm3DwuyJvKGQv7D4Bq3vinGSo2a"),
-"lhs": DRIVE_LINK_PLACEHOLDER.format("19iE8rRb1CfJarJ3OE3HSoN_VgRHdI1cy"),
-"lofts": DRIVE_LINK_PLACEHOLDER.format("1omrw2ZOTD0CbUofY-GnaJatrvhCEMi6m"),
-"lathi": DRIVE_LINK_PLACEHOLDER.format("1s7pEv-c0D7g4rK1qcWZYeFK27MxJeWj8"),
-"leaching": DRIVE_LINK_PLACEHOLDER.format("1TmtTsM6WrNgMaztuuyLv68nTq4lXsa0U"),
-"litter": DRIVE_LINK_PLACEHOLDER.format("1QTFkyR8X0C2ndXYie9k1FX_HF1wh73YN"),
-"leisure": DRIVE_LINK_PLACEHOLDER.format("1am8ROWScIUU7r_5fdYasAZeFuLEPcJhg"),
-"land_fill": DRIVE_LINK_PLACEHOLDER.format("1KnTDtMfKrMrypDo4jNIklu5uvED1jbqY"),
-"lapse": DRIVE_LINK_PLACEHOLDER.format("1XDJHgB6sJHO0ut6C9qnt7XfDtmKlmGDe"),
-"laminate": DRIVE_LINK_PLACEHOLDER.format("1c1iniTFBQnncpfrkMk8OtpOtGlMhCOss"),
-"lather": DRIVE_LINK_PLACEHOLDER.format("1vaUsxNFDZYehHsxL34PVXrihxdKfDQ-L"),
-"loam": DRIVE_LINK_PLACEHOLDER.format("1r1THpOuU09u1Ntd6tdNfFtGzaOtHET8d"),
-"lingua_franca": DRIVE_LINK_PLACEHOLDER.format("1gHwEnE7i1bR7syk2wWyeuKsckoq91e3t"),
-"lilacwater": DRIVE_LINK_PLACEHOLDER.format("1whrkMl4DaliahO-PtKdhLO4Ash8qcWUO"),
-"laminate": DRIVE_LINK_PLACEHOLDER.format("1cyPBEnKk7gqpfscQC4kCgL58HS9SzM_d"),
-"landscape": DRIVE_LINK_PLACEHOLDER.format("1-VWJ5F0GuCgmX7pgqxp4nF8eV8nZKG7V"),
-"lacerate": DRIVE_LINK_PLACEHOLDER.format("1OwCY4RagPET3OSxsN9DhbqZrxVV8QbQr"),
-"lacerate": DRIVE_LINK_PLACEHOLDER.format("1aGR1Ckx4Woz3DN_Ck9s8JdtFuZm0PqRJ"),
-"criticize": DRIVE_LINK_PLACEHOLDER.format("1aGR1Ckx4Woz3DN_Ck9s8JdtFuZm0PqRJ"),
-"lactose": DRIVE_LINK_PLACEHOLDER.format("1zpU5spoUy_da9fEOnhXA9SYnTwPUWBoE"),
-"labourer": DRIVE_LINK_PLACEHOLDER.format("1yCTS3DaIC46CCI_PRalVpFQBuVyyeBkc"),
-"labour": DRIVE_LINK_PLACEHOLDER.format("1xKjc7h6edNehd8NOor3UCYvYYcq0iSB-"),
-"lacunae": DRIVE_LINK_PLACEHOLDER.format("15Mai2seMuAdo8AdOIH75Be0AqbxfwscH"),
-"laidback": DRIVE_LINK_PLACEHOLDER.format("1uu8G2iV6MakiK4x5-mJCqYVYPQoj1gEl"),
-"loitering": DRIVE_LINK_PLACEHOLDER.format("1_tuS9_UeByeBzCLebu9PikKCrWn2EgeP"),
-"loophole": DRIVE_LINK_PLACEHOLDER.format("1JEwmIeYSwPzgWriWAloiU53R3GtaAg9F"),
-"ludo": DRIVE_LINK_PLACEHOLDER.format("1ayww7G_yM0P1KLB_k2evyNV8SWhnReAh"),
-"lamb": DRIVE_LINK_PLACEHOLDER.format("1vC_9kw6Z-csuVNiyOv0D6DO5bn5pWyBC"),
-"ladybird": DRIVE_LINK_PLACEHOLDER.format("1DEt2w4Vn1xt9uFqdWI_4zTur-Fn93qN1"),
-"lace": DRIVE_LINK_PLACEHOLDER.format("1KyKc5N-TUDkMsDipl8zERSlxBiZbsta2"),
-"landmine": DRIVE_LINK_PLACEHOLDER.format("10YStLmp3ax-OrLG7ttfdzlI14TmUuVKP"),
-"ladle": DRIVE_LINK_PLACEHOLDER.format("183eaHczBSos8SV2AH4r8iHwFvbaVubv4"),
-"legalese": DRIVE_LINK_PLACEHOLDER.format("1KiAjuxyuFRAsWoaT3PPolK93uyePufuM"),
-"launch": DRIVE_LINK_PLACEHOLDER.format("1Lwz-VnPCOffb3YvdU3t5WRdDE2Ncke8Z"),
-"liberalization": DRIVE_LINK_PLACEHOLDER.format("1zq_K22ZV6DlgIAJEdjz1iJopprrz3rA_"),
-"liability": DRIVE_LINK_PLACEHOLDER.format("19MVhDkJ58yQNNMBJ_eFDp33DtCdfoszn"),
-"luggage": DRIVE_LINK_PLACEHOLDER.format("1NuxhO_bmPPhjPdzq4tr_UbMX0PDuSiVK"),
-"landlord": DRIVE_LINK_PLACEHOLDER.format("1urqqHkLsldRjZ1oL34cEKHDMI5WLd_j9"),
-"liquid": DRIVE_LINK_PLACEHOLDER.format("1JMH0tlat25dAmJJtpHMe78wz_AglhUlj"),
-"longitude": DRIVE_LINK_PLACEHOLDER.format("1h3aZKg9xafW5aAYfCxGsP9aPTqzxXv7H"),
-"lava": DRIVE_LINK_PLACEHOLDER.format("1m7tBN2hHb0BJNpgwz5kATJcgMbzVgqmo"),
-"linguistics": DRIVE_LINK_PLACEHOLDER.format("1gVs76a2WHFfnKS8Y69kGRdkE1519u5Uz"),
-"licence": DRIVE_LINK_PLACEHOLDER.format("1b2z4tpoOpGmR6g6E7wkX1mlUHCquD2mL"),
-"lease": DRIVE_LINK_PLACEHOLDER.format("1EHX8NN2_eji2QdSAB8_y_9pEFhAke0Wb"),
-"lawyer": DRIVE_LINK_PLACEHOLDER.format("1S0iQHkFKqUB-zI5TqynL071BBoYVEHAA"),
-"barriester": DRIVE_LINK_PLACEHOLDER.format("1S0iQHkFKqUB-zI5TqynL071BBoYVEHAA"),
-"attorney": DRIVE_LINK_PLACEHOLDER.format("1S0iQHkFKqUB-zI5TqynL071BBoYVEHAA"),
-"advocate": DRIVE_LINK_PLACEHOLDER.format("1S0iQHkFKqUB-zI5TqynL071BBoYVEHAA"),
-"long": DRIVE_LINK_PLACEHOLDER.format("1A5VOmcMeSi14LDcPngxa6_OAnN8Hr7Fa"),
-"labour": DRIVE_LINK_PLACEHOLDER.format("1P_6ur5J8CXaYZK2lfC7ILGGoESnEpP_J"),
-"leprosy": DRIVE_LINK_PLACEHOLDER.format("1bZlV1sOavNeoUxlYjznuIGT27XuxYQ8b"),
-"listen": DRIVE_LINK_PLACEHOLDER.format("13Ka0q6mmA0LYu0SuoL5T8I0l-GrmpcT1"),
-"landslide": DRIVE_LINK_PLACEHOLDER.format("16k5SgGiHmP-Cdy84-2duub_K749-1gAG"),
-"loan": DRIVE_LINK_PLACEHOLDER.format("12FjcRVXFvg1rbl0fot5YZJIHNgUo8QB-"),
-"lockout": DRIVE_LINK_PLACEHOLDER.format("19fJGF6YS5uMfv1ObTZVPLR5qfAJB07tE"),
-"levees": DRIVE_LINK_PLACEHOLDER.format("1_Kpz00HiAbolRQEHk4NzFzNzYZVIuwP3"),
-"landmark": DRIVE_LINK_PLACEHOLDER.format("1roN2DtSvtvvGK5Vcc8_CnkTbURsyYaSp"),
-"landfill": DRIVE_LINK_PLACEHOLDER.format("1UpB7Yhlw5ZyJwVqcww9GLlMjaLBQAeW6"),
-"louse": DRIVE_LINK_PLACEHOLDER.format("1biaTvfzCCwJw9WKdHd7g0O9vKalnjyWD"),
-"laryngitis": DRIVE_LINK_PLACEHOLDER.format("1NtyoGqVphOyL8cGmQ9Yi1jrkwQ-hw2Rt"),
-"laparoscope": DRIVE_LINK_PLACEHOLDER.format("1XaMXwrrxljOUUQ8QGbEsIOqmSKsXAlHT"),
-"lactation": DRIVE_LINK_PLACEHOLDER.format("1rse9uU_5s-Uq5JcsOjoRjWlifEo2XHg7"),
-"lecturer": DRIVE_LINK_PLACEHOLDER.format("1JZob2RYRKOY4j1nLXcLADVtqddA9DLey"),
-"lakshmi": DRIVE_LINK_PLACEHOLDER.format("10Fyju01zqXS6jlc6OnAd-GMRxyl5hcua"),
-"lecture": DRIVE_LINK_PLACEHOLDER.format("1QmDzlAnDUKemHe6TlMpnkexxC1NLiUEK"),
-"lady": DRIVE_LINK_PLACEHOLDER.format("1_1u3GiU4PnQG8oKIyXbCLQ9Z8XmgyeXR"),
-"lenovo": DRIVE_LINK_PLACEHOLDER.format("1NcWh6JrQ5OJUSLcv848XGZsRfFMxDHdw"),
-"lighthouse": DRIVE_LINK_PLACEHOLDER.format("1qv91OiARvJCVKmaJcgjk3JYiTONS8u--"),
-"lunch": DRIVE_LINK_PLACEHOLDER.format("1RdmWuoq7yL-HW1WY1dBJqTdxMwGOE4lm"),
-"luck": DRIVE_LINK_PLACEHOLDER.format("1TGxQ22S_s2lVTOmgriqMtEsn-DkbUpZJ"),
-"loudspeaker": DRIVE_LINK_PLACEHOLDER.format("1lbhbpsiE4_QbmY19w3ALY1c0lbsWhDrH"),
-"lottery": DRIVE_LINK_PLACEHOLDER.format("1AwddgT8xl-wbA_UiRqm_kB4GMr4SxmyO"),
-"lymphoma": DRIVE_LINK_PLACEHOLDER.format("1l3OUZAQ9KipFu3JKxSKs6Ph2V6ZZg-yO"),
-"levelling": DRIVE_LINK_PLACEHOLDER.format("1-UgAZoHy8WDBBh9AlUVZvkqc8PQzZh-8"),
-"laying": DRIVE_LINK_PLACEHOLDER.format("1udjaMSYWcN8JxxRGBhBsX354kEy9H4kc"),
-"license": DRIVE_LINK_PLACEHOLDER.format("1Wh1-pnj0vojF8DHZLhoNAEhxliSRj5WZ"),
-"lentils": DRIVE_LINK_PLACEHOLDER.format("1BIaghyf3aMMWKmFFZk_YH1b9dY3RYmch"),
-"lawyer": DRIVE_LINK_PLACEHOLDER.format("1FIdFx3zqhoX27tJ0RgpJ1JB4v4pFnDWd"),
-"laptop": DRIVE_LINK_PLACEHOLDER.format("1uToaMeAzZM_dqSRodmuBuNq4kGBjkA2-"),
-"lintel": DRIVE_LINK_PLACEHOLDER.format("1K-eiNWbJPaJqIBa3uduJmmp2V6El6EfT"),
-"libya": DRIVE_LINK_PLACEHOLDER.format("1VJ8WCnXpVv48xAdjA2Jd0RxNze1LDmb9"),
-"liberia": DRIVE_LINK_PLACEHOLDER.format("1P5UKZEezNekCjINAT13bfI__5BJrQ_oP"),
-"lebanon": DRIVE_LINK_PLACEHOLDER.format("1WkpXDKELVSmXkzFNjR_vAukl3Ogx_Vll"),
-"laos": DRIVE_LINK_PLACEHOLDER.format("1-pwmcye3ABxK48RwBXHi_nrJ6KFydXpg"),
-"lollipop": DRIVE_LINK_PLACEHOLDER.format("1aPxFOmYh-oZ02l3rM9aBfiZkmG7fJkE8"),
-"lassi": DRIVE_LINK_PLACEHOLDER.format("1-1th4q_Xexxea6WfSxUITrDg__3q0nKP"),
-"limit": DRIVE_LINK_PLACEHOLDER.format("1xdJXgxvJkl4Yde5tNf1zRkwmdnuG7Z2B"),
-"like": DRIVE_LINK_PLACEHOLDER.format("1BRTNXbA0xggpSgrDhB9Mc2rZk_8q-k2S"),
-"less": DRIVE_LINK_PLACEHOLDER.format("1tLncrP9fqqLc86SxK3hM_cuNonD9VrXF"),
-"few": DRIVE_LINK_PLACEHOLDER.format("1tLncrP9fqqLc86SxK3hM_cuNonD9VrXF"),
-"lazy": DRIVE_LINK_PLACEHOLDER.format("1yxmtYg2JRBIWXR9W2dir6bF-hEw-neC2"),
-"inactive": DRIVE_LINK_PLACEHOLDER.format("1yxmtYg2JRBIWXR9W2dir6bF-hEw-neC2"),
-"laugh": DRIVE_LINK_PLACEHOLDER.format("1Od7u2SpZQJxa5b8hB7zdizWPvyOqRs1A"),
-"language": DRIVE_LINK_PLACEHOLDER.format("1lNYzlCiaj_gdzzOBbB4b13si7-iLIQoM"),
-"luminous": DRIVE_LINK_PLACEHOLDER.format("1UNbdUFmkcJUnU7a2uw-5Sse9D9kKJcRp"),
-"law": DRIVE_LINK_PLACEHOLDER.format("1UqBNOPl3rt9pRTFht5AFCl93ROT03mMf"),
-"libel": DRIVE_LINK_PLACEHOLDER.format("1ej1mwv4DJpNhvNWcUWo_bgipoaZk_6Vi"),
-"lynching": DRIVE_LINK_PLACEHOLDER.format("1au5Wv_et7JxtRwPIXb_uAWZ4sf4EJ60d"),
-"leds": DRIVE_LINK_PLACEHOLDER.format("1b0Gd9FbhGHY3o6Kv1u5XuVj6AVoHzjqM"),
-"luster": DRIVE_LINK_PLACEHOLDER.format("1PQeFqFqLIHnWzYl2IwIIiRrLtCBQnVhC"),
-"lapel": DRIVE_LINK_PLACEHOLDER.format("1tih369COqW6OgQQndtbMFfje7CaovD2M"),
-"lacing": DRIVE_LINK_PLACEHOLDER.format("16yfGfYrYrj08g-4qWXXxycg0IfxUkCLq"),
-"lock": DRIVE_LINK_PLACEHOLDER.format("1VTq3EgUpVBOrY9Wz5FRfG2ZdBSBYWn2f"),
-"lamp": DRIVE_LINK_PLACEHOLDER.format("1D4cHoHSVbVszf_mIamksLQDpFRkF4Fwy"),
-"lumberjack": DRIVE_LINK_PLACEHOLDER.format("15X3_fVqJTlZRghf4TZJ4-KlwffA4ryxG"),
-"linux": DRIVE_LINK_PLACEHOLDER.format("1gumnA08dkHSAwhDCVk1XOEqJarKZg9hg"),
-"lychee": DRIVE_LINK_PLACEHOLDER.format("1C5ofSXfIALy3f87eJQxbDPC_BXH_KtOs"),
-"lemon": DRIVE_LINK_PLACEHOLDER.format("1GYsJhYcsqZC-O6_bOKDYPJgsZT-TdqQ2"),
-"ladyfinger": DRIVE_LINK_PLACEHOLDER.format("1zAf7EdQeKuXx_dmO8Ji7mbL9BdSWbSub"),
-"letter": DRIVE_LINK_PLACEHOLDER.format("1_AR5o-uKoFk-ohwVRyG8x_9REsIQVQXE"),
-"lathe": DRIVE_LINK_PLACEHOLDER.format("1LEmp2c6C_gH8R_WjY8AiHMQ6-lQDNFUZ"),
-"lifter": DRIVE_LINK_PLACEHOLDER.format("1rFg4LlHnB4xW4yAZI-5AmDf06izn4Tvk"),
-"lightning": DRIVE_LINK_PLACEHOLDER.format("1Y5027UBmWNZlz5suWGVm5agjxdVhAF5-"),
-"leaf": DRIVE_LINK_PLACEHOLDER.format("1qlEkryUr32LswMtadUAO3pAypjNgmISi"),
-"lake": DRIVE_LINK_PLACEHOLDER.format("1z5qoHyXl_aV9qCdiB0bf3aicLwz5rasF"),
-"lion": DRIVE_LINK_PLACEHOLDER.format("15GhVKstIEap7psTAQcOYyPep-N_i772v"),
-"live": DRIVE_LINK_PLACEHOLDER.format("1yglVzNqE_N_W1uLu7_4_xXILY-hj_GS0"),
-"life": DRIVE_LINK_PLACEHOLDER.format("1jpvugWbEYYY954nqGdDJepTeZeTlSDUe"),
-"large": DRIVE_LINK_PLACEHOLDER.format("15m3EoaZyggIeK2ViQjB9Qi0_ms41tqCi"),
-"login": DRIVE_LINK_PLACEHOLDER.format("1rmcn3R0_dEzVCQe0wajBFYgKOTwiywGG"),
-"label": DRIVE_LINK_PLACEHOLDER.format("1-DAbjJZKRVZ-66gnlb9d9l9YD_QKuzdd"),
-"legal": DRIVE_LINK_PLACEHOLDER.format("1xTBJo0O3EvfW90ReZjR-Xj9d6BvSRpS2"),
-"lawful": DRIVE_LINK_PLACEHOLDER.format("1xTBJo0O3EvfW90ReZjR-Xj9d6BvSRpS2"),
-"livelihood": DRIVE_LINK_PLACEHOLDER.format("1XbNCeUyjSTlDVZVLTpL410WY4e0-k-x6"),
-"lung": DRIVE_LINK_PLACEHOLDER.format("1mGJYKO6KrXkGpEbs-vb_JLbam19q_9y2"),
-"liver": DRIVE_LINK_PLACEHOLDER.format("1e-IArUHQJZN1QWKwWJwOSL_ZWiUkgkbd"),
-"low": DRIVE_LINK_PLACEHOLDER.format("1fqs-CXvEied9EbbPE4JmuSAacERFZ1Vv"),
-"love": DRIVE_LINK_PLACEHOLDER.format("1h99Vg12MXkXhwAYRQ06ZJcpI0CwvNlAS"),
-"loud": DRIVE_LINK_PLACEHOLDER.format("1hehUG6O5lBqVzRmpgNT-lZ3yHm6YivTv"),
-"lotus": DRIVE_LINK_PLACEHOLDER.format("1HWtEnWAj-r1ZTmx71RNuaJrOhK5fBWhX"),
-"loss": DRIVE_LINK_PLACEHOLDER.format("1fWfcl1AVAzVJR1N995N07dAVsRpOmfT-"),
-"lose": DRIVE_LINK_PLACEHOLDER.format("1j4K6kIWTnIoq3EzGVYTc1YfTiJ4WQq7l"),
-"litre": DRIVE_LINK_PLACEHOLDER.format("1SsoEzCC9i2R2XR44yrIeUUdfv4JmRt9E"),
-"listen": DRIVE_LINK_PLACEHOLDER.format("10ArQIZe9a4frHhnMPQ5sT7Ep6m8kke96"),
-"lips": DRIVE_LINK_PLACEHOLDER.format("1Ui5HM9CYOj7DC2UMlSrZNSpv3LulNipO"),
-"line": DRIVE_LINK_PLACEHOLDER.format("1YchiOcp99qX34Bk0eQJBXO76weCYIdNQ"),
-"leave": DRIVE_LINK_PLACEHOLDER.format("1yXZ-oSw8yo34cLWqrjFocnkKfxmAuUZ0"),
-"leather": DRIVE_LINK_PLACEHOLDER.format("1viW1dehlmUyz2yExA9UF2or_rm7ydgfk"),
-"learn": DRIVE_LINK_PLACEHOLDER.format("1fOfLXPhRvFd2j2doe_Mbab9EA6amoLW6"),
-"load": DRIVE_LINK_PLACEHOLDER.format("14LbVxA1x6D4NBgx1wmFEY3xL7W2Jn2h-"),
-"late":DRIVE_LINK_PLACEHOLDER.format("1MZjvktH_D7isJRbjKWQRh3nxV6MIXB6s"),
-"later":DRIVE_LINK_PLACEHOLDER.format("1SZQupLH79BcWdW4RdBUbWnoFzu-6LQjN"),
-"ladder": DRIVE_LINK_PLACEHOLDER.format("1mgHP6LUepAzbYbQWxhTPtFn5IX44wOnv"),
-"local": DRIVE_LINK_PLACEHOLDER.format("1z4koSssML4qMMhxW-5iBrl4UNu07zBrw"),
-"list": DRIVE_LINK_PLACEHOLDER.format("1OymZ5BgVAQ-M-AWVIPsoi_C838u_vmK_"),
-"link": DRIVE_LINK_PLACEHOLDER.format("1ByiEMN3w75mFa-ExwSSaww7wQYzTTsBN"),
-"connect": DRIVE_LINK_PLACEHOLDER.format("1ByiEMN3w75mFa-ExwSSaww7wQYzTTsBN"),
-"associate": DRIVE_LINK_PLACEHOLDER.format("1ByiEMN3w75mFa-ExwSSaww7wQYzTTsBN"),
-"lift": DRIVE_LINK_PLACEHOLDER.format("1UyqqjverK75Yi6lyY37rpUhBiEmryDtF"),
-"level": DRIVE_LINK_PLACEHOLDER.format("1fB4pplXFHipgp7Hw3ZKbASFqH_4L1ar0"),
-"lunula": DRIVE_LINK_PLACEHOLDER.format("16ZKOKNF74xTaSyVjySgXo_gsjlqWqTns"),
-"laryngoscope": DRIVE_LINK_PLACEHOLDER.format("1dbyJ2Uk-6bw6INmIjwip5HDmR91iU6z1"),
-"laboratory": DRIVE_LINK_PLACEHOLDER.format("1qMY7sU3qMN4Wc_dBdPqgxSU3mwJJQhCW"),
-"latitude": DRIVE_LINK_PLACEHOLDER.format("1PvnD2iDR8mU_3XuNldHWOmEiDzYTjBQT"),
-"lithosphere": DRIVE_LINK_PLACEHOLDER.format("1js7WhEGXWPzV-qS7-CV3TwDE1e4tf7nL"),
-"library": DRIVE_LINK_PLACEHOLDER.format("1-o3VNb5Fkukz4p_53n0z1NUOdizW7IEq"),
-"librarian": DRIVE_LINK_PLACEHOLDER.format("1GNhD7K2nBpsxAhY7GZLXIafzUTDQgxv4"),
-"length": DRIVE_LINK_PLACEHOLDER.format("1nW6x_4v3HTgQd0IR_UidFSDY7eodouA7"),
-"molecular": DRIVE_LINK_PLACEHOLDER.format("1fRPOmQJQzc5WOnqiX0MZZOfM7MqgbNFc"),
-"microscope": DRIVE_LINK_PLACEHOLDER.format("1xIVYBBcSEyIwx2AJ5BHoCjHK-uxAY9S4"),
-"microbiology": DRIVE_LINK_PLACEHOLDER.format("1oC8rnhLrrGvxhIak1tGEV4hlOWzerkSm"),
-"melanocyte": DRIVE_LINK_PLACEHOLDER.format("1csfHAzBByuMyX_G9IC11xcmULwxEZOWg"),
-"melanin": DRIVE_LINK_PLACEHOLDER.format("1ZjwL0TTFmwi1AH3jW8G2VGQnqrnEURsv"),
-"mausi": DRIVE_LINK_PLACEHOLDER.format("1nkJrmRHcCk-rJC1KAihMxVQLkiVQLLEn"),
-"monsoon": DRIVE_LINK_PLACEHOLDER.format("1kIAhlKJkgYmJ6J5QKQzjkNeUxMjRRKOA"),
-"majority": DRIVE_LINK_PLACEHOLDER.format("1PVkUP8FmxmKlpE7ITwoVqGTtPKA5GBTE"),
-"migration": DRIVE_LINK_PLACEHOLDER.format("1bEUneBtUIJtmFMrl42b6FNY7J9fG-qqj"),
-"mercury": DRIVE_LINK_PLACEHOLDER.format("1gZMQZWn446lm0-QLOrYKVpFj7ptp5IlZ"),
-"muscle": DRIVE_LINK_PLACEHOLDER.format("1RApxWzHPQO_CgwYbpSFfJeXNI4GUasV3"),
-"metal": DRIVE_LINK_PLACEHOLDER.format("1kO-LuiHkgMlLXd5ZjGpPioVMLJdjuhp0"),
-"multiple": DRIVE_LINK_PLACEHOLDER.format("1oMj1iPF55lHZOEqmM9XajjMsCSqz_VQD"),
-"mauryas": DRIVE_LINK_PLACEHOLDER.format("1VV_-ffoTfXyPlSROwuLQok7gT1exL9MR"),
-"monk": DRIVE_LINK_PLACEHOLDER.format("1FuPAA6rT9FzFByQNsXvCRg0rolMmt0vB"),
-"microlith": DRIVE_LINK_PLACEHOLDER.format("1jAmYB1nC7kakRvnYwwiCZTskM3i9nTwJ"),
-"mesolithic": DRIVE_LINK_PLACEHOLDER.format("1qcAhBpK5yPzsQ4AT346HcWCiteeQtYWu"),
-"monastery": DRIVE_LINK_PLACEHOLDER.format("1L8LdyV7C-0sYvmVnrhZfMLx7sFqt25Ec"),
-"megalith": DRIVE_LINK_PLACEHOLDER.format("1qnQeJ9kSxBOe_vth_KmthZ6WE9FfyNiq"),
-"mohenjodaro": DRIVE_LINK_PLACEHOLDER.format("1tQMlPWP9fPyixjeuL6QhNBB-CIpqnc4b"),
-"manuscript": DRIVE_LINK_PLACEHOLDER.format("1L6nWYjXjv6pLzfg4xRqN-M0MuZhhptnP"),
-"mysuru": DRIVE_LINK_PLACEHOLDER.format("10FDsjW-7Us1ukrJeW5cTu7L5gQupuRrP"),
-"mysore": DRIVE_LINK_PLACEHOLDER.format("10FDsjW-7Us1ukrJeW5cTu7L5gQupuRrP"),
-"mumbai": DRIVE_LINK_PLACEHOLDER.format("1L34JKWfRuLlt2vpz20Ikq8KC4FKIIyel"),
-"mizoram": DRIVE_LINK_PLACEHOLDER.format("16uGsQS2OOWDjaHfsGeFx5qB6zSgyWOBW"),
-"meghalaya": DRIVE_LINK_PLACEHOLDER.format("1MapOOwM1VX5iCa4vmmLob9RFKXhW4MHr"),
-"manipur": DRIVE_LINK_PLACEHOLDER.format("1_l64jaRozjMc5flPDvMUW0VB0KuRe8Nn"),
-"maharashtra": DRIVE_LINK_PLACEHOLDER.format("1cyAKNaM8GmDDpDlqEL5y5WYARosRYesV"),
-"mortgages": DRIVE_LINK_PLACEHOLDER.format("1oEK2WbbQygAQ3bNvbcu4yl8ZXWTlUg7s"),
-"margin": DRIVE_LINK_PLACEHOLDER.format("1AFrSWWrCapJrmz5wwbHcssH37NJi-89K"),
-"mandatory": DRIVE_LINK_PLACEHOLDER.format("16oGnEnUASzyfHgZ4vUERFDLmJxx4mqfW"),
-"missing": DRIVE_LINK_PLACEHOLDER.format("12-J6mOg1RDCZ0NjPOf-YAOoS-e4DIjf1"),
-"middleman": DRIVE_LINK_PLACEHOLDER.format("1c3-K1cP9XjROIHaxMu_OM7ZHrEJrEOOs"),
-"metamorphosis": DRIVE_LINK_PLACEHOLDER.format("1nC1SVdJ6lSFIQLCECfbkzKZCikUmOFJ0"),
-"mastitis": DRIVE_LINK_PLACEHOLDER.format("1QBo0KC7kjdl4GyfRqUlLG_OSpO12O5j9"),
-"master": DRIVE_LINK_PLACEHOLDER.format("1Jz37wcvnUAdPB2ENj22pbqKhNZMM2LqZ"),
-"maya": DRIVE_LINK_PLACEHOLDER.format("1x-dwN2sRJBGN5jqS1W6Kj5NmIg_Bhp3X"),
-"mash": DRIVE_LINK_PLACEHOLDER.format("13CX1QJVvdlIf6rFtSCDNq4gkf83Uw2ib"),
-"markup": DRIVE_LINK_PLACEHOLDER.format("1OXdTY5zSOsvDIfjalPFAm_mBVy9nLFKh"),
-"macros": DRIVE_LINK_PLACEHOLDER.format("18XDWr7h8OA7RtonKFQjKQ6VLoPIVgFDT"),
-"mince": DRIVE_LINK_PLACEHOLDER.format("1ddG78xWRHPEjdTx2lElYczEEYY4ftBKh"),
-"mockup": DRIVE_LINK_PLACEHOLDER.format("12RDtD4InnmMujLVqNMiG9q1VvscGnGMz"),
-"marinade": DRIVE_LINK_PLACEHOLDER.format("1glirw0JldSW3mWzwAtp65yZNDaggr8GT"),
-"molecules": DRIVE_LINK_PLACEHOLDER.format("1gNbp0kMtfuQOGn4ObO0k7gTJfY_4tVjC"),
-"magnesium": DRIVE_LINK_PLACEHOLDER.format("1d6kRdBweLihOcSyW01mYx_CaA5IgKRAx"),
-"mattress": DRIVE_LINK_PLACEHOLDER.format("1epZmlyPjANXD4haG_6CPcYA06IcaYR5X"),
-"mask": DRIVE_LINK_PLACEHOLDER.format("1H6TYvp3GCHRuoinyw5fbsSg8qtjwleWk"),
-"moderates": DRIVE_LINK_PLACEHOLDER.format("1xWtnbxA5ZumqyRV1t9rHCuZfmkxYnffB"),
-"multilingualism": DRIVE_LINK_PLACEHOLDER.format("1pUzg9W8FcllORjm8K8DdOaOa3dj4kfVq"),
-"mouthing": DRIVE_LINK_PLACEHOLDER.format("19pnqL4LHcaGv-ULW6BjvPH11DpU-1kPB"),
-"monoculture": DRIVE_LINK_PLACEHOLDER.format("1xvA5hnAcmliqqrGdZwwl53vZk_lfbYoy"),
-"manual": DRIVE_LINK_PLACEHOLDER.format("1BpIVp7XFdCQsbshGo03QD3H2w5ODJRES"),
-"mercury": DRIVE_LINK_PLACEHOLDER.format("1hVQIjNYDhkunEL9484OZ5xb6ZT2isr0A"),
-"meow": DRIVE_LINK_PLACEHOLDER.format("1sY1VpimgUVJM6WjnbO92bes2X3DG9Efz"),
-"misogynist": DRIVE_LINK_PLACEHOLDER.format("12b5hhIcobAfSD_phfV1HjIsEAobCxTpw"),
-"momos": DRIVE_LINK_PLACEHOLDER.format("1cwieXUO7IaQG1Rf_6xOdREg80fXXaPpY"),
-"mustache": DRIVE_LINK_PLACEHOLDER.format("1lC1aUeFgG_usrqNapT0lqFBq9xjPLzmY"),
-"mukhbir": DRIVE_LINK_PLACEHOLDER.format("1AqG2phbrAwE-1EvUXn1EnB5ElbM4Cbt-"),
-"mastermind": DRIVE_LINK_PLACEHOLDER.format("1NUSlErDp4PAMQb6cIW79Kx3YhDVztIZJ"),
-"minor": DRIVE_LINK_PLACEHOLDER.format("1MyrmqAVM-924Jn5rB9KCc40Z08O5wjHd"),
-"minute": DRIVE_LINK_PLACEHOLDER.format("1z0eXPx7qlUUBTwDqUysmbSyDQNG5AZ-G"),
-"minutes": DRIVE_LINK_PLACEHOLDER.format("1z0eXPx7qlUUBTwDqUysmbSyDQNG5AZ-G"),
-"mulching": DRIVE_LINK_PLACEHOLDER.format("1BIPs4dFb8EmO_Mt0XV6GRTx8le5H6gnx"),
-"militarize": DRIVE_LINK_PLACEHOLDER.format("1bHawHjz52Cx0lBJfGYYlwZ6Oaet4Si5M"),
-"movement": DRIVE_LINK_PLACEHOLDER.format("1BA0Cpcrw-Fcz1WKQATmnjxxUZieCgwQv"),
-"mother": DRIVE_LINK_PLACEHOLDER.format("1-SeJn-_ZoRoATnGVg86gyZ95B5yEbNAV"),
-"magnet": DRIVE_LINK_PLACEHOLDER.format("1c65aw7ctSb1l56LhZBZXmnfMMtMBf47s"),
-"mummification": DRIVE_LINK_PLACEHOLDER.format("1enUEi2BVoKFoWa9e5lR90-zKQ7SHkvAv"),
-"motion": DRIVE_LINK_PLACEHOLDER.format("17aX03qBqiwbrmcJ-Wp7g5lre-evZ63fB"),
-"morphology": DRIVE_LINK_PLACEHOLDER.format("1mEtW1YVtcVDBqjJ26OoMaT0ehoZ9xZE3"),
-"minerals": DRIVE_LINK_PLACEHOLDER.format("1ymcTu8KZQCPjPCB8g6NBUC2a6rB8oBls"),
-"median": DRIVE_LINK_PLACEHOLDER.format("177D4aA8Avmcf4k616CW4he3tLswc9nyU"),
-"mean": DRIVE_LINK_PLACEHOLDER.format("1n7zEAHloMXuTklLXYHMYVTuMO__9AW4A"),
-"marginalization": DRIVE_LINK_PLACEHOLDER.format("1iRtuBcnFFQUVFtko5lnTZIJhGbGJTYWB"),
-"manuscript": DRIVE_LINK_PLACEHOLDER.format("1UGfx_eVVVLCGibMSeqjDz75ebn7cp_Oy"),
-"maxilla": DRIVE_LINK_PLACEHOLDER.format("1kfVu0dVBhxVLC7XN_Oaluz7_3tIhmoqG"),
-"menopause": DRIVE_LINK_PLACEHOLDER.format("1GBvXtm76_1WFBMYBYaDXKQ-8AcKHHjDF"),
-"meningitis": DRIVE_LINK_PLACEHOLDER.format("10HfxzmWcY5E5IWcL_ovPKXIXG43FvVLl"),
-"mania": DRIVE_LINK_PLACEHOLDER.format("1nNsbMXWK5QVmeFKNAIEodY7iKLXX09Dm"),
-"mafroor": DRIVE_LINK_PLACEHOLDER.format("1di3exS-7WlACf8OAg915Aztx895NcVDp"),
-"mode": DRIVE_LINK_PLACEHOLDER.format("1Zji4EIAVEM2IgMsvwjFpBgQCiuW7Pu8Y"),
-"milkman": DRIVE_LINK_PLACEHOLDER.format("1R8L_Dv1z7tXNERVE4kRpxUZelRs5gfNH"),
-"mechanic": DRIVE_LINK_PLACEHOLDER.format("1BNZ9H0Eop9FBpfSYmdNaoPmPdpG7-um0"),
-"mason": DRIVE_LINK_PLACEHOLDER.format("1EYn26rnrtg-ZCvGD8nFV7yA4_IqwikBz"),
-"manager": DRIVE_LINK_PLACEHOLDER.format("1AfG2503CLHPSesFcOFa57bS_O7rkjwUN"),
-"mahavir": DRIVE_LINK_PLACEHOLDER.format("11jMPfUjned7vOoDEQcMlP5m2dXEYrbEd"),
-"multiple": DRIVE_LINK_PLACEHOLDER.format("1emfFR2c4nrpdMQfAolw0cPiFA9KE-CGo"),
-"mix": DRIVE_LINK_PLACEHOLDER.format("1bQjvz3-aT46xF22g0vmWafPkP_cVb5oU"),
-"mature": DRIVE_LINK_PLACEHOLDER.format("1VgnJ-UIgUByKdNSaBq13p3Rc9PzoyQMv"),
-"menu": DRIVE_LINK_PLACEHOLDER.format("1-FrK3fZuU_CxZMiGySlnx1jksO0xmqFJ"),
-"magician": DRIVE_LINK_PLACEHOLDER.format("1xjSkYUHcUZ_gLkd2rNCv25W89aWtmuFp"),
-"motorola": DRIVE_LINK_PLACEHOLDER.format("1KZIHyFHs9bgdjvgfpRxSM4AqF9H4BxLe"),
-"mtnl": DRIVE_LINK_PLACEHOLDER.format("1UdKDv80Qbju2vOEGMrF2uYhgKP0ZskiT"),
-"must": DRIVE_LINK_PLACEHOLDER.format("1fJrJYdwOnav8nWgTmjBah4-xRDueVd36"),
-"should": DRIVE_LINK_PLACEHOLDER.format("1fJrJYdwOnav8nWgTmjBah4-xRDueVd36"),
-"move": DRIVE_LINK_PLACEHOLDER.format("1MYdWjrMiTLKx33itezL6uwkn-gMbXGnb"),
-"morning": DRIVE_LINK_PLACEHOLDER.format("1OrVuOFADn13dVE7hXMmhwst9zkyugsyJ"),
-"mock": DRIVE_LINK_PLACEHOLDER.format("16VXYCJgfkhdLd_WPUVoZTnvwoMGzjBWb"),
-"ridicule": DRIVE_LINK_PLACEHOLDER.format("16VXYCJgfkhdLd_WPUVoZTnvwoMGzjBWb"),
-"misunderstand": DRIVE_LINK_PLACEHOLDER.format("1frOqy4uHR4BUvH2GRXKcjDTnsDxa9MVM"),
-"misconstrue": DRIVE_LINK_PLACEHOLDER.format("1frOqy4uHR4BUvH2GRXKcjDTnsDxa9MVM"),
-"meeting": DRIVE_LINK_PLACEHOLDER.format("1SNJ0TOHyBGffTAk4HiAZb_HByolvRcq3"),
-"meet": DRIVE_LINK_PLACEHOLDER.format("1OFC5NzytUbuvAA96CkRDj0NRk6UufP25"),
-"maybe": DRIVE_LINK_PLACEHOLDER.format("1dDX5dIrOS50mFpRSN7GY7GQI7JmEXRLf"),
-"maximum": DRIVE_LINK_PLACEHOLDER.format("1rWCanEhR4d5wKEJpksZiFbsX-N0P7G-Q"),
-"maths": DRIVE_LINK_PLACEHOLDER.format("11DIhq46Y_TIcJ19ItB7ogEYT9vhif1rR"),
-"market": DRIVE_LINK_PLACEHOLDER.format("1Ni4jI76sNn5h1wbBYnCElKFHqQhmbaKa"),
-"marathi": DRIVE_LINK_PLACEHOLDER.format("1BczgSN4mpJ933u5O_G8xhbkmFTgtQPfI"),
-"mall": DRIVE_LINK_PLACEHOLDER.format("1M52i1PqI4w7cK8i6T3Q0nTxSWcXvpUPH"),
-"male": DRIVE_LINK_PLACEHOLDER.format("1ZrQv4fwJXNwurCXpshgNrRCjMO1Japbr"),
-"masculine": DRIVE_LINK_PLACEHOLDER.format("1ZrQv4fwJXNwurCXpshgNrRCjMO1Japbr"),
-"magic": DRIVE_LINK_PLACEHOLDER.format("1EDGhkxG5DsYt7gZ7aWfCJDHYCC2SxS3U"),
-"mic": DRIVE_LINK_PLACEHOLDER.format("1wdJwvUu-x1i78lUL3vGtH8t9_yR6hilk"),
-"microphone": DRIVE_LINK_PLACEHOLDER.format("1wdJwvUu-x1i78lUL3vGtH8t9_yR6hilk"),
-"mouthwash": DRIVE_LINK_PLACEHOLDER.format("13Pzn_2NHmH8OBnateBTjGGtDiSlT9b7G"),
-"mutualism": DRIVE_LINK_PLACEHOLDER.format("1sln90EVz4l94jsCYLy0p_kinvqVLuV-s"),
-"metabolism": DRIVE_LINK_PLACEHOLDER.format("1j9f2SkzQVMrQd3ac_uzMGjsRKDu5y-og"),
-"myomectomy": DRIVE_LINK_PLACEHOLDER.format("13tcCxU2Vlwh6cwBUwXmmQwLytoCXx4VO"),
-"mumps": DRIVE_LINK_PLACEHOLDER.format("1nEuOhj_aZS35I-LUwH0B25BLZc9TkEmw"),
-"mortuary": DRIVE_LINK_PLACEHOLDER.format("1DwWDTwt-bDVcxS6yerZB1neiO57xTm-z"),
-"migraine": DRIVE_LINK_PLACEHOLDER.format("1aEzq2VVJkUa414xfxOf_EiTt6rAUtWOR"),
-"melatonin": DRIVE_LINK_PLACEHOLDER.format("1ANslhqodbCnclQtogKVEq2x8VM4kZiTg"),
-"melanoma": DRIVE_LINK_PLACEHOLDER.format("1DBLtltK7IYOUvYVVYTB_TIPyut6aZWBX"),
-"mainsworn": DRIVE_LINK_PLACEHOLDER.format("1mBkO8rpI5I4EM-8ClHE73O5cwMq12xNW"),
-"measurement": DRIVE_LINK_PLACEHOLDER.format("1IJ3zViFHj3_hOeQW4mXEkQKrEbdr64nu"),
-"message": DRIVE_LINK_PLACEHOLDER.format("15x5MlTxAA7GUpI3zKgh8v8FWxOWOKGwn"),
-"mutiny": DRIVE_LINK_PLACEHOLDER.format("1zfRKZeog3aN5uBJj9qBHxCn0IxdKmOYa"),
-"misbranding": DRIVE_LINK_PLACEHOLDER.format("1IPYlEcAwvNpNAWGVZVtI5LXCf6rTzY-O"),
-"manifesto": DRIVE_LINK_PLACEHOLDER.format("1iAQVG4SjOa2QSUbxL2LPuOMOBN0HRJr3"),
-"mahrana": DRIVE_LINK_PLACEHOLDER.format("1clu71a5LAZ6UB_hrNwJ5oYD3szQRSHRv"),
-"mahr": DRIVE_LINK_PLACEHOLDER.format("1GqfGl9KTH-VSG1xDm4fTmjuZ4xIl60wE"),
-"mazdoor": DRIVE_LINK_PLACEHOLDER.format("1CT1LokVVOpGkE-z2A-9o0aXYgMwRi7cH"),
-"myanmar": DRIVE_LINK_PLACEHOLDER.format("1XHtxjeZ-eD5DpodhSpKQv5dF_T0M9Lkv"),
-"morocco": DRIVE_LINK_PLACEHOLDER.format("1bbkR0V9nKTIPDhepb9zECPXPvP7PLk0h"),
-"mongolia": DRIVE_LINK_PLACEHOLDER.format("1vS1Fp5KIpjZaHzj9ZkMaZehR6-8p_1QA"),
-"mexico": DRIVE_LINK_PLACEHOLDER.format("1IKzJx9xlBSfKGSVn27pd-PqMH-LEPUBf"),
-"mauritius": DRIVE_LINK_PLACEHOLDER.format("15zty4Jr0ZtAPH90mgaVW_T5O0RJNeZgc"),
-"mali": DRIVE_LINK_PLACEHOLDER.format("16A8aORUeZMyY9l_44KsuuroEVXm4lZXW"),
-"malaysia": DRIVE_LINK_PLACEHOLDER.format("1PepI72v0TDz5nXhXHKtAwIraRabBF_iw"),
-"malawi": DRIVE_LINK_PLACEHOLDER.format("1lLY3kOfgFRWpeAmEXsD4ZL8uuM257XAj"),
-"madagascar": DRIVE_LINK_PLACEHOLDER.format("1EBbGcC81UyHonFl-4BDj-YEzh3ahNf1K"),
-"macau": DRIVE_LINK_PLACEHOLDER.format("16Is4JT0mNoGLU8nyzf4W_SkvynhWzRZN"),
-"may": DRIVE_LINK_PLACEHOLDER.format("1Srb37RLiSDpJc-PoXt0Iaaf-ARLzzBo1"),
-"march": DRIVE_LINK_PLACEHOLDER.format("10uuskGxrBTbAwiL-3NuEMoC2CoKI7Tif"),
-"millionaire": DRIVE_LINK_PLACEHOLDER.format("12s0ZJFyzLGaKfQaxtq23zFgYWtaBaAbv"),
-"mercantile": DRIVE_LINK_PLACEHOLDER.format("1ixE4tQy32DSmNBab3AIHEdRqs6p_LZk_"),
-"mugshot": DRIVE_LINK_PLACEHOLDER.format("1_R65mYHBDLFhvjKC-alN77f9fzZ-WE9o"),
-"monopoly": DRIVE_LINK_PLACEHOLDER.format("1DWICaJS_g2QePqXDXdVDl6-wYjOLUbQQ"),
-"monarchy": DRIVE_LINK_PLACEHOLDER.format("1zwiMfY4GkSZQJTjl-w-LduJJvcqkj8lr"),
-"metaphor": DRIVE_LINK_PLACEHOLDER.format("1epf9JKNsanwcX9howgVbFnejBKpTQK5m"),
-"matriarchal": DRIVE_LINK_PLACEHOLDER.format("1J22HE08gw1SdeQY8mtQ-uTiFrFmIdmj6"),
-"mouse": DRIVE_LINK_PLACEHOLDER.format("1OaUbOiS6uTWwaIhYkQ3rKvwZeQPOUCLd"),
-"muffler": DRIVE_LINK_PLACEHOLDER.format("1qNldoqb8l9nY2G0b2L_FhL7oqMUXrOmv"),
-"metamerism": DRIVE_LINK_PLACEHOLDER.format("1ttj7DFYbafr66K8Fy_fSodr4-O-0DjXk"),
-"mushroom": DRIVE_LINK_PLACEHOLDER.format("1WCuNolT5B63Q2QwjPa6co4y6KBtZ1nFt"),
-"mosambi": DRIVE_LINK_PLACEHOLDER.format("1Cocgx_2cHBy39LQ9Rx2yLPB2zJYrenfs"),
-"mango": DRIVE_LINK_PLACEHOLDER.format("1wEx5IkNTbYcFkOx9fgeftn3uOMwNfCVF"),
-"mountain": DRIVE_LINK_PLACEHOLDER.format("122igZIGj8PAlDZ1nUtWWAZZceSlYfggZ"),
-"moon": DRIVE_LINK_PLACEHOLDER.format("1Q8s7w76vAuExt_XHh_Y376_RW0bcr5Wx"),
-"monday": DRIVE_LINK_PLACEHOLDER.format("1maP4s4S2YW3xYNs_9aS33gEAnXPqRHZh"),
-"mosquito": DRIVE_LINK_PLACEHOLDER.format("1BDjXIMl_Tqo7fv1HVbPQ3x-tzwsUYz7I"),
-"monkey": DRIVE_LINK_PLACEHOLDER.format("1Qes20b5WKF0ACsHNsJE1iC52mQv0xA3I"),
-"metro": DRIVE_LINK_PLACEHOLDER.format("1fdtBOXL2fhQyxHzC51jGbVpFLTUMUMCv"),
-"marigold": DRIVE_LINK_PLACEHOLDER.format("1NnC9oU6UWdywbqDQa3Ry8LbKK8hDl1Vt"),
-"mile": DRIVE_LINK_PLACEHOLDER.format("1TuEjOsMmn5soPmTRQY-es6IWmgAkJ34i"),
-"material": DRIVE_LINK_PLACEHOLDER.format("1WF2BypssE48JMs03p8UCJ81K8wtsJF8I"),
-"museum": DRIVE_LINK_PLACEHOLDER.format("1ncDD-293jvaLR7BtkvXTpOSbVf8u1PXG"),
-"mosque": DRIVE_LINK_PLACEHOLDER.format("1jZFK1WQSDLywqkPdhuXKe8ddHd4Hfp_s"),
-"modern": DRIVE_LINK_PLACEHOLDER.format("1_-YB5ciylJ3TvdMlrTNS8aV8_xlqwHdu"),
-"multiply": DRIVE_LINK_PLACEHOLDER.format("1Go6Ry9GMMyAYDrIkxgpcTw0LBTe1tFDo"),
-"mug": DRIVE_LINK_PLACEHOLDER.format("1reGDogOHekJF-o-O6ttGQ9yKJ52SjDpB"),
-"mouth": DRIVE_LINK_PLACEHOLDER.format("1xR5uE_LnOnp1Vb_QzZPwEEuth5s_tjS3"),
-"motor": DRIVE_LINK_PLACEHOLDER.format("1Nh50S7SqNqpSRRjowtA438gLUkF3nNzx"),
-"mood": DRIVE_LINK_PLACEHOLDER.format("1uUfAc9w5sMUtRfy0hYcakN98dLk7iNXW"),
-"madhya pradesh":DRIVE_LINK_PLACEHOLDER.format("1VeLLFf5XQ1YeNvDICAIhIQA0oMmxHd_c"),
-"minority": DRIVE_LINK_PLACEHOLDER.format("19y9ISkh12A1Wgx6cdNDk8hhAh4TbMtqe"),
-"medium": DRIVE_LINK_PLACEHOLDER.format("1qnr_YIOkQt81cUmovnCpxPCMwhXx2SS-"),
-"monthly": DRIVE_LINK_PLACEHOLDER.format("1qw-wAJVRGk60dAnlEPPzSo8yC7w2d2pv"),
-"month": DRIVE_LINK_PLACEHOLDER.format("1UXAiBCnJvmvoTgKZg8bqkZwRHniLq4P0"),
-"meditate": DRIVE_LINK_PLACEHOLDER.format("1ZzBlQkn57mvI7KQNXx6-H0nzhJbPP70N"),
-"mirror": DRIVE_LINK_PLACEHOLDER.format("1gc0P7envU0XJJawVEAdA69Fu4UQOcc-k"),
-"musician": DRIVE_LINK_PLACEHOLDER.format("1DAW-Nf-h7eRbzEn33zaBas_ratz6BPE9"),
-"myself": DRIVE_LINK_PLACEHOLDER.format("1lF6PqUbYuPy14tLTkWrqX-9VMcScAPK9"),
-"music": DRIVE_LINK_PLACEHOLDER.format("1Nzem8NMv3i9Heyb4Oxle8hU74hYaCN7e"),
-"millilitre": DRIVE_LINK_PLACEHOLDER.format("1NpcVyLPVy5-SqXotDM-RgmZjb6rh7eXL"),
-"metre": DRIVE_LINK_PLACEHOLDER.format("1TwkFwWZIlI6NSAzkiAKvOPGD1BDJKxQP"),
-"metal": DRIVE_LINK_PLACEHOLDER.format("1JJMqdK5Nra85VGza5S_K5oBR8EYV8bO7"),
-"maternity": DRIVE_LINK_PLACEHOLDER.format("1M1Pd10HNgcFpWCYW3FL0UopkXZjWe1S_"),
-"multitask": DRIVE_LINK_PLACEHOLDER.format("17fUMNn-9chqoQwfJDhH-ePQINzUlDJNc"),
-"motherboard": DRIVE_LINK_PLACEHOLDER.format("1vUQLdEBK7ESQRN7E_bWdxbaRCf2C8HLX"),
-"monitor": DRIVE_LINK_PLACEHOLDER.format("151rGx-4dZKzdJ1CLNRqQ_IcXXP6Jk8_X"),
-"minimize": DRIVE_LINK_PLACEHOLDER.format("1PgEMaKyUeLlomv7xiuqADsc0KgFYCZ7s"),
-"menubar": DRIVE_LINK_PLACEHOLDER.format("1YcO321vk40EkcZKs6AR40ZfBHBhGEH_G"),
-"medal": DRIVE_LINK_PLACEHOLDER.format("1MvjRkigqzVxuD-DjqO3dWFHlD8ApM7fk"),
-"matchbox": DRIVE_LINK_PLACEHOLDER.format("1sd7LRru-CPQ-B0z0F9HF9QccYxPBUiTq"),
-"mat": DRIVE_LINK_PLACEHOLDER.format("1LGvrjenfDf7GcRqZYy58fYVk3sUElutY"),
-"man": DRIVE_LINK_PLACEHOLDER.format("1YMVnUgdcYvk4FHl_O3Xyq23GhOEAwHHB"),
-"malayalam": DRIVE_LINK_PLACEHOLDER.format("1zzzRRAAvY2aeGh4Ig0Pr61BfZwGmjmdy"),
-"me":DRIVE_LINK_PLACEHOLDER.format("1ZzZJUrKHlpi686-lrFBY-huiDfpFPkRr"),
-"make": DRIVE_LINK_PLACEHOLDER.format("15uLAWpMgafPpZV3fOX4dRE2j95SF4xrC"),
-"maximize": DRIVE_LINK_PLACEHOLDER.format("1odmZubRxOr4ppdPlzWEzTVEs1Sf8uRBz"),
-"mallet": DRIVE_LINK_PLACEHOLDER.format("1tAQPqVMtxOfZxqZamijCEJiI24w1_2Tj"),
-"malpractice": DRIVE_LINK_PLACEHOLDER.format("12oWzYRrpbblnVasyJDoh3srKyhxqx40l"),
-"mammography": DRIVE_LINK_PLACEHOLDER.format("17uYKaprGZ23e2S9y2I4m8f3e51kBVVQe"),
-"midwives": DRIVE_LINK_PLACEHOLDER.format("1qXJJLYudnOaxo_LU0-UWqkjqL-608m4k"),
-"might": DRIVE_LINK_PLACEHOLDER.format("1DR3y9677uPfYEURyvhaTimclThais-oZ"),
-"multiplication": DRIVE_LINK_PLACEHOLDER.format("1bFD2ab06VvTXsPH45v8Mo_gt1ncfnVHC"),
-"mammals": DRIVE_LINK_PLACEHOLDER.format("179Wp36I4JbkmRV-5-6iSGgkNpzMqn7Gq"),
-"machine": DRIVE_LINK_PLACEHOLDER.format("17f_rgHeUTDLF2qus70ISIIfFwEu63sat"),
-"mass": DRIVE_LINK_PLACEHOLDER.format("1cHjbrYsTCDVY56iY2_dBhGuf7ASU48of"),
-"my": DRIVE_LINK_PLACEHOLDER.format("1SpvqWO8QlfBA6T4bnu6c6p0llQfYxfGD"),
-"muharram": DRIVE_LINK_PLACEHOLDER.format("1EODj-eCNLfbkWoecVTrWUl_fkesPZWpk"),
-"movie": DRIVE_LINK_PLACEHOLDER.format("17WstZnu2IlMDuIG7iADjGg9xoZmzLfzY"),
-"motivate": DRIVE_LINK_PLACEHOLDER.format("1ZeeRHt2zy9P5yYjMsbkO-BUnYqBIQioV"),
-"more": DRIVE_LINK_PLACEHOLDER.format("1tqW0Bxi_-86I6V7F0yrOjwGGAqMeVYII"),
-"monsoon": DRIVE_LINK_PLACEHOLDER.format("1FtQJbzyBUBBMokeAee-ndRnbwUHc1qoe"),
-"model": DRIVE_LINK_PLACEHOLDER.format("1eRV8tvjJRjswr-JRImtHFNcz7M8DP9F4"),
-"minister": DRIVE_LINK_PLACEHOLDER.format("1RmwApa88XNjmdV5b3VOUAZ8JNkGo23bd"),
-"milk": DRIVE_LINK_PLACEHOLDER.format("18NL33EqccnLGwSpcaYXtVrI8l00QWxpt"),
-"middle": DRIVE_LINK_PLACEHOLDER.format("1ME3u-dEQLA1PC0RRoHrAva3apE5iddeS"),
-"method": DRIVE_LINK_PLACEHOLDER.format("1LxkwUz_ATPsG5NtY-advEpDui8JYdozH"),
-"medicine": DRIVE_LINK_PLACEHOLDER.format("13nA6PWUuJb50kJ_ocpbF2BfQ332Zo1zo"),
-"meat": DRIVE_LINK_PLACEHOLDER.format("1nNxAhcNfmqSnVOPQ6CUjbgwRw1h2JIHr"),
-"measure": DRIVE_LINK_PLACEHOLDER.format("1ebI1IOrpA3WLjcQKCB6RkinRVOf7Lo2r"),
-"map": DRIVE_LINK_PLACEHOLDER.format("1PJxIUGLASCClfKIgx7NzTJHHFVCxadkb"),
-"nitrogen": DRIVE_LINK_PLACEHOLDER.format("1pKoKIzohu3GJGGqCxuXJjOeHelue_RCe"),
-"nutrition": DRIVE_LINK_PLACEHOLDER.format("1BbgarPoNHP8Ld01FLKY2H0Yq-a5bQjeQ"),
-"neutral": DRIVE_LINK_PLACEHOLDER.format("1IieAi2G02aFOrJ06R2K0eg7FVQV0jMlr"),
-"nutrient": DRIVE_LINK_PLACEHOLDER.format("1gsJESVR6iY5UXOyn9LLsIJ8lrmxtgcfF"),
-"numeral": DRIVE_LINK_PLACEHOLDER.format("1OKNCIUAKmUbiozgzjuP5OpuXRAP_TLcS"),
-"numerator": DRIVE_LINK_PLACEHOLDER.format("1AIRA2KyKOnnwlV1HINcTgdQ5JvAaJ_h2"),
-"neolithic": DRIVE_LINK_PLACEHOLDER.format("1oN4crW14XmVg4SLVpJSFyixkq2KZHf9n"),
-"nagpur": DRIVE_LINK_PLACEHOLDER.format("1hJvXz2f50ENV8atG_YzAw9x2uO-tAyKk"),
-"netting": DRIVE_LINK_PLACEHOLDER.format("1NHHUENHRRjWQg0iHdixM2pG6i9z-kCre"),
-"nominee": DRIVE_LINK_PLACEHOLDER.format("1d2rYQwrEDnTp2Jb-NU3AE3NcXWOHHLl2"),
-"nematicides": DRIVE_LINK_PLACEHOLDER.format("1tt005pODIiO_N2uvAOQMDeizaRd2puzi"),
-"nematology": DRIVE_LINK_PLACEHOLDER.format("16yOqTUjOiQqyJ_KaDNEf4QKxid0ODnEZ"),
-"nemaphose": DRIVE_LINK_PLACEHOLDER.format("1SJmOZ2fytd7JNu_Q84kgPAd0WSDKYA3v"),
-"nucleus": DRIVE_LINK_PLACEHOLDER.format("1g9ke9MBGXNH9yxXTKu61l1_sND8ODrhZ"),
-"nest": DRIVE_LINK_PLACEHOLDER.format("1MyambhJwwnKd0QzMQ1JUm1goC4WLrMqr"),
-"norm": DRIVE_LINK_PLACEHOLDER.format("1btPp1lMPlZoRiOAo_gP9oTJOCuG-qLQF"),
-"noose": DRIVE_LINK_PLACEHOLDER.format("13CHjsdrHKBIoXkpe2EradrOkz1G3ADOp"),
-"nickel": DRIVE_LINK_PLACEHOLDER.format("1To-qfZqVGo1IL49qtooKwzlsuaKvSHGs"),
-"neon": DRIVE_LINK_PLACEHOLDER.format("12QiiN8lHsSrQQAiQHibJXykVUsM8LHv6"),
-"netflix": DRIVE_LINK_PLACEHOLDER.format("1qaDdiC8U_raiVf9akeSxmi4QD3sHOVFf"),
-"newsreader": DRIVE_LINK_PLACEHOLDER.format("1VZdfONj60SnnFCNet-zOoxyDCuVJBTa6"),
-"nota": DRIVE_LINK_PLACEHOLDER.format("1Vwcgb8CeYF0beZS03al6ABYhGSLEvKkR"),
-"notesheet": DRIVE_LINK_PLACEHOLDER.format("1I6nu5iFDoG_lAVAQMj6_dvD0V5_oGOX5"),
-"negotiate": DRIVE_LINK_PLACEHOLDER.format("1BUO9M3RZTwDYbMh2K0tyeNfqugft71iW"),
-"neigh": DRIVE_LINK_PLACEHOLDER.format("19XSqPWsRZPU7e8Ppk7k-x1pJyzrazH7y"),
-"noting": DRIVE_LINK_PLACEHOLDER.format("1nW2CXaLvo_yl9p3LrYwNXJUIu7HP1ExM"),
-"nectar": DRIVE_LINK_PLACEHOLDER.format("1uNlt7uW-udAtR9hx8-UxqS_BwYKT8MGt"),
-"notebook": DRIVE_LINK_PLACEHOLDER.format("18-T8bKxsB1iBzOvQiWjKv85CEfBJTw85"),
-"nazism": DRIVE_LINK_PLACEHOLDER.format("1x4E-rhA39uphm9vqYwW8jmyhdmCDpMJD"),
-"noun": DRIVE_LINK_PLACEHOLDER.format("1_O6WsbWLaw9S3TFiX8lPdKSJcmGOK1Qp"),
-"neurolinguistics": DRIVE_LINK_PLACEHOLDER.format("17X8P6xWdPCgXb0cFD5_Ak6SK_uJHTmQ9"),
-"nri": DRIVE_LINK_PLACEHOLDER.format("1_04PnupyaTUKzgBrHH_mT_0TbdpD_5yV"),
-"nomographer": DRIVE_LINK_PLACEHOLDER.format("13BoeRZzslrddO2lYzRRGfwn9iysYMiaw"),
-"noise": DRIVE_LINK_PLACEHOLDER.format("1yhOnnlqfddMz6MNv-U7mO2SkD1Kcy9lb"),
-"noverca": DRIVE_LINK_PLACEHOLDER.format("1BZQ0KYIMUR5klaYLw03gEfTIMVn_8akc"),
-"neurologist": DRIVE_LINK_PLACEHOLDER.format("1ASVcbWfSnyxnyPTIPeVduD78FMiVxGvR"),
-"nervous": DRIVE_LINK_PLACEHOLDER.format("1DMCx3z1MkJwBqKCOAs3ZCVI0r9qcI1om"),
-"neonatologist": DRIVE_LINK_PLACEHOLDER.format("173f0cYyRoxm4cQjxOJNyGSe_FH_FdxGJ"),
-"nebulization": DRIVE_LINK_PLACEHOLDER.format("1Pz9Dus1NgrhOBflpCFh47gu1PiIwQC-B"),
-"nauseous": DRIVE_LINK_PLACEHOLDER.format("1VcVjzwxaNYnUkNDQz3FjTJDScvreSQLi"),
-"nurse": DRIVE_LINK_PLACEHOLDER.format("1R4fVrs_eTRjMR0XOiji8rC_Ttq8Nq5eR"),
-"network": DRIVE_LINK_PLACEHOLDER.format("13aXNZSw0iiodP4OF8XdqvhszTfJoGh5p"),
-"name": DRIVE_LINK_PLACEHOLDER.format("1A3IyV8n35GhQVGO04vOesYpKUEwHV24C"),
-"no": DRIVE_LINK_PLACEHOLDER.format("1agT05yoJYmPO1i1X4pH_5Xc8rJUBK4mR"),
-"niece": DRIVE_LINK_PLACEHOLDER.format("1WLNTxhUq7F0Rd-1CE2BXiGlOPHBikBul"),
-"next": DRIVE_LINK_PLACEHOLDER.format("1YnEo7yBCXOQGeVJfIVTGSmLPwkctODd5"),
-"nephew": DRIVE_LINK_PLACEHOLDER.format("1yFUyBsQhHLEFvF-wGsFOffBjzzI7OZ46"),
-"necklace": DRIVE_LINK_PLACEHOLDER.format("1hmQEaB_ymeMfdFO7mzUnGkjFlorEXOch"),
-"nokia_mobile": DRIVE_LINK_PLACEHOLDER.format("1eTUazHjl5qSzbensNzXS5X7ztkpmE8l0"),
-"negative": DRIVE_LINK_PLACEHOLDER.format("1HTkbBVEG20DDR3AHpkgvGB4a-k7H5nqP"),
-"nostril": DRIVE_LINK_PLACEHOLDER.format("1fyV1tQWphio99oejwsELpHWD2eh154i5"),
-"nephrology": DRIVE_LINK_PLACEHOLDER.format("1dSMqiSXusx58CQJu8Cdf2sV4kJS3O_cH"),
-"nubilis": DRIVE_LINK_PLACEHOLDER.format("1_j4kQ6jibgKHsMUtRWbI67em0XGg8wcp"),
-"nominee": DRIVE_LINK_PLACEHOLDER.format("181zo2WuvUufbV8GSqlVjKKL55JbAd0-v"),
-"natality": DRIVE_LINK_PLACEHOLDER.format("1x8cjLmqhpOMEh6bavrWzhTZcyNyKCDaV"),
-"norway": DRIVE_LINK_PLACEHOLDER.format("1_alkRL7vuJh5h6q10QQklomvVY7G3DqY"),
-"nigeria": DRIVE_LINK_PLACEHOLDER.format("1yyhkNWEeefTkOAf8wl06jZ6ydbUDOGap"),
-"niger": DRIVE_LINK_PLACEHOLDER.format("1oNyYLO8yi_E_RPsda9YdvoVX84RadhiG"),
-"netherlands": DRIVE_LINK_PLACEHOLDER.format("19cVVYqzbAJT-ZPzEkelU-b8VeLxZ5Q-J"),
-"namibia": DRIVE_LINK_PLACEHOLDER.format("1OB46Hccecq4ratZ8WpPt0jX9GJKE-Ndf"),
-"nagaland": DRIVE_LINK_PLACEHOLDER.format("1MERl1jmfLvI6LvKopxmAMYZulVfcH3IL"),
-"november": DRIVE_LINK_PLACEHOLDER.format("1mBLNsk2OZIfSntJSrr71o-SgJIy74x_O"),
-"non-fiction": DRIVE_LINK_PLACEHOLDER.format("1uea5A4R_gjm0iHOEWsy4DFDvqf-oFakQ"),
-"neuropsychology": DRIVE_LINK_PLACEHOLDER.format("13s3XudDt3FqrwpXo5CujTCaZw33g_nNV"),
-"nuisance": DRIVE_LINK_PLACEHOLDER.format("1B_FhhvVsJhsB6ApWO581hdrS-guLeP9U"),
-"negligence": DRIVE_LINK_PLACEHOLDER.format("1JEhO5sCXP-CIaPQIAEFxfZ_80qiaVxmU"),
-"needle": DRIVE_LINK_PLACEHOLDER.format("1XhJDi4NVIYuojgw4zb6qj3IusbHSbGOr"),
-"nepal": DRIVE_LINK_PLACEHOLDER.format("1Q2QwUb30yoscB8viXXoR6WNjKfMw16us"),
-"natural": DRIVE_LINK_PLACEHOLDER.format("153EPQB_nSyI-CK-y5NVfpiDWoBZbjXSC"),
-"nutrition": DRIVE_LINK_PLACEHOLDER.format("1feRpj8NvDzr0nJXVrzUZbR5Q9YCHzLA4"),
-"nose": DRIVE_LINK_PLACEHOLDER.format("1eGTbg1B57hjmX_uRMRZWWbxcVjwF0cgd"),
-"noon": DRIVE_LINK_PLACEHOLDER.format("1KMzjK-h44MzTQB-vbPLM_raqs16RHBxq"),
-"ninth": DRIVE_LINK_PLACEHOLDER.format("1mRylfgOmSqefPP1XPmNfZYtLpdiSyMdG"),
-"never": DRIVE_LINK_PLACEHOLDER.format("1WXShM86bIK_DNvsT0_hA9uxOwtR0Qc22"),
-"nature": DRIVE_LINK_PLACEHOLDER.format("1w6wbz9tYog_p36u9iMfVOXKFXtU-hfJY"),
-"narrow": DRIVE_LINK_PLACEHOLDER.format("1O8_rskr_bHturtpEQNCnYQN5XGsAa8zu"),
-"namaste": DRIVE_LINK_PLACEHOLDER.format("1C75EuPC8sIwHjY0WKrXlTK_pYK5KHVPi"),
-"nice": DRIVE_LINK_PLACEHOLDER.format("1AqEFIzIEAgt04RhqEwPvrgMqKzfGgOQU"),
-"neck": DRIVE_LINK_PLACEHOLDER.format("1nGu70EPXvD6K1feFH6vVYu_bxrRRGNd4"),
-"nail": DRIVE_LINK_PLACEHOLDER.format("1dPiS1mU-jHSwA-oXx3GF0MfqenojHP6e"),
-"nut": DRIVE_LINK_PLACEHOLDER.format("1Pdb5BBO8Qf-LRMdAk_JTnMfxaflaRbbP"),
-"numpad": DRIVE_LINK_PLACEHOLDER.format("1IqSZMWlQvrvYGHBwsjFBa3N7Q_7n1iGZ"),
-"notepad": DRIVE_LINK_PLACEHOLDER.format("1TrSKVzyQ8GOemhJN6hHqo5k89011mwk-"),
-"nurses": DRIVE_LINK_PLACEHOLDER.format("1HtbXYqc90ozrBOuzhe4UP4WJtyNmrAKc"),
-"night": DRIVE_LINK_PLACEHOLDER.format("1RmyEqEU5pUrjWTekBMlJe1gvIkiUg7Gz"),
-"number": DRIVE_LINK_PLACEHOLDER.format("1-5O8cRaYJ48qIalff2Gs9KtVnrgY06Ei"),
-"north-east": DRIVE_LINK_PLACEHOLDER.format("1_7Yt563hDGAkUsWJqi-Cxk2zgHjoKIZ7"),
-"north": DRIVE_LINK_PLACEHOLDER.format("19dhrDsAUA0LFtN-FytJZmmwQgwy7A8w1"),
-"news": DRIVE_LINK_PLACEHOLDER.format("1Wcw8vAxrM0rZdkRBTl4dLUt8E1DnLalo"),
-"new": DRIVE_LINK_PLACEHOLDER.format("1Pv92Eae7HMb1dnetWYO6vNUKBxyEv6rH"),
-"neighbor": DRIVE_LINK_PLACEHOLDER.format("18NY6TY0Xu2n6-_T1Aol7lU0f6HDkEwrH"),
-"neat": DRIVE_LINK_PLACEHOLDER.format("1jrScvbcuhYkGgQS9Z1rX4OLBBoit_nAn"),
-"near": DRIVE_LINK_PLACEHOLDER.format("10c9RdWGIMNsdbTYqOWOCNo9dyW21c8XN"),
-"nearby": DRIVE_LINK_PLACEHOLDER.format("10c9RdWGIMNsdbTYqOWOCNo9dyW21c8XN"),
-"national": DRIVE_LINK_PLACEHOLDER.format("1X2d8KpqKKKHeZ8batGo1R0eHE-LqdRJF"),
-"organelle": DRIVE_LINK_PLACEHOLDER.format("1Lsi63z1bu1kzNqzpDPcj-Ylyf98J3a8U"),
-"once": DRIVE_LINK_PLACEHOLDER.format("1tfBPYCGBjEVVMYseAIslvrWsz1SJ5hEb"),
-"offence": DRIVE_LINK_PLACEHOLDER.format("1t7K4sOH_D8i3DfKaZ2ffRnYJKSpw-JKI"),
-"opposition": DRIVE_LINK_PLACEHOLDER.format("1nyHbr8ZkySM22SYUBSNM84cN0HE8PNpM"),
-"oxygen": DRIVE_LINK_PLACEHOLDER.format("1TbzrEpjLCw2u545c0p9D_QQhuZC5IMKW"),
-"operation": DRIVE_LINK_PLACEHOLDER.format("1N2Hc0Gt1VNjqmtIOvZiEey0SvXVekjjC"),
-"one-fourth": DRIVE_LINK_PLACEHOLDER.format("1F4Cs6CNNcG-0B_xY7RSoI4cZ8BoV-uDH"),
-"octagon": DRIVE_LINK_PLACEHOLDER.format("1-tlioyudnPW_gPpe0mr_o9LSc37lTgal"),
-"odisha": DRIVE_LINK_PLACEHOLDER.format("1Iqdh0uosIHlkDh_AqN0Jj1snlSRmESSH"),
-"order": DRIVE_LINK_PLACEHOLDER.format("1mIPYHnir-XmKx1FWtwjIdw87A0o7OHcM"),
-"options": DRIVE_LINK_PLACEHOLDER.format("1Jn5BroI9z_AEE0lqbd13GOn1zpKsoAXh"),
-"otc": DRIVE_LINK_PLACEHOLDER.format("1SywS-zBG5RAW1lYVKgKMCQcWihiv4Fsf"),
-"overdraft": DRIVE_LINK_PLACEHOLDER.format("1fA-k6XYrR5ww7GrucxIQQUW3RrUR-a97"),
-"opuntia": DRIVE_LINK_PLACEHOLDER.format("1c2zmXBTki3HE7BWjwBOYM9SXblvF4a8C"),
-"olericulture": DRIVE_LINK_PLACEHOLDER.format("1grkflBD8g28o9a6dYrsOmDFbbWG9waTT"),
-"or":DRIVE_LINK_PLACEHOLDER.format("1kzuH3POZQrS2SYiZJW-SM8o7uB8Sn0Px"),
-"oxidation": DRIVE_LINK_PLACEHOLDER.format("1avtWCXE7JFDiLzaNbFB5aKwgyQkIjIv8"),
-"ovi-viviparous": DRIVE_LINK_PLACEHOLDER.format("11tP-5DrdNCSR4kT0HyKTFUSXUamHTlEA"),
-"oviparous": DRIVE_LINK_PLACEHOLDER.format("1_CM6Ml4YezPdjgN8Dp_CKezpH8RcExmd"),
-"ornithology": DRIVE_LINK_PLACEHOLDER.format("10Z4gS50SCvayg_eTZJstR2f-WqrrsFaZ"),
-"omnivovus": DRIVE_LINK_PLACEHOLDER.format("1dAlr5cYP9Y8quTskUkHeCpHgTjE-_Uy9"),
-"offset": DRIVE_LINK_PLACEHOLDER.format("1Gq5NeX969j_tm4PTL5wFpEZ1HD9mm-r7"),
-"organism": DRIVE_LINK_PLACEHOLDER.format("12MEWbtFqyb_MwtSS38RTQKVBpU5tfWqe"),
-"orbiter": DRIVE_LINK_PLACEHOLDER.format("1TE945UEjc0g7Y-54kGV2nS2kjHA2iEgL"),
-"owe": DRIVE_LINK_PLACEHOLDER.format("1tRp9ZWPUBMbNM3icQ759Lc35djV3J5f2"),
-"origami": DRIVE_LINK_PLACEHOLDER.format("1yBNFBk4vKsRS0psMPAeDYyX_qIkb4Db1"),
-"old-fashioned": DRIVE_LINK_PLACEHOLDER.format("1QkDVhOyn69T0a9oYa-wk9ooTzTs8tZEn"),
-"overtime": DRIVE_LINK_PLACEHOLDER.format("1WgxWzSobgbHyoO8mA5iXRJinUBoajdbF"),
-"outlier": DRIVE_LINK_PLACEHOLDER.format("1JclqDECxpLg8wlrlXKoTOWG9dN-AB-EU"),
-"odds": DRIVE_LINK_PLACEHOLDER.format("12dEATJNB9gzYDgM7jsB3VMfAK4MHZDAF"),
-"over": DRIVE_LINK_PLACEHOLDER.format("1wZ9mprj4xCPFi4RAjcSFQz_4qfzIylGI"),
-"opposition": DRIVE_LINK_PLACEHOLDER.format("10vVEuiyTw6AAZ5kdR4G5HmoeuMsVW5FA"),
-"objectives": DRIVE_LINK_PLACEHOLDER.format("1WtFug1C9G8Eg2AcH8WR1YidapIMGnzmx"),
-"outline": DRIVE_LINK_PLACEHOLDER.format("196ymF30ybQ2zknorpiiFHSRK61y-9BOL"),
-"outcomes": DRIVE_LINK_PLACEHOLDER.format("1nUPMU1Qs-1wJqf179gdFb2ThEeZuDg-J"),
-"onam": DRIVE_LINK_PLACEHOLDER.format("1V2DWX4o9F8n6PcVSQCDY9uCKgmzFIa9X"),
-"order": DRIVE_LINK_PLACEHOLDER.format("1owGZyXlSArQoa9NtD1jbiXW2bRqGYImi"),
-"oasis": DRIVE_LINK_PLACEHOLDER.format("1kU8oqe9D73fL4M48voJEcyLo51pc05TG"),
-"ovules": DRIVE_LINK_PLACEHOLDER.format("1KSWHeC6kGFp6i54jM5e1bGbwlxfEYusT"),
-"ostracise": DRIVE_LINK_PLACEHOLDER.format("1VtcGXtMovnyUayvT3LwTfm6WQ7xT5onN"),
-"oralism": DRIVE_LINK_PLACEHOLDER.format("1aqnrky99Oh3v8Yuce3cbY-WE2j17Pgp7"),
-"onomatopoeia": DRIVE_LINK_PLACEHOLDER.format("13Vq9K_cgxEGPGPjbths7oMKu6ikhuzpw"),
-"oscillation": DRIVE_LINK_PLACEHOLDER.format("1iuuo1yc-QhHpPSIYf1GZGWC7oqHgPyvP"),
-"ovary": DRIVE_LINK_PLACEHOLDER.format("1UfforzTPQAJRV6pZX--JblVXcMb8Lf8o"),
-"our": DRIVE_LINK_PLACEHOLDER.format("1_vn3cYIq0FVoa83pnEJ890V8lqSKqNj1"),
-"official": DRIVE_LINK_PLACEHOLDER.format("1HubgJqJYu8f4ErR11fWSFSQReFRRl5Kg"),
-"ostrich": DRIVE_LINK_PLACEHOLDER.format("1mO4w6_PFVol1kWTj0xEsAoY1hmzuMSMa"),
-"operation": DRIVE_LINK_PLACEHOLDER.format("1hLAUcdBIaEtFqKAyechKkwQgTfeSxjqF"),
-"often": DRIVE_LINK_PLACEHOLDER.format("1evrNBwWDNuCef4Q3-rrmTqJ0ar0B2_Er"),
-"office": DRIVE_LINK_PLACEHOLDER.format("13vUPlk6pS_awn1PTyWZdD_t--veNo_OY"),
-"otoscope": DRIVE_LINK_PLACEHOLDER.format("1OFZG0ax9r5ocfluVenqMmPS9TOis1gqe"),
-"otorhinolaryngology": DRIVE_LINK_PLACEHOLDER.format("1ZYovBRYGNHMJqWmDiOlYivO-M6OkjA8T"),
-"osteoporosis": DRIVE_LINK_PLACEHOLDER.format("1lhexOs3Pjfb29UINspiFA67fkzeo8kR9"),
-"osteoclast": DRIVE_LINK_PLACEHOLDER.format("1vuMY5iZVioVIoVA7lcVRXgioTWyht_Gg"),
-"osteoarthrirtis": DRIVE_LINK_PLACEHOLDER.format("1F2rZFkJVA5r1RY_quFcEo1Ah6t9dY74-"),
-"orthopedics": DRIVE_LINK_PLACEHOLDER.format("1aXtylsKGCdLUqQJ7_tTQpHRRNfXCLPkp"),
-"orbit": DRIVE_LINK_PLACEHOLDER.format("1oBNizHLf6ZjLUO61qMX4Ubp_VV1tiFZx"),
-"oral_rehydration_therapy": DRIVE_LINK_PLACEHOLDER.format("1iJSK3OmDAsqGvaXzqEZpGp4eZjFDkM_Q"),
-"optometrist": DRIVE_LINK_PLACEHOLDER.format("1z_V7jXXUoWFt1pXbHFRMn6Fux6aIq0D8"),
-"optician": DRIVE_LINK_PLACEHOLDER.format("1fFTP5tXm4g8jT2mf__XnxF4noL1vnI7a"),
-"ophthalmoscope": DRIVE_LINK_PLACEHOLDER.format("1NWhAp0Ay7bvhFSVChiiWuAAJZQidruXR"),
-"oncologist": DRIVE_LINK_PLACEHOLDER.format("1mEYQUmVNMszZMVP9W82p1N2fl5cUZfiM"),
-"officialese": DRIVE_LINK_PLACEHOLDER.format("1l6Fi6X2Pppm5IVF_lu77kBq1GM4TdQ0g"),
-"oscilloscope": DRIVE_LINK_PLACEHOLDER.format("1M60y1HXZfYhrkNUB2kyJHBX5BuWE8YHO"),
-"organic": DRIVE_LINK_PLACEHOLDER.format("1Hi4YrI77LUlIefuhqPy0aVt484Dt06PX"),
-"objectivity": DRIVE_LINK_PLACEHOLDER.format("1Pg-IhXvAamuUwl-ZOWgBOycioEL_H6oH"),
-"orange": DRIVE_LINK_PLACEHOLDER.format("102d-9X3zBXur6_E3eGlmsqVictn3zJEs"),
-"onion": DRIVE_LINK_PLACEHOLDER.format("1xjOFg2krblMvV3JxNGkVC6fO2JFy6Ked"),
-"offence": DRIVE_LINK_PLACEHOLDER.format("1DVF3Lfe6vaqKOj-dg4LW5W9i1hE5JAK6"),
-"octopus": DRIVE_LINK_PLACEHOLDER.format("1pDbpLtMlya43PoFYSD-BCuzZlMhJy8XC"),
-"ox": DRIVE_LINK_PLACEHOLDER.format("1J3HA-6WI-ULnEjLIP66uOjYAtzWh9uT6"),
-"owl": DRIVE_LINK_PLACEHOLDER.format("1U2myf-EgCSPXO6AHLOeonpBfq9FWr2IQ"),
-"owner": DRIVE_LINK_PLACEHOLDER.format("1_TS4KXHwq-C0yw6fbv7JgXzXU_E2DIg6"),
-"own": DRIVE_LINK_PLACEHOLDER.format("1SKuufqzd9QOHeZfn9aTAeTv2d9jYU7UI"),
-"possess": DRIVE_LINK_PLACEHOLDER.format("1SKuufqzd9QOHeZfn9aTAeTv2d9jYU7UI"),
-"oval": DRIVE_LINK_PLACEHOLDER.format("15V80a7vGEB5lkG59iY5yipBkHl1oZthM"),
-"ourselves": DRIVE_LINK_PLACEHOLDER.format("1UnjeXhGMei4K0Kpd-LufDxnHb2UmUIt6"),
-"other": DRIVE_LINK_PLACEHOLDER.format("1WRpUqReWkqi3k2AFwsVqjKehcH1VXrM1"),
-"oriya": DRIVE_LINK_PLACEHOLDER.format("1RYyE6uZ5ZS6jmSOpk7uwey6ZtQnlQ2-R"),
-"open": DRIVE_LINK_PLACEHOLDER.format("1at1e9PugFE6jXcXLQtSiQ_XwLK2RnEsp"),
-"ooty": DRIVE_LINK_PLACEHOLDER.format("1p1ZUKzj9aVuWlufA7OAzgBcGYb3zz1SJ"),
-"online": DRIVE_LINK_PLACEHOLDER.format("10OEJYau-Q_-Zfg-lRXzMV1D8jb09Igc0"),
-"on": DRIVE_LINK_PLACEHOLDER.format("1yDO5GTzkDnQbVgzDz5sjvRnJA1I78gZM"),
-"oil": DRIVE_LINK_PLACEHOLDER.format("1qI4tNLUrlKXy0zplAi1EtwnunYA-JPj1"),
-"offer": DRIVE_LINK_PLACEHOLDER.format("16dI_ztrH_z-Og75h_ChEHJxwhhBh09yK"),
-"opposite": DRIVE_LINK_PLACEHOLDER.format("12kJBe6MKxer3lTTF55wQxGDm3eSaFnXf"),
-"contradict": DRIVE_LINK_PLACEHOLDER.format("12kJBe6MKxer3lTTF55wQxGDm3eSaFnXf"),
-"oath": DRIVE_LINK_PLACEHOLDER.format("1Dw84Yc0EHPcloz8X2pEqoKvA_usjRonE"),
-"pledge": DRIVE_LINK_PLACEHOLDER.format("1Dw84Yc0EHPcloz8X2pEqoKvA_usjRonE"),
-"omnivores": DRIVE_LINK_PLACEHOLDER.format("1GwKLF-2x4H6VM7A1qWEHL-ijsSggAi09"),
-"oath": DRIVE_LINK_PLACEHOLDER.format("1JB6-T3qENFQ6Om3S-lU5xkLJGMoItV6a"),
-"ophthalmology": DRIVE_LINK_PLACEHOLDER.format("1eTe66MSYJ_ZN7tVBDIIxGkRmNFHn1bHL"),
-"ophthalmologists": DRIVE_LINK_PLACEHOLDER.format("1v1DQgN4yfiKjAIdBDBx0noZoB75v4axD"),
-"oncology": DRIVE_LINK_PLACEHOLDER.format("1NI6z48B5JI9FkaXhJGKENdKZv1uSN_Uv"),
-"obstetricians": DRIVE_LINK_PLACEHOLDER.format("1V5xErE5O89unI8mrLzW9vObhnvvYXTvp"),
-"obesity": DRIVE_LINK_PLACEHOLDER.format("128TtjbFO5LfgDDhRJgpnaN6WY5d_qHnn"),
-"original": DRIVE_LINK_PLACEHOLDER.format("1DXwCyADQHx94_xo4QZXXLVXGMTWZf0sN"),
-"order": DRIVE_LINK_PLACEHOLDER.format("1BwiJF9EGaN9wbbT8APSzQxfELJZJuxaC"),
-"command": DRIVE_LINK_PLACEHOLDER.format("1BwiJF9EGaN9wbbT8APSzQxfELJZJuxaC"),
-"direct": DRIVE_LINK_PLACEHOLDER.format("1BwiJF9EGaN9wbbT8APSzQxfELJZJuxaC"),
-"instruct": DRIVE_LINK_PLACEHOLDER.format("1BwiJF9EGaN9wbbT8APSzQxfELJZJuxaC"),
-"opinion": DRIVE_LINK_PLACEHOLDER.format("1Uqbtb8zGz_vil170UedP0zBBJmemzERe"),
-"okay": DRIVE_LINK_PLACEHOLDER.format("1R6bugnFg149ypVMofrQieQvtUbQVJizW"),
-"october": DRIVE_LINK_PLACEHOLDER.format("1238XiFHFU1vJjNH8-LzvXvgQCHnqr-j0"),
-"ours": DRIVE_LINK_PLACEHOLDER.format("1aj-QoVoBQBe1K-L_5VVxXPvJpQE1KJNk"),
-"protozoa": DRIVE_LINK_PLACEHOLDER.format("1owg-ZBi04TYof-8nIaCtx0kqCOzk2VjR"),
-"purification": DRIVE_LINK_PLACEHOLDER.format("1pJvMbKEi0hHF3krpnVZh7nfAq0OiUBMn"),
-"polysulfone": DRIVE_LINK_PLACEHOLDER.format("1EPWLSnn9tkwWPvr7MGYlWKcf_nq-TWJt"),
-"pigmentation": DRIVE_LINK_PLACEHOLDER.format("11o1M-2UDpAeMsY8pz35R0wAOJhXGYDaX"),
-"pathogen": DRIVE_LINK_PLACEHOLDER.format("1ADtXjfelFevcP_3_Hs-7m3Zpb25_0T3-"),
-"polypropylene": DRIVE_LINK_PLACEHOLDER.format("1YwNKkIn_bB4zjtBjmchMZjixJTu5pyYN"),
-"polymers": DRIVE_LINK_PLACEHOLDER.format("1Pn6oaZuB0BMQySxVzmcQWYDUAhTirUIX"),
-"polyethersulfone": DRIVE_LINK_PLACEHOLDER.format("1hNgCXCgdFm5erifz1VR4aY4iIi1UG5q-"),
-"phloem": DRIVE_LINK_PLACEHOLDER.format("1XtUZDsL4N5x99G_TpllW73_E_WHILbWB"),
-"protractor": DRIVE_LINK_PLACEHOLDER.format("1ShOALKxnKPJmRRb78lI0QVxQRYSWYWkz"),
-"pyramid": DRIVE_LINK_PLACEHOLDER.format("1FIcVGEGxJNj6Sx0air6u7ZnbcurmUmf4"),
-"picture": DRIVE_LINK_PLACEHOLDER.format("1DCEP5abVIvLDBObSTXZvgTW1nlWlymvA"),
-"pune": DRIVE_LINK_PLACEHOLDER.format("1lhI9jPfJOx3yAd38DkOBb9Bu8FpjqEl-"),
-"property": DRIVE_LINK_PLACEHOLDER.format("1MwVCMK3KmFXEZ9g10FMwvKdiWLTTY-oB"),
-"polity": DRIVE_LINK_PLACEHOLDER.format("1i2uJme0A2FxCTqOBveOiFarjeEvXSHdZ"),
-"press_conference_(academic)": DRIVE_LINK_PLACEHOLDER.format("1tScqLUUFijyxPI4WPRM4ZgmDN0c7Qbdz"),
-"physics": DRIVE_LINK_PLACEHOLDER.format("1kht5rwdK0KV5zHOJvl7LQIZF-6cGYG_1"),
-"pesticide": DRIVE_LINK_PLACEHOLDER.format("1vj7LqNIDAOzKGrqTy2Skh91pGBEpt4Y8"),
-"pulse": DRIVE_LINK_PLACEHOLDER.format("1xKOLV34ZX6lAzkk25I8zJdVKY_KbTM2-"),
-"platelet": DRIVE_LINK_PLACEHOLDER.format("1wo8rPMIAedUcfB_HtXSbfvkFpupGwKu3"),
-"percolation": DRIVE_LINK_PLACEHOLDER.format("15e3H-yk6KWS9UYWKYIGG-bspFNDy_DUx"),
-"parasite": DRIVE_LINK_PLACEHOLDER.format("1XJVsmj4_Pe4k_7iK4Avs-OPQV-R3tRan"),
-"pancreas": DRIVE_LINK_PLACEHOLDER.format("1KqVNfKX_KPPt3JQKmFPaRmciSv0flGGK"),
-"prey": DRIVE_LINK_PLACEHOLDER.format("1l1tVJ1WfAVbs9e6ZXM7UTHlCdXC8mywE"),
-"predator": DRIVE_LINK_PLACEHOLDER.format("1lLUZ_3-Jtf8qXIsZMuRLaJtcj9jgNO39"),
-"predecessor": DRIVE_LINK_PLACEHOLDER.format("1exgY98Fz9dLb_GKJTr51Ikg7I1YYiHyC"),
-"proportion": DRIVE_LINK_PLACEHOLDER.format("1D2RWiOw-dVXwOSLbqEqRlPFikTGcHTnx"),
-"pictograph": DRIVE_LINK_PLACEHOLDER.format("1qwI_cJ6umvVPQM6MRKocySv7CeW1zs2L"),
-"perimeter": DRIVE_LINK_PLACEHOLDER.format("1ye9Ce2qIlZjcOuPC8SfL3iA_LnfiYuYK"),
-"pointer": DRIVE_LINK_PLACEHOLDER.format("1KtkGYWCRqRY8fkzyeuaQMV82kqQmchpd"),
-"prism": DRIVE_LINK_PLACEHOLDER.format("1LTlbX38-Z7G4GpH1JZqiip07ZrKBWQaj"),
-"pentagon": DRIVE_LINK_PLACEHOLDER.format("1T4JNPnDBFcCXTclqWHQxVXaTpMlD__I4"),
-"parallelogram": DRIVE_LINK_PLACEHOLDER.format("1UICRgcnDZDds9Ts4SJDQkhIsDZdo0MQu"),
-"polygon": DRIVE_LINK_PLACEHOLDER.format("1J7wFjLrQ6jdvmnx2_QUDzrnr_goieMtX"),
-"point": DRIVE_LINK_PLACEHOLDER.format("1cXjINCrrvnh9ufYRXpWfgeem0wQpYR_6"),
-"pandyas": DRIVE_LINK_PLACEHOLDER.format("1fBcskILS6dCtLs7tNcCOWVx-4Z4l47ts"),
-"province": DRIVE_LINK_PLACEHOLDER.format("1b416inz6ul-BiB0FDz_h9Fkh31-rMLm0"),
-"panchtantra": DRIVE_LINK_PLACEHOLDER.format("11WHgj2Fif4fkqZrB0UXGBzKOT0kPeFoU"),
-"pilgrim": DRIVE_LINK_PLACEHOLDER.format("1eLbkvWcf4Y5ypuZvCeY9HXcS2_6qLSQ1"),
-"palaeolithic": DRIVE_LINK_PLACEHOLDER.format("16BD9m1gxbDOTDT1irlHwrdqyRnhkRbi1"),
-"prakrit": DRIVE_LINK_PLACEHOLDER.format("1XxKIujSb02voSdRfXHbEDQ0iUW_ruhT4"),
-"protein": DRIVE_LINK_PLACEHOLDER.format("1tn8ylpN2NGvXRic8eJmo_4AzHENqz1pP"),
-"punjab": DRIVE_LINK_PLACEHOLDER.format("1x_5skHzTNG05gHJ2LB6Qp-ojwtIhCQmM"),
-"puducerry": DRIVE_LINK_PLACEHOLDER.format("1f9twLWics7vXt0xNwythBVr05oYA9jav"),
-"puducherry": DRIVE_LINK_PLACEHOLDER.format("1f9twLWics7vXt0xNwythBVr05oYA9jav"),
-"pondicherry": DRIVE_LINK_PLACEHOLDER.format("1f9twLWics7vXt0xNwythBVr05oYA9jav"),
-"patna": DRIVE_LINK_PLACEHOLDER.format("1S0h-rfFnxFcj5pD2T4iBnj2IuwvtXBXH"),
-"panaji": DRIVE_LINK_PLACEHOLDER.format("1rv9BfkJHgaliFCa-UFv-G7HpFM6f-mxr"),
-"premium": DRIVE_LINK_PLACEHOLDER.format("1zJETZQ31K8ufqmI_OQwIXINEH3rkNUsI"),
-"pension": DRIVE_LINK_PLACEHOLDER.format("1phnLDEnRn2N5R033D06mtADrcaAMcYdW"),
-"profit": DRIVE_LINK_PLACEHOLDER.format("1xCsiwbQu8VLVlAMHqTV8c6yH-vZdWPT_"),
-"progress": DRIVE_LINK_PLACEHOLDER.format("1F09fLsM-PKfhxva1Aytw3NuC6yU8sPdC"),
-"pending": DRIVE_LINK_PLACEHOLDER.format("1fI1m8MMpxfWe4-9cFo0OeMcGyGlvczwu"),
-"property": DRIVE_LINK_PLACEHOLDER.format("1j4aBfFayVQkTvW7kLbcEt01CN7e78zsL"),
-"prospectus": DRIVE_LINK_PLACEHOLDER.format("1U-wt0ZC3R9oiKCPxgVj77xkVBagiJSaf"),
-"packing": DRIVE_LINK_PLACEHOLDER.format("1TkvOQVqRVeB5qXN5dQiNlsunkfO8WJll"),
-"processing": DRIVE_LINK_PLACEHOLDER.format("1uMzBrRe_S1REpn1KUo1a7PYe56_ulfjB"),
-"pollination": DRIVE_LINK_PLACEHOLDER.format("1cXd3L8uC9yYoomFk6a4FZMWvjcnuY-gJ"),
-"photosynthesis": DRIVE_LINK_PLACEHOLDER.format("105-ch3QB1RqKc-E9rDk0MAJCaXlt672d"),
-"parasitic": DRIVE_LINK_PLACEHOLDER.format("1u_QdfAHuxFtkBA745hrwi4rUPucqv8L_"),
-"pacing": DRIVE_LINK_PLACEHOLDER.format("1ORo813fXvM_hBjEupwFF9zgaAjNAzCfw"),
-"pupa": DRIVE_LINK_PLACEHOLDER.format("1cr0luMef3HsfdCZO5lSPb9wA2GlcIDU4"),
-"phyllody": DRIVE_LINK_PLACEHOLDER.format("1GdVsuyBQEmYTIRBVmkx6yXTSrTyWQpuc"),
-"pullorum": DRIVE_LINK_PLACEHOLDER.format("13-Ir5EoLFnEkT2PadTb6d9ZX-fRx5ink"),
-"pullet": DRIVE_LINK_PLACEHOLDER.format("1DEnIdVmflFHuvwj40pdQvFwapxkuk30A"),
-"photoperiodism": DRIVE_LINK_PLACEHOLDER.format("1TiKKa2XOIJAuRTW5ttqoP7GRf-1e3lJ8"),
-"pomology": DRIVE_LINK_PLACEHOLDER.format("1DZrMS7kvR3GzXe2w4nyiSVQx80F68Ue2"),
-"phenomenon": DRIVE_LINK_PLACEHOLDER.format("1THC-Q9P22igiWEZbiQjB__B6m0-1fFDl"),
-"periodically": DRIVE_LINK_PLACEHOLDER.format("1q_XUpIjNxOxg-vvBOlhgCkdEOCXl7i2_"),
-"perception": DRIVE_LINK_PLACEHOLDER.format("1B5B8_sjX2Cl5HdJiQW25YokSvxo7WMsZ"),
-"pet": DRIVE_LINK_PLACEHOLDER.format("1AwYPn0XYfgNqqeRTPkntBD4I0fhbub7r"),
-"platform": DRIVE_LINK_PLACEHOLDER.format("1ci30uMiBoa5dOb7OjYJfW-4Zd3Ok_y8E"),
-"propose": DRIVE_LINK_PLACEHOLDER.format("1IHNtLXS2EDlBhN-T1hz-hWYcJV4HJBDk"),
-"punch": DRIVE_LINK_PLACEHOLDER.format("1YQKIOgtvkRwueoJeoZkupAIKkVzvbpb4"),
-"prompt": DRIVE_LINK_PLACEHOLDER.format("14sz5pxkCKC9icfSxx5kHPxSGEQmlj_pY"),
-"pour": DRIVE_LINK_PLACEHOLDER.format("1b_Ew3KFGX5e_xgZ7G8apMVn1oURuZh7E"),
-"pleasant": DRIVE_LINK_PLACEHOLDER.format("1vW8_Tx5kkINVRUPno9e7rGNNBTGTI-dq"),
-"peel": DRIVE_LINK_PLACEHOLDER.format("1IrAAi_G8vYhvjnq7jHAqf6GqTPs5uhuA"),
-"passcode": DRIVE_LINK_PLACEHOLDER.format("1f05MnmkubyIkFvMNaoRnozZgCPryfHFz"),
-"patent": DRIVE_LINK_PLACEHOLDER.format("1Hn0MvBL2-hQjI0qtOIfNjXLpdaH7fLK1"),
-"pedestal": DRIVE_LINK_PLACEHOLDER.format("13FUEd0zX_BvSlizRpZPbrpP82x2PKPfp"),
-"pan": DRIVE_LINK_PLACEHOLDER.format("1HbICL6RKG0rlBDjymWpsShZswMuxObK6"),
-"promotions": DRIVE_LINK_PLACEHOLDER.format("1htANoVmSmUkbGPX6H-IygLYBwHcZ5lh8"),
-"podcasts": DRIVE_LINK_PLACEHOLDER.format("1476KEqrO14AQNiEdt07_EQNiuAXoS4Xw"),
-"pile_up": DRIVE_LINK_PLACEHOLDER.format("16fB1lNcYKm9ld4iCmHLhbPCH6s7RF9ND"),
-"passenger": DRIVE_LINK_PLACEHOLDER.format("1MZ0ANkZex7ofmytLujNGtO2Yb1FjTIck"),
-"passengers": DRIVE_LINK_PLACEHOLDER.format("1MZ0ANkZex7ofmytLujNGtO2Yb1FjTIck"),   
-"pedestrian": DRIVE_LINK_PLACEHOLDER.format("1lTnk1OFNvHTYcv57h7cR6DPIrvspvGlY"),
-"protocol": DRIVE_LINK_PLACEHOLDER.format("1Osg7nKTTlO2iXpkXmEMpfvI5BPKo9Osk"),
-"probability": DRIVE_LINK_PLACEHOLDER.format("1ob4qBtHg34fuWdxRwOSsq38pOzIFY_YS"),
-"philosophy": DRIVE_LINK_PLACEHOLDER.format("1cka6ixKY3fKviekgTQt6l35Gp871nrsd"),
-"paradigm": DRIVE_LINK_PLACEHOLDER.format("1S-o8MObFzJRGS-R74nxK-Cdc6_GsFX_w"),
-"papad": DRIVE_LINK_PLACEHOLDER.format("1nbzMB0w-HSCY8ipWiH9y0Qn-enm8wMyk"),
-"publish": DRIVE_LINK_PLACEHOLDER.format("1V2eCS7VDU5TLnVndxl36GXbKIZ2YBBaf"),
-"properties": DRIVE_LINK_PLACEHOLDER.format("1NnznD5bPmvW4r7m9CAcKDDZUYa_g3ayD"),
-"puncture": DRIVE_LINK_PLACEHOLDER.format("1jDWbjzEvBR_HOoWUBtlvHobAW-kxVoSe"),
-"priority": DRIVE_LINK_PLACEHOLDER.format("1eeV8PdYz5FysxVlf4ZQ7JkPSS1KTg4zh"),
-"payment": DRIVE_LINK_PLACEHOLDER.format("1W5kM8u_-seN302wNzwaYbp89CjWL-Anb"),
-"pupil": DRIVE_LINK_PLACEHOLDER.format("1UP4079wtlGuXZPUsg2hL_4qgn3WuvOhd"),
-"publisher": DRIVE_LINK_PLACEHOLDER.format("1cgQUAXaIpJAV4vlzZu6b1ApGfEAHdHif"),
-"prokaryotes": DRIVE_LINK_PLACEHOLDER.format("148z4hoJws4jOoEr7vTxQBnLxKSJ1fEPy"),
-"prism": DRIVE_LINK_PLACEHOLDER.format("1qC4lsldb6vRb5dW5OPc3s9yKePM-9exO"),
-"potassium": DRIVE_LINK_PLACEHOLDER.format("1ZTe6_Zevdz_aTl-8Jb63OUUAm0kOKTG2"),
-"plastids": DRIVE_LINK_PLACEHOLDER.format("1uQkZqJIexz5jVkTaZWwRQQK76ZK2Aemz"),
-"phrase": DRIVE_LINK_PLACEHOLDER.format("1PtgjZH9IJErCtjG6J-gu27IlWkBZM-GH"),
-"phosphorus": DRIVE_LINK_PLACEHOLDER.format("128-I_cT4DnVCMptockSNNg0YTsFy6IhK"),
-"passage": DRIVE_LINK_PLACEHOLDER.format("1KWlClwh-YI-uZz1OJ-nxp0jTAfFn14SB"),
-"paramecium": DRIVE_LINK_PLACEHOLDER.format("1JY5ZewMh4bdPWQ_e7Bf2WJ3NvY0PvrPs"),
-"pumpjack": DRIVE_LINK_PLACEHOLDER.format("1pxVhum_sm2fu5yMHnbWi3kwnw9mogFGX"),
-"procession": DRIVE_LINK_PLACEHOLDER.format("1mf0ynS-T_3-ofFLdAmqKulPtJl1eyvdC"),
-"purlin": DRIVE_LINK_PLACEHOLDER.format("1TFr2j1bfHxcsxnfplPYqGPhreeBaAea8"),
-"podium": DRIVE_LINK_PLACEHOLDER.format("17LDC6kI_XJ3cL2jCkwMcJzHFnIPkoufI"),
-"potable": DRIVE_LINK_PLACEHOLDER.format("1FC3deWCJncx6qx9IFr5gv03ntaeMxPUN"),
-"puree": DRIVE_LINK_PLACEHOLDER.format("1peXY_oMQ-rZjUL3vNhxGFdiZ6iNrfuIT"),
-"pinch": DRIVE_LINK_PLACEHOLDER.format("1S48OvH90JVSGg6uvnfOMFFpUSVtXRIZS"),
-"perjury": DRIVE_LINK_PLACEHOLDER.format("13okxEBHiGjFYjPaQH_ht0dYD45db-WsY"),
-"promissory_note": DRIVE_LINK_PLACEHOLDER.format("1w8v5ttMs7lcRLS9pbOwxubbhETjgsBIL"),
-"pillory": DRIVE_LINK_PLACEHOLDER.format("1eWQVwf8pLcweCS6192MWrylpCCw7fH_G"),
-"picket": DRIVE_LINK_PLACEHOLDER.format("1ZJGhjr70b5YtMGQgsuSaHPF3Zu_bEacB"),
-"pragmatics": DRIVE_LINK_PLACEHOLDER.format("1rJ7BdnyQvVu7o1C2rjOohvZ3hwPXzFfq"),
-"polysemy": DRIVE_LINK_PLACEHOLDER.format("1N-_tWd0vYKakYEk3jJnp9AS5VFrVew4z"),
-"phoenicians": DRIVE_LINK_PLACEHOLDER.format("1X3ro1Ohj7O_x_il7GPlYAeli9XKLY7F5"),
-"prototype": DRIVE_LINK_PLACEHOLDER.format("1oeZowgz1CwTbXYS1QQ9Y9gFeMMbFMpzE"),
-"pioneer": DRIVE_LINK_PLACEHOLDER.format("1OZxbFAx1RHT0OTzyKn9seJOCOuvrEE6n"),
-"piglet": DRIVE_LINK_PLACEHOLDER.format("1rd-HwZsZ6jSmsNlS3lMk8neSGxbxBEjK"),
-"parricide": DRIVE_LINK_PLACEHOLDER.format("1oqB7D4h98WhuTpdYNAmj0KdhRJf-o0WE"),
-"parliamentarian": DRIVE_LINK_PLACEHOLDER.format("183wAPZh_Z590vuvUliAefBvyxxsdOmd5"),
-"polo": DRIVE_LINK_PLACEHOLDER.format("1rlnz9DiC_XdcP8TGNjRQjDeIC4b3Foss"),
-"parachute": DRIVE_LINK_PLACEHOLDER.format("1LsGjuBzNGDUu8gmZV2IbJCloq9WmcQqz"),
-"pakora": DRIVE_LINK_PLACEHOLDER.format("1icy4cnHtOI3DrL1mi7lnb02pamhfePVn"),
-"punishment": DRIVE_LINK_PLACEHOLDER.format("1pSHPLKMg5n5puk_VhtGy_RRR3gQClmVI"),
-"pickpocket": DRIVE_LINK_PLACEHOLDER.format("1sbqTBwMxuIT7pJxGcXRQmr8mD4GuK2yk"),
-"precipitation": DRIVE_LINK_PLACEHOLDER.format("12d117qsHxFR2LDTwuTxdDvvHXDv1VTUm"),
-"poisonous": DRIVE_LINK_PLACEHOLDER.format("1hbgt-SFCJ3RN2pnoOa2iyt8yCAOruc5A"),
-"venom": DRIVE_LINK_PLACEHOLDER.format("1hbgt-SFCJ3RN2pnoOa2iyt8yCAOruc5A"),
-"pee": DRIVE_LINK_PLACEHOLDER.format("1fi_DPygWsoJnVrbKlvnAjlLqehsYhSbY"),
-"urine": DRIVE_LINK_PLACEHOLDER.format("1fi_DPygWsoJnVrbKlvnAjlLqehsYhSbY"),
-"passbook": DRIVE_LINK_PLACEHOLDER.format("1178tavY00dWngaMCFznEhldzmjdSF5dx"),
-"parade": DRIVE_LINK_PLACEHOLDER.format("1Wf2ydElocYqeV3nPXuCM39PGC2z6ZOhs"),
-"pads": DRIVE_LINK_PLACEHOLDER.format("1A9TAteL3Kscpi0uTf8f6S5NfCJp2b6HG"),
-"panipat": DRIVE_LINK_PLACEHOLDER.format("1aj-hNOGPYWqofa0oVOW-YPfhouWwsUxj"),
-"philanthropy": DRIVE_LINK_PLACEHOLDER.format("1x1nhds4qCmqs_BqK1g8u-OjfT9T-4adD"),
-"philanthrophist": DRIVE_LINK_PLACEHOLDER.format("1x1nhds4qCmqs_BqK1g8u-OjfT9T-4adD"),
-"pilgrim": DRIVE_LINK_PLACEHOLDER.format("1oSYlQ4oEwedCY_ak1sMoGwtpMjX3haic"),
-"pending": DRIVE_LINK_PLACEHOLDER.format("1l6Xg2r-3vrbz9meQMpIVBOhRqycGlJIt"),
-"passport": DRIVE_LINK_PLACEHOLDER.format("1OIgn0P45Sa-pz0ZAweA0uZl60Z8CMa_v"),
-"prostitute": DRIVE_LINK_PLACEHOLDER.format("1YUoW-fn3LU-8O1JvyGYBBYMd2riawrsj"),
-"prostitution": DRIVE_LINK_PLACEHOLDER.format("1YUoW-fn3LU-8O1JvyGYBBYMd2riawrsj"),
-"partition": DRIVE_LINK_PLACEHOLDER.format("1Wk2Wtp97n0lg88FzJUaFqhuBiXo3r-i2"),
-"parasite": DRIVE_LINK_PLACEHOLDER.format("12eqQjJXa50LalHVpp5lugwW10P9f8v2S"),
-"permit": DRIVE_LINK_PLACEHOLDER.format("1xkVYDz3-nuUHl-qhI3x2iUyY0LuXKhmR"),
-"permission": DRIVE_LINK_PLACEHOLDER.format("1L0B-T5uz40beRMY-gTn4dq698khJKDGh"),
-"pi": DRIVE_LINK_PLACEHOLDER.format("1ELFuEY0ocQTfZZTU-OSXmCP021ESCk9s"),
-"president": DRIVE_LINK_PLACEHOLDER.format("1b0qum59hm6QtwjibepcTJNKSTEoSVuN0"),
-"parents": DRIVE_LINK_PLACEHOLDER.format("1QNHtUqNkR-t06OaI4o3hqnYOTurXivor"),
-"paper": DRIVE_LINK_PLACEHOLDER.format("1W5B6Hj0DHLCT4NhaCLPLNvUuHoFHS5Bo"),
-"polygraph": DRIVE_LINK_PLACEHOLDER.format("1FGIXXBfhhnCdmVcm96sH4InfUysILMse"),
-"plea": DRIVE_LINK_PLACEHOLDER.format("1wtUAXhB6BNvs8n2l3zV4xLubi-ex2w4M"),
-"bargain": DRIVE_LINK_PLACEHOLDER.format("1wtUAXhB6BNvs8n2l3zV4xLubi-ex2w4M"),
-"plagiarism": DRIVE_LINK_PLACEHOLDER.format("1XhrFWBRd9nfdNh3qUygwh41pypvhL9R-"),
-"piracy": DRIVE_LINK_PLACEHOLDER.format("1Mm4ZMcfTOq0PH_EmTDko6urEDyx6YvnX"),
-"penology": DRIVE_LINK_PLACEHOLDER.format("1iPTNstrRLhwB4dq78iDdL_HDdHZeP27T"),
-"peddling": DRIVE_LINK_PLACEHOLDER.format("1wb7bDnMVPU-lhDut1K3Pnozoh-4jIPW9"),
-"peddler": DRIVE_LINK_PLACEHOLDER.format("1wb7bDnMVPU-lhDut1K3Pnozoh-4jIPW9"),
-"peculation": DRIVE_LINK_PLACEHOLDER.format("1yp_bEporYOOjHpSiTK1GYOvitKNh9Qki"),
-"phishing": DRIVE_LINK_PLACEHOLDER.format("19rvJDxp7bXZctniBBLmOVudobSsFxan_"),
-"polity": DRIVE_LINK_PLACEHOLDER.format("1DrGdADFJ3ReZVpzbfg9QTC8xfQjvLhP-"),
-"phonology": DRIVE_LINK_PLACEHOLDER.format("1hngV4_l2NSRYLEF2jmmZpbS5bArux_sb"),
-"phototropism": DRIVE_LINK_PLACEHOLDER.format("1Mi2W5rhiCSQUITARmT92idyZvokWwaKX"),
-"paralysis": DRIVE_LINK_PLACEHOLDER.format("1KLuZH9-AYHbp82ydxdjzLxvhmtHH3gyV"),
-"pygmies": DRIVE_LINK_PLACEHOLDER.format("1XHxKhRaDfDGqnTmXoSORpJJHHUQ_Ijyu"),
-"proteins": DRIVE_LINK_PLACEHOLDER.format("1AU5DU22PeG-be-_iDTiiQfEE7jQ-4Rav"),
-"platelets": DRIVE_LINK_PLACEHOLDER.format("1Sx-82jXRXmqpatCYGNjLrQK9mRaMQbiI"),
-"polarization": DRIVE_LINK_PLACEHOLDER.format("1XErzWoj6OTHoz-rHAFNvX8WxsSpRb_pZ"),
-"pisciculture": DRIVE_LINK_PLACEHOLDER.format("17xSGwhEOGfEogLzInc2SUSslhaD23vpo"),
-"phonetics": DRIVE_LINK_PLACEHOLDER.format("1JqexNeiirf8hQJBoIPqgsnLEFpVC-OJf"),
-"pharaoh": DRIVE_LINK_PLACEHOLDER.format("1MvRZ3xAqAJoiwIUk3DS-y9kNplJ3rSCK"),
-"professor": DRIVE_LINK_PLACEHOLDER.format("1ISxDoXrfPTJW-aKOjy59OqrQs37XPkBT"),
-"petroleum": DRIVE_LINK_PLACEHOLDER.format("1ais5giwztYT8Y_BJ93i52aNaL7_sY5sc"),
-"policeman": DRIVE_LINK_PLACEHOLDER.format("1mwtmRZzQ3aFVXvT3327FipDkhhuQ1qAG"),
-"pilot": DRIVE_LINK_PLACEHOLDER.format("1HyXSHfqTonUPf98BRxI6GQBtyOCR23g4"),
-"pharmacist": DRIVE_LINK_PLACEHOLDER.format("1JU8YlWQwgOcaRcuBVt_s_7-53YtVG3eA"),
-"peninsula": DRIVE_LINK_PLACEHOLDER.format("1JRSFB76tHjtKB-N1IvLKjumBf7nDluMI"),
-"payroll": DRIVE_LINK_PLACEHOLDER.format("1M8xVrxLghKVU1fl_KZJSnuBh5wJTjr4y"),
-"patwari": DRIVE_LINK_PLACEHOLDER.format("1wLiJVOzDT57Uf2wfle8DTs2OjExXNSUw"),
-"pasteurization": DRIVE_LINK_PLACEHOLDER.format("1wRRpd3Cp6YdmU3_yzzYpSHg5eC8fMKeE"),
-"personality": DRIVE_LINK_PLACEHOLDER.format("1VO-x5R4iFchUy7EvThVSfMGka9U8nXNb"),
-"part": DRIVE_LINK_PLACEHOLDER.format("195oMizcicGwZMv51xxAt5fLJP54pSFuE"),
-"pink": DRIVE_LINK_PLACEHOLDER.format("1Q-uk4G3NA3GUjsBh18Lw11fXhTVhZnJY"),
-"puppet": DRIVE_LINK_PLACEHOLDER.format("1CE0WfQsRZJXJR1lKSmbQYG6gDwoqO6fZ"),
-"pin": DRIVE_LINK_PLACEHOLDER.format("1momJx7__bIFXmx_15i0I3mMmap_ulj_W"),
-"programme": DRIVE_LINK_PLACEHOLDER.format("17nvHLrIZN2NMk9lXKIsj1EKH0rBrJS6b"),
-"purulent": DRIVE_LINK_PLACEHOLDER.format("1FF8T8aCT0wvsVI05aRAhJwwxM9k-3i0U"),
-"puberty": DRIVE_LINK_PLACEHOLDER.format("1rSmoywBKNAcPPoilVvX2WOHhL3bLErvq"),
-"psychiatry": DRIVE_LINK_PLACEHOLDER.format("1N3uPLWl5T5VpPPP69T7xRJ9c-Y_as-d5"),
-"psychiatrist": DRIVE_LINK_PLACEHOLDER.format("1HBbhmkesIxoW9KZy026zl-Rk6lw4H1v6"),
-"proteinuria": DRIVE_LINK_PLACEHOLDER.format("1pjlzpBKQWcMD7jdRFqMPKTOpBe2pHBRk"),
-"prosthetists": DRIVE_LINK_PLACEHOLDER.format("1hKt3HNkJMaLympB5Wr9u07epovhC24jm"),
-"prostaglandins": DRIVE_LINK_PLACEHOLDER.format("1C84oIAfcmhggRIerplLRBj3DlxJa_Kxu"),
-"prolactin": DRIVE_LINK_PLACEHOLDER.format("1GROWMtSjcbgpZjw6vaLbQ5g7Szh_0tNM"),
-"physiotherapists": DRIVE_LINK_PLACEHOLDER.format("1dPWMeTakNNn3LKvR7r29lfuobmYS8_W-"),
-"phlebotomy": DRIVE_LINK_PLACEHOLDER.format("1ors9y5Z9hjiRdTCqkTMbVUhpJaDwi1Uf"),
-"phlebotomist": DRIVE_LINK_PLACEHOLDER.format("1PuTCyDGKHy428DFECsutS-rC0_uX3RiE"),
-"pediatrics": DRIVE_LINK_PLACEHOLDER.format("1JaUYYCcVcKzD_DDjWlNVfLZyRJG8Xatk"),
-"pediatrician": DRIVE_LINK_PLACEHOLDER.format("15Yn5J2n1yDo8liGzWzuZ2MszlOPsuglA"),
-"pathologists": DRIVE_LINK_PLACEHOLDER.format("1GbkgnGU9EKrY4g5yojYEhPmJuvHIt1u7"),
-"paramedics": DRIVE_LINK_PLACEHOLDER.format("1KO5T_ikhT5MMQI7TbET9_9eojRfLjmZQ"),
-"palpitation": DRIVE_LINK_PLACEHOLDER.format("1mG8uTBRIiSZtIg7JCzQFOhfvXHMkgMUE"),
-"palliation": DRIVE_LINK_PLACEHOLDER.format("1kggY4rlplT_u4aD2yDysyyn3hVpdpQHM"),
-"pacemaker": DRIVE_LINK_PLACEHOLDER.format("15vTMlBkIQH4YIVKsMU0xE8hlX2yePWOY"),
-"put": DRIVE_LINK_PLACEHOLDER.format("1Xgov6xb6VQIju144OEG3jHhulZFgm6eL"),
-"pure": DRIVE_LINK_PLACEHOLDER.format("1IUeHi6ysUsjFFJOCzQJ_1Nz_4ugfbhJp"),
-"punish": DRIVE_LINK_PLACEHOLDER.format("1v6d8mSqlLNtSj0MS12qzn6Z0CNxnqBbe"),
-"protect": DRIVE_LINK_PLACEHOLDER.format("1YSB2xDUwkjBDKHv7I1_oi5hNzPl2q2iS"),
-"program": DRIVE_LINK_PLACEHOLDER.format("1x4T4XIr-Wm4vKK16rYmzBM8wa17hlFkv"),
-"process": DRIVE_LINK_PLACEHOLDER.format("1VYu_vT5OoKIe9RknmpzTVQpY66ODmSsN"),
-"problem": DRIVE_LINK_PLACEHOLDER.format("1jcks_CRzo_7AjfA1q9gmwcq3ylwPcDM7"),
-"private": DRIVE_LINK_PLACEHOLDER.format("1XGGCI8-v8qpBznk_w41HQriPKXtAqwtH"),
-"print": DRIVE_LINK_PLACEHOLDER.format("1lc1MqjHgZgEpbU8hb0jSV4Efb1C6ffZx"),
-"pray": DRIVE_LINK_PLACEHOLDER.format("1WVGPUAI95GzL-vSAlKNSTD4xBBYHElg2"),
-"praise": DRIVE_LINK_PLACEHOLDER.format("1VPoXmDG724h2n6zl4vm-lAecz4tvwltI"),
-"power": DRIVE_LINK_PLACEHOLDER.format("1855NLAr_zbRwvEiGGxuC9lgrj4F3wFa5"),
-"post": DRIVE_LINK_PLACEHOLDER.format("1Tw0DrrM_ylftGgJiQevx95f7MXZXSPbX"),
-"possible": DRIVE_LINK_PLACEHOLDER.format("1GufU5o_aZcMEFgzcCRX5cknSwN5mjazG"),
-"positive": DRIVE_LINK_PLACEHOLDER.format("1v0mPpouFdfvjCi2sLrrZhy3gqClGKp6n"),
-"poor": DRIVE_LINK_PLACEHOLDER.format("1-RObBCzEmpmdTRhuiJrv1shFJQCYfcEU"),
-"politics": DRIVE_LINK_PLACEHOLDER.format("1aV1CMn7qCyDGEs2LpziNGAp7U9Jdl8_U"),
-"please": DRIVE_LINK_PLACEHOLDER.format("12PBqhCNHBw2uG8UArKmyoMeNFGjor3mH"),
-"play": DRIVE_LINK_PLACEHOLDER.format("19gGJAIiecPE9sb53JZEBg09I2Oh9zR7x"),
-"plan": DRIVE_LINK_PLACEHOLDER.format("1PlIn2Vbq08Ph68clq_IiUSdzwNWxFphx"),
-"place": DRIVE_LINK_PLACEHOLDER.format("1M45CyH3Ha7rcyLpaJAheQ4HXYEaroLy1"),
-"pick": DRIVE_LINK_PLACEHOLDER.format("1gKxG4XrbB4GJUT-yzCSROV5SdBAxaL9x"),
-"personal": DRIVE_LINK_PLACEHOLDER.format("1KA-QkdQmJR8AFOQ7BXUZIDuW7chDf8Dl"),
-"permanent": DRIVE_LINK_PLACEHOLDER.format("1YWJ5wkJAw_dzVX_krDMcvklacKFxjvkA"),
-"perfect": DRIVE_LINK_PLACEHOLDER.format("1nhn3IIDJnQWgeYOo1NQXEm9EcHbwqVRL"),
-"pay": DRIVE_LINK_PLACEHOLDER.format("1lW-fZkDrJGyCl6eziUAhP6UaPFqVq3Cg"),
-"patience": DRIVE_LINK_PLACEHOLDER.format("1xXHQsBXlg6FCyyKU880SDcyw25o708-e"),
-"past": DRIVE_LINK_PLACEHOLDER.format("17xW19jiEEhhzmtnaIlmSljJsYMhV9Rpp"),
-"pass": DRIVE_LINK_PLACEHOLDER.format("1CJCOSJnfODRNDgXAYvVzFnMoqrjo0zGY"),
-"party": DRIVE_LINK_PLACEHOLDER.format("1hGejaKpLSLz0iGcfFecr2ZZhYniJqauw"),
-"prevent": DRIVE_LINK_PLACEHOLDER.format("1bXsOBp0MFAaagDxoN-iCcJYxaHgBorCw"),
-"paragraph": DRIVE_LINK_PLACEHOLDER.format("1Jfadj7ESuEBDom_Ia4f-hbFZysMQk6iV"),
-"parasitism": DRIVE_LINK_PLACEHOLDER.format("1Ywzt7SJXaXK9u2JJ7D-fL5PJff51qjYH"),
-"polisher": DRIVE_LINK_PLACEHOLDER.format("18bKAQGOFTGaS6k9vuaOk98yVR_O3ykrw"),
-"psychology": DRIVE_LINK_PLACEHOLDER.format("1SqZFDe5y5IuFKUG1jFnaFZgmKcI0uXKC"),
-"prepare": DRIVE_LINK_PLACEHOLDER.format("1CSNetoLWJwJxlLo2tj9LXASty0G8-0lV"),
-"parcel": DRIVE_LINK_PLACEHOLDER.format("1VgTgUyzdIe1mPrZ6le6yrPvrQAxwL6RV"),
-"pastry": DRIVE_LINK_PLACEHOLDER.format("11bnUsusj4e6H7x4F9XbNOH6KlFA41Wkm"),
-"pus": DRIVE_LINK_PLACEHOLDER.format("17LQZsuQj2T5LkkJzsM6cObL_3zZyr9IH"),
-"pulse": DRIVE_LINK_PLACEHOLDER.format("1k6i4ewddtqeldQNlHlpioRbHaIMUlUFm"),
-"prostate": DRIVE_LINK_PLACEHOLDER.format("1Ubr2t2L27RdiMmzoUmUTFPOn9pRAK9RS"),
-"privy": DRIVE_LINK_PLACEHOLDER.format("1CUFCy8mP-0K0XMwYEp1r8YrUhAC1Ovv-"),
-"preterm": DRIVE_LINK_PLACEHOLDER.format("1w7nO12ypbOlVDcgJHGcWJwCwPVrrE9yj"),
-"presbyopia": DRIVE_LINK_PLACEHOLDER.format("17cwxf0Mlrn2b3BbXSA0PPMNykk_Yy003"),
-"pregnancy": DRIVE_LINK_PLACEHOLDER.format("1DW42-X27F_TZJO9rUURarnsVW7bcJVX5"),
-"pox": DRIVE_LINK_PLACEHOLDER.format("154Yo7sOH4XLvoyOY3vS4ku-wmiQa8ofk"),
-"polyuria": DRIVE_LINK_PLACEHOLDER.format("1imsHWqB22wOfv6T1B4YkPNuwCBOtCsb6"),
-"pneumonia": DRIVE_LINK_PLACEHOLDER.format("1n1Liiso9NwYDjj1MdvpMV_FfwTvfQ8FR"),
-"platelet": DRIVE_LINK_PLACEHOLDER.format("1svd5I_I9Blf17kVJozu0rdO5qxEBU9Qg"),
-"pinna": DRIVE_LINK_PLACEHOLDER.format("19sKDl5A87nckdM6Zb3f3DytqxsaM_pP8"),
-"pimple": DRIVE_LINK_PLACEHOLDER.format("1Is_HWVA4WQF-R1AY4KgXgCpUrbVuf2FC"),
-"phobia": DRIVE_LINK_PLACEHOLDER.format("1JI6ed287b6x5j11qFFjTkfVLVNkJ82nP"),
-"phlegm": DRIVE_LINK_PLACEHOLDER.format("1L-RcvXxzWSIDAZ0tgJ4AdpcWsY09tuff"),
-"pharyngitis": DRIVE_LINK_PLACEHOLDER.format("1dC6yuM54Vm7fycBnqWIxSR9UrxoAK8QO"),
-"pharmacology": DRIVE_LINK_PLACEHOLDER.format("1LM1PxFoA0DOy1crEUSFr_mH-Bzm8GCJR"),
-"pharmacologist": DRIVE_LINK_PLACEHOLDER.format("1NFEIYpwtAfNGPKjfDy2O1uIKiZiHx1bg"),
-"petechiae": DRIVE_LINK_PLACEHOLDER.format("1d_S9dNOiAP0t-krV3HJD_CpxWH7TZQ2J"),
-"perspiration": DRIVE_LINK_PLACEHOLDER.format("1jLBAcX45BOJbfxDpONRtHnoQsMFakpjt"),
-"patella": DRIVE_LINK_PLACEHOLDER.format("1S4CaUhzu_qqpBw97cl7mYz1Arzaad3cH"),
-"plumbing": DRIVE_LINK_PLACEHOLDER.format("1Za16quZUyUuqXewZupVtUXHM2QV3MaWL"),
-"plastering": DRIVE_LINK_PLACEHOLDER.format("1hRe1qLV7eRhPbQDInrnawjiNfWj96xXo"),
-"pillar": DRIVE_LINK_PLACEHOLDER.format("1k24bD1ljT4EON_l0rvw4d1k9K99AqNOY"),
-"parapet": DRIVE_LINK_PLACEHOLDER.format("1bn7Nms8YP82Noja78cCjNRO3X3yFQCez"),
-"portugal": DRIVE_LINK_PLACEHOLDER.format("1RocnZgGS59ZgoNHzrTZNZaRb5-Q4HeGJ"),
-"poland": DRIVE_LINK_PLACEHOLDER.format("1JDf1kNdhShASFWArF6mRmLo3hNI2U6xy"),
-"philippines": DRIVE_LINK_PLACEHOLDER.format("1_DX_k_Am205pfVZxjfXkglbIxxTn41JU"),
-"peru": DRIVE_LINK_PLACEHOLDER.format("1fxDM7tMG9eIKHeB53xzpDu3H-W7gu9wj"),
-"paraguay": DRIVE_LINK_PLACEHOLDER.format("1EMvPUiP_GYzESN2cfCtR2-TqyJbPqv8m"),
-"panama": DRIVE_LINK_PLACEHOLDER.format("1x0VFEO3NiGjth43KSbBvUun-MGBnnD1n"),
-"pakistan": DRIVE_LINK_PLACEHOLDER.format("1GALZPbl0MUMcdBC_rQA-sXXclR89ZD5l"),
-"pickle": DRIVE_LINK_PLACEHOLDER.format("1AWkqw-VxxIycvfYJqwYSIfkYjg_QWPQy"),
-"paytm": DRIVE_LINK_PLACEHOLDER.format("1W9SpxaeDSWImUKRx0FJ042mHumQ4HAqj"),
-"pista": DRIVE_LINK_PLACEHOLDER.format("1wLzG8AnvSIylFeNCm74yDiRV877xOwTJ"),
-"paan": DRIVE_LINK_PLACEHOLDER.format("1DQAVY0DkLnKn3Brj-Le_pwf1Lc73p1Wk"),
-"punjabi": DRIVE_LINK_PLACEHOLDER.format("1ndlC1BMauzi-nhDuXHqMPfThAollyLTT"),
-"port": DRIVE_LINK_PLACEHOLDER.format("1zEByp2a7mRLu630ccaAJgxt7vKvHPvVa"),
-"parole": DRIVE_LINK_PLACEHOLDER.format("19RliwELjXzboAQiflwERjWzh7I_olJlR"),
-"poaching": DRIVE_LINK_PLACEHOLDER.format("1a7mhERByoCwzBQgZCs2egJ-gNmCdWs61"),
-"powerlines": DRIVE_LINK_PLACEHOLDER.format("1keA8T8LPcxMGY41tTuZL4oJ-rdZbJ3xf"),
-"polarity": DRIVE_LINK_PLACEHOLDER.format("1PbiTklnAcO6hF6cOs9nN4kOKU8AWfCSF"),
-"psychoanalysis": DRIVE_LINK_PLACEHOLDER.format("1nvyCK5gKIX8wpQ-onhzyE6ljQeqryPdy"),
-"patriarchal": DRIVE_LINK_PLACEHOLDER.format("1Bm22asuWK7A77XDJhDY_wUNkuRB1edmJ"),
-"petty": DRIVE_LINK_PLACEHOLDER.format("1C-osVWrxL2_ce8z8bG4HVTtCtHCHzLjA"),
-"offense": DRIVE_LINK_PLACEHOLDER.format("1C-osVWrxL2_ce8z8bG4HVTtCtHCHzLjA"),
-"plunger": DRIVE_LINK_PLACEHOLDER.format("10OYxe5hptGK8KsBhZkE9n0uT2OrblTU6"),
-"popcorn": DRIVE_LINK_PLACEHOLDER.format("1r6V0SZrc2jCKSASwC3ajGgxpoJ3tZHmD"),
-"projector": DRIVE_LINK_PLACEHOLDER.format("1EQGbq4T3EUvzTgP-SbsCzu3oEx2cKmn6"),
-"printer": DRIVE_LINK_PLACEHOLDER.format("1NmIaTvrk_1E4n752P9TGIH0dqQUQe_sJ"),
-"pen_drive": DRIVE_LINK_PLACEHOLDER.format("1lwMcWTCOrlgCIwhUqUera6ssoJDEpzj9"),
-"piping": DRIVE_LINK_PLACEHOLDER.format("15Y1qy1vtztmJfN9xY1BEzYCS7GxjC5gP"),
-"plate": DRIVE_LINK_PLACEHOLDER.format("1iSLk5sD93IVkeO6kVn0v_NUNg5gjSnm6"),
-"pencil": DRIVE_LINK_PLACEHOLDER.format("1SILRXW7CKczEWNL36JnJhsK4Rhk3KFjY"),
-"pen": DRIVE_LINK_PLACEHOLDER.format("15hwVvtdf9uYbTlUeCypgcV-6cVP9UMuh"),
-"pumpkin": DRIVE_LINK_PLACEHOLDER.format("1hg_17Jj-ZUaOuZnHF9zSmuv0YK8mikFf"),
-"potato": DRIVE_LINK_PLACEHOLDER.format("1bBNEW-eMkfLrPjEP5hvo94hnsIqFdyS0"),
-"pomegranate": DRIVE_LINK_PLACEHOLDER.format("1-LFTPKWUp1vb9ZQgqV-wRe0M4q1VEX-I"),
-"plum": DRIVE_LINK_PLACEHOLDER.format("1Iw0iG0ER7IzCqES-AFxDkjjlGnLHoovS"),
-"pineapple": DRIVE_LINK_PLACEHOLDER.format("1f3jJnT6hu-FZvP2CpfaAw9f1Pk5VXsyy"),
-"peas": DRIVE_LINK_PLACEHOLDER.format("1Lb8ibef5soWOKFD1Bs5_CevXe2jSoYqO"),
-"pear": DRIVE_LINK_PLACEHOLDER.format("1xmaXwut_YWM17AWq2HKWqf5fhSNFs0cS"),
-"papaya": DRIVE_LINK_PLACEHOLDER.format("1hdDuQZaGL-FtwZwefcZ70hngojCedcA9"),
-"parentheses": DRIVE_LINK_PLACEHOLDER.format("1vCr3AH08pTeS_L5lMP1k16m-2VMkGzeM"),
-"parameter": DRIVE_LINK_PLACEHOLDER.format("1IkpnDdDfjTsPJfMRGqdSR3gCpQM5kYqj"),
-"prohibited": DRIVE_LINK_PLACEHOLDER.format("16kGIo-eGDxrK4fawGeEp39U7AsQN82Og"),
-"pond": DRIVE_LINK_PLACEHOLDER.format("1WS8rDV2-JYNCWCwPglCgSA4X1DfZXzxa"),
-"planet": DRIVE_LINK_PLACEHOLDER.format("1l4gK6bDendB0KZL3LijmA6e6EZ5R_ehe"),
-"python": DRIVE_LINK_PLACEHOLDER.format("1R4tVS_qXeiggHvTL8krCr-bPPa1ZrNwN"),
-"peacock": DRIVE_LINK_PLACEHOLDER.format("1rFsA2FFFkFU4RPN_jN57VEUApMAIjb-0"),
-"parrot": DRIVE_LINK_PLACEHOLDER.format("1g6OKvZeLxmIU5rs5KzMXTQWoz6FWJdUH"),
-"penguin": DRIVE_LINK_PLACEHOLDER.format("1fibeBvINhkkEv1aQHhYqBBAzYCc92F01"),
-"policy": DRIVE_LINK_PLACEHOLDER.format("1I52GxkJQO7mHV2yo3Fx8wzS4OYqd_JW4"),
-"pram": DRIVE_LINK_PLACEHOLDER.format("1XBk1dF5rCoERmqbvzjBerndQO8JL8VQt"),
-"pizza": DRIVE_LINK_PLACEHOLDER.format("1f65erYhqUy5eOYUt9fmOSCaEsHOigntQ"),
-"piano": DRIVE_LINK_PLACEHOLDER.format("1lmlp3GEWzKeboEKLcB53QEZltgj8g1I6"),
-"profession": DRIVE_LINK_PLACEHOLDER.format("1ONddbQApsPKoqXekmiEK6BrIQsZ_CjHC"),
-"percentage": DRIVE_LINK_PLACEHOLDER.format("1AVE_TMkmrGlLtCDr9ftY7F53Opo8ddhx"),
-"peon": DRIVE_LINK_PLACEHOLDER.format("1S2psVRWoGax-NusCMXRX1b1VgLrF2odQ"),
-"pause": DRIVE_LINK_PLACEHOLDER.format("1gSocI2kQ_i7JhlNmUT9Kge88B1XCDhzy"),
-"paramedic": DRIVE_LINK_PLACEHOLDER.format("1SCq591DPPIJdL9Pg24nLC-ERM9I6kH77"),
-"promise": DRIVE_LINK_PLACEHOLDER.format("1Ma80OZKU3o7G8qYTkOR0Jo6pZ2_1B7uL"),
-"plaster": DRIVE_LINK_PLACEHOLDER.format("1KoLiCFZJRnXvs9CyrUtvJKP1vN6enBmP"),
-"physiology": DRIVE_LINK_PLACEHOLDER.format("1KlpclC4yKxBVdQm5kWTHRvw4QkP8jyea"),
-"pharmacy": DRIVE_LINK_PLACEHOLDER.format("1UDSDCabWWAq3lJgj-m1J-btp-xpfnBxR"),
-"piece": DRIVE_LINK_PLACEHOLDER.format("1MV8wV7hpqfqE_9BCEDjxOV3159D5i314"),
-"phone": DRIVE_LINK_PLACEHOLDER.format("1Tv7TIKGdo17wDb-Tqjo9smsmC2XIcY08"),
-"period": DRIVE_LINK_PLACEHOLDER.format("1Ci5A2Q3cc56g5urh0ERe0yCBhWolR9k_"),
-"perform": DRIVE_LINK_PLACEHOLDER.format("1L4fR7aqh2F-FSZdpx5R5l88gL66WHjyE"),
-"people": DRIVE_LINK_PLACEHOLDER.format("1mnz0C-xZxLSza2y3CX3ToXuD_SkgNJIm"),
-"peanut": DRIVE_LINK_PLACEHOLDER.format("1GKSRRNQXpTJhGRktDJnzaB5zSH1AGxfS"),
-"patriotic": DRIVE_LINK_PLACEHOLDER.format("1XYM1t82TXqiAnRb3VL90L7sV7510BC5p"),
-"paste": DRIVE_LINK_PLACEHOLDER.format("1ieJWGrAZHd-VvNUY6CS65QndfMuzdTq1"),
-"passion": DRIVE_LINK_PLACEHOLDER.format("1L4wCLOJK91Ocs6QFV7DtILANRfyxEf4o"),
-"parking": DRIVE_LINK_PLACEHOLDER.format("1h2iCjYSO15XJeV1_ATWWaMRjAeZhVov_"),
-"panic": DRIVE_LINK_PLACEHOLDER.format("1qsHMWBKKnRnKKWQ97SQjjeYfGUTSJhhn"),
-"pamphlet": DRIVE_LINK_PLACEHOLDER.format("10w_IRWWga6BPW0bZOQyUGSIWjdC2Ou_w"),
-"pair": DRIVE_LINK_PLACEHOLDER.format("1u95vHqBeWmtuYAwMs1gEX4GN4RAZWZOD"),
-"puzzle": DRIVE_LINK_PLACEHOLDER.format("1m0lSkdqBjxcEtNQBptQEAGOLJPv5eNEW"),
-"public": DRIVE_LINK_PLACEHOLDER.format("1Vn6ay3ItWT3e8NHkntqRTb0S8Hy_Ovgf"),
-"prove": DRIVE_LINK_PLACEHOLDER.format("15W9SgK7Tj0APCzDSkcUTncd9lkpKdoTP"),
-"property": DRIVE_LINK_PLACEHOLDER.format("1JKMz_s_krZYsE6hiNFle7f2JwOfjiGAa"),
-"pronoun": DRIVE_LINK_PLACEHOLDER.format("1_wNmcn-MYR20PRXrfSJZ4Gs_5l-eDukj"),
-"promote": DRIVE_LINK_PLACEHOLDER.format("1r_chQ_65z3pysIg5KEisJUjF3t3xkkoY"),
-"price": DRIVE_LINK_PLACEHOLDER.format("1K5p_FMebMBH0rvfWfkMSpy1ACEwGjdVP"),
-"present": DRIVE_LINK_PLACEHOLDER.format("10lIM2k4OB2AmMdK_0uzY0Dd-niQz7aN_"),
-"now": DRIVE_LINK_PLACEHOLDER.format("10lIM2k4OB2AmMdK_0uzY0Dd-niQz7aN_"),
-"preposition": DRIVE_LINK_PLACEHOLDER.format("1yKbvtSq5sXBv4Gzcmft_RulwyUAk4rEM"),
-"prejudice": DRIVE_LINK_PLACEHOLDER.format("1T-qEqUnAw44kee2Gmz_lR8piFa2QN2Pb"),
-"prefer": DRIVE_LINK_PLACEHOLDER.format("1mqQbwODi-F66CmWzK0gPRl9pa181YNZh"),
-"predict": DRIVE_LINK_PLACEHOLDER.format("1xnjNwMfmAl3YUNA3F7vGQHxJFdt7z1IE"),
-"potential": DRIVE_LINK_PLACEHOLDER.format("1mFkFY8l67L95wOpM-6qXcsFjDV3wU3gH"),
-"postpone": DRIVE_LINK_PLACEHOLDER.format("12XySs44MkLS4Vts2KF-lkDDOaAhpflTj"),
-"postman": DRIVE_LINK_PLACEHOLDER.format("1dka_al-tPduXLdfn0ISEU4_YVzOKYGTt"),
-"pollution": DRIVE_LINK_PLACEHOLDER.format("1K_E8N1V95gJST5dNbhjhw6LtpWAQJH2-"),
-"polite": DRIVE_LINK_PLACEHOLDER.format("1OTcu5wtanV0CVo1duGkxjBNZagvaBEq3"),
-"police": DRIVE_LINK_PLACEHOLDER.format("1SEr28Bxv7xia9ehqpI7XjAZhnVpnNpLW"),
-"poison": DRIVE_LINK_PLACEHOLDER.format("1_3F1T6Un74H4rbVAkpYIqYy2HAWMQsC8"),
-"plumber": DRIVE_LINK_PLACEHOLDER.format("1lkEyx_-2zUCPjou7Ku_StZrb-njkw-F7"),
-"plenty": DRIVE_LINK_PLACEHOLDER.format("1mdz1LNqP1CroiVmnJH7R2WSr2I_M760T"),
-"psychologists": DRIVE_LINK_PLACEHOLDER.format("1K3B16QjJavFxgqaovbQp1RN9pXaYX-nj"),
-"podiatry": DRIVE_LINK_PLACEHOLDER.format("1G_rZbKOF8jZEOAVaa5djVnQ2qWg_zRbU"),
-"pulley": DRIVE_LINK_PLACEHOLDER.format("1TyuR-uVDXARW9z3PBxYeuCrc-R4L_xG_"),
-"paint": DRIVE_LINK_PLACEHOLDER.format("1bYIk_JC75L6LYUmLw7NVvvtH4o1i_Xip"),
-"prescription": DRIVE_LINK_PLACEHOLDER.format("1cOs61Q_v7DWjxnygkn_Gwasw8IjH9SQn"),
-"proud": DRIVE_LINK_PLACEHOLDER.format("1S0tf6NtkFiT5s2u9AIlk-URYJEwE5n6k"),
-"pyjama": DRIVE_LINK_PLACEHOLDER.format("1MJDSZD2ylpxRC346DZumVBuMKIta8e_H"),
-"profit": DRIVE_LINK_PLACEHOLDER.format("12MWfq_XVVKfw_7ROdFYuHS7zSxbmOKkh"),
-"professional": DRIVE_LINK_PLACEHOLDER.format("1s7rG5WrI6YGpk7igXVYzOmaBNvVw8oTL"),
-"principal": DRIVE_LINK_PLACEHOLDER.format("10JC0UIq6E9UMlywpJe8aDfT--fpMvynN"),
-"proof": DRIVE_LINK_PLACEHOLDER.format("1gDu9qqubYnSEr4_zDCzrDTz356f5nr_F"),
-"politician": DRIVE_LINK_PLACEHOLDER.format("1xxsBulHNA6_vanROaCy7HBKeFnVY1_5L"),
-"photographer": DRIVE_LINK_PLACEHOLDER.format("1FqLjf8fVrCi_KWVq5Sd7hwUsuLSL_oJj"),
-"person": DRIVE_LINK_PLACEHOLDER.format("1d9SQ8Qs4Z2C5_yoCj1mfZRG43QNRS-AZ"),
-"praise": DRIVE_LINK_PLACEHOLDER.format("18wMZjxl63FLnPIpF79LdgA7nZIEex48z"),
-"clap": DRIVE_LINK_PLACEHOLDER.format("18wMZjxl63FLnPIpF79LdgA7nZIEex48z"),
-"pain": DRIVE_LINK_PLACEHOLDER.format("1eIA6fsDw-Iu37-Whw589M9xVzVc35h7v"),
-"prayer": DRIVE_LINK_PLACEHOLDER.format("1Mu4n56UTUiff22-xHloDgRkoQBXhpBoK"),
-"petition": DRIVE_LINK_PLACEHOLDER.format("11a4XEZPzDcIVt3H-4XMDjHpZtN9Mk6oQ"),
-"petitioner": DRIVE_LINK_PLACEHOLDER.format("11a4XEZPzDcIVt3H-4XMDjHpZtN9Mk6oQ"),
-"promotion": DRIVE_LINK_PLACEHOLDER.format("13IoRm8436ZqSU40_gPO6KpHtTnR2qoh0"),
-"practice": DRIVE_LINK_PLACEHOLDER.format("1D6URO-PIhSegTwGMwMQPHAJK_j_016yX"),
-"pulmonology": DRIVE_LINK_PLACEHOLDER.format("1-heTT6-WPFIOjRy0mFW404ZTO3djuGXO"),
-"psoriasis": DRIVE_LINK_PLACEHOLDER.format("1OEdPJ4OiwvhcnZatkViRT1dVKjSyKKlQ"),
-"planets": DRIVE_LINK_PLACEHOLDER.format("1V3nvhWamEMo8cPMFoLg8lkUjYM6zm1zX"),
-"pathology": DRIVE_LINK_PLACEHOLDER.format("1AD3x-YKgo2ITxtyO7vxTj18VaGMcw7Nj"),
-"pancreas": DRIVE_LINK_PLACEHOLDER.format("1H5WTpG-_-i-Yq2_tJXqrW7qgPXeY-b-f"),
-"palm": DRIVE_LINK_PLACEHOLDER.format("1ocOalJCeCzhTKWs8tVhQvxyDSWFHxedG"),
-"paediatrician": DRIVE_LINK_PLACEHOLDER.format("150j6MlFthbnIffIt9hIPPdlB0aKumG0l"),
-"pressure": DRIVE_LINK_PLACEHOLDER.format("1RIrDs50TFuZ6HxdIWBynYzYqs12QtbhM"),
-"physics": DRIVE_LINK_PLACEHOLDER.format("18hGKGDsvEhu5ei5iPnGrsDKXKqRIQSzx"),
-"parliament": DRIVE_LINK_PLACEHOLDER.format("1mmR9Zoze_jKoGyKR019h8UnVBwWrnWlO"),
-"plateau": DRIVE_LINK_PLACEHOLDER.format("1MIH2XwePMPy9jxvzYEu5GqrY9wisFGw0"),
-"quadrilateral": DRIVE_LINK_PLACEHOLDER.format("1p8Vgv_GxfbS9zFbJVhPGsWO6lQ0jlcl7"),
-"quantity": DRIVE_LINK_PLACEHOLDER.format("1uHFcHKsnp5wn6BirjpwX8MgRJfSqbktq"),
-"quotient": DRIVE_LINK_PLACEHOLDER.format("1XI_iqTBevzjQ_atpSwgD4N-GbhpwjL2W"),
-"quota": DRIVE_LINK_PLACEHOLDER.format("11SmBIXtSByiogkdBVLvRF5wG7F_7Z017"),
-"quotation": DRIVE_LINK_PLACEHOLDER.format("1uO0TJJJ9y6jVuYxcgvFv_x_mGZOvEWQN"),
-"quack": DRIVE_LINK_PLACEHOLDER.format("1x9Lm2BMiVlRwL9-w1I7FD3Gg7F1LNir_"),
-"quiet": DRIVE_LINK_PLACEHOLDER.format("1AYrxItzBY7RtwMvK0gs1_HaPmacfD9Ia"),
-"quickly": DRIVE_LINK_PLACEHOLDER.format("1XKL0L8Fecow47UxK9OygZ1DPNFiiT58T"),
-"hurry": DRIVE_LINK_PLACEHOLDER.format("1XKL0L8Fecow47UxK9OygZ1DPNFiiT58T"),
-"quickening": DRIVE_LINK_PLACEHOLDER.format("1BTkJk8uElJBamK4s-rARdbLykU_rDD6p"),
-"quarantine": DRIVE_LINK_PLACEHOLDER.format("1pWyabZE6cx9p2EwpxMJij73AzEohtOCS"),
-"quadriplegia": DRIVE_LINK_PLACEHOLDER.format("1lzlZR4WvYjSWRs_8-nu4LaodF4FmG8fe"),
-"quilted": DRIVE_LINK_PLACEHOLDER.format("16hYzOcXJJwZUHyY2Ljd0T3kTnil6yOXe"),
-"quarrying": DRIVE_LINK_PLACEHOLDER.format("1TSpk76U_DbtoPUqOSZ2rrEuyGtjwVdzp"),
-"quarry": DRIVE_LINK_PLACEHOLDER.format("1TSpk76U_DbtoPUqOSZ2rrEuyGtjwVdzp"),
-"quantity": DRIVE_LINK_PLACEHOLDER.format("1cc7qRzjdVoEwdaV7pi1WZyDMecpSAN8_"),
-"quickly": DRIVE_LINK_PLACEHOLDER.format("1nWzhHrYEj5Au5hWHLTuwfZm00q5XAoF5"),
-"question": DRIVE_LINK_PLACEHOLDER.format("1aXhBYE3NhLPCh3oEjcfZ2Wpipy5jtkJv"),
-"query": DRIVE_LINK_PLACEHOLDER.format("1vB3IWSvRTQDSPAyqGidqI3wuhltPVTvH"),
-"quarter": DRIVE_LINK_PLACEHOLDER.format("1CCM0Jr8gcd7yVujDJ6cL31YVgzs7Dx9n"),
-"queue": DRIVE_LINK_PLACEHOLDER.format("1diOW8HJACBTODvU2B3kM_BadBIuCAoJE"),
-"queen": DRIVE_LINK_PLACEHOLDER.format("16yE39bdLFY1Q-XNnL-8VuLA_bwkWx-eU"),
-"quality": DRIVE_LINK_PLACEHOLDER.format("1AensbqFF1Upq9gFJD06PdhKHZYcZfFVj"),
-"qualification": DRIVE_LINK_PLACEHOLDER.format("1MZlL3-zInmHDA2Pf2XUAjZGlCk0bH7xK"),
-"rupee": DRIVE_LINK_PLACEHOLDER.format("1-8poIHfDfoHrdN6qYLu1cSr6lw0NThnY"),
-"money": DRIVE_LINK_PLACEHOLDER.format("1-8poIHfDfoHrdN6qYLu1cSr6lw0NThnY"),
-"reflection": DRIVE_LINK_PLACEHOLDER.format("15x4VhkaDopJZT7zYgNatYHUOkd1ZKUwS"),
-"radiation": DRIVE_LINK_PLACEHOLDER.format("1s6rYQFHBcmYpEedFhtCBSK-cefWF2p1l"),
-"reward": DRIVE_LINK_PLACEHOLDER.format("1943V23JdEFedUMmFOP6v9q90L2WyOyuw"),
-"revenue": DRIVE_LINK_PLACEHOLDER.format("11-b4cACRCmgjr2uSYlXUNewIGIVOoiQN"),
-"regulator": DRIVE_LINK_PLACEHOLDER.format("16hxuAMbhRGORAnXfUqYy-Do_vME7cMYs"),
-"rusting": DRIVE_LINK_PLACEHOLDER.format("1HLX2UzsW8xJF7Gkh7KMwgcpvRqU6c8rp"),
-"rust": DRIVE_LINK_PLACEHOLDER.format("11upfvb75JWO3mplpP88ttRoB_s6Drdb3"),
-"rectum": DRIVE_LINK_PLACEHOLDER.format("17fpoqywWpgqKJU4L_5b_rup4CG6DsY_j"),
-"respiration": DRIVE_LINK_PLACEHOLDER.format("1bIAWO2fNm6tDNwmm_BXYgc_ZJf0bVMmx"),
-"remainder": DRIVE_LINK_PLACEHOLDER.format("1w-g_CL69sWUWJLbtZvChrZ-O0Om6jAhn"),
-"ratio": DRIVE_LINK_PLACEHOLDER.format("1sOfZ0Oi_FO823mU7caHJQnenBfOt8ALk"),
-"rhombus": DRIVE_LINK_PLACEHOLDER.format("1CIVXgHPT1ifXyB4bKmuexQXVDCxu6q2H"),
-"rectangle": DRIVE_LINK_PLACEHOLDER.format("1VNpnllvqrAuxSpU3PIsoCZOjEfyMru7h"),
-"radius": DRIVE_LINK_PLACEHOLDER.format("1R_fDZAwnz8xA89a5nSwvQzZIaMoAtoGE"),
-"region": DRIVE_LINK_PLACEHOLDER.format("1YNxLG8-WgJH6Wp6AcgrK5AY9is71rhgR"),
-"ray": DRIVE_LINK_PLACEHOLDER.format("1-v5-b1_gIF9oYhpLGjJPg4SfLKs_9TMG"),
-"ruler": DRIVE_LINK_PLACEHOLDER.format("1xdyr6O0r4Krkc9fVjrWVqrqJvo6XwMDm"),
-"raisin": DRIVE_LINK_PLACEHOLDER.format("1eL-ZLdNm8vZ4zsvCcjOtDFsSeqsye4Kq"),
-"runs": DRIVE_LINK_PLACEHOLDER.format("1IJCNSlfN0DKbkXEqnZgtgWcPt0eRugBJ"),
-"ranchi": DRIVE_LINK_PLACEHOLDER.format("1hKYDpTcvaG80h1RxD4cuzLxtBuNFAsg8"),
-"rajasthan": DRIVE_LINK_PLACEHOLDER.format("1mF1yDfc4mL6xDFrsTg0L1dlC_YzpmB_0"),
-"rajdhani": DRIVE_LINK_PLACEHOLDER.format("1Zl99McpbsuG3Pki30GZcieNhYcYHoh_J"),
-"rajdhani express":DRIVE_LINK_PLACEHOLDER.format("1Zl99McpbsuG3Pki30GZcieNhYcYHoh_J"),
-"raipur": DRIVE_LINK_PLACEHOLDER.format("18UdVxZjFbXns4EzubPuFg5eDZmJsDvnX"),
-"reconciliation": DRIVE_LINK_PLACEHOLDER.format("1a2fE-xaSFR3ZlgiCuOFKrayNUybyyu3f"),
-"regulations": DRIVE_LINK_PLACEHOLDER.format("16XfiyWwU0X5elaNJVVgPwJVD0vwQBK2n"),
-"retirement": DRIVE_LINK_PLACEHOLDER.format("1hM_zMjYEQHajU1YainHvF19w3zxN_JXR"),
-"renewal": DRIVE_LINK_PLACEHOLDER.format("1MKlFKJ9ENk3uR5HSQGV-ElXjF3njgafD"),
-"refund": DRIVE_LINK_PLACEHOLDER.format("1JyGNbL-UMHIH7kEmyp_s0E1Bqj9qcsyr"),
-"remittance": DRIVE_LINK_PLACEHOLDER.format("18jloVHQAaqJ0ncrellze9p4qb5wSLZT_"),
-"revalidation": DRIVE_LINK_PLACEHOLDER.format("1gOYajzIJsKTRPXG3HQA27m1DdXqn7Rso"),
-"riverine": DRIVE_LINK_PLACEHOLDER.format("14Vc6_nS-ZJ5n8tGTC16K_LwX2VJtOq1p"),
-"reducation": DRIVE_LINK_PLACEHOLDER.format("1YlBa0g0S8Iwg6hpLzcxGQcblouycZbt-"),
-"rotting": DRIVE_LINK_PLACEHOLDER.format("1-Nc-5QO5p-Oqx1FWvgBvXwCSJhtv7Ilw"),
-"rot": DRIVE_LINK_PLACEHOLDER.format("1sflfi5DuWp1lvk3_81hryKRzS60QCCo4"),
-"reproduction": DRIVE_LINK_PLACEHOLDER.format("1cFVZMcVrDhhBq3C4Novs_YzfGfLfcVG6"),
-"ram": DRIVE_LINK_PLACEHOLDER.format("17Ig45OM3wQerW72sWcrXjLUObcwLnNn_"),
-"roughages": DRIVE_LINK_PLACEHOLDER.format("1742BVMueTYkebiRTlZvpBZOwWRHoOjPL"),
-"roasters": DRIVE_LINK_PLACEHOLDER.format("1Xacx2_Bf117SAROR9BbDv48aQuWvM-nx"),
-"rose": DRIVE_LINK_PLACEHOLDER.format("1hEJnzJzGK2TNObkh_RUNCoT2dPOMGXrp"),
-"rinderpest": DRIVE_LINK_PLACEHOLDER.format("11sHIHxDNgmgrEZ-kOVKItt_F_JNq-_92"),
-"ranikhet": DRIVE_LINK_PLACEHOLDER.format("1irextv_cdR_Y3M80liNIXfog5lNrBoKn"),
-"rhizome": DRIVE_LINK_PLACEHOLDER.format("1gmOpAyGFbjOCJJ6en0rrZl5Ve34dzQWf"),
-"routed": DRIVE_LINK_PLACEHOLDER.format("1iQaxc1T7pjrCvWNo_8hfiH2kQhnbTBDf"),
-"renewable": DRIVE_LINK_PLACEHOLDER.format("11fwZjF6Kjrthn6GfJHis27VUy1TGULLo"),
-"regional": DRIVE_LINK_PLACEHOLDER.format("1eFMdRzp84OFEHYhLSbkN89tbi2B0S8I-"),
-"recurring": DRIVE_LINK_PLACEHOLDER.format("1MP9Gmdo1e6KnufwAOKorFDTK6y2NjdkN"),
-"discrimination": DRIVE_LINK_PLACEHOLDER.format("1sAUH9weSMmCnUpRW1OI6t9reeR6wVF7g"),
-"rehearsal": DRIVE_LINK_PLACEHOLDER.format("1xvVNYE-oscKhG7_gZuBbgorXt2-Gos6r"),
-"reside": DRIVE_LINK_PLACEHOLDER.format("1sJ0iBTr55Ie-HbiT87cayKMvdawY9MHx"),
-"respond": DRIVE_LINK_PLACEHOLDER.format("1meZzi5WE1rzzrRgFfrgmL_bH1hOXJwnn"),
-"ride": DRIVE_LINK_PLACEHOLDER.format("18DkHY05NdFlOKBKgxSZafAdrGEpNxf-n"),
-"rotoscope": DRIVE_LINK_PLACEHOLDER.format("1G9xLG6fYAABK_67bl9HlCBAwZG403dnk"),
-"rush": DRIVE_LINK_PLACEHOLDER.format("1CRqEYzmESA9oFVBAdzsBK9oCNgNwRqVU"),
-"remarketing": DRIVE_LINK_PLACEHOLDER.format("1JfooAkLZ2fdmzQImvaV60UHKlnw3Ptxc"),
-"reprimand": DRIVE_LINK_PLACEHOLDER.format("18an5QMQTmzVHxN2H20ncH8G9637fhb7f"),
-"razor": DRIVE_LINK_PLACEHOLDER.format("15Kqo4d1HUnwXV69cyCqFqYB6cU_luxON"),
-"raita": DRIVE_LINK_PLACEHOLDER.format("1gJXMq5q6dcuebRpcXR-56Afbn5raM5Bb"),
-"reliability": DRIVE_LINK_PLACEHOLDER.format("1tvN_kYG20hrZTXydYov0Bf3x7o_JOwOx"),
-"ramp": DRIVE_LINK_PLACEHOLDER.format("1UY2CKI6Otgz23slS1IAEV4fFm3hHZPyN"),
-"raft": DRIVE_LINK_PLACEHOLDER.format("1oDSaIKq1u-sCORbURWZmthCZlWnkjOvm"),
-"rage": DRIVE_LINK_PLACEHOLDER.format("1Csb9O2GwqZ_Vr0ya9YPNEFtttA9nbhQW"),
-"rag": DRIVE_LINK_PLACEHOLDER.format("1T-EK0fkeA7lFXll6t5qpCfl32rJlyMuG"),
-"rack": DRIVE_LINK_PLACEHOLDER.format("1YpBaInq5JG8t7akcGPwMDW6dRyGfnItq"),
-"rhs": DRIVE_LINK_PLACEHOLDER.format("1g3sLT-mSW1bNccv6Kmjab8TMrzt7bVkn"),
-"revolt": DRIVE_LINK_PLACEHOLDER.format("1F2lj-_fP6cb-3zzrhL0CleR_UQWeViW3"),
-"retina": DRIVE_LINK_PLACEHOLDER.format("1Vl1RlTUYj66EXUX-T7J6KmCeJW983Dc2"),
-"range": DRIVE_LINK_PLACEHOLDER.format("1-Q7vZHxvd-Nl88U-2YTUx0QWe2TjSZwt"),
-"retarder": DRIVE_LINK_PLACEHOLDER.format("19oEK40caZRU_WtNcQ2DMeSvqyTmHIl5j"),
-"rafter": DRIVE_LINK_PLACEHOLDER.format("19WhdaUyloAFQ0uZdEGHSLkFLvO7eH2E7"),
-"ribbon": DRIVE_LINK_PLACEHOLDER.format("1ns2pbXQ-uEUr2O3D9dgnBNXoIM-ddYeC"),
-"reforestation": DRIVE_LINK_PLACEHOLDER.format("13-eU6NtjsCheK6nn25q-YWtiphGlUilo"),
-"recreation": DRIVE_LINK_PLACEHOLDER.format("1x4mwFwNyzDN0PsQM-IpHuUrfnuFmI30U"),
-"recyclables": DRIVE_LINK_PLACEHOLDER.format("1yAR8uyWpfUrxjmWQ6b_dxg70g8rhHLH7"),
-"recipe": DRIVE_LINK_PLACEHOLDER.format("1EG1Xcz7fKLXQq5n3JqzWf35-IvTlPf2-"),
-"race": DRIVE_LINK_PLACEHOLDER.format("1VNBJ4bSiuKft77Wk4cwl9MwNcYcjIX1E"),
-"respite": DRIVE_LINK_PLACEHOLDER.format("1lUnSZiekQWQ7xR0VadTdYc3P60o3I8jV"),
-"ransom": DRIVE_LINK_PLACEHOLDER.format("1i6XOgRW0TPQHmJ9JuC093uc1a4yfLka-"),
-"recruit": DRIVE_LINK_PLACEHOLDER.format("1dNL6VkE0OQalpXVtTXTlNUBMBAwfoNcr"),
-"roar": DRIVE_LINK_PLACEHOLDER.format("190qxvltaarAbh3kwcB946OjgA2I_K4Ov"),
-"rdx": DRIVE_LINK_PLACEHOLDER.format("1UgFIj-G1HaR3oYGMygFvtflNn3XmUO6W"),
-"recovery": DRIVE_LINK_PLACEHOLDER.format("1CjCZWWDXs28W5bkRf4xn5ihwFD7xRqje"),
-"revolve": DRIVE_LINK_PLACEHOLDER.format("1dxRvMKs79UT75pOpqo7EPA2Q6C_shqND"),
-"reimbursement": DRIVE_LINK_PLACEHOLDER.format("18E_I4ZqrUYiJiKqXJP-5mW1_Wnh2nklI"),
-"rugby": DRIVE_LINK_PLACEHOLDER.format("1KDB24OP3lDHTYQRKP8_zqXNNBuoQ-5PC"),
-"rape": DRIVE_LINK_PLACEHOLDER.format("1PiFQSkqjGurBdbXcy8oyNoOzX3pL-22a"),
-"reporter": DRIVE_LINK_PLACEHOLDER.format("1kqDCBG7oJLsmx07FehBJWan6IhOTMukq"),
-"researcher": DRIVE_LINK_PLACEHOLDER.format("1XZzUFWrYbrZ5KlNKMxfoUz5e7Pjy-fTh"),
-"runway": DRIVE_LINK_PLACEHOLDER.format("13eKJuZBC_vuy5s1j9vciB7Ez7jnVtvMy"),
-"refraction": DRIVE_LINK_PLACEHOLDER.format("1pifFz2nW33V9PqSsJRV5d5x7zV__h4BH"),
-"res": DRIVE_LINK_PLACEHOLDER.format("1diI-GlGB8cubUTzxXltbiSfO5bjd3diX"),
-"remand": DRIVE_LINK_PLACEHOLDER.format("1EX8CiUxN2JVMgeDAeQWsiNOfxC_TZKrd"),
-"radar": DRIVE_LINK_PLACEHOLDER.format("1YRjaaG44nujBqWxxSUzhozcv8sSgEMKe"),
-"relaxant": DRIVE_LINK_PLACEHOLDER.format("1XBlYErCAWhlMPje4xQLedsX2FPxNPWkf"),
-"rust": DRIVE_LINK_PLACEHOLDER.format("1iyfTfTLmvthO4iggCn0mQ4UqxRHDPNMo"),
-"revenue": DRIVE_LINK_PLACEHOLDER.format("1w7OTTiwJggK-wybnB36AYSNM-1EGZ2m9"),
-"refund": DRIVE_LINK_PLACEHOLDER.format("1LoHxUdBpJLzdiCBP3QIMpqUW5fKt4BsW"),
-"reciprocal": DRIVE_LINK_PLACEHOLDER.format("1OtvpxS6TQCyUrJk6wo0mOSgo9vfRPn-x"),
-"rama": DRIVE_LINK_PLACEHOLDER.format("1KaFnBtM1KHCbisyzBr4zFN2t9uYrs_E4"),
-"relief": DRIVE_LINK_PLACEHOLDER.format("1HhMbQgpKMXgURMtkbty5wzVSeUZbFAW1"),
-"realize": DRIVE_LINK_PLACEHOLDER.format("1I_jGQV3bIdRoy2a5cpiJTnnsJVsF5PfQ"),
-"red": DRIVE_LINK_PLACEHOLDER.format("1m3eq3FCMnLidrcV7f1f1Vln521PiJZzv"),
-"rocket": DRIVE_LINK_PLACEHOLDER.format("1pc1SPCk9_TT868ceHhKIlfpXLOGNCaw8"),
-"rheumatology": DRIVE_LINK_PLACEHOLDER.format("1jUgaCsW7VNv-H7aJ4uJ4QARNdgptFbdZ"),
-"resuscitation": DRIVE_LINK_PLACEHOLDER.format("1HlnUe_QehMUM80honF9F61tDIv95zsBE"),
-"rehabilitation": DRIVE_LINK_PLACEHOLDER.format("1taBN_7Xjf5eV4CiVFgKRuXdtCqd-YSfa"),
-"rude": DRIVE_LINK_PLACEHOLDER.format("1a2sjuxRD5DEos8CJqQPxWavZLYWkv0nH"),
-"role": DRIVE_LINK_PLACEHOLDER.format("1wrtXaAwIW9K2KVQ96FNzpDPzFdd3nCYk"),
-"right": DRIVE_LINK_PLACEHOLDER.format("1EP_IKwbjeEg6TkitaKIPk1auC3gPMOoG"),
-"rich": DRIVE_LINK_PLACEHOLDER.format("1HSAYxLFIYa0qQ42ajNK7Hcq242CXqEOC"),
-"result": DRIVE_LINK_PLACEHOLDER.format("1w6dxPZRYtcs4f7FWlQc-NBKdA1bndrms"),
-"respect": DRIVE_LINK_PLACEHOLDER.format("1LJgQVwKUJmxnGQcK0hvkn997mXZdpqKi"),
-"report": DRIVE_LINK_PLACEHOLDER.format("1iUnT-gh61ZxsYTT62Zk_j3RnRYte9plh"),
-"rent": DRIVE_LINK_PLACEHOLDER.format("1KyFYTW0GJpk_RcgT4Y6544DxtIHbNAra"),
-"relax": DRIVE_LINK_PLACEHOLDER.format("1NewZWThlPM2o5d3Qza_mq38qaD1_vFvX"),
-"record": DRIVE_LINK_PLACEHOLDER.format("1DK3uFwUX9XS0x7O_Dj3-Qlly8zJCT0iB"),
-"receive": DRIVE_LINK_PLACEHOLDER.format("1hLEKXkq2TpjOcL2brKW6kV37-M64snBb"),
-"reception": DRIVE_LINK_PLACEHOLDER.format("124WGoe-oAAHiY7_YIx4way_4r9-zPxob"),
-"racism": DRIVE_LINK_PLACEHOLDER.format("1hvotvYDNeWyqeVxvUHDnBp2LT15a2aAu"),
-"reservation": DRIVE_LINK_PLACEHOLDER.format("1iAEBs_wOUlZ49K1QNnFIJUZHg6jiF1pG"),
-"respirator": DRIVE_LINK_PLACEHOLDER.format("1Ul990Yq0sI07Awe6Jvw_Hx4iSXKUZ6jh"),
-"regurgitation": DRIVE_LINK_PLACEHOLDER.format("1Dqnjc9njpxAb7jO9JCjvvEd4tjw6zms6"),
-"rabies": DRIVE_LINK_PLACEHOLDER.format("15H0rJiPcFnpjKPDrPwWc91t8MhYG2l2C"),
-"restaurant": DRIVE_LINK_PLACEHOLDER.format("1ahJHK83qEpiIacBODJU3jan_XUoXbwS6"),
-"religion": DRIVE_LINK_PLACEHOLDER.format("1usbwIlMRwgPwTvdBAJbycdNWknCZXp-Z"),
-"renovation": DRIVE_LINK_PLACEHOLDER.format("1VQg1-zIHaTA4tCPa8M9o9ibsiZRzccO7"),
-"rwanda": DRIVE_LINK_PLACEHOLDER.format("17NFAqI6jXomeHqZfv3SBiiW5xZRAodRm"),
-"russia": DRIVE_LINK_PLACEHOLDER.format("1qyXbH5UaRjbiouC5ergc-5coo6n2rRsI"),
-"ruler": DRIVE_LINK_PLACEHOLDER.format("1PhDDRHIPa_K3E9zWTFBQxZ0fkclcdFHG"),
-"rum": DRIVE_LINK_PLACEHOLDER.format("1sVKpCSykd51mDy1E9Bwe2d9bF4lwkVTd"),
-"ring": DRIVE_LINK_PLACEHOLDER.format("14YXpjPQBGsKAcaWSKYtWR6y46x2-ol1K"),
-"rasgulla": DRIVE_LINK_PLACEHOLDER.format("1ZNd16u1E7Aaw4kBpDCydxFbhxIX8q6ll"),
-"rice": DRIVE_LINK_PLACEHOLDER.format("1VeJtLXxueH1r0nGR_03iT8OuzXiABU-Y"),
-"run": DRIVE_LINK_PLACEHOLDER.format("1cQrfTMdUV0KEMGY7cSukBGbyxEGJPi--"),
-"rule": DRIVE_LINK_PLACEHOLDER.format("1o74YWx5Ze8E1vzmpp9Vg60eOz_fUGAvd"),
-"reamer": DRIVE_LINK_PLACEHOLDER.format("1eaCVxOX-MmiuFBLYCOk1PK8bUg_FJDmq"),
-"remarry": DRIVE_LINK_PLACEHOLDER.format("1LCb9CSkCE0Z57AyqxK3e7qiDUH-eerEP"),
-"riots": DRIVE_LINK_PLACEHOLDER.format("1GILFyT8ZHQTRWxBR6EiHDdLkCUB7pd3v"),
-"relay": DRIVE_LINK_PLACEHOLDER.format("1akfHj4uCgrXjZ1f4rJGrmpjEQIqsx1pm"),
-"resistance": DRIVE_LINK_PLACEHOLDER.format("1aVUjV2XD07Q6mR17vSaYNi-ezwne79dc"),
-"republic": DRIVE_LINK_PLACEHOLDER.format("19cZbOKkXE7fONHhKDEId6oditMeHGEvF"),
-"refugee": DRIVE_LINK_PLACEHOLDER.format("15M_GdN0E6hx5uXoo_4d5Xz3RYFO-iU20"),
-"ration": DRIVE_LINK_PLACEHOLDER.format("1jR4JgDdVOW6C7gZo7WVw_tJXJRP7jhXU"),
-"router": DRIVE_LINK_PLACEHOLDER.format("1J1uEsDiH5cYs1iXdkfw1QLGsr5C47oJp"),
-"rollerpaint": DRIVE_LINK_PLACEHOLDER.format("1YO55xbMyZtESmiuVjEbNc7wb08siwqmB"),
-"rake": DRIVE_LINK_PLACEHOLDER.format("1cUgYw1XPQ7Hxz-5OIOBkExJFqRFeaTXV"),
-"rever": DRIVE_LINK_PLACEHOLDER.format("1xGuaQYJDnUNHC5lPfAky5yNHfG5VrFKo"),
-"rectangle": DRIVE_LINK_PLACEHOLDER.format("1e2MFi2kuGsUoUTCm60r5serdwL5lcw9M"),
-"radio": DRIVE_LINK_PLACEHOLDER.format("15RmmvJgorkROvbsXb9OEb3hdBWfE_R1D"),
-"runner": DRIVE_LINK_PLACEHOLDER.format("1AoOh_g5K6KnaI-B88ucCqifsAo8SZ-Pm"),
-"radish": DRIVE_LINK_PLACEHOLDER.format("1Fjb0QVjkfGoT4FvUIoHyJDKi6BlvrkRB"),
-"rivet": DRIVE_LINK_PLACEHOLDER.format("1jUyqw8ChVya3cmIQHr9f47DeFkO2MbUT"),
-"regulator": DRIVE_LINK_PLACEHOLDER.format("1WAb_9h5H3AmZXaFIzsbd0wy7J3R6oJ3R"),
-"rock": DRIVE_LINK_PLACEHOLDER.format("1kqtb-R0K5X6K_bq_ZuXmc-Bp2gpeO7ww"),
-"rainbow": DRIVE_LINK_PLACEHOLDER.format("1HNK4yrJvCIRcLXfj-C_vF3VUqWIBswMC"),
-"rain": DRIVE_LINK_PLACEHOLDER.format("1yj2PqTH-MXzLfR5dcY3OSm2Svh98VtcB"),
-"rhinoceros": DRIVE_LINK_PLACEHOLDER.format("1KA9XaUzC9BlNEpjrFjyycU51aJkMcJdJ"),
-"recently": DRIVE_LINK_PLACEHOLDER.format("1byxxukqnsKswhM_zk6I4Z4U0fokzoRSD"),
-"round": DRIVE_LINK_PLACEHOLDER.format("1pMsI_vAB94d6VPHGeFoYDGnMeX5SdR3y"),
-"reflect": DRIVE_LINK_PLACEHOLDER.format("1xVKhSYmTye2S5ikrAtcLx1XhuwnCoKcf"),
-"reflection": DRIVE_LINK_PLACEHOLDER.format("1xVKhSYmTye2S5ikrAtcLx1XhuwnCoKcf"),
-"room": DRIVE_LINK_PLACEHOLDER.format("1TxDfLKOWfwiQEmFv-vTT3MFtGhjP29Fw"),
-"roof": DRIVE_LINK_PLACEHOLDER.format("1eerIdVQNF9H9RYb0mKfbccVNr33jGP4v"),
-"roll": DRIVE_LINK_PLACEHOLDER.format("1iI7gXZoKB3KiPT-ICBjgP1Xi0NFCVsjI"),
-"record": DRIVE_LINK_PLACEHOLDER.format("1L3bKbpOkhGnpaz-4JKhqPHl8d8APn_h7"),
-"recognize": DRIVE_LINK_PLACEHOLDER.format("1tOK_aDqVN1v2B2dJ8VyRXB99vjYN50Ng"),
-"receipt": DRIVE_LINK_PLACEHOLDER.format("1Ow24h6ni5Eg1A_lA-FnOYadJSFXtpFdT"),
-"reach": DRIVE_LINK_PLACEHOLDER.format("1-4Ixo5IrTHkmi4wXy6tFY5OiN2AavSpY"),
-"raw": DRIVE_LINK_PLACEHOLDER.format("1bxY9kGRCTXRZbimhFNjqQ_ur1xtR9cir"),
-"rarely": DRIVE_LINK_PLACEHOLDER.format("17T9T66Prm0Tkt1fOTm-q8JkedkT40YU_"),
-"route": DRIVE_LINK_PLACEHOLDER.format("1um5s55fhxRBBTGxGbPrJAZ3Fkg9RUHPz"),
-"regret": DRIVE_LINK_PLACEHOLDER.format("1SB0ots0qPv9jiZYdEWX6mzAhPmZT2N1A"),
-"retire": DRIVE_LINK_PLACEHOLDER.format("1wyh5HlbdCM8U7Heg0QQn40aDT5DRgKsd"),
-"resolve": DRIVE_LINK_PLACEHOLDER.format("16lFVudxlWTiVLIMZQBvzmnqDduU58lgf"),
-"resign": DRIVE_LINK_PLACEHOLDER.format("12Mz0W3BdZxV5OqrmBHD1B-cQXIFiuqrg"),
-"request": DRIVE_LINK_PLACEHOLDER.format("1U1LMStfJ7LlnYerDnuGVTtWyzBvTZQAX"),
-"rom": DRIVE_LINK_PLACEHOLDER.format("1Jj8uOzOgXihjcDUtAYwtqYQRliT8xxcF"),
-"restart": DRIVE_LINK_PLACEHOLDER.format("1dEdTrTDo6ozMAMWXrPfmcQ-qgat5o8N5"),
-"rename": DRIVE_LINK_PLACEHOLDER.format("1OlmUAHZOtVdLJYQ2kWOyIx3M8MFYZ3-S"),
-"remote": DRIVE_LINK_PLACEHOLDER.format("1tqBw0GyYCJx_YhewpwWIJABrtah_7evT"),
-"redo": DRIVE_LINK_PLACEHOLDER.format("1_k-16FOSI3h1xsc8FTR6qz2BLXtvb-54"),
-"remember": DRIVE_LINK_PLACEHOLDER.format("1V1_XsYvvlCol_-ssGnSyXrOE8VRJnnLR"),
-"road": DRIVE_LINK_PLACEHOLDER.format("1dbqq7NmZwYuzHVhFW7GBwt0QEWmx-hpm"),
-"research": DRIVE_LINK_PLACEHOLDER.format("1zb_m0Xu9u28U_VxCxj4lFreMAfuMB1FU"),
-"relatives": DRIVE_LINK_PLACEHOLDER.format("1nXQ9c_8F9xvEbYAJpIlkSt1zqMDSgoSf"),
-"ready": DRIVE_LINK_PLACEHOLDER.format("1L1YhbXOF_OoFqwOk4h1CQn-PuzxycsQM"),
-"reverse": DRIVE_LINK_PLACEHOLDER.format("120rUgjdHTX0kJ1FbNYufeLINN6P_9vFB"),
-"return": DRIVE_LINK_PLACEHOLDER.format("1iX3gEzpd1CNKJW8oKrc7cw8ZkoNvoNk8"),
-"rest": DRIVE_LINK_PLACEHOLDER.format("1oN2dd5b3_h_zUiZTMhrL9Ovcb6Wvwiwd"),
-"repair": DRIVE_LINK_PLACEHOLDER.format("1IYvl_6qJRFlGaQ8vfCIWCqTvv4moCZqM"),
-"regular": DRIVE_LINK_PLACEHOLDER.format("1ZhDQOYInipBJnLMeJWXME8xbQFks2bVK"),
-"reduce": DRIVE_LINK_PLACEHOLDER.format("1sTHFiWi7yKgf52SQeeS7_73uJR69vUfO"),
-"recent": DRIVE_LINK_PLACEHOLDER.format("1cqTZloKXVPs0EZ1dpfZH87tcrtDNLfa2"),
-"read": DRIVE_LINK_PLACEHOLDER.format("1gRAASx4AcQkLCu9n0FF-pA3ZSagearyT"),
-"rare": DRIVE_LINK_PLACEHOLDER.format("1KpQ7bR_fLthdKMViGE-U5oZ0W3NHBCvu"),
-"rank": DRIVE_LINK_PLACEHOLDER.format("1G_JJI043WIFW-VXRh_nxSqhbmhwWNOoO"),
-"reason": DRIVE_LINK_PLACEHOLDER.format("1j84UlwRhikkhVstPb3ECRU1Wt6L2ptVl"),
-"ribs": DRIVE_LINK_PLACEHOLDER.format("1BGkVEt0HlcrPG0ejyMJR3hfuZyANRRHd"),
-"radiology": DRIVE_LINK_PLACEHOLDER.format("1BRhbgaswQz2Xi65iPw82C1LnyzTKQwem"),
-"radiographers": DRIVE_LINK_PLACEHOLDER.format("1N2hjmuBHK92YiFf_V9hSGCoE6gmH192m"),
-"revolution": DRIVE_LINK_PLACEHOLDER.format("1f_YqRU-xl-9y-4ix8cEi-1o1dSe_f85S"),
-"rotation": DRIVE_LINK_PLACEHOLDER.format("1EOKBV0ZImYglQtNCQJa4lPovXf9CWh70"),
-"reptiles": DRIVE_LINK_PLACEHOLDER.format("1teijBJ-KO9XFVQY-r51i9YgpTl2dnbdX"),
-"refrigerator": DRIVE_LINK_PLACEHOLDER.format("1LFfCD0kUIQN5lxrZBcAqS5wWRFybrGNB"),
-"slide": DRIVE_LINK_PLACEHOLDER.format("1NjcHMeBsSE5fNMmrsLGFAawGk_RttJp9"),
-"secular": DRIVE_LINK_PLACEHOLDER.format("1mK85R2Xn4wImjOktahUPFwL6gIyyeT7U"),
-"scheme": DRIVE_LINK_PLACEHOLDER.format("18Lh3lsaqNJrqchgKxBRS0ETdSd2dl9EV"),
-"silt": DRIVE_LINK_PLACEHOLDER.format("1UBGHDKUjRaCpF-174GCdbQ5dE6fKSB2S"),
-"sewage": DRIVE_LINK_PLACEHOLDER.format("11uaAK5WTLT7IcvIggFWkYvIi_xsFipQ_"),
-"symmetry": DRIVE_LINK_PLACEHOLDER.format("1LA5pC5c_F5ONEaQQrA-tBg-ClJbtkxa4"),
-"subtitles": DRIVE_LINK_PLACEHOLDER.format("1RcONBe9e75xaI3FmcnuZ0yxrODvJD-yj"),
-"sauce": DRIVE_LINK_PLACEHOLDER.format("10KTZuS5fpUuvlX1-AzNxdQgm-mmzJTq5"),
-"srinagar": DRIVE_LINK_PLACEHOLDER.format("1_FoBVUfWrosyEQUBjKIeXQulLsHP4_Ql"),
-"symbol": DRIVE_LINK_PLACEHOLDER.format("1JfhJsBqC5BbFlu5k4Gz3vCvgjeKVLtl9"),
-"subcontinent": DRIVE_LINK_PLACEHOLDER.format("1lh20AGRLxhS4lWw5kqJlXA4hXM6UiAPU"),
-"source": DRIVE_LINK_PLACEHOLDER.format("1FQak60P0yC8uCOzuaZMGqYJbHxzCyrae"),
-"survivor": DRIVE_LINK_PLACEHOLDER.format("16Jvlmrj9FxoJ3VFBZelK3aqFXvEA4aNR"),
-"sentence": DRIVE_LINK_PLACEHOLDER.format("1rMZoFMyJ4U1BRNIhnnjgckBroETjLkjR"),
-"stereotype": DRIVE_LINK_PLACEHOLDER.format("10OZmGOMieNdKyysJeVR0EWfeMDQYU_Y-"),
-"speed": DRIVE_LINK_PLACEHOLDER.format("1tWOHedYEb85t8aoEBUR-_C7PZ6GXn37W"),
-"solid": DRIVE_LINK_PLACEHOLDER.format("1ltfcE1fh__-X7t_AfP2t1IulYDD8EU6K"),
-"shrub": DRIVE_LINK_PLACEHOLDER.format("1-Gast_Cv5bXzpkQCTqQZ1jyGsPGgk0yF"),
-"successor": DRIVE_LINK_PLACEHOLDER.format("17kbhOvEOhHf5X3CrbxDSGepFTuGMg-qB"),
-"smallest": DRIVE_LINK_PLACEHOLDER.format("1TYU0lHJfhWerCJqiphMjDOAuDsnmNGLD"),
-"scale": DRIVE_LINK_PLACEHOLDER.format("1CyKHrmJVnvGvHd4Lh5LvvHN5dJNafmxC"),
-"sphere": DRIVE_LINK_PLACEHOLDER.format("1Pi-myaxJPdORSaLQkRfeqAJDylyICoQQ"),
-"square": DRIVE_LINK_PLACEHOLDER.format("1y81d-oLKDJBtUulYbUGmm1ZNMgWE4DH8"),
-"segment": DRIVE_LINK_PLACEHOLDER.format("1_SZRjjiIGqFGwE6PcJVkXndxz-hygQfO"),
-"sector": DRIVE_LINK_PLACEHOLDER.format("1Q_TTQtHEmq9YLH9k5CpANLLHWkZZ-3fd"),
-"side": DRIVE_LINK_PLACEHOLDER.format("1a_LyXkoOVJi4nI1-duK4Da95smsv5yGC"),
-"satavahanas": DRIVE_LINK_PLACEHOLDER.format("1sJl4vhj8K_BX5FDMF25WwGZubFmpRGKD"),
-"site": DRIVE_LINK_PLACEHOLDER.format("1BrNdT2EB7D4aXnEOFt-knIHMC5lLGk2N"),
-"shrine": DRIVE_LINK_PLACEHOLDER.format("1oN5aGEbVVwsRKj4Ia9J7wcE8IHMZk-40"),
-"sangam": DRIVE_LINK_PLACEHOLDER.format("1pXYz70d9iK6Wm25_9vOFrnbNmi45jAgk"),
-"shudra": DRIVE_LINK_PLACEHOLDER.format("1PVCyNqA9UQzLG03AodtTs_BxEkp71iE0"),
-"sage": DRIVE_LINK_PLACEHOLDER.format("1iJ7W70bW_cwtzY8LGhIqtVAESm2PfzrR"),
-"specialist": DRIVE_LINK_PLACEHOLDER.format("1IhHTPM2nD7XQcfslW6dLlOLOpuarYvq-"),
-"settlement": DRIVE_LINK_PLACEHOLDER.format("1M8oDKFu3fia7Rm4Bie7L3hzktMyghffT"),
-"scribe": DRIVE_LINK_PLACEHOLDER.format("18b3Dp2szeyG8BspaFB5tAwzXVs4BRmz2"),
-"sacrifice": DRIVE_LINK_PLACEHOLDER.format("1HrDUlEnZ1qzzNGohPG6NZ-taJWsZozCm"),
-"samudragupta": DRIVE_LINK_PLACEHOLDER.format("1k79_DPCau58LQ4uLR0qRS82H3ktejT1a"),
-"stupa": DRIVE_LINK_PLACEHOLDER.format("1UM0NvIVV70izuLLgfxG3wrPLXpU-BWA2"),
-"sikkim": DRIVE_LINK_PLACEHOLDER.format("1PD3fThJ3mi8PUvyW72ZDlNwL6ZNGBNcm"),
-"shimla": DRIVE_LINK_PLACEHOLDER.format("1DLdjbYPo9xZ4PMwZ8gJdTm6UqZucf8tb"),
-"shillong": DRIVE_LINK_PLACEHOLDER.format("1CFsG5pn6tWii4I5vU_EvftfnhFWpveLA"),
-"surat": DRIVE_LINK_PLACEHOLDER.format("1p6Knnw3YbDfqtzBQmlVLtz5e3bGbENGY"),
-"sanctions": DRIVE_LINK_PLACEHOLDER.format("1yPsP4hpVXDGwIcS09fM-Z-LyI04WLJw2"),
-"securities": DRIVE_LINK_PLACEHOLDER.format("1_eh-JOIloRLblS2paCEKUc4DpLPvk2cH"),
-"swaps": DRIVE_LINK_PLACEHOLDER.format("1rArJZ7lFupZoycJ3j6uQLUAT7VXkH5TZ"),
-"signatory": DRIVE_LINK_PLACEHOLDER.format("13HV7BerVMx7ppvMODa3_D7FhaelVEAlx"),
-"stock": DRIVE_LINK_PLACEHOLDER.format("1zduhcY1TUc4l2UkfUiiDEtlgFia_88Wz"),
-"shareholder": DRIVE_LINK_PLACEHOLDER.format("1yxzZXraph03Iixb5v89gYvUMXv3mCvsc"),
-"speculator": DRIVE_LINK_PLACEHOLDER.format("1R-Ls7yx82DqqWgfuQCEn9KVMLsm3_IWL"),
-"subsidiary": DRIVE_LINK_PLACEHOLDER.format("1H_HdB5wX1kT30V2eTenFq0ZCitGWZ8FJ"),
-"subtropical": DRIVE_LINK_PLACEHOLDER.format("1tDGQMa-PMmQJWr9K_u2fy65EckHO3rAw"),
-"shrubs": DRIVE_LINK_PLACEHOLDER.format("1sdYRpOxIFBhvfYGeloBTVAly4GZrv_0o"),
-"station": DRIVE_LINK_PLACEHOLDER.format("1hW-fsVdvbJox23Tv1702MszJdtuD99Re"),
-"speedometer": DRIVE_LINK_PLACEHOLDER.format("1NjDgiWMPqfSmA4jYIGoH2Ic7kcA6p2TH"),
-"swellings": DRIVE_LINK_PLACEHOLDER.format("1KurRBbUXEyvJxLYFSuuj1cTdV-GXFwOE"),
-"sterilization": DRIVE_LINK_PLACEHOLDER.format("1tXHDBzCuQi9oy8tgmmaQ9_Km6bigjL0U"),
-"stags": DRIVE_LINK_PLACEHOLDER.format("1xQx0ZB5tbi2iR6XGaAenIxwGpCMT_gfa"),
-"silage": DRIVE_LINK_PLACEHOLDER.format("1kA0MWCRqQNZdDwZViVcIM739JxQHucHf"),
-"sucker": DRIVE_LINK_PLACEHOLDER.format("1B6oe7e6E0-V1Zwl00FmsV48Hjm37lGJv"),
-"semicolon": DRIVE_LINK_PLACEHOLDER.format("1brmWP0LK3Eeum2LPJk4B9Lu_p9c9zQx1"),
-"sustaining": DRIVE_LINK_PLACEHOLDER.format("13-yzNM8tWo1-DGn-1kmPTDMQG3sYxssY"),
-"structure": DRIVE_LINK_PLACEHOLDER.format("1SRoA32bi5Xp1dX4utIwywuDrJdYgm0DG"),
-"strom": DRIVE_LINK_PLACEHOLDER.format("1nw6a3xCajCvenLd_LdGKVZczSkGMzuV2"),
-"spinning": DRIVE_LINK_PLACEHOLDER.format("1Hvl9yQVHQlQkxPBtfSlARC89M6yfqIRX"),
-"sew": DRIVE_LINK_PLACEHOLDER.format("1VtLjFLG3hCytRvq5Qe6rqcjwFSEM5EwR"),
-"spot": DRIVE_LINK_PLACEHOLDER.format("1yu7L5aTk4Z5_bdsJ2UY6wepSXfdP1GLU"),
-"separated": DRIVE_LINK_PLACEHOLDER.format("1jH1MzZUxt-Ide9ESu1N_ts-6SRu2g60o"),
-"shut": DRIVE_LINK_PLACEHOLDER.format("1f7NVAL_ND_T-4BjH41_qtwdJ5J_iTM1X"),
-"spell": DRIVE_LINK_PLACEHOLDER.format("1cKAltFftXVaiHzySkHIaNk89XqYhBFp1"),
-"spend": DRIVE_LINK_PLACEHOLDER.format("1zCvw7b7Euj1wnNtmCzX3Mwy3uFi1hYEo"),
-"steal": DRIVE_LINK_PLACEHOLDER.format("1oek7U_V6MOnoGo5GDgoQ246ImLXfU173"),
-"superimposing": DRIVE_LINK_PLACEHOLDER.format("1ajacp5do4MGz8b5JVn5DMK_RnGLqEK8M"),
-"starred": DRIVE_LINK_PLACEHOLDER.format("1JXo9xsdhfZZrHbFRK6p4y8Lnr8IQw4oD"),
-"snoozed": DRIVE_LINK_PLACEHOLDER.format("1cucqCgrruZF_n9ytg28PspnqDD2EswFI"),
-"snippets": DRIVE_LINK_PLACEHOLDER.format("1O2n_3ViiuRad2N0QZ5_iNgfCwkjUB48C"),
-"simulation": DRIVE_LINK_PLACEHOLDER.format("1kTN4XYgTFq82gMynXvVfoUZ1f7r6xfiq"),
-"slice": DRIVE_LINK_PLACEHOLDER.format("1VvcnqV5pNNbqRr1IA8oR-1aRMORtoaPA"),
-"shiver": DRIVE_LINK_PLACEHOLDER.format("1EpICG5cqu-Q_6TKk0Mtroolbwnz-V7X7"),
-"section": DRIVE_LINK_PLACEHOLDER.format("1ne-mplINcT7mS3K7-H2eBI7spOiAxuLv"),
-"storyboard": DRIVE_LINK_PLACEHOLDER.format("1QSqVUGjfM1YkZUBxnIOPm9kUKZs5j1yP"),
-"streaming": DRIVE_LINK_PLACEHOLDER.format("1X8MYoYq0t8AsB5y8Tzi0f0ZMpM6idtGE"),
-"spider": DRIVE_LINK_PLACEHOLDER.format("198Vfn2RsRV5dz6S-S29_wVC-QnbX_JZX"),
-"slug": DRIVE_LINK_PLACEHOLDER.format("12xBFgjXdn2tylg3itIQgEqy0096HoCmS"),
-"slaughter": DRIVE_LINK_PLACEHOLDER.format("12kDVWY5IvKIf14-r4Bc3YW7s6QQ9QCfh"),
-"submarine": DRIVE_LINK_PLACEHOLDER.format("1esAY39e5v2kV2YzHMFcCAX7DHDlqc3Ho"),
-"surrender": DRIVE_LINK_PLACEHOLDER.format("1R7nF4M03FoJI2HqhXGeOZDhiQXOrp007"),
-"statistics": DRIVE_LINK_PLACEHOLDER.format("1Y9BJaZ0FNLretNo60aKOHGbvRZbwvcLW"),
-"specificity": DRIVE_LINK_PLACEHOLDER.format("1gg7b6ERZ2k5CgB_PZROBgs3JfNob4-vb"),
-"sift": DRIVE_LINK_PLACEHOLDER.format("18ZM-no5wqS-m2NzxxXEuTQJM9JuEnVDE"),
-"shred": DRIVE_LINK_PLACEHOLDER.format("1r1bwtKGx-fN3xZiI37q_3TDHV6_NJM4Z"),
-"stumps": DRIVE_LINK_PLACEHOLDER.format("1FoXcYmVjPMDgsgf9tNETWclk5nhK00t2"),
-"shading": DRIVE_LINK_PLACEHOLDER.format("1nzipOL8YGLhYYmGw1ALZqxMtc0RWYyPH"),
-"serif": DRIVE_LINK_PLACEHOLDER.format("1YGfPdiwTEbeD_gQk4kUQuPT6SapiAsu2"),
-"saturation": DRIVE_LINK_PLACEHOLDER.format("1ka39HABo_NLmQj8fQ8wM3NIV_TOtYryb"),
-"solo": DRIVE_LINK_PLACEHOLDER.format("1YVHYeAa-P9dwBGegfyggapglZSb7hjpE"),
-"serial": DRIVE_LINK_PLACEHOLDER.format("11fhDWo4pQu3YSYv6J7HCl-dZNhetpepy"),
-"summary": DRIVE_LINK_PLACEHOLDER.format("1Y4SlqFvKYQrjiK4X7GIyZdwnYXj-XLZI"),
-"sulphur": DRIVE_LINK_PLACEHOLDER.format("1XwPySLy7vT7pqD7SL9F1YG9uJXTkgpA7"),
-"stanza": DRIVE_LINK_PLACEHOLDER.format("1iA9jB1v_x3B8JESdqP6p5z9wyuUB0D8Z"),
-"spherical_lenses": DRIVE_LINK_PLACEHOLDER.format("1DnAerEb2XwOWG8m0C7PNC7SZmnBQOxCb"),
-"speaker": DRIVE_LINK_PLACEHOLDER.format("1exZzTO7RbHxDxeEdxWMbZKBUhmr5AVHd"),
-"spectrum": DRIVE_LINK_PLACEHOLDER.format("1qNuJffeaxIekC4vEH8R15VuAlKRfjtFT"),
-"sorting": DRIVE_LINK_PLACEHOLDER.format("1IxFilr-w2yDbH_gR3_lQ2gCq5T1nqYB7"),
-"sodium": DRIVE_LINK_PLACEHOLDER.format("1G_JsaQxMN_4ywCpSJoocyy2flDa_fNI8"),
-"silicon": DRIVE_LINK_PLACEHOLDER.format("1Nn7GXPy4oLWfa25gl3LeooBBz3nOJQhC"),
-"shearing": DRIVE_LINK_PLACEHOLDER.format("1KsPp6YsHZ7D__9LOG3go6wQc3BI2nwnc"),
-"sentences": DRIVE_LINK_PLACEHOLDER.format("1FVNAysuOyXr-_kOyuFBbTDZdZB8mBDqE"),
-"scouring": DRIVE_LINK_PLACEHOLDER.format("1QijPsx-wR00RKBKg6CYXs3lHEqvu0TMA"),
-"shutter": DRIVE_LINK_PLACEHOLDER.format("1JdW8yUmBwvFgia0upt8a99UCWS6pwUP0"),
-"sealent": DRIVE_LINK_PLACEHOLDER.format("1tTHwq2yFo5OhftR8-9qXbjQFCeAMFlMH"),
-"studio": DRIVE_LINK_PLACEHOLDER.format("1AvtADEA6ENXoQq6livbv5gCxZ7NpsJ3T"),
-"stepwell": DRIVE_LINK_PLACEHOLDER.format("187VDUKGG_oSBol_LpbA5oJRsSAc-uuxx"),
-"sink": DRIVE_LINK_PLACEHOLDER.format("1oqL7WRsnVop4S5MZx5Y7HNJ-UhHzMD_y"),
-"seeds": DRIVE_LINK_PLACEHOLDER.format("1LCJsQoiUGx57k72jZSqw-C_9mfrKxvvy"),
-"seashore": DRIVE_LINK_PLACEHOLDER.format("184N9O61N8QBbhHUdDezpVOty9to4UbVA"),
-"stepfather": DRIVE_LINK_PLACEHOLDER.format("1qBMwoD91BEMHuePtBapxET2BqcRZaYe7"),
-"site": DRIVE_LINK_PLACEHOLDER.format("1jprafPgZS6_vz0mvJ1YFDBcADpDuuOYn"),
-"spiral": DRIVE_LINK_PLACEHOLDER.format("1lv8XTZm2nIHL7ERuAziCaC4ybzWzhmv2"),
-"serious": DRIVE_LINK_PLACEHOLDER.format("1wFEswjLx_7BZOYZPX3hDiZIVZ6dAduHi"),
-"sodicity": DRIVE_LINK_PLACEHOLDER.format("1VlX3vcv5w0b4bevsvlJjZlG7avzT444r"),
-"screech": DRIVE_LINK_PLACEHOLDER.format("10oGA20ajknKgGzZqo3Zb5zfGRu9hnmkp"),
-"scream": DRIVE_LINK_PLACEHOLDER.format("1WxVuZZR-cinkMe7huQNY_axj2SclqwkD"),
-"stir": DRIVE_LINK_PLACEHOLDER.format("17R-mcZiwEdg5lEd4fs2xupFOUE9-Z93U"),
-"steep": DRIVE_LINK_PLACEHOLDER.format("1PG3OolG63oMIDzrgvhO8cwsUUbg-AOgw"),
-"surfing": DRIVE_LINK_PLACEHOLDER.format("1pj0IkOaVc8gDzt9vIH6KilEgoCT-GBta"),
-"suspect": DRIVE_LINK_PLACEHOLDER.format("1RJlcnlmVCkatUAuMCgcoxICGt0qeRBUh"),
-"synonymy": DRIVE_LINK_PLACEHOLDER.format("1-4JXew4HF7bDYVAiXPfbwZX_vNEkvnHd"),
-"savannahs": DRIVE_LINK_PLACEHOLDER.format("1Wu8tXlNyplrC2QPCvuUHRSu1Wo6s2yvQ"),
-"sample": DRIVE_LINK_PLACEHOLDER.format("1f666dem6iP5MJJc1u_tAMc1yI_LmKsLC"),
-"stable": DRIVE_LINK_PLACEHOLDER.format("1QESOPKDk_zEuEZ42xD1sjaWt-p1epJN4"),
-"snorkelling": DRIVE_LINK_PLACEHOLDER.format("1cMxaZKgw4f5XkOgJ89HDjt8SGLn-9vo8"),
-"shooting": DRIVE_LINK_PLACEHOLDER.format("1P_MZFnaLN2mRXOaug5dOIXd1q2Wd6FBy"),
-"simmer": DRIVE_LINK_PLACEHOLDER.format("1ugMzbp3PuqM6RnFO99eG3hQk2i4HYWFs"),
-"surface": DRIVE_LINK_PLACEHOLDER.format("1lQFZQlVqYGGvILmEJNhfgqenQDJWOmod"),
-"spacecraft": DRIVE_LINK_PLACEHOLDER.format("1L5TD7S5GJktD6LsIGMib0O8gikTA15jm"),
-"stenographer": DRIVE_LINK_PLACEHOLDER.format("1x1xT2CFM_RC5iziIfRhFtNI6CeFeHd8w"),
-"speakers": DRIVE_LINK_PLACEHOLDER.format("1yCXsMkRnVPbRw6fnztILv3MOA6HT3tE8"),
-"spin": DRIVE_LINK_PLACEHOLDER.format("1yqberM4jcpTbK37BF4eXIfsSUd7Xs1IU"),
-"sonipat": DRIVE_LINK_PLACEHOLDER.format("1SeJyFsk7SUgwbpDfhj65sMJaa5i1u0b3"),
-"sin": DRIVE_LINK_PLACEHOLDER.format("12U8jWP98s0cuWMFaGRHi89BGuKA49HiA"),
-"stand": DRIVE_LINK_PLACEHOLDER.format("10ZSN296cngfQhSyjUgucRcWb6mXYJcJm"),
-"subtraction": DRIVE_LINK_PLACEHOLDER.format("1ng8p_Je_y9oKuP1CD9c35OeNDAjMoZdf"),
-"syllabus": DRIVE_LINK_PLACEHOLDER.format("11mQ9ERj9UuzyeXImmbreKwijCbbrz1kp"),
-"surcharge": DRIVE_LINK_PLACEHOLDER.format("14jBbPCi_j7KHbmzOh90ThYCPEZTDvVww"),
-"summon": DRIVE_LINK_PLACEHOLDER.format("1KJdHnqw2lRuQJdAX20UK5HPUoXKchG-e"),
-"stalking": DRIVE_LINK_PLACEHOLDER.format("1w-J4ODuMfb46pOp_2U_jJ7gXS594gbPP"),
-"snail": DRIVE_LINK_PLACEHOLDER.format("1BkuyNxPr_EnijVpzsJbieaemFeDUKVWM"),
-"simile": DRIVE_LINK_PLACEHOLDER.format("1Qjt5XRJR0TR4eazp1CPILShSsxHyJlX2"),
-"sailboat": DRIVE_LINK_PLACEHOLDER.format("1DV_2q2lL-q719Td7fyFoJvSLDLXQkTAf"),
-"sieving": DRIVE_LINK_PLACEHOLDER.format("16s7rmIjSro2Bu3vg8d2uf8QFHoux3gPB"),
-"slave": DRIVE_LINK_PLACEHOLDER.format("1qxsVNSqbNK0EtWahrQiW5x6NS-x4Wonl"),
-"sericulture": DRIVE_LINK_PLACEHOLDER.format("17qzPX5Bx9FTfrvEPlurTx-PDSfhpoaws"),
-"settlement": DRIVE_LINK_PLACEHOLDER.format("1OUT_Q9P1jB6R6Vecc8Lam2yj1aEeyvnG"),
-"saprotrophs": DRIVE_LINK_PLACEHOLDER.format("1iA8uUsONUTyT8VSLEXrZHq1gEaGBeEc2"),
-"stage": DRIVE_LINK_PLACEHOLDER.format("1ikWqI9bdQP_r9l5HSbh9n4akWHIh0MqR"),
-"son": DRIVE_LINK_PLACEHOLDER.format("1YysT-Q6WQHRe_IZo_i54H8c8PTlBc6mB"),
-"sister": DRIVE_LINK_PLACEHOLDER.format("1b-0oNnH0zSbYYTVZjDNSsPPvhW3Ev7rq"),
-"service": DRIVE_LINK_PLACEHOLDER.format("1ezi-x_kCj1xsLyNvoj2HQflOTPQ7SryU"),
-"syntax": DRIVE_LINK_PLACEHOLDER.format("1Jw0iN0b9jKkI7sMffWoRJCTrMKuGigHA"),
-"symbols": DRIVE_LINK_PLACEHOLDER.format("1oleOt_jo55Y2C1CfhDjM2MUTyx7CkG7z"),
-"subcontinent": DRIVE_LINK_PLACEHOLDER.format("1b9SGc5e8hP5dD9n0euR9VWsaPr9DnZyl"),
-"stomata": DRIVE_LINK_PLACEHOLDER.format("1qSPTslby6iqiouMZyBmbnYkjcrGymmYs"),
-"stocks": DRIVE_LINK_PLACEHOLDER.format("1LeLRKcTMlJjwZOWLyz7s1r7EDX93vZT9"),
-"stereotype": DRIVE_LINK_PLACEHOLDER.format("1Lp0G0pltiY-LpBtTmO9MzYrPT4V76Nqy"),
-"sphinx": DRIVE_LINK_PLACEHOLDER.format("1NTAjs_HAdMNX6jyZGSjbAM7lrriYkWAH"),
-"sociolinguistics": DRIVE_LINK_PLACEHOLDER.format("1ISW3HjHUUQYFEnB1VUL9KuhmD5VH0ETf"),
-"sonorous": DRIVE_LINK_PLACEHOLDER.format("1HIib0--XahIdMjHf3PAql98JTVAVJtiJ"),
-"semantics": DRIVE_LINK_PLACEHOLDER.format("13Ri1TTSFW_7WCsWK83zpEB25fdEvJ0Xs"),
-"seismograph": DRIVE_LINK_PLACEHOLDER.format("1g0uNG50OdwoxpkaMJCbpMoTv9s6YbF-B"),
-"sarpanch": DRIVE_LINK_PLACEHOLDER.format("1MUN7CLQjv-wMetdGFf7ElqtxEIH2PIO6"),
-"sanitation": DRIVE_LINK_PLACEHOLDER.format("1JjHTrFh-2pJVywVp4EBSgMeUfTBQCBXw"),
-"shopkeeper": DRIVE_LINK_PLACEHOLDER.format("1tuYkPNiYbC-_FuslJGs7yRQTf-7EgJ3B"),
-"servant": DRIVE_LINK_PLACEHOLDER.format("1dIbDbatc2uMzmLhsXgvpy7azBbfvZe4P"),
-"secretary": DRIVE_LINK_PLACEHOLDER.format("1UxlZxpcDAvklf1-Ag2a71P6k-LvakovI"),
-"scientist": DRIVE_LINK_PLACEHOLDER.format("169qX_VVc5UgF1yK8XjRuL7QPlYtxAKKH"),
-"salesman": DRIVE_LINK_PLACEHOLDER.format("1yEeLnqgSvePlLlBOUVjBixfmAJikYoh6"),
-"sailor": DRIVE_LINK_PLACEHOLDER.format("1omX4Wm-3hWB_WwLbjdlllS-IUHZO_ewu"),
-"shiva": DRIVE_LINK_PLACEHOLDER.format("1B2xu1luFxtEfI_sRy3_A-upSxblXACPn"),
-"saraswati": DRIVE_LINK_PLACEHOLDER.format("1Gy7bHDkvHuYLI_LZZofYqg0sox5UsXDr"),
-"saibaba": DRIVE_LINK_PLACEHOLDER.format("1qMFwl6QZlaeSqeiJ_VDgpC46ia8GVrVY"),
-"size": DRIVE_LINK_PLACEHOLDER.format("17XlK_czMtZ7fdFTUR2Qo4gzVuIpEBC3C"),
-"shallow": DRIVE_LINK_PLACEHOLDER.format("1GvQ4mkuu6NRTXt30OtW24Ojb4f_19hLf"),
-"shower": DRIVE_LINK_PLACEHOLDER.format("1rwLBNNyig42ybsXF5ixJtLVvVKotd5bk"),
-"shocked": DRIVE_LINK_PLACEHOLDER.format("1BeuDN_c1MOmrbBvuiDRKkC7g5pm7RZgM"),
-"sufism": DRIVE_LINK_PLACEHOLDER.format("1fwDL9kFodt6s0EO_XhnQbpJ4vRy8swKz"),
-"samsung": DRIVE_LINK_PLACEHOLDER.format("16TocdL6vDUTgk8VCJ7HsZPq96ioe_2Kw"),
-"stumps": DRIVE_LINK_PLACEHOLDER.format("1FVYdHFto_cRTDdP1rgBQHEIjRj7iqA0a"),
-"six": DRIVE_LINK_PLACEHOLDER.format("1QxJwRp6LWOpl_HDbY3swc5iNGAaTdD9V"),
-"swing": DRIVE_LINK_PLACEHOLDER.format("1ZfZ0XeqqvU4iWZDOF4FxoevnglXKPYtJ"),
-"starfish": DRIVE_LINK_PLACEHOLDER.format("1eGLKg2N4IsTCrdaiecr8Bs4SjCIzdjGT"),
-"shark": DRIVE_LINK_PLACEHOLDER.format("1V80VHubdgYOeAF4C8jg4_2w7u9cciGT2"),
-"sandwich": DRIVE_LINK_PLACEHOLDER.format("1pGCgoYdTm6OLPAAHThUx3DSvhM2MYwd2"),
-"snow": DRIVE_LINK_PLACEHOLDER.format("1aiFL5TwQG-Z8NrgJ0CK5au00B477L4Vs"),
-"slippers": DRIVE_LINK_PLACEHOLDER.format("1iD6j_DA_IluMMoJQ63wXpNTfncpIx-ku"),
-"sari": DRIVE_LINK_PLACEHOLDER.format("1LdE6Vvs8JzlZr_EUr48tg9l6yioXD4Yf"),
-"starvation": DRIVE_LINK_PLACEHOLDER.format("1WXzLVnTIatfSeo8gq3jk53YxCQg4D0rD"),
-"squint": DRIVE_LINK_PLACEHOLDER.format("10REmWWaWWgEoocSo7ZrKPPx4SOX6SWq-"),
-"spondylitis": DRIVE_LINK_PLACEHOLDER.format("1BN9C4-GckqT6dpKVMtHq6mnevEGrMRFL"),
-"sinusitis": DRIVE_LINK_PLACEHOLDER.format("1B50F_n8rByzKlYYP2Hk4d1PATyMFrtZ5"),
-"soft": DRIVE_LINK_PLACEHOLDER.format("1qr9Ca8NjTL3sOhiPDoLbYmTBFLsq03xD"),
-"shoot": DRIVE_LINK_PLACEHOLDER.format("1043QRrJGt6Xpj8LuCxa0g4oqdqnb7HhV"),
-"shock": DRIVE_LINK_PLACEHOLDER.format("1xB0KvGlRsmrX1GvV_6wkMtb7_ahah_pr"),
-"swimming": DRIVE_LINK_PLACEHOLDER.format("1vMXvpooLfvxqX7dcP8mz8mkPWh0XlGfX"),
-"skating": DRIVE_LINK_PLACEHOLDER.format("1OQyUrw7DRfXLXK6YF5PYQP4P10B3wY1G"),
-"starve": DRIVE_LINK_PLACEHOLDER.format("1kTgZWpM3Ku3sBQiYJubfl9tSU9uIxcLR"),
-"staff": DRIVE_LINK_PLACEHOLDER.format("1493iZ4BxKSuzIe80gLhCvDidGINlKRag"),
-"spatula": DRIVE_LINK_PLACEHOLDER.format("1InLNDLtmYZgR0SMolSq4IAyG9Qw-LB4M"),
-"seize": DRIVE_LINK_PLACEHOLDER.format("1evaZvkKWIVK0h1zou5lbZ91XSU5X0s6K"),
-"syrup": DRIVE_LINK_PLACEHOLDER.format("1zp2L0dtmZxtbJA43bO026lCW3yhqkKSB"),
-"syringe": DRIVE_LINK_PLACEHOLDER.format("1KF5sBbf3HZmojshQsk4HEte2ucqQVtkB"),
-"syphilis": DRIVE_LINK_PLACEHOLDER.format("1jxRG70o5u0RvPpRwlyssNNgDBIMeSF7M"),
-"syndrome": DRIVE_LINK_PLACEHOLDER.format("1N5rpnoj_xaA4gMvGf8gvm3KlgQ3900g6"),
-"syncope": DRIVE_LINK_PLACEHOLDER.format("119CV50ILwjO7eXFzF_UGFkX_Tyqe-OkN"),
-"symptom": DRIVE_LINK_PLACEHOLDER.format("1xW5WhdvooV5SqkGhxaxWx0J193PrvHCZ"),
-"swelling": DRIVE_LINK_PLACEHOLDER.format("1UoUQKDaDu4BGw2WGhyQMC5grxSeF7IxW"),
-"swab": DRIVE_LINK_PLACEHOLDER.format("1FUjmbtN1vTmSKgSl0xuhMYTHGDMQnSKE"),
-"suture": DRIVE_LINK_PLACEHOLDER.format("1r_GOFJlDrMDY0vvGYoLj4FMBbKxkaHT4"),
-"surgery": DRIVE_LINK_PLACEHOLDER.format("1ZcoXS2rDDn3VVPvUkeUhcdg3IUisdisj"),
-"suntan": DRIVE_LINK_PLACEHOLDER.format("1isUFEkLWnOSlgtetVu8ZFRbjiTOmkMXo"),
-"sunscreen": DRIVE_LINK_PLACEHOLDER.format("1aRyHzgDuYw_JYxO8L11gzdclcQe04hQl"),
-"sunburn": DRIVE_LINK_PLACEHOLDER.format("1GXlZpFDVwouCBkhHJcGa0U-xx4oGOnEN"),
-"suicide": DRIVE_LINK_PLACEHOLDER.format("1qz64kZy39FR1LZV0b51d8D0RhmKcdbY0"),
-"stretcher": DRIVE_LINK_PLACEHOLDER.format("19EU_PfnLx553qQameY67bj4xnphhWOJT"),
-"sterilizer": DRIVE_LINK_PLACEHOLDER.format("1zvXUDBhhyXoAzCtQrztK5u7VQo-bc0JH"),
-"sputum": DRIVE_LINK_PLACEHOLDER.format("1eabYz26W_QxsGB7DPKLpah4RgguUCfZz"),
-"sprain": DRIVE_LINK_PLACEHOLDER.format("1TKSKMR4Bi27vGzPIh7p8n2upnQnaAy9E"),
-"spleen": DRIVE_LINK_PLACEHOLDER.format("1EAsdOnebE3p3C8h66hbukyTw3gvZ96V-"),
-"spasm": DRIVE_LINK_PLACEHOLDER.format("13bwD9Iih2BYOmnSvfKs6tZAacJBHMsHs"),
-"snore": DRIVE_LINK_PLACEHOLDER.format("1sv8_3Ays36PwAgJ8j50lIL3gddO5NNzV"),
-"sneeze": DRIVE_LINK_PLACEHOLDER.format("1tA0KRgZN-OoqgDf3JKNOH48XXbPCmMW3"),
-"sleepwalking": DRIVE_LINK_PLACEHOLDER.format("15Znr2OwCxzpq2p8goOYovzxLeHbVRvjQ"),
-"sepsis": DRIVE_LINK_PLACEHOLDER.format("1J9okdAzYJql_7LOPdOaRv9lkiceBqKWc"),
-"seizure": DRIVE_LINK_PLACEHOLDER.format("1pev3E6P0fSDLw07CoTt9ZXqOtiwPyq9k"),
-"sedative": DRIVE_LINK_PLACEHOLDER.format("1VnnNfvdUZwW6pDhP54LtTf1pY9iQMJES"),
-"scoliosis": DRIVE_LINK_PLACEHOLDER.format("1rWa7IDSyxN7Oeegzn-2azT-N5ESQ9bGD"),
-"sciatica": DRIVE_LINK_PLACEHOLDER.format("1tntrhd7KzOzekQoe3ioIvq91fO1LL1-u"),
-"scar": DRIVE_LINK_PLACEHOLDER.format("1OXj8Gd8Q-Ed7s67MtZQLopkUmvqJ-OE1"),
-"scapula": DRIVE_LINK_PLACEHOLDER.format("13BzQHyOMN-jgPCcJ3eXxvbNl66cxMxvi"),
-"scalp": DRIVE_LINK_PLACEHOLDER.format("108epXCuGVKHXDt26mxoE0MxJj5lCIsW-"),
-"scabies": DRIVE_LINK_PLACEHOLDER.format("12f-yk-dBP4IqO0fvJygSZgJ6_SjGcBYG"),
-"saliva": DRIVE_LINK_PLACEHOLDER.format("1Z0yklRi40uq4nYZrGJWuO257-m7k12r6"),
-"sikhism": DRIVE_LINK_PLACEHOLDER.format("16SMtAsLsuPswNs1-LGS4bV8_z8YkJw1N"),
-"sikh": DRIVE_LINK_PLACEHOLDER.format("16SMtAsLsuPswNs1-LGS4bV8_z8YkJw1N"),
-"sperm": DRIVE_LINK_PLACEHOLDER.format("1q3HRkLhfmzAxtug175E5PbEUkVCOm6t_"),
-"syria": DRIVE_LINK_PLACEHOLDER.format("10l3L7NOExrpw2jjYnEY4LyojKgjAM2ct"),
-"switzerland": DRIVE_LINK_PLACEHOLDER.format("12lAhtGiAuDmrGzpx9Upp4mplhxoqWlxl"),
-"sweden": DRIVE_LINK_PLACEHOLDER.format("1klM1sBcMouhoEnExC09Cl5juqDEe4A6F"),
-"swaziland": DRIVE_LINK_PLACEHOLDER.format("1yTbsp8NJiclglmMaT2bxU2PR3tLLAs1T"),
-"sudan": DRIVE_LINK_PLACEHOLDER.format("1jtVHpQf9G73YBPAq_CCHfTani5bpSzr5"),
-"spain": DRIVE_LINK_PLACEHOLDER.format("13__FpX1MyBn2YQTop8rd_LHr2wV4XCcG"),
-"slovakia": DRIVE_LINK_PLACEHOLDER.format("1wxn96cPfJ-2iAzTsGLJQfoXPhY1gqOd5"),
-"seychelles": DRIVE_LINK_PLACEHOLDER.format("1oA1Wi-I6DErtkvEk4z4lvlxUycp-ukiQ"),
-"scotland": DRIVE_LINK_PLACEHOLDER.format("11_N70afI2ZQHT9GFVeAfyyxw3e184dBj"),
-"salt": DRIVE_LINK_PLACEHOLDER.format("1st-9w4rdoWEAoo_0pH3NMWW1-Zd3JvZi"),
-"slap": DRIVE_LINK_PLACEHOLDER.format("1R__mr2y9YKVfyI7Rle05og2-3MJ8UtxG"),
-"silver": DRIVE_LINK_PLACEHOLDER.format("1pbX0bwKqiMbgQ7eHzUPNKPIoQoTKy2hI"),
-"shirt": DRIVE_LINK_PLACEHOLDER.format("1Wui8SeoeGXRw2uZXUjiXCord_190-wiO"),
-"superman": DRIVE_LINK_PLACEHOLDER.format("1vi_P6dFCoIUDbD-4IfJAbyoB-729csAP"),
-"sugar": DRIVE_LINK_PLACEHOLDER.format("14VewMU498zz9ndoCZOpaNCQSbjMIIH6o"),
-"samosa": DRIVE_LINK_PLACEHOLDER.format("1Irf14vS2sAqshA7BUphtQV_LPTElpBA_"),
-"surprise": DRIVE_LINK_PLACEHOLDER.format("1AUIKwvQ--qkOmK4_ZeOgH5HRBZ07aYSS"),
-"suggest": DRIVE_LINK_PLACEHOLDER.format("1Lpk3A1xr_1pRZmzfbxnuYJ7bM3z_qvb3"),
-"stupid": DRIVE_LINK_PLACEHOLDER.format("10h822DKvMxPNwtkJhmpFmGV5q7Sh0aW7"),
-"student": DRIVE_LINK_PLACEHOLDER.format("1zbKPy1lkzD12sM-Ew744z6ftGGF65UXs"),
-"strict": DRIVE_LINK_PLACEHOLDER.format("1U75GhO5QAWmO3_FrMV5O9OE1-arkvaT5"),
-"straight": DRIVE_LINK_PLACEHOLDER.format("1bJ9HTAeczl4QyrujqHBYqg-VWIb8YYuX"),
-"soon": DRIVE_LINK_PLACEHOLDER.format("1ffXo_BbqOWe24yM9yzFCMb9KyEzlaa3r"),
-"some": DRIVE_LINK_PLACEHOLDER.format("1HmPWu6749j-2SdeDY6LMIKSIqEqeQ2Kw"),
-"solve": DRIVE_LINK_PLACEHOLDER.format("1LBthS8IeRey8DEAa5jZY_Tr8FoQaLp__"),
-"smile": DRIVE_LINK_PLACEHOLDER.format("1q2510RTDKjjFQKJc4JfBLLROI5Z5SROz"),
-"slow": DRIVE_LINK_PLACEHOLDER.format("15BFTafY4ixF1OqJyf0TcoB6cV_a7OOiT"),
-"sleep": DRIVE_LINK_PLACEHOLDER.format("1Rave7GTdfFLRVjdO0UoODwOBJoLvLh_C"),
-"situation": DRIVE_LINK_PLACEHOLDER.format("1DtK88F8iIpHrf2ntnVSzbXtGn-lT_IOT"),
-"simultaneous": DRIVE_LINK_PLACEHOLDER.format("1OAJe5g0v6jxBsQAdkzDIGdkGH7kmqQQs"),
-"shy": DRIVE_LINK_PLACEHOLDER.format("1t5UCGYR9HWFgvy8KF600TrMwXBTsyvzm"),
-"self": DRIVE_LINK_PLACEHOLDER.format("1jc1G9VQZBr3YGDpg_yZ3_D5LuimT-0Ac"),
-"secret": DRIVE_LINK_PLACEHOLDER.format("1xHsCOXhYIPEAGvaeDv6lNBewq8R_3hBr"),
-"scold": DRIVE_LINK_PLACEHOLDER.format("15rocVCbCbiAG-N5kXubapc72CYDuMhLI"),
-"school": DRIVE_LINK_PLACEHOLDER.format("1M3KyEZvzvvyW1p6jxgVDQUrI9CE6OKvI"),
-"salary": DRIVE_LINK_PLACEHOLDER.format("1SfM88BiIAyBGp78_PzGY2v0rMqyH30vq"),
-"swear": DRIVE_LINK_PLACEHOLDER.format("1__THyp-dWT12or8Et2WKhPA_XKMeX8lF"),
-"stencil": DRIVE_LINK_PLACEHOLDER.format("1m_5UU2iGZqQ-W6o2Zlb1btmkfFx5lvA8"),
-"scriber": DRIVE_LINK_PLACEHOLDER.format("1BWMDt5-ricYxuiM7oTQc9Cj3FCbrqnsu"),
-"shaft": DRIVE_LINK_PLACEHOLDER.format("1tdWIsqmcka3uGodC3L6kXywx71RHefrT"),
-"secularism": DRIVE_LINK_PLACEHOLDER.format("1sahU8lxfQ9v8aTJjNKqvRuPp1H-_TqT1"),
-"scribe": DRIVE_LINK_PLACEHOLDER.format("16UTLcPV3NPi8laiZogX1uTv9HweT5111"),
-"separation": DRIVE_LINK_PLACEHOLDER.format("1Ys9OjxUso-x3pvSeu0gYIa5U10xK3BJn"),
-"substation": DRIVE_LINK_PLACEHOLDER.format("1A4JOkB6fG13uttL8G2UiZMxCfjRaLQss"),
-"sovereignty": DRIVE_LINK_PLACEHOLDER.format("1yTF3LZNHTY2FdSWk5Qo2rpEGhZfjUWEj"),
-"seismology": DRIVE_LINK_PLACEHOLDER.format("1BmwuqRW7fAj2sV35w5q5rP7838G7uG4v"),
-"seismologist": DRIVE_LINK_PLACEHOLDER.format("1dlwQXJFOOCErJA5wQaTzSRnMA4GKDUxi"),
-"seasons": DRIVE_LINK_PLACEHOLDER.format("1lFGNoAIFoLSRJzwnvrMQE1Aq_8G7QZnn"),
-"somatostatin": DRIVE_LINK_PLACEHOLDER.format("1J7tmqfr-ills_KRhg1P1ZXIMntzpc1eK"),
-"serology": DRIVE_LINK_PLACEHOLDER.format("1TAqYj2npeiORNMKVx7WEnSkPVdelx7xQ"),
-"surform": DRIVE_LINK_PLACEHOLDER.format("1RaRYe1fOJRrk92L9x6_gbxzHjYJDu9Yp"),
-"stethoscope": DRIVE_LINK_PLACEHOLDER.format("1H8AYCmoyLkNunF-SX_aQfvLaW77kDGdZ"),
-"steroid": DRIVE_LINK_PLACEHOLDER.format("1e_K7NlpVOgnPJW25UCYUg25NXM2-pacu"),
-"scalpel": DRIVE_LINK_PLACEHOLDER.format("12GsChR5u5Ch75DoYWa501UDBL4g82bwq"),
-"sander": DRIVE_LINK_PLACEHOLDER.format("1rMi7WoFzInBn6R1phW8S1cm-pAJnHnKq"),
-"sitar": DRIVE_LINK_PLACEHOLDER.format("1G4rfzXS6Xg-d4QqUi0wGDLylVPweJcEl"),
-"sweep": DRIVE_LINK_PLACEHOLDER.format("1xJC5TnfaHVhJBWTgjQpeDnuIqMIrwdvy"),
-"silhouette": DRIVE_LINK_PLACEHOLDER.format("17dTjb2JYaW2l7L5o19Ex7wVxaBg6UeXM"),
-"shirring": DRIVE_LINK_PLACEHOLDER.format("15283wczZLMhDOxMUAm60fqheH_4dUqjv"),
-"shears": DRIVE_LINK_PLACEHOLDER.format("1E1Tp45gOMb7L9VgqqEzfIIbmJ10BZmf0"),
-"shearling": DRIVE_LINK_PLACEHOLDER.format("1s2IcD3jnp5p7JM-aKYvb64zD6qyvqYe_"),
-"shawl": DRIVE_LINK_PLACEHOLDER.format("1QnE4bPuVzCPLPbWg-vXHOx-R9nDTXo5f"),
-"selvage": DRIVE_LINK_PLACEHOLDER.format("1E2WuV3gMU_TN0qbXIpP7nBBFuYf3-E8R"),
-"switch": DRIVE_LINK_PLACEHOLDER.format("1ftPuGbkIZT43D1dB7-ajwb6fK8wCSGd6"),
-"stapler": DRIVE_LINK_PLACEHOLDER.format("1DvCcX_7PWVa4Ld4iD7atQs1qOVpkAOeB"),
-"square": DRIVE_LINK_PLACEHOLDER.format("1zROALRZ7h_sdUCDVNTrmaDN77LgKNb7D"),
-"spoon": DRIVE_LINK_PLACEHOLDER.format("1TdFqFMecw6Nw41mGBl6pHWBr7_t1O0x0"),
-"sphere": DRIVE_LINK_PLACEHOLDER.format("1mO3707AybFPRWVAx1zP4WMeUDZM65abS"),
-"sofa": DRIVE_LINK_PLACEHOLDER.format("1NH1iBivxcl2kEg3jQyqCsrnsdx2UYqBs"),
-"socket": DRIVE_LINK_PLACEHOLDER.format("1zI1ZWncb8Dm3apk_WDLkR-BWytS73lqp"),
-"soap": DRIVE_LINK_PLACEHOLDER.format("1HQsnovJeK_-tca3adKY-dj7kDKPDHja6"),
-"sharpener": DRIVE_LINK_PLACEHOLDER.format("1PvDAkLriues35vn5UxYnTUCH4tuo6jER"),
-"shape": DRIVE_LINK_PLACEHOLDER.format("1qK6WUeFt6I0czRaDj-u-MAZ24UlkLHLe"),
-"semicircle": DRIVE_LINK_PLACEHOLDER.format("1JPn6RSlxwSjvwKj-6fxaWB6DwoDxZtxo"),
-"scissors": DRIVE_LINK_PLACEHOLDER.format("1SCmMB4bL1Ua9s9g5h1dKNgcoA6394VRt"),
-"singapore": DRIVE_LINK_PLACEHOLDER.format("1FTlYqXaSCDqCTdswMf6B7es1k39JTKIw"),
-"scraping": DRIVE_LINK_PLACEHOLDER.format("1axgsx8mQNhKX_KCl80n8sE8fvrliePa_"),
-"spinach": DRIVE_LINK_PLACEHOLDER.format("1evSR01W98eoQCslk7Cy7A96tNlXiY8-b"),
-"shovel": DRIVE_LINK_PLACEHOLDER.format("1p1SfJ87jBnuK_HPlmjTJ5LHrRkHBjqSc"),
-"sunset": DRIVE_LINK_PLACEHOLDER.format("1k_t8pN-_yChy3J9HOgf7IiKE8OQ55Pfe"),
-"sunrise": DRIVE_LINK_PLACEHOLDER.format("1Enhcr2aTPPiPCXuAen8eYuKg75SJmRFj"),
-"sunny": DRIVE_LINK_PLACEHOLDER.format("1DfjKzPDLZekOBbn64Al9dHCmyLA2IeiP"),
-"sun": DRIVE_LINK_PLACEHOLDER.format("1cJoku4k9xRqzmYCzMKdRiH_uvR4A1oXp"),
-"summer": DRIVE_LINK_PLACEHOLDER.format("1qEO_sn45o2ibnvkREgS-gelQ720pWREO"),
-"stone": DRIVE_LINK_PLACEHOLDER.format("1XPD7TT_7cuX6bme_EutnzuV2jngOBUZD"),
-"star": DRIVE_LINK_PLACEHOLDER.format("1D3p4HSUzmKOQErMmQKkXFpErFmk-HFZu"),
-"spring": DRIVE_LINK_PLACEHOLDER.format("1Efb1ty_RqODtuAy-v-MQ5pVcm8hKPztg"),
-"soil": DRIVE_LINK_PLACEHOLDER.format("1NkHqJ5w4KPLjoGrIXhA-CShbhmH4JSva"),
-"sky": DRIVE_LINK_PLACEHOLDER.format("1O7leQpzjNAAICU1_cQgWU6hgikKWL1A_"),
-"season": DRIVE_LINK_PLACEHOLDER.format("1MNx4w4X16XPEqUZifyKtje1_JgK4d9Nm"),
-"sea": DRIVE_LINK_PLACEHOLDER.format("1ggO69WZYPAC3kfBddioQAr1ECMaMzMI5"),
-"sand": DRIVE_LINK_PLACEHOLDER.format("1qX2PTGL2FoPP4kjRqnAIl26GTTqqUMf_"),
-"saturday": DRIVE_LINK_PLACEHOLDER.format("10RJqmD04Diia0CwJjboN52E7yNDoMJbI"),
-"sunday": DRIVE_LINK_PLACEHOLDER.format("1kuEF8zepFcvuHEc7ApOvg14VyMpz1O5s"),
-"skiing": DRIVE_LINK_PLACEHOLDER.format("1-3q4uXiybU68Hx0oIk2GFJFZpjBWiR_2"),
-"shooting": DRIVE_LINK_PLACEHOLDER.format("1_qc1RDOwsYHjJ7HPlInYC-GMkofHqe6V"),
-"squirrel": DRIVE_LINK_PLACEHOLDER.format("10HdabC7CfYJ9JO6SGI3gOojk4LxwgzTB"),
-"sparrow": DRIVE_LINK_PLACEHOLDER.format("1FkTgu7Vj7uSH237jVveH4bPz3_0nbNs4"),
-"snake": DRIVE_LINK_PLACEHOLDER.format("1xAFCCLKnnqZUZSfgbW5dbjH-fWy8izzV"),
-"sheep": DRIVE_LINK_PLACEHOLDER.format("1zF7BI2OWDzUw6atqOLjzwfVpXyUB1N5M"),
-"scorpion": DRIVE_LINK_PLACEHOLDER.format("1pPiJhZuPqYxBRdt38aJ13nqPm4uQ2Tkp"),
-"stuck": DRIVE_LINK_PLACEHOLDER.format("1T5Zaa4aFQhLY6K8WY-czS6fX7ZJrxXGr"),
-"stress": DRIVE_LINK_PLACEHOLDER.format("1AbyKE03LKCdW-fuFNIgGpjS8KHwGL2wG"),
-"sex": DRIVE_LINK_PLACEHOLDER.format("1GcqChwH9Xdl1DImOLgLFjtbBOgPQnZsy"),
-"ship": DRIVE_LINK_PLACEHOLDER.format("1MY1iygoga7O4IgS5Ou9Hwana7I5G0A0z"),
-"scooter": DRIVE_LINK_PLACEHOLDER.format("1aA9cuefxXCSMlziUI1Fuj_ey2d2xVIct"),
-"seventh": DRIVE_LINK_PLACEHOLDER.format("1XMTQFsbAeYwRAkoCUlDpZYzfAtyWzt8_"),
-"social": DRIVE_LINK_PLACEHOLDER.format("15UGUfEuE-cF_ayCewH5fCFaFrwMoNvbj"),
-"smoke": DRIVE_LINK_PLACEHOLDER.format("16bA3ncI4Pn3i1P0PyGHBrTFZcVqkbe_w"),
-"smog": DRIVE_LINK_PLACEHOLDER.format("1BBjOiPOGg-krQYZeb9CZ7wToWvpOG9R3"),
-"smell": DRIVE_LINK_PLACEHOLDER.format("1BEEJR_Ug85Y5CcrUhZkEzqg-48ILYEyw"),
-"smallpox": DRIVE_LINK_PLACEHOLDER.format("1XNlvfJe4Ge3vpPptlEUmPJTK2ZLqTfug"),
-"small": DRIVE_LINK_PLACEHOLDER.format("1BD_JyO62xaVsaHBWd965F1cq8orfmDD_"),
-"slope": DRIVE_LINK_PLACEHOLDER.format("1Bb9HYNGGsGkyJaeu8lGYxg7tgtcsuw0c"),
-"slip": DRIVE_LINK_PLACEHOLDER.format("1MKrw1V6f8FypxpEvTERbbpCXmyevmFQC"),
-"skin": DRIVE_LINK_PLACEHOLDER.format("1puWH55tZKWIfxS0-qOHltni1Xi1qkJYh"),
-"sit": DRIVE_LINK_PLACEHOLDER.format("12PMfOJOX4jLDuqGNuNuBLHZonS3RJarT"),
-"sing": DRIVE_LINK_PLACEHOLDER.format("1ImqoLxNg0QsrbOoAMUIl1FQn1bfBDNV8"),
-"since": DRIVE_LINK_PLACEHOLDER.format("1C9S2Uz9RFCsuB2vPXPFbmnN2JnuOgly2"),
-"similar": DRIVE_LINK_PLACEHOLDER.format("1nFzxKxyxKGfFwDRQ06qRL2eBprYKUHgJ"),
-"sightseeing": DRIVE_LINK_PLACEHOLDER.format("1h9LPxeKPTBh2DQnkfU8d7qbEugujK5KH"),
-"side": DRIVE_LINK_PLACEHOLDER.format("1g4CrJBn_H-4s1SFs3XTOOBeVKpDPN7Xt"),
-"show": DRIVE_LINK_PLACEHOLDER.format("1y2C1USZFmPnOtrHzIqv6t6x0TFwaqnxg"),
-"shoulder": DRIVE_LINK_PLACEHOLDER.format("1Oz2nOgjG3gLnD4RZefAaVIJK1x3Q8mPS"),
-"should": DRIVE_LINK_PLACEHOLDER.format("1yTP_3tDIexFIF_YhwlXdKW0FdkIisDxg"),
-"short": DRIVE_LINK_PLACEHOLDER.format("1WepLrJt-s-GLkrOTny5rgITVnrEd6JHl"),
-"shop": DRIVE_LINK_PLACEHOLDER.format("1fmaS0mk0fXl7S7kRVpvXSJtE1RPMD0m2"),
-"shine": DRIVE_LINK_PLACEHOLDER.format("1hKFoVXcuvBcDR9arY_4IOrotuK_xByl4"),
-"shift": DRIVE_LINK_PLACEHOLDER.format("1BsL93Vz0RyvRzJf3SSVJbnS1LpPTJ73k"),
-"she": DRIVE_LINK_PLACEHOLDER.format("14e6Hsp8PA1f8gTGUCQfkgFjBKCnVXWuA"),
-"sharp": DRIVE_LINK_PLACEHOLDER.format("1pQ0X4Zco7mB4AJ4EOQBmRpu9doznq-Sz"),
-"share": DRIVE_LINK_PLACEHOLDER.format("1n8S9qmTrMlt7-x48F6PbjqRLGgTJEGcH"),
-"system": DRIVE_LINK_PLACEHOLDER.format("1LM091S782-uSYZ7_efEjrbCyCD0v8brC"),
-"sweater": DRIVE_LINK_PLACEHOLDER.format("1Y5GoMJaskoSE2KRB-0hWWTYhhMzHJTLE"),
-"sweat": DRIVE_LINK_PLACEHOLDER.format("1d-pnXzOgwwET4gpcKj8iwtGF10r9WJX5"),
-"surname": DRIVE_LINK_PLACEHOLDER.format("1nTTSDCk7-rKeb_bCndN1BOtf48tEiekh"),
-"support": DRIVE_LINK_PLACEHOLDER.format("1xBiVzdOsvEF2TTD_Fjz9Y-HIuiqOYNNU"),
-"sunflower": DRIVE_LINK_PLACEHOLDER.format("1vb46SRR5DsKQJVNyBuz6pzUw5e6KKEsU"),
-"subway": DRIVE_LINK_PLACEHOLDER.format("1EXqsqU20txQViw9xhB8Psiwloe6nct-f"),
-"subtract": DRIVE_LINK_PLACEHOLDER.format("1-el1kLq9iC1S59yHoCkysgldAeT2Edo5"),
-"study": DRIVE_LINK_PLACEHOLDER.format("1dPdudFkIErp5WXdBrfaA1qTVK4ARFkf7"),
-"strange": DRIVE_LINK_PLACEHOLDER.format("1-fYU2w_i1vSkdb2aVxb7hms_ZQssRD9f"),
-"storm": DRIVE_LINK_PLACEHOLDER.format("177I5lA7P_DiXPGKM4JrJKiwjFFAuWXlx"),
-"stop": DRIVE_LINK_PLACEHOLDER.format("1PVp0Q4tcz5Weee3Dqb5EIecgB_xz8jOE"),
-"stomach": DRIVE_LINK_PLACEHOLDER.format("18-fyiTDAM0qlVMl3UEko_WQ_x7uO_-1N"),
-"stink": DRIVE_LINK_PLACEHOLDER.format("17fBc86TK0Bko-GUs_YcpapyKmLNfGbeo"),
-"still": DRIVE_LINK_PLACEHOLDER.format("1ZiFu04hOtlSUwRxsW45eQ_3vBUveE6z0"),
-"stay": DRIVE_LINK_PLACEHOLDER.format("1h2kFsX9ab3rj5n_XC_Jjc7WDFXnuUrvr"),
-"stationery": DRIVE_LINK_PLACEHOLDER.format("1qirckI3vPypqfML2HaMLYlC7wwiIcJQJ"),
-"state": DRIVE_LINK_PLACEHOLDER.format("1O3utAcuZZrQtjTZ-xgdrnHqTF_2Zun8t"),
-"startle": DRIVE_LINK_PLACEHOLDER.format("1N2fRsk-KHNV15aF9W0dKwz_hVCfIgPgl"),
-"set": DRIVE_LINK_PLACEHOLDER.format("11oY9XB4G1jljNmynPzF9oZtYgLxxoIlD"),
-"stairs": DRIVE_LINK_PLACEHOLDER.format("1_ah0uRilQy1wbztMF9OA4eujhA-P3Mn9"),
-"sequential": DRIVE_LINK_PLACEHOLDER.format("1wnEtfiJr9LdonX1OIgtzdKp5hn3z83Dl"),
-"sports": DRIVE_LINK_PLACEHOLDER.format("10RjNVfb4LvIS0EcH1joCwi8kksZPQnsv"),
-"separate": DRIVE_LINK_PLACEHOLDER.format("1gU3hrx9w_TA35yUfWozlKUtUkbCXSBBW"),
-"sentence": DRIVE_LINK_PLACEHOLDER.format("1vL85TnmLZ8svKA6CiRFCwtMCzy_G-G_B"),
-"send": DRIVE_LINK_PLACEHOLDER.format("10uzyFeTVdmPQ8vhoYcz1Yz6e9H94FuV4"),
-"seminar": DRIVE_LINK_PLACEHOLDER.format("1K-Vyx0YkB3mZH5_SuV2SoWPw4usB8apn"),
-"sell": DRIVE_LINK_PLACEHOLDER.format("1xpk0RSeyOyqPkSWhAr54e7AjLvXKN08B"),
-"soup": DRIVE_LINK_PLACEHOLDER.format("1bsQsB0sjB_4owuSv25u4UbDwdTYLiaHr"),
-"select": DRIVE_LINK_PLACEHOLDER.format("1XiBQepW4O1EKN2oTVWxvx_nE8XK-xbtp"),
-"seed": DRIVE_LINK_PLACEHOLDER.format("1WkGaReSfI1PMA0KszqOmz8Fi2Qu-upPM"),
-"see": DRIVE_LINK_PLACEHOLDER.format("1FH9TNfRozEm19uN2Z6CzZY_uwsKPftzZ"),
-"something": DRIVE_LINK_PLACEHOLDER.format("196GEhwgDkTtS5cFUfkM9MuA6ys3ZOENG"),
-"soldier": DRIVE_LINK_PLACEHOLDER.format("1PbJAn2NhHOxH51ed8AqXPLz73154amwp"),
-"score": DRIVE_LINK_PLACEHOLDER.format("18HzNHuJeO50SKVT7LOa7IR1MKuq4LUl5"),
-"society": DRIVE_LINK_PLACEHOLDER.format("1L0qQH4IFWSvAR3nUYFlV3l_RKglQQbip"),
-"science": DRIVE_LINK_PLACEHOLDER.format("10B73ATmliNrOXlUlydTiW2smk5-Ll7Sn"),
-"schedule": DRIVE_LINK_PLACEHOLDER.format("16MWn9QURI-KvBu4r2S5Xzuv1Njw5VAZb"),
-"scan": DRIVE_LINK_PLACEHOLDER.format("1rj4qRZ7cPLYvz_Xm4XVk25OI0HvTSNMf"),
-"satisfied": DRIVE_LINK_PLACEHOLDER.format("15RQzGDkhMEi1e9TUhVzMoAtoj0SuTZbO"),
-"same": DRIVE_LINK_PLACEHOLDER.format("1va9J4IT6ZAvjbPp6PeOGPhxbTI9q0Jpq"),
-"salwar": DRIVE_LINK_PLACEHOLDER.format("1LbeHo0tkRlm3ob2yteZg1qZTqYabucts"),
-"sad": DRIVE_LINK_PLACEHOLDER.format("1dBAUwsNFP6xGODU-zjA_m5vbU1CV0GFb"),
-"stroke": DRIVE_LINK_PLACEHOLDER.format("1cab80wOdZKV27lpf9hLBmfY-lk7G2y7D"),
-"scrabble": DRIVE_LINK_PLACEHOLDER.format("1Pqs1BPAuRHbdORq-IqU_9FS4x-Tfny-4"),
-"supervisor": DRIVE_LINK_PLACEHOLDER.format("1NIpL7Lxh2pTiTPSKmHcc9m7H6LFU-Apn"),
-"superstition": DRIVE_LINK_PLACEHOLDER.format("1CdLVKTAby76OtEMl0Kw6oKWSg2c5q-C5"),
-"spicy": DRIVE_LINK_PLACEHOLDER.format("1hib8u4zvPXcoFL9joVhDgvsCDDQpX8IJ"),
-"sweet": DRIVE_LINK_PLACEHOLDER.format("187n-_dnZ5xweJYBivzlh0yroff3ybPR6"),
-"superficial": DRIVE_LINK_PLACEHOLDER.format("1Bsajl_kl8RVHqUXSvE2e5aEE2n9gEAVX"),
-"sudden": DRIVE_LINK_PLACEHOLDER.format("1X-caFqRJ9Bx9G_oq2ptjPe6LIzH8XWF9"),
-"sacrifice": DRIVE_LINK_PLACEHOLDER.format("1Y02ZQmDxUOZEFq7metYYqurn6-8e4ZVl"),
-"sympathy": DRIVE_LINK_PLACEHOLDER.format("1t9q-lAdAK45Mb6-Wg-2Edqk-omXhsprb"),
-"swim": DRIVE_LINK_PLACEHOLDER.format("1yhBSEV9Vk-9DwXdxk_9sPZZrVpPY4ZC5"),
-"sweets": DRIVE_LINK_PLACEHOLDER.format("15h3t_y40S3bSDYbWFOO-YVV_sG6Hiq67"),
-"suspect": DRIVE_LINK_PLACEHOLDER.format("1gNX--Zpo_uMUcDu5oyxlZIkLufIeWu9-"),
-"spanner": DRIVE_LINK_PLACEHOLDER.format("1X2gobXxguLoukSqr90xokLVATpyMAsE-"),
-"shutdown": DRIVE_LINK_PLACEHOLDER.format("1Cw-ob6yxbA0p47yT2O1ON4EUv9H3Frzq"),
-"screen": DRIVE_LINK_PLACEHOLDER.format("1MazuzvwbMGgG_uOkfQFYRBO13IzQfB_C"),
-"singer": DRIVE_LINK_PLACEHOLDER.format("1RQJs7tpMjFs5ovo3MoJzaNZwynBKDtkD"),
-"sculptor": DRIVE_LINK_PLACEHOLDER.format("1QEIjhZu2GPg0t8B11Ac0uTaNmg0RLwTE"),
-"states": DRIVE_LINK_PLACEHOLDER.format("1nvO2OH1pYH6PcTKYhFwO4WTzRh2vX5NZ"),
-"spices": DRIVE_LINK_PLACEHOLDER.format("11KqtnGKe7Tm27S1MnQZQjbc5f4DujQcY"),
-"spectacles": DRIVE_LINK_PLACEHOLDER.format("1Kx5FhFs4V5xOeSV4C2kOppYQ2_a_tcZ7"),
-"suffer": DRIVE_LINK_PLACEHOLDER.format("1JWnLUUwrimp7CCDW7QTeatU90yGpqwR4"),
-"success": DRIVE_LINK_PLACEHOLDER.format("1C-S3EcRwcXbu4QpwQb1E0UaWbo9IajW0"),
-"strength": DRIVE_LINK_PLACEHOLDER.format("1ehrqe0lX0JQqwnnZMQ_AeybeGx-pwl32"),
-"steel": DRIVE_LINK_PLACEHOLDER.format("1EVqZFdAgitfADn12GyxgVF_szJ5JT0MZ"),
-"special": DRIVE_LINK_PLACEHOLDER.format("1dSQbIiax-SF5pk1PUzN6XkBORe_f7vQE"),
-"south": DRIVE_LINK_PLACEHOLDER.format("1rJL9rhWAISA3E3bD6fcsqa-dYRC9faUY"),
-"sorry": DRIVE_LINK_PLACEHOLDER.format("11Rg-S5AWw_6tiFSW-vysz8D-uVJBiSkM"),
-"socks": DRIVE_LINK_PLACEHOLDER.format("1REGwnHSP4hldspyZKU1Plmw0cGFGEN8p"),
-"sign": DRIVE_LINK_PLACEHOLDER.format("1ZUfB4NisxqpvXLOf6YWzeGAi3e4Rjcrc"),
-"skirt": DRIVE_LINK_PLACEHOLDER.format("1cXM3znx0hUN1icZQue7R7NM3qsMHZoqB"),
-"silk": DRIVE_LINK_PLACEHOLDER.format("1nLUCCkEv4boKrYAEY78dJAWWicVTsOHf"),
-"sick": DRIVE_LINK_PLACEHOLDER.format("1yhx3ev8vEiox6K7pbKNUMygO_G1wfoGx"),
-"sibling": DRIVE_LINK_PLACEHOLDER.format("18nRUIbrY_EZa0pt50eiG5VYWoUYRs4q6"),
-"shoes": DRIVE_LINK_PLACEHOLDER.format("1xX8CzpYGQn_sWwCQKSqBEk3Qfd0qZGhT"),
-"september": DRIVE_LINK_PLACEHOLDER.format("1TALNMdh6XwxtBtjouBH7QmHDsngbfE2F"),
-"safe": DRIVE_LINK_PLACEHOLDER.format("18y7Z2hX5bk26fr8u_YNH1QSifo4aSeFu"),
-"scavengers": DRIVE_LINK_PLACEHOLDER.format("1znKW_2ZVfwBeNqH6vlOjv2IMymbtUW8G"),
-"selfish": DRIVE_LINK_PLACEHOLDER.format("1ZjA1vX4PF3-1_FAxf-O0qS9I9WZDCQ5q"),
-"search": DRIVE_LINK_PLACEHOLDER.format("1a2EX3W_rCKT_iZaOr29I9thKG7dEjGDu"),
-"surgeon": DRIVE_LINK_PLACEHOLDER.format("1izMWg7pQoQsrtQY-OWIRfClgz3qZo0OE"),
-"skull": DRIVE_LINK_PLACEHOLDER.format("1Jt6IZiG6_mQYTBVea83emRkhLJ9ak-_w"),
-"skeleton": DRIVE_LINK_PLACEHOLDER.format("1xW7Oovtqgg4VGY9foxHRyC54nTqMFoQu"),
-"satellite": DRIVE_LINK_PLACEHOLDER.format("1fK12lUeRx8gTb0XaqMG-yfGmzaAwxCSP"),
-"solid": DRIVE_LINK_PLACEHOLDER.format("1rg7G6hPzrS75rcH09c9IJg_L9vVJlcFd"),
-"topography": DRIVE_LINK_PLACEHOLDER.format("1_AJftzVQWwj5pKMW3Lu8ifU7EwM-QrjR"),
-"temperature": DRIVE_LINK_PLACEHOLDER.format("1rH5v88ar7MI3nKgw2clj5OZ-2KbVcNsc"),
-"true": DRIVE_LINK_PLACEHOLDER.format("1_dJAnQdv2BTN--cERmO9r6dtlzJDYX2L"),
-"trader": DRIVE_LINK_PLACEHOLDER.format("1MNYAAWlu5_1rdKXG8QdC4wVAulHEt6bK"),
-"trade": DRIVE_LINK_PLACEHOLDER.format("16ErSMQI0RIUqxHY4ObHYhkAFdJjJk5fB"),
-"trail": DRIVE_LINK_PLACEHOLDER.format("1kLubwYTP7mZT3S3P1plU6VyWHLAvYGGD"),
-"tornado": DRIVE_LINK_PLACEHOLDER.format("1dXUYKlX4oYYH5DG5LyrHmWduOjS0bK_h"),
-"tenths": DRIVE_LINK_PLACEHOLDER.format("1uhjVnBaDlmBgTKZaOhhlEx3ZQtrOVstc"),
-"trapezium": DRIVE_LINK_PLACEHOLDER.format("1IK_IVeT0NG8HHg3r3EC2HpcHY5CvhvOv"),
-"thousands": DRIVE_LINK_PLACEHOLDER.format("1y4cHfdsjUm0O_r-XsYbHf79Wv3WJ4ZBF"),
-"tens": DRIVE_LINK_PLACEHOLDER.format("1_AoxuwrL4bONT9Auzs0l-ZD3J6LZ2tnO"),
-"tripura": DRIVE_LINK_PLACEHOLDER.format("1oLRnJLbiVuahsuWSGceXvGgDgluepuan"),
-"thiruvananthapuram": DRIVE_LINK_PLACEHOLDER.format("1-hGzFKTcmT0AA6Q4wYa-u87Hp731n3bY"),
-"trivandrum": DRIVE_LINK_PLACEHOLDER.format("1-hGzFKTcmT0AA6Q4wYa-u87Hp731n3bY"),
-"telangana": DRIVE_LINK_PLACEHOLDER.format("19gzLMFLWhwVpEKQvCrxL1-dSR015Lxt8"),
-"transparency": DRIVE_LINK_PLACEHOLDER.format("1S0Obsf8_PZWmbLfqquYyhz6nqti-fTrI"),
-"traders": DRIVE_LINK_PLACEHOLDER.format("1JJpGSGcDMHIfNZgNfF3cfp8OJjIO5wPS"),
-"taxable": DRIVE_LINK_PLACEHOLDER.format("12opnmV4ft8ru01ln6pSLanqI_joj1ykw"),
-"total": DRIVE_LINK_PLACEHOLDER.format("1TkpdZDMpup8YM4B3-u2O1QINtDQx8oBi"),
-"treasury": DRIVE_LINK_PLACEHOLDER.format("1hU1G03U9d-ykxBaL1L3xWg4kAV8uCYLf"),
-"trading": DRIVE_LINK_PLACEHOLDER.format("1QtH5xMRp2ovveS0OHPF7p3Cn1iWe9NnT"),
-"tractor": DRIVE_LINK_PLACEHOLDER.format("13Ze9o7FaEZykhivFl7-cP2918juw8CHi"),
-"transplanter": DRIVE_LINK_PLACEHOLDER.format("1psDYwm8dhavrhOLcf2SVvQ6IKYcjTOIU"),
-"thiram": DRIVE_LINK_PLACEHOLDER.format("1MMKHPNjdsw2oOj85DdBHNE9abJM0X8xC"),
-"tagetus": DRIVE_LINK_PLACEHOLDER.format("1sW0GqOMAOEYwNfBAzBvkpGr1gkKOXI6q"),
-"tamil nadu":DRIVE_LINK_PLACEHOLDER.format("1p0cuErj_Rw3GToE5vVS5ODdSo_JeI5rb"),
-"turbine": DRIVE_LINK_PLACEHOLDER.format("1cR2GJE9ld1rkN87sJ3j5daDUPUes2nkT"),
-"transmission": DRIVE_LINK_PLACEHOLDER.format("1mx7YLNA729INIYX1fo-8a2r9Ku96wpAE"),
-"tower": DRIVE_LINK_PLACEHOLDER.format("1BBsmgtuDy1qFVQauAm_4edjgTKVYj5pQ"),
-"tidal": DRIVE_LINK_PLACEHOLDER.format("145-bA_22iDZyVNVCJ4OpSOvI8rCLCYPu"),
-"tear": DRIVE_LINK_PLACEHOLDER.format("12rxCfcwjcfhenrzgT2_5VqmlMCqEregK"),
-"tweening": DRIVE_LINK_PLACEHOLDER.format("1Z-tF2kw7-AyTzkDnbkugkm_gEPQ4i0Up"),
-"thrill": DRIVE_LINK_PLACEHOLDER.format("1lEjmiVy_tnkS2mpoj-j5rC31C2Rpb1EM"),
-"truck": DRIVE_LINK_PLACEHOLDER.format("1iPCJaOFuFtW-j3JvS3hXlblgbd5fB_5d"),
-"tilts": DRIVE_LINK_PLACEHOLDER.format("1CqgtiR6YZDdngW7B8yWnyCLRBk0hxjhk"),
-"transversal": DRIVE_LINK_PLACEHOLDER.format("1do8cWOnJoZCdAH50ShWA5dmA7-gxpFvN"),
-"thermometer": DRIVE_LINK_PLACEHOLDER.format("1Yp-JqWVfmlCgxICK07jKVHtDwU4urWST"),
-"toss": DRIVE_LINK_PLACEHOLDER.format("1G2xw6roLbe01IN6ryNCU0hUA5xaCpTj7"),
-"typography": DRIVE_LINK_PLACEHOLDER.format("1jjKumua2AzgBVZ9WjxdSYRMEHpveIcdm"),
-"tracking": DRIVE_LINK_PLACEHOLDER.format("1AqkPAdN1SROCdcXU1F2EWcN6YTpfYfhG"),
-"tax": DRIVE_LINK_PLACEHOLDER.format("1H4YTi2K86xTCcMwDONtqQ2V7jhvk9ubv"),
-"theory": DRIVE_LINK_PLACEHOLDER.format("1tEHIRdpbQCOfJXjXtcmBVqiuugJrFcvp"),
-"tribes": DRIVE_LINK_PLACEHOLDER.format("1FhCiDBV8TmSuD-usiyYZIo7lBZxAu6UF"),
-"tribals": DRIVE_LINK_PLACEHOLDER.format("1R_Oo1EvyE1SsXjcUy0X5BOecuEhDA65w"),
-"transposing": DRIVE_LINK_PLACEHOLDER.format("1_9LXm87m93Gj5W-AEkZb2s_-f-2ueI1F"),
-"trade": DRIVE_LINK_PLACEHOLDER.format("1ltiaxZkxM9ET1ygIzWJXuaeoWVVjdXtv"),
-"tissues": DRIVE_LINK_PLACEHOLDER.format("1L47rESp-vqmHCzMrX3Tv3KPwzRZaH0j7"),
-"territories": DRIVE_LINK_PLACEHOLDER.format("1PtWZDCaK_wxBB7TuKVBOauPl1JMZJ80k"),
-"trusses": DRIVE_LINK_PLACEHOLDER.format("1MeS71ZttYl3MCax8aq7PWUHyWGJOUlzl"),
-"travelling": DRIVE_LINK_PLACEHOLDER.format("1XeH9fQczMLh8nH5BqN_TeVkxIuCVC5h5"),
-"tourism": DRIVE_LINK_PLACEHOLDER.format("1tIy93nRipe_S4SewtD8A0K7uoUFe7i8v"),
-"terrain": DRIVE_LINK_PLACEHOLDER.format("1r4AzYkUR8i2jgO-x0BAzBF1oeG9ZHf3v"),
-"trolley": DRIVE_LINK_PLACEHOLDER.format("1Xmu8IRC6L_hfG5b2JgKl6UJdQFCY9Pf_"),
-"tds": DRIVE_LINK_PLACEHOLDER.format("1P0i8qacGT2U3SoqfVt2tm97_pl5QQpmR"),
-"testify": DRIVE_LINK_PLACEHOLDER.format("1NQu35n6fRX9kM2HaAjG2jomQYnQkzTVs"),
-"twinkling": DRIVE_LINK_PLACEHOLDER.format("1vzBO_473WNnflpnFXy3ufTWighVYU5MF"),
-"tremors": DRIVE_LINK_PLACEHOLDER.format("1qSkCsjwWUEZwvmhQroq2wwlkHLw_cUlr"),
-"turnover": DRIVE_LINK_PLACEHOLDER.format("1Tum7TuPu_6jCRbVf9jNc5MgyMjJ6YOYR"),
-"target": DRIVE_LINK_PLACEHOLDER.format("1BaeE9cTfc_7QZce574xOrrYCxaSA-ZmF"),
-"takeover": DRIVE_LINK_PLACEHOLDER.format("1d2IOf5ciToIg-v3_39vYjmg0gPdUEgfB"),
-"trumpet": DRIVE_LINK_PLACEHOLDER.format("15KHdGFmY5wCDm1oPclPqWi1cN9KkB86v"),
-"taillights": DRIVE_LINK_PLACEHOLDER.format("115OszRbzm7GU-zcpNFfGSUM4NLBDsFj8"),
-"tadpole": DRIVE_LINK_PLACEHOLDER.format("1uhw4TVEN3VEAub67bBU9BsdunqvuyyO7"),
-"tawa": DRIVE_LINK_PLACEHOLDER.format("1B8n3AfzHRGWgLY1lai6elQ0ke1m_OoWC"),
-"turban": DRIVE_LINK_PLACEHOLDER.format("1ThWR34YH9f4sgGc2yv6CsOlhD7eQez38"),
-"tuba": DRIVE_LINK_PLACEHOLDER.format("1TbCdwn1ZlkubqlMOnriAkvy29MiPR7Dk"),
-"tricycle": DRIVE_LINK_PLACEHOLDER.format("1GzxaKNP18KlntXLHogqIdrwAlVqnDmt0"),
-"treadmill": DRIVE_LINK_PLACEHOLDER.format("1850WRToizneOEZWis-hZ4WBHGRgFzN0J"),
-"tambourine": DRIVE_LINK_PLACEHOLDER.format("1i45M1aEXULtWF4QDWruOn-Cnu_HqneQ6"),
-"treason": DRIVE_LINK_PLACEHOLDER.format("113qhBsuzkYB9le99Rixlk4CD5P_KPpAC"),
-"trademark": DRIVE_LINK_PLACEHOLDER.format("1BMVpQJYNqJDGfCk4mtaSNtdKzDBoUupD"),
-"tsunami": DRIVE_LINK_PLACEHOLDER.format("1o76pzuprXcpvfBkJ-_LPChbKgPpXUhNV"),
-"telescope": DRIVE_LINK_PLACEHOLDER.format("1t6zxSXctb9lIjo5zi8UekRU8zYOjer5y"),
-"thread": DRIVE_LINK_PLACEHOLDER.format("1N6r12D0ITk_RU9ubYfmBAEHowE9NOvft"),
-"toenail": DRIVE_LINK_PLACEHOLDER.format("1Nc6aQ7IaRKmJo3-bwutpkztg_VJsrOEV"),
-"to":DRIVE_LINK_PLACEHOLDER.format("1-ZZGS4mf1kZbgnoB2ZMGUqbjPeGBStP4"),
-"typhoon": DRIVE_LINK_PLACEHOLDER.format("12U-DEVfaQSG7zSfP9tCQ5VSA3C4_o4w0"),
-"tributaries": DRIVE_LINK_PLACEHOLDER.format("10n_ALOiPZ3F4HzeFSOL7LrzR-gu5SANj"),
-"trapezoid": DRIVE_LINK_PLACEHOLDER.format("18qSIEc1nkBNoSE_rpbQs4zdQmklPcxqd"),
-"transpiration": DRIVE_LINK_PLACEHOLDER.format("1UAa4Xm4zxQwEDEFsnGgK3oJNVQGXRtMk"),
-"timeline": DRIVE_LINK_PLACEHOLDER.format("1P3TyzqNkuZ1riwjxZxgHP14Yd9wyVUK3"),
-"threshing": DRIVE_LINK_PLACEHOLDER.format("14mioryzVyPttBT8I-wF6dR-FyBYpOvdO"),
-"trespass": DRIVE_LINK_PLACEHOLDER.format("1bkDrigINK8AbRNNs9Puq3mTn_GG3sI2S"),
-"terrarium": DRIVE_LINK_PLACEHOLDER.format("15FjfJuZyjaM5Cpw4aCNygTuGTl01Jckw"),
-"terrestrial": DRIVE_LINK_PLACEHOLDER.format("1sUtaYXkcNVVYfnUJIugjeHZYj4tZc9JJ"),
-"terracotta": DRIVE_LINK_PLACEHOLDER.format("108i_rzwasLnySXLwurr0Rwg72qIiL87o"),
-"telegram": DRIVE_LINK_PLACEHOLDER.format("12N0Z3i7i_9aEkPNtRKTuTPkjbG3_04nV"),
-"tally": DRIVE_LINK_PLACEHOLDER.format("19zIEn7SCFraUjJtUMFz2Pywr-nwCR1yu"),
-"terrorism": DRIVE_LINK_PLACEHOLDER.format("1frUTvlKdRwzU5t1rHYAZ-1VBL1ucsLH9"),
-"typist": DRIVE_LINK_PLACEHOLDER.format("1wzCZ4zAiu4GGdWw73PHDonYMtypv5L6s"),
-"trader": DRIVE_LINK_PLACEHOLDER.format("16CmcuRWZRgR-0RPy9vy-gAY8dl2ZwvEY"),
-"teacher": DRIVE_LINK_PLACEHOLDER.format("1bJXtKgt-B9wbK-WqFr9Eut9bsdxrqdzc"),
-"tailor": DRIVE_LINK_PLACEHOLDER.format("1a5tpC4rPLSRCNP9TKpXtx94qDAmDa0Ld"),
-"tall": DRIVE_LINK_PLACEHOLDER.format("1--GTO1Mt-nXPkNPxsSHe5RE36TDPHK5t"),
-"telugu": DRIVE_LINK_PLACEHOLDER.format("1ZXKrfuGGrede912FDBg53hAThu5HTbor"),
-"tamil": DRIVE_LINK_PLACEHOLDER.format("1uN5SShua6UrEX35yWcm8EW-TVD87pcrU"),
-"trenchers": DRIVE_LINK_PLACEHOLDER.format("1tFYMPCr8TT4NuskR9-xVL90Iqq2OBlIH"),
-"toyota": DRIVE_LINK_PLACEHOLDER.format("1xEHj47ihLVD9TzSOuI9lS-am6lMzUDUB"),
-"tongs": DRIVE_LINK_PLACEHOLDER.format("1plzK49TfpodJ4BwmW1VLGwAZfnd4zBXr"),
-"tenons": DRIVE_LINK_PLACEHOLDER.format("1m7QjZM5rxMCH9ZJVM1eSTWiPkio9voG2"),
-"thyroxine": DRIVE_LINK_PLACEHOLDER.format("1ECi-CBiYEJOJY1yTsFSs_eR3_RgQSwbM"),
-"tennis": DRIVE_LINK_PLACEHOLDER.format("1lx712DtYNhSNVHlVBy-xbvuLgWfHGDhU"),
-"tongue": DRIVE_LINK_PLACEHOLDER.format("1K_ir8pvV-V40HoIUF40pcWM46ykXmOOo"),
-"throat": DRIVE_LINK_PLACEHOLDER.format("1BaCDgG1tWVFqsLlWgm3Kuv_6BFyfLtiH"),
-"threading": DRIVE_LINK_PLACEHOLDER.format("1uTKnIop3keGPwQxLIxRhBbXeJdTL9MIP"),
-"tremor": DRIVE_LINK_PLACEHOLDER.format("1s9b-wn75WUUciXAl_xGbsTXltPLHa5jl"),
-"transplantation": DRIVE_LINK_PLACEHOLDER.format("1V3tOFUir5KDH-eSmoKBhAESIbG6SgBof"),
-"tracheotomy": DRIVE_LINK_PLACEHOLDER.format("1EK3Zc5IA-ndQavGPUQrJ7uxW_BWQIfzP"),
-"trachea": DRIVE_LINK_PLACEHOLDER.format("1_UAbpIeD1-Wp5AMfEXpOxHzRbsnsU4yT"),
-"tourniquet": DRIVE_LINK_PLACEHOLDER.format("1DTKN30VBeV9J1OFy4Q1fL57E8_Fc2wn6"),
-"than":DRIVE_LINK_PLACEHOLDER.format("1ZHyVWbF8aeVNpLqUcq2Ql3bzjduPBmt9"),
-"toothache": DRIVE_LINK_PLACEHOLDER.format("1diT5gJii_Po5mrQAMZIA56JSYrmn-K06"),
-"tonsillitis": DRIVE_LINK_PLACEHOLDER.format("1bVw9q3o_XxU79HiacEjIb2rTWCt2tbPN"),
-"tonsillectomy": DRIVE_LINK_PLACEHOLDER.format("1ppZzn3yi18vFtgwyo9PNNC2ppxlPmTl3"),
-"tinnitus": DRIVE_LINK_PLACEHOLDER.format("1cnoiaVzImWl7PlpTzMV1f7yujlP-QhxR"),
-"tibia": DRIVE_LINK_PLACEHOLDER.format("12XADPdieTsvbgHzxyEso6LmCHNAYn4_u"),
-"thrombocytopenia": DRIVE_LINK_PLACEHOLDER.format("1sQ_C3guact2R0pJjNfk-a0b7_pI24LbG"),
-"testosterone": DRIVE_LINK_PLACEHOLDER.format("1oAuJaf3bNNLL_3yq55a5Qi0sn6Iu8qGm"),
-"tendon": DRIVE_LINK_PLACEHOLDER.format("1SRJCYHQbhcnrozJVuw_GdI5BWztZ2BQd"),
-"tachycardia": DRIVE_LINK_PLACEHOLDER.format("1c2GUaOhNogIgsLskzu25ifi-d50x9hks"),
-"tablet": DRIVE_LINK_PLACEHOLDER.format("1HZmzDt-YLjtwAXu4BsCcm2wBLf9AtXuy"),
-"turkey": DRIVE_LINK_PLACEHOLDER.format("1QUPQhYGveggsyJUy3yfMFSfzY6LSxvAg"),
-"tunisia": DRIVE_LINK_PLACEHOLDER.format("1Tut1PaibowvHI0GIAG2-UHIzZn_B1qOO"),
-"thailand": DRIVE_LINK_PLACEHOLDER.format("1-pLr_dHsVlgK7xufzpGEaJrCSEncJsaM"),
-"tanzania": DRIVE_LINK_PLACEHOLDER.format("1Atr5WP1C0n05Mu30RcPzj_bqJRgtLcQx"),
-"taiwan": DRIVE_LINK_PLACEHOLDER.format("18VnPXx5YcdkhutXAklV76-pWMoz3eyEe"),
-"towel": DRIVE_LINK_PLACEHOLDER.format("11m9labJ-Ay6ANv88bvqlvU2q9tSSw4O1"),
-"tie": DRIVE_LINK_PLACEHOLDER.format("1lKUhYPZCISqOhWmxLshp9uJzOLX-lyUI"),
-"toffee": DRIVE_LINK_PLACEHOLDER.format("1wBZ1kp-Lm1KhbW4zl-HW-mI0ZV9EB48G"),
-"tea": DRIVE_LINK_PLACEHOLDER.format("1Mhg_Ozq7wTaSCq4iQHMYUkdk4wHmLpap"),
-"touch": DRIVE_LINK_PLACEHOLDER.format("1EmlwE5-hrD0mwI02ZasGj8ff_nf4c8li"),
-"tomorrow": DRIVE_LINK_PLACEHOLDER.format("1xx70VX3Yr8068kzsTXEUXkMWoYpro89Y"),
-"today": DRIVE_LINK_PLACEHOLDER.format("19VdwmISY2LKgXsWhQybRChpE8CLunWNR"),
-"time": DRIVE_LINK_PLACEHOLDER.format("1YwPH2rQhN1ppOK3Vx45PA1zxjrhJ_mOf"),
-"ticket": DRIVE_LINK_PLACEHOLDER.format("1MwiPN7588jotExtWoOfGof2SAicqJxAx"),
-"throw": DRIVE_LINK_PLACEHOLDER.format("12YZQcszyrDnP5k_qZMk46lfxp0kM82IO"),
-"technology": DRIVE_LINK_PLACEHOLDER.format("1TZQDl6Bs2CeLpZ_oC3Xo4w2zyB0XVgcN"),
-"taste": DRIVE_LINK_PLACEHOLDER.format("1D_1qVLdE9jENzz0cu7nQSHKK_CCgjfDW"),
-"tyranny": DRIVE_LINK_PLACEHOLDER.format("1DcqDvMUyLVGFD1CaaGCkDFU9dcbQyxZu"),
-"transformer": DRIVE_LINK_PLACEHOLDER.format("1z1ONNU51mquifZXlt88eNOKy_b6NAxAn"),
-"travelogue": DRIVE_LINK_PLACEHOLDER.format("17KmzJ5JFzQeJZWacBYfYbM7sVqV2tFoC"),
-"transhumance": DRIVE_LINK_PLACEHOLDER.format("1tV3x0wjgg_0WqxorFxrQQOp-vjvHEvQI"),
-"teenage": DRIVE_LINK_PLACEHOLDER.format("14h6EJzUIFHKLxSZm1Zwdfda0GcDPuVJg"),
-"toxicology": DRIVE_LINK_PLACEHOLDER.format("1c9Ke0-txpghzrNVCAf0RUWyY3E8FKB_3"),
-"tonsil": DRIVE_LINK_PLACEHOLDER.format("1-uC4t5sZBZefCmxQ_QuPMGrZ6dyflf4b"),
-"therapist": DRIVE_LINK_PLACEHOLDER.format("1o_57mR9APqDUh_iWSrw-TzdttdHPPntH"),
-"theatre": DRIVE_LINK_PLACEHOLDER.format("1FCESe6bL-Vr-wvBMoctxtQBm_uwwwEJZ"),
-"testes": DRIVE_LINK_PLACEHOLDER.format("1vBAun_Q_fq6VLoo3S__q8MBamps25R7G"),
-"toll": DRIVE_LINK_PLACEHOLDER.format("1YyuySwvqNdiyp_gGvF6shnPMyZxQnF8d"),
-"twitter": DRIVE_LINK_PLACEHOLDER.format("1eMPAPELjmk5jFHomSR64Pf8RY1ZVcBxr"),
-"tunic": DRIVE_LINK_PLACEHOLDER.format("12jGq-WqX9WD0RRTGOwbPLsEelE6oKgN2"),
-"toile": DRIVE_LINK_PLACEHOLDER.format("1b-PSP8wYjpz5qveM1GNv8uLMHyycGZCi"),
-"tanning": DRIVE_LINK_PLACEHOLDER.format("1S6IldTP0PDZX9rFGBNO2pjQPDtCJTh7k"),
-"tyre": DRIVE_LINK_PLACEHOLDER.format("1hsPYdpc7Rm0Kle4iFJBOtdSz8-33CKxs"),
-"tubelight": DRIVE_LINK_PLACEHOLDER.format("1J88Sr74VdCzbXZ7Yf4drayCnz_dMqJdu"),
-"triangle": DRIVE_LINK_PLACEHOLDER.format("13rag7WJl934wu8w_FjwiRDoY-PCNzMLY"),
-"torch": DRIVE_LINK_PLACEHOLDER.format("16okYjlYSjzcs3Nd-8iDndsOtqUCLIKcb"),
-"toothpick": DRIVE_LINK_PLACEHOLDER.format("1Td8_uIG70su-G_Eq-NSnuQ-bgbK_T9gZ"),
-"toothpaste": DRIVE_LINK_PLACEHOLDER.format("1Rbit953wNB5bsoP_68N4RL5ZBcgV6JzH"),
-"tootbrush": DRIVE_LINK_PLACEHOLDER.format("11LQGBeA06SXl_mADSr0k3TdDo5nfBgv6"),
-"television": DRIVE_LINK_PLACEHOLDER.format("1nS-CZCgofuSs1hjsC8vPmOZKT5Sa2_7x"),
-"theme": DRIVE_LINK_PLACEHOLDER.format("18Wp5SsjR4ygOYLinT-PxDA5qwW-bYMdX"),
-"tympanometer": DRIVE_LINK_PLACEHOLDER.format("1J5v9pzInssTBJ7VUzQma5Uj4BNurKld-"),
-"tripod": DRIVE_LINK_PLACEHOLDER.format("1d3YzLB7DbJTRq3xYWSYUdM5nBdLIdwZF"),
-"tomato": DRIVE_LINK_PLACEHOLDER.format("1KSVUSV6FdCuRG33tDH6lYB2h9MxEB_oO"),
-"tree": DRIVE_LINK_PLACEHOLDER.format("1CvS45KtsjClVmKiSmABQUGx8PhMfWDML"),
-"tornado": DRIVE_LINK_PLACEHOLDER.format("1ZmO4mZ6CLyRDqGWQa4XVVzQkfb1x0Bot"),
-"thunder": DRIVE_LINK_PLACEHOLDER.format("1VZbm8Pv3eMGotF3hZlIrj5mslOpa2e__"),
-"thursday": DRIVE_LINK_PLACEHOLDER.format("1zEqxQS_bLdbCb5sV31U--2vrkZH5jpV4"),
-"tuesday": DRIVE_LINK_PLACEHOLDER.format("1-r9tYWD0c1w-LDH3wvY0WTH3AnLOJdMS"),
-"tortoise": DRIVE_LINK_PLACEHOLDER.format("1xoHK5ggyNxyY9meVIIuGtsf02kQ_r6yj"),
-"transgender": DRIVE_LINK_PLACEHOLDER.format("1rC0KuZxoWgTROaFFmT9z2Drps6ekpLhz"),
-"trust": DRIVE_LINK_PLACEHOLDER.format("1kLlMBdjBCRB_HgbVKS3xz_XU0DLPGiKe"),
-"taxi": DRIVE_LINK_PLACEHOLDER.format("1SuFBWe5FMtyet9VXKXVUz-Hw7JhlcFm9"),
-"tap": DRIVE_LINK_PLACEHOLDER.format("1tgNi4TTPczexYD4BvQGsuRc2jPXMVJXV"),
-"tabla": DRIVE_LINK_PLACEHOLDER.format("1iEdm77oMokH269gbT8DdRqRjPCPDWNUH"),
-"toaster": DRIVE_LINK_PLACEHOLDER.format("1Mvi7hCPZUtmpRxmiKUAYuEWUwXM4g8ya"),
-"thrice": DRIVE_LINK_PLACEHOLDER.format("1aqfuyVZu4i-uGadcE4eJUxZfTyy75y45"),
-"third": DRIVE_LINK_PLACEHOLDER.format("1w1kF5JS8rgvHb4DUxeYtWue1DhLsWDVP"),
-"themselves": DRIVE_LINK_PLACEHOLDER.format("14NrrWB-kss8pOfj3YN8zAzlXuqHpaufq"),
-"tolerate": DRIVE_LINK_PLACEHOLDER.format("1-axYyq4RI5XPC-34JrbVRenJZE7jiZba"),
-"that": DRIVE_LINK_PLACEHOLDER.format("1VAwQl1h_edZwvs_xYJYYzFqKpBRZ-8yV"),
-"trim": DRIVE_LINK_PLACEHOLDER.format("1q9R-xszs7LB1O2ttogagamWCJOYV_Pyv"),
-"try": DRIVE_LINK_PLACEHOLDER.format("1wFPKNsAXgzA3UwHwsUPQeBOQrVsQgvxn"),
-"tool": DRIVE_LINK_PLACEHOLDER.format("14U6y0zXLWjBl5lH6rXCKUUuJpV9oQXGP"),
-"transport": DRIVE_LINK_PLACEHOLDER.format("1DoYn-NxSw6maTmdqu6bOqmHRi2u6Z1Rg"),
-"transparent": DRIVE_LINK_PLACEHOLDER.format("1UtGEdd4sB5T8M8jwO6KIUx_AStdG5M7F"),
-"tooth": DRIVE_LINK_PLACEHOLDER.format("15aaBmIKnaa-JvJgC1-DaJyRC8z9Bsirq"),
-"technician": DRIVE_LINK_PLACEHOLDER.format("1dZ0SmoTDmv692ktODNNx4Y2Noh28Y6bP"),
-"tweezers": DRIVE_LINK_PLACEHOLDER.format("1NiktgFsKM__WnpHyJJP36MTEoReg6O-p"),
-"toolbar": DRIVE_LINK_PLACEHOLDER.format("11HzThpwON0Mem7V1X2rq0fLv0G-zbrcy"),
-"thimble": DRIVE_LINK_PLACEHOLDER.format("1K_zJJ65iXTpasJUuf716lKJvwvi8NfMo"),
-"tumors": DRIVE_LINK_PLACEHOLDER.format("1So3qbPcwfwp5QXyRbNo7fjcBSFO_MLNB"),
-"terrorist": DRIVE_LINK_PLACEHOLDER.format("1xsJ1IinmsyrqpHSJPh7ZEK4z8alUio1b"),
-"twin": DRIVE_LINK_PLACEHOLDER.format("1HqX-DTVYgAaHyTfLde7m6qdr7vCKLOir"),
-"turn": DRIVE_LINK_PLACEHOLDER.format("1x7GVIxldmTi6Fpn6zSI_sza6qMyM49fc"),
-"turmeric": DRIVE_LINK_PLACEHOLDER.format("1_EqkYPyCrLTc3gFb-6HiiRzyRuuKD6Ia"),
-"triple": DRIVE_LINK_PLACEHOLDER.format("1wV1fxTXhCEbOd-7rQZnC_uTtULybZRqK"),
-"traffic": DRIVE_LINK_PLACEHOLDER.format("1swXVqm6FFS4_VsOdofgg96xM8kRFK04W"),
-"traditional": DRIVE_LINK_PLACEHOLDER.format("1kLAkyntSgHNeK_FyOlwgr-JMvF-Zf1mU"),
-"toy": DRIVE_LINK_PLACEHOLDER.format("1aYwdBZGo_34_Rm61Jkp-hLGDX_kSIH-o"),
-"town": DRIVE_LINK_PLACEHOLDER.format("1CBgfCfgWdWNStgJWWDkAqNwsSGvafMbY"),
-"touchscreen": DRIVE_LINK_PLACEHOLDER.format("1vPOoozS1RakqSRg6-bbgyHqQ6FTv7e5g"),
-"tonight": DRIVE_LINK_PLACEHOLDER.format("189drp0mf5BulM_lqs2_8cUAoGjjaphMD"),
-"timid": DRIVE_LINK_PLACEHOLDER.format("12VHhJSR2b3PFnwkjWj_uqQ5hcj5biXeX"),
-"tiffin": DRIVE_LINK_PLACEHOLDER.format("1280f--LObElIbyXI38b4ZOlpD_Q_LAAJ"),
-"this": DRIVE_LINK_PLACEHOLDER.format("1extqtL-IQia7BZD_EcCrRHwFUcuCuQBr"),
-"thirsty": DRIVE_LINK_PLACEHOLDER.format("1RqIEZSOgJg-6mgECwK65uZubRMOnzY3s"),
-"things": DRIVE_LINK_PLACEHOLDER.format("14rDhWxAq3teCs7P8D_REAbK4WkvJUqGB"),
-"thin": DRIVE_LINK_PLACEHOLDER.format("1rs_-m-0tmqEIKgR8p7hIKRByG60xGBgG"),
-"tension": DRIVE_LINK_PLACEHOLDER.format("1XCtqxgEW4_NIm78_ClwU7_NlzQmJjmjQ"),
-"temporary": DRIVE_LINK_PLACEHOLDER.format("1T2r0frQsrTJpLKRyI5C7nW1bweiyXsZE"),
-"temple": DRIVE_LINK_PLACEHOLDER.format("1H2H1hJFwmw2YWTxAAUxHde5W0MmUcxYb"),
-"tape": DRIVE_LINK_PLACEHOLDER.format("1XGmj1GSxMlvocrHik1eTT7ANHblc8tyQ"),
-"take": DRIVE_LINK_PLACEHOLDER.format("13pfKMV43maoou1NeLS7h43GrRevERyKP"),
-"thumb": DRIVE_LINK_PLACEHOLDER.format("1DQvV27TsvPIn64o492VgCXfGDhyxB7Pa"),
-"thigh": DRIVE_LINK_PLACEHOLDER.format("1uoc6TYwUjbhu1nB3mQeNFKnr8igunAY0"),
-"tuberculosis": DRIVE_LINK_PLACEHOLDER.format("1sCBoFInQw7IwEJAfNjXC9ANjKhru5yo3"),
-"travel": DRIVE_LINK_PLACEHOLDER.format("1ejHGUnp-4wh0x00DQyyIVvXIN6YCLDmM"),
-"translator": DRIVE_LINK_PLACEHOLDER.format("1EmgTbt79BeEUbmIBwgroBbwd5YetlB12"),
-"translate": DRIVE_LINK_PLACEHOLDER.format("1e1s3E7ph8PwkXZeQ-OklN33wMhpFmgrp"),
-"train": DRIVE_LINK_PLACEHOLDER.format("1bQnuCqwcKy9PoTWH9vYvU2QDesz3nziB"),
-"top": DRIVE_LINK_PLACEHOLDER.format("1vewXvMh1igb1_9IizQ4h9P4gV33v8QJM"),
-"tonic": DRIVE_LINK_PLACEHOLDER.format("1BOzzBJmqfui-HNF6l5cdJ0YJxwZt91r-"),
-"together": DRIVE_LINK_PLACEHOLDER.format("1FmZlB_6AchuZjm0nug27bF4KIF29_gMb"),
-"they": DRIVE_LINK_PLACEHOLDER.format("1QVWeJNtFD9kP665toI60IgAHNlRSx9ww"),
-"there": DRIVE_LINK_PLACEHOLDER.format("15l-SsSzRUxOyg2ddsvngkwDhVFZ8VrbX"),
-"theirs": DRIVE_LINK_PLACEHOLDER.format("1OmvWLssIwZy_2cXlcOzC2jHoZB5Q5YiR"),
-"team": DRIVE_LINK_PLACEHOLDER.format("1P7wuzew-DkM3usimqadxOExbrGROk8V2"),
-"teach": DRIVE_LINK_PLACEHOLDER.format("1LNpesyLEDkXKiSSfIT8v0BDPtTY-fZeP"),
-"unit": DRIVE_LINK_PLACEHOLDER.format("1STJJRTyJcIdNjEoHuZSw9fwonbsesQrL"),
-"uttarkhand": DRIVE_LINK_PLACEHOLDER.format("1rgRZ020NbhmV91CV4mUWHnegAJRKQf8E"),
-"uttar pradesh":DRIVE_LINK_PLACEHOLDER.format("1CDElG2RiqMkeTYl5Il1bWj53iAL-pZNj"),
-"unit": DRIVE_LINK_PLACEHOLDER.format("1-XfbTBjDz50_ODXwU2fcneg0qQO_deP9"),
-"unauthorised": DRIVE_LINK_PLACEHOLDER.format("1GOHoqMpgQaK3PSbnKNfNEb-vya1fDF4x"),
-"utilisation": DRIVE_LINK_PLACEHOLDER.format("1FkgMbs9OSbA2D2FUWBKTT6RFssgDeo0_"),
-"ugly": DRIVE_LINK_PLACEHOLDER.format("1m5YgqBsvpdydGGnMVzlm5nnR3mT62tWx"),
-"umpire": DRIVE_LINK_PLACEHOLDER.format("1DAF2MP2Z1BVpr7YkS1dSL0JQG8aDrpWF"),
-"unhappy": DRIVE_LINK_PLACEHOLDER.format("1W7DTA7slO4qIe3dbdxvdTg_RVUtUQlTP"),
-"unimodal": DRIVE_LINK_PLACEHOLDER.format("1ssYTvM52GsPUdYN_m597rqsvePMr7sq7"),
-"underhand": DRIVE_LINK_PLACEHOLDER.format("1nSb_T4pKARh669aakudizhhPhE_ZoFzY"),
-"uranus": DRIVE_LINK_PLACEHOLDER.format("1SYMVP_gE__ZOibdoJGThQ81fVA7P8z_n"),
-"undersigned": DRIVE_LINK_PLACEHOLDER.format("1Hou1_RE_d7lc9w3zrpSfm_5LiJKNH9ii"),
-"update": DRIVE_LINK_PLACEHOLDER.format("1i7b7AKFIrdTC9Q8kgHQxLnSafdCHaEUz"),
-"urgent": DRIVE_LINK_PLACEHOLDER.format("1yABFcuYjzX3clBX0fuKHlzizvZfcJAbE"),
-"uncle": DRIVE_LINK_PLACEHOLDER.format("14010x752QSKzA0U5VuSqS-zbmhb3rcCR"),
-"umiak": DRIVE_LINK_PLACEHOLDER.format("1bhnqqv7nE57EMdTwcNdjGHG6B_DhSN87"),
-"uncrpd": DRIVE_LINK_PLACEHOLDER.format("1gWZF5JJecMlLcyFwPRYBi9R778DLK_RW"),
-"urticaria": DRIVE_LINK_PLACEHOLDER.format("14YI5vbjtEk8O2qe3ZW_cCFQSTyn_k81g"),
-"umpire": DRIVE_LINK_PLACEHOLDER.format("1LIWvpXtSv9_ijeNt55C7uknzpzkFllhJ"),
-"unprecedented": DRIVE_LINK_PLACEHOLDER.format("1NM0OGjYOTJ8GapEY_ca5NNz8tsicebaP"),
-"urethra": DRIVE_LINK_PLACEHOLDER.format("1n1r4B2v1LmDv8zWedngi2x_Fh8qwrZgT"),
-"ureter": DRIVE_LINK_PLACEHOLDER.format("1cRQAVmSvvKoOHig9wTbnmE1xem_izgo7"),
-"uterus": DRIVE_LINK_PLACEHOLDER.format("14iKszsw-Q3LfMnjOYZxRHi4wJh9NWqpr"),
-"urologist": DRIVE_LINK_PLACEHOLDER.format("1XGARJVW5ZEszeUxl2ZoV-DY7X1SMVZ-L"),
-"urine": DRIVE_LINK_PLACEHOLDER.format("11UzkuWTNq4QfPQRcfjRMdR9sVMQhUfZH"),
-"uzbekistan": DRIVE_LINK_PLACEHOLDER.format("1afUeBup3yAoP7v1-g9brYeHhLHtbVVCY"),
-"uruguay": DRIVE_LINK_PLACEHOLDER.format("1Cw8RRa-Q21LhaQ4a85zds2Cit8ppJnEn"),
-"ukraine": DRIVE_LINK_PLACEHOLDER.format("1mv9YXloRE-gr1G8AcEhwlg7zuOTG-kuG"),
-"uganda": DRIVE_LINK_PLACEHOLDER.format("1VHPfBXceVJPYTGNU17UIFtqUWMz0dhPu"),
-"umbrella": DRIVE_LINK_PLACEHOLDER.format("11w6ijQvGYU4FBmA2HT2FHp95zmmHsNan"),
-"untouchability": DRIVE_LINK_PLACEHOLDER.format("1j-hMg3B4XS7L5iFWC95pQVyn4rKmO16v"),
-"universe": DRIVE_LINK_PLACEHOLDER.format("1VeUV_YBwkq_avehydlDTXqAKHDpYthyT"),
-"usury": DRIVE_LINK_PLACEHOLDER.format("1FNt2c-FgtWVONrecULDoTlOGMT4ioKq1"),
-"undo": DRIVE_LINK_PLACEHOLDER.format("1sPM3Tn61zRmtQ--thD6tn5yz7wgCwcl-"),
-"urbanization": DRIVE_LINK_PLACEHOLDER.format("1u5B5WnUIKkEphga8MU1MxJCOBeBQr_Ax"),
-"uterine": DRIVE_LINK_PLACEHOLDER.format("1I4W-_lHElC1X5pL33gI9m9pBAV5lqwtW"),
-"url": DRIVE_LINK_PLACEHOLDER.format("1h62SLql7E6JfkZaTMrycdpq12dzCLI2U"),
-"unix": DRIVE_LINK_PLACEHOLDER.format("1IeuJlh8g7KUwu0XSQMO3RPErgTEiyOgM"),
-"underline": DRIVE_LINK_PLACEHOLDER.format("1ebQPZ3wFAj7hRg8t-n2VDVQ5U8uzzWLx"),
-"uncomfortable": DRIVE_LINK_PLACEHOLDER.format("1eptzrxgiaVZwK-Gob7FMr2dn-ZohPWyG"),
-"unofficial": DRIVE_LINK_PLACEHOLDER.format("1goxgT83KjkvtTZNoMws6RSUQHl3vIDBP"),
-"urology": DRIVE_LINK_PLACEHOLDER.format("1tcmXHG_IP0I6mDh5oYGmF1cLQCGa0424"),
-"ulcers": DRIVE_LINK_PLACEHOLDER.format("1P3uyOXysv_PUm3A7-rc0Z0mB28dReAt6"),
-"urdu": DRIVE_LINK_PLACEHOLDER.format("1f-ZJY_LN80d7n_ZABbtj28g7KY7KbPrz"),
-"up": DRIVE_LINK_PLACEHOLDER.format("1k6ZUP12Qu2zPG8YpPbuqYmqo0j5lTp_2"),
-"university": DRIVE_LINK_PLACEHOLDER.format("1rQPh-6Tv2AsQ1B8pipgKn4OEHmGA1JO-"),
-"under": DRIVE_LINK_PLACEHOLDER.format("1BTPw8dSVRVEU6nQDyTNKi1lGmeVkbZ4M"),
-"vitiligo": DRIVE_LINK_PLACEHOLDER.format("1BlEkTtn4PLZkiTzi78eu9E_rHOdcSadn"),
-"viruses": DRIVE_LINK_PLACEHOLDER.format("12Enm6hH5aHe3jjszD7PK7gmXhjO_r85F"),
-"vertex": DRIVE_LINK_PLACEHOLDER.format("1wefHWjiLZ06GX9LhAxTuiDQ4lk91OdpO"),
-"varanasi": DRIVE_LINK_PLACEHOLDER.format("1A5a8cq_hpSeSHfcyNT143n_71N6XlP-4"),
-"victim": DRIVE_LINK_PLACEHOLDER.format("1iAiXXc8vYbBNeVyAuU8USsc-RrnVLCIa"),
-"villi": DRIVE_LINK_PLACEHOLDER.format("1NU7N9Gm81RBruUT0FVc24IRy5_yKyxvX"),
-"vein": DRIVE_LINK_PLACEHOLDER.format("1oHefq3jJ7hG2t9nwCiW1m8ivA-gn1oN5"),
-"vapour": DRIVE_LINK_PLACEHOLDER.format("1S7gP3I8Q_ZXT3kDmaLsXtgxo9-VxdEou"),
-"variable": DRIVE_LINK_PLACEHOLDER.format("1LWNdsVw8Xj1Q1tQsmpbPUhYgI-1XQhmG"),
-"vertex": DRIVE_LINK_PLACEHOLDER.format("1yturRiDIxS1qomYa9z7w0rZc1ypccQfB"),
-"varna": DRIVE_LINK_PLACEHOLDER.format("1IA40Rpg98A39VcWv1Q-ENaAwwkjGdNw_"),
-"vaishya": DRIVE_LINK_PLACEHOLDER.format("1qwxTXBTOWzQSmn9Yw4P-Kw-Y__St0AY3"),
-"vadodara": DRIVE_LINK_PLACEHOLDER.format("1nt5tWK-B-PF9gOae4LytFf_eo24_OF33"),
-"voluntarily": DRIVE_LINK_PLACEHOLDER.format("1FmKUi4iNFwW0l8Cla5HoEKaZ8QuZxm0a"),
-"verification": DRIVE_LINK_PLACEHOLDER.format("1yOKMKAfbHajdtndYkxvJzKOPuhCkHqsA"),
-"volcano": DRIVE_LINK_PLACEHOLDER.format("1YRmhzwOfh8I0qyvCFlnKG7OSdfeT4OQD"),
-"viable": DRIVE_LINK_PLACEHOLDER.format("1lTePz87P_UPeZPKxYsTFv2uABN6fq6yN"),
-"vagaries": DRIVE_LINK_PLACEHOLDER.format("1-aw3Po9cq2N-T9n6rpOrSyvYUFhgdZHa"),
-"visible": DRIVE_LINK_PLACEHOLDER.format("1KcHtlwTpA6dPZlnEfMG4pbhu77G7CKcp"),
-"vision": DRIVE_LINK_PLACEHOLDER.format("1bUZKDN4Zs9cIhm9RoFc-PlK0OQssmbyT"),
-"vacuole": DRIVE_LINK_PLACEHOLDER.format("1UVKM1seUAF370by6d6mVoRkusjH7N8Zu"),
-"ventilation": DRIVE_LINK_PLACEHOLDER.format("1KPGLYJzJarfRulFHahFqZHJjErSVwe0_"),
-"vacationers": DRIVE_LINK_PLACEHOLDER.format("1serlZ9jHbLTxr5dJP76-NzXynQbnAjRy"),
-"vertebrates": DRIVE_LINK_PLACEHOLDER.format("1Bi5F5YDsSk_Ooa4HCnCHJPNFGK7MQeyz"),
-"venus": DRIVE_LINK_PLACEHOLDER.format("1kWUdqxAyh-CpqfCsyPkpwYSMZaX-Onde"),
-"veteran": DRIVE_LINK_PLACEHOLDER.format("1_qBiUHNxNYOB5K0NrxGZ3GTJEj4Az8j5"),
-"voyeurism": DRIVE_LINK_PLACEHOLDER.format("1wIDJoz0eNBIn6E1jW4RnH17xtzs60dD9"),
-"viscosity": DRIVE_LINK_PLACEHOLDER.format("1Ckiic0m4osdk9lDt4e20F7RauDFrsYwO"),
-"velocity": DRIVE_LINK_PLACEHOLDER.format("1XFaEuJx7v52_hJ_OCmLdltuI9F9ieOwH"),
-"vitamins": DRIVE_LINK_PLACEHOLDER.format("18fsU-OETYyrsvvt9v1zLl7-AbTOlFfZI"),
-"vocabulary": DRIVE_LINK_PLACEHOLDER.format("1p9PtwFhwDefjFNOMWQoci6Uxq7oPJXh9"),
-"verbs": DRIVE_LINK_PLACEHOLDER.format("1PJlLs0GfqUTT4LHDHNzKLiQE58LmVUjX"),
-"vishnu": DRIVE_LINK_PLACEHOLDER.format("19VSP5RY_DuTMMA_cSC2t2n1vJxecDowR"),
-"vodafone": DRIVE_LINK_PLACEHOLDER.format("1SRXGYB1ACHg5zsJrC0n_Cao8pcyzFQDz"),
-"volkswagen": DRIVE_LINK_PLACEHOLDER.format("1PJwCxHkArutt7oUOl-rFvIu-22WOX7cj"),
-"volleyball": DRIVE_LINK_PLACEHOLDER.format("1InVWQV2RYpSsovT37kI0HFhQg1OILu5U"),
-"vomiting": DRIVE_LINK_PLACEHOLDER.format("1CsCIKcMrUfvtFQyI62rH4zYWwpcqmcCx"),
-"vertigo": DRIVE_LINK_PLACEHOLDER.format("18099_31pgLyKaGLV7s7xNv8YjY05ffPA"),
-"vertebra": DRIVE_LINK_PLACEHOLDER.format("164G9pK5QLcjBYXQUB3raFsauTGGROGW2"),
-"vein": DRIVE_LINK_PLACEHOLDER.format("1X6Rky5eSzETIJF-R1j5qLRD1-9TO4LSQ"),
-"vaccine": DRIVE_LINK_PLACEHOLDER.format("1MttlxULQbGioBuMILVJJni4cxZZrGQto"),
-"vaccination": DRIVE_LINK_PLACEHOLDER.format("1ltjJASJL41w6wruuYwmKS7uI5iz1IEx1"),
-"vibrator": DRIVE_LINK_PLACEHOLDER.format("1M1LM0tWWj8M1-TuIN_JWhLQbxgHONdOk"),
-"vietnam": DRIVE_LINK_PLACEHOLDER.format("1BhxWjnoopwQAeH34qB0i8hPZvuemPH7O"),
-"venezuela": DRIVE_LINK_PLACEHOLDER.format("1fz4RJAARIyDaDubB_EJYEe5ufMXFBjuP"),
-"vodka": DRIVE_LINK_PLACEHOLDER.format("1gY7M7r6JrDGooN5_peC_8H6t4Olz4qUw"),
-"valve": DRIVE_LINK_PLACEHOLDER.format("1izlCbDtq4izPwv8vhR40KtlHezRv2N5D"),
-"vermicomposting": DRIVE_LINK_PLACEHOLDER.format("1UV6Bj6RGRvjaCKdMXoify6W9wQbKlasT"),
-"victim": DRIVE_LINK_PLACEHOLDER.format("1UP20lGdYTG17BB8sG26WpKB8-qw3kW7W"),
-"volatile": DRIVE_LINK_PLACEHOLDER.format("1uC5-LZVUK8fobjASrwVkqFpMZueliB0p"),
-"variable": DRIVE_LINK_PLACEHOLDER.format("1pJdsrO_xE9p8_001As4RG2dY6VWikH0b"),
-"volt": DRIVE_LINK_PLACEHOLDER.format("164rDhlnpYPO6XRsPDX5vmBeVGkJVhdGU"),
-"viticulture": DRIVE_LINK_PLACEHOLDER.format("1bmGnTzTgmYZyUzPDHxu1a4dEPsibmplI"),
-"vent": DRIVE_LINK_PLACEHOLDER.format("1jvJZo78uUBDZPoc0BnDDZOjbBsCx9kBL"),
-"velcro": DRIVE_LINK_PLACEHOLDER.format("1_1TEHUxyCaaPgrcxnSGi2NkwnZgl5Ya1"),
-"vectors": DRIVE_LINK_PLACEHOLDER.format("1ULfpDiUogI9ar5ILZahjEQVq-umSg8bZ"),
-"vegetables": DRIVE_LINK_PLACEHOLDER.format("1hkjLn6KuYc5MbwfRMayCzFv3t5HIMWWx"),
-"volume": DRIVE_LINK_PLACEHOLDER.format("18MeS2K-0X7Cqoeko2HjbxOHF9OBC-eHL"),
-"valley": DRIVE_LINK_PLACEHOLDER.format("1xDlUNWQyov4hUyAeHjpmUAqRNR_9Z_50"),
-"vulture": DRIVE_LINK_PLACEHOLDER.format("1jXAOcT_we6vdEp5lOcwVtqvssMCyU1bR"),
-"violin": DRIVE_LINK_PLACEHOLDER.format("1ZMqU22sCS7fzg3w8IQhwvXOSPG4UWJ1k"),
-"very": DRIVE_LINK_PLACEHOLDER.format("1aWt-XXsbhtFWQJZrHeno8WSG-0tjH-ig"),
-"version": DRIVE_LINK_PLACEHOLDER.format("1rkx1MI2dXbE8jdLeGvbCX1k0mTf51qBM"),
-"vote": DRIVE_LINK_PLACEHOLDER.format("1DmZw3__2Z-kOsjzWI46zfNjWSQ4XJncv"),
-"vocation": DRIVE_LINK_PLACEHOLDER.format("1rafmJ1ZFywMiJtjFIrhCXnMuB6R7dT3g"),
-"visual": DRIVE_LINK_PLACEHOLDER.format("1iX1KsI7mcvWkG3p76bqCVXqT7NVu-0h6"),
-"visit": DRIVE_LINK_PLACEHOLDER.format("1PwKUz3RUIQmTAqeGT3gsvTxcRWOQ_-RW"),
-"village": DRIVE_LINK_PLACEHOLDER.format("1hs0Fnt6iPhLkH6KfZaYnYRO94Xb1kwHe"),
-"vessel": DRIVE_LINK_PLACEHOLDER.format("1Ql-QQji6HnDlFptZyZPZT0EtmXg3rZ5g"),
-"verb": DRIVE_LINK_PLACEHOLDER.format("1xzThGLfUVDXHSoIVnltwtEOv429KXN1s"),
-"variation": DRIVE_LINK_PLACEHOLDER.format("1bpOm21MWyPY9ATzQI05jD-HpnQLmgGkH"),
-"van": DRIVE_LINK_PLACEHOLDER.format("1gstBgxzAl-jf2tn6xSeu8W90IvrJl52r"),
-"vitamin": DRIVE_LINK_PLACEHOLDER.format("1vS9X5Eb53_OngjJ7yP9Fffr6kb1ge9F0"),
-"virus": DRIVE_LINK_PLACEHOLDER.format("1_LIVyFcZJHZ3sYn4HcPkYqzEGOS4Ht5A"),
-"videographer": DRIVE_LINK_PLACEHOLDER.format("1-V1qYFtbbm62rJmfIniwGKp-A64CeR0A"),
-"voltmeter": DRIVE_LINK_PLACEHOLDER.format("1GkGClnkDMLOGQjhdgRPBPK5e9FHke44B"),
-"virtual": DRIVE_LINK_PLACEHOLDER.format("1-mBj1kJdSN0DLbOh0Fj_qSbgxTz_4zWv"),
-"vakalatnama": DRIVE_LINK_PLACEHOLDER.format("1oBjReya88H_mfLxtUrbQdmuavtHUv1Sd"),
-"voice": DRIVE_LINK_PLACEHOLDER.format("1WXROCAVadViHh3uDkLKTfHCNduxa51oR"),
-"visa": DRIVE_LINK_PLACEHOLDER.format("1cm9KryKB2fTTFeaTLSKDBzVkjwfw3tbB"),
-"video": DRIVE_LINK_PLACEHOLDER.format("1LFWPqeZpXQcS2Yn6N2MYBOch4I7ZurlF"),
-"veterinarian": DRIVE_LINK_PLACEHOLDER.format("11Oco-HUAGJf-ZMEHCv7KxZr9Bt08ikoE"),
-"vehicle": DRIVE_LINK_PLACEHOLDER.format("18vTmA_7Y_uQXfiLGOPIkv9xpAB7uzpYY"),
-"weather": DRIVE_LINK_PLACEHOLDER.format("1Ce1w6MeTQ_OsRZvok9NbakIoDvM5lmdP"),
-"whirlpool": DRIVE_LINK_PLACEHOLDER.format("17C7Cot9WlUwvXuyN5APIjoLCs8MAN7gl"),
-"wastewater": DRIVE_LINK_PLACEHOLDER.format("1yLLrkLHdaZI5VWXeE0DVzU4Z5iJT265U"),
-"warrior": DRIVE_LINK_PLACEHOLDER.format("1OChyrKbMTSnkbXlWSnZ2f_HnKiTX5Pwo"),
-"weapon": DRIVE_LINK_PLACEHOLDER.format("1rmT6k9zhoP-toUM0io0fsw_Aqo30978Q"),
-"wilt": DRIVE_LINK_PLACEHOLDER.format("1-a2CKp1JRN3DreWtvhAui_lk-7qofy31"),
-"weed": DRIVE_LINK_PLACEHOLDER.format("1gH9Ep-Q4iVgRkI3YT5B5rIhbgNf1t_GT"),
-"want": DRIVE_LINK_PLACEHOLDER.format("1YAnh6odCU3a1OdyPboWiq98gfWNXwlBO"),
-"windmill": DRIVE_LINK_PLACEHOLDER.format("1i-alOw8TU13--B37bM-KYZ6ZOU_OH20v"),
-"weekday": DRIVE_LINK_PLACEHOLDER.format("1mGj_uEtlE3PgqJIPFdpUFxowjgxFm5Om"),
-"weekend": DRIVE_LINK_PLACEHOLDER.format("17k8b-W0cY1PSvRJZAaQePu_yOAcPNZQo"),
-"wrinkle": DRIVE_LINK_PLACEHOLDER.format("1pWt8pljbWqTYHW3Cs89nn2E2O3da_Xog"),
-"webex": DRIVE_LINK_PLACEHOLDER.format("1YYegme7Ie5xPkib4bRVkoKpSvb0NQDsG"),
-"wide": DRIVE_LINK_PLACEHOLDER.format("15PSusPw0vu_kBnFFNNivg-3KhpT1XAJp"),
-"withdrawal": DRIVE_LINK_PLACEHOLDER.format("1QqLXFppQrDYKWmtqqW4B8Wb2R0_VY3EU"),
-"whitegoods": DRIVE_LINK_PLACEHOLDER.format("112u6Nb1bOCVvfuvcxc67wNEGIvJFPbLl"),
-"whale": DRIVE_LINK_PLACEHOLDER.format("147MOOm5CwA5RVt7Rqb8Rj5NbJDIgPKwp"),
-"weeds": DRIVE_LINK_PLACEHOLDER.format("13s2blOWoFjjbLBn0q6x4AhKHjWu2Gx7V"),
-"wool": DRIVE_LINK_PLACEHOLDER.format("1MIwkglVebDk04FrbS2gPbxK9AWWNizVr"),
-"wood": DRIVE_LINK_PLACEHOLDER.format("1WVjcMM-jVnEPaPurt6jqAE6Ik1dD7ogD"),
-"walnut": DRIVE_LINK_PLACEHOLDER.format("1rw8Q7RnsMF19OBllcYOllz7yArWafMNd"),
-"weathering": DRIVE_LINK_PLACEHOLDER.format("1WlFcbuWohHx75DgODVP_LqRUHoSxDZJq"),
-"waste": DRIVE_LINK_PLACEHOLDER.format("1ZQsO_BLM578vi8AknetHENnyYeJH3T82"),
-"window": DRIVE_LINK_PLACEHOLDER.format("1_yG8HOAUkNB7s_83G44ufiY6v8czZUIL"),
-"wife": DRIVE_LINK_PLACEHOLDER.format("1JJlQYby0Lrlcp8XqHox9RKa0caUxmUMl"),
-"weaver": DRIVE_LINK_PLACEHOLDER.format("1HLPX8osoOqm-IO8mYwlz37NxtqQjjitC"),
-"winnowing": DRIVE_LINK_PLACEHOLDER.format("1vCwZ5S9HQtyaUVQC7o7UrjuW_fLWJvJK"),
-"wbc": DRIVE_LINK_PLACEHOLDER.format("1_PA-l0qVzi-YT_snNAlHaeNe2wXgnQA9"),
-"waterfall": DRIVE_LINK_PLACEHOLDER.format("1YVmV2i1BAr8mG3cj0WE_xdUBdp82bCVd"),
-"wadis": DRIVE_LINK_PLACEHOLDER.format("1ep686DKcsm9PuFblQbW6wt8P9rNlqsy1"),
-"wrench": DRIVE_LINK_PLACEHOLDER.format("119iTh1v2rCWzLOEUlhXzP7_ZLA2N7RUD"),
-"waveform": DRIVE_LINK_PLACEHOLDER.format("1b6S9dmtpWwXWt57phu6oZ0iKC1k9-fAV"),
-"welder": DRIVE_LINK_PLACEHOLDER.format("1uIbdXibPTrTh0pyL51Ns_M4WuMysu-kH"),
-"weak": DRIVE_LINK_PLACEHOLDER.format("1s2CSY-y50yyLalJbrCuRhEaK4eNsrxvd"),
-"wash": DRIVE_LINK_PLACEHOLDER.format("1COFDem3xu2eqhWvF61AoOdfxT7mWcpsz"),
-"white": DRIVE_LINK_PLACEHOLDER.format("14PPnn4F7nquWB_0uaL7KQgmg3Yq7g9Ac"),
-"waist": DRIVE_LINK_PLACEHOLDER.format("1U5F4vf6zLtD7SWV7rHP870zAqYh1Vkpm"),
-"wicketkeeper": DRIVE_LINK_PLACEHOLDER.format("1r_A9J-szvBM20626KQc6-9vhc6N152Sh"),
-"wicket": DRIVE_LINK_PLACEHOLDER.format("18cDSLVLjngxcOq1RtViEk_Xi46QABVNR"),
-"wallet": DRIVE_LINK_PLACEHOLDER.format("12HqMDzX3jsMI4uQ6uk_CRNMS0DECFScX"),
-"wedge": DRIVE_LINK_PLACEHOLDER.format("1FLJZiWXKIGdIGpk97PCTnp2n30s_JNxe"),
-"wiring": DRIVE_LINK_PLACEHOLDER.format("1SUf2MzDJXo3Skfkxss5WGaFl8TpoECMw"),
-"website": DRIVE_LINK_PLACEHOLDER.format("14ha5uwFHZO2oa6t_dL8nroVyCGROnuU9"),
-"warm": DRIVE_LINK_PLACEHOLDER.format("1OpZN1MtM9f6IzdaZhr-AnyvzcvEqsQ9L"),
-"west bengal": DRIVE_LINK_PLACEHOLDER.format("1DJ8h58jJptyoPi3mUOINdGfNUnjsBwj0"),
-"woven": DRIVE_LINK_PLACEHOLDER.format("1SSLsg7O3VhHTDGXpWMxFpzJA3xW4vtxe"),
-"waxing": DRIVE_LINK_PLACEHOLDER.format("14aO03RPu67ZtZv2s-zmXlRr1p43Xq4Kl"),
-"wash": DRIVE_LINK_PLACEHOLDER.format("1qyQx59XgB48CPa-PvtfbMFoHmKdm6nfj"),
-"wales": DRIVE_LINK_PLACEHOLDER.format("1IJYNv7hYrRkdUxz1XQHKW2UZ5SuvBmyY"),
-"wikipedia": DRIVE_LINK_PLACEHOLDER.format("1K2XmbPV6aZZAevLji9UbIZCsdOCYWpap"),
-"wine": DRIVE_LINK_PLACEHOLDER.format("1aVo3SxAJPKjDJ-ojZrhpZt2CJDS9NlKH"),
-"write": DRIVE_LINK_PLACEHOLDER.format("1zwdUSesGN24U80xedlYHar6GzHHS7u98"),
-"worry": DRIVE_LINK_PLACEHOLDER.format("1tKtC5mVAFwYtYmNz28ukzPdhQFRi2pKf"),
-"when": DRIVE_LINK_PLACEHOLDER.format("1A9vK22ovF7VDFpunwL3tYJTJGZiViqt-"),
-"walk": DRIVE_LINK_PLACEHOLDER.format("1CN8YMKSS4ecHjB80SyGY5kNt_BCqutZ4"),
-"wholesale": DRIVE_LINK_PLACEHOLDER.format("1XYpuR9-gZTWZvI6OhiZa5i94o0e4yOE4"),
-"watt": DRIVE_LINK_PLACEHOLDER.format("1_FQqvQ6Zg_iKNrCm8HxVQntvq8xICDF7"),
-"winds": DRIVE_LINK_PLACEHOLDER.format("184fxB9e0ieeWcM4HOj9UR1Yfz5VCFlUN"),
-"whatsapp": DRIVE_LINK_PLACEHOLDER.format("1puS59qZhWcDVBMqi2Q1lgDRxov-DuFwT"),
-"whiteboard": DRIVE_LINK_PLACEHOLDER.format("1130TzbJgs8QzLIy1HlOysFc2Lgk8vpj9"),
-"wan": DRIVE_LINK_PLACEHOLDER.format("1GQKEKJC2xHe3vfFXqwN1256rrtd_pB4-"),
-"ward": DRIVE_LINK_PLACEHOLDER.format("1fxdtNd3uFT2gmBoH_mzHOduTLgWHNMQM"),
-"watermelon": DRIVE_LINK_PLACEHOLDER.format("1cX8wucxIdW1MM2Gs3O5-fViNMGJdq5xE"),
-"war": DRIVE_LINK_PLACEHOLDER.format("1L9-5misWdsO7aPRWa_E7oJuXRWsZX8-V"),
-"who":DRIVE_LINK_PLACEHOLDER.format("1-10ck91TzMYD3V5oevE5EbxWx58hlq9k"),
-"whom":DRIVE_LINK_PLACEHOLDER.format("1-10ck91TzMYD3V5oevE5EbxWx58hlq9k"),
-"why":DRIVE_LINK_PLACEHOLDER.format("1N02pG1uJtEnbE8Z4gQ6mkWDc0FR0zRKI"),
-"wake": DRIVE_LINK_PLACEHOLDER.format("1ZV31Le1g0nyiyBE1uJeVV3-zYGpglLSK"),
-"winter": DRIVE_LINK_PLACEHOLDER.format("1zkKqioIpAIZS65KRZsaHLZLx1wwrtPj8"),
-"wind": DRIVE_LINK_PLACEHOLDER.format("1gJWDzQX8ofr_02ULLoe3eBZeinvAzpN6"),
-"wave": DRIVE_LINK_PLACEHOLDER.format("11uzKP7or6QGNIYmuI-LHXz5hBMN3O2Z9"),
-"wednesday": DRIVE_LINK_PLACEHOLDER.format("14N4uPlRjlCYMz_-Q49kuzIXDAWoybf7M"),
-"wrestling": DRIVE_LINK_PLACEHOLDER.format("1IGtjkuED8lPmnuephEKWmgUU4TAdXVqI"),
-"weightlifting": DRIVE_LINK_PLACEHOLDER.format("1Klss3Ak2CjUTb3wwezCxThPvwnSi19Ci"),
-"woodpecker": DRIVE_LINK_PLACEHOLDER.format("1p-JrRT3kxIUWnV4UukO8emxrBw8eRgP-"),
-"wolf": DRIVE_LINK_PLACEHOLDER.format("1aP38bReJSUiZHfebVvwaTNzWIe0bYvtI"),
-"whistle": DRIVE_LINK_PLACEHOLDER.format("1sTGmiQ-zJpke7MaxtRGMRoRNRwN79Yje"),
-"workshop": DRIVE_LINK_PLACEHOLDER.format("1XnCLvoS77mSsKDEbFpT_jSHxEAPigOl_"),
-"word": DRIVE_LINK_PLACEHOLDER.format("1hHjZtwtnUM_AlK-s-j2wjljHxhsONoE0"),
-"wall": DRIVE_LINK_PLACEHOLDER.format("1LLC8f3A-w_71wVn3zfuCoRWljLAe7b6n"),
-"washerman": DRIVE_LINK_PLACEHOLDER.format("1-_b7gjPmkHC9-s5e-H036AFDt5jDNyHX"),
-"work": DRIVE_LINK_PLACEHOLDER.format("1bkDF8h9g9Cexy6tU3x5FCPqybXM45HMj"),
-"without": DRIVE_LINK_PLACEHOLDER.format("1S570mFlId3HfncwKGGnx5Cw6Ni-AWV5h"),
-"with": DRIVE_LINK_PLACEHOLDER.format("1Kh2WPp6mt04Yk9fxbjxA-CeWhBSilamd"),
-"win": DRIVE_LINK_PLACEHOLDER.format("1HfmRp0dsrK6fV1XiZlrzWTYL6qGbRrQh"),
-"while": DRIVE_LINK_PLACEHOLDER.format("1ZZ3sX7zA1bbK7yuCSuLoIzcEIaBH77eP"),
-"weekly": DRIVE_LINK_PLACEHOLDER.format("1TRAPFyDjHIxYfJfF1Qw-KVgjF6vrtLuV"),
-"wedding": DRIVE_LINK_PLACEHOLDER.format("1ut54nlTizj-bDdCk3G7Nga-7LIT4fcAf"),
-"weapon": DRIVE_LINK_PLACEHOLDER.format("1Hno7-4-F6urKf7n9NH4DqCfTvhKhMc-o"),
-"washroom": DRIVE_LINK_PLACEHOLDER.format("1SFvL1pYKOkNo8-ptO7QboJOlG8QP256T"),
-"wait": DRIVE_LINK_PLACEHOLDER.format("1qqlZY5T1veySKq7r2P6biwplUyg_iPJx"),
-"warranty": DRIVE_LINK_PLACEHOLDER.format("1ZIFcX8PCIh-MQ6IrQPjZdkZvyUmwW_xA"),
-"wet": DRIVE_LINK_PLACEHOLDER.format("14a_mFm12GZ1opBBbuMTnKLTvT-jezANI"),
-"wear": DRIVE_LINK_PLACEHOLDER.format("1psP6Cd_saTg31oas6coJePG6ewMNUiBN"),
-"water": DRIVE_LINK_PLACEHOLDER.format("1TXFmAS2vWOZNcWepZ6CcaEXtslDWc_El"),
-"waiter": DRIVE_LINK_PLACEHOLDER.format("1Z5a83m2YsHgJ_EnSaYLlOdV23f1VTUwS"),
-"which": DRIVE_LINK_PLACEHOLDER.format("1Hjiz46B6mLkqSmNtKumndk8mkGeO_N-4"),
-"where": DRIVE_LINK_PLACEHOLDER.format("1jHCB67DlteEIUI8dDKx6f1z7RyhW3ww4"),
-"whatever": DRIVE_LINK_PLACEHOLDER.format("1AyC0hvrzW0cYAIBcI52uR0zxx4jviJ3v"),
-"what": DRIVE_LINK_PLACEHOLDER.format("12KbUJ4HK7gsoqYmMD4VsSQ_k_Umy8tud"),
-"west": DRIVE_LINK_PLACEHOLDER.format("1J3PoAsHKTEeSegPQ1Ef0Ud_Ow1kVwZfI"),
-"weave": DRIVE_LINK_PLACEHOLDER.format("1v1Fype4sP0zOCAlFFpdcEAeV8-UuYKTH"),
-"we": DRIVE_LINK_PLACEHOLDER.format("15UWhW79UX1klo8479BTU9VyJaqFi7gwD"),
-"way": DRIVE_LINK_PLACEHOLDER.format("1MLNTnlgy-2nHwgjoywhl7K9WRItssQsN"),
-"wound": DRIVE_LINK_PLACEHOLDER.format("18i85tpOA8hWobAmuhYvME5AIdB8b8_Cz"),
-"wifi": DRIVE_LINK_PLACEHOLDER.format("1czy8A9QqT49vwQqKX7Z755pEUkyNLNgL"),
-"xylem": DRIVE_LINK_PLACEHOLDER.format("1WT2SJe33VPj0QAp8woVbysxgQe9PqK1Y"),
-"xbox": DRIVE_LINK_PLACEHOLDER.format("1ZTkCg6obO7eKKlcZV8tHBxUI4Hz_Yqap"),
-"xylophone": DRIVE_LINK_PLACEHOLDER.format("1jB_jT42n9pdtESSKFomaD_l-sUbFPMKk"),
-"yield": DRIVE_LINK_PLACEHOLDER.format("1OCL1ufEMM2dHnSsJS8MXPaNzU_87Ysy8"),
-"yolk": DRIVE_LINK_PLACEHOLDER.format("1lbHbE7Shflnf90cTZtQNTE4CuPAA5yyJ"),
-"yarn": DRIVE_LINK_PLACEHOLDER.format("1qkex4igy_XGQ4REGNi2vn3pmiMU8uRAe"),
-"yoyo": DRIVE_LINK_PLACEHOLDER.format("1xfBbRE2AqEJW5BN3cxukiotKmGYlXW45"),
-"yearlong": DRIVE_LINK_PLACEHOLDER.format("1_Ubu-RQ-HZLH47jWjXLq-75nUYgFwazx"),
-"yawn": DRIVE_LINK_PLACEHOLDER.format("10g9js7T84Pgn1sQG9vUqLDUMrFP0QWdL"),
-"yellow": DRIVE_LINK_PLACEHOLDER.format("1CR-qOfQo7j286OG4yGGYr1HNhX2nyzq2"),
-"yahoo": DRIVE_LINK_PLACEHOLDER.format("1KqkOUwi2ZE0X0QdiseLpoAf3cJbuHxZg"),
-"youtube": DRIVE_LINK_PLACEHOLDER.format("1Tc2tecdJYbSuNvPwP20QTvPJoEFQGDp4"),
-"yoke": DRIVE_LINK_PLACEHOLDER.format("1aV1jYoac9NXfgCD_xth-e1fGnhx1ihrS"),
-"yardstick": DRIVE_LINK_PLACEHOLDER.format("1XwUmsUBm1Z0XVTWKFy1TJToBydRQZaQG"),
-"young": DRIVE_LINK_PLACEHOLDER.format("1hcUArWTm7HN2m0aTkLqVp4de9M55LvKz"),
-"yak": DRIVE_LINK_PLACEHOLDER.format("1MrIYhwyo1a9kvjK9hqvCMBk1IrB_zo-W"),
-"yes": DRIVE_LINK_PLACEHOLDER.format("1ToFfcA-AgdD_oqMiehMzCqBVJaByymfh"),
-"yesterday": DRIVE_LINK_PLACEHOLDER.format("1kKm6s2OFHPVg2k7OmJgfUU7tSO1HQ0JM"),
-"youth": DRIVE_LINK_PLACEHOLDER.format("1B_92od6X0bMTr8OIhfKDUmw0Kryzk5-b"),
-"younger": DRIVE_LINK_PLACEHOLDER.format("13tO_72-uPCWMBmOKNZuDz3tp-PBU-ht_"),
-"year": DRIVE_LINK_PLACEHOLDER.format("1aCzTmCmCOWJ5k0FXz04clUqr0JBuKfh6"),
-"yourself": DRIVE_LINK_PLACEHOLDER.format("17L6Mp9datPoXbfGCQiNXzORNtOkX0GJg"),
-"your": DRIVE_LINK_PLACEHOLDER.format("1UHMsMg9qGC2qbdR3RjKimFkPqOQX59Po"),
-"you": DRIVE_LINK_PLACEHOLDER.format("1AWOcuY6jFlh8b6M-MNdckfL2g67L3QmR"),
-"yoga": DRIVE_LINK_PLACEHOLDER.format("1vcf0p_PIa3ysLoI1lvbf84Br7m9d3b0M"),
-"zimlets": DRIVE_LINK_PLACEHOLDER.format("1lgAUDNWf2EEuWC5WGzQlm62fVu_1RLYJ"),
-"zone": DRIVE_LINK_PLACEHOLDER.format("1xk5cXy-OucPAto7UYrn7idQgW93yXQuc"),
-"zoom": DRIVE_LINK_PLACEHOLDER.format("1jXlcJqvt0pR02xVcjkv7ZBFf3jECdBG5"),
-"zimbabwe": DRIVE_LINK_PLACEHOLDER.format("198WEGSTwlxuefaLAT0or3FqRWM-YjaDd"),
-"zambia": DRIVE_LINK_PLACEHOLDER.format("1qi2F0znfUU_DueQzzaFzI3W1H4b8puEd"),
-"zipper": DRIVE_LINK_PLACEHOLDER.format("1URASVofgqxs9m5kxVR6FK_k5P94n81jQ"),
-"zebra": DRIVE_LINK_PLACEHOLDER.format("1V8RGkXogmE34hAR4PbE2tsSZHPPS7afB"),
-"zero": DRIVE_LINK_PLACEHOLDER.format("1ur5X53RsOtHSBXMhl3gTTQyljhzsPhdt"),
-"zoo": DRIVE_LINK_PLACEHOLDER.format("1iS8xTrIowBsDmSiruh_4x7ZGLFmayTQi"),
-"zigzag": DRIVE_LINK_PLACEHOLDER.format("1jlm3l7m7gMhK8QXHyKxGcnJvJnxEqX4Y"),
-"zip": DRIVE_LINK_PLACEHOLDER.format("1aJM0KA6URjztam6VI2LfOrg6zvcY2QHI"),
-"0":DRIVE_LINK_PLACEHOLDER.format("18PRuMCFG3K3KiniBCEGloE3OoKKp7VxL"),
-"1":DRIVE_LINK_PLACEHOLDER.format("1uQuMqys_7ZusWS0ToZY5yuQPA-EWfObt/"),
-"2":DRIVE_LINK_PLACEHOLDER.format("1sNpHBgn-jgYINqosu8J8ny_VbfK9MlO_"),
-"3":DRIVE_LINK_PLACEHOLDER.format("16l4WN8MMIotpJD2XqAsRB3IZkBAcUlz0"),
-"4":DRIVE_LINK_PLACEHOLDER.format("19XXVQk4Uey6WyAAOGQi7xo0miu9VnHip"),
-"5":DRIVE_LINK_PLACEHOLDER.format("1ygqtyvJagKW8DAOyLYQC3r8O4NbufRD6"),
-"6":DRIVE_LINK_PLACEHOLDER.format("107Uq9oB6dg9XzL6gYimzEYWn8GAUeaI8"),
-"7":DRIVE_LINK_PLACEHOLDER.format("1kfO8ryeLg0VYVxIwlKNdRPRP_wHhB7oZ"),
-"8":DRIVE_LINK_PLACEHOLDER.format("1D-HRaXIrDbztDIz0_J7hq_Peb82Ed4yh"),
-"9":DRIVE_LINK_PLACEHOLDER.format("1nrHOfPVkRCfs7udzVbTUugYqZbVvh-_J"),
-"A":DRIVE_LINK_PLACEHOLDER.format("1EicW-NQtBPNyuMABKUO5rMDcuqmS1E1r"),
-"B":DRIVE_LINK_PLACEHOLDER.format("117Yzfos8NT6RgxgUV2lg9LJrDI20siZ2"),
-"C":DRIVE_LINK_PLACEHOLDER.format("1-kTACRZdq-DvGtlpbF8JNY5Isn3_FxAL"),
-"D":DRIVE_LINK_PLACEHOLDER.format("1FWGwwsW-hRU0ppcz53Y5mnHbXqRdmua0"),
-"E":DRIVE_LINK_PLACEHOLDER.format("1BfdWG02e_hvq8_D8vyxIBETj_rmwBk3r"),
-"F":DRIVE_LINK_PLACEHOLDER.format("1ijOGb3OqYXMecE9GDg13kDNrlhegQxr3"),
-"G":DRIVE_LINK_PLACEHOLDER.format("1lqJ45yGZaZkISQPuN_h-t_JvbaYSCLsf"),
-"H":DRIVE_LINK_PLACEHOLDER.format("1q5Jg94buBBKXyL7vLfbr-Ym_NhkQF5gW"),
-"I":DRIVE_LINK_PLACEHOLDER.format("1ELfQLGzrwuYOYFZrBIM5Ad84AlfRj3uW"),
-"J":DRIVE_LINK_PLACEHOLDER.format("103dz90TtrU5f4eXOuk9TomjaR0w9ELz4"),
-"K":DRIVE_LINK_PLACEHOLDER.format("15GrpGwT3vvBCI1Y3D_ceZzNP29EIytlX"),
-"L":DRIVE_LINK_PLACEHOLDER.format("1xsneHqoWJeSK4QQVBru_azN_2wbs_z72"),
-"M":DRIVE_LINK_PLACEHOLDER.format("1BicoSH6LhvUkJ5wgpXAzhvn77QeEz--e"),
-"N":DRIVE_LINK_PLACEHOLDER.format("1ws3PVouB5OpmkQRqVOvLTC8wubeiJK0l"),
-"O":DRIVE_LINK_PLACEHOLDER.format("1-HCa0IzLSJl6kcRFK_PfODslE_J1j331"),
-"P":DRIVE_LINK_PLACEHOLDER.format("1A5xOL5gmbefnJCyMQBOVCLLRoz017uTg"),
-"Q":DRIVE_LINK_PLACEHOLDER.format("1QHxuVIQeQdS1LJiYZKBEf-jpouwn_BhE"),
-"R":DRIVE_LINK_PLACEHOLDER.format("1J11U2pR60aCDD2fnnS-5xKtrbzLTrkCK"),
-"S":DRIVE_LINK_PLACEHOLDER.format("19ZmX1SaHzuyyASTaJaRfebTXzlGzJMDN"),
-"T":DRIVE_LINK_PLACEHOLDER.format("1AmBrwjd2TLM74Kpq1Li8Aej_ssOWF4ZH"),
-"U":DRIVE_LINK_PLACEHOLDER.format("1Da2_cUVYMDONfdiSEv4COHinZhiHHTes"),
-"V":DRIVE_LINK_PLACEHOLDER.format("1VmxJgGvTmpWxpHvs9OiR_9Ld8ccLxx9Q"),
-"W":DRIVE_LINK_PLACEHOLDER.format("1dZ7ztZcYDIqTsfXYQ73nErng5Vu46lpI"),
-"X":DRIVE_LINK_PLACEHOLDER.format("18-Gh-msyZACxnZI1yMvW1k-utYSwMJ-O"),
-"Y":DRIVE_LINK_PLACEHOLDER.format("1XIHQMtY076GQO_T5PLjBjbbkM0Uk16aM"),
-"Z":DRIVE_LINK_PLACEHOLDER.format("1h5y2coPy2jKOjk8Af84-Wrs8NL2zd3CD")}
\ No newline at end of file
+# Word -> video URL. The entries live in dictionary_data/medical.json (see
+# helper.compact_dictionary.write_compact_dictionary) and are read on first use.
+MED_VIDEO_IDS = CompactDictionary(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionary_data", "medical.json"),
+    DRIVE_LINK_PLACEHOLDER,
+)
@@ -0,0 +1,144 @@
+import json
+import os
+import tempfile
+import uuid
+from array import array
+
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from vector_index import VectorIndex
+
+
+class LocalVectorStore(VectorStore):
+    def __init__(self, path, embedding, nprobe=None):
+        """
+        LangChain vector store kept on local disk, a drop-in for PineconeVectorStore.
+
+        Embeddings live in a memory-mapped VectorIndex and the chunks in
+        path/docs.jsonl, with their byte offsets in path/docs.idx so a hit is
+        read with one seek. as_retriever() and similarity_search behave like
+        the Pinecone store's, without a network round-trip or credentials.
+        Search is exact unless build_index() is called to opt into
+        approximate (IVF) search for a large store.
+
+        Metadata filters and other search options of other stores are not
+        supported and raise ValueError instead of being ignored.
+
+        :param path: Directory of the store
+        :param embedding: LangChain Embeddings (e.g. HuggingFaceEmbeddings)
+        :param nprobe: IVF cells scored per query, see VectorIndex
+        """
+        self.path = path
+        self._embedding = embedding
+        self.index = VectorIndex(path, nprobe=nprobe)
+        self._docs_path = os.path.join(path, "docs.jsonl")
+        self._offsets_path = os.path.join(path, "docs.idx")
+        self._offsets = None
+
+    @property
+    def embeddings(self):
+        return self._embedding
+
+    def __len__(self):
+        return len(self.index)
+
+    def _load_offsets(self):
+        """
+        Byte offsets of the stored chunks, one per searchable row.
+
+        An add_texts interrupted after writing chunks but before adding their
+        vectors leaves offsets (and chunks) without a row; they are dropped
+        so the next chunk's offset lines up with its row again.
+        """
+        if self._offsets is None:
+            self._offsets = array("Q")
+            if os.path.exists(self._offsets_path):
+                with open(self._offsets_path, "rb") as f:
+                    self._offsets.frombytes(f.read(len(self.index) * self._offsets.itemsize))
+            del self._offsets[len(self.index):]
+        return self._offsets
+
+    def _truncate_orphans(self):
+        """Cut docs.idx and docs.jsonl back to the chunks that have a vector."""
+        offsets = self._load_offsets()
+        del offsets[len(self.index):]
+        size = len(self.index) * offsets.itemsize
+        if not os.path.exists(self._offsets_path) or os.path.getsize(self._offsets_path) <= size:
+            return
+        with open(self._offsets_path, "r+b") as f:
+            f.seek(size)
+            orphan = f.read(offsets.itemsize)
+            f.truncate(size)
+        if len(orphan) == offsets.itemsize and os.path.exists(self._docs_path):
+            with open(self._docs_path, "r+b") as f:
+                f.truncate(array("Q", orphan)[0])
+
+    @staticmethod
+    def _check_kwargs(kwargs):
+        if kwargs:
+            raise ValueError(f"LocalVectorStore does not support {', '.join(sorted(kwargs))}")
+
+    def add_texts(self, texts, metadatas=None, ids=None, **kwargs):
+        self._check_kwargs(kwargs)
+        texts = list(texts)
+        if not texts:
+            return []
+        metadatas = metadatas or [{}] * len(texts)
+        ids = list(ids) if ids else [uuid.uuid4().hex for _ in texts]
+        vectors = self._embedding.embed_documents(texts)
+
+        self._truncate_orphans()
+        offsets = self._load_offsets()
+        new_offsets = array("Q")
+        with open(self._docs_path, "ab") as f:
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                new_offsets.append(f.tell())
+                f.write(json.dumps({"id": doc_id, "text": text, "metadata": metadata}).encode("utf-8") + b"\n")
+        with open(self._offsets_path, "ab") as f:
+            new_offsets.tofile(f)
+        offsets.extend(new_offsets)
+
+        # Vectors last: a row is only searchable once its chunk is on disk
+        self.index.add(vectors)
+        return ids
+
+    def _document(self, f, row):
+        f.seek(self._load_offsets()[row])
+        record = json.loads(f.readline())
+        return Document(page_content=record["text"], metadata=record["metadata"], id=record["id"])
+
+    def similarity_search_by_vector_with_score(self, embedding, k=4, **kwargs):
+        self._check_kwargs(kwargs)
+        rows, scores = self.index.search(embedding, k)
+        if not len(rows):
+            return []
+        with open(self._docs_path, "rb") as f:
+            return [(self._document(f, row), float(score)) for row, score in zip(rows, scores)]
+
+    def similarity_search_with_score(self, query, k=4, **kwargs):
+        """Chunks most similar to query, with their cosine similarity."""
+        return self.similarity_search_by_vector_with_score(self._embedding.embed_query(query), k, **kwargs)
+
+    def similarity_search_by_vector(self, embedding, k=4, **kwargs):
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k, **kwargs)]
+
+    def similarity_search(self, query, k=4, **kwargs):
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self):
+        # Scores are cosine similarities in [-1, 1]
+        return lambda score: (score + 1) / 2
+
+    def build_index(self, nlist=None):
+        """Build the IVF index over every stored chunk, see VectorIndex.build_ivf."""
+        self.index.build_ivf(nlist)
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, ids=None, path=None, **kwargs):
+        """Create a store at path (a temporary directory if None) holding texts."""
+        if path is None:
+            path = tempfile.mkdtemp(prefix="vector_store_")
+        store = cls(path, embedding, **kwargs)
+        store.add_texts(texts, metadatas, ids)
+        return store
@@ -0,0 +1,54 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from vector_index import VectorIndex
+
+
+class FakeEmbeddings:
+    """Deterministic 4-dimensional embeddings derived from the text."""
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        rng = np.random.default_rng(sum(text.encode("utf-8")))
+        return rng.standard_normal(4).tolist()
+
+
+def test_add_drops_vectors_of_an_interrupted_add(tmp_path):
+    index = VectorIndex(str(tmp_path))
+    index.add(np.eye(4)[:2])
+    # A crash between appending vectors and saving index.json leaves orphan rows
+    with open(tmp_path / "vectors.f32", "ab") as f:
+        f.write(np.ones((3, 4), dtype=np.float32).tobytes())
+
+    index = VectorIndex(str(tmp_path))
+    assert index.add(np.eye(4)[2:]) == [2, 3]
+    assert os.path.getsize(tmp_path / "vectors.f32") == 4 * 4 * 4
+    np.testing.assert_allclose(index.vectors, np.eye(4))
+
+
+def test_add_texts_drops_chunks_without_a_vector(tmp_path):
+    pytest.importorskip("langchain_core")
+    from local_vector_store import LocalVectorStore
+
+    store = LocalVectorStore(str(tmp_path), FakeEmbeddings())
+    store.add_texts(["first", "second"])
+    # A crash after writing chunks but before adding their vectors leaves orphan chunks
+    with open(tmp_path / "docs.jsonl", "ab") as docs, open(tmp_path / "docs.idx", "ab") as offsets:
+        offsets.write(np.array([docs.tell()], dtype=np.uint64).tobytes())
+        docs.write(json.dumps({"id": "orphan", "text": "orphan", "metadata": {}}).encode("utf-8") + b"\n")
+
+    store = LocalVectorStore(str(tmp_path), FakeEmbeddings())
+    store.add_texts(["third"])
+    assert os.path.getsize(tmp_path / "docs.idx") == 3 * 8
+    with open(tmp_path / "docs.jsonl") as f:
+        assert [json.loads(line)["text"] for line in f] == ["first", "second", "third"]
+    hits = store.similarity_search_by_vector(FakeEmbeddings().embed_query("third"), k=1)
+    assert hits[0].page_content == "third"
@@ -0,0 +1,234 @@
+import json
+import os
+
+import numpy as np
+
+# Rows scored per matrix product in an exhaustive search; bounds the memory of one query
+SEARCH_BLOCK_ROWS = 65536
+# Scores computed per matrix product when assigning rows to IVF cells
+ASSIGN_BLOCK_SCORES = 16 * 1024 * 1024
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _top_k(ids, scores, k):
+    """The k highest scores and their ids, best first."""
+    if len(scores) > k:
+        best = np.argpartition(-scores, k - 1)[:k]
+        ids, scores = ids[best], scores[best]
+    order = np.argsort(-scores, kind="stable")
+    return ids[order], scores[order]
+
+
+def _assign(vectors, centroids):
+    """Index of the closest centroid of every row, in blocks of bounded size."""
+    assignment = np.empty(len(vectors), dtype=np.int64)
+    block = max(1, ASSIGN_BLOCK_SCORES // len(centroids))
+    for start in range(0, len(vectors), block):
+        assignment[start:start + block] = np.argmax(vectors[start:start + block] @ centroids.T, axis=1)
+    return assignment
+
+
+class VectorIndex:
+    def __init__(self, path, dim=None, nprobe=None):
+        """
+        Float32 vector matrix on disk, searched by cosine similarity.
+
+        Vectors are normalized and appended to path/vectors.f32, which is
+        memory-mapped for search: opening the index reads nothing and the OS
+        page cache decides which rows stay in memory. Search is exhaustive
+        (a blocked matrix product) until build_ivf() clusters the rows into
+        k-means cells and writes a copy of the vectors in cell order; then
+        only the nprobe cells closest to the query are scored, each as one
+        contiguous slice. Rows added after the last build are always scored
+        exhaustively, so the index never misses new rows.
+
+        :param path: Directory of the index
+        :param dim: Vector dimension (read from the index when it exists)
+        :param nprobe: Cells scored per IVF query (defaults to a tenth of the cells)
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._meta_path = os.path.join(path, "index.json")
+        self._vectors_path = os.path.join(path, "vectors.f32")
+
+        meta = {"dim": dim, "count": 0, "ivf": None}
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                meta = json.load(f)
+            if dim is not None and dim != meta["dim"]:
+                raise ValueError(f"Index at {path} has dimension {meta['dim']}, not {dim}")
+        self.dim = meta["dim"]
+        self.count = meta["count"]
+        self.ivf = meta["ivf"]  # {"nlist", "indexed"} once built
+        self.nprobe = nprobe
+
+        self._vectors = None
+        self._centroids = None
+        self._list_ids = None
+        self._list_offsets = None
+        self._list_vectors = None
+
+    def __len__(self):
+        return self.count
+
+    def _save_meta(self):
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"dim": self.dim, "count": self.count, "ivf": self.ivf}, f)
+        os.replace(tmp_path, self._meta_path)
+
+    @property
+    def vectors(self):
+        """Memory-mapped (count, dim) matrix of normalized vectors."""
+        if self._vectors is None:
+            if not self.count:
+                return np.empty((0, self.dim or 0), dtype=np.float32)
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(self.count, self.dim))
+        return self._vectors
+
+    def _truncate_orphans(self):
+        """Cut vectors.f32 back to the rows in index.json, dropping those of an interrupted add."""
+        size = self.count * self.dim * np.dtype(np.float32).itemsize
+        if os.path.exists(self._vectors_path) and os.path.getsize(self._vectors_path) > size:
+            self._vectors = None
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(size)
+
+    def add(self, vectors):
+        """
+        Append vectors; returns their row numbers.
+
+        :param vectors: Array-like of shape (n, dim)
+        """
+        vectors = _normalize(vectors)
+        if vectors.ndim != 2 or not len(vectors):
+            return []
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of dimension {self.dim}, got {vectors.shape[1]}")
+
+        self._truncate_orphans()
+        with open(self._vectors_path, "ab") as f:
+            f.write(vectors.tobytes())
+        first = self.count
+        self.count += len(vectors)
+        self._vectors = None
+        self._save_meta()
+        return list(range(first, self.count))
+
+    def _ivf_path(self, name):
+        return os.path.join(self.path, f"ivf_{name}.npy")
+
+    def build_ivf(self, nlist=None, iterations=10, train_rows=None, seed=0):
+        """
+        Cluster the rows into nlist cells with spherical k-means for approximate search.
+
+        :param nlist: Number of cells (defaults to 4 * sqrt(rows))
+        :param iterations: k-means iterations
+        :param train_rows: Rows sampled to train the centroids (defaults to 64 per cell, at most 200k)
+        """
+        if not self.count:
+            return
+        vectors = self.vectors
+        nlist = min(self.count, nlist or max(1, int(4 * np.sqrt(self.count))))
+        rng = np.random.default_rng(seed)
+        sample = min(self.count, train_rows or min(64 * nlist, 200000))
+        train = np.asarray(vectors[np.sort(rng.choice(self.count, sample, replace=False))])
+
+        centroids = train[rng.choice(len(train), nlist, replace=False)]
+        for _ in range(iterations):
+            assignment = _assign(train, centroids)
+            counts = np.bincount(assignment, minlength=nlist)
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            filled = counts > 0
+            sums = np.zeros_like(centroids)
+            sums[filled] = np.add.reduceat(train[np.argsort(assignment, kind="stable")], starts[filled], axis=0)
+            # Cells that lost all their rows restart from a random training row
+            sums[~filled] = train[rng.choice(len(train), int((~filled).sum()))]
+            centroids = _normalize(sums)
+
+        assignment = np.concatenate([_assign(vectors[start:start + SEARCH_BLOCK_ROWS], centroids)
+                                     for start in range(0, self.count, SEARCH_BLOCK_ROWS)])
+
+        list_ids = np.argsort(assignment, kind="stable").astype(np.int64)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=nlist), out=offsets[1:])
+
+        # Vectors in cell order, so a probed cell is read as one slice
+        tmp_path = self._ivf_path("vectors") + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.lib.format.write_array_header_1_0(f, {"descr": "<f4", "fortran_order": False,
+                                                     "shape": (self.count, self.dim)})
+            for start in range(0, self.count, SEARCH_BLOCK_ROWS):
+                block_ids = list_ids[start:start + SEARCH_BLOCK_ROWS]
+                # Read the memory map in ascending row order, write in cell order
+                order = np.argsort(block_ids)
+                block = np.empty((len(block_ids), self.dim), dtype=np.float32)
+                block[order] = vectors[block_ids[order]]
+                f.write(block.tobytes())
+        os.replace(tmp_path, self._ivf_path("vectors"))
+        np.save(self._ivf_path("centroids"), centroids)
+        np.save(self._ivf_path("ids"), list_ids)
+        np.save(self._ivf_path("offsets"), offsets)
+        self.ivf = {"nlist": nlist, "indexed": self.count}
+        self._centroids = None
+        self._list_vectors = None
+        self._save_meta()
+
+    def _load_ivf(self):
+        if self._centroids is None:
+            self._centroids = np.load(self._ivf_path("centroids"))
+            self._list_ids = np.load(self._ivf_path("ids"), mmap_mode="r")
+            self._list_offsets = np.load(self._ivf_path("offsets"))
+            self._list_vectors = np.load(self._ivf_path("vectors"), mmap_mode="r")
+
+    def _search_rows(self, query, k, start, stop):
+        best_ids = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        vectors = self.vectors
+        for block_start in range(start, stop, SEARCH_BLOCK_ROWS):
+            block_stop = min(stop, block_start + SEARCH_BLOCK_ROWS)
+            scores = vectors[block_start:block_stop] @ query
+            ids, scores = _top_k(np.arange(block_start, block_stop), scores, k)
+            best_ids, best_scores = _top_k(np.concatenate([best_ids, ids]), np.concatenate([best_scores, scores]), k)
+        return best_ids, best_scores
+
+    def _search_ivf(self, query, k, nprobe):
+        self._load_ivf()
+        nlist = self.ivf["nlist"]
+        nprobe = min(nlist, nprobe or self.nprobe or max(1, nlist // 10))
+        cells = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        # Ascending cells read the cell-ordered copy front to back, one slice per cell
+        cells.sort()
+        spans = [(self._list_offsets[c], self._list_offsets[c + 1]) for c in cells]
+        scores = np.concatenate([self._list_vectors[start:stop] @ query for start, stop in spans])
+        positions, scores = _top_k(np.concatenate([np.arange(start, stop) for start, stop in spans]), scores, k)
+        ids = np.asarray(self._list_ids[positions])
+
+        indexed = self.ivf["indexed"]
+        if indexed < self.count:
+            tail_ids, tail_scores = self._search_rows(query, k, indexed, self.count)
+            ids, scores = _top_k(np.concatenate([ids, tail_ids]), np.concatenate([scores, tail_scores]), k)
+        return ids, scores
+
+    def search(self, query, k=4, exact=False, nprobe=None):
+        """
+        Rows most similar to a query vector.
+
+        :param exact: Score every row even if an IVF index was built
+        :param nprobe: Cells scored for this query (IVF only)
+        :return: (row numbers, cosine similarities), best first
+        """
+        if not self.count:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        query = _normalize(query).reshape(-1)
+        k = min(k, self.count)
+        if self.ivf is None or exact:
+            return self._search_rows(query, k, 0, self.count)
+        return self._search_ivf(query, k, nprobe)
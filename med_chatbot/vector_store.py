@@ -1,13 +1,32 @@
 import os
-from pinecone import Pinecone, ServerlessSpec
 from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_pinecone import PineconeVectorStore
+
+# "pinecone" uses the remote index; "local" keeps the chunks on disk (no network or API key)
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "pinecone")
+LOCAL_VECTOR_STORE_DIR = os.getenv(
+    "LOCAL_VECTOR_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "vector_store_data")
+)
+# Opt-in approximate (IVF) search for local stores of at least this many chunks; 0 keeps exact search
+LOCAL_VECTOR_IVF_MIN_CHUNKS = int(os.getenv("LOCAL_VECTOR_IVF_MIN_CHUNKS", "0"))
+# IVF cells scored per query (0: a tenth of the cells); more cells trade latency for recall
+LOCAL_VECTOR_NPROBE = int(os.getenv("LOCAL_VECTOR_NPROBE", "0"))
+
+
+def get_local_vector_store(embeddings):
+    # Imported here so the Pinecone backend does not need NumPy
+    from local_vector_store import LocalVectorStore
+    return LocalVectorStore(LOCAL_VECTOR_STORE_DIR, embeddings, nprobe=LOCAL_VECTOR_NPROBE or None)
 
 
 def get_vector_store():
     # Initialize embeddings
     embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
 
+    if VECTOR_STORE_BACKEND == "local":
+        return get_local_vector_store(embeddings)
+
+    from langchain_pinecone import PineconeVectorStore
+
     index_name = "medical-chatbot"
 
     # Initialize and return PineconeVectorStore
@@ -18,13 +37,34 @@ def get_vector_store():
     )
 
 
-def init_vector_store(texts):
-    # Initialize Pinecone
-    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+def init_local_vector_store(texts, embeddings):
+    vector_store = get_local_vector_store(embeddings)
 
+    # Upload vectors if they don't exist
+    if len(vector_store) == 0:
+        print(f"Embedding {len(texts)} chunks into {LOCAL_VECTOR_STORE_DIR}...")
+        vector_store.add_documents(texts)
+        if LOCAL_VECTOR_IVF_MIN_CHUNKS and len(vector_store) >= LOCAL_VECTOR_IVF_MIN_CHUNKS:
+            vector_store.build_index()
+    else:
+        print("Vectors already exist in the local store. Using existing index...")
+
+    return vector_store
+
+
+def init_vector_store(texts):
     # Initialize embeddings
     embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
 
+    if VECTOR_STORE_BACKEND == "local":
+        return init_local_vector_store(texts, embeddings)
+
+    from pinecone import Pinecone, ServerlessSpec
+    from langchain_pinecone import PineconeVectorStore
+
+    # Initialize Pinecone
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+
     index_name = "medical-chatbot"
 
     # Check if the index exists, create if it doesn't
@@ -0,0 +1,143 @@
+"""
+Render ISL sign videos for a batch of sentences without a display.
+
+Each sentence is tokenized against the chosen dictionary and rendered by
+the same playback pipeline as the interactive players, into a video file
+instead of a window. Sentences are spread over worker processes.
+
+Usage (from the repository root):
+    python render_signs.py "good morning" "thank you" [--dictionary general]
+    python render_signs.py --file announcements.txt --dictionary railway --workers 4 --output rendered/
+"""
+import argparse
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+from helper.dictionaries import DICTIONARY_NAMES, load_dictionary
+from helper.frame_sinks import VideoFileSink
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(ROOT, "rendered")
+
+# Per worker process
+_preprocessor = None
+_frame_cache = None
+
+
+def tokenize(sentence, dictionary_name):
+    """Dictionary keys of a sentence; words without a sign are fingerspelled."""
+    global _preprocessor
+    if dictionary_name == "railway":
+        if _preprocessor is None:
+            from text_isl_preprocessing import RailwaysAnnouncementPreprocessor
+            _preprocessor = RailwaysAnnouncementPreprocessor()
+        return _preprocessor.preprocess(sentence)
+
+    from helper.phrase_matcher import get_phrase_matcher
+
+    words = []
+    for token, is_key in get_phrase_matcher(dictionary_name).segment(re.findall(r"[a-z0-9']+", sentence.lower())):
+        if is_key:
+            words.append(token)
+        else:
+            words.extend(letter.upper() for letter in token if letter.isalnum())
+    return words
+
+
+def label_frame(canvas, word, fps):
+    from helper.player import draw_word_label
+    return draw_word_label(canvas, word)
+
+
+def render_to_file(sentence, dictionary_name, path, fps=30.0):
+    """
+    Render one sentence into a video file; runs in a worker process.
+
+    :return: Dict with the sentence, output path, words, frames written and seconds taken
+    """
+    global _frame_cache
+    start = time.perf_counter()
+    words = tokenize(sentence, dictionary_name)
+
+    if dictionary_name == "railway":
+        from railway_landmark_detector import draw_word, render_sentence
+        sink = VideoFileSink(path, fps, annotate=draw_word)
+        render_sentence(words, sink=sink)
+    else:
+        import text_isl
+        from helper.frame_cache import FrameCache
+        from helper.player import FRAME_CACHE_MB
+
+        # Memory only: worker processes do not share one spill directory
+        if _frame_cache is None:
+            _frame_cache = FrameCache(FRAME_CACHE_MB * 1024 * 1024)
+        sink = VideoFileSink(path, fps, annotate=label_frame)
+        store_path = os.path.join(ROOT, "landmark_store", dictionary_name)
+        asyncio.run(text_isl.process_sentence(words, load_dictionary(dictionary_name), store_path,
+                                              cache=_frame_cache, sink=sink))
+
+    return {
+        "sentence": sentence,
+        "path": path,
+        "words": words,
+        "frames": sink.frames_written,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def output_name(index, sentence, extension):
+    slug = re.sub(r"[^a-z0-9]+", "_", sentence.lower()).strip("_")[:40] or "sentence"
+    return f"{index:03d}_{slug}.{extension}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sentences", nargs="*")
+    parser.add_argument("--file", help="Text file with one sentence per line")
+    parser.add_argument("--dictionary", default="general", choices=DICTIONARY_NAMES)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Directory for the rendered videos")
+    parser.add_argument("--format", default="mp4", choices=["mp4", "avi"])
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    args = parser.parse_args()
+
+    sentences = list(args.sentences)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            sentences.extend(line.strip() for line in f if line.strip())
+    if not sentences:
+        parser.error("no sentences given")
+
+    os.makedirs(args.output, exist_ok=True)
+    start = time.perf_counter()
+    frames = failed = 0
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(sentences))) as pool:
+        futures = {
+            pool.submit(render_to_file, sentence, args.dictionary,
+                        os.path.join(args.output, output_name(i, sentence, args.format)), args.fps): sentence
+            for i, sentence in enumerate(sentences, 1)
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"Failed: {futures[future]!r}: {e}")
+                continue
+            frames += result["frames"]
+            print(f"{result['path']}: {len(result['words'])} words, {result['frames']} frames "
+                  f"in {result['seconds']:.1f}s")
+
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(sentences) - failed}/{len(sentences)} sentences ({frames} frames) in {elapsed:.1f}s "
+          f"with {min(args.workers, len(sentences))} workers")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    main()
@@ -1,35 +1,99 @@
+import ast
+import hashlib
 import os
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from helper.announcement_tokenizer import NUMBER_WORDS, STOP_WORDS, TENS_WORDS, TOKENIZER_VERSION, AnnouncementTokenizer
+from helper.phrase_matcher import PhraseMatcher, get_phrase_matcher
+from helper.preprocess_cache import TemplateCache
 from helper.railway_dictionary import RAILWAY_IDS
 
+# Tokenized announcement templates; set PREPROCESS_CACHE_DB to keep them across restarts
+PREPROCESS_CACHE_SIZE = int(os.getenv("PREPROCESS_CACHE_SIZE", "1024"))
+PREPROCESS_CACHE_DB = os.getenv("PREPROCESS_CACHE_DB")
+
 class RailwaysAnnouncementPreprocessor:
-   def __init__(self, dictionary=RAILWAY_IDS):
+   def __init__(self, dictionary=RAILWAY_IDS, use_llm_fallback=None, cache=None):
+      """
+      :param dictionary: Sign dictionary whose keys are the output vocabulary
+      :param use_llm_fallback: Ask the LLM to lemmatize words the offline tokenizer does not know
+         (defaults to the PREPROCESS_LLM_FALLBACK environment variable)
+      :param cache: TemplateCache for tokenized templates (defaults to one sized by PREPROCESS_CACHE_SIZE,
+         backed by PREPROCESS_CACHE_DB; False disables caching)
+      """
+      self.dictionary = dictionary
       self.multi_word_list = [key for key, value in dictionary.items() if len(key.split()) > 1]
-      self.stop_words = [
-         "a", "an", "the","by", 
-         "is", "am", "are", "was", "were", "be", "been", "being", 
-         "do", "does", "did", "has", "have", "had", "will", "shall", 
-         "would", "should", "can", "could", "may", "might", "must",
-         "and", "or", "nor", "so", "for", "yet", 
-         "oh", "uh", "um", "ah", "wow", 
-      ]
+      self.stop_words = sorted(STOP_WORDS)
       self.list = None
-      self.number_words = {
-      "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
-      "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
-      "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
-      "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
-      "eighteen": 18, "nineteen": 19, "twenty": 20
-      }
-      # self.llm = ChatOpenAI(model='gpt-4o-mini')
-      self.llm = ChatGroq(model='llama-3.1-70b-versatile')
-      # self.llm = ChatGroq(model='llama-3.3-70b-versatile')
+      self.number_words = {**NUMBER_WORDS, **TENS_WORDS}
+      matcher = get_phrase_matcher("railway") if dictionary is RAILWAY_IDS else PhraseMatcher(dictionary.keys())
+      self.tokenizer = AnnouncementTokenizer(dictionary.keys(), matcher=matcher)
+      if use_llm_fallback is None:
+         use_llm_fallback = os.getenv("PREPROCESS_LLM_FALLBACK", "0") == "1"
+      self.use_llm_fallback = use_llm_fallback
+      self._llm = None
+
+      if cache is None and PREPROCESS_CACHE_SIZE > 0:
+         cache = TemplateCache(PREPROCESS_CACHE_SIZE, PREPROCESS_CACHE_DB, self.cache_namespace())
+      self.cache = cache or None
+
+   def cache_namespace(self):
+      """Identifies the dictionary, tokenizer rules and fallback setting the cached templates were made with."""
+      digest = hashlib.sha1("\n".join(sorted(self.dictionary)).encode("utf-8")).hexdigest()[:12]
+      return f"v{TOKENIZER_VERSION}-{digest}-{'llm' if self.use_llm_fallback else 'offline'}"
+
+   @property
+   def llm(self):
+      # Created on first use so the offline path needs neither langchain nor an API key
+      if self._llm is None:
+         from langchain_groq import ChatGroq
+         # from langchain_openai import ChatOpenAI
+         # self._llm = ChatOpenAI(model='gpt-4o-mini')
+         self._llm = ChatGroq(model='llama-3.1-70b-versatile')
+         # self._llm = ChatGroq(model='llama-3.3-70b-versatile')
+      return self._llm
+
+   def preprocess(self, sentence):
+      """
+      Tokenize an announcement into dictionary keys offline; see AnnouncementTokenizer.
+
+      Announcements that differ only in numbers, times or platforms share a
+      cached template, so repeats only refill the slots.
+      """
+      fallback = self.lemmatize_unknown if self.use_llm_fallback else None
+      return self.tokenizer.tokenize(sentence, fallback=fallback, cache=self.cache)
+
+   def lemmatize_unknown(self, words):
+      """
+      One LLM call mapping out-of-vocabulary words to their root form.
+
+      :return: {word: lemma}; empty if the response cannot be parsed
+      """
+      from langchain_core.prompts import PromptTemplate
+
+      prompt_template = PromptTemplate.from_template("""
+      Lemmatize each word below to its root form (e.g. "leaving" -> "leave", "platforms" -> "platform").
+      Words: {words}
+
+      Return ONLY a Python dict literal mapping every word to its lemma. NO PRELUDE OR EXPLANATION.
+      """)
+      response = self.llm.invoke(prompt_template.invoke({'words': str(words)}))
+      try:
+         lemmas = ast.literal_eval(response.content.strip())
+      except (ValueError, SyntaxError):
+         return {}
+      if not isinstance(lemmas, dict):
+         return {}
+      return {str(word): str(lemma).lower() for word, lemma in lemmas.items()}
 
-      
    def multi_word_matcher(self,sentence):
+      """Multi-word dictionary keys found in the sentence, longest match first."""
+      self.list = self.tokenizer.matcher.find(self.tokenizer.normalize(sentence), min_words=2)
+      return self.list
+
+   def llm_multi_word_matcher(self, sentence):
+      """The original LLM phrase matching call of preprocess_llm."""
+      from langchain_core.prompts import PromptTemplate
+
       prompt_template = PromptTemplate.from_template("""
       ### Debug Prompt:
       You are a debugging assistant. Your task is to **identify exact multi-word phrase matches** from the input list and output those matches.  
@@ -65,14 +129,20 @@ class RailwaysAnnouncementPreprocessor:
          'sentence': sentence,
          'list': str(self.multi_word_list),
       })
-      
+
       response = self.llm.invoke(prompt)
-      self.list = eval(response.content)
-      return eval(response.content)
-    
-   def preprocess(self, sentence):
+      self.list = ast.literal_eval(response.content.strip())
+      return self.list
+
+   def preprocess_llm(self, sentence):
+      """
+      The original two-call LLM pipeline (LLM phrase matching, then LLM tokenizing),
+      kept for comparison (see benchmarks/bench_preprocessing.py --llm).
+      """
+      from langchain_core.prompts import PromptTemplate
+
       sentence = " ".join([word.lower() for word in sentence.split() if word.lower() not in self.stop_words])
-      self.multi_word_matcher(sentence)
+      self.llm_multi_word_matcher(sentence)
       
       prompt_template = PromptTemplate.from_template("""
       You are a highly advanced text preprocessing assistant for Indian Sign Language (ISL) translation. Your task is to process railway announcements into context-aware tokens suitable for ISL video generation. Follow these steps precisely and **STRICTLY ADHERE** to the instructions.
@@ -138,10 +208,10 @@ class RailwaysAnnouncementPreprocessor:
       })
       
       response = self.llm.invoke(prompt)
-      keys = eval(response.content)
+      keys = ast.literal_eval(response.content)
       final_keys = []
       for key in keys:
-        if key in RAILWAY_IDS.keys():
+        if key in self.dictionary:
             final_keys.append(key)
         elif key in self.number_words.keys():
             final_keys.append(str(self.number_words[key]))
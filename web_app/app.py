@@ -10,6 +10,8 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
 import uuid
+import json
+import threading
 from pydub import AudioSegment
 from gtts import gTTS
 
@@ -145,15 +147,34 @@ def gen_frames():
         yield (b'--frame\r\n'
                b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
 
+# Speech-to-text: STT_BACKEND=google (default), sphinx or vosk (both offline)
+STT_BACKEND = os.getenv('STT_BACKEND', 'google')
+STT_TIMEOUT = float(os.getenv('STT_TIMEOUT', '10'))
+# Caps concurrent recognitions so slow upstream calls can't exhaust request threads
+stt_slots = threading.BoundedSemaphore(int(os.getenv('STT_MAX_CONCURRENCY', '4')))
+
+def recognize(recognizer, audio):
+    if STT_BACKEND == 'sphinx':
+        return recognizer.recognize_sphinx(audio)
+    if STT_BACKEND == 'vosk':
+        return json.loads(recognizer.recognize_vosk(audio)).get('text', '')
+    return recognizer.recognize_google(audio)
+
 def audio_to_text(audio_path):
     print(f"Processing audio file: {audio_path}")
     r = sr.Recognizer()
+    r.operation_timeout = STT_TIMEOUT
     text = ""
     try:
         with sr.AudioFile(audio_path) as source:
             audio = r.record(source)
         print("Audio recorded, recognizing...")
-        text = r.recognize_google(audio)
+        if not stt_slots.acquire(timeout=STT_TIMEOUT):
+            raise sr.RequestError("too many concurrent recognitions")
+        try:
+            text = recognize(r, audio)
+        finally:
+            stt_slots.release()
         print(f"Recognized text: {text}")
     except sr.UnknownValueError:
         print("Speech Recognition could not understand audio")